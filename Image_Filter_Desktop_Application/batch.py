@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Headless batch processing.
+
+Applies a chain of operations to many images without creating any widgets:
+
+    python batch.py photos/ "scans/*.png" -o out --op gray=40 --op rotate=90
+    python batch.py photos -o out --op crop=0,0,800,600 --op resize=400x300 --resume
+    python batch.py photos -o out --op rotate=90 --lossless
+
+Files stream through decode -> filter -> encode on a bounded pool of
+workers, so memory stays proportional to --jobs however many files there
+are. A per-file timing summary is printed at the end.
+"""
+
+# Built-in/Generic Imports
+import argparse
+import concurrent.futures
+import glob
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Libs
+from PyQt5.QtGui import QImageReader
+
+# Own modules
+import lossless
+from export import write_image
+from loader import IMAGE_SUFFIXES
+import parallel
+from pipeline import EditPipeline, operation
+
+
+def parse_operation(text):
+    """Turn 'gray=40', 'rotate=90', 'crop=x,y,w,h' or 'resize=WxH' into an Operation"""
+    name, _, value = text.partition('=')
+    try:
+        if name == 'gray':
+            return operation('gray', intensity=int(value))
+        if name == 'brightness':
+            return operation('brightness', adjustment=int(value))
+        if name == 'rotate':
+            return operation('rotate', angle=int(value))
+        if name == 'crop':
+            x, y, width, height = (int(v) for v in value.split(','))
+            return operation('crop', x=x, y=y, width=width, height=height)
+        if name == 'resize':
+            width, height = (int(v) for v in value.lower().split('x'))
+            return operation('resize', width=width, height=height)
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError('invalid operation: %s' % text)
+
+
+def collect_inputs(patterns):
+    """Expand files, directories and glob patterns into a sorted list of images"""
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            candidates = glob.glob(pattern) or [pattern]
+        files.update(os.path.normpath(path) for path in candidates
+                     if os.path.isfile(path) and path.lower().endswith(IMAGE_SUFFIXES))
+    return sorted(files)
+
+
+def output_path(path, output_dir, image_format=None):
+    stem, suffix = os.path.splitext(os.path.basename(path))
+    return os.path.join(output_dir, stem + ('.' + image_format if image_format else suffix))
+
+
+def is_done(path, target):
+    """Return True when target exists and is at least as new as path"""
+    return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path)
+
+
+def process_file(path, target, operations, quality=-1, lossless_jpeg=False):
+    """Decode, filter and encode one file; returns the time spent in each step"""
+    timings = {}
+    start = time.perf_counter()
+    if lossless_jpeg and lossless.can_rotate(path, target, operations):
+        try:
+            lossless.rotate(path, target, lossless.quarter_turns(operations))
+        except IOError:
+            pass  # Not a whole number of blocks; re-encode instead
+        else:
+            timings['decode'] = timings['encode'] = 0.0
+            timings['filter'] = time.perf_counter() - start
+            return timings
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    image = reader.read()
+    if image.isNull():
+        raise IOError('cannot read %s: %s' % (path, reader.errorString()))
+    timings['decode'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    image = EditPipeline(image).render(operations)
+    timings['filter'] = time.perf_counter() - start
+
+    # write_image() uses a temporary name, so an interrupted run never leaves
+    # a truncated file that --resume would mistake for a finished one.
+    start = time.perf_counter()
+    write_image(image, target, quality)
+    timings['encode'] = time.perf_counter() - start
+    return timings
+
+
+def run(paths, output_dir, operations, jobs=1, resume=False, image_format=None, quality=-1, report=print,
+        lossless_jpeg=False):
+    """Process paths with at most jobs files in flight; returns {path: timings or error}"""
+    os.makedirs(output_dir, exist_ok=True)
+    # Split the cores between files in flight and the bands of each filter,
+    # and give the full count back afterwards for the next run.
+    workers = parallel.workers()
+    parallel.configure(workers=max(1, workers // jobs))
+    results = {}
+    pending = set()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(jobs) as pool:
+            for path in paths:
+                target = output_path(path, output_dir, image_format)
+                if resume and is_done(path, target):
+                    results[path] = 'skipped'
+                    continue
+                if len(pending) >= jobs * 2:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        _collect(future, results, report)
+                future = pool.submit(process_file, path, target, operations, quality, lossless_jpeg)
+                future.path = path
+                pending.add(future)
+            for future in concurrent.futures.as_completed(pending):
+                _collect(future, results, report)
+    finally:
+        parallel.configure(workers=workers)
+    return results
+
+
+def _collect(future, results, report):
+    try:
+        results[future.path] = future.result()
+    except Exception as error:
+        results[future.path] = error
+        report('error: %s' % error)
+
+
+def summary(results):
+    """Return the per-file timing table as text"""
+    lines = ['%-40s %9s %9s %9s' % ('file', 'decode', 'filter', 'encode')]
+    totals = dict.fromkeys(('decode', 'filter', 'encode'), 0.0)
+    for path, timings in sorted(results.items()):
+        name = os.path.basename(path)
+        if isinstance(timings, dict):
+            lines.append('%-40s %8.1fms %8.1fms %8.1fms' % (
+                name, timings['decode'] * 1000, timings['filter'] * 1000, timings['encode'] * 1000))
+            for key in totals:
+                totals[key] += timings[key]
+        else:
+            lines.append('%-40s %s' % (name, timings))
+    lines.append('%-40s %8.1fms %8.1fms %8.1fms' % (
+        'total', totals['decode'] * 1000, totals['filter'] * 1000, totals['encode'] * 1000))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply a filter chain to many images without the GUI.')
+    parser.add_argument('inputs', nargs='+', help='image files, directories or glob patterns')
+    parser.add_argument('-o', '--output', required=True, help='output directory')
+    parser.add_argument('--op', dest='operations', action='append', type=parse_operation, default=[],
+                        help='gray=N, brightness=N, rotate=DEG, crop=X,Y,W,H or resize=WxH; repeat to chain')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='files processed at once')
+    parser.add_argument('--resume', action='store_true', help='skip files whose output is already up to date')
+    parser.add_argument('--format', help='output format, e.g. png or jpg (default: keep the input format)')
+    parser.add_argument('--quality', type=int, default=-1, help='encoder quality 0-100')
+    parser.add_argument('--lossless', action='store_true',
+                        help='turn JPEGs by quarter turns with jpegtran instead of re-encoding them')
+    args = parser.parse_args(argv)
+
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        parser.error('no images found')
+    start = time.perf_counter()
+    results = run(paths, args.output, args.operations, max(1, args.jobs), args.resume, args.format, args.quality,
+                  lossless_jpeg=args.lossless)
+    print(summary(results))
+    print('%d files in %.2fs' % (len(paths), time.perf_counter() - start))
+    return 1 if any(isinstance(result, Exception) for result in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Headless performance benchmarks.
+
+Times the filter, geometry, load and save paths on synthetic images of
+several sizes and pixel formats without creating any widgets:
+
+    python benchmark.py -o results.json
+    python benchmark.py --sizes 1,12 --cases gray,brightness --baseline baseline.json
+    python benchmark.py --sizes 1,12 --save-baseline baseline.json
+
+Every case records its best and mean wall time over --repeat runs, the
+throughput in megapixels per second and the peak memory it added to the
+process. With --baseline the results are compared with a stored run and
+the command exits with status 1 when a case is slower than the baseline
+by more than --threshold (a fraction, default 0.15).
+"""
+
+# Built-in/Generic Imports
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Libs
+import numpy as np
+from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QRect
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication
+
+# Own modules
+import cache
+import image_ops
+import parallel
+import profiling
+from export import write_image
+from loader import read_image
+from pipeline import OPERATIONS
+
+
+SIZES = (1, 12, 50, 100)  # megapixels
+FORMATS = {
+    'rgb32': QImage.Format_RGB32,
+    'argb32': QImage.Format_ARGB32,
+    'rgb888': QImage.Format_RGB888,
+    'gray8': QImage.Format_Grayscale8,
+}
+
+
+def _dimensions(megapixels):
+    """Return a 3:2 width and height with about megapixels million pixels"""
+    height = int(round((megapixels * 1e6 / 1.5) ** 0.5))
+    return int(round(height * 1.5)), height
+
+
+def synthetic_image(megapixels, image_format, seed=0):
+    """Return a reproducible photo-like test image: gradients plus noise"""
+    width, height = _dimensions(megapixels)
+    image, pixels = image_ops.new_image(width, height, image_format)
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0, 200, width, dtype=np.float32)
+    rows = np.linspace(0, 55, height, dtype=np.float32)[:, None]
+    for channel in range(pixels.shape[2]):
+        base = (ramp[None, :] * (channel + 1) / 3 + rows).astype(np.uint8)
+        pixels[:, :, channel] = base + rng.integers(0, 32, (height, width), dtype=np.uint8)
+    if image_format in (QImage.Format_RGB32, QImage.Format_ARGB32):
+        pixels[:, :, 3] = 255
+    return image
+
+
+def _case_load(image, workdir):
+    path = os.path.join(workdir, 'load.jpg')
+    write_image(image, path, quality=90)
+    return lambda: read_image(path)
+
+
+def _case_save(suffix):
+    def case(image, workdir):
+        path = os.path.join(workdir, 'save.' + suffix)
+        return lambda: write_image(image, path)
+    return case
+
+
+def _case_crop(image, workdir):
+    rect = QRect(image.width() // 4, image.height() // 4, image.width() // 2, image.height() // 2)
+    return lambda: image_ops.region(image, rect).copy()
+
+
+def _case_resize(image, workdir):
+    return lambda: OPERATIONS['resize'](image, width=image.width() // 2, height=image.height() // 2)
+
+
+def _case_resize_4k(image, workdir):
+    return lambda: OPERATIONS['resize'](image, width=3840, height=2160, kernel='lanczos')
+
+
+CASES = {
+    'gray': lambda image, workdir: lambda: image_ops.grayscale(image, 100),
+    'brightness': lambda image, workdir: lambda: image_ops.brightness(image, 30),
+    'rotate': lambda image, workdir: lambda: OPERATIONS['rotate'](image, angle=90),
+    'crop': _case_crop,
+    'resize': _case_resize,
+    'resize_4k': _case_resize_4k,
+    'load': _case_load,
+    'save_png': _case_save('png'),
+    'save_jpg': _case_save('jpg'),
+}
+
+
+class MemorySampler:
+    """Samples the resident set size on a thread to find the peak of a block"""
+    def __init__(self, interval=0.002):
+        self.interval = interval
+        self.start = self.peak = profiling.rss()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, profiling.rss())
+
+    def added(self):
+        """Return the peak bytes added since the block started, or None"""
+        return None if self.start is None else max(0, self.peak - self.start)
+
+
+def run_case(name, megapixels, format_name, repeat=3, workdir=None, image=None):
+    """Time one case; returns a result dict"""
+    image = image if image is not None else synthetic_image(megapixels, FORMATS[format_name])
+    job = CASES[name](image, workdir)
+    times = []
+    with MemorySampler() as memory:
+        job()  # Warm up caches, plugins and thread pools
+        for _ in range(repeat):
+            start = time.perf_counter()
+            job()
+            times.append(time.perf_counter() - start)
+    pixels = image.width() * image.height() / 1e6
+    added = memory.added()
+    return {
+        'case': name,
+        'megapixels': megapixels,
+        'format': format_name,
+        'best': min(times),
+        'mean': sum(times) / len(times),
+        'mp_per_s': pixels / min(times),
+        'peak_mb': None if added is None else added / 2 ** 20,
+    }
+
+
+def run(cases, sizes, formats, repeat=3, report=print):
+    """Run every case at every size and format; returns the results document"""
+    cache.configure(limit=0)  # Time real decodes, not the decoded cache
+    workdir = tempfile.mkdtemp(prefix='filter-benchmark-')
+    results = []
+    try:
+        for megapixels in sizes:
+            for format_name in formats:
+                image = synthetic_image(megapixels, FORMATS[format_name])
+                for name in cases:
+                    result = run_case(name, megapixels, format_name, repeat, workdir, image)
+                    results.append(result)
+                    report(format_result(result))
+                del image
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'qt': QT_VERSION_STR,
+            'pyqt': PYQT_VERSION_STR,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'cpus': os.cpu_count(),
+            'workers': parallel.workers(),
+        },
+        'results': results,
+    }
+
+
+def format_result(result):
+    peak = '%8.1fMB' % result['peak_mb'] if result['peak_mb'] is not None else '%10s' % 'n/a'
+    return '%-11s %5sMP %-7s %9.1fms %9.1fms %8.1fMP/s %s' % (
+        result['case'], result['megapixels'], result['format'], result['best'] * 1000,
+        result['mean'] * 1000, result['mp_per_s'], peak)
+
+
+def _key(result):
+    return result['case'], result['megapixels'], result['format']
+
+
+def compare(results, baseline, threshold=0.15):
+    """Return (lines, regressions) comparing best times with a baseline document"""
+    reference = {_key(result): result for result in baseline['results']}
+    lines, regressions = [], []
+    for result in results['results']:
+        old = reference.get(_key(result))
+        if old is None:
+            continue
+        ratio = result['best'] / old['best']
+        status = 'REGRESSION' if ratio > 1 + threshold else 'ok'
+        lines.append('%-11s %5sMP %-7s %9.1fms -> %9.1fms %+6.1f%% %s' % (
+            result['case'], result['megapixels'], result['format'], old['best'] * 1000,
+            result['best'] * 1000, (ratio - 1) * 100, status))
+        if status != 'ok':
+            regressions.append(result)
+    return lines, regressions
+
+
+def _list(text, choices=None):
+    values = [value.strip() for value in text.split(',') if value.strip()]
+    unknown = [value for value in values if choices is not None and value not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError('unknown value(s): %s' % ', '.join(unknown))
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the image operations headless.')
+    parser.add_argument('--cases', type=lambda text: _list(text, CASES), default=list(CASES),
+                        help='comma separated cases (default: all of %s)' % ', '.join(CASES))
+    parser.add_argument('--sizes', type=lambda text: [float(value) for value in _list(text)], default=list(SIZES),
+                        help='comma separated image sizes in megapixels (default: 1,12,50,100)')
+    parser.add_argument('--formats', type=lambda text: _list(text, FORMATS), default=list(FORMATS),
+                        help='comma separated pixel formats (default: all of %s)' % ', '.join(FORMATS))
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case; the best counts')
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare with the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed slowdown against the baseline as a fraction (default 0.15)')
+    parser.add_argument('--save-baseline', metavar='FILE', help='write the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # Font and plugin setup for encoders
+    print('%-11s %7s %-7s %11s %11s %12s %10s' % ('case', 'size', 'format', 'best', 'mean', 'throughput', 'peak'))
+    results = run(args.cases, [int(size) if size == int(size) else size for size in args.sizes],
+                  args.formats, max(1, args.repeat))
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as handle:
+                json.dump(results, handle, indent=2)
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    lines, regressions = compare(results, baseline, args.threshold)
+    print('\n'.join(lines))
+    if regressions:
+        print('%d case(s) slower than the baseline by more than %d%%' % (len(regressions), args.threshold * 100))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
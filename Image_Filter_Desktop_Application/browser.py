@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Folder browser with asynchronous thumbnails.
+
+The browser lists the images of a folder in a grid. A thumbnail is made on
+a worker pool the first time the view asks for it, so only items that are
+scrolled into view cost anything, and the most recently requested item is
+made first, which keeps the visible ones ahead of those scrolled past.
+JPEGs use the thumbnail embedded in their EXIF data when there is one;
+everything else is decoded at reduced size by QImageReader.
+
+Thumbnails are stored in a SQLite index next to the decoded image cache,
+keyed by path, size and modification time, so a folder that has been seen
+before fills the grid straight from the index.
+"""
+
+# Built-in/Generic Imports
+import collections
+import os
+import sqlite3
+import struct
+import threading
+
+# Libs
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QBuffer, QByteArray, QIODevice, QModelIndex, QObject, QRunnable,
+    QSize, QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QDockWidget, QListView
+
+# Own modules
+import cache
+from loader import IMAGE_SUFFIXES
+
+
+THUMBNAIL_SIZE = 128
+PIXMAP_CACHE_LIMIT = 64 * 1024  # kB of decoded thumbnails kept for painting
+
+
+def exif_thumbnail(path):
+    """Return the JPEG thumbnail embedded in the EXIF data of path, or None"""
+    try:
+        with open(path, 'rb') as handle:
+            if handle.read(2) != b'\xff\xd8':
+                return None
+            while True:
+                marker, length = struct.unpack('>2sH', handle.read(4))
+                if marker[0] != 0xff or marker[1] in (0xd9, 0xda):
+                    return None
+                if marker[1] == 0xe1:
+                    data = handle.read(length - 2)
+                    if data.startswith(b'Exif\0\0'):
+                        return _ifd1_thumbnail(data[6:])
+                else:
+                    handle.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error, IndexError):
+        return None
+
+
+def _ifd1_thumbnail(tiff):
+    order = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+    if order is None:
+        return None  # Not TIFF data; decode the image instead
+    ifd0 = struct.unpack(order + 'I', tiff[4:8])[0]
+    count = struct.unpack(order + 'H', tiff[ifd0:ifd0 + 2])[0]
+    ifd1 = struct.unpack(order + 'I', tiff[ifd0 + 2 + 12 * count:ifd0 + 6 + 12 * count])[0]
+    if not ifd1:
+        return None
+    tags = {}
+    for index in range(struct.unpack(order + 'H', tiff[ifd1:ifd1 + 2])[0]):
+        entry = tiff[ifd1 + 2 + 12 * index:ifd1 + 14 + 12 * index]
+        tag, kind, _, value = struct.unpack(order + 'HHI4s', entry)
+        tags[tag] = struct.unpack(order + ('H' if kind == 3 else 'I'), value[:2 if kind == 3 else 4])[0]
+    offset, length = tags.get(0x0201), tags.get(0x0202)
+    if offset is None or not length or offset + length > len(tiff):
+        return None
+    return tiff[offset:offset + length]
+
+
+def make_thumbnail(path, size=THUMBNAIL_SIZE):
+    """Return a QImage of path that fits in size x size; raises IOError"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    if reader.transformation() == QImageIOHandler.TransformationNone:
+        embedded = exif_thumbnail(path)
+        if embedded:
+            image = QImage.fromData(embedded)
+            if not image.isNull() and max(image.width(), image.height()) >= size:
+                return image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    full = reader.size()
+    if full.isValid() and (full.width() > size or full.height() > size):
+        # Decode at twice the size so the final smooth scale stays sharp
+        reader.setScaledSize(full.scaled(2 * size, 2 * size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        raise IOError('Cannot load %s: %s' % (path, reader.errorString()))
+    return image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def encode_thumbnail(image):
+    """Return image compressed for the index, JPEG unless it has alpha"""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, 'PNG' if image.hasAlphaChannel() else 'JPG', 85)
+    return bytes(data)
+
+
+class ThumbnailIndex:
+    """SQLite table of encoded thumbnails, safe to use from any thread"""
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache.directory(), 'thumbnails.sqlite')
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS thumbnails (path TEXT PRIMARY KEY, folder TEXT, '
+                         'size INTEGER, mtime INTEGER, data BLOB)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS thumbnails_folder ON thumbnails (folder)')
+        self._db.commit()
+
+    def folder(self, folder):
+        """Return {path: (size, mtime, data)} for every thumbnail stored for folder"""
+        with self._lock:
+            rows = self._db.execute('SELECT path, size, mtime, data FROM thumbnails WHERE folder = ?',
+                                    (os.path.abspath(folder),)).fetchall()
+        return {path: (size, mtime, data) for path, size, mtime, data in rows}
+
+    def store(self, path, size, mtime, data):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?, ?)',
+                             (path, os.path.dirname(path), size, mtime, data))
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class _ThumbnailSignals(QObject):
+    ready = pyqtSignal(str, bytes)
+
+
+class _ThumbnailWorker(QRunnable):
+    """Makes thumbnails until the loader has no more requests"""
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def run(self):
+        while True:
+            job = self.loader._next()
+            if job is None:
+                return
+            path, size, mtime = job
+            try:
+                data = encode_thumbnail(make_thumbnail(path))
+            except Exception:
+                data = b''
+            if data:
+                self.loader.index.store(path, size, mtime, data)
+            self.loader._signals.ready.emit(path, data)
+
+
+class ThumbnailLoader(QObject):
+    """Makes requested thumbnails on a pool, newest request first"""
+    thumbnailReady = pyqtSignal(str, bytes)  # path, encoded thumbnail or b'' on failure
+
+    def __init__(self, index, parent=None, pool=None):
+        super().__init__(parent)
+        self.index = index
+        self.pool = pool or QThreadPool(self)
+        self._pending = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._signals = _ThumbnailSignals()
+        self._signals.ready.connect(self.thumbnailReady)
+
+    def request(self, path, size, mtime):
+        """Queue path ahead of every earlier request"""
+        with self._lock:
+            self._pending[path] = (path, size, mtime)
+            self._pending.move_to_end(path)
+            start = self._workers < self.pool.maxThreadCount()
+            if start:
+                self._workers += 1
+        if start:
+            self.pool.start(_ThumbnailWorker(self))
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+
+    def _next(self):
+        with self._lock:
+            if not self._pending:
+                self._workers -= 1
+                return None
+            return self._pending.popitem(last=True)[1]
+
+
+class ThumbnailModel(QAbstractListModel):
+    """Images of one folder, with thumbnails filled in as they arrive"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index_db = ThumbnailIndex()
+        self.loader = ThumbnailLoader(self.index_db, self)
+        self.loader.thumbnailReady.connect(self._onThumbnail)
+        self._files = []
+        self._rows = {}
+        self._stored = {}
+        self._requested = set()
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT))
+
+    def setFolder(self, folder):
+        """List the images in folder, using the stored thumbnails that are current"""
+        self.beginResetModel()
+        self.loader.clear()
+        self._requested.clear()
+        files = []
+        for entry in sorted(os.scandir(folder), key=lambda entry: entry.name.lower()):
+            if entry.name.lower().endswith(IMAGE_SUFFIXES) and entry.is_file():
+                status = entry.stat()
+                files.append((os.path.abspath(entry.path), status.st_size, status.st_mtime_ns))
+        stored = self.index_db.folder(folder)
+        self._files = files
+        self._rows = {path: row for row, (path, _, _) in enumerate(files)}
+        self._stored = {path: stored[path][2] for path, size, mtime in files
+                        if path in stored and stored[path][:2] == (size, mtime)}
+        self.endResetModel()
+
+    def path(self, index):
+        return self._files[index.row()][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._files)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path, size, mtime = self._files[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(path)
+        if role == Qt.ToolTipRole:
+            return path
+        if role == Qt.DecorationRole:
+            data = self._stored.get(path)
+            if data is None:
+                if path not in self._requested:
+                    self._requested.add(path)
+                    self.loader.request(path, size, mtime)
+                return None
+            pixmap = QPixmapCache.find(path)
+            if pixmap is None and data:
+                pixmap = QPixmap()
+                pixmap.loadFromData(data)
+                QPixmapCache.insert(path, pixmap)
+            return pixmap
+        return None
+
+    def _onThumbnail(self, path, data):
+        row = self._rows.get(path)
+        if row is not None:
+            self._stored[path] = data
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+
+class FolderBrowser(QDockWidget):
+    """Dockable thumbnail grid of a folder; activating an item opens it"""
+    imageActivated = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__('Folder', parent)
+        self.model = ThumbnailModel(self)
+        self.view = QListView()
+        self.view.setViewMode(QListView.IconMode)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.view.setGridSize(QSize(THUMBNAIL_SIZE + 24, THUMBNAIL_SIZE + 32))
+        self.view.setModel(self.model)
+        self.view.activated.connect(lambda index: self.imageActivated.emit(self.model.path(index)))
+        self.setWidget(self.view)
+
+    def setFolder(self, folder):
+        self.model.setFolder(folder)
+        self.setWindowTitle(os.path.basename(os.path.normpath(folder)) or folder)
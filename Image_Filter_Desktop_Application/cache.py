@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of decoded images.
+
+Decoding a large JPEG takes seconds; reading the same pixels back from a
+raw file that is memory-mapped into a QImage takes no time at all, and the
+pages are only read from disk as they are drawn. Entries are keyed by the
+file path, its size and its modification time, plus a kind such as 'full'
+or a pyramid level, so an edited file never hits a stale entry.
+
+Each entry is one file: a 64 byte header with the geometry and format of
+the image followed by its buffer exactly as QImage lays it out. The total
+size is kept under a limit by deleting the least recently used entries;
+a hit touches the file so that its modification time is its last use.
+
+The cache lives in FILTER_APP_CACHE_DIR (default: the platform cache
+directory) and holds up to FILTER_APP_CACHE_LIMIT megabytes (default 2048,
+0 disables it); configure() changes both at runtime.
+"""
+
+# Built-in/Generic Imports
+import concurrent.futures
+import hashlib
+import mmap
+import os
+import struct
+import threading
+
+# Libs
+from PyQt5 import sip
+from PyQt5.QtCore import QStandardPaths
+from PyQt5.QtGui import QImage
+
+
+MAGIC = b'FAPRAW01'
+HEADER = struct.Struct('<8siiii')
+HEADER_SIZE = 64
+SUFFIX = '.raw'
+
+_settings = {
+    'directory': os.environ.get('FILTER_APP_CACHE_DIR', ''),
+    'limit': int(os.environ.get('FILTER_APP_CACHE_LIMIT', 2048)) * 1024 * 1024,
+}
+_stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+_lock = threading.Lock()
+_writer = concurrent.futures.ThreadPoolExecutor(1, 'decoded-cache')
+
+
+def configure(directory=None, limit=None):
+    """Set the cache directory and its size limit in bytes (0 disables it)"""
+    with _lock:
+        if directory is not None:
+            _settings['directory'] = directory
+        if limit is not None:
+            _settings['limit'] = max(0, int(limit))
+
+
+def directory():
+    """Return the cache directory, creating it when needed"""
+    path = _settings['directory'] or os.path.join(
+        QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation) or os.path.expanduser('~/.cache'),
+        'filter_image_app', 'decoded')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def enabled():
+    return _settings['limit'] > 0
+
+
+def _entry(path, kind):
+    """Return the cache file for kind of path, or None when path is missing"""
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    key = repr((os.path.abspath(path), status.st_size, status.st_mtime_ns, kind))
+    return os.path.join(directory(), hashlib.sha1(key.encode()).hexdigest() + SUFFIX)
+
+
+def lookup(path, kind='full'):
+    """Return the cached image of kind for path, memory-mapped, or None"""
+    if not enabled():
+        return None
+    entry = _entry(path, kind)
+    image = _map(entry) if entry is not None else None
+    with _lock:
+        _stats['hits' if image is not None else 'misses'] += 1
+    if image is not None:
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+    return image
+
+
+def _map(entry):
+    try:
+        with open(entry, 'rb') as handle:
+            magic, width, height, stride, image_format = HEADER.unpack(handle.read(HEADER.size))
+            if magic != MAGIC or os.fstat(handle.fileno()).st_size != HEADER_SIZE + stride * height:
+                raise ValueError('corrupt cache entry')
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error):
+        _remove(entry)
+        return None
+    import numpy as np  # Not at the top: the cache is imported at startup, long before a hit
+    pixels = np.frombuffer(mapping, np.uint8, stride * height, HEADER_SIZE)
+    # The read-only pointer selects QImage's const constructor, so writes
+    # detach a private copy instead of faulting on the read-only mapping.
+    address = sip.voidptr(pixels.ctypes.data, pixels.size, False)
+    image = QImage(address, width, height, stride, QImage.Format(image_format))
+    image.pixel_owner = pixels  # Keeps the mapping open; see image_ops.region()
+    return image
+
+
+def store(path, kind, image):
+    """Write image to the cache as kind of path in the background"""
+    if enabled() and not image.isNull():
+        entry = _entry(path, kind)
+        if entry is not None and not os.path.exists(entry):
+            try:
+                _writer.submit(_write, entry, image)
+            except RuntimeError:
+                pass  # Interpreter shutting down
+
+
+def _write(entry, image):
+    partial = entry + '.part'
+    try:
+        with open(partial, 'wb') as handle:
+            header = HEADER.pack(MAGIC, image.width(), image.height(), image.bytesPerLine(), int(image.format()))
+            handle.write(header.ljust(HEADER_SIZE, b'\0'))
+            pixels = image.constBits()
+            pixels.setsize(image.sizeInBytes())
+            handle.write(pixels)
+        os.replace(partial, entry)
+    except OSError:
+        _remove(partial)
+        return
+    with _lock:
+        _stats['stores'] += 1
+    evict()
+
+
+def _entries():
+    entries = []
+    with os.scandir(directory()) as scan:
+        for item in scan:
+            if item.name.endswith(SUFFIX):
+                try:
+                    status = item.stat()
+                except OSError:
+                    continue
+                entries.append((status.st_mtime, status.st_size, item.path))
+    return entries
+
+
+def usage():
+    """Return the bytes held by the cache"""
+    return sum(size for _, size, _ in _entries())
+
+
+def evict(limit=None):
+    """Delete least recently used entries until the cache fits in limit bytes"""
+    limit = _settings['limit'] if limit is None else limit
+    entries = sorted(_entries())
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in entries:
+        if total <= limit:
+            break
+        if _remove(entry):
+            total -= size
+            with _lock:
+                _stats['evictions'] += 1
+
+
+def _remove(entry):
+    try:
+        os.remove(entry)
+        return True
+    except OSError:
+        return False
+
+
+def clear():
+    """Delete every entry and reset the statistics"""
+    evict(0)
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def stats():
+    """Return hits, misses, stores, evictions and the current size in bytes"""
+    with _lock:
+        result = dict(_stats)
+    result['bytes'] = usage() if enabled() else 0
+    return result
+
+
+def flush():
+    """Wait until every pending store() has been written"""
+    _writer.submit(lambda: None).result()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Tiled image canvas.
+
+Replaces a QLabel with setScaledContents(True), which rescales the whole
+pixmap on every paint and needs a backing pixmap as large as the zoomed
+image. The canvas is sized like that label, stretching the image over its
+whole rect, but it only renders the fixed-size tiles that intersect the
+exposed area and keeps them in an LRU cache with a byte limit.
+
+Tiles are drawn from the level of an ImagePyramid nearest above the current
+zoom. While the canvas is being resized in quick succession (zoom bursts)
+they are drawn with nearest-neighbour sampling, and redrawn smoothly once
+the zoom has been still for a moment. An orientation in quarter turns is
+applied while drawing, so the image itself is never rotated for display.
+
+A detail image can be laid over part of the image, e.g. a sharper decode
+of the visible region of a file that has only been decoded at preview size.
+"""
+
+# Built-in/Generic Imports
+import collections
+
+# Libs
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize, QTimer
+from PyQt5.QtGui import QPainter, QPalette, QPixmap, QTransform
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+# Own modules
+import profiling
+
+
+TILE_SIZE = 256
+DEFAULT_CACHE_LIMIT = 128 * 1024 * 1024
+SETTLE_DELAY = 150  # ms without a resize before tiles are redrawn smoothly
+PARTIAL_UPDATE_LIMIT = 0.25  # Largest share of the image refreshed in place, on the GUI thread
+
+
+class TiledImageCanvas(QWidget):
+    """Draws a QImage stretched over the widget, one cached tile at a time"""
+    def __init__(self, text='', parent=None, cacheLimit=DEFAULT_CACHE_LIMIT):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setBackgroundRole(QPalette.Dark)
+        self.text = text
+        self.cacheLimit = cacheLimit
+        self._image = None
+        self._pyramid = None
+        self._detail = None  # (image, rect in the coordinates of self._image)
+        self._turns = 0
+        self._tiles = collections.OrderedDict()
+        self._tileBytes = 0
+        self._fast = False
+        self._settleTimer = QTimer(self)
+        self._settleTimer.setSingleShot(True)
+        self._settleTimer.setInterval(SETTLE_DELAY)
+        self._settleTimer.timeout.connect(self._settle)
+
+    def setImage(self, image, changedRect=None, path=None):
+        """Show image, a QImage of any size, stretched over the canvas.
+
+        When image replaces one of the same size and only changedRect of it
+        differs, the pyramid and the tile cache are refreshed for that
+        region alone; larger changes rebuild the pyramid in the background
+        as for a new image. path names the file when image is that file
+        unedited, which lets the pyramid levels come from the on-disk cache.
+        """
+        if self._image is not None and image.cacheKey() == self._image.cacheKey():
+            return
+        if (changedRect is not None and self._pyramid is not None and self._image is not None
+                and image.size() == self._image.size() and image.format() == self._image.format()
+                and changedRect.width() * changedRect.height()
+                <= PARTIAL_UPDATE_LIMIT * image.width() * image.height()):
+            self._pyramid.update(image, changedRect)
+            self._image = image
+            self._detail = None
+            self._dropTiles(changedRect)
+            self.update()
+            return
+        if self._pyramid is not None:
+            self._pyramid.cancel()
+        from pyramid import ImagePyramid  # Pulls in NumPy, which the empty window does not need
+        self._image = image
+        self._detail = None
+        self._pyramid = ImagePyramid(image, path)
+        self._pyramid.levelAdded.connect(self._onLevelAdded)
+        self._pyramid.build()
+        self.clearTiles()
+        self.update()
+
+    def image(self):
+        return self._image
+
+    def setDetail(self, detail, rect):
+        """Draw detail, an image of any size, over rect of the image (in its coordinates)"""
+        self._detail = (detail, QRectF(rect))
+        self.clearTiles()
+        self.update()
+
+    def setOrientation(self, turns):
+        """Show the image turned clockwise by quarter turns"""
+        turns %= 4
+        if turns != self._turns:
+            self._turns = turns
+            self.clearTiles()
+            self.update()
+
+    def orientation(self):
+        return self._turns
+
+    def imageSize(self):
+        """Return the size of the image as shown, after the orientation"""
+        if self._image is None:
+            return QSize()
+        return self._image.size().transposed() if self._turns % 2 else self._image.size()
+
+    def viewTransform(self):
+        """Return the QTransform from image pixels to widget coordinates"""
+        from pipeline import orientation_transform
+        unoriented = self.size().transposed() if self._turns % 2 else self.size()
+        scale = QTransform.fromScale(unoriented.width() / max(1, self._image.width()),
+                                     unoriented.height() / max(1, self._image.height()))
+        return scale * orientation_transform(unoriented, self._turns)
+
+    def sizeHint(self):
+        return self.imageSize() if self._image is not None else QSize(200, 100)
+
+    def clearTiles(self):
+        self._tiles.clear()
+        self._tileBytes = 0
+
+    def images(self):
+        """Return the image, its pyramid levels and the detail image"""
+        if self._pyramid is not None:
+            images = self._pyramid.images()
+        else:
+            images = [self._image] if self._image is not None else []
+        if self._detail is not None:
+            images.append(self._detail[0])
+        return images
+
+    def tileUsage(self):
+        """Return the bytes held by cached tile pixmaps"""
+        return self._tileBytes
+
+    def cacheUsage(self):
+        """Return the bytes held by cached tiles and pyramid levels"""
+        return self._tileBytes + (self._pyramid.memoryUsage() if self._pyramid is not None else 0)
+
+    def _dropTiles(self, imageRect):
+        changed = self.viewTransform().mapRect(QRectF(imageRect)).toAlignedRect().adjusted(-1, -1, 2, 2)
+        for key in list(self._tiles):
+            if changed.intersects(QRect(key[0] * TILE_SIZE, key[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
+                tile = self._tiles.pop(key)
+                self._tileBytes -= tile.width() * tile.height() * 4
+
+    def _onLevelAdded(self):
+        self.clearTiles()
+        self.update()
+
+    def _settle(self):
+        self._fast = False
+        self.clearTiles()
+        self.update()
+
+    def resizeEvent(self, event):
+        self.clearTiles()
+        if self._image is not None:
+            self._fast = True
+            self._settleTimer.start()
+        super().resizeEvent(event)
+
+    @profiling.traced('paint')
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._image is None or self._image.isNull():
+            painter.drawText(self.rect(), Qt.AlignCenter, self.text)
+            return
+        exposed = event.rect()
+        first_x, first_y = exposed.left() // TILE_SIZE, exposed.top() // TILE_SIZE
+        last_x, last_y = exposed.right() // TILE_SIZE, exposed.bottom() // TILE_SIZE
+        for ty in range(first_y, last_y + 1):
+            for tx in range(first_x, last_x + 1):
+                painter.drawPixmap(tx * TILE_SIZE, ty * TILE_SIZE, self._tile(tx, ty))
+
+    def _tile(self, tx, ty):
+        key = (tx, ty)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+        with profiling.span('paint.tile', fast=self._fast):
+            tile = self._renderTile(tx, ty)
+        self._tiles[key] = tile
+        self._tileBytes += tile.width() * tile.height() * 4
+        while self._tileBytes > self.cacheLimit and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self._tileBytes -= evicted.width() * evicted.height() * 4
+        return tile
+
+    def _renderTile(self, tx, ty):
+        """Draw tile (tx, ty) from the nearest pyramid level into a new pixmap"""
+        target = QRect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(self.rect())
+        view = self.viewTransform()
+        area = view.inverted()[0].mapRect(QRectF(target))
+        unit = view.mapRect(QRectF(0, 0, 1, 1))
+        level = self._pyramid.level(max(unit.width(), unit.height()))
+        sx = level.width() / max(1, self._image.width())
+        sy = level.height() / max(1, self._image.height())
+        source = QRectF(area.x() * sx, area.y() * sy, area.width() * sx, area.height() * sy)
+        tile = QPixmap(target.size())
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, not self._fast)
+        painter.setTransform(view * QTransform.fromTranslate(-target.x(), -target.y()))
+        painter.drawImage(area, level, source)
+        if self._detail is not None and self._detail[1].intersects(area):
+            painter.drawImage(self._detail[1], self._detail[0])
+        painter.end()
+        return tile
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Writing documents to disk off the GUI thread.
+
+An export renders the document once at full resolution, with its
+orientation applied, and encodes it on the thread pool. One export can
+write several targets, e.g. a PNG and a JPEG or a full size image and a
+thumbnail, from that single render; the targets are scaled and encoded in
+parallel. Each file is written under a temporary name and moved into place
+when complete, so a failed or interrupted export never leaves a truncated
+image behind.
+
+JPEG targets of a JPEG whose only edits are quarter turns are written by
+jpegtran instead, without decoding or encoding, when it is installed.
+"""
+
+# Built-in/Generic Imports
+import collections
+import concurrent.futures
+import math
+import os
+import threading
+import traceback
+
+# Libs
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImageWriter
+
+# Own modules
+import lossless
+import profiling
+from parallel import RenderCancelled
+
+
+# One file to write. width is the largest width to scale the render down to
+# (None keeps the full size); quality is the JPEG/WebP quality 0-100,
+# compression the PNG zlib level 0-9, -1 meaning the encoder default.
+ExportTarget = collections.namedtuple('ExportTarget', 'path width quality compression progressive',
+                                      defaults=(None, -1, -1, False))
+
+MAX_WRITERS = 4
+
+
+def image_format(path):
+    """Return the format QImageWriter should use for path, from its suffix"""
+    return os.path.splitext(path)[1][1:].lower().encode()
+
+
+@profiling.traced('encode')
+def write_image(image, path, quality=-1, compression=-1, progressive=False):
+    """Encode image to path in the format its suffix names; raises IOError"""
+    partial = path + '.part'
+    file_format = image_format(path)
+    writer = QImageWriter(partial, file_format)
+    if file_format == b'png' and compression >= 0:
+        # Qt's PNG writer derives the zlib level from the quality setting
+        # as (100 - quality) * 9 / 91, so choose the quality giving the level.
+        quality = 100 - math.ceil(min(compression, 9) * 91 / 9)
+    writer.setQuality(quality)
+    writer.setProgressiveScanWrite(progressive)
+    writer.setOptimizedWrite(True)
+    if not writer.write(image):
+        error = writer.errorString()
+        writer.setDevice(None)
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise IOError('Cannot write %s: %s' % (path, error))
+    writer.setDevice(None)
+    os.replace(partial, path)
+
+
+def write_targets(image, targets, progress=None, isCancelled=None):
+    """Write image to every target in parallel; returns {path: error message}.
+
+    progress is called with the path of every target once it is written.
+    """
+    errors = {}
+    lock = threading.Lock()
+
+    def write(target):
+        if isCancelled is not None and isCancelled():
+            raise RenderCancelled()
+        scaled = image
+        if target.width and target.width < image.width():
+            import resize  # Not at the top: this module is imported at startup
+            height = max(1, round(image.height() * target.width / image.width()))
+            with profiling.span('scale.export', width=target.width):
+                scaled = resize.resize(image, target.width, height, 'bicubic', isCancelled)
+        try:
+            write_image(scaled, target.path, target.quality, target.compression, target.progressive)
+        except IOError as error:
+            with lock:
+                errors[target.path] = str(error)
+        if progress is not None:
+            progress(target.path)
+
+    with concurrent.futures.ThreadPoolExecutor(min(len(targets), MAX_WRITERS) or 1, 'export') as pool:
+        for future in [pool.submit(write, target) for target in targets]:
+            future.result()
+    return errors
+
+
+class _ExportSignals(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(str, str)
+
+
+class _ExportTask(QRunnable):
+    def __init__(self, exporter, pipeline, operations, targets):
+        super().__init__()
+        self.exporter = exporter
+        self.pipeline = pipeline
+        self.operations = operations
+        self.targets = targets
+
+    def run(self):
+        signals = self.exporter._signals
+        total = len(self.targets) + 1
+        done = [0]
+        lock = threading.Lock()
+
+        def step(path=None):
+            with lock:
+                done[0] += 1
+                signals.progress.emit(done[0], total)
+
+        paths = ', '.join(target.path for target in self.targets)
+        error = ''
+        try:
+            with profiling.span('export', targets=len(self.targets)):
+                targets = self.rotateLossless(step)
+                errors = {}
+                if targets:
+                    image = self.pipeline.render(self.operations, self.exporter.isCancelled)
+                    step()
+                    errors = write_targets(image, targets, step, self.exporter.isCancelled)
+                else:
+                    step()  # Nothing left to render
+            error = '\n'.join(errors.values())
+        except RenderCancelled:
+            error = 'Cancelled'
+        except Exception as exc:
+            traceback.print_exc()
+            error = str(exc)
+        signals.finished.emit(paths, error)
+
+    def rotateLossless(self, step):
+        """Write the targets jpegtran can turn without re-encoding; return the others"""
+        path = self.pipeline.sourcePath()
+        turns = lossless.quarter_turns(self.operations)
+        if path is None or turns is None:
+            return self.targets
+        width = self.pipeline.outputSize(self.operations).width()
+        remaining = []
+        for target in self.targets:
+            if self.exporter.isCancelled():
+                raise RenderCancelled()
+            if (not target.width or target.width >= width) and lossless.can_rotate(path, target.path, self.operations):
+                try:
+                    with profiling.span('export.lossless', turns=turns):
+                        lossless.rotate(path, target.path, turns, target.progressive)
+                except IOError:
+                    pass  # Not a whole number of blocks; re-encode instead
+                else:
+                    step(target.path)
+                    continue
+            remaining.append(target)
+        return remaining
+
+
+class Exporter(QObject):
+    """Renders and encodes documents on a thread pool"""
+    progress = pyqtSignal(int, int)  # steps done, total steps
+    finished = pyqtSignal(str, str)  # paths, error messages or ''
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        # Not the global pool: Qt splits scaling and format conversion into
+        # jobs on the global pool, and the writer threads wait for those
+        # while the export task would be occupying a pool thread.
+        self.pool = pool or QThreadPool(self)
+        self._cancelled = False
+        self._signals = _ExportSignals()
+        self._signals.progress.connect(self.progress)
+        self._signals.finished.connect(self.finished)
+
+    def export(self, pipeline, operations, targets):
+        """Write the render of operations, a pipeline snapshot, to targets.
+
+        targets is a path or a list of paths and ExportTarget.
+        """
+        if isinstance(targets, str):
+            targets = [targets]
+        targets = [ExportTarget(target) if isinstance(target, str) else target for target in targets]
+        self._cancelled = False
+        self.pool.start(_ExportTask(self, pipeline, tuple(operations), targets))
+
+    def cancel(self):
+        """Stop running exports before their next step"""
+        self._cancelled = True
+
+    def isCancelled(self):
+        return self._cancelled
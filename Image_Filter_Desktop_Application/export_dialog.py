@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Dialog choosing where and how to save the document.
+
+Besides the main file it can add copies in other formats and scaled-down
+copies; all of them are written by one export from a single render.
+"""
+
+# Built-in/Generic Imports
+import os
+
+# Libs
+from PyQt5.QtWidgets import (
+    QCheckBox, QDialog, QDialogButtonBox, QFileDialog, QFormLayout, QHBoxLayout,
+    QLineEdit, QMessageBox, QPushButton, QSpinBox
+)
+
+# Own modules
+from export import ExportTarget
+
+
+EXTRA_FORMATS = ('png', 'jpg', 'webp')
+
+
+class ExportDialog(QDialog):
+    """Collects the export targets and encoder options"""
+    def __init__(self, path='', parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Save Image')
+        layout = QFormLayout(self)
+
+        self.pathEdit = QLineEdit(path)
+        browse = QPushButton('Browse...')
+        browse.clicked.connect(self.browse)
+        row = QHBoxLayout()
+        row.addWidget(self.pathEdit)
+        row.addWidget(browse)
+        layout.addRow('File:', row)
+
+        self.formatBoxes = {}
+        row = QHBoxLayout()
+        for name in EXTRA_FORMATS:
+            self.formatBoxes[name] = QCheckBox(name.upper())
+            row.addWidget(self.formatBoxes[name])
+        layout.addRow('Also save as:', row)
+
+        self.widthsEdit = QLineEdit()
+        self.widthsEdit.setPlaceholderText('e.g. 1920, 256')
+        layout.addRow('Also at widths:', self.widthsEdit)
+
+        self.qualitySpin = QSpinBox()
+        self.qualitySpin.setRange(1, 100)
+        self.qualitySpin.setValue(90)
+        layout.addRow('JPEG/WebP quality:', self.qualitySpin)
+
+        self.compressionSpin = QSpinBox()
+        self.compressionSpin.setRange(0, 9)
+        self.compressionSpin.setValue(6)
+        layout.addRow('PNG compression:', self.compressionSpin)
+
+        self.progressiveBox = QCheckBox('Progressive JPEG')
+        layout.addRow('', self.progressiveBox)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def browse(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, 'Save Image', self.pathEdit.text(),
+                                                   'Images (*.png *.jpg *.jpeg *.bmp *.webp)')
+        if file_name:
+            self.pathEdit.setText(file_name)
+
+    def widths(self):
+        """Return the extra widths entered, or None when the text is invalid"""
+        try:
+            return sorted({int(value) for value in self.widthsEdit.text().replace(',', ' ').split()}, reverse=True)
+        except ValueError:
+            return None
+
+    def accept(self):
+        if not self.pathEdit.text() or not os.path.splitext(self.pathEdit.text())[1]:
+            QMessageBox.warning(self, 'Save Image', 'Enter a file name with an extension such as .png or .jpg.')
+        elif self.widths() is None or any(width <= 0 for width in self.widths()):
+            QMessageBox.warning(self, 'Save Image', 'Widths must be positive whole numbers.')
+        else:
+            super().accept()
+
+    def targets(self):
+        """Return the ExportTarget list for the chosen options"""
+        stem, suffix = os.path.splitext(self.pathEdit.text())
+        suffixes = [suffix] + ['.' + name for name, box in self.formatBoxes.items()
+                               if box.isChecked() and '.' + name != suffix.lower()]
+        targets = []
+        for width in [None] + self.widths():
+            for extension in suffixes:
+                path = stem + ('_%d' % width if width else '') + extension
+                targets.append(ExportTarget(path, width, self.qualitySpin.value(),
+                                            self.compressionSpin.value(), self.progressiveBox.isChecked()))
+        return targets
@@ -0,0 +1,57 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Fast-start build: a onedir bundle (pyinstaller filter_app_fast.spec).
+#
+# filter_app.spec makes a single exe that unpacks itself into a temporary
+# directory on every launch. This profile leaves the files unpacked in
+# dist/filter_app, skips UPX (every compressed DLL would be inflated at
+# load time) and leaves out Qt and Python modules the application never
+# imports. Icons come from the compiled icons_rc module, so no data files
+# are needed. Time the result with:
+#     python startup_benchmark.py --command dist/filter_app/filter_app
+
+
+a = Analysis(
+    ['filter_app.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[
+        'tkinter',
+        'PyQt5.QtNetwork', 'PyQt5.QtQml', 'PyQt5.QtQuick', 'PyQt5.QtSql', 'PyQt5.QtMultimedia',
+        'PyQt5.QtWebEngineWidgets', 'PyQt5.QtWebEngineCore', 'PyQt5.QtBluetooth', 'PyQt5.QtDBus',
+    ],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='filter_app',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='filter_app',
+)
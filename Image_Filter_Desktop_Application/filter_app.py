@@ -8,18 +8,36 @@ from __future__ import print_function
 
 
 # Built-in/Generic Imports
+import functools
+import multiprocessing
+import os
 import sys
 
 # Libs
-from PyQt5.QtCore import Qt, QSize, QPoint, QRect, QSize
+from PyQt5.QtCore import Qt, QEvent, QObject, QSize, QPoint, QRect, QRectF, QSize, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QLabel, QSizePolicy,
+    QApplication, QMainWindow, QLabel,
     QMessageBox, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QGroupBox,
-    QRadioButton, QFileDialog, QAction, QToolBar, QScrollArea, QSlider, QRubberBand, QLineEdit
+    QRadioButton, QFileDialog, QAction, QToolBar, QScrollArea, QSlider, QRubberBand, QLineEdit, QProgressBar,
+    QComboBox
 )
-from PyQt5.QtGui import QImage, QPixmap, QIcon, QPainter, QKeySequence, QPalette,  QColor, QTransform
-from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
-
+from PyQt5.QtGui import QIcon, QIntValidator, QPainter, QKeySequence, QPalette, QTransform
+
+# Own modules
+import icons_rc  # Registers the :/icons resources
+import memory
+import profiling
+from canvas import TiledImageCanvas
+from export import Exporter
+from histogram_view import HistogramView
+from history import EditHistory
+from loader import ImageSource
+from prefetch import Prefetcher
+from scheduler import FilterScheduler
+
+# Printing, dialogs, the folder browser and the pipeline with its filters
+# (and NumPy behind them) are imported where they are first used, so that
+# none of them delays the first paint of the window.
 
 """
 {Description} {License_info}
@@ -39,6 +57,8 @@ __status__     = '{Dev}'
 
 class ResponsiveWidget(QWidget):
     """ResponsiveWidget class create a Widget and Main Layout"""
+    historyChanged = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.initUI()
@@ -57,20 +77,50 @@ class ResponsiveWidget(QWidget):
         self.originPoint = QPoint()
         self.currentPoint = QPoint()
         self.rubberBand = None  # Initialize rubber band object
-
-        # Image label inside the scroll area
-        self.image_label = QLabel("No Image Selected")
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
-        self.image_label.setScaledContents(True)
+        self.pipeline = None  # Edit pipeline of the open document
+        self.history = EditHistory()  # Undo/redo of pipeline edits
+        self.current_filter = None  # Filter shown in the Filter Options panel
+        self.view_scale = 1.0  # Zoom of the image label when not fitting the window
+        self.scheduler = FilterScheduler(self)  # Renders off the GUI thread
+        self.scheduler.resultReady.connect(self.showRender)
+        self.exporter = Exporter(self)  # Encodes saved images off the GUI thread
+        self.exporter.finished.connect(self.exportFinished)
+        self.histograms = None  # Histograms of preview renders, set with a document
+        self.histogramScheduler = FilterScheduler(self)  # Exact histograms of full renders
+        self.histogramScheduler.resultReady.connect(self.showExactHistogram)
+        self.detailScheduler = FilterScheduler(self)  # Region decodes of the part in view
+        self.detailScheduler.resultReady.connect(self.showDetail)
+
+        # Full resolution render once a slider has been idle for a moment
+        self.idleTimer = QTimer(self)
+        self.idleTimer.setSingleShot(True)
+        self.idleTimer.setInterval(250)
+        self.idleTimer.timeout.connect(self.renderFull)
+
+        # Decode the part of the file in view once zooming and scrolling pause
+        self.detailTimer = QTimer(self)
+        self.detailTimer.setSingleShot(True)
+        self.detailTimer.setInterval(150)
+        self.detailTimer.timeout.connect(self.decodeVisible)
+        # Not start itself: valueChanged would pass the position as the interval
+        self.scroll_area.horizontalScrollBar().valueChanged.connect(lambda: self.detailTimer.start())
+        self.scroll_area.verticalScrollBar().valueChanged.connect(lambda: self.detailTimer.start())
+
+        # Image canvas inside the scroll area, drawn in cached tiles
+        self.image_label = TiledImageCanvas("No Image Selected")
 
         # Set image label as the widget for the scroll area
         self.scroll_area.setWidget(self.image_label)
 
-        # Filter options section
+        # Filter options section, below the histogram of the document
         self.filter_groupbox = QGroupBox('Filter Options')
+        self.histogram = HistogramView()
         self.filter_layout = QVBoxLayout()
-        self.filter_groupbox.setLayout(self.filter_layout)
+        group_layout = QVBoxLayout()
+        group_layout.addWidget(self.histogram)
+        group_layout.addLayout(self.filter_layout)
+        group_layout.addStretch()
+        self.filter_groupbox.setLayout(group_layout)
 
         # Add widgets to main layout
         sub_layout = QHBoxLayout()
@@ -91,16 +141,225 @@ class ResponsiveWidget(QWidget):
             self, 'Open Image', '', 'Images (*.png *.jpg *.jpeg *.bmp *.gif)'
         )
         if file_name:
-            image = QImage(file_name)
-            if image.isNull():
+            try:
+                source = ImageSource(file_name)
+            except IOError:
                 QMessageBox.information(self, "Image Viewer", "Cannot load %s." % file_name)
                 return
-            pixmap = QPixmap.fromImage(image)
-            self.image_label.setPixmap(pixmap.scaled(
-                self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            ))
+            self.setSourceImage(source)
+            self.resizeView(1.0)
+
+    @profiling.traced('open.document')
+    def setSourceImage(self, source):
+        """Start a new document from a QImage or an ImageSource.
+
+        Only a viewport-sized decode is shown at first; the full resolution
+        image is decoded when a render or the zoom level needs it.
+        """
+        from histogram import PreviewHistograms
+        from pipeline import EditPipeline
+        self.scheduler.cancel()
+        self.idleTimer.stop()
+        self.detailScheduler.cancel()
+        self.detailTimer.stop()
+        self.pipeline = EditPipeline(source)
+        self.histograms = PreviewHistograms()
+        self.history.clear()
+        self.historyChanged.emit()
+        self.image_label.setOrientation(0)
+        viewport = self.scroll_area.viewport()
+        self.pipeline.setPreviewSize(viewport.size() * viewport.devicePixelRatioF())
+        self.displayImage(self.pipeline.proxy()[0])
+
+    def showRender(self, result):
+        """Show the (image, changed rect) result of a render job"""
+        self.displayImage(*result)
+
+    @profiling.traced('display')
+    def displayImage(self, image, changedRect=None):
+        """Show a rendered image in the image label.
+
+        changedRect bounds the pixels that differ from the image shown
+        before, if known, so that only that part of the view is refreshed.
+        """
+        path = None
+        if (self.pipeline is not None and not self.pipeline.unoriented()
+                and image.size() == self.pipeline.sourceSize()):
+            path = self.pipeline.sourcePath()  # The unedited file itself
+        self.image_label.setImage(image, changedRect, path)
+        if self.pipeline is not None and not self.scroll_area.widgetResizable():
+            self.image_label.resize(self.pipeline.outputSize() * self.view_scale)
+        self.updateHistogram(image)
+
+    def updateHistogram(self, image):
+        """Show the histogram of a displayed render, exactly once it is full resolution"""
+        if self.pipeline is None:
+            return
+        from histogram import SAMPLE_LIMIT, compute
+        operations = self.pipeline.unoriented()
+        if image.size() == self.pipeline.outputSize(operations):
+            self.histogram.setHistogram(compute(image, SAMPLE_LIMIT))
+            self.histogramScheduler.submit(functools.partial(self.exactHistogram, image, operations))
+        else:
+            self.histogramScheduler.cancel()
+            self.histogram.setHistogram(self.histograms.histogram(self.pipeline, operations, image))
+
+    @staticmethod
+    def exactHistogram(image, operations, isCancelled=None):
+        from histogram import compute
+        return operations, compute(image, isCancelled=isCancelled)
+
+    def showExactHistogram(self, result):
+        operations, histogram = result
+        if self.pipeline is not None and operations == self.pipeline.unoriented():
+            self.histogram.setHistogram(histogram, exact=True)
+
+    def resizeView(self, scale):
+        """Show the document at scale, decoding more detail if that needs it"""
+        self.view_scale = scale
+        if self.pipeline is None:
+            return
+        self.image_label.resize(self.pipeline.outputSize() * scale)
+        if self.needsDetail():
+            if not self.pipeline.unoriented() and self.pipeline.canDecodeRegion():
+                self.detailTimer.start()  # Only the part in view, once the zoom settles
+            else:
+                self.renderFull()
+
+    def needsDetail(self):
+        """Return True when the image shown has fewer pixels than the view draws"""
+        shown = self.image_label.imageSize()
+        return not shown.isEmpty() and shown.width() < min(self.image_label.width(), self.pipeline.outputSize().width())
+
+    def decodeVisible(self):
+        """Decode the part of an unedited file in view at the resolution it is drawn at"""
+        if (self.pipeline is None or self.pipeline.unoriented() or not self.pipeline.canDecodeRegion()
+                or not self.needsDetail()):
+            return
+        canvas, viewport = self.image_label, self.scroll_area.viewport()
+        visible = QRect(canvas.mapFrom(viewport, QPoint()), viewport.size()).intersected(canvas.rect())
+        if visible.isEmpty():
+            return
+        area = canvas.viewTransform().inverted()[0].mapRect(QRectF(visible))
+        shown, size = canvas.image(), self.pipeline.sourceSize()
+        toSource = QTransform.fromScale(size.width() / shown.width(), size.height() / shown.height())
+        rect = toSource.mapRect(area).toAlignedRect().intersected(QRect(QPoint(), size))
+        # Pixels per source pixel on screen, never more than the file has
+        scale = min(1.0, viewport.devicePixelRatioF() * max(canvas.width(), canvas.height())
+                    / max(size.width(), size.height()))
+        target = QSize(max(1, round(rect.width() * scale)), max(1, round(rect.height() * scale)))
+        self.detailScheduler.submit(functools.partial(self.decodeDetail, self.pipeline, rect, target))
+
+    @staticmethod
+    def decodeDetail(pipeline, rect, size, isCancelled=None):
+        return pipeline, rect, pipeline.sourceRegion(rect, size)
+
+    def showDetail(self, result):
+        pipeline, rect, image = result
+        if pipeline is not self.pipeline or self.pipeline.unoriented():
+            return  # Another document, or edited since
+        shown, size = self.image_label.image(), pipeline.sourceSize()
+        toShown = QTransform.fromScale(shown.width() / size.width(), shown.height() / size.height())
+        self.image_label.setDetail(image, toShown.mapRect(QRectF(rect)))
+
+    def applyOperation(self, name, **params):
+        """Record an operation on the document and show the re-rendered result"""
+        if self.pipeline is None:
+            return
+        self.recordOperation(name, **params)
+        if not self.scroll_area.widgetResizable():
+            self.image_label.resize(self.pipeline.outputSize() * self.view_scale)
+        self.renderFull()
+
+    def applyAdjustment(self, slider, name, **params):
+        """Record a slider adjustment, previewing it until the slider settles"""
+        if self.pipeline is None:
+            return
+        self.recordOperation(name, merge=name, **params)
+        self.renderPreview()
+        if not slider.isSliderDown():
+            self.idleTimer.start()
+
+    def recordOperation(self, name, merge=None, **params):
+        """Change the pipeline and push the change onto the undo history"""
+        before = self.pipeline.snapshot()
+        self.pipeline.setOperation(name, **params)
+        self.history.record(before, self.pipeline.snapshot(), merge)
+        self.image_label.setOrientation(self.pipeline.orientation())
+        self.historyChanged.emit()
+
+    def undo(self):
+        if self.pipeline is not None and self.history.canUndo():
+            self.restoreOperations(self.history.undo())
+
+    def redo(self):
+        if self.pipeline is not None and self.history.canRedo():
+            self.restoreOperations(self.history.redo())
+
+    def restoreOperations(self, operations):
+        """Put the pipeline back to an earlier list of operations"""
+        from pipeline import split_orientation
+        unoriented, turns = split_orientation(operations)
+        rerender = unoriented != self.pipeline.unoriented()
+        self.pipeline.operations = list(operations)
+        self.image_label.setOrientation(turns)
+        snapshot = self.history.snapshot(unoriented) if rerender else None
+        if snapshot is not None:
+            self.scheduler.cancel()
+            self.idleTimer.stop()
+            self.displayImage(snapshot)
+        elif rerender:
+            self.renderFull()
+        else:
+            self.displayImage(self.image_label.image())
+        if self.current_filter:
+            self.updateContent(self.current_filter)
+        self.historyChanged.emit()
+
+    def renderPreview(self):
+        """Render the document on a proxy the size of the viewport"""
+        viewport = self.scroll_area.viewport()
+        self.pipeline.setPreviewSize(viewport.size() * viewport.devicePixelRatioF())
+        self.scheduler.submit(functools.partial(self.renderProxy, self.pipeline, self.pipeline.snapshot()))
+
+    def renderFull(self):
+        """Render the document at full resolution"""
+        if self.pipeline is None:
+            return
+        self.idleTimer.stop()
+        self.history.seal()
+        self.scheduler.submit(functools.partial(self.renderDocument, self.pipeline, self.history,
+                                                self.history.generation(), self.pipeline.snapshot(),
+                                                self.image_label.image()))
+
+    @staticmethod
+    def renderProxy(pipeline, operations, isCancelled=None):
+        """Preview render job; proxies are small, so they are always redrawn whole"""
+        return pipeline.render(operations, isCancelled, preview=True, oriented=False), None
+
+    @staticmethod
+    def renderDocument(pipeline, history, generation, operations, shown=None, isCancelled=None):
+        """Full resolution render job; the result is also kept for undo.
+
+        The orientation is left to the view, so turning the document never
+        needs a render and the result is remembered without it. generation
+        is history.generation() when the job was submitted; a job that has
+        been superseded, or whose document has been replaced since, is not
+        remembered. Returns the image and the rect in which it differs from
+        shown, the image on screen, so that the view can refresh an edited
+        region alone.
+        """
+        from image_ops import changed_rect
+        from pipeline import split_orientation
+        image = pipeline.render(operations, isCancelled, oriented=False)
+        unoriented = split_orientation(operations)[0]
+        # Without operations the render is the source itself
+        if unoriented and not (isCancelled is not None and isCancelled()):
+            history.remember(unoriented, image, generation)
+        return image, changed_rect(shown, image)
 
     def updateContent(self, filter_name):
+        self.current_filter = filter_name
         # Clear existing sliders
         for i in reversed(range(self.filter_layout.count())):
             widget = self.filter_layout.itemAt(i).widget()
@@ -112,68 +371,206 @@ class ResponsiveWidget(QWidget):
             self.grayscale()
         elif filter_name == 'Brightness':
             self.brightness()
+        elif filter_name == 'Contrast':
+            self.contrast()
+        elif filter_name == 'Gamma':
+            self.gamma()
+        elif filter_name == 'Levels':
+            self.levels()
+        elif filter_name == 'Curves':
+            self.curves()
+        elif filter_name == 'Box Blur':
+            self.boxBlur()
+        elif filter_name == 'Gaussian Blur':
+            self.gaussianBlur()
+        elif filter_name == 'Sharpen':
+            self.sharpen()
+        elif filter_name == 'Edges':
+            self.edges()
+        elif filter_name == 'Median':
+            self.median()
+        elif filter_name == 'Resize':
+            self.resizeOptions()
         # Add more conditions as needed for additional filters
 
     def grayscale(self):
         self.grayscale_slider = QSlider(Qt.Horizontal)
         self.grayscale_slider.setMinimum(0)
         self.grayscale_slider.setMaximum(255)
-        self.grayscale_slider.setValue(0)
+        self.grayscale_slider.setValue(self.pipeline.parameter('gray', 'intensity', 0) if self.pipeline else 0)
         self.grayscale_slider.setTickInterval(10)
         self.grayscale_slider.setTickPosition(QSlider.TicksBelow)
         self.grayscale_slider.valueChanged.connect(self.applyGrayscale)
+        self.grayscale_slider.sliderReleased.connect(self.renderFull)
         self.filter_layout.addWidget(QLabel('Grayscale Intensity:'))
         self.filter_layout.addWidget(self.grayscale_slider)
 
     def applyGrayscale(self):
-        intensity = self.grayscale_slider.value()
-        pixmap = self.image_label.pixmap()
-        if pixmap:
-            grayscale_image = pixmap.toImage().convertToFormat(QImage.Format_Grayscale8)
-            for x in range(grayscale_image.width()):
-                for y in range(grayscale_image.height()):
-                    pixel_value = grayscale_image.pixelColor(x, y).value()
-                    new_value = max(0, min(255, pixel_value + intensity))
-                    grayscale_image.setPixel(x, y, QColor(new_value, new_value, new_value).rgb())
-            self.image_label.setPixmap(QPixmap.fromImage(grayscale_image))
+        self.applyAdjustment(self.grayscale_slider, 'gray', intensity=self.grayscale_slider.value())
 
     def brightness(self):
         self.brightness_slider = QSlider(Qt.Horizontal)
         self.brightness_slider.setMinimum(-100)
         self.brightness_slider.setMaximum(100)
-        self.brightness_slider.setValue(0)
+        self.brightness_slider.setValue(self.pipeline.parameter('brightness', 'adjustment', 0) if self.pipeline else 0)
         self.brightness_slider.setTickInterval(10)
         self.brightness_slider.setTickPosition(QSlider.TicksBelow)
         self.brightness_slider.valueChanged.connect(self.increaseBrightness)
+        self.brightness_slider.sliderReleased.connect(self.renderFull)
         self.filter_layout.addWidget(QLabel('Brightness Adjustment:'))
         self.filter_layout.addWidget(self.brightness_slider)
 
     def increaseBrightness(self):
-        adjustment = self.brightness_slider.value()
-        pixmap = self.image_label.pixmap()
-        if pixmap:
-            brightness_image = pixmap.toImage()
-            for x in range(brightness_image.width()):
-                for y in range(brightness_image.height()):
-                    pixel = QColor(brightness_image.pixel(x, y))
-                    new_brightness = max(0, min(255, pixel.lightness() + adjustment))
-                    pixel.setHsl(pixel.hue(), pixel.saturation(), new_brightness)
-                    brightness_image.setPixel(x, y, pixel.rgb())
-            self.image_label.setPixmap(QPixmap.fromImage(brightness_image))
+        self.applyAdjustment(self.brightness_slider, 'brightness', adjustment=self.brightness_slider.value())
+
+    def addSlider(self, label, minimum, maximum, value, changed):
+        """Add a labelled slider to the Filter Options panel"""
+        slider = QSlider(Qt.Horizontal)
+        slider.setMinimum(minimum)
+        slider.setMaximum(maximum)
+        slider.setValue(value)
+        slider.setTickInterval(max(1, (maximum - minimum) // 20))
+        slider.setTickPosition(QSlider.TicksBelow)
+        slider.valueChanged.connect(changed)
+        slider.sliderReleased.connect(self.renderFull)
+        self.filter_layout.addWidget(QLabel(label))
+        self.filter_layout.addWidget(slider)
+        return slider
+
+    def parameter(self, name, key, default):
+        return self.pipeline.parameter(name, key, default) if self.pipeline else default
+
+    def contrast(self):
+        self.contrast_slider = self.addSlider('Contrast:', -100, 100, self.parameter('contrast', 'amount', 0),
+                                              self.applyContrast)
+
+    def applyContrast(self):
+        self.applyAdjustment(self.contrast_slider, 'contrast', amount=self.contrast_slider.value())
+
+    def gamma(self):
+        gamma = self.parameter('gamma', 'gamma', 1.0)
+        self.gamma_slider = self.addSlider('Gamma (x0.01):', 10, 300, round(gamma * 100), self.applyGamma)
+
+    def applyGamma(self):
+        self.applyAdjustment(self.gamma_slider, 'gamma', gamma=self.gamma_slider.value() / 100.0)
+
+    def levels(self):
+        self.levels_black_slider = self.addSlider('Black Point:', 0, 254, self.parameter('levels', 'black', 0),
+                                                  self.applyLevels)
+        self.levels_white_slider = self.addSlider('White Point:', 1, 255, self.parameter('levels', 'white', 255),
+                                                  self.applyLevels)
+        gamma = self.parameter('levels', 'gamma', 1.0)
+        self.levels_gamma_slider = self.addSlider('Midtones (x0.01):', 10, 300, round(gamma * 100), self.applyLevels)
+
+    def applyLevels(self):
+        slider = self.sender() if isinstance(self.sender(), QSlider) else self.levels_black_slider
+        self.applyAdjustment(slider, 'levels', black=self.levels_black_slider.value(),
+                             white=self.levels_white_slider.value(), gamma=self.levels_gamma_slider.value() / 100.0)
+
+    def curves(self):
+        points = dict(self.parameter('curves', 'points', ()))
+        self.curve_sliders = [
+            self.addSlider('%s:' % label, 0, 255, points.get(position, position), self.applyCurves)
+            for label, position in (('Shadows', 64), ('Midtones', 128), ('Highlights', 192))
+        ]
+
+    def applyCurves(self):
+        slider = self.sender() if isinstance(self.sender(), QSlider) else self.curve_sliders[0]
+        points = ((0, 0),) + tuple((position, curve_slider.value()) for position, curve_slider
+                                   in zip((64, 128, 192), self.curve_sliders)) + ((255, 255),)
+        self.applyAdjustment(slider, 'curves', points=points)
+
+    def boxBlur(self):
+        self.box_blur_slider = self.addSlider('Box Blur Radius:', 0, 100, self.parameter('box_blur', 'radius', 0),
+                                              self.applyBoxBlur)
+
+    def applyBoxBlur(self):
+        self.applyAdjustment(self.box_blur_slider, 'box_blur', radius=self.box_blur_slider.value())
+
+    def gaussianBlur(self):
+        sigma = self.parameter('gaussian_blur', 'sigma', 0.0)
+        self.gaussian_slider = self.addSlider('Gaussian Blur Sigma (x0.5):', 0, 100, round(sigma * 2),
+                                              self.applyGaussianBlur)
+
+    def applyGaussianBlur(self):
+        self.applyAdjustment(self.gaussian_slider, 'gaussian_blur', sigma=self.gaussian_slider.value() / 2.0)
+
+    def sharpen(self):
+        sigma = self.parameter('unsharp_mask', 'sigma', 1.0)
+        self.sharpen_sigma_slider = self.addSlider('Sharpen Radius (x0.5):', 1, 40, round(sigma * 2), self.applySharpen)
+        self.sharpen_amount_slider = self.addSlider('Amount (%):', 0, 300, self.parameter('unsharp_mask', 'amount', 0),
+                                                    self.applySharpen)
+        self.sharpen_threshold_slider = self.addSlider('Threshold:', 0, 50,
+                                                       self.parameter('unsharp_mask', 'threshold', 0), self.applySharpen)
+
+    def applySharpen(self):
+        slider = self.sender() if isinstance(self.sender(), QSlider) else self.sharpen_amount_slider
+        self.applyAdjustment(slider, 'unsharp_mask', sigma=self.sharpen_sigma_slider.value() / 2.0,
+                             amount=self.sharpen_amount_slider.value(),
+                             threshold=self.sharpen_threshold_slider.value())
+
+    def edges(self):
+        self.edges_slider = self.addSlider('Edge Strength (%):', 25, 400, self.parameter('sobel', 'gain', 100),
+                                           self.applyEdges)
+
+    def applyEdges(self):
+        self.applyAdjustment(self.edges_slider, 'sobel', gain=self.edges_slider.value())
+
+    def median(self):
+        self.median_slider = self.addSlider('Median Radius:', 0, 5, self.parameter('median', 'radius', 0),
+                                            self.applyMedian)
+
+    def applyMedian(self):
+        self.applyAdjustment(self.median_slider, 'median', radius=self.median_slider.value())
+
+    def resizeOptions(self):
+        size = self.pipeline.outputSize() if self.pipeline else QSize()
+        self.widthEdit, self.heightEdit = QLineEdit(), QLineEdit()
+        for label, edit, value in (('Width:', self.widthEdit, size.width()), ('Height:', self.heightEdit, size.height())):
+            edit.setValidator(QIntValidator(1, 1000000, edit))
+            edit.setPlaceholderText('Enter ' + label[:-1])
+            edit.setMinimumWidth(150)
+            edit.setMaximumWidth(200)
+            if value > 0:
+                edit.setText(str(value))
+            self.filter_layout.addWidget(QLabel(label))
+            self.filter_layout.addWidget(edit)
+        self.kernelBox = QComboBox()
+        self.kernelBox.addItems(['Lanczos', 'Bicubic', 'Bilinear', 'Nearest'])
+        self.kernelBox.setCurrentText('Bicubic')
+        self.filter_layout.addWidget(QLabel('Resampling:'))
+        self.filter_layout.addWidget(self.kernelBox)
+        self.resizeBtn = QPushButton('Resize')
+        self.resizeBtn.clicked.connect(self.applyResize)
+        self.filter_layout.addWidget(self.resizeBtn)
+
+    def applyResize(self):
+        """Resize the document to fit the entered width and height, keeping its aspect ratio"""
+        if self.pipeline is None:
+            return
+        try:
+            width, height = int(self.widthEdit.text()), int(self.heightEdit.text())
+        except ValueError:
+            width = height = 0
+        if width <= 0 or height <= 0:
+            QMessageBox.warning(self, "Invalid Size", "Width and Height must be positive numbers.")
+            return
+        self.applyOperation('resize', width=width, height=height, kernel=self.kernelBox.currentText().lower())
+        self.updateContent('Resize')
 
     def rotateRight(self):
-        transform = QTransform().rotate(90)
-        pixmap = self.image_label.pixmap()
-        if pixmap:
-            rotated_pixmap = pixmap.transformed(transform, Qt.SmoothTransformation)
-            self.image_label.setPixmap(rotated_pixmap)
+        self.rotateView(90)
 
     def rotateLeft(self):
-        transform = QTransform().rotate(-90)
-        pixmap = self.image_label.pixmap()
-        if pixmap:
-            rotated_pixmap = pixmap.transformed(transform, Qt.SmoothTransformation)
-            self.image_label.setPixmap(rotated_pixmap)
+        self.rotateView(-90)
+
+    def rotateView(self, angle):
+        """Turn the document by quarter turns without re-rendering it"""
+        if self.pipeline is None:
+            return
+        self.recordOperation('rotate', angle=angle)
+        if not self.scroll_area.widgetResizable():
+            self.image_label.resize(self.pipeline.outputSize() * self.view_scale)
 
 
     def mousePressEvent(self, event):
@@ -191,18 +588,50 @@ class ResponsiveWidget(QWidget):
             self.rubberBand.setGeometry(QRect(self.originPoint, self.currentPoint).normalized())
 
     def cropImageSave(self):
+        """Crop the document to the rubber band and save the crop to a chosen file"""
         if self.rubberBand and self.rubberBand.isVisible():
             self.rubberBand.hide()
-            rect = self.rubberBand.geometry()
-            croppedPixmap = self.image_label.pixmap().copy(rect)
-            croppedPixmap.save('output.png')
+            if self.pipeline is None:
+                return
+            rect = self.imageRect(self.rubberBand.geometry())
+            if rect.isEmpty():
+                return
+            # Only crop once there is somewhere to save it; cancelling leaves the document alone
+            file_name, _ = QFileDialog.getSaveFileName(self, 'Save Crop', 'crop.png', 'Images (*.png *.jpg *.jpeg *.bmp)')
+            if file_name:
+                self.applyOperation('crop', x=rect.x(), y=rect.y(), width=rect.width(), height=rect.height())
+                self.exporter.export(self.pipeline, self.pipeline.snapshot(), file_name)
+
+    def exportFinished(self, path, error):
+        if error:
+            QMessageBox.warning(self, "Image Viewer", "Cannot save %s: %s" % (path, error))
+
+    def imageRect(self, rect):
+        """Map a rectangle in widget coordinates to the rendered image.
+
+        The rectangle is clipped to the visible part of the canvas; the
+        scroll position and zoom are taken from the canvas geometry. The
+        result is in the coordinates of the oriented output, which the
+        pipeline maps back through the orientation.
+        """
+        label = self.image_label
+        size = self.pipeline.outputSize()
+        viewport = self.scroll_area.viewport()
+        visible = QRect(viewport.mapTo(self, QPoint()), viewport.size())
+        rect = rect.intersected(visible)
+        rect = QRect(label.mapFrom(self, rect.topLeft()), rect.size())
+        sx = size.width() / max(1, label.width())
+        sy = size.height() / max(1, label.height())
+        rect = QRect(int(rect.x() * sx), int(rect.y() * sy), round(rect.width() * sx), round(rect.height() * sy))
+        return rect.intersected(QRect(QPoint(), size))
 
 class QImageViewer(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self.printerObj = QPrinter()
+        self.printerObj = None  # Created with the first print
         self.scale_factor = 0.0
+        self.prefetcher = Prefetcher()  # Decodes the neighbours of the open image
 
         self.responsiveWidget = ResponsiveWidget()
         self.setCentralWidget(self.responsiveWidget)
@@ -210,10 +639,7 @@ class QImageViewer(QMainWindow):
         # setting the central widget to the scroll area using the setCentral Widget() method  
         self.setCentralWidget(self.responsiveWidget)  
 
-        icon = QIcon()
-        icon.addPixmap(QPixmap("icons/save_21411.ico"), QIcon.Selected, QIcon.On)
-        self.setWindowIcon(icon)
-        # self.setWindowIcon(QIcon('icons/save_21411.ico'))
+        self.setWindowIcon(QIcon(':/icons/save_21411.ico'))
         self.setWindowTitle("Image Viewer")
         self.resize(800, 600)
 
@@ -222,29 +648,80 @@ class QImageViewer(QMainWindow):
         self.createToolbars()
         self.createLeftToolBar()
 
+        self.folderBrowser = None  # Thumbnails of a folder, docked when one is opened
+
+        # Progress of background saves, shown while one is running
+        self.exportProgress = QProgressBar()
+        self.exportProgress.setMaximumWidth(200)
+        self.exportProgress.hide()
+        self.statusBar().addPermanentWidget(self.exportProgress)
+        self.responsiveWidget.exporter.progress.connect(self.update_export_progress)
+        self.responsiveWidget.exporter.finished.connect(self.export_finished)
+
+        # Timings of the latest operations, refreshed while profiling is on
+        self.profileLabel = QLabel()
+        self.statusBar().addPermanentWidget(self.profileLabel)
+        self.profileTimer = QTimer(self)
+        self.profileTimer.setInterval(500)
+        self.profileTimer.timeout.connect(self.update_profile_readout)
+        self.toggle_profiling(profiling.enabled())
+
     def createActions(self):
-        self.openAct = QAction(QIcon('icons/image_1146.ico'), "&Open...", self,
+        self.openAct = QAction(QIcon(':/icons/image_1146.ico'), "&Open...", self,
                                shortcut=QKeySequence.Open,
                                statusTip="Open an existing image",
                                triggered=self.openImage)
 
-        self.exitAct = QAction(QIcon('icons/ic_exit_to_app_128_28418.ico'), "E&xit", self, shortcut="Ctrl+Q",
+        self.openFolderAct = QAction("Open &Folder...", self, shortcut="Ctrl+Shift+O",
+                                     statusTip="Browse the images of a folder",
+                                     triggered=self.openFolder)
+
+        self.nextAct = QAction("&Next Image", self, shortcut="Ctrl+Right",
+                               statusTip="Open the next image in the folder",
+                               triggered=self.nextImage, enabled=False)
+        self.previousAct = QAction("&Previous Image", self, shortcut="Ctrl+Left",
+                                   statusTip="Open the previous image in the folder",
+                                   triggered=self.previousImage, enabled=False)
+
+        self.exitAct = QAction(QIcon(':/icons/ic_exit_to_app_128_28418.ico'), "E&xit", self, shortcut="Ctrl+Q",
                                statusTip="Exit the application",
                                triggered=self.close)
-        self.printAct = QAction(QIcon('icons/Print_22326.ico'),"Print", self,
+        self.printAct = QAction(QIcon(':/icons/Print_22326.ico'),"Print", self,
                                 shortcut=QKeySequence.Print, 
                                 statusTip='Print as existing image',
                                  triggered=self.printImage)
         
-        self.saveAct = QAction(QIcon('icons/save_21411.ico'),"Save", self,
+        self.saveAct = QAction(QIcon(':/icons/save_21411.ico'),"Save", self,
                                 shortcut=QKeySequence.Save, 
                                 statusTip='Save as existing image',
                                  triggered=self.saveImage)
 
+        self.undoAct = QAction("&Undo", self, shortcut=QKeySequence.Undo,
+                               statusTip='Undo the last edit',
+                               triggered=self.responsiveWidget.undo, enabled=False)
+        self.redoAct = QAction("&Redo", self, shortcut=QKeySequence.Redo,
+                               statusTip='Redo the last undone edit',
+                               triggered=self.responsiveWidget.redo, enabled=False)
+        self.responsiveWidget.historyChanged.connect(self.update_history_actions)
+
+        self.profileAct = QAction("&Performance Overlay", self, shortcut="Ctrl+Shift+P", checkable=True,
+                                  checked=profiling.enabled(),
+                                  statusTip='Time every stage and show the latest timings',
+                                  toggled=self.toggle_profiling)
+        self.exportTraceAct = QAction("Export Performance &Trace...", self,
+                                      statusTip='Save the recorded timings as a Chrome trace',
+                                      triggered=self.export_trace)
+        self.memoryAct = QAction("&Memory Usage...", self,
+                                 statusTip='Show the memory held by the image and each cache',
+                                 triggered=self.show_memory_usage)
+
         
     def createMenus(self):
         self.fileMenu = self.menuBar().addMenu("&File")
         self.fileMenu.addAction(self.openAct)
+        self.fileMenu.addAction(self.openFolderAct)
+        self.fileMenu.addAction(self.previousAct)
+        self.fileMenu.addAction(self.nextAct)
         self.fileMenu.addSeparator()
         self.fileMenu.addAction(self.printAct)
         self.fileMenu.addSeparator()
@@ -252,9 +729,13 @@ class QImageViewer(QMainWindow):
         self.fileMenu.addSeparator()
         self.fileMenu.addAction(self.exitAct)
 
+        self.editMenu = self.menuBar().addMenu("&Edit")
+        self.editMenu.addAction(self.undoAct)
+        self.editMenu.addAction(self.redoAct)
+
         self.viewmenu = self.menuBar().addMenu('&View')
 
-        self.fitToWindow_opt = self.makeAction(self, 'icons/fit_to_center_icon_215663.ico', 'Fit To Window', 'Fit To Window', self.fit_to_window)
+        self.fitToWindow_opt = self.makeAction(self, ':/icons/fit_to_center_icon_215663.ico', 'Fit To Window', 'Fit To Window', self.fit_to_window)
         self.fitToWindow_opt.setShortcut(QKeySequence("Ctrl+F"))
         self.fitToWindow_opt.setEnabled(False)
 
@@ -264,32 +745,38 @@ class QImageViewer(QMainWindow):
 
         self.viewmenu.addSeparator()
         self.viewmenu.addAction(self.fitToWindow_opt)
+        self.viewmenu.addSeparator()
+        self.viewmenu.addAction(self.profileAct)
+        self.viewmenu.addAction(self.exportTraceAct)
+        self.viewmenu.addAction(self.memoryAct)
 
     def createToolbars(self):
         self.fileToolBar = self.addToolBar("File")
         self.fileToolBar.addAction(self.openAct)
+        self.fileToolBar.addAction(self.previousAct)
+        self.fileToolBar.addAction(self.nextAct)
 
-        self.zoomIN_opt = self.makeAction(self, 'icons/zoomin_zoom_search_find_1531.ico', 'Zoom In (25%)', 'Zoom In (25%)', self.zoom_in)
+        self.zoomIN_opt = self.makeAction(self, ':/icons/zoomin_zoom_search_find_1531.ico', 'Zoom In (25%)', 'Zoom In (25%)', self.zoom_in)
         self.zoomIN_opt.setShortcut(QKeySequence.ZoomIn)
         self.zoomIN_opt.setEnabled(False)
 
-        self.zoomOUT_opt = self.makeAction(self, 'icons/zoomout_zoom_search_find_1530.ico', 'Zoom Out (25%)', 'Zoom Out (25%)', self.zoom_out)
+        self.zoomOUT_opt = self.makeAction(self, ':/icons/zoomout_zoom_search_find_1530.ico', 'Zoom Out (25%)', 'Zoom Out (25%)', self.zoom_out)
         self.zoomOUT_opt.setShortcut(QKeySequence.ZoomOut)
         self.zoomOUT_opt.setEnabled(False)
 
         # New actions for rotate
-        self.rotateRightAct = self.makeAction(self, 'icons/rotate_right_filled_icon_201938.ico', 'Rotate Right', 'Rotate Right', self.rotateRight)
+        self.rotateRightAct = self.makeAction(self, ':/icons/rotate_right_filled_icon_201938.ico', 'Rotate Right', 'Rotate Right', self.rotateRight)
         self.rotateRightAct.setEnabled(False)
 
-        self.rotateLeftAct = self.makeAction(self, 'icons/rotate_left_filled_icon_201238.ico', 'Rotate Left', 'Rotate Left', self.rotateLeft)
+        self.rotateLeftAct = self.makeAction(self, ':/icons/rotate_left_filled_icon_201238.ico', 'Rotate Left', 'Rotate Left', self.rotateLeft)
         self.rotateLeftAct.setEnabled(False)
 
         # New actions for Crop
-        self.CropAct = self.makeAction(self, 'icons/Crop.ico', 'Crop', 'Crop', self.imageCrop)
+        self.CropAct = self.makeAction(self, ':/icons/Crop.ico', 'Crop', 'Crop', self.imageCrop)
         self.CropAct.setEnabled(False)
 
         # New actions for Crop
-        self.ResizeAct = self.makeAction(self, 'icons/resize.ico', 'Resize', 'Resize', self.imageResize)
+        self.ResizeAct = self.makeAction(self, ':/icons/resize.ico', 'Resize', 'Resize', self.imageResize)
         self.ResizeAct.setEnabled(False)
 
         self.normalSize_opt = self.makeAction(self, '', 'Normal Size', 'Normal Size', self.normal_size)
@@ -313,12 +800,12 @@ class QImageViewer(QMainWindow):
         help_menu = addmenubar.addMenu('Help')
 
         # # File -> open
-        open_action = QAction(QIcon('icons/image_icon-icons.com_50366.ico'), 'Gray', self, statusTip='Gray as existing image')
+        open_action = QAction(QIcon(':/icons/image_icon-icons.com_50366.ico'), 'Gray', self, statusTip='Gray as existing image')
         # open_action.triggered.connect(self.GrayImage)
         open_action.triggered.connect(lambda: self.onFilterActionTriggered('Gray'))
         # file_menu.addAction(open_action)
 
-        brightness_action = QAction(QIcon('icons/contrast_sun.ico'),'Brightness', self, statusTip='Brighten the existing image')
+        brightness_action = QAction(QIcon(':/icons/contrast_sun.ico'),'Brightness', self, statusTip='Brighten the existing image')
         # self.brightness_action.triggered.connect(self.show_brightness_controls)
         brightness_action.triggered.connect(lambda: self.onFilterActionTriggered('Brightness'))
 
@@ -331,6 +818,18 @@ class QImageViewer(QMainWindow):
         #Add actions to the toolbar
         self.toolbar.addAction(open_action)
         self.toolbar.addAction(brightness_action)
+        for filter_name, tip in (('Contrast', 'Stretch or flatten the tones'),
+                                 ('Gamma', 'Brighten or darken the midtones'),
+                                 ('Levels', 'Set the black point, white point and midtones'),
+                                 ('Curves', 'Reshape the tone curve'),
+                                 ('Box Blur', 'Average every pixel with its neighbours'),
+                                 ('Gaussian Blur', 'Blur smoothly'),
+                                 ('Sharpen', 'Sharpen with an unsharp mask'),
+                                 ('Edges', 'Show the Sobel edges'),
+                                 ('Median', 'Remove speckle noise')):
+            action = QAction(filter_name, self, statusTip=tip)
+            action.triggered.connect(lambda checked=False, name=filter_name: self.onFilterActionTriggered(name))
+            self.toolbar.addAction(action)
         self.toolbar.addAction(exit_action)
 
     def onFilterActionTriggered(self, filter_name):
@@ -347,42 +846,75 @@ class QImageViewer(QMainWindow):
         self.responsiveWidget.cropImageSave()
 
     def imageResize(self):
-        # Create input fields for width and height
-        self.widthEdit = QLineEdit()
-        self.widthEdit.setPlaceholderText("Enter Width")
-        self.widthEdit.setMinimumWidth(150)  # Set minimum width
-        self.widthEdit.setMaximumWidth(200)  # Set maximum width
-        self.responsiveWidget.filter_layout.addWidget(QLabel('Width:'))
-        self.responsiveWidget.filter_layout.addWidget(self.widthEdit)
-
-        self.responsiveWidget.filter_layout.addWidget(QLabel('✖'))
-
-        self.heightEdit = QLineEdit()
-        self.heightEdit.setPlaceholderText("Enter Height")
-        self.heightEdit.setMinimumWidth(150)  # Set minimum width
-        self.heightEdit.setMaximumWidth(200)  # Set maximum width
-        self.responsiveWidget.filter_layout.addWidget(QLabel('Height:'))
-        self.responsiveWidget.filter_layout.addWidget(self.heightEdit)
-
-        # Create a resize button
-        self.resizeBtn = QPushButton("Resize")
-        self.resizeBtn.clicked.connect(self.resizeImage)
-        self.responsiveWidget.filter_layout.addWidget(self.resizeBtn)
-
-    def resizeImage(self, width, height):
-        if width <= 0 or height <= 0:
-            QMessageBox.warning(self, "Invalid Size", "Width and Height must be positive numbers.")
-            return
+        self.responsiveWidget.updateContent('Resize')
 
-        scaledPixmap = self.pixmap().scaled(QSize(width, height), Qt.KeepAspectRatio)
-        self.setPixmap(scaledPixmap)
-        
     def saveImage(self):
-        pixmap = self.centralWidget().getImagePixmap()
-        if pixmap:
-            filename, _ = QFileDialog.getSaveFileName(self, 'Save Image', '.', 'Images (*.png *.jpg *.jpeg *.bmp)')
-            if filename:
-                pixmap.save(filename)
+        """Save the full resolution document in the background"""
+        pipeline = self.responsiveWidget.pipeline
+        if pipeline is None:
+            return
+        stem, suffix = os.path.splitext(pipeline.sourcePath() or 'image.png')
+        from export_dialog import ExportDialog
+        dialog = ExportDialog(stem + '_edited' + (suffix or '.png'), self)
+        if dialog.exec_():
+            self.exportProgress.setValue(0)
+            self.exportProgress.show()
+            self.responsiveWidget.exporter.export(pipeline, pipeline.snapshot(), dialog.targets())
+
+    def update_export_progress(self, done, total):
+        self.exportProgress.setMaximum(total)
+        self.exportProgress.setValue(done)
+
+    def export_finished(self, paths, error):
+        self.exportProgress.hide()
+        if not error:
+            self.statusBar().showMessage('Saved %s' % paths, 5000)
+
+    def toggle_profiling(self, enabled):
+        profiling.enable(enabled)
+        self.exportTraceAct.setEnabled(enabled)
+        self.profileLabel.setVisible(enabled)
+        if enabled:
+            self.profileTimer.start()
+            self.update_profile_readout()
+        else:
+            self.profileTimer.stop()
+
+    def update_profile_readout(self):
+        parts = []
+        for name, seconds, usage in profiling.recent():
+            part = '%s %.1f ms' % (name, seconds * 1000)
+            if usage:
+                part += ' %+.1f MB' % usage
+            parts.append(part)
+        rss = profiling.rss()
+        if rss is not None:
+            parts.append('RSS %d MB' % (rss // 2 ** 20))
+        self.profileLabel.setText('  |  '.join(parts))
+
+    def export_trace(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, 'Export Performance Trace', 'trace.json',
+                                                   'Chrome trace (*.json)')
+        if file_name:
+            try:
+                profiling.export_trace(file_name)
+            except OSError as error:
+                QMessageBox.warning(self, "Image Viewer", "Cannot write %s: %s" % (file_name, error))
+                return
+            self.statusBar().showMessage('Saved %s' % file_name, 5000)
+
+    def show_memory_usage(self):
+        """Show what the document, its caches and the view hold, each shared buffer counted once"""
+        widget = self.responsiveWidget
+        pipeline = widget.pipeline
+        rows = memory.report([
+            ('Source image', pipeline.sourceImages() if pipeline else [], 0),
+            ('Render stages', pipeline.renderImages() if pipeline else [], 0),
+            ('View pyramid and tiles', widget.image_label.images(), widget.image_label.tileUsage()),
+            ('Undo snapshots', [], widget.history.memoryUsage()),
+            ('Prefetched images', self.prefetcher.images(), 0),
+        ])
+        QMessageBox.information(self, 'Memory Usage', '<pre>%s</pre>' % memory.format_report(rows))
 
     def openImage(self):
         selections = QFileDialog.Options()
@@ -394,15 +926,31 @@ class QImageViewer(QMainWindow):
             options=selections
         )
         if file_name:
-            image = QImage(file_name)
-            pixmap = QPixmap(file_name)
-            self.original_image = pixmap.toImage()
-            self.display_image(self.original_image)
-            if image.isNull():
+            self.openPath(file_name)
+
+    def openFolder(self):
+        folder = QFileDialog.getExistingDirectory(self, 'Open Folder')
+        if folder:
+            if self.folderBrowser is None:
+                from browser import FolderBrowser
+                self.folderBrowser = FolderBrowser(self)
+                self.folderBrowser.imageActivated.connect(self.openPath)
+                self.addDockWidget(Qt.LeftDockWidgetArea, self.folderBrowser)
+            self.folderBrowser.setFolder(folder)
+            self.folderBrowser.show()
+
+    @profiling.traced('open')
+    def openPath(self, file_name):
+        """Open the image file file_name as a new document"""
+        if file_name:
+            source = self.prefetcher.take(file_name)
+            try:
+                source = source or ImageSource(file_name)
+            except IOError:
                 QMessageBox.information(self, "Image Viewer", "Cannot load %s." % file_name)
                 return
 
-            self.responsiveWidget.image_label.setPixmap(QPixmap.fromImage(image))
+            self.responsiveWidget.setSourceImage(source)
             self.scale_factor = 1.0
             self.responsiveWidget.scroll_area.setVisible(True)
             self.fit_to_window()
@@ -410,19 +958,43 @@ class QImageViewer(QMainWindow):
             self.update_actions()
 
             if not self.fitToWindow_opt.isChecked():
-                self.responsiveWidget.image_label.adjustSize()
+                self.normal_size()
+
+            viewport = self.responsiveWidget.scroll_area.viewport()
+            self.prefetcher.setCurrent(file_name, viewport.size() * viewport.devicePixelRatioF())
+            self.nextAct.setEnabled(self.prefetcher.neighbour(file_name, 1) is not None)
+            self.previousAct.setEnabled(self.prefetcher.neighbour(file_name, -1) is not None)
+
+    def nextImage(self):
+        self.openNeighbour(1)
+
+    def previousImage(self):
+        self.openNeighbour(-1)
+
+    def openNeighbour(self, step):
+        """Open the image step places away from the current one in its folder"""
+        pipeline = self.responsiveWidget.pipeline
+        path = pipeline.sourcePath() if pipeline is not None else None
+        neighbour = self.prefetcher.neighbour(path, step) if path else None
+        if neighbour:
+            self.openPath(neighbour)
 
 
     def printImage(self):
+        from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
+        if self.printerObj is None:
+            self.printerObj = QPrinter()
         print_dialog = QPrintDialog(self.printerObj, self)
         if print_dialog.exec_():
             the_painter = QPainter(self.printerObj)
             rectangle = the_painter.viewport()
-            the_size = self.responsiveWidget.image_label.pixmap().size()
+            the_image = self.responsiveWidget.image_label.image()
+            the_image = the_image.transformed(QTransform().rotate(90 * self.responsiveWidget.image_label.orientation()))
+            the_size = the_image.size()
             the_size.scale(rectangle.size(), Qt.KeepAspectRatio)
             the_painter.setViewport(rectangle.x(), rectangle.y(), the_size.width(), the_size.height())
-            the_painter.setWindow(self.responsiveWidget.image_label.pixmap().rect())
-            the_painter.drawPixmap(0, 0, self.responsiveWidget.image_label.pixmap())
+            the_painter.setWindow(the_image.rect())
+            the_painter.drawImage(0, 0, the_image)
 
     def closeEvent(self, event):
         reply = QMessageBox.question(self, 'Message', 'Are you sure to quit?', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -438,7 +1010,7 @@ class QImageViewer(QMainWindow):
         self.scale_image(0.8)
 
     def normal_size(self):
-        self.responsiveWidget.image_label.adjustSize()
+        self.responsiveWidget.resizeView(1.0)
         self.scale_factor = 1.0
 
     def makeAction(self, parent_obj, icon_destination, name_of_action, status_tip, triggered_method):
@@ -463,9 +1035,13 @@ class QImageViewer(QMainWindow):
         self.CropAct.setEnabled(not self.fitToWindow_opt.isChecked())
         self.ResizeAct.setEnabled(not self.fitToWindow_opt.isChecked())
 
+    def update_history_actions(self):
+        self.undoAct.setEnabled(self.responsiveWidget.history.canUndo())
+        self.redoAct.setEnabled(self.responsiveWidget.history.canRedo())
+
     def scale_image(self, sf):
         self.scale_factor *= sf
-        self.responsiveWidget.image_label.resize(self.scale_factor * self.responsiveWidget.image_label.pixmap().size())
+        self.responsiveWidget.resizeView(self.scale_factor)
 
         self.adjust_scroll_bar(self.responsiveWidget.scroll_area.horizontalScrollBar(), sf)
         self.adjust_scroll_bar(self.responsiveWidget.scroll_area.verticalScrollBar(), sf)
@@ -480,13 +1056,26 @@ class QImageViewer(QMainWindow):
 
     def display_image(self, image):
         # Display image in QLabel
-        pixmap = QPixmap.fromImage(image)
-        self.responsiveWidget.image_label.setPixmap(pixmap)
+        self.responsiveWidget.displayImage(image)
+
+
 
+class FirstPaintProbe(QObject):
+    """Reports the first paint of the window and exits, for startup_benchmark.py"""
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            sys.stdout.write('first-paint\n')
+            sys.stdout.flush()
+            os._exit(0)
+        return False
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # For the process backend of parallel in frozen builds
     app = QApplication(sys.argv)
+    if os.environ.get('FILTER_APP_STARTUP_PROBE'):
+        probe = FirstPaintProbe(app)
+        app.installEventFilter(probe)
     image_viewer = QImageViewer()
     image_viewer.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Red, green, blue and luma histograms of the document.
+
+While a slider moves, the histogram comes from the preview render, and
+only from a sample of its pixels when it is large. When the operations end
+in a run of point operations, the histogram of the stage before the run
+is kept and pushed through the run's lookup table, so dragging a contrast
+or curves slider never rescans pixels. Once a full resolution render is
+shown its exact histogram is computed in the background.
+
+Remapping is exact for the red, green and blue channels. Luma is remapped
+through the same table, which is exact for grey images and close for
+colour ones; tables that differ between channels rescan the preview.
+"""
+
+# Built-in/Generic Imports
+import math
+
+# Libs
+import numpy as np
+
+# Own modules
+import image_ops
+import point_ops
+import profiling
+from parallel import RenderCancelled
+
+
+SAMPLE_LIMIT = 256 * 1024  # Pixels read for a preview histogram
+
+
+@profiling.traced('histogram')
+def compute(image, limit=None, isCancelled=None, band=256):
+    """Return the (4, 256) red, green, blue and luma histogram of image.
+
+    With limit, only every n-th pixel of every n-th row is counted, n being
+    chosen so that at most about limit pixels are read.
+    """
+    image = image_ops.supported(image)
+    array = image_ops.to_array(image)
+    if limit:
+        step = max(1, int(math.ceil(math.sqrt(image.width() * image.height() / float(limit)))))
+        array = array[::step, ::step]
+    rgb = image_ops.channels(image)
+    result = np.zeros((4, 256), np.int64)
+    for top in range(0, array.shape[0], band):
+        if isCancelled is not None and isCancelled():
+            raise RenderCancelled()
+        rows = array[top:top + band]
+        if rgb[0] == rgb[1] == rgb[2]:
+            result += np.bincount(rows[:, :, rgb[0]].ravel(), minlength=256)
+            continue
+        for index, channel in enumerate(rgb):
+            result[index] += np.bincount(rows[:, :, channel].ravel(), minlength=256)
+        result[3] += np.bincount(image_ops.luma(rows, rgb).ravel(), minlength=256)
+    return result
+
+
+def remap(histogram, lut):
+    """Return the histogram of an image after mapping it through lut, a (3, 256) table"""
+    result = np.empty_like(histogram)
+    for index, table in enumerate((lut[0], lut[1], lut[2], lut[0])):
+        result[index] = np.bincount(table, weights=histogram[index], minlength=256).round()
+    return result
+
+
+def _point_run(operations):
+    """Split operations into the stages before their trailing point operations and that run"""
+    start = len(operations)
+    while start > 0 and point_ops.is_point(operations[start - 1].name):
+        start -= 1
+    return operations[:start], operations[start:]
+
+
+class PreviewHistograms:
+    """Histograms of preview renders, remapped through point operations when possible"""
+    def __init__(self):
+        self._base = None  # (operations, histogram) of the stage before a point run
+
+    def clear(self):
+        self._base = None
+
+    def histogram(self, pipeline, operations, image):
+        """Return the histogram of image, the preview render of operations"""
+        prefix, run = _point_run(tuple(operations))
+        if run:
+            lut = point_ops.compile_lut(run)
+            if point_ops.is_uniform(lut):
+                if self._base is None or self._base[0] != prefix:
+                    stage = pipeline.cachedStage(prefix, preview=True)
+                    self._base = (prefix, compute(stage, SAMPLE_LIMIT)) if stage is not None else None
+                if self._base is not None:
+                    with profiling.span('histogram.remap'):
+                        return remap(self._base[1], lut)
+        return compute(image, SAMPLE_LIMIT)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Widget drawing the histograms computed by the histogram module.
+
+It only reads the arrays it is given and does not import NumPy itself, so
+it can be built with the window before any image is open.
+"""
+
+# Libs
+from PyQt5.QtCore import QPointF, QSize
+from PyQt5.QtGui import QColor, QPainter, QPainterPath
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+
+class HistogramView(QWidget):
+    """Draws red, green and blue histograms with the luma histogram on top"""
+    COLORS = (QColor(255, 60, 60, 110), QColor(60, 220, 60, 110), QColor(70, 110, 255, 110))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._histogram = None
+        self._exact = False
+
+    def sizeHint(self):
+        return QSize(256, 110)
+
+    def minimumSizeHint(self):
+        return QSize(128, 110)
+
+    def setHistogram(self, histogram, exact=False):
+        """Show histogram, a (4, 256) array, or nothing when it is None"""
+        self._histogram = histogram
+        self._exact = exact
+        self.setToolTip('Exact histogram' if exact else 'Histogram of the preview')
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(30, 30, 30))
+        if self._histogram is None:
+            return
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Square roots keep small counts visible next to large peaks
+        heights = self._histogram ** 0.5
+        heights = heights / max(heights.max(), 1.0)
+        width, height = self.width(), self.height() - 1
+        xs = [index * (width - 1) / 255.0 for index in range(256)]
+        for values, color in zip(heights[:3], self.COLORS):
+            path = QPainterPath(QPointF(0, height))
+            for x, value in zip(xs, values):
+                path.lineTo(QPointF(x, height - value * height))
+            path.lineTo(QPointF(width - 1, height))
+            painter.fillPath(path, color)
+        path = QPainterPath(QPointF(0, height - heights[3][0] * height))
+        for x, value in zip(xs[1:], heights[3][1:]):
+            path.lineTo(QPointF(x, height - value * height))
+        painter.setPen(QColor(235, 235, 235) if self._exact else QColor(235, 235, 235, 160))
+        painter.drawPath(path)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Undo/redo history for the edit pipeline.
+
+Because the source image is never modified, every edit is fully described
+by the operation list before and after it. A step stores those two tuples,
+which makes undo and redo constant time and a few hundred bytes each:
+undoing a rotation simply restores the operation list without it.
+
+Rendering an older state again can still be slow on large images, so the
+history also keeps zlib-compressed snapshots of rendered results. They are
+compressed on a background thread and evicted oldest first once their
+total size exceeds the memory budget; an evicted snapshot only means the
+state is re-rendered instead of shown immediately.
+"""
+
+# Built-in/Generic Imports
+import collections
+import concurrent.futures
+import threading
+import zlib
+
+# Libs
+from PyQt5.QtGui import QImage
+
+
+DEFAULT_BUDGET = 256 * 1024 * 1024
+
+
+class _Step:
+    def __init__(self, before, after, merge=None):
+        self.before = before
+        self.after = after
+        self.merge = merge
+
+
+class EditHistory:
+    """Undo and redo stacks of operation lists, plus rendered snapshots"""
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self._undo = []
+        self._redo = []
+        self._snapshots = collections.OrderedDict()
+        self._snapshotBytes = 0
+        self._lock = threading.Lock()
+        self._compressor = concurrent.futures.ThreadPoolExecutor(1, 'history-snapshot')
+        self._generation = 0  # Bumped by clear(), so that late snapshots are dropped
+
+    def record(self, before, after, merge=None):
+        """Push an edit from the before to the after operation tuples.
+
+        Consecutive edits with the same merge key, such as the steps of one
+        slider drag, collapse into a single undo step until seal() is called.
+        """
+        if before == after:
+            return
+        top = self._undo[-1] if self._undo else None
+        if merge is not None and top is not None and top.merge == merge and not self._redo:
+            top.after = after
+        else:
+            self._undo.append(_Step(before, after, merge))
+        self._redo.clear()
+
+    def seal(self):
+        """Stop the current step from absorbing further edits"""
+        if self._undo:
+            self._undo[-1].merge = None
+
+    def canUndo(self):
+        return bool(self._undo)
+
+    def canRedo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """Return the operation tuple to restore, or None"""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        step.merge = None
+        self._redo.append(step)
+        return step.before
+
+    def redo(self):
+        """Return the operation tuple to re-apply, or None"""
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._undo.append(step)
+        return step.after
+
+    def clear(self):
+        """Forget every step and snapshot, including snapshots still being compressed"""
+        self._undo.clear()
+        self._redo.clear()
+        with self._lock:
+            self._generation += 1
+            self._snapshots.clear()
+            self._snapshotBytes = 0
+
+    def generation(self):
+        """Return a token that remember() accepts until the next clear()"""
+        with self._lock:
+            return self._generation
+
+    def remember(self, operations, image, generation=None):
+        """Compress a rendered result for operations in the background.
+
+        generation, from generation() when the render started, drops the
+        result if the history has been cleared for another document since.
+        """
+        if self.budget <= 0:
+            return
+        with self._lock:
+            if generation is None:
+                generation = self._generation
+            elif generation != self._generation:
+                return
+        self._compressor.submit(self._store, generation, tuple(operations), image)
+
+    def _store(self, generation, operations, image):
+        ptr = image.constBits()
+        ptr.setsize(image.sizeInBytes())
+        # Compressing straight from the buffer saves a full size copy of it
+        entry = (image.width(), image.height(), image.bytesPerLine(), image.format(), zlib.compress(ptr, 1))
+        with self._lock:
+            if generation != self._generation:
+                return  # Rendered for a document that is no longer open
+            old = self._snapshots.pop(operations, None)
+            if old is not None:
+                self._snapshotBytes -= len(old[4])
+            self._snapshots[operations] = entry
+            self._snapshotBytes += len(entry[4])
+            while self._snapshotBytes > self.budget and self._snapshots:
+                _, evicted = self._snapshots.popitem(last=False)
+                self._snapshotBytes -= len(evicted[4])
+
+    def snapshot(self, operations):
+        """Return the remembered render of operations as a QImage, or None"""
+        with self._lock:
+            entry = self._snapshots.get(tuple(operations))
+            if entry is not None:
+                self._snapshots.move_to_end(tuple(operations))
+        if entry is None:
+            return None
+        width, height, stride, image_format, data = entry
+        return QImage(zlib.decompress(data), width, height, stride, image_format).copy()
+
+    def memoryUsage(self):
+        """Return the bytes held by compressed snapshots"""
+        with self._lock:
+            return self._snapshotBytes
@@ -0,0 +1,9404 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x38\x1b\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x5d\x07\x7c\x55\xe5\xd9\xbf\x88\x15\xaa\
+\xf5\xb3\x5f\xab\xed\xd7\xcf\xb6\xda\x2a\x7e\x5a\xab\x2d\x55\xab\
+\x75\x40\xb5\x5a\x07\xae\xaa\x28\x22\xca\x9e\xb2\xc2\x48\x08\x10\
+\x12\x42\xf6\xde\x3b\x37\x7b\xef\xbd\x43\x36\x09\x10\x56\x20\x09\
+\x3b\x61\xaf\xb0\x21\xcc\xfc\xbf\xe7\x79\xcf\x39\x37\xe7\xde\xdc\
+\x0c\xd0\xd6\x44\xf3\xfa\x7b\x0c\xe7\xae\x73\xef\xf9\x3f\xcf\xff\
+\x19\xef\xf3\xbe\x47\xa3\x19\x42\xff\x59\x59\x69\xe8\xff\x0f\x6b\
+\x1e\x1f\x3e\x44\xf3\x0b\x8d\x46\xf3\x38\x09\x3d\xc4\x0f\x8a\xc7\
+\xc5\xa0\xe7\x06\xc7\xe0\x18\x1c\x83\x63\x70\x0c\xd8\xc1\x24\x3e\
+\x54\x96\x3b\xe5\xbf\x77\xc8\x8f\x0f\x8e\xef\xef\x50\x70\x1f\x46\
+\x72\x37\xc9\xbd\x24\xff\x45\xf2\x13\xf9\xf8\x2e\xf9\xf9\x41\x3d\
+\xf8\xfe\x0d\xc6\xf4\x47\x1a\x09\xe7\xff\x26\xf9\x1f\x92\xdf\x90\
+\xfc\x96\xe4\xd7\x24\xbf\x94\x1f\xbf\x47\x33\xa8\x07\xdf\xb7\xa1\
+\x60\xcf\x76\xfe\x00\xc9\xef\x48\xfe\x40\xf2\x67\x92\xbf\x90\xfc\
+\x49\x3e\xfe\x3d\xc9\xaf\x48\x7e\x4a\xf2\x63\x8d\xe4\x1b\x06\x75\
+\x60\x60\x0f\x35\xf6\xbf\xbc\xe7\x9e\x7b\x9e\x1a\x39\x72\x64\xd0\
+\x5f\xff\xfa\xd7\xad\xaf\xbd\xf6\x5a\xd3\x98\x31\x63\xf2\x46\x8f\
+\x1e\x6d\x7e\xe7\x9d\x77\xbe\x42\xcf\x3f\xab\x91\xf4\xe0\x21\x92\
+\xfb\x35\x12\x17\xf0\x7b\xef\xf8\xae\xbe\xfc\xe0\xf8\x46\x43\x0f\
+\xfb\x9f\xfd\xec\x67\x2f\x3c\xf3\xcc\x33\x7b\x9f\x7f\xfe\x79\x10\
+\xf6\xf8\xe8\xa3\x8f\x30\x69\xd2\x24\xcc\x9f\x3f\x1f\x26\x26\x26\
+\xad\xf4\xd8\x72\x7a\xdd\x8b\x1a\x89\x17\x1e\x21\xf9\x85\xfc\xde\
+\x41\x1d\x18\x78\x43\x0f\xfb\x47\x1f\x7d\xf4\x85\x77\xde\x79\x67\
+\xdf\xc7\x1f\x7f\x8c\xc9\x93\x27\x63\xd6\xac\x59\x98\x32\x65\x8a\
+\xc0\xde\xcc\xcc\x4c\xfc\xe5\xc7\x89\x0f\x4a\xef\xbe\xfb\xee\x7f\
+\x6a\x24\xbf\x30\x42\x23\xc5\x05\x8a\x0e\x0c\xfa\x82\x81\x31\xba\
+\x60\xff\xe9\xa7\x9f\xee\x9b\x30\x61\x82\xc0\xd9\xde\xde\x1e\x61\
+\x61\x61\x48\x4f\x4f\x47\x40\x40\x00\x16\x2c\x58\x20\xb0\xff\xe4\
+\x93\x4f\xf0\xf6\xdb\x6f\xe3\xe5\x97\x5f\x6e\x25\xae\xf8\x88\xde\
+\xfb\x0c\xc9\xa3\x1a\x89\x07\x38\x6e\x1c\x8c\x09\xfb\xff\xe8\x13\
+\xf6\xb9\xb9\xb9\xa8\xae\xae\x16\x7f\xbd\xbd\xbd\xc1\xcf\x33\xf6\
+\xa3\x46\x8d\xc2\xb3\xcf\x3e\x8b\x27\x9f\x7c\xf2\xf8\x83\x0f\x3e\
+\xf8\x09\x7d\xc6\x48\x8d\x14\x2f\xfe\x4c\x23\xe5\x8d\x83\x7e\xa0\
+\xff\x8e\x5b\xc6\x3e\x22\x22\x02\x2e\x2e\x2e\x30\x35\x35\x15\xf8\
+\xcb\xd8\xe3\x91\x47\x1e\xc1\x13\x4f\x3c\xb1\xff\x37\xbf\xf9\xcd\
+\x7b\xf4\x59\x4f\x91\x3c\xa8\x91\xea\x05\x77\x7e\x87\xbf\x6f\x70\
+\x74\x3f\x6e\x1b\x7b\x73\x73\x73\xcc\x9c\x39\x13\xf4\x7a\x70\x6c\
+\xc8\xd8\x3f\xf4\xd0\x43\x78\xf8\xe1\x87\xf1\xc2\x0b\x2f\xac\x1d\
+\x3e\x7c\xf8\xdf\x34\x92\x1f\x50\x38\x60\xd0\x07\xf4\xaf\xf1\xad\
+\x60\xff\xe6\x9b\x6f\xe2\xa5\x97\x5e\xc2\xe3\x8f\x3f\x2e\xb0\x67\
+\x3d\xa0\x7f\x5f\x7d\xe5\x95\x57\x96\x68\xa4\xbc\x90\x63\x41\xae\
+\x0b\x0c\xfa\x80\xfe\x33\xbe\x55\xec\x29\x3f\xc4\x73\xcf\x3d\xc7\
+\xdc\x8f\xc7\x1e\x7b\x4c\xfc\x7d\xf5\xd5\x57\x6b\x35\x92\x0f\xe0\
+\xda\x10\xd7\x04\x06\xf1\xef\x1f\xe3\xdf\x82\xfd\x8b\x2f\xbe\x08\
+\xb2\x79\x11\x07\x3c\xf5\xd4\x53\x7c\x7c\xe2\xb7\xbf\xfd\x2d\xd7\
+\x05\xb8\x66\x3c\x68\xff\xfd\x63\xfc\xdb\xb0\x1f\x3d\x7a\x34\x5e\
+\x7f\xfd\x75\xa1\x03\x23\x47\x8e\xe4\x7c\xb0\x6d\xc4\x88\x11\xcf\
+\xd3\x79\x7e\xae\x19\xf4\xff\xfd\x61\xfc\xdb\xb1\x1f\x33\x66\x0c\
+\xde\x7f\xff\x7d\xf1\x38\x3d\xd6\xaa\x91\xe6\x89\xee\x95\xcf\x3b\
+\x38\xbe\xbb\xf1\x1f\xc1\x9e\x6b\xc3\x9f\x7f\xfe\xb9\x78\x9c\xc4\
+\x5a\x33\x98\xff\xf7\x87\xf1\x1f\xc5\x9e\x3f\x97\x9e\xcb\xd6\x74\
+\xc6\xfd\x43\xbf\xcb\x1f\xff\x03\x1f\xff\x51\xec\x79\x5e\xe8\x83\
+\x0f\x3e\x50\xb0\x1f\xac\xfd\x7e\xb7\xe3\x3f\x8e\x3d\xc9\x20\xf6\
+\xfd\x63\x7c\x27\xd8\xdf\x73\xcf\x3d\x83\xd8\x7f\xf7\x63\x10\xfb\
+\x1f\xee\x18\xc4\xfe\x87\x3b\x06\xb1\xff\xe1\x8e\x41\xec\x7f\xb8\
+\x63\x10\xfb\x1f\xee\x18\xc4\xfe\x3f\x37\x86\x18\xc8\x1d\x9a\xce\
+\xf5\x4f\x6a\xf9\x4f\x7e\x9f\x41\xec\xbf\xfd\xa1\xc6\x96\x7f\x23\
+\x5f\x63\x5e\xdb\x32\x4c\x96\xe1\xdd\xc8\x30\xf9\x75\x77\xc9\xef\
+\x51\xd6\xca\xfd\x3b\xd6\xc8\xf1\xe7\x71\x4f\x15\xcf\xab\x0f\x62\
+\xff\xcd\x86\x82\xb7\x82\x35\xe3\xc8\x75\x6b\xbe\xb6\x3c\x77\x75\
+\x9f\x46\x5a\xe3\xc4\xf3\x98\xbc\xbe\x81\xd7\xc2\xfc\xc2\x40\x1e\
+\x90\x9f\xfb\xb9\xfc\xda\x9f\xca\xef\xbd\x47\xfe\xac\x61\x9a\x4e\
+\x9d\xf8\x36\xf4\xe1\x0e\xf9\x73\xef\xe7\x39\x56\xc2\x72\xef\x20\
+\xf6\xb7\x34\x14\xcc\xd9\x86\xd8\x5e\xf9\x5a\x32\x8f\x32\x6e\x8c\
+\x21\xff\xd6\xff\xd5\x48\x6b\xdd\x1e\xd6\x48\xeb\x1a\xb8\xaf\xfd\
+\xff\x34\xd2\x16\x07\x4f\x68\xa4\xde\xa6\x3f\xc8\xff\x7e\x5c\x7e\
+\x6e\x84\xfc\xda\x87\xe5\xf7\xfe\xaf\xfc\x59\x3f\x97\x3f\xfb\x27\
+\xf2\xb9\xee\x92\xcf\x7d\xbb\xba\xc0\xef\xbd\xf7\x89\x27\x9e\x18\
+\x39\x88\xfd\x2d\x0d\x65\x2d\xab\x82\x39\xdb\x28\xcf\x51\xf2\xef\
+\xe3\xf5\x8c\xdc\xb3\xfc\x98\x46\xc2\xf5\x69\x8d\xd4\xc7\xcc\xeb\
+\x9b\xfe\xfa\xf4\xd3\x4f\xbf\x39\x6a\xd4\xa8\x8f\x9e\x1d\xf9\xf4\
+\xc7\xe3\x3e\xfe\x70\xd6\xb8\xb1\x1f\xce\x7a\xfe\xd9\x91\x1f\xff\
+\xfd\xef\x7f\xff\xf8\x91\x47\x1e\x79\x93\x5e\xc3\xfd\x8e\x2f\xf0\
+\x6b\xe5\xf7\x8c\x94\x3f\xe3\x0f\xf2\x67\xf2\x67\x3f\xa8\xe9\x5c\
+\x33\x79\xaf\xa6\x53\x17\x6e\xf5\xba\xfe\xe8\xf9\xe7\x9f\x1f\xf1\
+\xd9\x67\x9f\xed\x1e\xc4\xbe\x4f\x43\xf1\x97\xcc\xc3\xcc\xc9\x6c\
+\x8b\xfc\xbb\xd8\x46\xb9\x47\x95\x31\xfa\xd3\x03\x0f\x3c\xf0\xe2\
+\xd8\xf7\xde\x9a\xb1\x70\xf6\x24\xf7\xe5\x26\x33\xd3\xec\x56\x98\
+\x6c\x76\xb5\x36\x3b\xea\xeb\xb8\x0a\x3e\xf6\xcb\xe1\xe7\x68\x81\
+\x00\xe7\x55\x08\x74\xb1\x44\x90\x8b\x15\x82\x5c\x57\x0b\x09\x64\
+\x71\xb7\xb9\xe1\xeb\xbc\xfa\xa8\xab\xcd\xf2\x8d\xd6\xe6\x8b\x52\
+\x17\xcf\x9d\xee\xfe\xe1\x98\xb7\xa7\x0f\x1f\x3e\x7c\x94\x46\xd2\
+\x0b\xd6\x09\x5e\x33\xc9\x7c\xf1\x88\x7c\xee\x5f\xc8\xdf\xe5\x1e\
+\xf9\xbb\xf5\x75\xed\xe4\x8f\x1c\x1d\x1d\xc3\x07\xb1\xef\x75\xa8\
+\x71\x67\xee\x65\x1e\x66\x4e\x66\x5b\x64\x1c\xfe\xfc\xaf\x77\xdf\
+\x9e\xbc\x78\xf6\xe4\x60\x1b\xf3\xf9\xdb\x5d\x57\x2f\xbe\xee\xb1\
+\x66\x29\x7c\x09\xeb\x20\x67\x0b\x84\xba\xaf\x46\x84\xb7\x0d\xa2\
+\xfd\x1c\x10\x17\xe0\x84\xc4\x20\x17\x24\x85\xb8\x21\x45\xeb\x81\
+\xd4\x30\x4f\xa4\x86\x7b\x8a\xbf\x29\x24\xc9\xf4\x58\x62\xa8\x3b\
+\xe2\x83\xdd\x10\x13\xe0\x82\x48\x3f\x47\x84\x79\xd9\x23\xd8\xc3\
+\xfe\xaa\x9b\x9d\xc5\xe6\x65\x26\xb3\x03\xdf\x7a\xe3\x1f\x13\xe9\
+\x9c\x2f\x91\x3c\xa7\x91\x74\xe1\x71\xf9\xbb\xfc\x4a\xfe\x6e\x3f\
+\xd1\xf4\x4d\x0f\x7e\x74\xed\xda\xb5\xd4\xd6\xd6\x56\x68\xb5\xda\
+\x41\xec\xbb\x0e\xf5\x9e\x05\x0a\xee\xcc\xbd\x6c\xeb\x7f\x7c\xf3\
+\xf5\x51\x9f\x9a\xcc\xfa\x2a\xda\xd6\x7c\xde\x71\x67\x8b\x05\xf0\
+\x24\xcc\xfd\x1d\x96\x23\xd4\xcd\x12\x51\x84\x77\x7c\x80\x03\x52\
+\x42\x5c\x90\x11\xe1\x81\x9c\x68\x1f\x14\xc4\xfb\xa3\x38\x29\x08\
+\xa5\x29\xa1\x28\x4b\x0b\x43\x45\x46\x38\x2a\x33\x23\x50\x99\x15\
+\x49\x12\x85\x8a\xcc\x48\x94\x67\x44\x62\x6d\x7a\x04\x4a\x52\xc3\
+\x50\x98\x14\x8a\xbc\xf8\x20\x64\xc5\xf8\x23\x35\xc2\x07\x09\xa1\
+\x1e\x88\x26\x9d\x08\xf3\x76\x80\xaf\xcb\x9a\x43\x16\xa6\x0b\xa2\
+\x46\xbd\xf4\xd2\x78\x8d\xb4\x6e\x92\xd7\x4b\x3d\xa9\x91\x38\xe1\
+\x41\x8d\xbe\x1e\x18\xbb\xf6\x1c\x33\x0c\x8b\x8e\x8e\xfe\xf3\xf5\
+\xeb\xd7\x8f\xdf\xbc\x79\x13\x3b\x77\xee\x44\x4d\x4d\xcd\x20\xf6\
+\xd2\xe0\xeb\xc3\xb1\x36\x73\x2a\xfb\x76\x81\xfb\xdd\x77\xdf\xfd\
+\xe7\x29\xe3\x3e\x5a\x69\xb1\x70\x7a\x83\xdd\xb2\x39\x70\xb3\x5c\
+\x08\x5f\x3b\x53\x84\xb8\xac\x24\xcc\xad\x91\x18\xe8\x80\xf4\x30\
+\x57\xe4\x46\x7b\xa3\x28\xc1\x1f\x6b\x53\x82\x51\x99\xae\x45\x75\
+\x56\x04\xd6\xe5\x44\xa1\x2e\x2f\x06\x1b\xf2\x63\xb1\xb1\x20\x1e\
+\xf5\x45\x09\xd8\x54\x9c\x88\x2d\x25\xc9\xd8\xba\x36\x05\xdb\xca\
+\xd2\xb0\xad\x9c\xa4\x2c\x1d\x5b\xe9\xdf\x9b\xd7\xa6\x62\x63\x71\
+\x32\x6a\x0b\x12\x50\x95\x13\x83\xd2\xb4\x08\x14\x24\x86\x22\x33\
+\x26\x00\xc9\x61\x5e\x88\x09\x74\x15\xba\xe0\x6a\x67\x51\x3f\x6d\
+\xd2\x84\x95\xe4\x23\x46\x6b\x24\x4e\xe0\x7e\x69\xd6\x51\xe6\x28\
+\x8e\x11\xee\xd6\x74\xae\xa3\x55\x62\x56\x8e\x17\x78\xff\x8d\x07\
+\x7d\x9c\xd6\x2c\x6b\xdd\xd3\x0c\xd6\x81\x53\xa7\x4e\x21\x21\x21\
+\xe1\x87\x8c\xbd\x62\xf3\x9c\x8b\x73\xce\xc6\x7d\xc7\xbf\xbf\xff\
+\xfe\xfb\x9f\x99\x31\xe1\x63\x17\x8b\x85\x53\x8f\xdb\x99\xcd\x26\
+\xdc\x17\xc0\x8f\x70\xd7\xba\x5a\x20\xce\x77\x0d\x52\x43\x9c\x90\
+\x13\xe9\x81\xc2\x38\x5f\x94\x26\x05\xa0\x2c\x39\x08\xe5\xa9\xc1\
+\xa8\x48\x0b\x45\x15\xe3\x9f\x19\x8e\x1a\x45\x07\x72\xa3\xb1\x3e\
+\x2f\x16\x1b\x0a\xe2\xb0\xb1\x30\x1e\x9b\x8a\x12\xb1\xb9\x24\x09\
+\x5b\x4a\x53\x48\x0f\x52\xd1\x50\x9e\x8e\xed\x15\x19\xd8\x51\x95\
+\x85\xc6\xea\x6c\x34\xd5\xe4\x88\xbf\x0d\x95\x99\xd8\x54\x9a\x8a\
+\xda\xfc\x04\x94\x65\x46\xa3\x20\x49\x8b\xcc\x68\x7f\xe2\x05\x4f\
+\x44\xf8\x3a\xc1\x8f\x38\x61\xee\xcc\xa9\x0e\xc3\x86\x0d\xfb\xbb\
+\x46\xd2\x03\xe6\x03\xf6\x0b\xbf\x94\x7f\x0b\xff\x26\xa5\x06\xc1\
+\xd8\xff\xef\xbb\x2f\xff\xe9\xc3\xc5\x13\xde\x39\xbb\x78\xc2\xdb\
+\xc8\x88\x0e\x46\x7b\x7b\x3b\xda\xda\xda\xe0\xe6\xe6\xf6\x43\xc4\
+\x5e\x6d\xf3\xcc\x9f\xdc\x77\xfa\xc4\xe4\xcf\xdf\x5f\xb5\x62\xee\
+\xc4\x63\x36\x4b\x66\xc0\x75\xe5\x3c\xf8\xd9\x2c\x21\xdc\x57\x20\
+\xce\x67\x0d\xd2\x42\x1c\x91\x13\xe1\x8e\x82\x18\x2f\x14\xc6\x92\
+\xcd\xc7\xf9\xa0\x24\xc1\x0f\xa5\x89\x64\xfb\x49\x81\x58\x4b\x7a\
+\xb0\x36\x25\x08\x65\xc4\x03\x42\x52\x43\x48\x42\x51\x9e\xa6\x45\
+\x45\x7a\x18\x2a\xc9\x07\x54\x13\xff\xaf\xcb\x21\x9d\x60\x5e\x28\
+\x24\x4e\x20\x5d\xd0\xe9\x41\x65\x06\x1a\x49\x0f\x9a\x08\xff\xe6\
+\x75\xb9\xd8\x59\x9b\x27\x64\x47\x55\x36\xe9\x42\x1a\x6a\xf2\xe2\
+\x51\x42\xbc\x90\x13\x17\x84\xa4\x30\x6f\x44\xfa\x3b\x0b\x3d\x98\
+\xf6\xd5\x84\x95\x1a\x29\x46\xe0\xb5\xd4\x1c\x1f\x70\x9c\xc8\xb5\
+\x05\x8e\x13\x05\x9f\x31\xf6\x4b\x26\xbc\x73\xc6\xe4\xf3\x37\xb1\
+\xf4\xab\x77\xb1\x62\xfa\x47\x08\x71\x5e\x89\xa3\x87\x0f\xe2\xe4\
+\xc9\x93\xb0\xb0\xb0\xf8\x21\x61\xaf\xf8\x79\xb6\x0b\xb6\xf9\x47\
+\xde\x18\xfd\xb7\x4f\x96\xce\x9a\xb0\xcd\xca\x64\x0a\x1c\x97\xcd\
+\x82\xd7\xea\x85\x08\x71\x5a\x86\x58\x2f\x4b\xa4\x06\xd9\x21\x53\
+\xeb\x84\xec\x70\x57\xc2\xdf\x0d\x79\x91\xee\xc8\x8f\xf6\x14\x92\
+\x47\x92\x4b\x5c\x90\x4d\x7a\x91\x19\xee\x8e\x8c\x30\x37\xf2\x09\
+\x24\x5a\xf9\x6f\x98\x3b\xd2\xf9\xf1\x08\x4f\x64\x45\x7a\x21\x9b\
+\x7c\x45\x6e\xac\x1f\xc5\x07\x01\x14\x1f\x04\x63\x6d\x2a\xe9\x46\
+\x06\x73\x05\xf9\x0a\xe2\xfe\xcd\xc4\x0b\x0d\x15\xb2\x1e\x10\x17\
+\xec\x24\x3d\xd8\x55\x97\x8f\xdd\xeb\x0b\x84\x2e\x6c\xab\xc8\x44\
+\x5d\x41\x12\xd6\x66\x44\x21\x27\x3e\x18\x49\x5a\x2f\xe2\x03\x47\
+\xb8\xda\x5a\xd4\xbf\xfa\xea\xe8\x2f\x35\x52\xde\xc0\x39\x24\xfb\
+\x84\x87\x49\x7e\xf7\xce\x4b\x4f\x7f\xc4\x76\xaf\xc6\xde\x76\xfe\
+\x04\x78\xae\x98\x85\x08\x77\x4b\x34\x6c\xdd\x84\x96\x96\x16\x4c\
+\x9b\x36\xed\x87\x82\x3d\x73\x23\xdb\xc6\x83\xbf\xf8\xc5\x2f\x9e\
+\xfe\x7a\xd2\xd8\x08\x8b\xf9\x93\xae\xdb\x9b\xce\x80\xc7\xaa\x79\
+\x08\xb4\x5b\x8a\x48\xb7\x95\x48\xf4\xb5\x46\x6a\xa0\x1d\xd2\x83\
+\xed\x91\x41\xb6\xcf\x3a\xc0\x92\x11\xea\x44\x3a\xe1\x80\xa4\x00\
+\x3b\xc4\xfb\xd9\x22\xd6\xc7\x06\x31\x14\x0f\x44\x79\x59\x23\xd2\
+\x73\x35\xc2\x3d\xac\x84\x84\x79\xf0\xbf\x59\xac\x11\xe1\xb5\x06\
+\x91\x9c\x17\xf8\xd8\x21\xd6\xcf\x1e\xf1\x81\x4e\x48\x0a\x76\x41\
+\xaa\x96\x74\x23\xd2\x1b\x39\xa4\x13\x85\x89\xc4\x1f\x14\x0b\x56\
+\x65\x13\x3f\x50\xcc\xb0\x85\xf8\x7f\x3b\xf9\x81\x66\xd6\x03\xc2\
+\x9e\xf5\x60\xcf\xfa\x42\xec\x22\x5d\x68\xa8\xcc\x42\x6d\x61\x12\
+\x4a\xd3\x23\x45\x8c\x10\x17\xec\x8e\x10\x4f\xfb\xab\xa6\x0b\xe6\
+\xf8\xcb\x3e\x81\x6b\x0a\x7f\x79\xfd\xaf\x7f\xf8\xbc\x3b\xec\x03\
+\x6d\x97\xd0\x77\xb7\x45\x41\x4a\x24\x4a\x8b\x0b\x51\x59\x59\x89\
+\xf1\xe3\xc7\x7f\x5f\xb1\x57\xf2\x3a\xae\x9f\x30\x27\xfe\xf6\xf5\
+\x57\x5f\x7c\xdf\x74\xe6\xf8\x66\xeb\x45\x53\xe1\xb2\xe2\x6b\xe2\
+\xfa\x45\x08\x77\x5d\x8e\x04\x9f\xd5\x48\xf6\x5f\x83\x94\x00\x1b\
+\x9d\x24\x93\x24\x90\x3e\xc4\x7a\x59\x21\xd2\x63\x15\xc2\x5c\x57\
+\x12\x7f\x52\xce\xe7\xb0\x0c\xfe\x76\x66\xf0\xb5\x35\x85\xb7\xcd\
+\x52\x78\x59\x2f\xa1\x58\xc1\x4c\x60\x9f\x18\xec\x2a\x7c\x76\x7e\
+\x02\xf9\x81\xcc\x58\xb2\xd9\x18\x11\xd3\xe5\x12\x7f\x73\x3e\x18\
+\xeb\xef\x88\x70\xcf\x35\xa4\x1b\xb6\x88\xa1\x7c\x31\x81\x72\xc5\
+\xd4\x30\x0f\x64\x45\xfb\xa2\x20\x81\x74\x81\xf2\x86\x1a\xe2\x85\
+\x8d\x45\x49\x82\x13\x9a\x64\x3d\x60\x2e\xd8\xb3\x81\xf4\xa0\xae\
+\x00\x5b\xcb\x33\x85\x5f\x28\x48\xd6\x22\x25\xc2\x97\x72\x48\x67\
+\xb8\xdb\x59\x34\x3c\xf7\xdc\x33\xe3\x5f\xfe\xd3\x88\xe9\x84\xfd\
+\xb9\x1e\xb1\x4f\x0e\xc7\xf6\x0d\x55\x38\x75\xfc\x08\xec\x6c\xd7\
+\xc0\xc3\xc3\x03\xef\xbd\xf7\xde\xf7\x15\x7b\xfe\xde\xec\x17\x7f\
+\xf7\xd5\xd8\x31\x66\x2b\xe6\x7e\x75\xc9\xde\x6c\x26\x3c\xad\x16\
+\x20\xc4\xd1\x4c\x70\xbd\x1a\x77\xfe\x77\x82\xef\x6a\x44\x7b\x58\
+\x20\xcc\x65\x39\x82\x1d\xcc\x10\x40\xdc\xe0\xb3\x66\x11\xbd\x67\
+\x21\xdc\x56\xcd\x87\xab\xc5\x7c\x81\x75\x51\x5a\x34\x5d\xc7\x4a\
+\x9c\x3c\xb4\x0f\x57\x2e\x9e\xc3\xcd\x2b\x97\x81\xab\x24\x57\x2e\
+\x02\xed\x24\x97\xcf\x4b\x72\xe9\x2c\x70\xf1\x0c\xc9\x69\xdc\x3c\
+\x77\x12\x57\x4e\x1c\xc4\xf1\x5d\x5b\xd0\xb8\xae\x18\x65\x19\xd1\
+\xa2\x56\x10\xe5\x6b\x2f\x74\x21\x2d\xcc\x93\x78\x81\xf2\xc8\xe4\
+\x50\x91\x33\xae\x2f\x4c\x24\xfe\xcf\x20\x3e\xe8\xf4\x09\xac\x07\
+\x4d\xeb\xf2\xb0\xb1\x24\x55\xf8\x84\xac\xd8\x40\xc4\x06\xb9\xc1\
+\xcb\xde\xe2\xc2\x9c\xb1\x6f\x9c\xee\x0b\xf6\xe7\x4e\x9f\xc2\xb1\
+\xd6\x5d\x28\x4e\x09\xc7\x27\x1f\xfd\x4b\xc4\x81\xdf\x43\xec\x39\
+\xce\x7b\xe0\xde\x7b\xef\x1d\x31\xe7\xcb\x7f\x85\x58\x2d\x9c\x0c\
+\xe7\xe5\x73\xe0\x47\x58\x46\x50\x7c\x97\x48\x38\xab\x71\x4f\x94\
+\x71\xd7\x3a\x9b\x93\x3f\x58\x02\x6f\x8a\x07\xdc\x2c\xe6\xc2\xc9\
+\x7c\x36\x1c\x96\xcd\x16\xf5\x9d\xfa\xaa\x62\x9c\x3d\x79\x0c\x1d\
+\x37\x6f\x00\x2c\x37\x58\xae\x4b\x72\xfd\xaa\x24\xd7\xda\x25\x1d\
+\xe8\x82\x3f\xc9\x85\x36\xe0\x3c\xcb\x49\x92\x13\xc0\xb9\x13\xb8\
+\x79\xfa\x08\xda\xf6\x6c\xc3\x96\xb5\x59\x14\x33\xf8\x08\x5e\x48\
+\x0e\x75\x13\x9c\x50\x98\x14\x82\x0a\xd2\x83\x0d\xcc\x07\xe4\x17\
+\x76\xae\xeb\xf4\x09\xbb\x49\x38\x36\xa8\xce\x8d\x43\x5e\x62\x08\
+\x7c\x6c\x97\xe1\xf3\xb7\x5f\xc6\x94\x0f\xfe\xde\x27\xec\xeb\x28\
+\xcf\x88\xf7\x5c\x05\xd3\x99\x13\xce\xbd\xfb\xee\xbb\x82\x03\xc6\
+\x8d\x1b\x27\xb0\x9f\x32\x65\x4a\x16\x61\xcf\x75\x47\x65\x6d\xc6\
+\x40\xc3\x9e\x75\xf6\x81\xbb\xee\xba\xeb\x31\x93\xa9\xe3\x0a\x98\
+\xef\xdd\x56\xce\x15\x7e\x3e\x86\x7e\xb3\xda\xe6\x93\xfc\x88\xe3\
+\xe9\xb1\x30\x17\x73\xf1\x3c\xe3\xee\xba\xf2\x6b\x38\x10\x4f\xb8\
+\x53\xfe\x5f\x92\x19\x8f\xb6\xe3\x87\xd1\xd1\xd1\x01\x80\x84\xff\
+\x76\xdc\x34\x82\xff\x35\x95\x0e\x5c\x21\x1d\xb8\x24\xe3\x7f\x4e\
+\x1f\x7f\xa1\x03\xa7\x74\xf8\xe3\xec\x31\xe0\x0c\xcb\x51\x74\xb4\
+\x1d\xc2\x89\xe6\x7a\x54\x66\xc6\x88\x5a\x22\x73\x03\xeb\x41\x11\
+\xf1\x01\xc7\x08\x9b\x4a\x52\x44\xae\xa8\xf6\x09\x8d\xc4\x0d\x75\
+\x14\x17\xc4\xd3\xeb\x2d\xe6\x7e\x85\x4f\xdf\x7c\x11\xb3\xc7\xbd\
+\x0d\x8f\xe5\xbd\x63\xef\x69\x3e\x7d\xf7\x5b\x2f\x8f\x7c\xfa\x8d\
+\x37\xde\xb0\x21\xfb\xbf\xce\xf8\x13\xf6\xe9\xf7\xdd\x77\x1f\xd7\
+\x15\x38\x66\x1a\x48\xd8\xf3\xe0\xef\x2b\xe6\x3c\x7f\xfd\xcb\x5f\
+\xfe\xd1\x74\xd6\xf8\x7a\x9b\x25\xd3\x44\x8c\xc7\x7c\x1f\xef\x6d\
+\xa5\xc3\x5e\x70\x3d\xf9\x7d\x8e\xfb\x82\x1d\x4c\xe1\x63\x6d\x22\
+\x74\xc4\xc1\x6c\x96\xc0\xbd\xa6\x38\x0b\xed\x97\x2e\xa0\xcb\xe8\
+\x50\x74\x40\xe1\x00\x19\xff\x1b\x06\xf8\x5f\x65\x1e\x20\x7f\xd0\
+\x4e\x9f\x71\xe9\x8c\xce\x07\x74\xc5\xff\xb8\x0e\x7f\x9c\x3e\x0c\
+\xb4\xb1\x1c\xc2\xc5\x03\x8d\x94\x33\x26\x53\xdc\xe8\x82\x64\x8a\
+\x19\xd9\x2f\x94\x52\xac\x58\x4b\xbe\x7f\x1b\xe5\x8e\xcd\xaa\x3c\
+\xa1\xb9\x36\x9f\x7c\x45\x92\x88\x4f\x56\xcc\xf9\x02\x33\x3e\x7b\
+\x07\xa6\x33\x3e\xa7\x18\xd5\xa6\x47\xec\xdf\x1e\xf5\x0c\xd7\x92\
+\x78\x8e\x69\x18\xf9\xff\x67\x89\x07\x16\xfd\xea\x57\xbf\x62\xdb\
+\x51\xe6\x1d\x07\xd2\x50\xe2\xfc\x9f\xff\xe6\x97\xbf\x7c\x72\xc9\
+\xcc\x71\x84\xfd\x74\x78\x5a\xce\x87\x96\xf2\x3a\xc6\x5a\xcd\xf7\
+\xec\xfb\xc3\x88\xeb\x03\xc8\x46\x3c\xe8\x35\x8e\xc4\xf1\x8e\xc4\
+\xf5\x65\x39\xc9\xc6\x71\xbf\x15\xfc\xaf\x5f\x91\xfc\x00\xeb\x00\
+\xc7\x04\x1c\x0f\xf4\x09\xff\x23\x3a\xfc\xd1\x76\x10\x38\x75\x00\
+\x17\xf6\x6f\xa7\x7c\x31\x0a\x71\x81\xce\x48\x0b\xf7\x12\x71\x22\
+\xc7\x06\xf5\xc5\x9d\x5c\xc0\x7a\xb0\x93\x74\x60\x5d\x5e\x1c\xe9\
+\xf2\x32\x58\x2d\x9c\x02\xd3\x39\x13\xe1\x6e\xb3\x02\x0d\xeb\x2b\
+\xbb\x60\xef\xb1\x6c\xda\x1e\x19\x7b\xf5\xfe\x6b\xdf\x45\x7f\xd2\
+\xb7\x35\x44\xbd\x9b\xe4\xbf\x29\x17\xfa\xbd\xd9\xac\x2f\xea\x6c\
+\x09\x7b\x2f\x8a\xf3\x18\x63\xb5\xaf\x67\xbe\x67\x3f\xcf\x7c\xe0\
+\x4b\x36\xef\x4a\x36\x6f\xb7\x74\x06\xa2\xfd\x9d\x70\xea\xd8\xa1\
+\xee\x71\xff\x26\xf8\x2b\x3a\x70\xe9\xcc\x2d\xe3\x8f\x93\xad\xe8\
+\x38\xbe\x1f\x47\xb6\x56\x8b\xf8\x30\x91\x7c\x42\x76\x8c\x1f\xe5\
+\x0a\xe1\x94\x33\x26\x48\xf9\x22\x73\x41\xad\xbe\x0e\xb8\xae\x5a\
+\x04\x3f\x0f\x67\x14\xe6\xe5\x1a\x62\xbf\xf7\x8d\x17\xff\xc4\xfb\
+\x30\x72\x2d\xe4\xfb\xb0\xf7\x9e\xd2\xe3\xc6\xbf\xe7\xd7\x26\x53\
+\x3f\xcd\x66\xce\x67\xbb\x97\xb0\xb7\xd6\x61\xcf\x7a\xc0\x7c\x1f\
+\x64\xbf\x54\xe8\x86\xd3\x72\x8e\xed\x66\x61\x7d\x79\xbe\xa8\x8f\
+\xf7\x69\xdc\x16\xfe\x97\xa4\x78\x80\xe3\x42\x8e\x07\x6f\x11\x7f\
+\x9c\x68\x11\x72\xed\xd0\x4e\xd4\x64\xc7\x22\x96\x7c\x3d\xd7\x10\
+\x38\x4f\x58\x47\xf1\x9f\xf0\x07\xa2\x76\x24\xd5\x0f\xd7\xe5\xc6\
+\x52\x9e\x6a\x06\xad\x8f\x13\xa2\xb4\x41\x94\x5f\x38\x0a\xec\xdd\
+\x4c\xa7\xee\xff\xeb\x53\x23\x78\x3f\x56\xae\x81\x29\x71\xfd\x40\
+\x1f\xec\xab\x98\xc7\x7e\x35\x6b\xc2\x87\x5e\xd6\x8b\xa7\x0a\x3e\
+\xd7\x3a\x2f\xeb\x82\x3d\xc7\xfd\x1c\xdb\xf3\xf3\x8c\xbb\x0f\xe5\
+\xf0\x47\x5a\xf7\xf6\x0d\xf7\xde\xf0\x37\x8c\xff\xae\xaa\xf0\xbf\
+\xa2\xc2\xbf\x5d\xd1\x81\xae\xf1\x9f\xda\xff\x1b\xc3\x1f\xc7\xf7\
+\xa1\xe3\xd8\x5e\xec\xad\x2d\xa2\xf8\xd0\x59\xcc\x2b\x17\x24\x06\
+\xa3\x3a\x3b\x86\xf2\x87\x34\x5d\x1d\x99\x85\xeb\x08\x41\x8e\xe6\
+\x94\xaf\x2e\xc4\xb2\x59\x5f\x60\xe5\xec\xf1\xad\x7f\x78\xf8\x37\
+\xef\xd3\x75\xfa\xa3\x46\x9a\xef\xfa\x89\x66\xe0\xef\xc3\xac\xeb\
+\x71\xfb\xe2\x83\xd7\xa7\x71\x2d\x97\x73\x36\xe6\xf6\x04\x15\xe7\
+\x2b\xd8\xb3\xaf\x77\xa7\x58\xd0\xde\x74\x26\x22\x7d\xec\x71\xf1\
+\xdc\x99\xdb\xc4\xbe\x0f\xf1\xbf\x31\xfc\xdb\x65\xfc\xdb\xe5\xbc\
+\xb0\x27\xfc\x4f\x19\xe2\xbf\x5f\xe0\x8f\x63\x2c\x7b\xd1\xd6\x58\
+\x87\xe4\x10\x57\xca\x15\xdd\x91\x1f\x1f\x88\x2a\x8a\x09\xb8\x96\
+\xac\xd4\x91\x9b\xaa\x73\x84\x2f\x88\xf3\x77\x80\xaf\xbd\x39\x7c\
+\x9d\x2c\x6f\x7c\xf0\xce\x5b\x73\x34\x52\x8f\x09\xcf\x23\x73\x5d\
+\x64\xb8\x66\xe0\xc5\x79\xca\x60\xbd\xe5\xf9\xae\x9f\xbe\xf2\xb7\
+\x3f\xbf\xb8\x72\xee\xc4\x73\x9c\xdf\x33\xb7\x73\x9c\x6f\x14\x7b\
+\x8b\x79\xc2\xd7\x27\x87\xfb\xe2\xea\x95\xf6\x5b\xc3\xbe\x57\xfc\
+\xd5\xdc\x6f\x0c\xff\x8b\xfa\xf8\x2b\xb5\x01\x1d\xff\x1f\xe9\x8a\
+\xff\xc9\xee\xf1\xc7\xb1\x3d\xb8\xb0\x67\x33\xd2\xb4\x9e\x94\x27\
+\xba\x22\x2f\x2e\x80\xf2\x46\x49\x07\x76\x50\x4c\xc0\xb1\x21\xc7\
+\x06\xd5\xe4\x0b\xb2\x62\x02\x10\xe5\xe7\x04\x0f\x7b\x8b\x13\x8f\
+\x3f\xfa\xe8\xbb\x1a\xa9\xaf\x84\xe7\xbf\x78\xde\x70\xa0\xc6\x00\
+\x82\xf7\x87\x0f\x1f\xfe\x1b\x8a\xf7\x36\x73\xbe\xee\x6f\xb3\x48\
+\xe4\xf2\xea\x58\x2f\xd2\x4d\xe2\x7c\x05\xfb\xf4\xe8\x00\x82\xeb\
+\xda\xad\x63\xaf\xcb\xfd\x6f\x23\xf6\xd3\xc3\xff\x42\x27\xfe\x97\
+\xe5\xda\x40\x17\xfc\x0f\xf6\x09\x7f\x1c\xdd\x8d\x4b\x42\x07\x3c\
+\x44\xed\x39\x57\xd6\x01\x9e\x6b\x56\xe6\x16\xb9\xd7\xa0\x2c\x23\
+\x12\xa9\xe1\xde\x08\xf5\xb4\x85\xad\xc5\xd2\x4a\x8d\xd4\x87\xc8\
+\xbd\x4d\x1c\x07\x70\x9d\x6c\xa0\xc5\x01\xcc\x59\x22\xd7\x9b\x39\
+\xe1\x7d\xdb\x35\x8b\xa7\x89\x78\x8e\xb1\x56\xe7\xf7\x1c\xe7\x33\
+\x1f\x78\xac\x9a\x2f\x38\x3f\x31\xd4\xeb\x36\xb1\xef\xcd\xf6\x0d\
+\xb8\xff\x56\xf0\x17\xf5\xc1\xd3\x2a\xfc\x0f\xe9\xe3\xaf\xf8\x7e\
+\x3d\xfc\xf7\xe8\xf0\xc7\x91\x5d\xb8\xb8\x7b\x13\x52\x43\xdd\x74\
+\x3c\x50\x95\x4d\x3a\xc0\x73\xcc\x15\xe9\x82\x0b\x78\x3e\x81\x6b\
+\x89\xdc\x77\xe6\xef\x6c\x85\x99\xd3\xbe\xb2\xd7\x48\x3d\x45\xec\
+\x07\x06\xe2\xfe\x3b\x22\xde\x7f\x6b\xf4\xf3\x2f\xaf\x5a\x30\xf1\
+\x0a\xd7\xeb\x42\x29\xc7\x67\x7b\xef\xcc\xef\x57\x89\x38\x80\xf5\
+\x82\xb9\x21\xcc\xcb\x96\x38\xff\xf2\x37\xc7\xbe\x57\xdb\xef\x25\
+\xf6\x33\x86\x3f\x0b\xe7\x85\x6d\x86\xf8\xb7\x1a\xc1\x5f\xb1\xfd\
+\x4e\xfc\x71\x78\x27\x4e\xef\xa8\x25\x5f\xef\x28\x6a\xc7\x05\x09\
+\x81\x14\xff\x45\x8b\xbe\x23\xee\x33\x60\xa9\x11\x7e\xc0\x8f\xe2\
+\x1e\x07\x78\xd8\xae\x3c\xfb\xf8\x88\x11\x63\x34\x5d\xf7\xdf\x1d\
+\x08\x7e\x40\x89\xf9\x1e\x30\x9d\x39\xbe\x4c\xf0\xbe\xed\x62\xc4\
+\x79\x5b\xea\x78\x3f\xde\xc7\x4a\xd4\xf1\xb9\xa6\xc7\xf5\x7b\x8f\
+\xd5\x8b\x70\xe1\x6c\x9b\x84\x21\xf3\x78\xdf\x81\xef\x06\xfb\x6e\
+\x6c\xbf\x57\xee\x97\x7d\xbf\x0e\xff\xb3\x9d\xf8\xb3\x1f\x38\x77\
+\xb2\xc7\xd8\xbf\x27\xfc\x71\xb8\x19\x07\xd7\x17\x21\xca\xc7\x4e\
+\xcc\x31\x17\x25\x05\xa3\x36\x2f\x56\xd7\x7b\xc6\x71\x01\xd7\x0f\
+\xb9\x07\x95\xfb\x91\x57\x2d\x9d\xcf\xfb\xb0\xf0\x9c\x31\xaf\x47\
+\x18\x48\xb1\xa0\xb0\xfd\xaf\x3e\x7e\x6b\x02\xd7\xf5\x3d\xad\xe6\
+\xeb\xf1\x3e\x73\x00\xc7\x7b\xfe\x36\x8b\xc5\x1c\xaf\x1d\xf1\xfe\
+\x81\x3d\x8d\x12\x6e\x02\xc3\x8e\xbe\xe9\x41\x47\x1f\xb0\xef\xcd\
+\xf6\xfb\xc2\xfd\x42\xce\x74\xce\x11\x70\x3e\xd0\x4b\xec\xaf\xc3\
+\xff\x08\xe3\xbf\x53\x87\x7f\xc7\xc1\x46\xd4\xe7\xc6\x09\x1d\x48\
+\x8f\xf0\x14\xbd\xa8\x1b\x44\x5f\x41\xb2\xe8\x39\xaa\xcb\x8f\x43\
+\x6e\x2c\xc7\x82\x0e\xf0\xb2\x5b\x71\xe3\x9d\x37\xdf\x98\xa4\x91\
+\x7a\x47\x78\x5d\xc3\x40\xd8\x83\x5b\x67\xfb\xcb\x66\x8f\xdf\xc1\
+\xb6\xcd\xb5\x7b\x25\xd7\x63\x1d\xe0\xf9\x9d\x20\x7b\x53\x51\xf3\
+\xb7\xa5\x78\xaf\xaa\x20\x5d\xc2\x4c\x99\xb3\x13\x58\xde\x34\xc0\
+\xb7\x27\xe9\x0b\xf6\x86\xb6\xdf\x5d\xde\xd7\x0d\xfe\x17\x55\xf3\
+\x03\x17\xdb\xa4\x38\x40\xf8\xfe\x9e\x63\x3f\x61\xfb\x2a\xfc\x71\
+\xa8\x09\xd7\xf7\x6f\x41\x76\xb8\x27\x62\x29\xef\xcb\x8e\xf6\x41\
+\x79\x7a\x98\xe8\x45\xe5\x1e\xc4\xcd\x25\xc9\xa2\xc7\x40\xe1\x00\
+\x2b\xb3\x79\x1c\x0b\x1a\x72\x40\x7f\xf6\x01\xac\x9f\xff\x35\x69\
+\xec\x5b\x53\x38\xe6\xe3\xb9\x3a\x8e\xf1\x14\xde\xe7\x1a\xbf\xe0\
+\x7d\x7a\x9c\x7b\xba\xb4\xee\xd6\xb8\xc1\x38\x08\xbc\x54\x3a\x70\
+\xf3\xa6\x4a\x0f\x7a\x12\xd5\x7b\xf4\xb0\xbf\x6e\x04\xfb\x5b\xb1\
+\x7d\x23\xdc\xaf\xc6\x9f\xeb\x83\x7d\x8c\xfd\x24\xec\x3b\xf1\xef\
+\x38\xb0\x03\xa7\x36\x97\x21\xd2\x8b\x72\xdf\x20\x67\xe4\xc7\xf9\
+\xa3\x86\xe2\x41\xa5\x1f\x99\x7d\x02\xcf\x25\x45\xfa\xda\xc3\xd3\
+\xd6\x1c\x6f\xbe\xf6\xca\x24\x4d\x67\x1c\xa0\xd4\x84\xfa\xe3\x60\
+\xbd\xe4\x38\xf5\xfe\xe5\x5f\x7f\xb9\x9d\x6b\xb7\xc1\x8e\xa6\x48\
+\x54\xc5\x7c\x51\xee\x2b\x45\x9e\xcf\xf1\x20\xf3\xfe\x91\xfd\x74\
+\x5d\x6e\x5c\x95\x6c\x55\xc8\x75\x95\x0e\xa8\x74\x41\x4f\x6e\xf4\
+\x8c\xbb\x51\x9f\xdf\x1d\xf6\x7d\xb0\x7d\x35\xf7\x2b\xf3\x43\x2c\
+\x67\x8e\xdf\x82\xef\xef\xc4\x1f\xe4\x03\xae\xed\xdd\x8c\x0d\x99\
+\x91\xa2\x07\x2d\x4d\xeb\x86\x92\xa4\x20\xd1\x9b\xce\xfd\xc8\xdc\
+\x83\xca\x7e\x81\x73\x85\x00\x67\x4b\xe2\x80\x05\xcc\x01\xdc\x4f\
+\xac\xe4\x02\x77\x69\xfa\x27\x07\x70\x8e\x7a\xcf\xd4\xcf\xc6\x8c\
+\x65\xbf\xef\x65\x60\xfb\x1c\xf3\x71\x0e\xc0\xf1\x3e\xe7\x7a\xb9\
+\x09\xa1\x12\x2e\x0a\x4e\x3a\x1d\x50\xf4\xc0\x98\x2e\x28\x72\xbd\
+\x2b\xe6\xdd\x72\x7e\x0f\xbc\x6f\x68\xfb\xdd\xc5\x7d\x6a\xdb\xd7\
+\xf5\x88\x9c\x92\xe2\x80\x6e\x7d\xbf\x01\xf7\x1f\x6e\xd2\xe1\x7f\
+\xb3\x65\x1b\x2e\xee\xa8\x46\xbc\x2f\xf7\x1e\xda\x21\x3b\xca\x0b\
+\x15\xe9\x5a\x5d\x5f\x3a\xf3\x41\x66\x94\x37\xc2\x3c\x6d\xe0\xbe\
+\xc6\x0c\xa3\x5e\x7a\xe1\x53\x8d\xb4\xbe\x4d\x99\x17\xe8\x8f\x71\
+\x20\xc7\x7d\x3f\x35\x9b\xfd\x45\x1e\x73\x3b\xe7\xf5\x89\x2a\xbf\
+\x2f\xd9\xbe\x14\xf3\x71\xbf\xce\x85\x53\xc7\x64\x6c\x58\xae\xca\
+\x36\x7b\xcd\x40\x0f\xae\x75\x83\xf3\x37\xc0\xde\x68\xcc\xdf\x47\
+\xdb\xbf\xa8\xee\x0f\xa1\x5c\xe0\xdc\xf1\x5b\xe2\x7e\x05\xff\x8e\
+\x03\xdb\x71\x65\xd7\x06\x34\x15\x25\x8a\xf5\x4a\x49\xc1\xce\x62\
+\x7d\x52\x4d\x76\xa4\xe0\x01\x96\x42\xca\x11\x63\x03\x1c\xc5\x9a\
+\xc5\x25\x73\xa7\xc5\x69\xa4\xb5\xa8\x7c\x7f\x3e\xa5\x26\xd8\x9f\
+\x06\xf3\xd1\xf0\x37\x5f\x7a\xee\x49\xab\x85\x93\xaf\x73\x3d\x27\
+\x42\x15\xf3\x27\xa8\x6c\xdf\xce\x74\x06\x0a\x53\x22\x65\x3c\xae\
+\xa8\x74\x40\xc5\x05\xd7\x7b\xc3\xdf\x40\x57\xf4\x70\xef\x0b\xf6\
+\xb7\xe9\xf7\xd5\xb6\x2f\x7a\xc4\x4e\x4a\xb1\x60\x5f\xb9\x5f\xc6\
+\x1f\x07\x77\xe0\xfa\xde\x4d\xb8\xb0\xad\x82\xfc\xa3\x9d\x58\xaf\
+\x96\x11\xee\x21\xd6\x27\xac\x23\x1d\xa8\xcd\x8d\x46\x59\x9a\x16\
+\x29\xa1\x6e\x08\x72\xb1\x84\xa3\xc5\xa2\xb3\xc3\x87\x0f\xe7\x75\
+\x66\x1c\x07\xf6\xc7\xbd\xd8\x05\xf7\x9b\x4c\xfb\x74\x25\xc7\xf4\
+\x7e\x94\xdb\x29\x35\x7e\xa5\xce\x17\x60\x27\xf9\x7d\x7b\xb3\x59\
+\xb8\x70\xe2\x88\x0a\x97\x76\x7d\x1d\x60\x2e\xb8\x66\x88\xe7\x35\
+\x23\x62\xf8\x1a\x19\xf7\xdb\xc1\xfe\x76\x6c\x5f\x11\x9e\x23\x3a\
+\xbe\xbf\xcf\xdc\xcf\xd8\xe3\xe0\x76\xf2\x01\x5b\x71\xb9\xb1\x1a\
+\x5b\x89\xeb\x43\x5c\x2c\x90\x18\xe8\x48\xb1\xa0\x2f\xaa\x32\xc2\
+\xc4\x5a\xa5\xea\xcc\x08\x64\x45\x7a\x8b\x7e\x64\xd7\xd5\x4b\xf0\
+\xe5\x67\x1f\x2d\xd3\x48\x73\x83\xbc\xce\xb4\xbf\xf9\x00\xc1\xfd\
+\x2b\xbe\xfe\xb2\x8e\xe7\x78\xd4\xb5\x3e\x9e\xe3\xe5\x5e\x5d\x6f\
+\xeb\x85\xa2\x77\x2b\x2d\xdc\xa7\x13\x07\x81\x8b\xa2\x03\xed\xbd\
+\xe8\x40\x77\x72\xa5\x07\xdc\x7b\xc2\xde\x08\xef\xdf\xaa\xed\x9f\
+\x93\xf1\xe7\xba\x60\x1f\xb9\x5f\xc1\xbf\xa3\x75\x1b\xda\x77\xd6\
+\xe2\x4c\x7d\x21\x71\xe5\x2a\xca\x07\xd6\x10\x07\xb8\x63\x6d\x72\
+\xb0\xd0\x01\x5e\xb3\x56\x40\xb9\x41\x8c\x9f\x3d\xbc\x6c\x97\xc1\
+\x6c\xc1\x8c\x02\x8d\xe4\x03\x78\x5e\x88\x7b\x29\xfa\x4b\x1e\x20\
+\xe2\xfe\xb1\x6f\x8f\x7a\x6a\xb5\xc9\x14\x78\x5a\x2e\x10\xbe\x5e\
+\x89\xfb\xb8\xee\xc7\x35\x00\x9e\xd7\xe5\x9c\xf0\x40\xd3\x66\x09\
+\x03\x1d\x1e\x97\x3b\xf5\xe0\x9a\x5a\x14\x9f\x60\x44\xae\x19\x93\
+\x6e\x70\xef\x13\xf6\x06\xbc\x7f\x2b\xb6\x7f\x56\xee\x11\x61\x1f\
+\xd0\x47\xee\x97\xf0\x6f\xc0\xd5\xdd\xeb\x71\x7e\xeb\x5a\x94\xc5\
+\xf8\xe8\x38\xa0\x20\xd6\x17\x15\x69\x21\x62\xdd\x6a\x29\xe5\x05\
+\x89\x41\x4e\xf0\x77\x5c\x01\xfb\x95\x8b\x2e\xcb\xf7\xe3\x52\xe7\
+\x01\xfd\x61\x30\x0f\xdd\x6d\x32\xf9\xd3\x85\xdc\xd3\x25\xb8\xdf\
+\xc7\x4a\x2f\xee\xe3\xfa\xaf\x13\xf1\x82\x8f\x8d\x29\x3a\xb8\xdf\
+\x96\xaf\xbf\x9e\x0e\x18\xe8\x81\x1e\x27\x18\xd1\x09\xa3\xb8\x5f\
+\xee\xc1\xe6\x7b\xc3\xbe\x2f\xbc\xdf\x0b\xfe\x5c\x17\x36\x56\xf3\
+\x31\xc2\xfd\x38\x20\xc9\xf5\x3d\x1b\x71\xa1\xa1\x1c\xfb\x8a\x13\
+\xe0\x6f\xbf\x0c\xd1\xde\x6b\xc4\x9a\x35\x5e\xbb\x58\xce\x6b\x15\
+\x53\x82\x29\x3f\x74\x45\xb0\xcb\x2a\x38\xae\x5c\x88\x4f\x3e\x78\
+\x87\xfb\x03\x78\x3d\x21\xf7\x7e\xf7\x97\x5a\x10\xfb\xfe\x9f\x50\
+\xce\x9f\x26\xd5\xfb\xcc\x3a\xb9\xdf\xcf\x5a\xf4\x6d\x73\x1d\x88\
+\x73\xbe\xe2\xd4\xa8\x0e\x5c\xbe\x20\x5f\x7f\x19\x0b\xa3\x3a\xd0\
+\x9b\x1e\x18\xb1\x71\x43\x51\xe3\xde\x67\xec\xbb\xe1\xfd\x1e\x6d\
+\x5f\xd5\x23\xa6\xf8\xfe\x5e\x6c\x5f\xc2\xbf\x01\x37\x28\x06\xbc\
+\xb4\xbd\x02\x6d\xeb\xf3\x10\xe1\x6a\x21\xd6\x33\x27\x07\x39\x8a\
+\x75\xcc\x6b\x93\x03\x05\xfe\x59\x11\x1e\x08\x73\x5f\x0d\x57\xcb\
+\x45\x98\x3b\x6d\x42\xa8\xa6\xff\xdd\x8f\x8b\xfd\xd0\x7d\xab\x16\
+\x4c\x3a\xcc\xfd\xd9\xe1\xe4\xeb\x95\xb8\x9f\x63\xc0\x60\x47\xb3\
+\x4e\xee\x6f\xdc\x24\x5f\x73\x45\x07\x2e\x74\xe5\x82\x9e\x30\xed\
+\x51\x2e\xa9\xfa\xf8\xba\xb3\xf9\xbe\x62\xdf\x9b\xdf\x3f\xa1\x6f\
+\xfb\x42\x8e\x49\xf3\x01\x3d\xda\xbe\x0a\x7f\xe2\xff\x9b\xfb\x36\
+\xe3\xf2\x8e\x4a\x9c\xde\x90\x8f\x92\x08\x77\x04\x38\x2c\x43\xac\
+\xaf\x8d\x58\xcb\x5e\x92\xe8\x2f\xd6\xb2\xe7\x46\x7b\x21\x8a\x62\
+\x03\x0f\xeb\x25\x58\x61\x32\x73\x93\x46\xba\x47\x37\xaf\x27\xe6\
+\xf9\x80\xfe\xd0\x17\x70\xd7\xb8\xf7\x5e\x7d\x92\x7b\xbb\x38\xbf\
+\x8b\x51\xd5\x7c\xb8\xd6\xcf\xbd\x1d\x9c\xf3\x73\xff\xf6\xb5\xb3\
+\x27\x3b\xa4\x38\xeb\x9c\x74\xfd\xdb\x55\x7a\x70\xe5\x42\xa7\xad\
+\x5e\xb9\xd4\x89\x67\x17\x51\xec\xdb\x90\xdf\x2f\xf5\x6e\xf3\xdf\
+\x06\xf6\xc6\x6c\x5f\xc1\x9f\xfb\x43\xfb\x68\xfb\x02\xff\xfd\x5b\
+\xd0\x4e\x39\xc0\x99\x8d\x05\x68\xc8\xd0\xc2\x7b\xcd\x62\x44\x78\
+\x58\x22\x3d\xd4\x59\xac\x65\x2f\x4e\xf0\x43\x7e\x8c\x37\x62\x48\
+\x27\xbc\xc9\x77\xae\x59\x36\xf7\xb2\x46\xea\x0f\x7b\x58\x23\xd5\
+\x01\xfa\x43\x0c\x38\xcc\x64\xea\xd8\x09\xdc\xcb\xcf\x6b\xb7\xd4\
+\x79\x1f\xcf\xfb\xf1\x63\x5c\x0f\x8a\xf2\xb1\xeb\xd0\x5d\x6b\x45\
+\x07\xda\xcf\xc9\xb8\x5c\x30\x90\x8b\xfa\xba\xd0\x67\x31\xc4\xfd\
+\x1b\x62\xdf\x1d\xef\x1b\xb3\x7d\xe6\x7f\xce\x03\x8c\xda\x7e\x63\
+\x17\xdb\x07\xc5\xff\x1d\x8c\x7f\x53\x0d\xce\x52\x0e\x70\xb8\x2c\
+\x89\xfc\xa4\x89\x58\x23\xc2\xeb\x98\x79\x2d\x3b\xef\x69\x50\x40\
+\x12\xef\x67\x07\x5f\x5b\x33\xac\x31\x9d\x8d\xd7\x5e\x1b\x3d\x56\
+\xd3\x7f\x62\x40\x51\xf7\x31\x9d\x33\x61\x35\xdb\x37\xcf\xeb\x29\
+\x35\x3f\x8e\x01\xd8\x17\x48\xbe\x7f\x06\x4a\xd3\xa2\x3b\x44\x6c\
+\x25\xe4\xac\xb4\xee\x4a\x8f\x0b\xce\xeb\xe3\x6f\x4c\xba\xe8\x84\
+\xea\x31\x43\xfd\xe9\x0e\x77\xbd\x38\xff\x9b\x60\xaf\xc2\xff\x8c\
+\x6c\xfb\x3c\xdf\xdb\x47\xdb\x57\xf0\xbf\x42\xf8\x9f\xdb\x54\x88\
+\xe3\x55\x69\x08\x73\x5c\x86\x00\xba\x86\xb1\x3e\xd6\x62\x6f\x03\
+\x69\x4f\x03\x2f\x24\x90\x3e\x70\x7c\x68\x6b\x36\x07\xe3\x3f\x79\
+\xcf\x54\x23\xed\x45\xc7\xf3\x81\xdf\x75\x1d\x48\xc4\xfe\x16\x0b\
+\x26\x45\xb9\x5a\xcc\xa3\x58\x6f\x45\xe7\x5c\x1f\xe9\x01\xd7\x01\
+\xb8\xcf\x9f\xfb\xfd\x9b\xea\x4a\x3b\xc4\xf5\xd5\xe1\x2f\xeb\x80\
+\x10\x35\x46\xe7\xbb\xfa\x86\x2e\xf8\x1b\xe2\x7d\xc1\x20\xa6\x38\
+\xff\x2d\x61\xdf\x47\xde\x67\xbb\x57\x63\xdf\x07\xdb\x47\x8b\x3e\
+\xfe\x27\x08\xff\x54\x9f\xd5\xf0\x21\x1f\x10\xe9\xbe\x0a\xe9\x21\
+\x4e\xc8\x8d\x74\x47\x5e\x94\x07\xf1\x81\xbd\x88\x0d\x78\xcf\xa3\
+\x19\x5f\x8d\xf5\xd5\x48\xbd\x81\xbc\x5f\xe9\x77\x9d\x03\x08\xfc\
+\xd7\x2c\x9d\x51\xe5\xb5\x7a\x11\xa2\x3d\xc9\x77\x85\x38\x20\x2d\
+\xd8\x5e\xac\xcd\x0f\x91\x63\x3f\xee\xf9\x3f\xb1\x67\x7b\x07\x2e\
+\x9c\x96\xaf\xf3\x19\xe3\x7a\xa0\x70\x81\x41\x8c\x78\xbe\xbe\x04\
+\x87\xa3\xec\x71\x28\xca\x0e\x07\x23\x49\x22\x6c\xd1\x1a\x61\x83\
+\xd6\x70\x1b\xb4\x84\xd9\x60\xbf\x76\x0d\xf6\x85\x5a\x63\x2f\xc9\
+\x9e\xd0\xd5\xd8\x1d\xb2\x1a\xbb\x82\xad\xb0\x33\xc8\x12\xcd\x81\
+\x96\x68\x0a\x5c\x85\xa6\x00\x0b\x34\xfa\xaf\xc4\x0e\x92\xed\x7e\
+\x2b\xd1\xe0\xbb\x02\xdb\x7c\x96\x63\xab\x8f\x39\xb6\x78\x9b\x63\
+\xb3\xd7\x32\x6c\xf2\x32\x43\xbd\x27\x89\x87\x29\x36\xb8\x2f\xc5\
+\x7a\xb7\x25\x42\xea\x5c\x17\xa3\xd6\x65\x11\xd6\x91\xd4\x38\x9b\
+\xa0\xda\xc9\x04\x55\x8e\x0b\x51\xe9\xb8\x00\x15\x0e\x0b\x50\x6e\
+\x33\x1b\x65\xd6\xb3\x48\x66\xf6\xd9\xf6\x8d\xe1\x5f\x14\xea\x08\
+\x0f\xcb\x05\xd0\x92\x1d\x25\x07\xda\x11\x07\xb8\x88\xfd\x4d\x92\
+\x03\xed\x11\x48\xf8\xdb\x9b\xcf\xc1\x82\x19\x13\x52\x35\xfd\xe7\
+\x9e\xcc\x7c\xee\x7b\x1c\xcc\xbf\xde\xe7\x67\xbb\x14\xf1\xbe\x6b\
+\x90\x15\xe6\x8c\xcc\x50\x27\xe2\xff\x35\x62\xbf\x16\x37\x0b\x29\
+\xf6\xbf\x72\xe2\x50\x87\x88\xa5\x58\x07\x2e\x9c\x56\xd9\x5d\x4f\
+\x3a\x20\xc9\xc9\xec\x50\x34\x2d\x7a\x13\x8d\x26\xff\xc4\x8e\x85\
+\x6f\xa0\x61\xc1\xeb\xd8\x36\xff\x1f\xd8\x32\xef\x1f\xd8\x3c\xf7\
+\x35\xd4\x7f\xfd\x2a\x36\xce\xf9\x3b\xd6\xcf\x1a\x8d\xba\x59\xa3\
+\x50\x3b\x73\x14\x6a\xa6\xbf\x82\xaa\x69\x2f\xa3\x72\xea\x4b\x28\
+\x9f\xf2\x22\xca\x26\xff\x0d\x6b\x27\xbd\x80\x92\x89\x2f\xa0\xf8\
+\xab\xe7\x51\xf8\xe5\x5f\x51\x30\xe1\x39\xe4\x7d\xf1\x2c\x72\xc7\
+\x3f\x83\xec\xcf\xff\x82\xac\x71\x7f\x41\xc6\x67\x23\x91\xfe\xe9\
+\x9f\x91\x36\xf6\x4f\x48\xf9\xe4\x69\x24\x7d\xfc\x14\x12\x3f\x7a\
+\x0a\x09\xff\xfa\x23\xe2\x3e\x7c\x12\xb1\x1f\xfc\x01\xd1\xef\x3f\
+\x81\xa8\xf7\x1e\x47\xc4\xbb\x8f\x23\x7c\xcc\xff\x41\xfb\xce\x63\
+\x08\x7d\x6b\x04\x82\xdf\x7a\xd4\x08\xf6\xc6\x6d\xbf\x13\xff\x6a\
+\x9c\xab\x67\xfc\x53\x51\x1d\xed\x2e\xd6\xbb\x05\x8b\xf5\x11\xd6\
+\xe2\x3a\xf2\xf5\x64\x5d\x50\xf0\x37\x99\x39\xa1\x5c\x23\xd5\x81\
+\xfb\xc3\x5c\xa0\xa8\xfb\x3b\xad\x98\x7f\x2a\xd0\xd1\x1c\x29\xa4\
+\xa7\xb9\xa4\xaf\xec\xbb\x92\x03\x6c\x11\xea\x6c\x4e\xf6\x3f\x9f\
+\xe2\xff\xb9\xb8\x79\xe6\x84\x84\xff\x79\x85\x63\x8d\xe9\x80\x12\
+\x1f\x2a\x22\xe9\xc3\xa9\x9c\x10\xec\x5c\xfc\xd6\x80\xd0\x01\x09\
+\xfb\xde\x6d\x1f\x2d\x5b\xd1\x41\xf9\xdf\x15\x8a\xff\xcf\xd6\x17\
+\xe0\x78\x65\x2a\x36\x25\xfa\x88\x7e\x48\x9e\x2b\xe1\xf5\xaf\x62\
+\x9f\x1b\xe2\x84\x24\xba\x96\x81\x0e\x66\xb0\x5f\x26\xf0\xe7\x1c\
+\xb0\xbf\xd4\x00\x44\xed\xc7\xd3\x7a\x31\x42\x5d\x56\x8a\xbc\x45\
+\xec\xc1\x14\xe5\x8e\x94\x20\x7b\xc1\x63\xcc\x67\x3e\x36\x4b\x6e\
+\x8a\x5a\xb9\xce\xa7\xaa\x79\xe0\xb4\xbe\x1f\x56\xeb\x81\xcc\x09\
+\x6d\x39\xa1\xd8\xb5\xe4\xad\x01\xa1\x03\xdd\xd5\xfa\x0c\x6d\x5f\
+\xc2\x7f\x13\xda\xb7\x57\xe1\xec\xc6\x7c\x1c\xaf\x48\x41\x43\x8a\
+\x9f\xc8\x93\x79\xdf\x1b\xae\x9b\xa6\x06\xda\x22\x8d\xae\x63\x92\
+\x9f\x8d\x88\x0b\xed\xcd\x66\x63\xd9\xdc\x49\x2d\x1a\xa9\x27\xb0\
+\xdf\xe0\xef\xba\x6a\x21\xc2\xdd\x2d\x91\x15\xee\x86\x42\xca\x5b\
+\x79\x3f\xb6\x34\x8a\x5f\xc2\xdd\x2c\xe0\x49\x39\x4d\xa8\xab\x95\
+\x1c\x3b\x73\x0c\x25\xeb\xc0\x05\x15\x0f\xe8\xe4\x8c\x3e\x27\xc8\
+\xbc\x70\x9a\xf0\xdf\xb3\xf4\xed\x01\xa1\x03\x46\x79\xff\x40\x57\
+\xec\xd1\xb2\x05\x37\xf7\xd6\xe3\xf2\xf6\x0a\x9c\xd9\x90\x8b\x63\
+\xe5\xc9\x68\x4e\x0f\x14\xeb\x1e\x7d\x29\x67\xe6\x75\xb0\xba\xf9\
+\x73\xf2\x05\xfe\xc4\x09\xdc\x33\x65\x3e\x6f\xea\x91\xfe\x86\xbf\
+\xfb\x6a\x8a\x59\x3d\xad\x91\x1b\xe5\x89\x92\x04\x7f\x14\xc5\xfb\
+\x22\x43\xeb\x82\x48\x0f\x2b\xa9\xa6\xe1\x69\x23\xc7\xcc\xf2\x9c\
+\xd9\x79\x99\x0b\x2e\x18\xea\xc1\x19\x03\x1d\x90\x84\xf1\xdf\x6b\
+\xfa\xce\x80\xd0\x81\xbe\xf0\xbe\x82\xff\x8d\x3d\x1b\x71\x69\x5b\
+\x19\x4e\xd7\xe5\xe0\x68\x59\x22\x9a\xd2\xfc\xc5\x1c\xa9\x84\xff\
+\x0a\xbd\x3a\x2a\x73\x02\xcf\xad\x2f\x9b\x3b\x85\xf1\xef\x4f\xfc\
+\x7f\x0f\xef\xb7\x1c\xed\x6d\x83\xbc\x18\x1f\x51\xb7\x2e\x4d\x0c\
+\x20\x2e\x70\xa7\xc7\xac\xc5\x3e\x5c\x51\xde\x76\x72\xae\x74\x42\
+\xc5\x03\x06\xfe\xe0\xbc\x01\x1f\x5c\xec\xf4\x0d\x67\x72\x43\xb1\
+\xdf\x6c\xcc\x80\xd0\x01\x1d\xf6\x2c\xec\x0b\x8c\xf0\x3e\x63\x0f\
+\x8a\xfd\xae\xef\x5a\x8f\x8b\x5b\x4b\xd1\x56\x9b\x85\x23\x6b\xe3\
+\xd1\x48\xfc\xdf\x69\xff\xfa\xf8\xfb\xae\x31\x11\x71\xb4\xd9\xd7\
+\x93\x14\xfc\xfb\x43\xfc\x27\xe2\x7f\x1f\x3b\x73\xc4\xf8\xda\xa1\
+\x20\xce\x4f\x9e\xb7\x0a\x42\x0e\x71\x41\xac\xaf\x2d\xfc\x29\x6e\
+\xd5\xba\xad\xbe\x29\xfa\x25\x59\x07\xb8\x67\x4a\xed\x0b\x14\x7f\
+\x60\x94\x0f\x24\x39\x4b\xf8\xb7\x2c\x7b\x77\x40\xe8\x80\xc0\x9f\
+\xe7\x01\x79\x7d\x00\xcf\x07\x19\xc3\x5e\xe0\xbf\x19\xd7\x9a\x6b\
+\x71\x61\x73\x31\x4e\xd5\x64\xe0\x50\x49\x2c\xb6\xc4\x7b\x88\x5a\
+\xa9\x21\xff\xf3\x1c\x3a\xef\x85\xc1\x79\xb4\xa9\x84\x3f\xef\x2d\
+\xdb\x5f\xf2\xbf\xbb\xb9\x47\x89\xf7\x50\x2c\x4c\x08\x10\xbd\x0b\
+\xbc\xef\x6e\x7e\xac\x2f\x12\x02\x1c\x10\xe4\xb4\x02\x01\x0e\xcb\
+\xa5\x1a\x99\x52\x33\x51\xea\x68\x8a\x1e\x9c\xef\x8e\x0b\x24\x39\
+\x97\x17\x8a\x03\xe6\xef\x0d\x08\x1d\x10\x7d\xe1\xca\x1a\x21\xee\
+\x09\x32\xc2\xfb\x8c\x3d\xc7\x7e\x1c\xfb\x2b\xb9\xdf\xc1\xa2\x68\
+\xd4\xc7\xb8\x89\x3d\x6e\x94\xf8\x4f\xc1\x9f\x73\x01\xee\x9f\x59\
+\xbd\x68\x2a\xe6\x4d\x1e\xdb\xa0\x91\xea\x3f\xfd\x61\x0e\x98\xcf\
+\xfd\x63\x5f\x87\xe5\xad\xbc\x9e\xa1\x28\x31\x10\x35\x59\x91\xa2\
+\x77\xa5\x98\x7c\x40\x72\xb0\x33\xc5\x7e\x96\xf0\xb2\x31\xc5\x8d\
+\x93\x07\x3b\xa4\x75\xb4\xc7\x3b\x7d\xc1\x59\x43\x1d\x38\x69\xc0\
+\x05\x92\x30\xfe\x07\x97\xbf\x3f\x20\x74\x40\xc2\x5e\x5e\x1f\xce\
+\xf8\x1b\xe1\x7d\xc6\xff\xe6\xde\x8d\x72\xec\x97\x87\x63\x15\xc9\
+\x38\x50\x10\x81\xf2\x50\x3b\x38\x2f\x9f\x2d\xfa\x25\xa2\x0d\xe6\
+\xd1\x78\x6e\x8d\xf7\x0d\x32\x99\xf6\x79\xbd\x46\xba\x4f\x4d\x7f\
+\xa8\xff\x8a\xfa\xbf\x9f\xe3\x8a\x6d\xbc\x77\x26\xe3\xcf\xbd\x8b\
+\xbc\xcf\x76\x59\x4a\x88\xd8\x6b\x37\x82\xe2\x42\xde\x9b\xff\xc2\
+\x81\x9d\x1d\x38\x7d\x54\x5e\x4b\x6d\xc8\x05\x27\x55\x31\x81\x2c\
+\x2a\xfc\xcf\xe7\x69\x71\x78\xc5\xfb\x03\x42\x07\x3a\xf7\x86\x38\
+\x28\xf5\x05\x1a\xe1\x7d\x96\x1b\xe4\xfb\x2f\x6d\x5d\x8b\xd3\xb5\
+\xd9\x14\xfb\x25\xa0\x85\x7e\x63\xbe\xaf\x25\x5c\x56\xcc\x11\x73\
+\xa6\x31\xaa\x75\xf2\xcc\x05\xbc\x27\xca\xaa\x05\x93\x30\x73\xc2\
+\x47\x59\x1a\xa9\x0f\xb4\xbf\xac\x05\x18\xe6\xef\x6c\x91\x17\x43\
+\xf8\x17\x26\xf0\x3a\x86\x58\xd1\xbf\xcc\x7b\x6b\x67\x47\x79\x8b\
+\xb8\x80\xf7\xb7\x38\xbc\x7d\x3d\x04\xfe\x42\x07\x8e\xea\xeb\x80\
+\xda\x27\xf0\xbe\x2b\x06\x5c\x70\xf3\xc4\x01\xdc\x38\xd8\x8c\xeb\
+\x42\x76\xca\x7f\x25\xb9\xc6\x72\xa0\xa9\x8b\x5c\x6d\x6d\x34\x90\
+\x1d\xb8\xb2\x6f\x1b\xae\xec\xda\x88\x2b\x3b\xd7\xe3\x4a\x33\x4b\
+\x1d\xae\x34\xd5\xa1\xbd\xa9\xb6\x53\x1a\xd7\x91\xd4\xe0\xf2\x8e\
+\x6a\x49\x28\x3f\xd7\x49\x43\x25\x2e\x35\x54\xe0\x52\x63\x2d\x2e\
+\xed\xda\x24\x4b\x3d\x2e\xb2\xec\x94\x44\x87\xfd\x49\xb6\xff\xfd\
+\x5d\x78\x5f\x08\x71\xff\xb5\xe6\x1a\x9d\xef\x3f\x4c\xbe\x7f\x5f\
+\x76\x30\x92\x5c\xcc\xc4\x1e\x77\x41\x0e\x4b\x11\xe7\xd5\xb9\x5e\
+\x36\xc2\x75\xb9\xd8\x37\x65\xe5\xbc\x89\x98\x3e\xfe\x43\x2d\x5d\
+\xf3\xdf\x6b\xa4\xfd\x92\xfb\x43\x1f\xf8\x8f\xfc\x9c\x56\xf9\xf2\
+\xfe\x9b\xbc\xae\x99\xf7\x49\xe6\x75\x2c\xbc\xa7\x3a\xaf\x6d\x4a\
+\x08\x74\x42\xa0\xb3\x05\xb6\x96\xe7\x4a\x73\x64\x2c\x67\xd4\x3c\
+\xa0\x88\x61\x5c\xd0\x0d\x2f\x74\x91\x53\xfa\xaf\x33\x7c\xbd\xd2\
+\x9b\xa5\xf4\xe9\x1b\xae\xd5\xd0\xf5\x6d\xaa\xd7\xec\xa9\x7b\x78\
+\x94\x39\x9d\x66\xe9\x35\x8c\x6d\x9b\x7a\x1f\xa0\x43\xfa\x9c\xaf\
+\x87\xff\x3e\x23\xd8\x93\xef\xdf\x53\x8f\xf6\x1d\x95\x38\xbb\x21\
+\x1f\xc7\x2b\x53\xc8\xf7\x47\x61\x4f\x66\x00\x82\x57\xcf\xd3\xed\
+\x85\x98\xa0\xea\xa1\xe3\xbd\x92\x9c\x89\x17\x96\x7f\xfd\x25\xbe\
+\xf8\x78\x8c\x95\xa6\x7f\xf5\x80\xde\x19\xe0\x64\xb9\x88\xf7\xeb\
+\xc9\x8b\x0f\x10\xf8\x6f\x2a\x4e\x12\xeb\x5a\x4b\x92\x43\x90\xa2\
+\x75\x83\xd6\x7d\x35\xfd\x3b\x42\xba\x66\x3a\xfc\x65\x51\xe3\x7f\
+\xd6\x58\x6c\xd0\x83\x4e\x18\x15\x79\x6e\x4e\xac\xd1\x6c\x35\xc0\
+\x5c\xc1\x7d\x6f\x57\xdc\xbb\xf4\xee\xa9\xb0\xe7\xd7\x33\xa6\x7a\
+\xfb\x7f\xf5\x82\xfd\x49\x39\xfe\x57\x63\x2f\xe3\x7f\x7d\x57\x1d\
+\xe5\xfd\x0a\xf7\x27\xa2\x25\x3f\x0c\xcd\xa9\x3e\x70\x5d\x36\xa3\
+\x73\x4f\x3c\xb9\x87\x8e\xe7\xd1\xb9\x7f\x96\xf3\xc2\x65\xb3\xbf\
+\xc0\x5b\xff\x78\xe5\x0b\x8d\xb4\x16\xb0\xbf\xec\x0b\x32\xd4\xc7\
+\xd1\xe2\x1f\xe1\x94\xe3\x67\xc7\xfa\xcb\xfb\xa4\xa7\x08\x1d\xe0\
+\x7d\xf4\x79\x1d\x13\xaf\x77\xe6\xfd\xb0\x74\xf8\xeb\xf1\x80\x31\
+\x1d\xe8\x2b\xfe\xaa\xc7\x05\xe6\x47\xa4\xeb\xae\x60\x7e\xbc\x1b\
+\xcc\x8d\xe2\x6e\x04\x7b\x7e\x3f\x63\xab\x7c\xdf\x5b\xc1\x5e\xe0\
+\xbf\x5b\x17\xef\xe9\x6c\x7f\x6f\x3d\xae\x36\x55\xe3\xfc\xa6\x22\
+\x9c\xac\x4e\x97\xb9\x3f\x04\x75\xe1\x76\x70\x5a\x36\x5b\xe4\xf9\
+\xfa\x6b\x67\x56\x8b\x78\xd0\x76\xe9\x74\x98\xce\xfa\x02\x4f\x8c\
+\x18\xf1\xbc\xa6\x7f\xe4\x7e\xca\x18\xb2\x68\xd1\x8c\xfb\x23\x7c\
+\x1c\x08\x6b\x5f\xb1\xa7\x15\xef\x77\xc7\xeb\xd9\x79\x2d\x2b\xef\
+\x7d\x15\x1f\xe8\x4c\x3e\x60\x15\x2e\xb6\x36\xcb\x3a\xa0\xe8\x81\
+\x8a\x07\xba\xf8\x83\x63\x72\xad\xc0\x88\x5f\xd0\xd5\x11\x64\xcc\
+\x4f\x1d\xe8\xc1\xce\x6f\x15\xf7\x5d\x92\xaf\x38\xad\xd2\xd5\xb6\
+\x5b\xc1\x5e\xb5\x2f\x10\x7f\x9e\x0a\x7b\xf6\xfb\x37\x77\x6f\xa0\
+\x38\xa2\x0c\x67\xd6\xe7\xe2\xb8\x88\xfb\x23\xb1\x27\xc3\x1f\xd9\
+\x9e\xcb\x05\xc7\x07\xc8\xb1\xbf\x2e\xf7\xa3\x38\x90\x7b\x68\x78\
+\x4d\xa5\xc9\xb4\x71\xfb\x35\xfd\x6f\x0d\x90\xd8\xe7\x8b\xf0\xdf\
+\xca\x7b\x18\xf1\x3e\xc8\xbc\x37\x3e\x4b\x3d\x71\x40\x69\xaa\x56\
+\xec\x83\xa7\xf5\x5c\x83\xed\x95\xf9\xb2\x3d\xa9\x79\x40\x89\x09\
+\x8f\x19\x8f\x09\xba\xc8\x31\xe9\xfd\x0a\xe6\x46\xf1\x36\xc0\xbc\
+\x2f\xb8\x73\xff\x06\x63\xc6\x9f\x7d\xe6\x88\x81\xcd\xdf\x06\xf6\
+\x2c\x5c\xff\x53\x61\xcf\xb6\x7f\xad\x49\x8a\xfb\xda\x28\xee\x3b\
+\x52\x1a\x87\xfd\xb9\xa1\xd8\x49\xdc\x1f\x62\x35\x57\xf4\x4a\x30\
+\xd7\xab\xf7\x4a\xe1\xbd\x32\x78\x6f\xac\x55\xf3\x27\x61\xce\xc4\
+\x8f\x33\x34\x9d\xbd\x7f\xfd\x21\xf6\x53\xc6\x9d\xe1\x3e\x0e\x3e\
+\x89\xa1\x1e\x58\x9b\x1e\x49\xd8\x67\x8a\xfb\x27\x31\x0f\xb0\x3e\
+\x64\xc7\xf8\x23\x9a\xf2\x83\xbc\xb8\x60\xf9\xda\x1d\x36\xd0\x81\
+\x23\xd2\x35\x37\xe4\x02\x9d\x1c\x95\x63\xb8\xd6\xbe\x61\x6d\x0c\
+\xf3\xee\x70\x57\x7c\xfb\x99\x23\xfa\xb8\x7f\x53\xec\x59\x78\x2e\
+\x40\xc6\xbe\xd3\xf6\xcb\x29\xee\xcb\x13\xf3\x7d\x07\x0b\xa3\xb0\
+\x37\x33\x10\x9b\xa3\x9d\xe0\x64\x3a\x5d\xac\x99\xd6\xaa\xf6\x44\
+\x65\xdf\xcf\xb1\xa0\xb3\xf9\x6c\x98\x7f\x3d\x01\x5f\x8d\x1d\xb3\
+\x5c\xd3\xbf\x7c\xbf\x32\xee\x08\x71\xb7\x7b\x9f\xef\x89\x56\x94\
+\xac\xc5\x96\xb2\x74\x34\xd5\xe4\x8a\xfb\x24\xf1\xde\xf8\xbc\x3f\
+\x7a\x52\xa8\x3b\xb4\x1e\x6b\xd0\x7e\x68\x57\xa7\x0e\xb4\x75\x87\
+\xff\x51\xe9\x39\xe1\xcb\xf7\x77\x8f\xaf\x51\xbc\xbb\xc3\x5c\x8d\
+\xfb\x2e\xe9\x73\xdb\x0e\xdf\x3a\xee\x6d\xdd\xe1\x6e\x80\x3d\x0b\
+\xd7\xfe\x65\xec\x25\xdb\xaf\x26\xdb\x2f\xd2\xd9\x3e\xe7\xfc\xbb\
+\xc8\xf6\x73\xdc\x97\x89\xf5\x31\xbc\x76\x26\x52\x55\xf7\xe3\x75\
+\x34\xbc\x4f\x0e\xef\x8b\xc7\xbe\xff\x99\xa7\xff\xf0\xb2\xa6\x7f\
+\xd4\xfd\x0c\xc7\x90\x19\x33\xc6\xde\x47\xf8\x5f\xe0\x7b\x61\x6d\
+\x28\x4a\x46\x73\x6d\x1e\x9a\xd7\xe5\x51\xde\x97\x81\x8a\xcc\x28\
+\x64\x46\xfb\x21\xca\xd7\x81\xe2\x82\x1c\xba\x76\x87\x24\xe9\xe2\
+\x0b\x64\x7f\xc0\xd7\xf6\xe8\x9e\x3e\xca\xee\x1e\xf0\x36\xb0\x75\
+\x7e\x3d\xe3\xa4\xd3\x37\x43\xdc\x7b\xf0\xf3\xb7\x8a\x3d\x73\x15\
+\xc7\x7e\x02\xff\x7a\xdc\xa0\x98\xff\x32\xc5\xfc\x67\x65\xbf\x7f\
+\xb0\x30\x52\xd8\x7e\x53\x92\x3b\x7c\x97\xcf\xec\xe4\x7e\x55\xde\
+\x1f\xe5\x6e\x21\xee\x85\x62\x65\x32\x19\x0b\xa7\x7e\xb6\x43\xd3\
+\x99\xf7\x7f\xd7\x7d\xbf\xc6\xc6\x9d\x51\xfe\x2e\x71\x69\x91\x7e\
+\xa8\xce\x8d\x27\xec\xf3\xc5\xfd\x70\x9a\x6a\xf2\xc4\x7d\x52\xf8\
+\x7e\x9a\x89\x21\xee\x48\x0c\x76\xc7\x4d\xbe\x36\x22\x8f\x3e\xa4\
+\xb2\xb5\xc3\x9d\xf9\x81\x12\x3b\xf7\x24\x47\x8c\x61\x2d\xe3\xad\
+\xe7\xd7\x8d\xd8\xba\x21\xee\xbd\xda\x7c\x4f\x7c\xdf\x0d\xf6\xc7\
+\x5b\x74\xd8\xdf\xdc\xb3\x01\x57\x28\xdf\x3f\x5f\x5f\x80\x53\x14\
+\xf3\x1f\x29\x8d\x45\x0b\xf9\x7d\xb6\xfd\xf2\x00\x4b\x38\x99\xcd\
+\x84\x8f\xf5\x42\xb1\x4e\x56\xcd\xfd\xdc\x3f\xcb\xeb\x69\x57\xcc\
+\xfd\x12\x53\x3e\xfb\xc0\x53\xd3\xb9\x07\x4c\x7f\xe2\x7e\x65\xdc\
+\x41\xf6\x3f\x96\xef\x87\x58\x9a\x1e\x85\xed\x55\x39\xd8\xb3\xa1\
+\x48\xba\x0f\x4a\x79\x26\x2a\xb2\xa2\xc5\xbd\x97\xa2\xfc\x1c\xb1\
+\x6f\x63\x85\x7c\x2d\x0f\xe9\x73\x81\x12\x17\xf0\x73\x46\xb1\x35\
+\x82\x73\x97\x7c\x5d\xc9\xdd\xf6\xeb\xfb\xf5\x1e\xed\xbd\x8f\x36\
+\xdf\x57\xec\x79\x4f\x18\xe6\x1a\xc2\xbe\x63\xef\x46\x51\xeb\xbb\
+\xb8\xa5\x84\xf2\xfd\x2c\x1c\xa3\x7c\x9f\x6b\xfd\x1c\xf3\x37\x26\
+\xba\x41\x6b\x35\x47\xac\x8b\xe7\x9a\xaf\x3a\xee\xe7\x39\x5f\xe6\
+\x7e\x5b\x99\xfb\xff\xf2\xd4\x13\xbc\x2f\x78\x7f\xde\x03\x6a\xc8\
+\xbb\xef\x3e\x73\x77\xa2\xd6\xeb\x64\x5e\x62\x28\x36\x96\xa6\x61\
+\xcf\xc6\x62\xec\x25\xd9\x59\x5b\x80\xf5\xe4\x13\x38\x36\x48\xd2\
+\x7a\x22\x23\xc2\xaf\x93\x03\x14\x3d\xd0\xe3\x82\x43\x92\x8f\x36\
+\x86\x6b\x77\xc2\x3a\xc1\xb1\xe1\xc9\x83\xfa\xfc\xde\xa3\xad\x7f\
+\x8b\xb8\xab\xb1\x67\xe1\xba\x91\x9a\xf7\x37\xe4\xe2\x44\x65\x0a\
+\x0e\x15\x45\x8b\x5a\xef\xce\x64\x2f\x54\x05\x59\xc1\x51\xc4\x7d\
+\x0b\x44\x8d\x4f\xbd\x4f\x1a\xd7\x00\x78\x1f\x0d\xcb\x05\x93\x31\
+\x77\xd2\x27\xeb\x34\xfa\xfb\x01\xf7\xd7\x31\x34\x49\xeb\xe3\x9e\
+\x16\xe5\x8f\xaa\xdc\x04\xec\x24\xdb\xdf\xbf\x79\x2d\xf6\xd6\x97\
+\xa0\xa1\x32\x1b\x95\x39\xb1\xc8\x8e\x0d\x14\xf7\xd6\xde\x55\x57\
+\xda\x79\x6d\xf5\xae\xbb\x8c\x0b\xdb\xaf\x52\x77\x35\xac\xc3\x2a\
+\x8f\xb1\x8d\xf1\xb5\x3e\xa5\xd4\x68\x0e\x1b\xc8\xad\xda\xba\x11\
+\xae\xbf\x1d\xec\xb9\x7e\xc0\x7b\x3c\xec\x5e\x8f\xf6\xed\xe5\x38\
+\xbf\x51\xe1\x7d\x8a\xf9\x72\xb5\xd8\x9d\xe6\x8b\x1d\xf1\xae\x08\
+\xb6\x98\x05\xd7\x15\x5f\x8b\x3d\xb1\xd4\xf3\xbd\xac\x07\xbc\x7f\
+\x0e\xf7\x02\x98\xcf\x99\x80\x71\x1f\xfc\x73\x9e\xa6\x7f\xd5\x7c\
+\xba\x1b\x43\x22\xbc\xed\x1e\x4b\x0c\xf3\xbe\x5e\x9c\x16\x89\xad\
+\x15\xd9\x68\xd9\x52\x46\x3a\x50\x86\xdd\x1b\x8a\x51\x4f\x9c\xc0\
+\xf7\x4b\xe5\xfb\x69\x27\x85\x78\xe0\xea\x91\x3d\xfa\x1c\xa0\xe7\
+\x0b\x0e\x49\xb9\x19\xfb\x7a\x11\xdf\xef\x95\x74\xe2\xa4\xcc\x1b\
+\x5d\xb0\x36\x22\x86\xb1\x45\x6f\xb8\xf7\x6a\xf3\xdd\xf1\xbd\x01\
+\xf6\x24\x37\x29\xef\xbf\x4a\x3e\xff\xc2\x26\x8a\xf7\xd7\x65\x12\
+\xef\x27\xe0\x40\x7e\x38\xf1\x7e\x00\x9a\x12\xdd\x51\xe4\x65\x0e\
+\x47\xb3\x19\xa2\xb6\x23\x6c\xdf\xc7\x4a\x6f\xbe\x8f\xeb\xc0\xab\
+\x4d\xa6\x62\xd1\xf4\x71\x47\x87\x0d\x1b\xc6\xeb\xbd\x94\xf9\x9e\
+\xfe\xc8\xfd\xea\x71\x67\xa2\xd6\x3b\x36\x8b\x72\xfd\xda\xc2\x14\
+\xec\xa9\x2f\x45\xeb\xb6\x0a\xa1\x07\x8d\x14\x13\xae\x2b\x48\x44\
+\x3e\xc5\x82\x7c\x3f\xf5\xba\xfc\x14\xc9\x0f\x9c\xec\x06\x7f\x63\
+\xf1\x61\x5b\x5f\xb1\xee\x0b\xde\xbd\xd9\x7b\x5f\x6c\xbe\x2b\xf6\
+\x7c\x0f\x88\xab\x8d\x55\xb8\x48\xb9\x1e\xfb\xfc\xe3\x65\x49\x22\
+\xde\xdf\x97\x15\x84\xe6\x64\x4f\x6c\x8e\xb2\x87\x87\x59\xe7\x3d\
+\xcf\xd4\x7e\x9f\xd7\xcf\x71\x1e\xc0\x7d\xe0\x3c\xdf\x33\x69\xec\
+\xdb\x36\x1a\xc9\xf6\x07\xca\xfd\x40\x86\xa4\x44\xf9\x3e\x97\x14\
+\xe6\x73\xbd\x34\x23\x06\x0d\xd5\xb9\x38\xb0\xad\x52\x08\xf3\xc0\
+\x56\xf2\x03\x15\xd9\xb1\xe2\xbe\x88\x71\x41\x6e\x38\xb2\xbd\x0e\
+\x37\x39\x56\x3e\x79\xb0\x67\x2e\x30\x2a\xb7\x89\xb7\x31\x5b\xbf\
+\x15\xdc\x8d\xf1\xbd\x82\xfd\xf1\x7d\xb8\x76\x60\x07\x61\x5f\x8c\
+\x33\x75\xd9\x38\x41\xb9\xde\xa1\xa2\x28\xec\xcf\x21\x9f\x9f\xe2\
+\x8d\xed\x71\xce\x88\xb1\xfe\x5a\xe0\xcb\x3d\x5d\xe1\x22\xe6\xef\
+\xf4\xfb\x91\xb2\xed\x73\xbd\x77\xd1\xb4\xcf\x4e\xdc\x7f\xef\xbd\
+\xbc\xd6\x6f\xa0\xdd\x07\x60\x68\x4a\xa4\x7f\x64\x76\x7c\x08\xea\
+\x8a\x52\xb1\x77\xd3\x5a\x1c\xda\x5e\x8d\x83\x0d\x55\x14\x13\x96\
+\xa0\x7e\x6d\x3a\x4a\x33\xa2\x90\x1e\xe5\x87\xb4\x08\x5f\x5c\x6c\
+\x6d\x24\x1e\x68\xe9\x8a\x87\x88\x0d\x14\xe9\x23\xa6\x3d\xbe\xde\
+\xc8\xe7\x77\x8b\xfb\xad\xd9\xbc\x82\xfd\x75\x8a\x5b\x2f\x37\xd7\
+\xea\xb0\x3f\x4c\xf1\x5e\x4b\x4e\x88\xc8\xf5\x76\xc4\xbb\x10\xef\
+\x2f\x83\xc3\xd2\x69\x62\x9f\x9c\x10\x07\xfd\x7b\x9c\xf2\x5c\x4f\
+\xa0\xec\xf7\xd9\xf6\x27\x7e\xfc\xb6\x95\x46\xaa\xf7\xf4\x77\xbf\
+\x6f\x38\x86\xc4\x68\x3d\x46\xa4\x46\xf9\xb7\x97\x10\x07\x6c\xab\
+\xca\xa5\x70\xa8\x1a\x87\x77\xd4\x08\x1d\x68\xae\x2b\x24\xbd\x48\
+\x41\x51\x6a\x38\x52\xc2\x7d\x50\x92\x12\x89\xab\x87\x77\xe3\x86\
+\xc8\xd9\x0e\xa8\xe4\xa0\x01\xa6\x3d\x48\xb7\xfa\xd2\x17\xcc\x6f\
+\x07\x77\x7d\xec\x6f\x12\xe7\x5f\x3f\xb4\x13\x57\x5a\xb6\x8b\xf5\
+\xdc\x9d\xd8\x87\x8a\x78\xaf\x91\xe2\xbd\x75\xc1\x56\x70\x5d\x2a\
+\xdd\x03\x87\xd7\xf8\xb0\x9f\x57\xef\x89\xcf\x5c\xc0\xf3\xff\x52\
+\x9f\xd7\xa7\x2d\xe4\xf7\x1f\xd6\x74\xde\x07\x6c\xa0\x8d\xa1\x19\
+\xb1\x81\xf6\x99\x14\x07\xd4\x14\x24\x63\xf7\xc6\x52\x1c\x69\xaa\
+\xc5\xe1\xc6\x75\xc2\x17\xec\xa8\xc9\x43\x4d\x7e\x12\xc5\x02\x5a\
+\x50\xce\x88\xfa\xa2\x74\x5c\x3d\xb4\x0b\xd7\xf9\x1e\x4a\x22\xc6\
+\x3b\x60\x1c\xb7\xde\xa4\x3b\xbc\x6f\x17\xf7\x5e\x6c\x9e\x63\xd2\
+\x9b\x94\x87\x70\x1f\x52\x7b\x4b\x03\x2e\xee\xae\xef\xc4\x3e\x97\
+\xb0\x4f\x27\xec\x13\xdc\x50\x1f\x61\x0b\x1f\xb3\x29\xa2\xbf\x8b\
+\xf7\x44\x60\xac\xd5\xf7\x40\xe2\x79\x3e\x7e\x9c\xf7\x47\xe4\x79\
+\xfe\xb1\x63\xfe\x31\x51\x23\xcd\xf3\x0d\x94\x7d\xdf\x0d\xc7\x10\
+\x1f\x4b\xcb\x9f\xa4\xc5\x04\x36\x17\xa6\x46\x62\x53\x79\x16\xc5\
+\x81\x55\x38\xda\x5c\x27\xf4\xa0\x65\x6b\x85\xe0\x85\xaa\xbc\x04\
+\xe4\x26\x86\x22\x31\xd4\x13\x8d\x95\x79\xb8\xc2\xfd\x5d\x47\xf7\
+\xca\xf5\x81\x03\x3d\x48\x77\x18\x1f\xe8\x05\xef\x3e\x62\xde\x1b\
+\xee\x32\xdf\xdf\x38\xb2\x1b\x57\x0f\x34\xa1\x7d\xff\x36\x71\x9f\
+\x8f\xb6\x4d\x25\x22\xc7\x67\xce\x17\x76\x4f\xd8\x6f\x8e\xb4\x43\
+\xf0\xca\x19\xc2\xe7\x73\x9d\x8f\xef\x77\x19\xaf\x9a\xe3\x4b\x90\
+\x63\x3e\x9e\xff\xb5\x98\x37\x11\x73\x26\xfc\x8b\x7b\xfc\x06\xea\
+\xbd\x5f\xd4\xe3\x8e\xbc\xa4\xb0\xbf\xa7\xc7\x04\x5d\x2f\xcf\x89\
+\xc7\x8e\x75\x05\x02\xfb\x63\x3b\xd7\x8b\xbf\xfb\xb6\x94\x53\x3c\
+\x98\x83\xca\xdc\x04\xe4\x24\x84\x22\x89\x78\x60\x77\x6d\x31\xda\
+\xb9\x87\x4f\xf6\x07\x1d\x22\x3f\x90\xb1\xea\x51\x1f\x64\x11\xaf\
+\xed\x09\xef\x5e\x30\xef\x03\xd7\x0b\x9b\x57\xf8\xbe\x75\x07\x2e\
+\xef\xdb\x8a\x0b\xbb\xea\x71\xb6\x91\x74\xbb\x2c\x51\xc4\x7a\xbb\
+\xd3\x7c\x74\xd8\x6b\x2d\x66\x90\x4f\x9f\x29\xe2\x3a\x71\x5f\x73\
+\xd5\x3d\x8e\x79\x9d\x34\xd7\x7d\xb9\xbf\x93\xfb\xbb\x17\x4f\x1f\
+\xd7\xf6\xc7\xc7\x7e\xc7\xeb\xbb\xbe\x2f\xf7\x7f\x1c\x9a\x13\x1f\
+\xea\x94\x4d\xf8\xae\x2b\x4c\xc5\x2e\xf2\x03\x8c\xff\xf1\x5d\x1b\
+\x04\x17\xec\xa5\x9c\x60\x4b\x05\xe5\x04\xa4\x1f\xb9\xb2\x0e\x34\
+\x57\xe6\xe3\x72\xcb\x0e\xe2\x82\x66\x5c\x3f\xb2\x47\xe4\x07\x7a\
+\x7a\x70\x5b\xd2\x0b\xe6\x7d\xc1\x5d\xce\xed\x84\xcd\x1f\x6c\x12\
+\x7c\x7f\x69\xef\x16\x9c\xdf\xb9\x01\x67\xc8\xaf\x9d\xdc\xbc\x16\
+\xfb\xb2\x83\x28\xd6\xf3\x16\xf5\x1d\x1d\xf6\x7c\x4f\x7b\x8a\xf7\
+\xd8\xc6\xd5\xb9\x9e\xb2\x3f\x1e\xdf\x07\x85\xeb\xbc\x66\xc4\xfb\
+\x9f\xbe\xfb\xea\x64\xcd\xc0\xbc\xe7\x4f\xb7\x63\xe2\xc4\x89\xc3\
+\xb3\x12\xb4\xb5\x05\x14\xe7\x6d\x5c\x9b\x89\xfd\x5b\x2a\x70\x62\
+\xf7\xc6\x4e\x1d\xd8\xc4\x3a\x20\xf1\x40\x6e\x22\xd7\x88\xbd\xb1\
+\xb9\x38\x0d\x97\xf6\x6d\x23\x2e\x68\xa4\xb8\x40\xf6\x09\x86\x7c\
+\xf0\x4d\xf1\xd6\xc3\xbc\x6f\xb8\xb3\x9f\xe7\x18\x4f\xd8\x3c\xf9\
+\xfa\x73\x4d\x75\x38\x4d\xb1\xed\x29\xf2\x67\x07\xd6\x26\x88\xba\
+\xee\xf6\x38\x17\x6c\x08\x5b\x83\xa0\x15\xd3\x75\xd8\xf3\xde\x38\
+\xfa\xf1\x9e\xe4\xf3\xb9\xb7\x8b\xe3\xfd\x15\x73\xbf\xc2\xcc\xf1\
+\x1f\xf0\xfe\x6e\x5c\xe3\x57\xee\xeb\xfe\x7d\x19\x43\xd2\xe2\xfc\
+\x1f\xce\x88\x0b\x39\xca\xf9\xc0\xe6\x8a\x5c\x1c\xd8\x5e\x83\x93\
+\x7b\xea\x85\x1e\x30\x1f\xec\xdb\x2c\xf9\x82\xaa\xbc\x44\xe4\x27\
+\x87\x21\x85\xf2\xc2\x4a\x7a\xed\x39\xe2\xd5\x4b\xfb\x1b\x3a\xf5\
+\x80\xf9\xe0\x98\xa2\x07\xb7\x29\xdd\x62\xde\x35\x9f\xbb\x29\x70\
+\xdf\x25\xe1\xde\xca\xb8\x4b\x7e\xfe\x5c\xb3\x64\xf3\x6d\x94\xcf\
+\x9c\xdc\x52\x86\xa3\x1b\x8b\xd0\x4c\xd8\x37\xc4\x3a\xa1\x3a\x68\
+\x15\x3c\x97\x4e\x16\xfe\x9e\x39\x9f\xed\x5e\x8d\xbd\xb2\xa6\x8b\
+\x73\x3d\x9e\xdf\xe3\xde\x9e\x85\x53\x3e\x59\xff\xe3\x1f\xff\x58\
+\xe9\xed\xe8\x0f\x7d\xbd\xdf\xf6\x10\xb1\x40\x56\x7c\x68\x7b\x59\
+\x76\x3c\xb6\x55\xe7\xe3\xe0\x0e\xe2\xcc\x3d\x9b\x84\x1e\x30\x17\
+\x30\x2f\x34\x54\xe7\x89\x7c\xa1\x88\x62\x46\xbe\x17\x60\x6e\x4c\
+\x10\x8e\x6c\xae\x10\xf7\x52\xbc\x44\x31\x56\x7b\xab\xe4\x17\xae\
+\x51\xae\x70\x43\xe8\x02\xe5\x0b\x8c\xdb\x49\x45\xbe\x2d\xcc\x77\
+\x0b\xff\x7e\x95\xf4\x4e\xb1\x77\xc6\xfd\x3c\xe1\x7e\xb6\xb1\x16\
+\xa7\x1b\xd8\xe6\xcb\x71\x7c\x53\x29\x8e\x6e\x28\xc4\xbe\x42\xca\
+\x73\xa3\x1d\x90\xeb\xb6\x04\xce\x8b\x27\x0b\x5c\xb9\xb6\xcb\xfb\
+\x61\x32\xe7\xab\xb1\x17\xfb\x22\x92\x4e\xf0\xbc\x9f\xd5\xc2\xc9\
+\x30\x99\xfa\xd9\xc1\xe7\x47\x3e\xc6\x3e\x9f\xf7\xf4\xfb\x3e\xf8\
+\xfc\xee\xc6\x1d\x59\xf1\x21\xe3\x32\xe3\x43\xaf\x57\xe4\x26\xa2\
+\xa1\xa6\x80\xf2\xc1\x5a\x9c\xda\x4b\x3a\x40\x72\x7c\xd7\x46\xb4\
+\x92\x3d\xed\x58\x57\x88\xf5\xc4\xff\xa5\x99\x31\xe0\x1a\x52\x32\
+\xc5\x04\x5b\x8a\x52\x71\x96\xae\xfd\x79\xc2\xe0\x22\xf9\xdc\xcb\
+\xc4\x09\x1c\x7b\x71\xec\x7d\x4d\xf0\x02\xc5\x8b\xc2\x47\xec\x93\
+\xfc\x84\xf0\x15\x86\x38\x77\x8a\x78\x5e\x60\x2d\xe3\x4d\x39\x1c\
+\xd7\x6e\xd8\xce\x75\x98\x93\xbe\xb1\x7f\xe7\xd8\xee\x5c\xf3\x7a\
+\x15\xee\xe4\xbf\xc8\xd7\x1f\x23\x9b\x3f\x5c\x47\x7a\x5c\x93\x8d\
+\xfa\x28\x07\x84\x5b\xce\x82\xfd\x12\xa9\xae\xcb\x6b\x38\x79\xfe\
+\x3e\x46\x15\xeb\x29\x3d\x3d\x8c\x3d\xbf\x86\xf7\x4b\x36\x9d\xf9\
+\xf9\x39\xbe\x4f\x9e\x46\x8a\xf7\xfa\xc3\x7a\x9e\x7f\xf7\x18\x5a\
+\x9a\x15\xbf\x98\x78\x00\x15\xb9\x49\xa4\x03\x85\x38\xc4\x3a\xb0\
+\x6f\x33\xe9\xc1\x66\xc1\x05\x87\x88\x17\x76\x6e\x28\xc1\xa6\xb2\
+\x2c\x11\x13\xe4\x27\x87\x23\x35\xd2\x9f\xb8\x20\x10\xfb\x49\x37\
+\xce\x12\x16\xe7\x49\x57\x2e\xe8\x74\x81\x78\x81\xf0\xba\xd2\x4a\
+\xb8\xf1\xda\x1f\xc1\x0f\x3b\x29\x87\xd8\x25\x30\xbd\x7e\x44\x96\
+\xc3\x9d\x72\xed\x30\x3d\x7f\xa8\x59\xc4\x71\x02\x6f\xd2\x25\x8e\
+\xe7\x98\xdf\x2f\xed\xd9\x22\xd9\x3a\xc5\x75\xec\xdf\xcf\xec\x90\
+\x78\x9e\xed\x5d\xc2\xbd\x18\x47\xd6\x17\xe0\xd0\xba\x5c\xb4\x56\
+\x67\xa1\x24\xcc\x05\xae\x4b\xa7\x4a\xf7\xb2\xa3\x38\x9e\xe7\xf3\
+\x38\xa6\x67\x8e\x57\x63\x1f\x27\xdb\x3d\xd7\x7f\x18\xfb\xa5\x33\
+\xc6\x5d\x1c\xfb\xe6\x28\xbe\xe7\xb3\x82\xfd\xf7\x22\xde\xeb\xc3\
+\x18\x9a\x93\x18\xb6\x38\x3b\x21\x0c\xcc\x03\xdb\xaa\x0b\x84\x2f\
+\x60\x1d\x68\x13\x7a\xb0\x89\xe2\xc2\xf5\x94\x1b\x94\xd3\x73\x79\
+\xa8\x25\xdb\xe7\xb9\x84\x1c\xe6\x82\x30\x6f\x94\x26\x69\x71\x88\
+\xf4\xe3\xcc\x8e\x5a\xd2\x85\x3a\x9c\xdb\xc9\xbc\x50\x4f\x3e\x42\
+\xd2\x87\x4b\xc4\xd5\x1c\x3b\xb2\x5e\x30\x4f\x08\x69\x91\x45\x39\
+\x66\xdb\xe6\xd7\xd1\xeb\x2f\x92\x6f\x61\x5d\xba\x40\x3a\xc5\x7e\
+\xfd\xac\x8c\xf9\xe9\xed\x84\xf9\xb6\x0a\xe1\xdf\x99\xe7\xd9\xde\
+\x8f\x90\xbd\x2b\xb8\xd7\xa5\x85\x21\xc2\x75\x15\xf1\xf8\x3c\x78\
+\x5a\x2d\xa4\x58\x6e\x89\xb0\x79\xf6\xf5\x5c\xcb\x55\xc7\xf9\x7c\
+\xbf\x4b\x9e\xd3\x65\xce\x57\xb0\xff\xf4\xdd\xd7\xde\xd3\xfc\xf0\
+\xb0\x57\xc6\xd0\xd2\xec\xf8\x99\xec\x0b\xca\x72\x12\xb0\xa5\x32\
+\x0f\x2d\xdb\xaa\x05\x07\xb4\xed\xdf\x22\x74\x81\x63\x43\x8e\x13\
+\x9b\xd7\x17\x8b\xfa\x51\x75\x7e\x12\x8a\xd3\xa2\xc0\x73\x8b\x9c\
+\x27\x16\x27\x84\x60\x0f\xc5\x8c\x6c\x9b\xa7\x77\xd4\x50\x3c\x56\
+\x8b\x33\x84\x1d\xf3\x03\xeb\x84\x24\x1b\x05\x57\x08\xd9\x29\xc9\
+\x39\x21\x1b\x24\x4e\x67\xac\x9b\x6a\x65\xbc\xab\x25\x3b\xd7\xc3\
+\xbc\x58\xf8\xf7\xc3\x02\xf7\x1c\xec\xaf\xcc\x40\x4d\x4a\x08\xa2\
+\xdc\xac\xe0\xb9\x7a\x11\xef\x6d\x24\xf6\xe6\xd2\xba\xae\x10\xfb\
+\xdf\x25\x52\x3e\x9f\x1a\x68\x27\x44\xe4\xf7\xca\xfd\x2f\x48\x37\
+\x5c\x28\x26\x60\x7f\xbf\x74\xe6\xe7\x6d\x5f\x7e\xf8\x4f\xbe\xcf\
+\x33\xfb\xfb\x1f\x22\xf6\xca\xb8\x83\x7c\xfc\xc7\x99\x71\xda\x0b\
+\x25\x99\x71\xa8\x2f\xcb\xc6\x1e\xb2\xf9\xe3\x64\xcb\xa7\x49\x07\
+\xda\xf6\x6d\x91\xb8\x80\xf2\x03\x8e\x0d\x77\xd4\x16\x52\xfe\x98\
+\x21\x72\x84\xa2\xb4\x48\x64\x93\x1e\xa4\x10\x1f\x64\x46\xf8\xa0\
+\x2e\x2b\x06\xad\xb5\x05\x38\x49\xbe\xf9\xd4\xb6\x4a\x9c\x22\x1c\
+\xdb\xb6\xb3\x54\x77\x23\x84\x73\x43\xa5\x78\xed\x49\xe6\x75\xc2\
+\x9b\xb9\xfd\x78\x7d\x89\x3e\xe6\xb5\x94\xab\x54\x67\x63\x6b\x6e\
+\x0c\x72\xc3\x3c\x10\xec\xb8\x02\xbe\x76\x66\x08\x70\x34\x47\xa8\
+\xeb\x4a\x44\x7a\x5a\x21\xce\x77\x8d\xd8\xa3\x2f\x23\xd4\x19\x59\
+\xe4\x0b\x32\xb5\x4e\xc8\x08\x71\x40\xb2\xdc\xbf\xcf\x6b\x7a\x78\
+\x5d\x3f\xaf\xdf\x5d\x3a\xe3\xf3\x03\xef\xfe\xe3\x45\xde\xc7\x9f\
+\xfb\xf8\xbe\xcf\xb1\x5e\x5f\xc7\x1d\xa5\xd9\x31\xcf\x64\x27\x86\
+\x1d\x2c\x4c\x8b\x46\x6d\x71\x3a\x9a\xd6\x97\xe0\x30\xd9\x25\xe3\
+\x2f\xe9\x81\x14\x17\x1c\x26\x3b\x65\x9f\xb0\x7d\x5d\x81\x4e\x0f\
+\x4a\xd2\xa3\x45\xfd\x38\x3d\xda\x5f\xf4\x97\x66\x84\x7b\xa3\x82\
+\xf2\xc7\x86\xc2\x24\x1c\xac\x2b\x10\x36\x6c\x54\x18\xe7\x7a\xc2\
+\x59\x60\x4d\xbc\xbe\x5e\xc1\x3b\x0f\x07\xc9\xce\x9b\x8a\x93\x50\
+\x9b\xaa\x45\x8e\xd6\x1d\xe1\xae\x94\xab\x11\xee\xc1\x2e\x16\xd0\
+\xba\x5b\x89\xfd\xb8\xe3\xfc\xec\xc4\x5e\xed\xe9\x5a\x17\xb1\x5f\
+\xb7\xb4\x57\xab\x87\xd8\xb3\x53\xec\x7f\x47\xf6\x1f\xee\xc6\xb5\
+\x9d\x45\xb0\xa7\xfc\x9e\xd7\xee\x2e\x9c\x3a\xb6\xfa\x9d\x51\xcf\
+\xf3\xde\x0d\x3c\x97\x3f\x88\x7d\xe7\x18\x42\xf8\xff\x4f\x4e\x62\
+\x44\x01\xc5\x05\xa8\xc8\x4b\xc2\x96\xaa\x3c\xec\xdd\x52\x29\x73\
+\xc1\x56\xc9\x27\xec\x65\x9f\x50\x2f\x72\x06\xd6\x83\x46\xe2\x03\
+\xf6\x0b\xdc\x67\x52\x9e\x1d\x87\x62\xca\x19\xb9\x86\xc8\x79\x23\
+\xc7\x09\x71\x81\x2e\x48\x0a\x72\x45\x56\x84\x37\x8a\x63\x03\x50\
+\x99\x1c\x8a\x75\x69\x11\x58\x9f\x1e\x8e\x8d\x59\x51\x42\xd8\x87\
+\x57\x26\x85\xa0\x24\xd6\x0f\x39\xe1\x9e\x48\x0a\x70\x42\xb8\xbb\
+\xb5\xd8\xb7\x42\xeb\x61\x8d\x08\x2f\x1b\x69\xfd\xa2\xbf\x83\xb8\
+\x17\x47\x6a\xa8\x2b\xf1\x0d\xe1\x1c\xed\x8d\xc2\x78\x3f\xb1\xdf\
+\x95\xb2\xe7\x15\xef\xd7\x9c\x43\xf8\xf3\xfe\xcd\x5a\xe2\x06\x2f\
+\xc6\xde\x8c\xb0\xa7\xfc\x7e\xf1\xf4\x71\x81\xf7\xde\x7b\xaf\x32\
+\x9f\xc3\xb5\x9d\x41\xec\xf5\x07\x5f\x8f\xa1\xc5\x19\xb1\xa6\x99\
+\x09\xa1\xed\xf4\x17\x75\xc5\x19\xc4\xf9\xc5\x68\xe5\x5a\x11\xf9\
+\x01\xb5\x4f\x60\x3d\x38\x42\x1c\xd1\x42\xfc\xcd\xb9\x02\xd7\x0d\
+\xea\xd7\x66\x0a\x5d\xe0\x5a\x72\x29\xf1\x42\x01\xf1\x40\x2e\xc5\
+\x08\x99\x94\x37\x70\x5f\x7a\x0a\x71\x03\xf7\x9f\x26\x10\x4f\xf0\
+\xbd\xd6\xe3\x48\x37\x24\x71\x11\x12\x4f\xff\x4e\x08\x76\x25\x1e\
+\x71\x43\x72\xa8\x3b\x52\x89\xef\x33\x22\xbc\xc4\x3e\x06\x79\xa4\
+\x1f\xbc\xbf\x4d\x49\x72\x30\xca\x53\x29\x77\x49\xd3\x8a\x7d\x6e\
+\xca\x53\x83\xc5\x9e\x57\x45\xa4\x0b\xbc\xff\x5d\x9c\xaf\x2d\x82\
+\x9d\x57\xc0\xc3\xca\x04\xb6\xa6\xb3\xb0\x7c\xde\xc4\xc3\xb3\xbf\
+\xfc\x17\xef\xd9\xcd\x7c\xff\x43\xf6\xf5\x7d\x1d\x77\x64\xa5\x44\
+\xfe\x31\x2f\x25\xa2\x96\xf3\x03\x8e\x0d\x37\xae\xcd\x12\x3e\xe1\
+\x00\xc5\x68\x27\x28\xc6\x67\x1d\x50\xf2\x04\xf6\x0b\x5c\x3f\x3c\
+\x44\xf1\x1f\xc7\x08\xbb\x48\x17\xb6\xd7\xe4\x8b\x39\x85\x0d\x25\
+\xe9\xa4\x0f\xc9\xa2\x17\xb5\x3c\x2b\x16\x6b\x33\xa2\x44\xff\x61\
+\x51\x4a\x18\x0a\x29\x87\x28\x20\xbf\x91\x9f\x18\xa2\x93\x02\x92\
+\x42\xe2\x02\x5e\xaf\x54\x92\xa2\x15\xf7\xe2\x2d\xcf\x08\x47\x55\
+\x56\xa4\xd8\xd3\xa4\x96\x62\x00\x65\x7f\x13\xbe\x47\x57\x55\x66\
+\x98\xd8\xe7\x24\x3f\xd6\x07\x29\x21\x2e\x88\xf4\xb2\x46\x80\x83\
+\x39\x78\x3f\xc4\x35\x4b\x19\xfb\x49\xb1\xaf\xbf\xf4\x0c\xf7\xed\
+\x72\x3d\x77\xa0\xdc\xbf\xbd\x3f\x0c\x89\x0b\x32\x63\x66\x66\x25\
+\x86\x1f\xcd\x4d\x8e\x40\x39\xe5\x89\x1b\x29\x3e\x6c\xac\x2b\x46\
+\x4b\x43\x35\x8e\x51\x3c\xcf\xfe\x40\xaa\x19\x6c\xd2\x9b\x4f\x38\
+\x4c\x7a\xd2\x4a\xbc\xc0\xf3\x0a\xbb\x36\x14\xa3\x89\xe2\x85\xed\
+\x55\xb9\xd8\x5a\x91\x85\xcd\x65\x19\xa2\x0f\x75\x63\x49\x2a\x36\
+\x14\xa5\x88\xbe\xf4\xf5\x14\x2b\x08\x29\x4a\x12\xeb\xd5\xea\x8b\
+\x93\xb1\xa9\x24\x59\xdc\x8f\x99\x85\xff\x5d\x5f\x94\x28\xee\xcd\
+\xba\x21\x3f\x0e\x75\xa4\x07\x55\xa4\x17\xbc\xdf\x4d\x06\xf9\x02\
+\xf6\x0d\xec\x2f\xf8\x1e\x0d\x0e\x2b\xe6\x61\xf5\x92\x19\x0d\x73\
+\x26\x8e\x7d\x4b\x23\xd5\x72\x07\x6d\xfe\xf6\xc7\x90\xa2\xd4\x88\
+\x9f\xe7\x27\x47\x5a\x67\xc5\x6b\xcf\xe4\x26\x45\xa0\x2c\x3b\x01\
+\x75\x25\x19\xd8\x56\x53\x80\xdd\x84\x2f\xd7\x0d\x8e\x11\xee\xcc\
+\x03\xca\x7c\x02\xeb\xc1\x31\xd2\x83\xa3\x14\x2f\x1e\x69\x5c\x27\
+\x7a\xcf\x0e\x50\xac\xdf\x42\x71\x3e\xf7\x20\xee\xa5\xf8\x8f\xfb\
+\xd0\x76\x53\xdc\xb7\x8b\xe2\xbe\x9d\x14\x27\x36\xd7\xe6\x8b\xf5\
+\x6a\xbc\x6e\xb1\x91\xe2\x7d\x5e\xbf\xca\x6b\x98\x95\xb5\xec\xac\
+\x07\xbc\xa7\x45\x15\xc5\x0c\xc5\x49\xc1\xc8\x22\x9f\x90\x10\xe4\
+\x2c\xee\xcf\xe7\xe7\xb0\x5c\xdc\x9f\xc7\xde\x7c\xde\x3e\x0b\x93\
+\xe9\x73\x1e\x7a\xe8\x21\xee\xd5\xe5\xf9\xbb\x41\x3f\xff\xed\x8c\
+\x3b\xc8\x87\xdf\x9f\x9b\x1c\xce\x7a\x70\x94\x04\xc5\xe9\x64\x83\
+\xf9\x84\x09\xf9\x06\xae\x23\xef\xda\xb8\x96\x62\x81\x2a\x51\x4b\
+\xe4\xda\x11\xfb\x04\x16\xa5\xdf\xe4\x70\x63\x8d\xae\x07\xf1\x00\
+\xe5\xf7\xad\xb2\x2e\xec\x23\x5d\xe0\xf5\x09\xca\x5a\xa5\x9d\x75\
+\x92\x1e\x34\x56\xe7\x08\xfc\x37\x95\xa6\xa0\x36\x3f\x9e\xfc\x40\
+\x04\xf9\x87\x20\x64\x44\x32\xee\x2e\x08\xf7\xb2\x45\x80\x93\x05\
+\xdc\xad\x97\xc2\x79\x95\xc9\x2e\xab\x25\xb3\x66\x0f\xe2\xfe\x6f\
+\x1f\x77\x44\x46\x3a\xdf\x43\x3c\x30\x31\x2b\x4e\x5b\x9e\x1e\x1b\
+\x02\xce\x17\x58\x17\xb8\x8e\x58\x5b\x94\x26\x6a\x08\x5c\x33\x6c\
+\xac\x2b\x12\xbd\x06\xec\x03\x38\x2e\xe0\x7e\x23\x9d\x6c\xe9\xe4\
+\x81\xdd\xc4\x03\xbb\xd6\x17\xa1\x89\xec\x9f\xd7\xac\x6d\x21\xff\
+\xb0\xa1\x38\x05\x35\x79\xf1\x28\xa3\x78\x81\xd7\x2d\xf2\xfa\xf5\
+\x14\x8a\x1b\x63\x03\x9c\xa1\xf5\xb4\x81\x1f\xe1\xee\x61\x63\xd6\
+\xee\x6a\xb5\x34\xdd\x7e\xf9\xfc\x7f\x69\xa4\x7c\x8e\x79\x7e\x10\
+\xf7\xff\xcc\x10\xf1\x41\x7e\x46\xe4\xa3\xb9\xc9\x61\xab\xd2\x63\
+\x82\xab\xd3\x62\xc8\x36\x49\x1f\x72\x93\x28\xb6\x4b\x8b\xc2\xda\
+\xac\x38\xa1\x13\xd5\xc4\x11\xdc\x77\x52\x57\x9c\x86\xf5\x25\x2c\
+\xe9\xd2\xdf\xe2\x54\xd1\x83\xba\xae\x20\x49\xf4\xa0\x55\x50\x7c\
+\xc8\xeb\x16\x0b\x39\x67\x88\x0f\x46\x46\x94\x9f\xa8\x31\xc6\x52\
+\x0e\x19\xee\x6d\x8f\x40\xd7\xd5\x84\xfb\xaa\x76\x6f\x87\x95\x45\
+\x2e\x6b\xcc\xbe\x9e\x3f\xe3\x4b\x8e\xeb\x38\x97\xe3\x3c\x7e\x10\
+\xf7\xef\x6e\x08\x5d\xe0\xfa\x41\x7e\x4a\xe4\x17\xe9\xd1\x41\x7e\
+\xa4\x0b\xf5\xa9\xd1\x81\xed\x49\x11\x7e\x48\x8d\x0a\x40\x3a\xe9\
+\x46\x66\x2c\xf9\xec\xb8\x10\x64\xc5\x87\x48\x7f\xe3\x82\xe9\xb1\
+\x20\x51\x2b\x48\xa5\xdc\x30\x29\xcc\x1b\xf1\x21\x1e\x88\x0e\x74\
+\x45\xb8\xaf\x23\x42\x3c\x6d\xa1\xf5\xb2\xbf\x10\xe0\x62\x5d\xe1\
+\xe7\xb8\xca\xd5\xcd\xc6\xec\x83\xf1\xe3\xc7\xfc\xb7\x46\xe2\xf7\
+\x41\xcc\xfb\xe7\x60\x3c\x38\xd6\x1e\x3a\x76\xec\xd8\x1f\x17\x25\
+\x45\x8c\x4c\x09\xf7\xff\x24\x31\xcc\x6f\x71\x6c\xa8\x97\x73\x52\
+\xb8\x6f\x64\x74\x90\x47\x66\x62\xb8\x6f\x45\x62\x98\x4f\x45\x42\
+\x98\x77\x45\x7c\x88\x67\x45\x88\x97\x7d\x52\x4c\x90\x5b\x54\xa8\
+\x8f\x83\x03\xe1\x3e\xcf\xdf\xcd\xe6\x83\x40\x17\x4b\xbe\xcf\x26\
+\xdb\x37\xf3\xba\x82\xf7\x1d\x9a\x41\xcc\x07\xda\x50\x74\x42\xe8\
+\x85\x2c\x77\x76\x23\xca\xf3\x0a\xce\x83\x58\x0f\x8e\xc1\xd1\xcd\
+\xc0\xad\x8c\xb3\x0f\xe9\x1f\x97\x0d\xd3\x3f\xb6\x1a\xa2\x7f\x6c\
+\xf0\xf1\x1d\x1a\x8d\xa5\xfa\xf8\x86\x46\x33\x5a\x7d\x7c\x45\xa3\
+\xd1\x3b\xc1\x59\x8d\xe6\x3e\xf5\x71\x8b\xc1\x71\x99\xc1\xb1\x15\
+\xf9\x75\xfd\xd3\xeb\x1d\x77\x18\x1c\xdf\x30\x38\xbe\x62\x70\x4c\
+\xa7\xd7\xfb\xfc\x16\x83\x63\x3a\xbd\xde\xf7\xb5\x32\x38\xe6\xcb\
+\x3b\x5a\xff\xf4\xea\xdf\x7f\xc3\xe0\xf2\xf3\xe9\xd5\xd7\x8f\x4f\
+\x3f\xd4\xe0\xf4\xea\xaf\x57\x66\xf0\x75\x54\xa7\x3f\x3b\x54\xef\
+\xf4\x37\xf8\x85\xaa\xd3\xf3\x3b\xa5\xe3\xce\x2f\xf6\x50\x87\xee\
+\xf4\xfc\x45\x34\xc3\x3a\x74\xa7\xe7\x13\x6b\x86\x74\x5e\x3d\x2b\
+\xa1\x38\xab\x94\xd3\x77\x48\x8a\xf4\x6b\xe5\xf4\x37\x3a\x95\x6b\
+\xb4\xf2\x3b\xe4\x61\xa9\xfb\x38\x95\xf2\x95\xe9\x0e\x87\xa8\x3e\
+\x5e\xa3\x9c\xbe\xa3\xf3\xe5\xc3\x0c\x3e\xfe\x3e\xdd\xb7\x95\xc6\
+\x43\x06\xa7\x33\x3c\x3d\xf4\x4f\x3f\xd4\xe0\xf4\xa3\x0d\x4e\x6f\
+\x69\x70\x2c\x3d\x6f\xf0\xf1\xaa\xaf\xf7\x90\xb1\x63\xc3\xaf\xab\
+\x3a\x1e\x66\xf0\xf5\x8d\x1e\xab\xbe\xfe\x50\x63\xc7\x9d\x3f\x47\
+\xba\x7c\xbd\x1d\x77\xfe\x5c\xe9\x7a\xf4\x76\x6c\xd5\xc3\xb1\xe5\
+\xb7\x70\xac\x3a\x14\x17\x74\xa0\x1f\x5b\xa9\x8e\xbf\x8d\xeb\xa3\
+\x3e\xbe\x45\xfc\xfa\xa4\x0f\xaa\x63\xa3\xfa\x65\x78\xdc\x9b\xbe\
+\xf6\xa0\xef\x46\xed\x43\x75\x6c\xd4\xbe\xba\xd8\x63\xe7\x0f\x84\
+\xfe\xb1\xcc\x9d\x2d\x06\xc7\xba\x1f\x20\x73\xa9\xee\x0b\xcb\x5c\
+\xaa\xfb\x82\x32\x97\xea\xbe\xd0\x43\xd2\xb1\xee\x0b\x8d\x96\x8f\
+\x95\x2f\x64\x09\xfd\x2f\x20\x1f\x2a\x5f\x40\x47\xdd\x57\xf4\x4e\
+\xa7\x3b\xa1\xf2\xf1\xca\x09\x46\xeb\x8e\xcb\xf4\x3e\x4e\xfe\x05\
+\x2a\x4f\x70\x43\xf5\x6d\x75\xdf\xc8\x12\x7a\x6f\x50\x3b\x0e\x7e\
+\x81\x25\xba\x19\xff\x0f\xbd\xec\x6f\xa5\
+\x00\x00\x0c\xa1\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x9d\xed\x6f\x1c\x47\x1d\xc7\xe7\x1e\x90\
+\x68\x2b\x81\xd4\x2a\x04\xa9\x94\x1a\x94\x40\x45\x29\x01\xde\xa1\
+\xa8\xb9\xf5\x9e\x15\xa5\xca\x0b\x8a\x44\x48\x1b\xef\xee\x99\xc2\
+\x7f\xd0\xd0\x17\x55\x85\xd3\x4a\x3c\xc5\x8d\x92\x0a\xa1\xa0\xa6\
+\x4a\x1b\x29\x45\x21\x48\x44\x34\xf1\x3d\xa4\x95\x5c\x89\x37\x79\
+\x95\xba\x51\x5f\x34\x2d\x2d\xaf\x40\x24\x6a\x05\x12\x89\x64\x1c\
+\xdb\xc7\x6f\x1e\x7e\xbb\x7b\xe3\xf5\xdd\xee\xde\x3e\xcc\xee\xcd\
+\x37\xfa\xf9\x3c\xe7\xcb\xec\xcc\x7c\xbe\x33\x73\xb7\x3b\xb7\x43\
+\x48\x05\xfe\x1d\x39\x42\xe0\xe7\x14\x79\xe8\xb3\x15\xf2\x05\x42\
+\xc8\x43\x10\xf0\x14\x7d\x92\x3d\xcf\x55\x21\x7f\xfd\x1c\x61\x11\
+\x46\x4e\x7b\xda\x0d\xbb\xe3\xfd\x3e\xb7\x64\x84\xcb\x40\x2b\x33\
+\x51\x26\x2e\x2f\x60\x65\xb7\xbd\x88\x23\xab\x67\x32\xe6\x22\x2a\
+\x10\x35\x0b\x7e\xc7\xd0\x1e\x50\x47\x07\xce\x1f\x00\xce\xc0\x6b\
+\xb1\x49\xac\xc5\x19\xca\xab\x46\x99\x51\x1f\xd0\xb0\xda\x46\xa4\
+\xfc\x9c\x4e\xd3\xcf\xbe\x0a\x1e\xaa\xe0\xef\xc0\xbe\xa2\x3d\xa0\
+\x8e\x5c\xf6\x3c\x2a\x8c\x57\xc7\xa4\xdc\xd9\xef\x51\x3d\x20\xb1\
+\xaf\x89\xc7\x1d\x10\x87\x77\x5f\x79\x94\x8e\x2f\xda\x03\x8a\x68\
+\x90\x7d\xb3\xe2\xf4\x1a\xd5\x3f\xf4\x09\xe5\xf5\x34\x30\xdf\xe1\
+\x0c\x32\x24\xb3\x23\x3c\xb0\x89\x7d\x17\xf2\xed\x4e\x6f\x87\xdf\
+\xaf\x42\xf4\x21\x16\xc4\x7b\x81\x9a\xf6\x40\xbe\x92\xd9\xdb\x5d\
+\xa3\x06\xfc\x29\x9b\xa3\x82\x15\x65\xb6\xdd\x06\xe6\x61\x3c\x20\
+\xb3\x77\x3a\x74\xfe\x37\x29\xfb\x65\x91\xdf\x8a\x78\x3c\xa6\x3d\
+\x90\xaf\x86\xb0\x5f\x90\x58\x2d\x87\xf1\x40\x08\xf6\x77\xa4\x47\
+\xed\x81\x9c\x14\x82\xbd\xcc\x6a\x19\xd8\x6c\xb7\x24\x0f\xb4\x16\
+\x4d\x96\x1f\x67\x1d\x8a\x7d\x7f\x94\x07\x6c\xed\x81\x54\x45\xdb\
+\x36\x24\x7b\x99\x15\xf3\x80\xdd\x1e\x7c\x3f\xe0\xb4\x4d\x37\x6f\
+\xfe\x19\x6f\x24\xfb\xa1\x1e\xb0\xf5\x38\x90\x9a\x22\xf4\xfb\xad\
+\x58\xf1\x71\x40\x7c\x9e\xc7\x7c\x45\xff\x17\x9f\xef\xcc\x07\xe1\
+\xf1\x9d\x11\xf9\x8d\x1c\x07\xb4\x07\x92\xd5\x18\xec\x37\x79\x00\
+\x58\x4d\x89\xcf\x05\x15\xce\xcd\xf4\x8f\x09\x3f\x93\xde\x3f\x8c\
+\x0a\xed\x81\x94\x15\xc4\xde\xe6\xec\x5f\x0c\xc9\xbe\x2f\x31\x7d\
+\x06\xe7\x7a\xca\x9e\x8a\xa7\x0d\x18\x03\xd8\x7b\x84\x63\x11\xf3\
+\xd5\x1e\x48\x49\x09\xf4\x7b\x99\xd1\x71\xce\xd8\xa8\xf8\xd9\x3b\
+\xdd\xbd\xe8\x81\xaa\xf0\xc0\x71\xed\x81\x7c\x95\x02\xfb\x97\xec\
+\x4e\x03\xe6\x7b\x83\x9f\x1f\xbc\xb4\x97\x5f\xd7\xe9\x21\x7b\xef\
+\x3c\xbf\xf6\x40\xbe\x4a\x8b\x3d\x70\xa5\x63\x3e\x9e\xcb\x27\xb3\
+\xed\xc7\xd8\xf1\xb4\x07\xd4\x51\xd6\xec\x51\xda\x03\xf9\x2b\x2f\
+\xf6\x28\xed\x81\xfc\x94\x37\x7b\x94\xf6\x40\xf6\x52\x85\x3d\x2a\
+\x4d\x0f\xd8\xee\xb9\xa6\xe4\x3d\x40\xcf\x6b\xb4\x2e\x9b\xa4\xf5\
+\xa6\xc9\xde\xdb\x5a\x6f\x18\xc4\xba\x08\xe5\x5e\x8c\xbe\x06\x86\
+\x9e\x1b\xfd\xf1\xc5\x26\xc4\x0c\x3b\x47\xf2\xc4\x5b\x0d\xf2\xe4\
+\x9b\x0d\x62\x75\xe3\xad\xa7\xd9\x4a\x8c\x3d\x3f\xef\xca\xaf\xdf\
+\xe7\xcc\x1e\x55\xb4\x71\xc0\xf1\xca\xca\xd7\xac\xf8\x7c\x16\x57\
+\x52\xfd\xab\x98\x4e\xca\x03\xaa\xf5\xfb\x4d\xf5\x4f\xc1\x03\xbe\
+\x6b\x10\x89\x79\x60\x13\xfb\xee\x74\xc5\xb9\x04\x6d\x70\x09\xca\
+\x2a\x22\x72\x9e\x8b\x26\xbb\x46\x46\x03\xf8\xd4\x81\x79\xa2\x1e\
+\xd8\xbc\x6e\xc7\xc0\xb6\x8d\x7a\x5e\x2f\x15\xf6\xa8\x20\x0f\x38\
+\x0a\x8d\x03\x12\x7b\x3c\x8f\xfd\x1d\x88\x67\xbd\xb1\xc0\x1c\x9d\
+\xd1\xa6\x7c\x4d\x28\x97\x51\x15\xd7\x4b\x9e\x13\x79\x0e\x5c\x3f\
+\x8b\xeb\x81\xe0\x7e\xbf\x67\x2c\xf6\x4e\x0a\xec\x51\xaa\xce\x05\
+\x41\xec\xe1\xb9\x2f\xc1\xe3\x27\x10\x67\xbd\xe7\xe3\xf1\xf7\xb1\
+\x7e\x1d\xe2\x53\xe0\xfd\xc0\xb8\x1e\x48\x6f\xcc\x9f\x4e\x85\x3d\
+\x4a\x35\x0f\x6c\xc1\x7e\x0a\x1e\xdf\x17\xf9\xbf\x9c\x20\xff\x53\
+\x22\xcf\xeb\xc0\xfb\x2b\x71\x3d\xa0\xfa\x7c\x3f\x4a\xaa\x78\x60\
+\x08\xfb\xbf\xf9\x8e\x71\x3a\x41\xfe\xaf\xfa\xf2\xfd\x28\x8e\x07\
+\x8a\xce\x1e\x95\xb7\x07\xac\xb6\x39\x8a\x3d\x5e\xe7\x4c\x83\x3f\
+\xe6\x1d\xc9\x03\x65\x61\x8f\xca\xcb\x03\x21\xd8\xaf\x89\x48\x8b\
+\xbf\x3f\xff\x50\x1e\x28\x1b\x7b\x54\xd6\x1e\x08\x62\x6f\x6f\x66\
+\xef\xcf\x2f\x0d\xfe\x77\xa4\x63\x0d\xf5\x40\x59\xd9\xa3\xb2\xf2\
+\x40\x10\x7b\x78\x2e\x88\x7d\x56\xfc\x43\x79\xa0\xcc\xec\x51\x59\
+\x78\x20\x02\xfb\x2c\xf9\x8f\xf4\x40\xd9\xd9\xa3\xd2\xf6\x40\x04\
+\xf6\x59\xf3\x1f\xee\x81\x09\x60\x8f\x4a\xf9\x9a\x51\x3d\x24\xfb\
+\x3c\xf8\x6f\xe5\x81\xfa\xa4\xb0\x47\xa5\xe5\x01\x2b\x3c\xfb\xbc\
+\xf8\x6f\xf2\x80\x45\xd7\xd8\x5d\x7e\x74\x62\xd8\xa3\x52\xf0\xc0\
+\xaf\x80\xfd\xfd\xb4\x5d\x43\xb0\xcf\x93\xbf\xbf\x6c\x1f\x5b\xfc\
+\x3c\xf4\x2f\x27\x89\x3d\x2a\xd0\x03\xdd\xe9\x38\x1e\xd8\x10\xaf\
+\xfd\xb7\x48\xaf\x47\x68\xc3\x3c\xf8\xfb\xcb\x48\xcb\xbc\x2a\xea\
+\x10\x89\xbd\xd3\x75\xe7\xbd\xc2\xb1\x47\x25\x38\x0e\xac\x8b\x36\
+\x0c\xc3\x5e\x05\xfe\xe3\x94\xb9\xd0\xfd\x5e\x56\x82\x1e\x08\xdb\
+\x87\x54\xe1\x1f\xa5\xcc\x01\xec\x8b\xdb\xef\x65\x25\xe8\x81\xa2\
+\xf1\x9f\xd8\x7e\x2f\x2b\x63\x0f\x14\x85\xff\x44\xb0\x47\x85\xf0\
+\x40\xd8\xb9\xb2\x0c\xfc\xb1\xae\x13\xc1\x1e\x15\xe8\x01\x7e\x5f\
+\x0a\xbc\x67\x4d\x94\x79\xbe\xa8\xfc\xb1\x8e\x0b\x4e\x67\xcf\xc4\
+\xb0\x47\xd9\x5d\xc3\xef\x81\xba\x18\x03\xbe\x06\xf1\xdf\x84\x3c\
+\xa0\x32\x7f\xac\x1b\xad\xeb\xd7\xbd\x36\xc0\xeb\x05\x46\xf2\x0d\
+\xae\x90\x24\xf6\xbc\x6d\xbb\x06\x3d\xaf\xf7\xb1\x34\x2e\x96\x95\
+\xbf\xbf\x8e\x7f\x07\xde\x01\xd7\x8c\x8c\xe4\x1b\x5e\x01\x0d\x61\
+\xff\x61\x82\xec\x8b\xc0\xdf\x5f\xd7\x8f\x26\xc1\x03\x43\xd8\x87\
+\x39\x9f\x5f\x46\xfe\xfe\x3a\x97\xda\x03\x19\xb3\x2f\x12\xff\xd1\
+\x1e\x88\x51\x6e\x95\x94\x03\xfb\xa2\xf1\x2f\xad\x07\x72\x62\x5f\
+\x44\xfe\x83\x1e\xe8\x04\xac\x23\x2a\x98\x07\x72\x64\x5f\x54\xfe\
+\x92\x07\xcc\xc2\x7a\x20\x67\xf6\x45\xe6\x5f\x78\x0f\x28\xc0\xbe\
+\xe8\xfc\x0b\xeb\x01\x45\xd8\x97\x81\x7f\x21\x3d\x30\xd7\x31\x58\
+\xd8\xde\x77\xe4\xbf\x0c\x71\x5d\xd4\x63\x45\xd4\xe9\x4e\x06\x81\
+\xdf\xd1\x3a\x95\x20\xff\x57\x7c\xf5\xc8\xa2\x0e\x6b\xbe\x7a\x7c\
+\x20\xee\xcb\xcb\xdb\x96\x7e\x4f\x1c\x42\x35\x59\xdd\x3d\x7e\xf6\
+\x8f\x40\xfc\x43\x94\x3f\x89\x6b\x3a\x71\xfa\xff\x6b\x09\xf2\x3f\
+\x23\xe5\x9d\x55\x60\xdb\xfd\x13\x62\x17\x7a\xc0\x6a\xab\xd7\xff\
+\xe9\x9a\xb5\xef\x9f\xdf\x4b\x9e\xb8\xc8\xf6\x12\xf8\x39\xc4\x9f\
+\x45\xbf\x39\x93\x71\xd0\x71\xff\x4f\x10\x3f\x71\xfb\x4c\x7c\xfe\
+\xe8\xe7\x9f\x8a\x3c\x4f\xe7\x50\x9f\x57\x44\x5b\xce\xcf\xbe\x61\
+\x90\xfd\xbf\xdd\x45\xf7\x64\x49\x81\xe0\x78\x9a\x83\xf6\x9a\xeb\
+\x36\xc5\xe3\x0c\xff\x1d\x1e\xb5\xc6\x53\xeb\xf2\xb4\x1b\x4e\xcf\
+\x70\x43\x35\x59\xfc\x1e\x14\x22\xe8\x3d\x66\xd9\x75\xcd\x5a\x4e\
+\x51\xe7\x7d\x97\xdd\xeb\x38\xd6\xfb\xa5\x56\x9b\xdd\xff\x85\x85\
+\x18\x07\x14\xa8\x0f\x6f\x5f\x2b\xe6\x9e\x7e\x69\xaa\x05\x63\x12\
+\x86\xd3\x35\xd5\x88\x1e\x0f\x3b\xc6\x7c\x69\xf5\x9a\x50\x17\x93\
+\x45\xee\xf5\x70\xc3\x60\xf3\xac\xa3\xe0\xf8\xaf\xa5\xa5\xa5\xa5\
+\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\xa5\
+\xa5\xa5\x55\x3e\xd9\x9d\x26\x0b\xab\xdd\x54\xe0\x3a\x89\xbe\xfe\
+\x93\xb5\xc4\xf7\xb8\x31\x14\xb9\x5e\xaa\xaf\xff\x66\x25\xab\x3d\
+\x03\x6d\xc5\xc3\xee\x7a\xa1\x35\x9e\x8a\xb2\xfe\x83\xf6\xb1\x1f\
+\xbd\xf5\x08\x8c\x9b\xbb\xf5\xfa\xaf\x09\x5c\xff\xe5\xb4\x07\xd6\
+\xfe\x7e\xcb\xe6\x6b\x16\xf5\xfa\xcf\x09\x59\xff\x79\xe8\xd2\x0c\
+\x0b\x5b\xaf\xff\x9e\xc8\xf5\xdf\x21\xf6\xe4\xd1\xdf\xff\x08\x1f\
+\x85\xfb\xfe\x07\x95\x22\x1e\x28\x3a\xff\x42\xb2\x47\x29\xe0\x81\
+\x22\xf3\x2f\x34\x7b\x54\xce\x1e\x28\x2a\xff\x52\xb0\x47\x6d\xb1\
+\x2f\x6b\x16\x1e\x28\x22\xff\x52\xb1\x47\x05\x79\x20\xc2\x3e\x0e\
+\x93\xc2\xbf\x94\xec\x51\x39\x78\xa0\x48\xfc\x4b\xcd\x1e\x15\x71\
+\xff\xb6\x49\xe1\x3f\x11\xec\x51\x21\x3c\x30\x99\xf7\x7f\x9c\x00\
+\xf6\xa8\x21\x1e\x98\xcc\xfb\xbf\x76\xcc\xaf\x4e\x0a\x7b\x94\xe4\
+\x81\xba\xd8\xdf\x51\xdf\xff\x79\x02\xd8\x0f\xd9\x03\xe0\x37\x09\
+\xb1\x57\x9d\xbf\xbf\x8e\x0b\xb3\xbd\x26\xb1\xbb\x66\xcd\xf6\xed\
+\xf7\xf2\xd4\x5f\x76\xa7\xd0\xf2\xf9\x4b\xef\xff\x10\x38\x07\xbc\
+\x64\x75\xcd\xd2\x7b\x40\xef\xff\x32\xb4\x9c\xa5\xf6\x80\xde\xff\
+\x69\x72\x3d\xa0\xf7\x7f\x8b\xee\x01\xab\x24\x1e\xd0\xfb\x3f\xc6\
+\xdb\xff\xb1\x0c\xe3\x80\xde\xff\x95\x3d\xc6\xde\xff\xd5\xee\xba\
+\xc7\x2e\x9c\x07\x52\xd8\xff\xf9\xd7\x10\xf7\xdb\x05\xdb\xff\x19\
+\x8e\x39\xd6\xfe\xcf\x45\x1c\x07\xd2\xd8\xff\x7d\xae\xc7\xcf\x17\
+\x39\xfc\xbe\xf8\x85\xd8\xff\x1d\xcf\xeb\x89\x7d\x9c\x63\xef\xff\
+\x5e\x24\x0f\xa4\xc1\x9e\x7f\xf7\xc6\xfd\xfe\x43\xd8\x35\x24\x79\
+\xf0\x0f\xba\x96\x53\x87\x39\xaf\x36\x09\x1e\x48\x93\xbd\xd5\x76\
+\xeb\x1d\x76\x0d\x49\xd6\xfc\xb7\xbe\x8e\xc7\xcb\x5e\x6a\x0f\xa4\
+\xcd\x9e\x7e\xd7\xc9\x97\x7f\x98\x6b\xc7\x59\xf2\x1f\x71\x0d\xb7\
+\xdc\x1e\xc8\x82\x3d\x8d\x88\x6b\x48\xb2\xe2\x3f\xf2\xfa\x7d\x99\
+\x3d\x90\x15\xfb\x03\xe7\xbf\xc7\x8e\x17\x61\x0d\x49\x16\xfc\x43\
+\xad\xdd\x38\x70\xfe\x40\x29\x3d\x90\x35\x7b\x54\x48\x0f\x20\x9b\
+\x34\xf8\xfb\xf3\x0f\xb5\x76\x23\xd0\x03\x3c\xef\x42\x7a\x20\x2f\
+\xf6\xa8\x10\x1e\xc0\xef\x4d\xa5\xc1\x1f\xf3\x8e\xb4\x6e\x67\xd0\
+\x03\x66\xc5\xee\x1a\x35\xa7\xd7\x28\x9c\x07\xf2\x66\x8f\x0a\xe1\
+\x81\xb4\xf8\x47\x66\x8f\x2a\xba\x07\x54\x61\x8f\x1a\xe2\x81\xf7\
+\x45\xfe\x2f\x27\xc8\xff\x94\xc8\xf3\xfa\x38\xeb\xf5\x98\x07\xda\
+\xa6\x88\x66\x61\x3c\xa0\x1a\x7b\xd4\x16\x1e\xa0\xe7\x5d\x3f\x81\
+\x38\x9b\x20\xff\xd7\x21\x3e\x85\x7c\x1e\x88\xcb\x1e\x55\x34\x0f\
+\x04\xb1\x77\xc6\x65\xdf\x1b\x9f\x3d\x2a\xc8\x03\x10\xdf\x86\x78\
+\x56\xfc\x1e\xfb\xfe\x0f\x96\xf7\x5d\xf6\xe7\x20\xbe\x3b\x2e\x7b\
+\x54\xb0\x07\xd8\xfe\x59\x2f\xc6\xf5\x80\x9d\x82\x07\xd2\xe8\xf7\
+\xe2\xb3\x7c\x0d\xda\x76\x6c\xf6\x28\xc9\x03\x94\x59\xe5\x50\xdb\
+\xac\x59\x5d\x83\xd0\x98\xed\x44\xbf\x5f\x46\x0b\xfe\x9f\x17\x74\
+\x9d\xaa\x59\xb1\x7d\xf7\xe0\x19\x77\xad\xe6\xa0\x07\x68\xde\x06\
+\xb6\x6d\x6c\x0f\x24\xb9\x7e\x40\xd5\x31\x7f\x2b\x05\x79\x00\xd3\
+\x71\x25\xd5\x3f\x31\xf6\x28\x55\xe7\x82\x54\xd9\xfb\xca\x95\x14\
+\x7b\x14\xf3\xc0\x25\x1a\x4d\x18\xbb\x4d\x32\xdb\x9b\x66\x61\xc5\
+\xea\xff\xd0\x6e\xdd\x06\x79\x0a\x78\xd0\x31\xeb\xc9\xf6\x0c\x39\
+\xd4\x9e\x49\x8c\x3d\x8a\x7f\x2e\x30\x79\x28\xf0\xb9\xa0\x68\xfd\
+\xbe\x0c\x52\x65\x1c\xd0\xec\xf3\x53\xde\x1e\xd0\xec\xf3\x57\x5e\
+\x1e\xd0\xec\xd5\x51\xd6\x1e\xd0\xec\xd5\x53\x96\x1e\xa0\x8f\x4e\
+\x17\x3d\x60\x54\x35\x7b\x35\x94\x96\x07\x20\xaa\xf4\x5e\xcd\xad\
+\x8b\x7b\xdc\xcf\xc6\x82\x7d\x45\xb0\x3f\xa6\xd9\xab\xa1\x14\x3c\
+\x70\x5c\x78\xa0\x42\x3d\x40\x65\x0f\x9e\xe7\x3e\x2c\x5e\xb7\xa2\
+\xd9\xab\xa1\x20\x0f\xd8\xdc\x03\x51\xcf\x13\x22\xd3\x67\x6c\x3c\
+\x8f\xcd\xd6\x56\x99\x38\xef\x13\x71\x9f\xd1\x77\x42\xe6\xab\xd9\
+\x67\xa4\x04\xc6\x01\xfc\xfb\xbb\x36\x5f\x3f\xeb\x32\x47\xf9\x3c\
+\xb0\x1d\x1e\x97\x47\xe4\xab\xd9\x67\xac\x31\x3c\x80\xcf\x5f\x73\
+\xda\xd3\x5f\x74\xf8\x7a\xda\x0a\xe6\xeb\xf8\xd7\x29\xb2\xef\x69\
+\xd1\xf7\x89\xd3\xc3\x3c\x30\x94\xfd\xdc\x92\x91\x63\x2b\x95\x5b\
+\xb4\x6d\x23\x7a\xc0\xed\xf7\x9c\xfd\xc0\x5c\x4f\xd7\xa3\xb1\x7c\
+\x1d\xb6\x77\x8b\xe7\x01\x6b\x6b\x0f\xe8\x7e\x9f\xb3\x22\x8c\x03\
+\xf8\xb8\x6c\x75\x80\x65\x7b\xf0\xda\xb5\x23\xed\x21\x62\xf5\xcc\
+\x51\x1e\x58\xd1\xec\xd5\x50\x08\x0f\xac\xf8\xd9\x5b\x7c\x6f\x06\
+\x97\x7d\x6b\x31\xf8\x1a\xd6\x10\x0f\x5c\x15\xf9\x2d\x68\xf6\x6a\
+\x68\x88\x07\x8e\x0a\x56\x57\x83\xd8\xdb\xed\xe1\xd7\x42\x65\x0f\
+\x88\xc7\x9d\x10\x87\xbf\x79\x7a\x17\xdd\x0f\xab\xaa\xd9\xab\x21\
+\xd9\x03\xc0\xbf\xfa\xfb\x3e\x7b\x2f\xff\x34\xc4\x0e\x89\x21\x99\
+\x15\x9f\xf9\x47\x49\xf2\x40\x95\xad\x5b\xe7\xf3\x87\x66\xaf\x98\
+\x36\xaf\x23\xe2\xeb\xdd\x1c\x69\xcd\x4a\x58\xf6\x28\xc9\x03\xec\
+\xba\x00\xcd\x43\xb3\x57\x4f\xae\x07\x16\x9b\xc4\x5a\x9c\xc1\x3e\
+\x5f\x89\xcb\x1e\x45\xdf\x23\x62\xe0\x7b\x46\x47\x7f\xc6\x53\x52\
+\x94\x89\xcb\x4b\xcc\xf3\x18\xc3\xd4\x7f\xb5\xef\xd3\xff\xfa\x1b\
+\x0b\xfe\xf4\xbb\xf3\xeb\x3b\xfd\xe9\xb3\x4b\xab\x2f\xf8\xd3\x8f\
+\xb5\x6e\xdf\x35\xef\x25\x37\x4e\x5c\xb8\x59\x5f\xf2\xd2\xeb\x53\
+\x07\xdf\xab\xb6\xbc\xf4\xaa\xf1\xf0\xb9\xca\x2e\x2f\x7d\xeb\xc8\
+\xb6\x65\x72\xd2\x4b\xdf\x20\xf7\x4c\x91\xfd\x5e\xfa\x1a\xa9\x4f\
+\x11\x5f\x01\xce\x92\xfa\x09\x72\xaf\x97\xde\x47\xee\xba\x42\xbc\
+\x02\x6c\x9c\x20\xf7\xc1\x4b\xdc\x02\xac\xc3\x7f\xbe\x46\xbc\x02\
+\xac\x1a\x64\xff\x0d\xe2\x15\xe0\xd6\x11\x72\x92\x86\x77\xf8\xca\
+\x2e\xfa\x1a\xef\xf0\xd5\xd6\x3a\x2b\xc0\x4a\xbf\xff\x20\x3b\xfc\
+\xd2\x06\x2b\xc0\x8d\xf9\x8d\x93\xec\xf0\xf3\xfc\xc7\xf2\xd2\xfa\
+\x3d\x7d\xfe\x27\x56\x80\x3f\x36\xd6\x7e\xd7\xe7\xff\x95\x15\xe0\
+\x07\x8d\xb5\xa3\x7d\x9e\x35\x3d\xc8\xc6\x99\xc6\xda\x2f\xe6\xf9\
+\xa1\xe9\xcf\xf5\xe9\xc6\xda\x0b\x4b\xbc\x68\xf4\x55\xab\xcf\x37\
+\xd6\x9e\x6f\xf1\xa2\xd3\x5c\x6e\x57\x1a\x6b\x47\x2e\xf0\xaa\xd1\
+\xa3\xdc\xa4\xe9\x83\xfb\x78\xd5\xe1\xe1\x87\x34\xfd\x0d\xd1\x34\
+\xf0\xb2\x73\x34\xbd\x4d\x34\x1d\x64\xf3\x38\x4d\xdf\x2d\x6a\x06\
+\x87\x99\xa2\xe9\xba\xa8\x39\x14\xe0\x6d\x9a\xae\x89\x96\x81\x02\
+\x10\x9a\x26\xa2\xe5\xa0\x00\x22\xcd\x5b\x16\x0a\x20\xd2\xa2\xe5\
+\xf7\x61\xfa\x5e\xa4\x24\xd2\x3b\xb1\x19\x45\x7a\x3f\x36\xb3\x48\
+\x9f\x74\x31\xb0\x34\x82\x59\xc5\xb4\x00\x77\x1b\x5f\x7f\x81\xa7\
+\x6f\x62\xfa\x20\x4f\xbf\x87\xe9\x87\x79\xfa\x1c\xa6\xb7\xf1\xf4\
+\xe3\x98\xbe\x9b\xbb\xe4\x35\x4c\x7f\x86\x95\x7f\xdd\xab\xef\x92\
+\x38\xbc\x48\xf3\x02\xc0\xe1\x45\x9a\x17\xe0\xa6\x97\x66\x05\xb8\
+\xe5\xa5\x59\x05\xae\x78\xe9\xfb\x82\xd2\xd7\xfa\xae\x58\x83\xfc\
+\x8b\xfe\x7d\x7e\x83\xfe\x7d\x3b\x4d\xff\x87\xa6\xfb\x7d\x9a\xfe\
+\x7c\xbf\x04\x92\xeb\x23\xd7\x57\x6e\x8f\x51\xed\x27\xb7\xb7\xcc\
+\x43\xe6\x25\xf3\x94\x79\xcb\x7e\x90\xfd\xb2\xc9\x4f\xb2\xdf\x64\
+\x3f\xca\x7e\x95\xfd\x2c\xfb\x5d\xee\x0f\x72\x7f\x91\xfb\x93\xd4\
+\xdf\xe4\xfe\x28\xf7\x57\xb9\x3f\xcb\xfd\x5d\x1e\x0f\xe4\xf1\x42\
+\x1e\x4f\xa4\xf1\x46\x1e\x8f\xe4\xf1\x4a\x1e\xcf\xe4\xf1\x4e\x1e\
+\x0f\xe5\xf1\x52\x1e\x4f\xa5\xf1\x56\x1e\x8f\xe5\xf1\x5a\x1e\xcf\
+\xe5\xf1\x5e\x9e\x0f\xe4\xf9\x42\x9e\x4f\xe4\xf9\x46\x9e\x8f\xe4\
+\xf9\x4a\x9e\xcf\xe4\xf9\x4e\x9e\x0f\xe5\xf9\x52\x9e\x4f\xe5\xf9\
+\x56\x9e\x8f\xe5\xf9\x5a\x9e\xcf\xe5\xf9\xfe\xff\xba\x75\xa6\x9d\
+\
+\x00\x00\x43\x99\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x9d\x05\x7c\x14\x57\xd7\xc6\x37\xee\xbe\
+\x71\xd9\x8d\xbb\x3b\x01\x92\x10\x5c\x82\xbb\x04\x82\x3b\xc5\xdd\
+\x09\x12\xdc\x5d\x8a\x14\x4a\x71\x77\xf7\x02\x85\xb6\x40\x5b\x28\
+\xd0\x16\x2d\x45\x5a\xa8\xbd\x6d\x9f\xef\x9c\x91\x30\xd9\x2c\xde\
+\xc2\xdb\xf7\xcb\xe5\xf7\x67\x76\x66\x77\x67\x67\xee\x73\xce\xb9\
+\xe7\xdc\x99\xec\xaa\x54\x06\xf4\x6f\xe8\x50\x15\xfd\xaf\x55\x85\
+\x98\x1b\xa8\x5c\x54\x2a\x55\x08\x41\x9b\x78\xa3\xb0\x5d\x68\xf4\
+\x5c\x71\x2b\x6e\xc5\xad\xb8\x15\xb7\xe2\x56\xdc\x8a\x5b\x71\xfb\
+\xe7\x1b\x00\x23\xa2\x36\x31\x96\xd8\x4d\x3c\x40\xd1\xf6\x84\x38\
+\x4c\x4c\x21\x9a\x11\x56\xef\xfa\xb8\x8b\xdb\x9b\x37\xd2\x31\x84\
+\x38\xa1\x47\xef\x17\xb5\xcb\x44\xda\xbb\x3e\xfe\xe2\xf6\xfa\x8d\
+\xf4\x7b\x8f\xf8\xe5\x35\xb4\x97\xdb\x9f\xc4\x18\xc2\xf4\x5d\x9f\
+\x4b\x71\x7b\xb5\x46\x9a\xb5\x7f\x03\xdd\x75\xdb\x94\x77\x7d\x3e\
+\xc5\xed\xe5\x1b\xe9\xe5\x4f\x3c\xd6\x15\x71\xf1\xe5\xdd\x68\xb8\
+\x77\x30\x62\xdf\x2f\x07\xa3\x51\x26\x50\x8d\x54\xc1\x20\xcf\x10\
+\x96\xf9\xd6\xe8\xbd\xad\x0f\x86\x6f\x19\x81\xf9\x47\x17\xe2\xf7\
+\xff\xfc\xae\xfb\xd6\xbf\x88\x52\xef\xfa\xbc\x8a\xdb\x8b\x1b\xe9\
+\x64\x48\x1c\x54\x8a\xf7\xe3\xaf\x3f\xa2\xf6\xf6\x61\x88\xd8\x94\
+\x8f\xd0\x15\xed\xa0\x9d\x53\x16\x66\x23\x6c\x61\x30\xc4\x00\x06\
+\x43\x8d\x60\x36\xca\x12\xa3\xb7\x8d\x41\xf3\xc5\xb9\xc8\x98\x9c\
+\x85\x1a\x0b\xea\xe0\xfa\x83\xeb\xba\x36\xf0\x15\x61\xf9\xae\xcf\
+\xaf\xb8\x3d\xbf\x91\x46\x65\x74\x85\x6b\xbc\xba\x13\x42\xe6\xb7\
+\x46\xd8\xaa\x3c\x84\x2d\xef\x8b\xc0\x39\xf5\x60\x32\xc0\x1a\x06\
+\xfd\x0c\x61\x38\xc0\x08\x46\x83\x4c\x30\x68\xdd\x60\x34\x9b\x97\
+\x83\xf4\xfc\x4c\x04\x0e\x0f\x41\xd6\x9c\x8a\xf8\xf3\xaf\x3f\x75\
+\x77\xd5\xe6\x5d\x9f\x5f\x71\x7b\x7e\x23\x8d\x7a\x2b\x05\x5b\xf7\
+\xc9\x3a\x38\x0f\x08\x85\x6f\x7e\x15\x04\xcf\xe9\x88\x90\x65\x79\
+\x08\x99\xd7\x16\xc6\xbd\x4c\x61\xdc\xdb\x18\x26\xfd\xcd\xc8\x16\
+\xcc\xd1\x6d\x45\x77\x34\x9e\xd9\x04\xa5\x46\x67\x20\x60\x70\x08\
+\xd4\x83\xdd\x31\xe3\xc4\x6c\x5d\xfd\x17\xbe\xeb\xf3\x2b\x6e\xcf\
+\x6f\xa4\xd1\x2a\xa5\x60\xf5\xe7\xd6\x87\x75\x17\x57\xb8\x0f\x4a\
+\x84\xdf\xf8\x3a\x08\x9d\xd3\x1a\xea\x71\x01\x30\x1f\x65\x4e\x71\
+\xdf\x0c\xe6\xa3\xcd\x05\xbc\xc7\x7b\xa3\xe2\x94\x4a\x28\x39\x32\
+\x03\xfe\x03\x82\xa1\x1e\xe0\x81\xb2\x8b\x2a\xeb\xea\x7f\xee\x5d\
+\x9f\x5f\x71\x7b\x7e\x93\xc6\xe9\x82\x16\xd2\x3f\x0c\x86\x2d\x8d\
+\x61\xdd\xd9\x0d\x5e\x83\x92\xe0\x35\x39\x0c\x06\x63\x0c\xa0\x1a\
+\xa7\x82\x2a\x9f\x18\xcf\x18\x08\x4b\xcf\x69\x9e\x88\x1b\x95\x04\
+\xcf\x01\x5a\xd8\x0f\x72\x85\xcb\x58\x1f\x4a\xfc\xfe\x52\xee\xee\
+\x3f\x84\xf9\xbb\x3e\xc7\xe2\xf6\xec\x46\xfa\xdc\x56\x0a\xe6\xd0\
+\xd6\x01\xaa\xa6\xa4\x71\x73\x15\xec\x3a\xd9\xc1\x6d\xba\x3b\x8c\
+\x26\x99\xc0\x78\x8a\x39\x4c\xa7\x5a\xc1\x6c\xba\x0d\x61\x2b\xe0\
+\x36\xcf\x1b\x1e\x79\x1a\x98\x0f\xb6\x85\xc5\x30\x7b\x58\x8e\x72\
+\xc4\x83\x5f\x8a\x4c\x15\xda\xbf\xeb\x73\x2c\x6e\xcf\x6e\xba\xfa\
+\xdb\xb7\xb1\x87\xaa\x09\xe9\xdf\x4c\x05\xe7\x2e\xce\xf0\x9b\x1f\
+\x04\xf3\x19\xf6\xb0\x9a\xed\x0c\x9b\x79\xee\xb0\x5b\xe0\x0d\xfb\
+\x45\x1a\x38\x2c\xd2\x22\xf0\x83\x38\xf8\x8d\x0d\x81\xd9\x20\x3b\
+\x58\x0c\x75\x80\xe5\x08\x35\xee\x17\xeb\xff\xaf\x6a\x45\xf4\x6f\
+\x45\xfa\x37\x16\xf5\xf7\xec\xe6\x89\xc8\xa5\x89\xa4\xb9\x17\x1c\
+\x17\xfb\x41\xbd\x34\x18\xae\x2b\x22\xe0\xbe\x32\x1a\x1e\x1f\xc6\
+\x21\x6e\x53\x45\x84\x4c\x88\x86\xf9\x40\x7b\x58\x0c\x71\x84\xe5\
+\xf0\x62\xfd\xff\x6d\x4d\x57\x7f\xbb\x56\x76\xa2\xfe\x4d\x0d\xa0\
+\xed\xae\x45\xf2\x87\x65\x48\xf7\x20\xb8\x7e\x10\x09\xcf\xd5\xf1\
+\xf0\x59\x57\x02\x7e\x9b\x28\xe7\xdf\x52\x0e\x99\xfb\x9b\x21\x66\
+\x4a\x32\x2c\x06\x90\xef\x0f\x71\x82\xd5\x30\xe7\x62\xfd\xff\x65\
+\xed\x59\xfa\x1b\x90\xfe\x81\xbd\x83\x90\xb1\x21\x1b\x6e\x2b\xa3\
+\xe0\xf5\x51\x12\x7c\x37\x94\x46\xe0\xd6\xf2\x08\xdb\x95\x8d\xa8\
+\xfd\xf5\x50\xe3\xe3\x1e\x48\x9e\x9e\x4e\xfa\x3b\xc2\x6a\x90\x1a\
+\xd6\xc3\x5c\x8a\xf5\xff\x2f\x6c\xa4\x81\x09\xeb\xf0\x0c\xee\x14\
+\xd5\xdf\x80\xf4\x37\x44\x58\xbf\x08\x54\xda\xda\x90\xb4\x4f\x84\
+\xb6\x40\xfb\xea\x88\x3a\x50\x1f\xf1\x47\x9b\xa3\xd1\x67\xc3\x91\
+\x3e\xbb\x3c\x2c\xfb\xb3\xfe\xce\xa4\xbf\x2b\x7e\xf8\xf9\xbe\xae\
+\xfe\x9a\x67\x7c\x6e\x71\x5d\xf0\x0f\x35\x88\xd7\xef\x1b\x12\x33\
+\x89\x93\xc4\xaf\xba\xa2\x3c\xab\xd9\xb5\xb6\x83\x41\x13\xd2\xbf\
+\x99\x11\x62\x06\xc5\xa0\xe6\xce\x5c\x68\x28\xe6\xfb\x6f\xce\x42\
+\xc8\x8e\x2a\x88\xd8\x5b\x1b\x31\x87\x1a\x23\xf1\x78\x4b\x34\xfd\
+\x7c\x14\xca\xce\xad\x06\xcb\x01\x6a\xd2\xdf\x05\xd6\x43\xdd\xf4\
+\xe9\xff\xac\xc6\xb5\xe1\x39\x62\x21\xd1\x06\xc5\x73\xc5\x7f\x4b\
+\xa3\x7e\x0c\x27\x4e\xbd\xac\x08\xba\x8d\xf3\x7f\xf6\x7d\x83\x1c\
+\x23\x24\x0c\x4d\x44\x83\x3d\xed\xc9\xf7\x4b\x91\xef\x97\x43\xe8\
+\xce\x6a\x88\xdc\x57\x07\xb1\xa4\x7f\xc2\xb1\x16\x68\xfe\xd9\x28\
+\x54\x5e\x50\x9b\xfc\x9f\x62\xff\x60\x17\xd8\x0c\x7b\x25\xfd\x75\
+\x1b\xcf\x43\x14\x5f\x33\x7a\x83\x46\xfd\xd7\x07\xaf\xe0\xeb\x7a\
+\xf5\xa7\xfa\x9f\x7d\xdf\x30\xc7\x18\xa9\x23\xd2\x90\x73\xa0\x1b\
+\x7c\x37\xa6\x0b\xb1\x9f\xf5\x67\xff\x8f\x3e\xd8\x10\x71\x87\x9b\
+\x21\xf7\xd3\x3c\xd4\x58\xd2\x00\x56\x03\x28\xf6\x0f\x72\x85\xed\
+\x30\x8f\x37\xd1\x9f\x1b\x4f\x1e\xf1\xfd\x44\x2f\x7b\xff\x80\x81\
+\x02\xc3\xff\xcf\xfc\xf1\xc7\x1f\x2d\x9f\xd7\xb1\xf7\x7e\xba\x87\
+\xbb\x3f\xde\x15\x79\x24\xf1\x63\x51\xec\xdb\x3b\x08\xbe\x6f\xd8\
+\xc2\x04\xa5\xc7\x64\xa0\xd5\xa1\x5e\x92\xfe\xe5\x28\xfe\x57\x45\
+\xf8\x9e\x9a\x42\xee\x17\x43\x36\xd0\xfa\xfc\x48\xd4\x5f\x9e\x03\
+\xeb\x01\xae\xb0\x19\xec\x4e\xfa\x7b\xe2\xca\xfd\xab\x82\x0d\xdc\
+\xff\xe5\x61\x01\x0f\x7e\x7d\xca\xc3\xdf\x1e\xe1\xd1\x6f\x3f\xea\
+\xce\x13\xea\xb6\x31\x2f\xa9\x3d\x9f\xbb\x31\x61\x42\x98\xfe\x7f\
+\xe5\xcb\x2f\xbf\xe4\xeb\xf7\x8f\x74\x3b\x71\xe9\xa9\xa5\xc8\x98\
+\x98\x01\xfb\x8e\xf6\xe2\x9c\x1e\xd7\x75\x0d\x75\x68\x24\x6d\xe7\
+\x31\xbf\xa9\x38\xee\x1b\x36\x37\x86\x51\xae\x09\xb2\xf2\xcb\xa1\
+\xe3\xd1\xfe\x42\xee\x17\xb0\xa5\x2c\x82\xb7\x57\x42\x28\xe5\xfe\
+\xe1\x7b\x6a\xd1\x38\x50\x17\x6d\xcf\x8d\x44\xd3\x95\xad\x61\x33\
+\xd0\x0d\xb6\x43\x3c\x60\x47\xfa\xdb\x8f\xf2\x81\xc3\x18\x2d\x1c\
+\xc7\xf9\x43\x3d\x31\x10\xce\x53\x82\xe1\x32\x3d\x14\xae\xb3\x22\
+\xe1\x36\x37\x1a\x9e\x0b\xe3\xe0\xb5\x24\x11\x61\xab\xb3\xd0\x70\
+\x7f\x67\x2c\xff\x7a\x83\x3e\x5b\xe0\x0b\x89\xcf\xbb\x97\x8c\x75\
+\x37\x92\xce\xdf\x82\xb0\x26\x6c\x08\x3b\x09\xfb\xff\x2f\xd8\xd9\
+\xd9\x39\xfc\xf6\xdb\x6f\x85\xae\xdf\x3f\xfe\xed\x31\x6a\x2d\xae\
+\x05\x55\x47\xd2\xb5\x0d\x91\x4b\xe4\xa8\x44\x1b\x68\x22\xe9\xdd\
+\x58\x7a\xdc\x44\xdc\x6e\xd0\x8c\xb4\xcf\x31\x24\xed\x49\x7f\xd2\
+\xde\xa8\xa5\x29\x2a\x4e\xaa\x82\x6e\xc7\x87\x40\xb3\xbe\x24\xd5\
+\xfc\x99\xc2\x18\x10\xbc\xa3\xb2\x60\x03\x61\xbb\x6b\xa0\xfd\x27\
+\x23\xd0\xea\xa3\x4e\xb0\x19\x44\xfa\x0f\x25\xfd\x87\x7b\xc3\x3e\
+\x4f\x43\xfa\xfb\xc2\x29\x9f\xf4\x9f\x14\x44\xfa\x93\xf6\xd3\xc3\
+\xe1\x36\x3b\x12\xee\xf3\x62\xe0\xb1\x28\x1e\xde\xef\x27\xc3\x67\
+\x45\x2a\xb4\x1f\x96\x82\xdf\x9a\x0c\x34\x3c\xfc\x1e\x6e\xff\xf2\
+\xbd\xae\x0d\xf0\xfd\x84\xfa\xee\x29\x35\x90\xb4\x37\x93\x74\x77\
+\x24\x5c\x09\x4f\xc2\x9b\xf0\x21\x34\xff\x5f\x58\xbf\x7e\x7d\xb6\
+\x6e\xc7\xb5\x59\xdf\x06\xaa\x1e\xa4\x6b\x27\xa2\x2d\xd1\x92\x68\
+\x21\xd9\x40\x33\xc9\x0e\x64\x78\x5d\xd2\xde\xa0\x05\xc7\x7d\xf2\
+\xfd\x96\xa4\x7f\x6b\x33\x54\x9f\x5e\x0b\xbd\x4f\x8c\x84\xcf\xda\
+\x54\xa1\xf6\xf7\xdf\x5c\x46\xb4\x01\x8a\x03\x5c\x0b\x74\x3c\x3b\
+\x02\x1d\xd7\x77\x27\xfd\x39\xf6\x7b\xc1\x6e\x84\x0f\xe9\x4f\xbe\
+\x3f\xd6\x0f\x4e\xe3\x03\xe0\x3c\x89\x7c\x7f\x6a\x18\x5c\x67\x44\
+\x90\xfe\x51\xf0\x98\x1f\x0b\xcf\x45\x89\xf0\x21\xfd\x35\x1f\xa4\
+\xc1\xf7\xc3\x74\xf8\xaf\xcd\x44\xc0\xc6\x72\x68\x7a\xbc\x8f\xbe\
+\x38\xd0\x4c\x8f\xfe\xec\xfb\xa6\x92\xf6\xce\x92\xde\x41\x44\x24\
+\x11\x43\xc4\x11\xf1\x0a\x12\xfe\x97\x39\x76\xec\xd8\x58\x65\x87\
+\x1d\xb8\x76\x00\xaa\xfe\x2a\x51\xff\x2e\x2a\x58\x76\xb5\x44\xd9\
+\x49\x65\xd1\x6e\x69\x3b\x74\x58\xd6\xa1\x10\xed\x97\xb6\xa7\x65\
+\x47\x74\x14\xe8\x84\x8e\xcb\x69\xb9\xa2\x33\x3a\x10\x1d\x3f\xe8\
+\x82\x91\xdb\x46\x63\xc0\xa9\x31\xf0\x5a\x93\x44\x35\x20\xe9\xb5\
+\x91\x6c\x60\x53\x19\x61\x2c\x60\x3b\xe8\x7c\x66\x04\x26\x1f\x9d\
+\x85\xf7\x36\xf7\xc7\x7b\x5b\xfb\xa1\xfb\xf6\x81\xe8\xb1\x83\xd8\
+\x39\x18\xdd\x77\x0f\x46\xcf\x3d\x43\xd0\x73\xef\x10\xf4\xda\x3f\
+\x0c\xbd\x0e\x0e\x47\xef\xc3\x23\xd1\xfb\xc8\x28\xf4\x3e\x9a\x87\
+\xe6\xfb\x7b\x22\x7a\x5d\x15\xd2\x3f\x0b\x81\x1b\x2b\x20\x78\x6b\
+\x65\x7c\xf8\xed\x0e\x5d\xfd\xf5\xdd\x47\xc8\xe3\x3d\xc7\x7c\x47\
+\x49\xfb\x70\x22\x85\xc8\x20\xca\x13\x95\x88\xca\xff\x5f\xa0\xb1\
+\x7f\x8f\xb2\xc3\x7a\xee\xe8\x29\xea\xdf\x53\x05\xa3\x6e\x46\x98\
+\xb4\x6f\x12\xa6\x1f\x9d\x8e\x16\xeb\x5b\xa0\xc9\xba\x26\x68\xbc\
+\xa1\x31\x9a\x6c\x6e\x82\x26\x5b\x9a\xa0\xe9\xb6\x1c\xe4\xec\xc8\
+\x45\xee\xae\x36\x68\xb7\xaf\x33\x5a\xed\xed\x84\x36\xfb\xbb\xa2\
+\xed\xc1\xf7\xd0\xee\x70\x0f\xb4\x3b\xd2\x1b\xa9\x9b\xab\x0a\xf3\
+\xbe\xde\x6b\x92\x85\x79\x00\xae\x05\x39\x1f\xe4\x39\xe0\xf8\x1d\
+\x35\xd0\x95\x6c\xa0\xcb\xe9\xe1\xe8\xfa\xf1\x30\x74\x3e\x35\x04\
+\x1d\x4f\x0c\x44\x87\x63\x7d\xe9\xbd\xbd\xd0\x86\xf6\xd3\x72\x5f\
+\x27\x34\xdf\xdd\x16\x4d\x77\xd0\xe7\x6f\x6b\x86\x86\x9b\x1b\xa2\
+\xf1\xc6\xc6\x18\x73\x2c\x1f\x8b\x2f\x7e\x88\xd8\xcd\xd5\x11\xc4\
+\xd7\x11\xb6\x56\x41\xbb\xb3\xc3\x75\xf5\x3f\xac\x47\x7f\xce\xf5\
+\xd8\xf7\x39\xe6\x07\x13\xc9\x44\x05\xa2\x16\xd1\x90\x68\x4a\x34\
+\x53\x90\xf3\xbf\xcc\xdd\xbb\x77\xbf\x51\x76\x58\xe6\xe2\x4c\xa8\
+\x06\x90\xfe\xbd\x54\x48\x9d\x9c\x8a\x35\x9f\xad\x85\xff\xb4\x20\
+\x78\x4f\xd3\xc2\x77\x4e\x20\x82\x16\x86\x21\x7c\x59\x34\x62\x56\
+\x26\x22\x79\x4d\x69\x94\xdc\x54\x0e\x59\x5b\xab\xa1\xca\xae\xfa\
+\xa8\xbb\x37\x07\xf5\xf6\xe7\xa2\xde\x81\x96\xa8\x7f\xa0\x0d\x1a\
+\x1c\x6c\x8b\x06\x87\xda\xa3\xf1\xd1\xce\x68\x7b\xb2\x0f\x5a\x1f\
+\xef\x8d\x7a\x87\x3a\x20\x79\x7b\x36\xe5\x04\x69\x22\x14\x17\x78\
+\x7c\x60\xfb\xf0\x5c\x9d\x00\xf7\x55\x31\xc2\x35\x22\xbe\x66\xe0\
+\xb0\xd8\x17\xb6\xf3\x3d\x60\x39\xcb\x09\xa6\xd3\x6c\x60\x34\xd9\
+\x4c\xbc\x7f\x60\x0c\xe5\x1b\x23\x0c\x30\xed\xd4\x4c\xb4\x3f\x31\
+\x14\xc1\x9b\x2a\x23\x64\x5b\x55\xa4\x1f\x68\xa1\xab\xff\x13\x3d\
+\xfa\x73\xec\xe7\x5c\x8f\xc7\x7b\x8e\xf9\x19\x92\xf6\xcd\x89\xb6\
+\x44\x27\xa2\xb3\x82\x2e\xff\xcb\xfc\xf0\xc3\x0f\x85\xe6\x6f\x83\
+\xa7\x05\x8b\xfa\xf7\x56\xa1\xd1\xb2\x46\x58\xfa\xf9\x0a\xa4\xaf\
+\xae\x80\xf4\x8f\x88\xb5\xc4\x3a\x62\x03\x41\x31\x37\x63\x73\x45\
+\x64\x6e\xa9\x8c\x32\xdb\xaa\x21\x6b\x7b\x75\x94\xdb\x51\x0b\xe5\
+\x77\xd5\x41\x85\xdd\xf5\x50\x69\x4f\x43\x54\xde\xd7\x18\x55\xf6\
+\x37\x41\x95\x03\xcd\x50\xf5\x60\x0e\xaa\x1d\x6a\x81\xfa\x47\x3b\
+\xa2\xeb\xd9\x21\x18\x70\x3e\x1f\xbd\x3f\xc9\x43\xf7\x33\xc3\xd1\
+\xe5\xd4\x60\x64\xee\xa8\x23\x5c\x17\x64\xed\x9d\x97\x85\xc0\x71\
+\x89\x3f\xec\x17\xfa\xc0\x7a\xae\x1b\x2c\x66\x3a\x90\xfe\x56\x30\
+\x9a\x64\x2a\xea\x3f\x9a\x18\xa1\x42\xd7\xad\x5d\x31\xe2\xd3\x99\
+\x08\xd9\x5c\x05\xa1\x64\x53\x11\xbb\x6b\xea\xea\x8f\x67\xe8\xcf\
+\x39\x3e\xe7\x7a\xb1\x44\x39\x95\xe8\xf7\xac\x7d\xb7\xc9\x93\x27\
+\xaf\x22\x3e\x94\x99\x34\x69\xd2\xea\xff\x65\x7e\xfa\xe9\xa7\x1f\
+\x0b\xe9\x3f\x9d\xf4\x1f\x48\xfd\xdb\x47\x85\x9c\x0f\x72\xb0\xea\
+\xd2\x1a\x94\x59\x53\x05\x65\xd6\x12\xeb\x89\x0d\xc4\x26\x62\x4b\
+\x15\xf2\xfb\xaa\x28\xbb\x2d\x1b\xe5\xb6\xd7\x40\x79\xd2\xbe\x02\
+\x69\x5f\x51\xd0\xbe\x01\x69\xdf\x48\xd0\xbe\x2a\x69\x5f\x8d\xb4\
+\xcf\x3e\xd8\x02\xd9\x87\x72\x51\x9d\x39\xdc\xb2\x10\x75\x8e\xb4\
+\x41\xaf\x4f\x46\x22\xef\xf3\x69\x18\x78\x76\x34\xea\xef\x6b\x05\
+\x8f\xa5\xa1\xe4\xfb\x9e\xc2\x7d\x03\xe6\x33\xec\x60\x32\xd5\x12\
+\x86\x13\x8d\xc5\x7b\x88\x24\xfd\x79\xac\x1a\xfb\xf9\x7c\x84\x6e\
+\xa9\x8a\xb0\x1d\xd5\x11\xb9\xa7\xf6\xab\xe8\xcf\x63\x3f\xe7\x7a\
+\x15\x55\x62\xcc\xef\x48\xf4\x2c\xb2\x83\xff\x67\x2d\x78\x06\xe9\
+\x3f\x98\xfa\xb7\x9f\x8a\x6a\xb3\x56\xd8\x70\x79\x33\xca\xaf\xaf\
+\x8e\xf2\x1b\x89\x4d\xc4\x16\x62\x2b\xb1\x8d\x20\xdd\x2b\x90\xee\
+\x15\x77\xd6\x41\xa5\x5d\x75\x51\x79\x4f\x7d\x54\xd9\xdb\x10\x55\
+\xc9\xef\xab\xed\x6f\x8a\xec\x03\x39\xa8\x7e\xb0\x39\x6a\x90\xdf\
+\xd7\x38\x9c\x4b\xb4\x44\xcd\x23\xad\x24\x5a\x4b\xb4\x42\x0d\x86\
+\x9e\xab\xc1\xb6\x41\x76\xd2\xf2\x78\x77\x8c\x3c\x3f\x01\x03\x4f\
+\x8f\x42\xd3\x3d\xad\x61\x3b\xd3\x59\xb8\x7f\xc8\x60\x82\x91\x78\
+\x1f\x59\x1e\x31\x5c\x85\xfe\xbb\xfb\x63\xc2\xc5\xc5\x08\xa5\xf1\
+\x27\x7c\x67\x4d\xd2\xbf\x4e\x91\xf3\x79\x81\xfe\x9c\xdf\x73\xbe\
+\xd7\x4c\x8a\xf5\xbd\xf5\x74\xc9\xff\xab\x16\x32\x33\x04\xaa\x21\
+\x2a\x61\x0c\x68\xb7\xae\x1d\xf6\x7f\x7b\x08\x95\x36\xd5\x46\xa5\
+\xcd\xc4\x16\x62\x1b\xb1\x9d\xd8\x41\xec\xac\x8d\xca\xa4\x7b\x95\
+\xdd\xf5\x51\x95\x7c\xbe\xea\xde\x46\xa8\xb6\xaf\x09\xb2\x49\xfb\
+\xea\xa4\x7d\x0d\x41\xfb\x5c\xd4\x3c\xd4\x12\xb5\x0e\xb7\x42\x2d\
+\xd2\x9b\xa9\x4d\xfe\xae\x44\xd8\x4e\xcf\xd7\x94\x6c\x80\xdf\x57\
+\x9d\xe2\x06\xef\xa7\xc9\xe1\x76\x18\x79\x6e\x3c\x3a\x1f\xec\x0e\
+\xe7\x99\x2e\x50\x8d\xa5\x63\x1b\x45\x0c\x53\x61\xf8\xbe\xe1\x98\
+\xfa\xc5\x32\x84\x6d\xab\x41\xb1\xbf\x16\xa2\xf6\xd6\x2b\x72\x3e\
+\xc5\xfa\xbf\x5a\xcb\x5e\x99\x0d\xbb\x31\x76\x88\x9c\x1e\x89\xbe\
+\xdb\xfb\xe2\xd6\xe3\xdb\x94\x83\x77\x46\xd5\xad\xa4\xef\x76\x89\
+\x9d\xc4\x2e\x62\x77\x03\x54\xa3\x71\x3e\x7b\x6f\x63\x54\x27\xdd\
+\xab\x93\x5e\x35\xf6\xe7\xa0\xe6\x81\xe6\xa8\x79\x30\x17\xb5\x24\
+\xdd\x6b\x1f\x6e\x2d\xc4\xf8\x3a\x47\xda\xa2\xce\xd1\xb6\xa8\x7b\
+\xb4\x5d\x01\xbc\x2e\x6c\x67\x5b\x38\x2c\xda\x01\xbf\xaf\x26\xc5\
+\x01\xde\x17\xef\x33\x9b\xf6\x5d\x6b\x5f\x33\x0c\x3a\x3d\x12\xdd\
+\x0f\xf6\x46\xe8\x9c\x50\x58\x8f\xb6\xc6\xc9\x1b\xa7\xf0\xfe\xd7\
+\x1b\xc8\x7e\xba\xa3\x14\xe5\x7e\xd5\x4e\x74\xd3\x3d\x9d\x07\x6f\
+\xaa\xff\x6f\xbf\xfd\x86\x9f\x7f\xfe\xb9\x80\x5f\x7e\x61\x7e\x11\
+\xf8\xf5\x57\xe6\x57\x81\xdf\x7e\xfb\x55\x78\xad\x2e\xbf\xff\xce\
+\xfc\x2e\xf0\x9f\xff\xfc\xe7\x85\xfc\xf1\xc7\x1f\x7a\xf9\xf3\xcf\
+\x3f\xf5\xf2\xd7\x5f\x7f\xbd\x12\xdc\xe4\xc7\xfc\x7e\xdd\x36\xf8\
+\xc0\x60\x04\xce\x08\x44\xf9\xf7\xcb\xa3\xed\xfa\xb6\xf8\xe2\xde\
+\x97\xb8\xf7\xf3\x3d\x9c\xba\x73\x06\xc7\x6f\x9f\xc2\xb1\x3b\xcc\
+\x49\x1c\xbd\x73\x02\x47\x88\xc3\x77\x8e\x17\x70\x48\xe0\x18\x0e\
+\x4a\xec\xbf\x7d\x14\x79\x17\xa6\xa2\x1e\xe9\x5c\xef\x58\x7b\x81\
+\xfa\xcc\xf1\x0e\x02\x7d\xce\xe7\x61\xff\x9d\xa3\xf4\x5a\x7a\xff\
+\x5d\xda\xd7\xdd\x93\x38\xf6\xfd\xc7\x38\x7e\xef\x0c\x4e\xde\x3b\
+\x8b\x53\xc4\xe9\x1f\xce\xe1\xcc\x0f\xe7\x71\xee\xfe\x67\xf8\xf4\
+\xfe\x05\x7c\xfe\xe0\x12\xbe\x79\xfc\x9d\x60\x97\xd7\x7f\xfc\x0e\
+\x79\x9f\xcd\x45\xdb\x8f\x87\xa3\xfa\xf1\x6e\xe8\x77\x71\xba\xee\
+\xe9\xec\xd6\xa3\x3f\xcf\xfb\xf1\xdc\x27\xcf\x7f\xf1\x1c\x08\xd7\
+\xc1\x5c\x0b\x71\x3e\xdc\x47\x77\x07\x3f\xfe\xf8\x23\x38\x45\x12\
+\xf9\x09\x8f\x1f\xcb\x3c\xc6\x93\x27\xcc\x13\x81\x9f\x7f\x7e\xf2\
+\x12\x36\xa2\xb4\x8b\xdf\xf5\xf2\x4f\xdb\x85\xac\x3f\xbf\x86\xdf\
+\x2f\x6f\x93\xdb\xa7\x77\x3f\x45\xe9\x25\xa5\xd1\x68\x4d\x23\x61\
+\x7c\x1d\xb4\x7b\x10\x46\xed\x1b\x85\x41\x3b\x07\x61\xd0\x8e\xc1\
+\x18\xb2\x63\x08\x31\x94\x18\x86\xa1\x02\xc3\x31\x6c\xc7\x08\x89\
+\x91\x18\xb6\x73\x14\x86\xef\xcc\xc3\x88\x5d\xa3\xb1\xf3\x8b\xdd\
+\x82\xa6\xf5\x8f\x75\x40\x83\xe3\x1d\x25\x3a\x15\xb0\xf6\xbb\xed\
+\x38\x7d\xeb\x1c\x46\x1f\x9e\x8c\xd1\x47\xa6\x60\xf4\xd1\xa9\x18\
+\x73\x7c\x1a\xc6\x9c\x98\x86\xb1\x27\x67\x62\xdc\xc7\xb3\x90\x7f\
+\x7a\x36\xc6\x9f\x9d\x8b\x09\xe7\xe6\x63\xc2\xf9\x05\x98\xf8\xd9\
+\x42\x4c\xf8\x6c\x11\xa6\x5c\x58\x8a\xfc\x4f\x17\x60\x12\x2d\xfb\
+\x9e\x9f\x8a\x16\x67\x86\xe0\xe0\x0f\x67\x75\xe5\x1b\x5b\xac\xff\
+\xf3\xf5\xd7\x17\x03\xe6\x7f\x32\x1f\x5d\xb6\x77\xc1\x98\xc3\x63\
+\xd0\x6e\x63\x3b\x54\x58\x52\x01\x86\x03\x0c\xc5\xbf\xdf\xea\x6b\
+\x04\xc3\x3e\xc6\x84\x29\x8c\xfa\x98\xc1\xb8\xb7\x39\x4c\xfa\x58\
+\xc2\x54\xc0\x1a\x66\x7d\x6d\x61\xde\xcf\x1e\x16\xfd\x1d\x31\x66\
+\xdf\x78\x9c\x20\x1f\x6e\x74\xa2\x33\xd1\x05\x8d\x99\x93\x5d\x0b\
+\xd8\x74\x73\x37\x36\x7e\xb9\x1d\xea\x89\xc1\x70\x9e\x1c\x06\xd7\
+\xa9\x11\x70\x9b\x11\x05\xf7\xd9\xb1\xf0\x9c\x9b\x00\xaf\x05\x49\
+\xd0\x2c\x4e\x85\x76\x69\x49\xf8\xad\x48\x87\xff\xaa\x32\x08\xf8\
+\xa8\x3c\x82\xd7\x55\x44\x83\x83\x3d\xd1\xef\xcc\x24\x4c\xff\xe2\
+\x03\x8c\xbb\xb4\x18\xf3\xae\xad\x2b\x72\x1e\xd4\x6a\x17\xeb\xaf\
+\x1f\x59\x7f\x46\xb7\xfd\xf1\xd7\x1f\xf8\xe0\xb3\x0f\xd0\x6b\x57\
+\x2f\xd4\xfe\xb0\x36\xe2\x67\xc7\xc3\x68\xb0\x31\x0c\x06\x90\xf6\
+\xfd\x8d\x60\xd4\xcf\x84\x20\xed\xfb\x9a\xc1\xa4\xaf\x05\x4c\xfb\
+\x5a\xc1\xb4\x9f\x15\xcc\xfa\x93\xf6\xfd\xed\xc4\xfb\x39\x07\x39\
+\x21\xff\xe0\x64\x9c\xb9\xff\x29\x9a\x9e\xea\xa6\xe0\xbd\x02\xb6\
+\xdd\xde\x8f\x1d\x5f\xef\x25\xed\x43\xe1\x32\x35\x1c\xae\x94\x73\
+\xb8\xcf\x8a\x81\xc7\x9c\x38\x78\xcd\x4f\x84\xf7\xa2\x14\x68\x97\
+\xa4\xc1\x77\x79\x69\xf8\xad\xcc\x44\xc0\xea\xb2\x08\x5c\x5b\x01\
+\x21\x54\x83\x56\xdb\xdf\x11\x1d\x4e\x8d\xc4\x48\xaa\xff\x36\xdd\
+\x3c\x80\x27\x7f\x14\xf9\xda\x01\xfe\x0e\x0a\xa3\xff\x75\xfd\x5f\
+\xd7\x06\x64\xfd\x79\xdf\xba\x63\x80\x1c\x23\xce\xdc\x3c\x83\x51\
+\x07\x47\xa1\xd2\xf2\x4a\x70\x1d\xe7\x06\x97\x31\x6e\x70\x1d\xed\
+\x2e\x92\xe7\x09\x37\x66\x94\x37\xdc\xf3\x34\x84\x16\x1e\xa3\x7d\
+\x61\x39\xd8\x51\xc0\x6a\x88\x33\xc6\x1f\x9a\x8c\xb3\x0f\x3e\x43\
+\xce\xc7\x3d\x90\x73\xba\x07\x9a\x9f\xee\x59\x88\x9d\x77\x0e\x61\
+\xe7\xd5\x7d\x70\x99\x42\xbe\x3f\x9d\x7c\x7f\x66\x34\x22\x96\x64\
+\x22\x6a\x69\x39\x44\xaf\xa8\x80\xd8\x55\x95\x11\xb7\xba\x1a\x12\
+\xd7\xd6\x40\xd2\xfa\xda\x48\xde\x54\x17\xa9\x5b\x1b\xa2\xe4\x8e\
+\x26\xc8\x39\x3e\x00\x33\x2f\xaf\xa2\xfd\x5f\xd2\xe7\xf7\x6c\x0c\
+\x21\x7a\xb4\x7f\x2d\xfd\x65\x1b\xd8\xb3\x67\x0f\xe2\xe2\xe2\x8a\
+\x10\x13\x13\x83\xa8\xa8\x28\x44\x46\x46\x22\x22\x22\x42\x80\xd7\
+\xf9\xb9\xc4\xc4\x64\x24\x97\x2c\x89\xd4\xf4\x32\x28\x51\xa6\x3c\
+\x92\xb3\x2a\x20\xae\x42\x36\xc2\x6a\x35\x87\x6f\xa3\x4e\xf0\x69\
+\xde\x15\xe1\x6d\x7b\x23\xa9\x57\x1e\xca\x8c\x9c\x82\xcc\xbc\x69\
+\xc4\x4c\xa4\x4d\x5e\x8a\xa4\xd9\xeb\x10\x3b\x79\x25\x22\xf2\x97\
+\x22\x64\xf0\x0c\x04\x77\x1f\x8b\xe0\x4e\x43\x10\xd6\xba\x37\xe2\
+\x1b\xb7\x43\x72\x76\x3d\x94\xaa\x5c\x1d\x29\x65\xa8\xbf\xe8\x73\
+\x82\xc3\xc3\x11\x14\x1a\x8a\xa8\xd8\x38\xa4\xa4\xa4\x20\x2d\x2d\
+\x4d\x80\x1f\x27\x25\x25\x21\x3e\x3e\x1e\xb1\xb1\xb1\x48\x4e\x4e\
+\x46\x49\x3a\x26\x7e\xae\x44\x89\x12\xc8\xce\xce\xc6\xed\xdb\xb7\
+\xf5\x74\xe3\xab\x37\xaf\x71\x01\xb0\x1c\xaa\x86\xd5\x30\x17\x4c\
+\x38\x32\x15\x9f\x3c\xb8\x80\x96\x67\xfa\xa2\xe5\xd9\xa2\xec\xf9\
+\xfe\x28\x76\x5d\xdb\x2f\x5e\xdf\x9d\x19\x05\x8f\xd9\x31\x78\xf0\
+\x6b\x91\xdb\x10\x5e\xa7\xbd\xf7\x0c\xed\xdf\x58\x7f\xee\x3f\xa5\
+\xde\xe1\xd4\xe7\x61\x61\x61\xc2\x32\x2a\x3a\x1a\x51\x71\x09\x88\
+\x4c\x48\x44\x64\x52\x2a\xe2\xd2\xd3\x11\x9b\x9e\x85\xa8\xd2\x59\
+\x08\x21\x82\xcb\x54\x84\x7f\xa5\xda\xd0\xd6\x6a\x0a\x9f\x06\x6d\
+\xe0\xdb\xaa\x07\xfc\x7a\x8c\x85\xef\x90\xb9\xf0\x1d\xb3\x14\x7e\
+\xf9\x2b\x11\x38\xf1\x43\x44\x2c\xda\x86\xd8\x25\xbb\x91\x30\x6b\
+\x03\xa2\xf2\xe6\x23\xb4\xdf\x24\xf8\xf5\x1c\x07\x97\x0e\x43\xe0\
+\xdc\xa8\x1b\x9c\x2a\x37\x81\x4b\x5a\x45\x78\xa6\xa4\xc3\x23\x2a\
+\x1e\x5e\x41\x61\x08\x0e\x8b\x10\x8e\x2d\x21\x21\x41\x38\xb6\xc0\
+\xc0\x40\xf8\xf9\xf9\x15\xc0\xeb\x41\x41\x41\x02\xc1\xc1\xc1\x08\
+\x09\x09\x29\x80\x8f\xbd\x7a\xf5\xea\xb8\x7f\xff\x8d\xee\xbd\x12\
+\x9a\x77\x7e\x10\xac\x46\x38\xc3\x7a\xa4\xab\xa0\xff\xb9\x87\x17\
+\xd1\xe6\xdc\x40\xbd\xec\xbf\x77\x82\xf4\x3f\x40\xda\x53\xdc\x27\
+\xed\x3d\xe7\xc6\xbf\xa9\xfe\xfc\x1d\x14\xed\x9f\xa3\xfd\xdf\xea\
+\xff\x89\x89\x89\x82\x2f\xb1\x0f\xc9\x3e\xc6\xb0\x06\x31\xa4\x45\
+\x78\x24\xd9\x03\xbd\x26\xa6\x24\xd9\x41\x56\x45\x44\x57\xa9\x85\
+\xa8\x9a\x8d\x10\x56\xa3\x31\x42\xb3\xeb\x23\xb4\x6a\x3d\x84\x54\
+\xab\x0b\xff\x72\xd5\xa0\x49\x2f\x0f\xaf\x52\xe5\xe0\x55\xba\x3c\
+\x3c\x4b\xd1\xe3\x32\xd9\xf0\xce\xaa\x0a\xbf\x92\x65\xa1\x4d\x2c\
+\x01\xbf\xb8\x24\xf8\xc7\x24\x22\x24\x29\x0d\xe1\xa9\x25\x11\x9b\
+\x52\x12\x09\x89\x49\xc2\x31\xc4\x12\x91\xd1\x31\x08\x0c\x0e\x85\
+\xd6\xd7\x0f\x1a\x5f\x5f\xf8\x05\x04\x08\x76\xc9\xb6\x1a\x4d\x76\
+\xc9\x1a\x07\x90\xd6\xbe\xfe\x01\xd0\x6a\x7d\xa1\xd1\x68\xe0\x4b\
+\xaf\x93\xf5\x67\x9b\xe1\x38\xb0\x66\xcd\x1a\x61\x0c\x7b\xdd\xa6\
+\xa1\x5c\xce\x3a\xcf\x05\x36\x79\x6e\x98\x78\x6c\x1a\xce\x3f\xba\
+\x84\x76\x9f\x0e\x41\xfb\x4f\x87\x8a\x7c\xf6\x94\x83\x3f\x9c\xc2\
+\x6e\xd2\xdf\x7d\x76\x34\x3c\xe6\xd2\x98\xbf\x20\xe1\x4d\xf4\xe7\
+\x7b\x58\xfc\x5f\xa0\xfd\x1b\xe9\xbf\x7b\xf7\x6e\xc1\xc7\x18\x8e\
+\xa5\x72\x3c\xe5\x3e\x96\xb7\x73\x5f\x73\xbf\xcb\xe3\x00\xf7\x2d\
+\xf7\xb1\xe0\x8f\xfe\xfe\xf0\x0e\x8b\x82\x57\x6a\x26\xdc\x2a\xd4\
+\x85\x67\x9b\x7e\xd0\x92\x5f\x07\xf6\x9b\x8c\xc0\x21\xd3\xe1\xdf\
+\x6f\x02\x02\x87\xce\x84\x7f\xde\x62\x04\x4c\x5a\x85\x80\x39\x5b\
+\xa1\x5d\x78\x00\x7e\x0b\xf6\xc3\x6f\xce\x6e\x68\x67\xec\x84\xef\
+\xf4\xcd\xd0\x4e\x5e\x0f\xcd\xd8\x95\xd0\x0e\x9c\x4b\x71\x61\x22\
+\x42\x3a\x0f\x46\x74\xcb\x9e\x88\x6a\xd2\x01\xe1\xb5\x9a\x20\xa2\
+\x7c\x36\x22\x4b\x66\x20\x9a\xec\x24\x32\x21\x59\x88\x49\xf1\x29\
+\x25\x90\x4c\x36\xca\xf6\x2a\x1f\xb3\x6c\xbf\x0c\xdb\x2c\xaf\xf3\
+\x39\x95\x2a\x55\x0a\xa3\x47\x8f\xc6\xc6\x8d\x1b\x71\xf2\xe4\x49\
+\x5c\xbb\x76\x0d\x3f\xfc\xf0\x83\xc0\xbd\x7b\xf7\x04\xbe\xff\xfe\
+\x7b\x01\xdd\xfa\x41\x33\x85\xe7\x66\xdc\x60\x33\xd6\x03\x13\x8f\
+\x4f\xc7\xa7\x8f\xbe\x40\xe7\x0b\xa3\xf4\x72\xe4\xc1\x19\xec\xbe\
+\x7e\x90\xb4\x27\xdf\x9f\x4f\x71\x6c\x51\x52\x11\xfd\x29\x3f\xb9\
+\x47\x79\xca\x5d\xfa\x9c\x3b\x0c\xc4\xbf\x37\x61\xf8\x7e\x5f\xfe\
+\xdb\x73\x9e\xb3\xe1\xef\xa0\x30\x7c\x09\xed\xdf\x58\x7f\xe5\x38\
+\x2f\xc7\xfe\x50\x1a\x73\x19\x7e\x1c\x12\x4e\xdb\x63\x62\x11\x99\
+\xc8\xf1\xbf\x2c\x22\x33\x2b\x20\x30\xa3\x02\x02\xca\x56\x85\x6f\
+\xd5\xfa\xf0\xad\x91\x43\xe3\x7e\x7b\x68\xda\xf4\x87\x57\xc7\xa1\
+\xf0\xec\x33\x09\x5e\x1c\xfb\xc7\xaf\x42\xc8\xb4\x75\x88\x98\xbd\
+\x11\xd1\xb3\xd6\x20\x6a\xc2\x32\x84\x4e\x58\x0e\x7f\x1a\xfb\x3d\
+\x47\x2e\x81\xdb\xc0\x79\x70\xed\x36\x16\x2e\x6d\x06\xc1\xad\x71\
+\x0f\x78\x66\xe7\x40\x93\x51\x05\x41\xc9\x25\x11\x14\x97\x88\xc0\
+\x88\x28\x04\x51\xbc\x89\xa0\x63\x8b\x8b\x27\x1d\x93\x53\x91\x90\
+\x94\x22\xd8\x23\x1f\x1b\xdb\x9f\x8f\x8f\x0f\x5c\x5d\x5d\xe1\xe2\
+\xe2\x22\x2c\xbd\xbc\xbc\x84\x6d\xfc\x1c\x9f\x0b\x6b\x9f\x9a\x9a\
+\x2a\xc0\x71\x4c\xb6\x67\x79\x9c\xe3\xa5\x9c\x3f\xc8\xb9\x03\xdb\
+\x84\xb2\x69\x69\x2c\xb7\x19\xe7\x01\xdb\xf1\x9e\x98\x78\x62\x06\
+\x3e\xfb\xf1\x2b\x74\xbb\x34\x4e\x2f\x47\x1f\x9e\xc3\xee\x6f\x48\
+\xff\x05\xac\x3d\xe5\xfb\x4b\x52\xf0\xf0\xb7\x42\x97\xa3\x50\xbe\
+\x7c\xf9\x12\x92\x56\x4e\x04\xdf\xcf\xc5\xd7\xef\x59\xeb\xd7\xfd\
+\x72\xe7\x57\xd4\xff\x51\x81\xfe\xbb\x76\xed\x12\xf4\x67\xb8\x5f\
+\xd8\x87\x94\x7e\xc3\x8f\x19\x7e\x2c\xf4\x59\x44\x24\x42\xc8\xf7\
+\x42\x4b\x96\x41\x4c\x95\x1a\x88\xaf\xdd\x18\x89\x39\x9d\x11\x9f\
+\xdb\x1d\x51\xed\xfb\x22\xac\xc7\x48\x84\x0e\x18\x8f\xe0\xfe\x13\
+\x10\xdc\x2f\x1f\x01\x3d\xc7\x20\xa0\xf3\x10\x68\x9a\x77\x83\x57\
+\xe3\x8e\xf0\xa8\xdd\x16\x4e\x65\x6b\xc3\x81\xc6\x7a\xdb\xe4\x4c\
+\xd8\x46\x95\x80\x5d\x48\x14\x5c\x02\xc2\x68\xcc\x27\x4d\xc3\x22\
+\x11\x96\x90\x84\x30\xfa\x8c\x30\xd2\x3c\x22\x9e\x72\x0f\x3a\x26\
+\xb6\x43\x8e\xf5\x7e\x14\xeb\x35\x5a\x2d\xbc\xbd\xbd\xe1\xe9\xe9\
+\x09\x0f\x0f\x0f\x78\x78\x7a\xc1\x83\x74\xe7\xed\x9c\x0b\xb0\x6d\
+\xf0\xf9\xb0\xa6\x3c\x86\xf1\xb1\xf3\x3a\x6f\xd7\xcd\x17\xf8\x31\
+\xdb\x0a\xaf\xf3\x67\xf0\x39\x72\x2c\x50\x36\xdf\x99\xe1\xb0\x9d\
+\xe0\x09\xbb\x89\xde\x98\x74\x72\x06\x3e\xff\xe9\x32\x7a\x5e\x9e\
+\xa4\x97\x13\x8f\x3e\xc3\xee\x6f\x0f\x09\xf7\x74\x79\x2f\x49\x86\
+\xcf\xb2\x12\x45\xf4\xa7\x63\xe2\xeb\x73\x11\x2a\x71\xbe\x96\x6d\
+\xc0\xf2\x0d\x6d\xe0\x0d\xf4\xdf\x29\x9c\xb3\x1c\xef\x39\x07\xe0\
+\xfe\xe2\xa5\x1c\xff\x95\x79\x21\x3f\x8e\x4f\x4e\x41\x4a\xc9\xd2\
+\x48\xcd\xc8\x44\x5a\x99\x2c\xa4\x95\xaf\x8c\xb4\x6a\x54\xcb\x34\
+\x6d\x83\x98\x4e\x83\x10\xda\x7b\x02\x7c\x7b\x8d\x87\x17\xe5\xf6\
+\x2e\x1d\x87\xc0\xa9\x75\x1f\xa8\xdb\x0d\xa6\xe5\x00\xd8\xe4\xf6\
+\x83\x45\xee\x40\x98\x37\xee\x05\xeb\x86\x94\xf7\xd5\x6d\x07\xf7\
+\x3a\xad\xa1\xa5\xdc\x3f\x88\xec\x28\xb4\x69\x3b\x84\x37\x6d\x8f\
+\xf0\x9c\x2e\xf4\xb8\x13\xfc\xeb\xb7\x87\x4f\xad\x5c\xb8\x97\xaf\
+\x0d\x75\x6a\x59\x38\x45\xa7\xc0\x3d\x22\x1e\x3e\x21\xe1\x14\x1f\
+\xc8\x5e\x13\xc5\x58\x2f\xd7\x02\x72\x1e\xcb\x4b\x39\x9f\x61\x9f\
+\xe6\xda\x80\xc7\x80\x8c\x8c\x0c\x94\x29\x53\xa6\xc0\xd7\x39\x2e\
+\xf0\xfb\xe5\xf7\xb2\x0d\xe8\xea\xef\x37\x3b\x12\xb6\x93\xbd\x60\
+\x3f\x59\x83\x49\xa7\x66\xe2\xc2\x4f\x5f\xa3\xef\xd7\x33\xf4\xf2\
+\xf1\x8f\x17\x49\xff\xc3\xa4\x7d\x12\x7c\x96\xa6\x42\xbb\x22\xad\
+\x88\xfe\x74\x7c\xf5\x49\x17\xbe\x97\x97\xef\xd3\xe2\x6b\xf6\x8e\
+\x3a\x36\xf0\x56\xf5\x97\xe3\x3e\x23\x8f\xf1\x0c\xf7\x05\xc7\x04\
+\x61\x6c\x25\x7f\x8c\xe6\x9c\x2c\x2e\x1e\xa1\x51\x31\x08\x8e\x49\
+\x80\x3f\xe5\xea\x3e\x65\x6b\xc2\xbb\x46\x13\x78\x35\x7b\x0f\xde\
+\x9d\x86\xc3\xab\xcf\x14\x78\x0c\x59\x00\xef\xe1\xf3\xe1\x3f\x68\
+\x26\x42\x07\x4f\x46\xc4\xe0\xa9\x08\x1f\x40\x79\xc0\x80\xc9\xf0\
+\xeb\x3b\x01\x5e\xed\x87\xc1\xb9\xd3\x48\x38\xf4\x9c\x02\xc7\xf7\
+\xc6\xc3\xa9\xed\x10\xb2\x81\x36\xf0\x48\x2e\x0b\xaf\xb8\x14\x04\
+\x24\x95\x42\x28\xe5\x87\x21\xb1\xf1\x08\x08\x8f\x86\x6f\x70\x08\
+\x34\x94\xef\xbb\x93\x8f\xbb\x93\xcf\xfb\x50\x8e\x17\x18\x14\x0c\
+\x3f\xc2\xd3\x47\x03\x2f\x6f\x1f\x21\x47\xf4\xa7\x5c\x84\x7d\x9a\
+\x75\x94\xf5\xe4\xf3\x08\xa0\xbc\x91\xeb\x05\xf6\x71\xc1\x7e\xe9\
+\x39\xb6\x17\x39\x3e\xb0\x6d\x94\x2e\x5d\x1a\xe9\x54\xdb\xb0\x8d\
+\xe8\xc6\x7f\xff\x79\x51\xb0\x9f\xea\x03\xfb\x69\x5a\x4c\xfc\x98\
+\xf4\x7f\xfc\x35\x06\x5c\x9f\xa7\x97\xd3\x3f\x7d\x81\xdd\xdf\x1d\
+\x26\xbf\x4f\x85\x86\xb4\xf7\x5d\x55\xba\x88\xfe\x74\x8c\xad\x48\
+\x97\x2a\x04\x8f\x03\x61\x84\x17\xe1\xa0\x12\xef\xe1\x33\x7e\x0d\
+\x1b\x78\x6d\xfd\x77\xee\xdc\x29\xe8\x2c\x23\xdb\x02\xfb\xbb\x90\
+\x63\xd3\x3a\x8f\xff\x41\x14\xf7\x83\x22\x63\x10\x44\x9a\x04\x27\
+\xa4\xc0\x2f\xbe\x04\x7c\x12\x4a\xc3\x8b\x6c\xc0\x9d\xf3\xfb\xca\
+\x0d\xe0\xd5\xa4\x2b\x7c\x5a\x76\x87\x6f\xc7\x41\x08\xa2\x9c\x2f\
+\x60\xc8\x0c\x68\x06\x4e\x83\x57\xaf\x7c\x78\x76\x1b\x03\x4f\xd2\
+\xdc\xad\x75\x7f\xa8\x9b\xf5\x80\x4b\xed\x96\x70\x26\x9f\x76\x2a\
+\x55\x01\xf6\x31\x25\x60\x1b\x16\x07\x9b\xe0\x68\xd8\x05\x86\xc3\
+\xc9\x3f\x18\x2e\x7e\x41\x70\xf3\x0d\x84\xa7\xd6\x1f\x9e\xa4\xaf\
+\x17\xe9\xac\xd1\x68\x85\x1c\x9f\xe1\x31\x9e\x97\x3c\x0e\xb8\xb9\
+\xb9\xc1\xd9\xd9\x59\x80\xf3\x00\x5e\xe7\xe7\x38\xae\xcb\x63\xbd\
+\x7c\x7e\x72\xcc\x97\x63\x99\x3c\x2e\xc8\xb5\x25\x2f\x39\x07\x54\
+\xb6\x80\x85\xb1\x70\x98\xa1\x85\xe3\x4c\x5f\x4c\x3a\x33\x0b\x97\
+\x9e\x5c\xc7\x90\x1b\x4b\xf4\xf2\xc9\x93\x2b\xd8\x73\xe3\x30\x69\
+\x5f\x02\xda\x95\xa5\xe0\xb7\x3a\xbd\x88\xfe\x99\x99\x99\x83\x54\
+\xe2\xfd\x39\x7c\x9d\x2e\x95\x08\x55\x89\xf7\x6e\xd9\xbf\xa6\x0d\
+\xbc\x96\xfe\xcc\xce\x9d\x3b\x0a\x72\x3d\x19\xb9\x86\x96\xf3\x40\
+\x65\xdd\xed\x4f\x8f\x03\xc2\x23\xa9\x6e\x4b\x40\x40\x7c\x2a\x02\
+\x29\x0f\x08\xa4\x5a\xcf\xb7\x7a\x63\x78\xd5\x6b\x0d\xf7\xe6\xbd\
+\xe1\xd5\x79\x04\x02\x7b\x8e\x46\x0c\xe5\x01\xc9\x83\xf2\x11\xdb\
+\xbe\x17\xc2\x5a\x75\x86\x4f\x93\x8e\x70\x6a\xd2\x03\x0e\xad\x07\
+\xc3\xbe\xc3\x48\xd8\x35\xef\x0f\xc7\x3a\xed\xe0\x52\xb1\x1e\x3c\
+\xd2\x2b\xc3\x33\xb5\x0c\x7c\x13\x68\x9f\x51\xb1\x08\xa1\xd8\xee\
+\x17\x18\x44\xfa\xfb\xc2\x8d\xc6\x77\x17\xd2\xd4\xd5\xd5\x0d\xee\
+\xee\xee\x42\x8e\xc7\xfa\xb2\xbf\xf3\xb1\xf1\x92\x61\x3f\x97\x97\
+\x8c\xf2\xb8\x79\x9d\x6b\x43\xad\xf6\xa9\x0d\xc9\x8f\x79\x29\x3f\
+\xc7\xe8\xea\x1f\x42\xb1\xdc\x71\x16\xed\x87\xec\x60\xf1\x85\x0f\
+\xf0\xcd\xaf\x77\x30\xe2\xf6\x0a\xbd\x5c\xf8\xe5\x3a\x76\x7d\x77\
+\x08\xda\x55\xa5\xe0\x4b\xda\x07\xac\xcd\xc2\xa3\xdf\x7f\x2a\xb4\
+\xbf\x55\xab\x56\xdd\x70\x74\x74\xe4\x7b\xf2\x78\x1c\xe0\x5c\x80\
+\xef\xd7\xe4\xb9\x3d\x0f\x95\x78\x1d\xd7\x5c\xb2\x81\x97\xcd\x05\
+\x5e\x5b\xff\x1d\x3b\x76\x14\xe4\x40\x72\x9c\xe4\x3e\x60\xff\xe2\
+\xfc\x8a\xfb\x9a\xfb\x94\x7d\x88\x63\x66\x2a\xc5\xca\x78\x1a\xfb\
+\x63\x4a\x66\x22\x8a\xea\x80\x88\xca\xb5\x10\x52\x93\xea\xb3\xda\
+\x4d\x11\x51\xab\x31\x22\x6a\x34\x40\x78\x76\x43\xf8\xd6\xce\x85\
+\x6b\xd3\xee\x50\xe7\xf6\x81\x57\x87\xc1\x08\xa6\xf8\x1f\x3f\x6c\
+\x1a\xe2\x7a\x0e\x45\x70\xdd\xe6\xf0\x2d\x55\x11\x2e\xa5\xaa\xc0\
+\xb9\x6a\x63\x38\xd5\xeb\x0c\xd7\x5a\x2d\xe1\x5f\xae\x26\x82\x29\
+\xf7\x0f\xa7\xb1\x26\x8a\xc6\x99\x58\xca\xff\xf8\x71\x70\x74\x1c\
+\xd5\xf8\xfe\x05\xba\xc9\xba\xf3\xf1\xca\x1a\xca\xf1\x40\x8e\xf3\
+\xf2\xf8\x2f\x8f\x03\x6c\xc7\xb2\x7d\xc8\xef\x67\x1b\xe7\xed\xbc\
+\xae\x3c\xe7\x2f\xbf\xfc\xb2\x50\x7f\x55\xdd\xd4\x00\x51\xcb\x4b\
+\xa1\xf9\xce\xce\xd8\x72\x79\xa7\x70\x2d\x61\xc9\x83\x3d\x18\xf3\
+\xfd\x47\x85\x98\x7c\x6f\x23\x7e\xfa\xe3\x67\x6c\xff\xe6\x00\xba\
+\x1d\x1b\x81\x9a\x7b\xda\x23\x79\x5b\xe1\xfb\xb7\xb8\xb6\xe4\x3e\
+\x9f\x35\x6b\xd6\x45\x33\x33\x33\xfe\x2e\xc0\x7a\x2a\xf1\x5e\xdd\
+\x24\x95\x78\xcf\xbe\xbb\xc2\x06\x8c\x5e\xd2\x06\x5e\x43\xff\x47\
+\x92\xfe\xdb\x0b\xe6\x4b\x38\x56\xca\xf9\xbe\x3c\xe7\xc3\xdb\x82\
+\x43\xc3\x10\x1e\x1d\x83\xe8\x84\x44\xc4\xa5\xa4\x21\x92\x74\x09\
+\xa1\xb8\xe9\x47\x71\xc0\x2b\x30\x04\x1e\x21\x11\xf0\x8a\x88\x85\
+\xa6\x44\x06\x02\xc8\x1e\xfc\x1a\x52\x3e\xd7\xa2\x27\x34\xed\xfb\
+\x23\xb0\xcb\x30\x84\x0e\x99\x86\x30\xaa\xf9\xfc\xc7\xbc\x0f\xef\
+\x51\x4b\xa9\xce\x5f\x0e\xef\x69\x1b\xe0\x3d\x6b\x07\xbc\xe7\xec\
+\x82\x76\xfc\x4a\xf8\xf4\x9f\x02\xcf\xf6\x43\xe1\xde\xb4\x0b\x9c\
+\xeb\xb4\x82\x53\xa5\xc6\xb0\xcd\xaa\x0d\xdb\xb4\x4a\xb0\x2d\x51\
+\x1e\x0e\xa5\x2b\xc3\x29\x23\x1b\x2e\x29\x99\x50\x87\xc5\x52\xbd\
+\x10\x04\x57\x5f\x7f\xb8\x78\x6b\xe0\xec\xee\x01\x67\x57\x37\xa1\
+\xfe\xe3\xf8\xc0\x3a\xb2\x9e\xb2\xd6\x6c\x0f\x3c\xae\xf1\xb9\xc8\
+\x75\x0d\x2f\x39\x07\xe4\x71\x9f\xf3\x40\x79\x8e\x91\xed\x61\xc3\
+\x86\x0d\x85\xfa\xab\xdf\xf1\x61\xc8\xde\xd2\x18\x23\x4e\x8c\xc7\
+\xf6\x2b\x7b\xf0\xf8\xf7\x27\xc2\xf7\x3a\xde\xfd\xfd\x21\x6e\xfd\
+\xfe\x83\xc0\xed\xdf\xef\xe3\xf7\xbf\xfe\x83\x9f\xff\xf3\x0b\x2e\
+\x7c\xff\x25\x96\x7e\xb9\x0e\x3d\x4e\xe5\xa1\xcf\x99\xfc\x42\xfb\
+\xe2\xeb\x2d\xfb\xf6\xed\xc3\xf6\xed\xdb\x79\x3e\xe2\x20\xe9\xd3\
+\x92\xa8\xab\x12\xef\xd9\x4c\x24\x02\x09\x37\xc2\x56\xd2\xf5\x65\
+\x6c\xe0\x8d\xf4\x97\xeb\x21\x19\xb6\x07\xee\x2f\xf6\x1f\xce\x91\
+\x38\x27\xe2\xbe\x12\xf2\x64\xea\xb7\xf0\xf8\x64\x84\x92\xd6\xe1\
+\x55\x6a\x23\x9c\xea\xfe\xb0\x76\xfd\x11\xda\x67\x02\x02\x46\x2e\
+\x80\xef\xf8\x0f\xe1\x35\x7d\x1b\x3c\x67\xef\x86\xc7\xac\x3d\xf0\
+\x9c\xb9\x05\xde\xa4\xaf\x76\xd8\x6c\xf8\xf6\x18\x0d\x4d\xdb\xbe\
+\xf0\xa0\xd7\x3b\x52\xfc\xb7\xe9\x90\x07\xcb\x0e\xf9\xb0\xe9\x39\
+\x15\xea\x6e\x63\xe1\xd9\xb8\xb3\x30\x47\xe8\x13\x93\x04\x3f\xaa\
+\x03\xfd\xa8\xfe\xf7\x89\x8a\x83\x7b\x68\x24\xd4\x5e\x5a\x38\x39\
+\xbb\x40\xad\x56\x17\xc0\x63\x3d\x6b\xcd\xc7\xcf\xc7\xcb\x31\x8a\
+\x8f\x9d\xe3\x00\xdb\x01\xd7\x86\x6c\x07\xbc\x4d\x9e\xdf\x92\xeb\
+\x03\x46\xce\x09\xe4\xbc\x57\x7e\x7e\xd4\xa8\x51\x85\xfa\xeb\xcc\
+\xf7\xe7\xd1\x68\x57\x5b\xac\xb8\xb4\x06\x5f\xdc\xbb\x8c\xab\xf7\
+\xaf\xe3\xe0\x8d\x63\x98\x75\xe1\x7d\xe4\x9f\x9f\x85\xf1\xe7\xe7\
+\x60\xc2\x67\x73\xb1\xfc\xf2\x3a\x1c\xbf\x75\x16\x8f\x7f\x79\x82\
+\x43\xb7\x4e\x61\xda\xc5\xa5\xd8\x73\xe7\x58\xa1\x7d\xdd\xbd\x7b\
+\x17\x47\x8e\x1c\x29\xb0\x81\x36\x6d\xda\xbc\x4f\x1a\xe5\x12\x75\
+\x88\xb2\x2a\xf1\xfe\x9d\x00\x95\x78\x2f\xbf\xcd\x4b\xda\xc0\x6b\
+\xeb\xcf\xc7\x20\x8f\x95\xdc\x8f\xf2\xfc\xaa\xec\x1f\xf2\xb5\x16\
+\x5e\xe7\xed\xdc\xc7\x91\xb1\x71\x08\x4b\x29\x8d\xa0\x52\xe5\xe0\
+\x5b\xa9\x0e\x7c\x9b\x74\x86\xb6\xf7\x44\xf8\xe6\xbd\x8f\x80\x49\
+\x1f\x21\x68\xc2\x72\x44\xe6\x2f\x47\xc4\x84\xf7\x11\x32\x76\x01\
+\xfc\x28\x0f\xf4\x1a\x30\x15\x6e\x7d\x48\xe7\x3e\x93\x29\xef\x9f\
+\x0a\xeb\x76\xa3\x60\xd1\xa4\x0f\x6c\xea\x77\x80\x5b\xdd\x5c\x84\
+\x34\xcc\x45\x00\x8d\x21\x3e\x94\x4f\x78\x05\x86\xc2\x2b\x24\x0c\
+\xda\x84\x52\xf0\x49\xaf\x00\xbf\x12\x59\xf0\x89\x88\x81\x2b\x69\
+\xea\xe0\xe0\x00\x1a\x3b\x85\x1c\x4f\x8e\xf9\xec\xe3\xec\xb7\xac\
+\xa1\x1c\xcf\xe5\x1c\x4f\xae\x61\xf9\x31\x6f\xe3\x71\x9e\xdf\xc7\
+\xe3\x1a\xc3\xf6\x21\x8f\x25\x72\x3f\xd4\xa9\x53\xf4\x9e\xcb\x89\
+\xe7\x67\x63\xc3\xd5\xed\xf8\xf9\xb7\x9f\x71\x80\xb4\x9f\x70\x6e\
+\x36\x12\x37\x52\xce\xb2\x92\xea\xfc\x0f\x53\xe0\xb3\xa6\x04\xba\
+\x9d\x18\x8e\xd5\x57\xb7\xe2\xf2\xc3\x6b\xb8\xf1\xf8\x36\x16\x5e\
+\x59\x5b\x64\x3f\xdf\x7c\xf3\x0d\x4e\x9d\x3a\x25\xd8\xc0\xde\xbd\
+\x7b\xb1\x79\xf3\xe6\xff\x50\x0c\x1a\x4d\x3a\xb5\x50\x89\xf7\xec\
+\x97\x51\x89\xf7\xf0\xfa\x11\x2e\x92\x0d\x98\xbe\xc0\x06\x5e\x49\
+\xff\x47\x8f\x9e\xea\xbf\x6d\xdb\xb6\x82\xf3\x66\xdf\x97\xfb\x51\
+\x39\x17\x24\xcf\xfd\x04\x51\x1d\x16\x10\x42\xfd\x4b\xda\x04\x45\
+\x46\xc1\x9f\x89\x89\x87\x1f\xd5\x6c\xbe\x29\x19\xf0\xcb\xa8\x08\
+\x6d\xd9\x1a\xf0\xaa\x52\x1f\xde\x5c\xd3\x53\xbe\x17\x90\xdb\x1d\
+\x21\xdd\x47\x92\xef\xe7\xc1\xa7\x2b\xe5\xff\x1d\x86\xc1\xa5\xcd\
+\x40\x78\x50\xad\xa8\xe9\x37\x11\xda\x01\x53\xe0\xf3\x5e\x1e\xbc\
+\x5a\xf7\x85\x7b\x23\xb6\x85\x56\x70\x6b\xd0\x06\x8e\x35\x5a\xc0\
+\xbe\x42\x03\xd8\x67\x56\x87\x03\xa1\x2e\x5b\x1b\x2e\x59\xb5\xe0\
+\x96\x9c\x05\xb7\xa8\x44\x78\x06\xd3\x98\x43\x63\x80\xa7\x7f\x10\
+\xbc\xa9\xf6\xf3\x64\x4d\xa9\x4e\xe0\x7a\x40\xce\xf7\xe4\x25\x9f\
+\x93\x60\xb7\x84\x9c\xdf\xf2\xb9\xca\xf3\x83\x1c\xff\x29\x27\x17\
+\xe2\x1c\x8f\x7b\xbc\x9d\xfd\x42\xd9\x78\xcc\x9f\x73\xe9\x7d\x6c\
+\xba\xbe\x13\xef\x5f\x5e\x8d\xce\xc7\x07\x21\x6a\x63\x39\x78\xaf\
+\x4e\x82\x66\x0d\xd5\xf9\x6b\x4b\xa2\xe1\x91\xae\x98\x70\x71\x01\
+\x76\xdd\x3a\x82\xcd\x37\xf6\xe1\x67\x9d\xeb\xf7\x7c\xbd\xfc\xd2\
+\xa5\x4b\x38\x7f\xfe\x7c\x21\x1b\xa0\x7c\xf0\x01\xd9\x73\x4f\x49\
+\xb3\x9a\x44\xa6\x4a\xfc\xbb\x3d\x5f\x95\xf8\xf7\x7c\xd6\x92\x0d\
+\x3c\x6b\x7e\xe8\x8d\xf4\x57\xe6\x50\xec\x13\xdc\x87\xec\x43\x72\
+\x4e\xc0\x7d\xc4\xf3\xec\xf1\xa9\x25\x10\x4d\xe3\x7f\x58\x4a\x29\
+\x84\xa4\xa5\x23\x92\x72\xc0\xd8\xf4\x4c\x44\xa6\x94\x40\x20\xe5\
+\x69\x1a\xca\x07\x3c\x43\xa3\xe0\x12\x97\x06\xd7\x8c\x6a\x70\xa8\
+\xd1\x12\x4e\xcd\xfb\xc0\xb3\x6d\x3f\x84\xb6\xea\x89\xf8\xd6\x9d\
+\x90\x90\xd3\x06\x51\x55\x6b\xc3\xa7\x4c\x65\x38\xa6\x55\x80\x5d\
+\xc5\x86\xb0\x6f\xd0\x15\xee\xcd\xba\xc3\xbf\x61\x3b\x84\x56\xa8\
+\x4e\xfb\x4d\x47\x34\xe5\x18\xb1\x49\x29\x88\x48\x2a\x81\x80\xb8\
+\x64\xf8\x04\x87\xc2\xc3\xcb\x5b\x18\xe3\xd9\xf7\xf9\x18\x95\x73\
+\x80\x1c\xef\x79\x3b\x3f\xe6\xed\x7c\x3e\xac\xbd\x3c\x1f\x28\xeb\
+\xcf\x70\xec\xe7\x73\x63\x1b\xf0\x97\xf2\x4a\xde\x0f\x8f\x27\x1c\
+\x5b\x18\x7e\x4e\xb7\x0e\xe0\x76\xe1\xe1\x97\x98\x71\x71\x31\xda\
+\x1f\xef\x87\x8c\x9d\xf5\x88\xfa\xc8\xdc\xdd\x08\x59\x7b\x9a\xa0\
+\xd9\xb1\x9e\x98\x75\x79\x05\x3e\xbe\xff\x59\x91\xf7\xf1\xbd\x07\
+\x77\xee\xdc\xc1\xd7\x5f\x7f\x2d\xd8\xc0\xb9\x73\xe7\x04\x1b\x38\
+\x7c\xf8\xb0\x60\x03\x33\x66\xcc\xf8\xca\xd0\xd0\x90\xef\xd7\xe7\
+\xfb\x36\x6b\x10\xe9\x44\x34\xa1\x25\xd4\xaa\xe7\xcf\x13\xbf\xa6\
+\xfe\x8f\xb0\x75\xeb\xd6\x82\xbc\x5a\x46\xee\x57\x79\x0c\x95\xeb\
+\x00\x1f\x9e\x77\xf5\x0f\x10\xb4\xd0\x50\x3c\xf6\x4c\x2c\x09\x17\
+\xca\xc9\xd4\xb5\x5a\xc1\xa5\xe5\x40\x78\x76\x9f\x00\xef\x41\x33\
+\xa1\x19\x3a\x97\xc6\xfb\x39\xf0\x1b\x30\x03\xda\x3e\x13\xe1\x4e\
+\x63\x83\x73\xaf\x89\x50\xf7\x9e\x0c\x9f\x61\xf3\x11\xc0\xf9\x5e\
+\xfe\x2a\xb8\x0f\x5f\x0c\xe7\xae\xe3\xe1\x98\xdb\x0f\xf6\x2d\xfa\
+\xc0\x8e\xea\x00\xa7\x0a\xf5\xa0\x8e\x2d\x09\xe7\x80\x10\xa8\x3d\
+\x35\x70\x72\xf7\x86\xda\xcd\x03\x4e\x94\xdf\x39\xd2\x98\xef\xe4\
+\xe4\x24\xe8\xcc\xc7\x24\x1f\x27\xaf\x33\x7c\x8c\x1c\xdf\x59\x3b\
+\xb9\xf6\x93\xf3\x7a\x3e\x0f\xd6\x57\x2d\xed\x43\xd6\x99\xd7\x79\
+\xde\x80\xed\x4a\xde\x27\xbf\x9e\x69\xdd\xba\x75\x11\x1d\x5f\xb7\
+\xb1\xef\xb3\x3d\xdd\xb8\x71\xe3\x99\x36\xd0\xa7\x4f\x9f\xbd\xa4\
+\x17\x5f\xeb\xe5\xbf\xdd\xc8\x26\xf8\xbb\x5f\xf8\xef\xb9\x78\x9e\
+\xf8\x79\x73\x84\x6f\xa4\xbf\x9c\x2f\xcb\xb5\xb0\x5c\x0f\x33\xb2\
+\x0f\x05\x12\x3c\xc7\xc6\x7d\xec\xc1\xb6\xc1\x7e\xe7\xe7\x0f\x4f\
+\xca\xfb\x9d\x13\xd2\x29\x46\xd7\x80\x53\xc3\xae\x70\xed\x39\x09\
+\xbe\xc3\x16\x23\x78\xda\x7a\x84\x2c\xd8\x81\x88\xf9\xdb\x11\x3a\
+\x73\x1d\x02\x66\x6f\x86\x76\xe6\x66\xb8\xe6\xaf\x81\xe3\xa8\x95\
+\x70\x1e\x34\x07\x8e\xdd\xc6\xc0\xb9\xed\x20\x38\xd6\x6d\x07\xc7\
+\x72\xb5\xe1\x96\x55\x1d\x3e\x65\xab\x23\x90\x72\x8a\xe0\xcc\x2a\
+\x94\x07\x26\xc0\x9d\x8e\xc1\x91\xb5\x27\x8d\x1c\x58\x3b\x49\x2b\
+\x79\x0e\x40\x3e\x76\x3e\x46\x79\x8e\x9a\xb5\x97\xf5\x97\x6b\x00\
+\x65\xcd\x28\xc3\x71\x81\xc7\x38\xf9\x1a\xb7\x72\xae\x50\xce\x1f\
+\x3a\x76\xec\x28\xf8\xed\xeb\x36\x8e\xb1\x3d\x7b\xf6\x44\x8f\x1e\
+\x3d\x84\xeb\x8e\xcf\xb3\x81\x3d\x7b\xf6\xfc\x55\xa5\x4a\x95\x45\
+\xa4\x59\x3b\xa2\x31\x51\x55\xf5\x74\x9e\xf8\x79\x73\x84\xaf\xac\
+\xbf\x6c\x03\xb2\xfe\xb2\xdf\xcb\x79\x11\xaf\xb3\x1f\x71\x0d\xc0\
+\x39\x20\xcf\x8d\x96\xc9\x2a\x8b\x12\x19\x65\x10\x4b\xb1\x3f\x8c\
+\xea\xf4\xc0\x44\x9e\xab\x2d\x89\x90\xac\x4a\x08\xa9\xde\x00\x01\
+\x0d\x3a\xc0\xa3\xc3\x08\x38\x0d\x5e\x08\x87\x89\x5b\xa1\x9e\x75\
+\x00\x1e\x73\xf6\x20\x60\xd6\x16\x44\x2f\xd9\x81\x12\x0b\x37\x23\
+\x6d\x22\xd9\xc6\xe0\x99\x70\xee\x3e\x11\x56\x9d\xc6\xc2\xa2\xf5\
+\x70\x58\xb7\x1c\x04\x97\xe6\xbd\xe0\x51\xb7\x35\xdc\x32\xab\xc2\
+\x35\x3c\x1a\x6e\x21\x94\xfb\x53\xde\xe7\x5b\xa9\x1e\xbc\xf9\xde\
+\x81\xe8\x04\x78\x07\x88\xd7\xfb\x58\x1f\xb6\x4d\xd6\x54\xce\xe7\
+\xe4\x58\xc0\x4b\x39\xe7\x97\xe7\xaf\xe4\x3a\x5f\xce\x6d\xe4\xda\
+\x86\x91\x6d\x46\xbe\xbf\x49\x79\x7d\x5b\x9e\x3b\xe2\xdc\x77\xd3\
+\xa6\x4d\xaf\xac\xfd\xc1\x83\x07\x85\x7d\xd9\xda\xda\xc2\xc6\xc6\
+\x06\xd6\xd6\xd6\xc2\xb5\x07\xca\xf9\x70\xf5\xea\x55\xc1\x06\x2e\
+\x5e\xbc\x28\xd8\x00\xdb\x06\xdb\xc0\xfa\xf5\xeb\x1f\xd3\xf9\x0c\
+\x24\xdd\x78\x6e\xa0\x91\xa4\xa5\x3c\x47\xf8\xac\xf9\xa1\x57\xd4\
+\xff\x61\x81\xfe\x5b\xb6\x6c\x11\xaf\xa1\x29\xe2\xbc\x3c\x7e\xca\
+\x73\x6b\x01\xd2\x7d\x17\xf2\x35\x42\xe1\xba\x0a\xd7\x04\x99\x59\
+\x88\x2a\x57\x19\x01\xe5\xb2\xe1\x5d\xb5\x31\x5c\x28\x67\x73\x6f\
+\xd2\x05\xda\x36\xbd\x10\xda\xa1\x3f\x22\x5a\x76\x47\x30\xe1\x55\
+\xaf\x05\x1c\xaa\x36\x85\x75\xe5\x1c\x58\xd6\xef\x01\x8b\x9c\x3e\
+\xb0\xa5\xbc\xc0\xa5\x0d\xd5\xfb\x1d\x89\x56\xbd\xe0\xda\xa2\x17\
+\xdc\x69\x0c\xf0\x6e\xde\x03\x9e\x4d\xdf\x83\x6b\xcd\x5c\x38\x53\
+\xbe\xe7\x99\x51\x15\x7e\x15\xeb\x42\x43\xf1\xc1\x3b\xa3\x32\x3c\
+\x4a\x94\xa5\x98\x13\x47\xf5\x41\x38\xb4\x9c\x8b\x86\xf2\xdc\x74\
+\x04\x02\x43\xc3\x10\x40\x3e\xeb\xe7\xe7\x5f\x50\x13\xc8\x31\x4d\
+\xb6\x09\x79\x7e\x57\xce\xff\xe4\x79\x0f\x39\x0f\x90\xcf\x55\xce\
+\x85\x39\x06\x28\x6d\x87\x7c\x13\x7d\xfb\xf6\xc5\xb2\x65\xcb\x04\
+\xcd\x2e\x5f\xbe\x5c\x88\x0b\x17\x2e\x60\xed\xda\xb5\x18\x34\x68\
+\x10\xaa\x56\xad\x2a\x8c\x9f\x3c\xbe\xf0\x38\x63\x6f\x6f\x2f\xd8\
+\x01\xc3\xe3\x0d\xc5\x7a\xd6\x1a\x67\xcf\x9e\x2d\x62\x03\x0b\x17\
+\x2e\xbc\x48\xb9\x40\x37\xd2\xae\x35\xd1\x40\x55\x78\x7e\x88\xe7\
+\x06\xe4\xba\xd0\xf0\xcd\xf5\xdf\x2c\x68\x2f\xfb\xbc\xdc\x4f\xb2\
+\x7f\xc9\x3e\xc6\x73\xef\x3e\x5a\x1a\x13\x82\x68\x6c\x0d\x27\x3f\
+\x49\x4a\x45\x78\xc9\x0c\x84\x56\xac\x89\xe0\xec\x86\xf0\xab\x54\
+\x17\x3e\xb5\x73\x85\x3c\xde\xb3\xd3\x30\xb8\xf7\x18\x07\xaf\x3e\
+\x93\xa0\xe9\x35\x16\xda\xbe\x53\xe1\x4b\xb9\xbe\x2f\xd5\x01\xda\
+\xf6\xfd\xe0\x9e\xd3\x03\x8e\x14\x2b\xac\x6a\xb7\x82\x55\xe5\x66\
+\xb0\x2d\x57\x07\x0e\xe9\x55\xe1\x94\x9c\x09\x97\x70\xaa\xf7\x83\
+\xc3\xa8\xb6\x88\x16\xae\x01\x07\x53\xfd\xaf\x21\xad\xdd\xe9\xb3\
+\x9d\x5c\x5c\x0b\xfa\x90\x7d\x89\x7d\x8a\x1f\xcb\xf5\xa0\x9c\xb3\
+\xca\xf7\x02\xca\xf3\x3a\xac\x1d\x9f\x97\x32\xbf\x93\xe7\x8a\x78\
+\x1b\xeb\xc1\x3a\xc9\x39\x80\x1c\x47\xe4\xeb\x49\xf2\xb5\x31\xb6\
+\x07\x65\x3e\x21\xe7\x47\x72\x4c\x92\xaf\x2d\xcb\xc8\x63\x10\xef\
+\x8b\x5f\xcb\x9f\xc3\xf5\x2b\x1f\x33\xbf\x2f\x2f\x2f\x0f\x4b\x97\
+\x2e\x15\xee\xc1\x62\xfd\x3f\xf9\xe4\x13\xc1\x06\x0e\x1d\x3a\x84\
+\xde\xbd\x7b\x6f\x94\xf4\x93\xe7\x87\xe4\xb9\x01\xae\x0b\xe5\x7c\
+\x50\x8e\x01\x6f\xa4\x3f\x1f\x9b\x8c\x9c\x5f\xcb\xb9\xb4\xec\x3f\
+\xf2\xdc\xaa\x3f\xf9\x85\x96\xf3\xbf\xb0\x28\x68\xe3\x93\xe1\x41\
+\x71\xd9\x39\xae\x04\x5c\x4a\x56\x80\x73\x46\x79\xb8\x96\xaa\x00\
+\xaf\xaa\x8d\xa0\x6d\xd6\x09\xda\x96\x7d\xe1\xd5\x6e\x00\x34\xad\
+\xfb\x43\xd3\xac\x2b\xbc\xda\xf6\x85\x5b\x97\xd1\xb0\x6f\x3d\x14\
+\x76\xb9\x03\xe1\xde\x69\x14\x02\x7b\x8d\x46\x6c\x9f\x3c\x24\xf7\
+\x1e\x8e\x84\xe6\x1d\x10\x51\xb9\x26\x34\x99\x95\xa1\xa6\xda\xc0\
+\xb6\x74\x36\xac\xd3\xb3\x61\x97\x52\x0e\x4e\x51\x29\x70\x09\x0e\
+\x17\xaf\xf7\x29\x6c\x95\x8f\x8d\x8f\x59\xbe\xfe\xc3\x8f\x65\x7b\
+\x96\xf3\x38\x79\x6c\xe0\xe7\x18\x59\x5b\x7e\x3f\xbf\x56\x3e\x67\
+\xd9\x3e\x64\x8d\xd8\x67\xd9\xc6\xec\xec\xec\x84\x9c\x51\xb6\x19\
+\x7e\xcc\xdb\x18\x7e\xad\xfc\x99\xb2\x3d\xc9\x79\xa6\x12\x39\xe7\
+\xe4\x7d\xf2\xfb\x78\xc9\x9f\x3f\x77\xee\x5c\x61\x0c\xe6\x5a\x90\
+\xeb\x42\x86\x6d\xe0\xc0\x81\x03\x7f\x50\x4d\x3a\x49\x25\xfe\xed\
+\x3e\xcf\x0d\x70\x5d\x98\x2e\xe5\x83\x5e\xd2\x38\x20\xc7\x80\xd7\
+\xd2\x9f\xd9\xbc\x79\x53\xc1\xbd\x33\xba\xc8\x73\xa9\xc2\x1c\x2a\
+\xc5\xff\xc0\xf0\x08\xf8\x52\xbc\xd5\x44\x44\x43\x43\x35\x99\x07\
+\x69\xed\x5a\xb9\x11\xd4\xd5\x5b\x40\x4d\xfe\xec\x46\x75\x3d\xd7\
+\xf8\xc1\x3d\xf3\x10\xde\x3b\x0f\x51\xfd\xc7\x23\xa2\xf7\x38\xf8\
+\x13\x1e\xdd\xc7\xc2\xa9\x57\x3e\x1c\xa9\x46\x50\xf7\x9d\x01\xd7\
+\x21\x0b\xe0\xd2\x7b\x1a\x1c\xda\x8f\x84\x53\x4e\x2f\xb8\x34\xe8\
+\x08\x97\xba\x6d\xe1\x52\xaf\x35\x9c\x69\xac\x70\xa7\x98\xef\x92\
+\x5a\x9e\x6a\x01\xb2\x2d\x8a\xf7\x1e\xd1\x89\xf0\x49\x48\x83\x1f\
+\x11\x10\x1d\x0f\x7f\x3a\x16\x1f\xff\x40\xaa\xfd\xfd\xe1\xe5\xe3\
+\x2b\x5c\x1b\xe2\x3e\xb6\xb7\x77\x10\x70\x74\x74\x12\xd6\x9d\x9d\
+\x5d\x04\xc4\x6b\x47\x1e\xa4\xb3\x7b\xc1\xfd\x42\xf2\x79\xcb\x7a\
+\xf1\x92\xed\x84\xe3\x9d\x3c\x06\xc8\xd7\x18\xe4\xdc\x48\xae\x37\
+\xf9\xb1\xd2\x66\x64\xbb\x91\xe7\xa7\xe4\xfd\xc9\x9f\x21\xd7\x29\
+\x72\x0c\x60\xbb\x62\x78\xff\x7c\x0d\xf6\xd8\xb1\x63\xc2\x38\xc0\
+\x79\x01\x5f\x7f\x3e\x7d\xfa\xf4\x9f\xdb\xb7\x6f\xbf\x4f\xfb\xea\
+\x4f\x1a\x76\x20\x9a\x48\xba\xf2\xb5\xa2\x00\x29\x06\x58\x4a\x31\
+\xe0\x35\xf4\x7f\x58\xa0\xbf\x3c\xfe\xcb\x79\xa0\x32\xff\x97\xfd\
+\x44\xb8\x07\x93\xc7\xd6\xc0\x60\x78\x06\x04\xc3\x95\xea\x33\x97\
+\xe0\x08\xb8\x84\x44\xc2\x2d\xa1\x04\x5c\xd3\x2b\xc3\xa9\x6c\x4d\
+\x1a\xb3\x6b\xc0\xa3\x71\x67\xb8\x75\x1c\x45\x7a\x4f\x86\xf3\xc0\
+\x79\xf0\x1d\xfd\x3e\x62\x26\xad\x40\x89\xe9\x2b\x90\x3e\x75\x31\
+\x4a\xe5\x2f\x40\xec\xa8\x59\xf0\xa7\xf1\xc1\xb9\xc7\x64\x58\x77\
+\x9e\x08\xb3\x56\x43\x61\x56\xbf\x1b\xac\xaa\xe4\xc0\x21\xad\x32\
+\xdc\xa2\xd3\xe0\x4d\x35\xa6\x7f\x50\x88\xf0\xd9\x7c\x8f\x8f\x9b\
+\x1b\xd7\xf6\x3e\xf0\xa5\xe3\xd0\xca\x79\x9f\xe0\xe3\x34\xde\x53\
+\x6e\x18\x42\x39\x40\x18\xd9\x45\x48\x88\x7c\x0d\x93\xc6\x11\xaa\
+\x57\xf9\x3d\x42\x4c\xa7\xd7\xf9\x68\xb4\xd2\xbd\xa2\x5a\xda\xe6\
+\x25\xd8\x85\x68\x23\x3c\x06\x38\x0b\x76\x23\x6b\xc8\xb0\x0d\xb1\
+\x96\xfc\x7e\xe5\xbc\x92\xdc\x3f\x72\x7c\x94\xe3\xbb\xec\xe3\x0c\
+\xaf\xcb\x75\xa9\x72\xdc\x60\x7b\x10\x6d\x55\x8c\x2f\x3c\xd7\xc4\
+\xb1\x9f\xeb\x01\xae\x0d\xb8\xf1\x7c\xc1\x95\x2b\x57\x7e\x99\x3f\
+\x7f\xfe\xc7\xa4\x21\xe7\x02\x7c\xcf\x00\xff\xed\x4f\x69\x95\x78\
+\xcf\x00\xe7\x01\x3c\x2f\x64\xf2\xa6\xfa\xcb\x71\x53\x69\xaf\x7c\
+\x3e\xca\xfa\x4a\x39\x8f\xc6\xf9\x9f\x70\x8f\x58\x32\xe5\x00\xf1\
+\x89\xd0\x50\xbe\xee\x1a\x1c\x09\x75\x58\x1c\xec\x22\x53\xe0\x18\
+\x5f\x0a\xce\x34\x1e\xb8\x56\xac\x47\x79\x5c\x0b\xb8\x52\x4e\xe8\
+\xd7\x65\x24\xc2\x07\x4c\x43\xcc\xf8\xf7\x11\x37\x66\x21\x62\x07\
+\x8c\x45\xd8\x7b\x43\xe1\x97\xdb\x0b\x9e\xe4\xff\x6e\x2d\xfa\x52\
+\xee\xd8\x15\xde\x35\x5b\xc2\x93\xec\xc8\x33\x26\x19\xee\xe4\xdf\
+\xae\xde\x1a\xb8\xf1\xbc\x94\x56\xf4\x73\x8d\x96\xc6\x53\x8d\xaf\
+\x90\x8b\xb0\x96\x8c\x87\x37\xdf\x03\x48\xfd\x4a\xf6\xe1\xe1\x45\
+\x36\x4c\x31\x81\xef\x09\x0e\x20\x5b\x0d\x0d\x8f\x14\xee\x59\x0e\
+\xe4\x7b\x48\x68\xbb\xa7\x97\x37\x9c\x29\x8f\x50\xbb\xb0\xee\xa4\
+\x03\x69\xce\x38\x3a\x91\x5f\x92\xf6\x8e\x4e\x6a\x61\x29\xeb\x2e\
+\xf6\x89\xab\x60\x1b\xdc\x4f\xf2\x98\xcf\xdb\xd9\x4e\xe4\x78\x2e\
+\xc7\x74\x46\xb6\x1b\x39\x26\xc8\xdb\x95\xaf\xe3\xa5\x5c\x17\x50\
+\xac\x17\xb4\xe7\x7a\xe0\xd6\xad\x5b\x85\xb4\xba\x7f\xff\xfe\x23\
+\xda\x47\x5f\x95\x38\x2f\xd0\x50\xca\x03\x78\x5e\x88\xef\x17\xe0\
+\x6b\x44\xa6\xaf\xaa\xff\xc3\x87\x4f\xf5\xe7\xfb\x61\x65\x5b\x97\
+\xe3\x96\x3c\x27\x22\x9e\xbb\x1b\xbc\xfd\x02\x68\xbc\x17\xe7\xf6\
+\x3c\xc2\x62\xe0\x14\x16\x0f\x87\x84\xd2\xb0\x2b\x55\x09\x0e\x25\
+\x2b\xc1\xb9\x4c\x55\x78\xd4\x6a\x0e\x8f\x46\x1d\x48\xcb\x9e\xf0\
+\x6c\xd3\x1f\xde\x1d\x06\xc1\xaf\xd3\x60\x04\xf4\x9b\x20\xde\x07\
+\xd2\x6d\x14\x3c\x5a\x0f\x80\x4b\xe3\x6e\x50\x37\xea\x0c\x47\xd2\
+\xda\xae\x76\x47\xca\xfd\xea\xc2\x36\xa5\x0c\xec\x42\x13\x61\x1b\
+\x4a\xf6\x13\x1c\x05\xfb\x20\xaa\xff\xf8\x1e\xaf\x98\x14\xf8\x53\
+\x7e\xe1\x1f\x95\x00\xbf\xd0\x68\x61\xec\xf1\xf0\x0d\x82\xbb\x97\
+\x16\xce\x6e\xde\x94\x0f\x7a\x42\xed\x4a\xe3\xba\x87\x17\x9c\x3d\
+\x7c\xa0\x76\xf7\x11\xb6\xbb\xba\x93\x5f\x7b\x69\x28\x57\xf0\x15\
+\xec\x46\xe3\x1b\x48\xf6\x40\xf9\x58\x28\xe5\x71\x51\x31\x08\x8b\
+\x88\x12\xe2\x0a\x6f\xf3\xd1\x06\x90\xfd\x68\xe0\xee\xc9\xf7\x98\
+\x68\x85\xeb\xcc\x7e\xfe\x5c\x67\x6a\xe1\xee\xe1\x29\x9c\x3f\xdb\
+\x84\xd8\x2f\xce\x52\x1e\xe0\x26\xc4\x14\xd9\x2f\xe4\x31\x82\xfd\
+\x5c\x99\xf3\xf3\x63\x8e\x15\x72\xbd\xc1\xf1\x82\x6d\x87\x9f\x93\
+\x73\x57\xe6\xc4\x89\x13\xb8\x7e\xfd\x3a\x6e\xde\xbc\xa9\xf7\xef\
+\x15\x48\xc3\x5e\x2a\xf1\xbb\x3c\x9a\x48\xb5\x00\x7f\xc7\x8b\xb7\
+\x94\x03\xbc\x81\xfe\x0f\xb1\x61\xeb\x2e\xd8\x6b\x63\x04\xec\x34\
+\xd1\xb0\xf5\x89\x12\xb0\xf1\x8e\x84\xb5\x57\x24\xac\x3c\x23\xe8\
+\x71\x14\x1c\xfc\xe2\xa9\x26\x4f\x85\x26\x26\x13\x01\xa9\x54\x93\
+\xa5\x55\x87\x57\xe9\x7a\x70\xab\xd6\x1e\xf6\xf5\xfb\xc3\xbe\xe1\
+\x40\xa8\x1b\xf6\x85\xb6\xc3\x38\x44\x0f\x9c\x8d\x98\x6e\x13\x10\
+\xd8\x6a\x08\x3c\xeb\xbc\x07\xbb\xb2\xb9\xb0\xae\xd5\x07\x96\x2d\
+\x46\xc3\xaa\xd9\x68\x58\xd7\x1b\x08\xdb\xaa\x5d\xe0\x90\xd5\x8c\
+\xc6\x8d\xfa\xf0\x26\xfc\xd2\xeb\x22\x80\xf6\xe7\x9f\x41\xb5\x5e\
+\xa9\xba\xf0\x4c\xa9\x09\x75\x7c\x15\x38\x45\x96\x87\x73\x74\x05\
+\xb8\xd1\x63\xb7\xe8\xf2\x70\x8b\x2a\x0b\xe7\xf0\x4c\x38\x86\xa4\
+\xc3\x36\xb0\x14\x2c\xfd\x4b\xc2\x8a\x96\x8e\x21\x19\x70\x8d\xe4\
+\xe7\xca\x92\x7d\x66\x42\x1d\x9a\x09\xd7\xf0\x0c\x01\x97\xb0\x74\
+\xb8\x46\x88\xeb\xce\xa1\xe9\x70\x22\x1c\x82\xd2\x60\xeb\x5f\x02\
+\xb6\x7e\x29\xb0\xf6\x4d\x84\x95\x4f\x1c\x2c\xbd\x63\x61\xad\x89\
+\x85\x43\x40\x12\xdc\x42\xd3\xa0\x8d\xcd\x42\x60\x52\x79\xf8\xc7\
+\x97\x83\x4f\x64\x29\x78\x84\xa6\xc2\x25\x30\x01\x8e\xd4\x57\x0e\
+\x9a\x28\x01\x7b\x9f\x08\x38\x48\x38\xfb\xc5\xc0\x23\x38\x9e\xe2\
+\x61\x0a\xb4\x91\x25\xe0\x15\x9a\x24\xac\x7b\x06\x27\x08\x8f\xbd\
+\xc3\x92\x85\xed\xda\xa8\x34\x78\x85\xa5\xc0\x3d\x24\x89\xf6\x17\
+\x4f\x35\xe0\x39\xe1\x6f\x95\x1e\x3c\x78\xa0\xf7\xef\x14\x48\xc3\
+\xde\x2a\xf1\x6f\xf9\x79\x6e\xb8\x92\x54\x07\xf8\xfc\x1d\xfa\xaf\
+\xdf\x7d\x0c\xd6\x09\x4d\x61\x15\xdf\x44\x58\xda\x24\xe6\xc0\x3e\
+\x35\x17\xea\x52\x6d\xe0\x9a\xd9\x01\xee\x59\x9d\x04\x3c\xb2\x68\
+\x4c\xcf\xec\x08\xe7\xf4\x0e\x70\x2c\xd5\x0e\xf6\x69\x6d\x60\x9d\
+\xdc\x4a\x24\xb5\x0d\x2c\xca\xf4\x84\x59\xf6\x48\x98\x35\x9a\x0a\
+\x8b\x4e\xcb\x61\xdf\x7f\x1b\x5c\x46\xec\x83\x57\xfe\x31\x68\xa7\
+\x9f\x85\xcf\x94\xd3\xf0\xa0\xc7\x6e\x63\x8e\x40\x3d\xfe\x14\x1c\
+\xa7\x9c\x83\xfd\x94\xcf\x61\x3f\xf9\x3c\xd4\xf9\xa7\xe1\x32\xf6\
+\x18\x1c\x87\xef\x83\x6d\xef\xcd\xb0\x6c\xbb\x0c\xe6\x39\xb3\x61\
+\xd6\x60\x3a\xed\x8f\xa8\x43\xf9\x41\xd5\x51\xb0\x28\x3f\x10\x36\
+\xe5\xfa\xc1\xb1\x62\x7f\xa8\x2b\x0d\x84\x5b\x95\x01\x70\xab\xd4\
+\x1f\x2e\xe5\xfb\x41\x4d\xdb\x1d\xb2\xfa\xc0\x2e\xab\x37\xd5\x0c\
+\xbd\x60\x59\xba\x07\x2c\x4a\x76\x83\x45\x5a\x17\x58\xa7\x75\x82\
+\x45\x4a\x7b\x98\x25\xb7\x81\x59\x52\x6b\x98\x25\x32\xad\x44\x92\
+\x5a\xc1\x3c\xb9\x35\x2c\x64\x78\x3d\x31\x57\x24\xa1\x39\xcc\xe3\
+\x73\x60\x16\xd7\x0c\x66\xb1\x4d\x61\x1e\xd3\x18\x16\x31\x0d\x61\
+\x15\xdb\x10\xe6\xd1\xf5\x60\x16\x59\x0b\x66\x11\x35\x60\x16\x5e\
+\x03\xe6\xe1\xd9\x22\x61\xe2\xd2\x22\xbc\x3a\x91\x2d\x12\xc1\xd0\
+\x7a\x64\x0d\x58\x46\xd6\x84\x65\x54\x2d\xa2\x36\x2c\xa3\xeb\xc2\
+\x32\xa6\x1e\x2e\x7e\x71\x45\x88\xc5\xfc\xb7\x95\xfc\xf7\x92\xff\
+\xbc\xfe\x0f\x0a\x6c\x60\xcd\xda\x35\x50\x19\x1a\x3d\x17\x03\x23\
+\x63\x81\x17\xbd\xee\x85\x18\x9b\x40\xa5\xf6\x80\xca\xc1\x45\x78\
+\x6c\x61\xef\x24\xd4\x74\x96\x34\xde\x16\x7a\x9d\x89\x29\x54\x4e\
+\xee\x50\xd9\xf1\x76\x93\x37\xff\xdc\xff\x72\xae\x5c\xf9\xba\xd0\
+\xdf\xc9\xbe\x4d\xfd\xd7\xb2\xfe\x2a\x55\x31\xef\x90\x6f\xbf\xfd\
+\xb6\xd0\xdf\x43\xbf\x4d\xfd\xd7\xad\x5f\xf7\xce\xcf\xff\x65\x30\
+\x36\x36\x82\xb9\xb9\x19\x6c\xac\xad\x28\x67\xb2\x7e\x65\x6c\xac\
+\x2d\x61\x66\x6a\x0a\x03\x03\x83\x97\xfa\x3c\x43\x43\x43\xfa\x3c\
+\x53\xd8\xda\x58\xc1\xc1\xde\x16\x76\xb4\x0f\x6b\xda\x87\xa5\x85\
+\x39\xcc\xcc\x4c\x61\x62\x6c\x2c\xbc\xe6\xef\x38\xb7\xaf\x2e\x7f\
+\x5d\xe8\xef\xde\xdf\x8e\xfe\xa2\x0d\x6c\xda\xb2\x95\x72\x51\xab\
+\x97\xea\x17\x3e\x5f\x13\x13\xe3\x97\xee\xc3\xd7\x81\xf7\xcd\x9f\
+\xc1\xfd\x6c\x6b\x63\x4d\xb9\xb2\x1d\x5c\x9c\x1d\xe1\xea\xe2\xf4\
+\xb7\xe1\xe8\x60\x07\x2b\x2b\x0b\xe1\x73\xd8\xae\x78\x69\x6a\x6a\
+\x22\xd8\x17\xeb\xed\xe4\x68\xff\xd2\xfb\xe2\x63\x53\x3b\xd9\x53\
+\x9d\x57\xd4\x46\x8c\xc9\x46\x5e\xe6\x9c\x2f\x5f\xb9\x5a\xe8\xfb\
+\x0d\xf4\xe8\xdf\x47\xd2\x32\x47\xd2\x36\x41\xd2\xda\x5e\xd2\xfe\
+\xb5\xf5\xdf\xb8\x6d\x17\xd4\x9e\x5a\xaa\x71\xec\xa5\xe3\x35\x28\
+\xf0\x37\xee\x23\x3e\x27\x5d\x0d\x9c\x9d\x9d\x60\x4b\x75\xad\x99\
+\xb9\x39\x54\xaf\x68\x0b\x6c\x43\x46\xf4\x39\x26\x26\x26\xd4\x47\
+\x66\x42\x9f\x5b\x59\x8a\x9f\xe3\xe4\xf4\xf2\xfd\xfe\x6f\xc1\x59\
+\xed\x20\xd8\x94\x29\x9d\xef\xd3\x7e\x28\xdc\x67\x97\xbf\xbe\x5a\
+\xe4\xfb\x6c\xde\x8e\xfe\x0f\xb0\x61\xdb\x1e\xd8\x07\xa6\x52\xcd\
+\x93\x08\x27\x4f\x7f\x58\x5a\x5a\x0a\x7e\x57\xe4\x5c\x5c\x9d\xe1\
+\xec\xe5\x0b\x27\xdf\x48\x38\xf0\xeb\xa9\x7e\x62\xec\xfd\x93\x61\
+\xe9\x1a\x00\x33\x3b\x37\x98\x3b\x7a\xc1\x42\xad\x11\xd6\xad\xdc\
+\x43\x60\xe3\x15\x01\x5b\x0d\xd5\x95\xbe\x09\xb0\x0f\x48\x29\x78\
+\x4f\x21\x02\x92\xa9\x76\xf7\xd2\xef\x5b\x2e\xea\x77\xae\xdf\xdf\
+\x6d\x0b\x3c\x7e\x99\x08\xb6\x60\x50\xc0\xdb\xd6\x9f\xeb\xcc\x42\
+\xfa\xb3\x8e\x41\x25\x45\x48\x5b\xb5\x36\x1c\xae\x3c\xf7\xe1\xee\
+\x01\xb5\x4f\x20\x9c\xfc\xe3\xe0\x10\x5c\x8a\x28\xfd\xcf\x10\x54\
+\x0a\xce\x9a\x10\xb8\xba\xb9\x16\xe0\xc2\xf3\x24\x64\x1b\x8e\x81\
+\x29\x64\x73\x11\x70\x21\xdb\x53\x3e\xff\x6f\xc6\xc5\xd5\x15\xb6\
+\xf6\xf6\x30\xa0\xda\xc6\xd0\xc8\x04\x5f\x5f\xbd\xfe\xee\xf4\xdf\
+\xbe\x17\x76\xc1\x99\xb0\x0b\x2d\x0b\xbb\xb0\x72\x02\xf6\x11\x15\
+\xe0\x10\x51\x1e\xf6\xe1\xe5\x85\xc7\x6f\x0b\xc7\xe0\x34\xb8\xf8\
+\x04\x08\x38\x84\xa6\x17\x79\xde\x21\xbc\x2c\x1c\x83\x52\xa0\x26\
+\x7b\x70\xf6\xe6\x7b\xff\xfd\xfe\xfb\xa0\x63\x57\xfb\x46\xc1\x29\
+\x88\x62\x64\x58\x16\x51\x16\xf6\x04\x1f\x3b\x63\x1f\xce\x7d\x9c\
+\x45\x94\x85\xb5\x5f\x09\xd8\x06\x96\xc4\xd5\xeb\xdf\xbe\x65\xfd\
+\xef\x17\xd8\xc0\x86\xed\xfb\x61\x1b\x95\x0d\xdb\xd8\x3a\xb0\x89\
+\xab\x47\xd4\x87\x6d\x42\xe3\x77\x86\x5d\x6c\x5d\xd8\xc7\xd6\x7a\
+\xf1\x6b\xe3\x1b\xc2\x21\xae\x16\x1c\xa9\x3f\x9d\xc8\x6e\xb8\xbf\
+\xdf\x26\x6c\xab\x8e\x61\x19\xf4\xf9\xa4\x6b\x44\x45\xd8\x47\x55\
+\x81\x5d\x4c\x0d\x3a\xb6\x46\x2f\x3c\x76\xee\x63\x1b\x3a\x4f\xdb\
+\xe8\x9a\xb0\x8b\xa8\x84\xab\x37\xef\xbd\x33\xfd\xd7\xef\x3c\x04\
+\x9b\xc4\x66\xb0\x4e\x6d\x07\xab\xb4\xce\xb0\x2a\xd9\x05\xd6\xe9\
+\x3d\x88\x9e\xff\x30\x3d\x0a\xb0\xaf\x3b\x0e\xae\x7d\x37\xc3\x63\
+\xc6\x57\x70\x7a\x6f\x0b\x6c\xca\x0d\x84\x4d\xa5\x11\xb0\xaa\x35\
+\x05\x56\x0d\x17\xc1\x22\x67\x0d\xcc\xda\xec\x86\x49\xe7\x93\x30\
+\xee\x71\x09\x86\xfd\x6f\xc1\x60\xe8\x13\xa8\x46\x02\x06\x83\x1e\
+\xc0\xb8\xcb\x27\xf4\xdc\x19\x58\xd6\x9e\x0d\xbb\xb4\x36\xb0\x4f\
+\xa8\xff\x1a\x34\xd2\xbf\x3d\xa9\x19\x6c\x53\xdb\xc0\x36\xad\x3d\
+\x6c\x4a\x76\x82\x4d\xa9\x6e\x6f\xd0\x3f\xe2\xf9\x0a\xfd\x5c\xa2\
+\x03\xac\x93\x5b\x0a\x76\x70\xe5\xd6\x83\x77\xa0\xbf\x68\x03\xeb\
+\x77\x1d\xa1\xe3\xe9\x08\xcb\x8c\xbe\xb0\xc8\x1a\x02\x8b\xb2\xc3\
+\x60\x59\x71\x0c\x2c\x2b\x8d\xfd\xc7\xb0\xae\x96\x0f\x75\x87\x55\
+\xf0\x99\xf0\x31\x82\xd7\x3f\x44\xf0\x1e\x20\x60\x3b\xa0\xd9\x08\
+\x78\xac\x06\x5c\x96\x02\x0e\xf3\x00\x9b\x19\x80\xc5\x64\xc0\x74\
+\x3c\x60\x3c\x16\x30\x1c\x4d\x7a\xe7\x41\xd0\xbd\x10\x23\x14\x0c\
+\xff\x0b\x46\x3d\xae\xc0\xbc\xe9\x5a\x58\x57\x18\x06\xdb\xf4\x2e\
+\xb0\x2d\xdd\x55\xa2\x1b\x6c\xca\xf4\x22\xfa\xc0\xa6\xec\x00\x58\
+\x97\x1b\x0a\xab\x0a\x23\xe9\x98\xc4\xf3\xb5\xaa\x30\x82\x9e\xeb\
+\x4b\xef\xe9\x26\x60\x93\xd5\x17\x56\x95\xfe\xc6\xbe\xa8\x28\x62\
+\x51\x76\x28\x2c\xcb\x0c\x84\x55\xe9\xee\xb0\x4e\x6c\x81\xcb\x37\
+\x1f\xbe\x33\xfd\xd7\x1d\xbb\x08\x8b\x8a\x43\x05\xdd\x2d\x48\x77\
+\xf3\x8a\xf9\xb0\xa8\x36\x0d\x16\xd9\xd3\x9f\x52\x5d\x66\xc6\xab\
+\x23\xec\x63\x1a\x6c\x1a\x2c\x80\x5b\xdf\x3d\x08\x98\x77\x05\x51\
+\xdb\x7f\x47\x34\x69\x1e\xb5\x17\x88\xdc\x07\x84\xd1\x32\x68\x17\
+\xe0\xb7\x15\xf0\x5e\x07\xb8\xad\x00\x9c\x16\x03\xb6\xb3\x01\xcb\
+\xa9\x80\xd9\x44\xc0\x64\xdc\x53\xfd\x0d\x74\xf5\x2f\x62\x03\x4f\
+\x31\xec\x73\x13\x26\xed\x4f\x91\x4d\x5c\xa3\x58\xf1\x8b\xb0\xcd\
+\x60\xc8\x1f\x30\xec\x7d\x13\xc6\xed\x4f\xc3\xac\xd9\x16\x98\xd7\
+\x5a\x20\x1c\xa3\xc8\x74\x58\x56\x9b\x02\xcb\xca\xf9\x8a\x73\xd7\
+\x77\x6e\xcf\xeb\x0f\xe9\x7d\xd9\x3a\x54\x13\x3f\xc3\xbc\x12\xed\
+\xbb\xc2\x28\x58\x66\xf6\x83\x75\x4a\x1b\x41\x7f\xe5\x77\x1c\xbe\
+\x3d\xfd\xef\xe3\xa3\xaf\x1e\x43\x35\xed\x07\x18\x8c\xba\x0a\xa3\
+\xf7\x8e\xc1\xa4\xc5\x3a\x98\xd7\x7b\x9f\x8e\x73\x26\x9d\x83\x92\
+\x59\x4f\xa9\x31\x9b\x98\x23\x31\x5b\x44\xf9\x7c\xf5\xa7\xdb\x2c\
+\x6b\xce\x81\xff\x9c\xcb\x88\xdb\xfd\x17\x12\x49\xeb\x44\xd2\x3a\
+\x69\x3f\x71\x90\x1e\x1f\x02\xe2\x0f\x03\x71\x47\xc8\x16\x88\x30\
+\xda\x1e\xb0\x03\xf0\xd9\x00\xb8\x92\x0d\x38\x2e\x22\x1b\x98\x45\
+\x31\x60\x0a\xc5\x80\x09\x80\x11\xdb\xc0\x18\xd2\x6f\x14\xf5\x89\
+\x2e\xfa\xec\x40\x8f\x3d\xa8\x86\x29\x50\x6c\x37\xe8\xff\x08\x46\
+\x5d\xbe\x80\x49\xab\x03\x30\x6f\xf8\xa1\x78\x0e\xba\xe7\xfd\x4a\
+\x48\xfd\x46\xfd\x60\xd2\xf6\x08\xd9\xe0\x09\x98\x35\xfe\x48\x78\
+\xce\x9c\x6d\x8b\x63\x6c\x19\x8a\x41\x29\x6d\xf1\xd5\xcd\x07\x6f\
+\x55\x7f\xbe\xc6\x5c\x48\xff\x19\xf7\xa0\x9a\x42\x4c\x20\xf2\x09\
+\x8a\xbb\x06\xf9\x3f\xc2\xa8\xff\x05\x98\xbc\xf7\x31\x4c\xba\x9d\
+\xa4\xf1\xf5\x38\x4c\x3b\x1e\x82\x05\xe9\x29\xfa\xf5\x4c\xc9\x46\
+\x66\xc0\xba\xcd\x46\xa8\x27\x5d\x81\xf3\xa8\xd3\xb0\xcd\x5d\xf9\
+\xd4\x8f\xc8\x07\x02\xe6\x7c\x89\xa4\x03\x40\x1a\xe9\x5c\x9a\x34\
+\xce\x3c\x0e\x64\x9d\x22\x4e\x03\x65\xce\xd2\xfa\x39\xda\xfe\x29\
+\x50\x82\x48\xfa\x84\xec\xe0\x04\xc5\x02\xb2\x11\xcd\x26\x8a\x03\
+\x2b\x45\x1b\xb0\x96\x6c\xc0\x84\x6c\xc0\x90\x6c\xc0\x80\x6c\x40\
+\x35\x5a\xa1\x7d\xde\x73\xec\xe1\x59\x76\x31\x5c\x5a\xea\xd8\x41\
+\x81\x3d\x0c\xfd\x1d\x86\xbd\xbe\x85\x71\xbb\x93\x30\x6b\xba\x91\
+\xce\x7b\x1e\xcc\x6b\x2f\x82\x69\x8b\x5d\x30\x69\x7d\x08\xa6\x64\
+\x27\xa6\x2d\xf7\xc2\x34\x77\x37\x4c\x9b\xef\x80\x69\xce\x56\x8a\
+\x25\x9b\xe8\xb5\xeb\x49\xe7\xb5\x30\x6b\xb8\x9a\x5e\xbb\x13\x06\
+\x83\x7f\x7c\x7a\x8c\x1c\xbf\x86\xff\x0a\xa3\x4e\xa7\x61\x42\xaf\
+\x33\x6d\xb0\x14\xa6\x8d\x96\xe1\xda\xbd\x5f\xde\xb2\xfe\x3f\x3c\
+\xd5\xff\xf2\x4f\x50\xcd\xba\x27\xda\xc0\x54\x62\x12\x31\x87\x3e\
+\x93\xfa\x5c\x35\x93\x98\x4e\x4c\xa3\xe3\x26\x8c\x08\x93\xb1\x0f\
+\x61\x49\xc7\x6c\x59\x6d\x12\xac\x3a\xec\x80\xe3\x8c\xef\xe1\xb6\
+\x96\x7c\x96\x62\x77\x00\xe9\x16\x42\x7e\x1d\xbc\xe1\x3e\xbc\xf3\
+\x0e\x23\x68\xf6\xe7\x48\x3b\x46\x3a\x7f\x0c\x54\x22\x6d\xb3\x49\
+\xe3\x5a\x17\x80\xda\x97\x80\x3a\x97\x81\x9a\x44\xf5\x6b\x40\x15\
+\xa2\xc2\x75\x20\xe3\x6b\x20\xf5\x0b\x20\x86\x5e\x1f\xbc\x5f\xb4\
+\x01\xd7\x0f\x00\xfb\x85\x80\x15\x1d\x8b\x29\xe5\x02\xc6\xe3\x45\
+\x1b\x50\x51\x3e\xa0\x92\xed\x60\xb4\xd4\xbf\x79\x3a\x8f\x95\xb6\
+\xf1\x22\x7b\x18\xa9\xf3\x78\x38\xf4\xdb\xcb\x08\x3d\xfb\x1a\xa9\
+\xf8\x2c\xe5\xe7\x8e\x96\x8e\x51\x09\x1f\xf7\x10\xea\xe3\xa1\x12\
+\xc3\xef\xe1\xbb\x1f\xff\x7c\xeb\xfa\xcb\x31\xe0\xa3\x2b\xa4\xff\
+\xfc\xef\x49\x73\x62\x16\x31\x9d\x20\x9f\x53\xcd\x27\x28\x07\x93\
+\x6d\xc1\x90\xfa\xdf\x88\x35\xa0\x31\xd9\x62\xce\x5f\xb0\x99\xf9\
+\x04\x0e\xcb\x21\x6a\x4f\x31\x3b\x90\x62\x79\x04\xe9\x16\xf7\x89\
+\xe8\xc7\x25\xc8\xb7\x33\xc8\xb7\x2b\x7c\x06\xd4\x20\x4d\x1b\x5e\
+\x01\x9a\x91\xce\xb9\xdf\x01\x2d\x89\xdc\x5b\xb4\x7e\x1b\x68\x74\
+\x17\xa8\x4b\x54\x27\x2a\xd2\x7a\xc6\xb7\xf4\x7e\xb2\x8f\x48\x8a\
+\x03\xfe\xbb\x29\x1f\x5c\x43\x31\x60\x19\xe5\x82\x74\x1c\xe6\x94\
+\x0b\x18\x53\x2e\x60\x98\x4f\xc7\x24\xdb\x80\x8c\xb2\x8f\x47\xeb\
+\x41\xdf\x98\x21\xeb\x24\xeb\x27\xdb\x80\xbe\x58\x22\x2f\x95\xfa\
+\x2a\xed\x4d\xa9\xb5\xf2\xb8\xf8\x38\xc7\xeb\x30\x4c\xd4\x5d\x35\
+\x52\xe4\xc6\x4f\xef\x42\x7f\xd1\x06\x04\xfd\x17\xde\x25\xbd\x89\
+\x79\xc4\x2c\x82\xfa\x5b\xb5\x84\xa0\x1c\x4c\xb5\x50\xb4\x05\x43\
+\xc2\x98\xec\xc1\x8c\x6c\xc3\x8a\xb6\xdb\x93\xf6\xce\xa4\xbd\x37\
+\xe5\xed\x01\x14\xd7\x23\x49\xeb\x84\xaf\x80\x92\xe4\xc3\x99\xa4\
+\x75\xf9\xab\x40\x35\xa2\xee\x37\x40\xd3\x1b\x40\x2b\xd2\xbb\x03\
+\x69\xdc\xf9\x1e\xd0\x89\xe8\xf0\x03\xd0\x9a\xc8\x21\x1a\xdd\xa7\
+\x78\xf0\x00\xa8\x4a\xdb\xb3\xe8\x75\x25\x28\x2e\xc4\x90\x0d\x05\
+\x53\xbe\xe0\x4d\x31\x40\x4d\xb9\x80\xed\x02\xb2\x3b\xb2\x3f\x93\
+\x49\x74\x2c\xe3\xa5\x7e\xd5\xf5\x2d\xa5\xfe\xca\xc7\xba\x3a\xc9\
+\xda\x29\x5f\xa3\xd4\x54\x1f\x4a\x9f\xd6\xd5\x7a\x8c\x74\x3c\x32\
+\xb2\xce\x13\x15\x4c\x92\x98\xcc\x76\x44\x3e\x36\x8a\xc8\x23\x46\
+\x7f\x8f\x9b\xef\x4c\xff\x1f\xf0\xd1\xd7\xa4\xff\xe2\x3b\xe4\xf3\
+\xc4\x02\x62\x1e\xb1\x8a\x3e\x93\xfa\x5c\xb0\x83\xf7\x21\xc4\x03\
+\x43\xb2\x07\x13\xc2\x9c\x6a\x33\x1b\xd2\xde\xf1\x23\xc0\x7d\x0b\
+\xe0\x4b\xf1\x3e\x94\x7c\x3d\xf6\x4b\xd2\x8d\x74\xce\xbc\x43\x7e\
+\x4c\x64\x13\x75\x89\x26\xdf\x93\xf6\xa4\x6b\x47\xd2\xb9\x1b\xe9\
+\xfc\xde\x03\x91\x2e\x44\x3b\x22\xf7\x21\xd0\xf8\xa1\xa8\x7f\x35\
+\x7a\xbe\x1c\xbd\x27\x8d\x6c\x28\xf6\x3c\xe9\x4f\x31\xc5\x67\x33\
+\xd9\xd9\x07\x0a\xfd\x29\x06\x18\x52\x7f\x1a\x8c\xd7\xe9\xf3\xb1\
+\xcf\x41\x5f\x5c\xd0\x1d\x3b\xc6\xe8\x6c\xd7\xd5\x57\xe9\xd7\xf2\
+\x67\xe6\x4b\xc8\x7a\x4f\x50\x68\x3d\x59\x62\x8a\xc4\x54\x09\x1e\
+\x4f\x47\xdf\x15\x19\x2b\x72\xeb\xa7\x3f\x0b\x7d\xf7\xf9\xdb\xd4\
+\x7f\x35\xeb\xbf\xe4\xb6\xc8\x22\x62\x1e\xf1\x21\x7d\x26\xe5\x5e\
+\xaa\x0f\x24\x3b\x20\xcd\x0d\xc9\x16\x4c\x08\x0b\xd2\xde\x96\xec\
+\xc3\x69\x3d\xc5\x66\x8a\xfb\xfe\xe4\xfb\xe1\x14\xe3\xe3\xc9\xe7\
+\x4b\x92\x76\x59\xa4\x73\x15\xd2\xb1\x16\xd1\x80\xc8\x21\x5a\x93\
+\xb6\x9d\x88\xae\xa4\xf3\x7b\x0f\xc5\x65\x27\xa2\x2d\xd1\x82\x68\
+\x24\xe9\x5f\x95\x5e\x5b\x96\xf5\xbf\xaa\xa3\xff\x4a\x85\xfe\x53\
+\x24\xfd\x27\x28\xfa\x7f\x9c\x1e\xc6\xe2\xd9\x76\xa1\x1b\xa3\xc7\
+\x3c\xe7\x39\xdd\xfd\xe6\xa3\xb0\xee\x4a\xcd\x27\x2a\x74\x67\xad\
+\xa7\x49\x4c\x97\xa0\xbc\x5a\xc8\xab\xc6\x91\x8f\x8d\x25\xf2\xef\
+\x08\x8f\x6f\xfe\xf4\xc7\x5b\xd5\x9f\xff\xbe\xe0\xa9\xfe\x94\x9f\
+\x2e\x53\xe8\xbf\x80\xa0\x31\x57\xb5\x1a\xa2\x1d\x48\x36\x60\x48\
+\x98\x10\xe6\xa4\xbd\x0d\x3d\xa7\xa6\x1a\xcd\x63\x27\xe9\x7f\x54\
+\xd2\x9f\xc6\xf6\x34\x8a\xef\x59\xa4\x61\x15\xd2\xb2\x26\x69\x5a\
+\x9f\x68\x46\xb4\x22\xda\x4b\x9a\x77\x96\x96\xed\xa5\xed\xfc\x7c\
+\x83\x47\x64\x2f\x0f\x45\xbb\x29\x43\x39\x40\x2a\xf9\x7f\x34\x8d\
+\x27\x41\xa4\xbf\x17\xc7\x7f\xd9\xff\x67\x49\xfe\x3f\x59\xea\xf7\
+\xfc\xe7\xa0\xab\x99\x3e\x2d\xf5\xa1\xbb\x1f\x59\x63\x25\xba\xf1\
+\x5c\xe9\xdf\xb2\xde\x33\x14\x7a\xcf\x56\x2c\xe7\xf2\x7e\x6f\x8b\
+\x8c\x17\xb9\xf9\xf8\x6d\xeb\x7f\xef\xa9\xfe\x57\x59\xff\x5b\xe4\
+\xe3\xc4\x62\x62\x11\x41\xbe\xad\xa2\xb1\x5d\xf5\x91\x64\x03\xa4\
+\xb9\x21\xf9\xa0\x31\x61\x4e\xeb\x36\xf4\x9c\xd3\x46\x8a\xff\xbb\
+\x28\xfe\x93\xfe\xa1\xe4\xab\xb1\x9c\xbb\x93\x76\x99\xa4\x61\x05\
+\x22\x9b\x7d\x5a\xf2\xed\xe6\x92\xd6\xec\xef\xed\xa4\x65\x6b\x69\
+\x3b\xc7\xfe\xba\x44\x0d\xb2\x99\x8a\x14\x3b\x32\x6e\x02\xc9\x94\
+\x47\x44\x9e\xa1\xbc\x82\x6a\x00\x4f\xb2\x33\x27\xb2\x3b\x1b\xca\
+\x43\xcc\xa9\xff\x8c\xa7\x49\xfa\x4f\x54\xd8\x80\x6e\x7e\x25\xa3\
+\xd4\xf0\x59\xda\xea\x32\x41\x67\x5d\x77\xfc\x9e\xf4\x0c\xbd\x65\
+\x66\x4a\x5a\xcb\x7a\x33\x73\x24\xe6\x49\x8c\xa7\x3e\x9e\x20\x31\
+\xf1\x36\x6e\xbd\x03\xfd\x65\x1b\x58\x7d\x8d\xf4\x5f\x71\x93\x6c\
+\x80\x78\x9f\x58\x42\x90\xcf\xa9\xa8\xdf\x55\xeb\x20\xc6\x02\xb2\
+\x03\x03\xc2\x98\xb4\x37\xa3\xa5\x35\x6d\x73\xe0\xda\x8c\xf4\xd7\
+\x50\x5d\x1f\xc4\x75\x3b\x8d\xff\x49\x94\xd7\x97\x26\x0d\xcb\x3d\
+\x78\x1a\x03\xea\x4a\x36\x90\x23\xc5\xfa\x5c\x69\x99\xf3\x48\xd4\
+\xbe\x1e\x51\xf3\x81\xe8\xfb\x65\x29\x57\x28\x49\xfb\x88\xbf\x48\
+\x31\xe5\x24\xe0\x47\xf9\xbf\x3b\xd9\xa2\x23\x8d\x39\xd6\x94\x7f\
+\x9a\xcd\x14\xf5\x37\x90\xf5\xd7\xe7\x9b\x13\x74\xb6\x3f\x4b\xe3\
+\x67\xbd\x5e\x8e\xe3\x4a\xff\xd6\xf5\x71\x65\x3c\x9f\xa1\xa3\xb9\
+\xac\xf5\x5c\x85\xde\xf3\x25\x28\x86\x09\xf9\xf4\xc4\x5b\x22\x93\
+\x45\xde\x95\xfe\x3c\x0e\x08\xfa\x7f\x70\x83\x6c\x80\x58\x4e\x2c\
+\x25\xa8\x96\x57\xd1\xb8\xab\x22\x1f\x17\x62\x01\x61\x40\x3e\x6f\
+\x44\x98\x92\x4d\x58\x92\x6d\xd8\x91\xfe\xce\x14\xff\xbd\x29\x46\
+\x07\x9c\x26\xbd\x48\xb3\x78\xaa\xe1\x4b\xd0\xf8\x9d\x41\x5a\x96\
+\xe7\xf1\xfc\xa1\x68\x03\x1c\x07\x1a\x48\x76\xc0\x9a\x37\x7e\x24\
+\xae\xd7\x95\xb4\xe7\x71\xbf\x3c\xe5\x88\x19\x14\x3f\x52\x68\xec\
+\x8f\xfe\x94\x6c\x8a\xe2\x8a\xcf\x36\xb2\x31\xb2\x35\x7b\xca\x41\
+\x2d\xa9\xff\x4c\xa9\x7f\x8d\xa8\xdf\x0d\xa6\x48\x9a\xc8\x1a\x29\
+\x7d\x74\x02\x8a\xe6\xdd\xcf\x7a\xac\xab\xb1\xec\xdb\xba\xfe\xad\
+\xf4\xf1\x99\xcf\xd1\x7b\xae\x42\x67\xa5\xde\xcc\x22\x88\xf5\x14\
+\xd7\x55\x93\x6f\x8a\x4c\x11\x97\xef\x4e\xff\x7b\x58\x7d\x9d\xf4\
+\x5f\x79\xe3\xa9\x0d\x2c\x23\x28\xaf\x53\x51\x5d\xa7\xda\x22\xd9\
+\x01\xe9\x6d\x40\x18\x12\x26\x84\x05\x61\x43\xdb\x9d\xe8\x35\xee\
+\x14\xa3\xb5\xc7\x81\x10\x1a\x03\xa2\xa8\x6e\x4b\xa4\x1a\x20\x8d\
+\xfc\x38\xf3\x07\xd1\x06\xaa\x90\xc6\xd5\x15\x76\xc0\xd4\x96\x74\
+\xaf\x2e\xf9\x7d\xf9\xef\xc5\xba\xa1\x04\xd5\xfe\xf1\x54\xfb\x87\
+\x93\x3d\xf9\xef\xa3\xfc\x82\x6c\xcc\x89\x62\x8e\x2d\xe9\x6f\x41\
+\x7e\x64\xc2\xfa\xcf\x10\xe7\xa2\x54\xb2\x0d\x28\xfd\x53\xa9\xa3\
+\x72\xbb\x3e\xad\x95\x79\x9a\x52\x6b\x7d\x31\x5d\x37\x9e\xcf\xd5\
+\xd1\x5c\xf6\xf1\x05\x12\x8b\x14\x7a\x33\xef\xeb\x20\x6b\x3f\x55\
+\xe4\xd6\x93\x3f\x0a\x7e\xb7\xe8\x19\xf7\x7f\xff\x63\xfa\x7f\x78\
+\xfd\x11\x8d\xef\xdf\x91\xfe\xc4\x4a\x62\x39\x41\x71\x5d\xb0\x01\
+\x86\x63\xc1\x26\xd1\x0e\x0c\x29\x1e\x18\x13\x66\xb4\x6e\x45\xeb\
+\xf6\xa4\xbf\xcb\x5e\x8a\x01\x34\x06\xf8\x93\x66\xa1\x9f\x53\xdd\
+\x4e\x75\x40\xe2\x77\x62\x2d\x90\xfe\xbd\x18\xd3\x59\xdf\x8a\x44\
+\x65\x05\xbc\x5e\xfe\x8e\x98\xef\xa5\xdf\x10\x73\x3e\x8e\xfb\x11\
+\x34\xee\x07\x1e\x94\x7c\x9f\xe2\x8d\x03\xd5\x1c\x56\xe4\x3f\x66\
+\x3c\xf6\x93\xf6\x86\xd3\x24\xff\x97\xb5\x54\x2e\x75\x6b\x2f\xe5\
+\xf3\x53\x74\x96\xcf\xd2\x5c\x37\xa6\xcf\x44\xe1\x71\x5c\x37\xae\
+\xcb\x3e\xae\xd4\x7b\x89\x02\xd6\x7b\xa9\x04\xd7\xd3\xcb\xf9\x18\
+\x6e\x88\x4c\x23\xa6\xde\xa0\xfc\xaf\xf0\xef\x62\xfd\xd3\xfa\xdf\
+\xbb\xf7\x7d\x61\xfd\x57\x4a\xfa\xaf\x50\xe8\xcf\xfe\xbf\x4d\xa1\
+\x3f\xe9\x6e\x40\x18\xd1\x58\x60\x42\x58\x6c\x12\x63\x80\x23\xbd\
+\xce\x8d\xe7\xeb\x79\x1c\xa0\x31\x3b\x8c\xf2\xf6\x68\x1e\x0b\x2e\
+\x8b\xb1\xbc\x04\x8d\x09\xa5\xbe\xa1\xbc\x80\xe7\x77\x65\x68\x7b\
+\x69\x22\x8d\x6c\x25\x95\x72\xbd\x44\xb2\x9b\x58\xca\x21\xc2\x29\
+\x8e\x04\x92\xdf\x6b\xb6\x8a\xf3\x7e\x4e\x5c\x6b\x52\xbf\x5a\x50\
+\xdf\x9b\x90\x36\x46\xa4\x9d\x81\x1c\xe3\xf5\x8d\xed\x72\x5e\xa7\
+\x7c\x4e\x39\xbe\x4f\x44\xd1\xb1\x41\x5f\x2c\xd0\xad\xd9\xe4\x3c\
+\x5e\x8e\x01\xba\xf1\x5e\x69\x07\x4a\x1b\x90\xfd\x7d\x99\x0e\xd3\
+\xa8\x8f\xa7\x12\xd3\xbf\x13\x1e\xdf\xfc\xe9\xed\xeb\x2f\xdb\xc0\
+\x87\xd7\x48\xff\x15\xdf\xd2\x71\xd1\xb1\x2c\x25\x96\x7c\x27\x6a\
+\xbe\xe5\xa9\xee\x72\x2d\x60\x40\x75\x9f\xe1\x2a\x29\x0f\xa4\xc7\
+\x96\xb4\xdd\x8e\xf2\x01\x35\xd9\x81\x3b\xc5\x0a\x0d\xd9\x41\x00\
+\xd9\x41\x28\xd9\x41\x24\xc5\x83\x18\xb2\x85\x78\xaa\x0d\x13\x2f\
+\x50\x6e\x48\x36\x91\x4c\xcb\x64\xd2\x3a\x89\xb6\x25\xd1\x78\x91\
+\xc0\xf3\x46\x1f\xd3\xb8\x71\x8c\xec\x86\x7c\x3e\x90\xf2\x3d\x2d\
+\xed\xcb\x93\x3e\xcb\x99\xb4\xb7\xe3\x79\x7f\xea\x6f\x33\xd2\xc3\
+\x98\xf4\x31\x9c\xc0\xd7\xa5\xa0\xbf\x96\xd3\x57\xaf\x8f\x45\xe1\
+\x7a\x50\x5f\xee\xaf\x5b\xd7\x29\xed\x62\x0a\x0a\xe7\x03\x72\x2e\
+\xa0\x1b\x23\xe4\x31\x41\x8e\x0b\xba\xb6\xb0\x48\x11\x07\x58\xff\
+\xc9\xd4\xc7\x53\x24\x1b\x20\xfd\xbf\x7b\x97\xfa\x5f\x25\xfd\x97\
+\x90\xfe\x8b\x89\x45\xc4\xfc\x6f\x9f\xe6\xfe\xeb\x44\xdd\x0b\xe6\
+\x03\x09\x03\x3a\x7e\x23\xd2\xc6\x84\x30\xa7\x75\x6b\xaa\x09\xed\
+\xc9\x16\x9c\x79\x3e\x88\x6c\xc6\x87\xe7\x04\xa4\xeb\x40\x61\x94\
+\xc3\x45\x9c\x20\x7d\xc9\x1e\xa2\x4f\x91\xd6\x12\x31\xbc\x4e\xbe\
+\x1e\xc9\x73\x07\x64\x2f\x21\x7c\xff\xc7\x4e\xf1\x7a\x8f\x07\x6b\
+\xbf\x42\xbc\xe6\x63\x4d\x7d\x6a\x3e\x43\x9c\xf3\x31\x9a\x24\xcd\
+\xf9\x3d\xab\xee\x1f\x07\xfd\xb5\xbf\x6e\x6d\x3f\x1e\xfa\xeb\x7b\
+\x65\xad\xa7\x3b\x8f\xa7\xaf\xce\x9f\xa2\x88\x0f\xca\xbc\x50\x39\
+\x46\xe8\xc6\x06\xd9\x26\x26\x52\x1f\x4f\x96\x98\xf2\x2d\xbe\xfd\
+\xf1\xdd\xe8\xcf\x08\xfa\x2f\xa4\xe3\x58\x20\x31\xf7\xdb\x42\x75\
+\x9f\x30\x0f\xb8\x12\x85\xe6\x83\x0d\xc9\x8e\x8d\x28\xbe\x99\x2e\
+\x15\xe7\x83\xad\x59\x2f\x8a\x09\xce\xf4\x1e\x77\xb2\x1d\x6f\x8a\
+\x1f\x7e\x14\x0f\x02\x48\xd7\x20\xca\x0f\x43\xd9\x16\x48\xe7\x30\
+\xca\x13\xc2\x0f\x8b\x8f\x43\x0f\x88\xf3\xfb\x01\x7c\xdf\x07\x8d\
+\x33\x3e\x3c\x9f\xb0\x46\x9c\xeb\x75\xa0\x7d\xdb\xcc\x13\xe3\xbe\
+\xe9\x34\x31\xee\x1b\xb2\xfe\x72\xcd\xf7\x26\xe8\x8e\x0d\x13\xf5\
+\x2c\x95\x75\x85\x6e\x8e\xf9\xac\x3a\x50\x59\x17\xe8\xd6\xfb\xf3\
+\x51\x38\x47\x60\xfd\x27\x3d\xd5\xff\xfa\xa3\x77\xa7\xff\x2a\xd6\
+\xff\xfd\x6f\xe8\xd8\x88\x85\xc4\xfc\x6f\x0a\x6a\xbe\x02\xff\x97\
+\xe6\x80\x84\xdc\x65\xb9\x18\x03\x0c\x69\x69\x4c\xda\x9b\xd2\xd2\
+\x82\xe3\xc0\x07\x62\x1c\x50\xd3\x98\xe0\x4a\x36\xe0\x49\x71\xdc\
+\x9b\x74\xf5\x25\x3b\xf0\x23\xdf\x0e\xd8\x2d\xda\x83\xb0\x24\xcd\
+\xfd\x69\x9b\x2f\x3d\xaf\xd9\x2c\xce\xf1\xb8\xd1\xe7\xa8\x39\x96\
+\xb0\x3d\xf1\x98\x4f\x3e\x64\xca\xf5\x3e\xf5\xaf\xe1\x54\x45\xcd\
+\xa7\x3b\x86\xbf\x2a\x93\x50\xb4\x1e\xd0\x57\x17\xe8\xd3\x7b\x1a\
+\x0a\xd7\x83\x72\x5e\xf0\xa2\x71\x40\xd6\x5d\xce\x09\x24\xdd\x55\
+\x53\xc5\xe5\x37\x0a\xff\x7f\xc6\xdf\xff\xfe\xad\xfa\x7f\xff\xfd\
+\xdd\xa7\xfe\x4f\xe3\xbf\xe1\x07\xdf\x90\x9e\xc4\x32\x62\x29\x41\
+\xfa\x18\x52\x5e\x67\x48\xfa\x18\x72\xde\xbf\x49\xcc\xfd\xb9\xfe\
+\x33\x24\x7d\x0d\xc9\x4f\x8d\x08\x63\xd2\xdb\x94\x30\x27\xed\x2c\
+\x09\x1b\xae\xd5\xd7\x89\x73\xc3\xae\x9b\xc5\xeb\x43\x9e\xdb\xc4\
+\x6b\x84\x7c\x8d\x58\x23\xe1\xb3\x5d\xb4\x0d\xcf\x8d\xe2\xfc\x0e\
+\xd7\xf8\x6a\xb2\x2f\xbe\x9e\xcc\xb5\x1e\xe7\xfb\xe6\xac\x3f\xf9\
+\x90\xb1\x54\xf3\x1b\x4e\x17\x73\x7f\xb6\x85\x17\x32\x4d\x87\xa9\
+\x3a\xcb\xe9\x7a\x96\x33\x74\x20\x4d\x0d\xa5\xeb\xde\x86\x73\x14\
+\xd0\x71\x19\xce\x93\x20\x7d\x0d\x17\x2a\x58\x2c\x5e\x27\xe3\xf8\
+\x28\xb0\x5c\x62\x85\x38\x7f\x2a\xf0\x21\xef\xff\x9b\x42\x7c\xfb\
+\x63\xe1\xdf\xcb\x7d\x1b\xfa\xcb\x36\xf0\xd1\xb7\x8f\x60\xb1\xf6\
+\x3a\x2c\xd6\x10\x1f\x11\x1f\x5e\x87\x15\x8d\xcb\x02\x87\x24\x28\
+\x86\x5b\x51\xac\xb6\x22\xff\xb5\x22\xff\xb5\x22\xdf\xb5\x22\x1b\
+\xb1\x26\x1d\x6d\x48\x47\x3b\xc2\x7e\x87\x38\x1f\xe0\xcc\xf5\xc0\
+\x76\xf1\xda\x80\x17\xbd\xc6\x87\xd0\xee\x91\xd8\x2d\x41\xcf\x69\
+\x77\x88\x35\x9e\x17\xd9\x89\x07\xd9\x81\x1b\xd9\x81\xf3\x47\x62\
+\xbd\xef\x40\xb1\xc4\x8e\xaf\xf9\x73\x2c\xa0\xfe\xb4\x5a\xf4\x1c\
+\x16\x2a\x96\xfa\x1e\x2f\xd2\x79\xac\x64\xb1\xb4\x5c\x22\xc1\xb6\
+\xb7\x54\x82\x1f\x2f\x53\x40\x1a\x5a\xd1\x71\x59\xad\x54\xb0\x4a\
+\x82\x8e\xd9\x6a\x8d\x04\xf9\x87\xd5\x3a\x09\x3a\x27\xab\x0d\x12\
+\x52\xcd\xcc\x4b\x8b\x05\xdf\x14\xe2\xc6\xe3\x77\xa7\xff\xba\x1b\
+\x8f\x60\xbf\xf1\xba\xc8\x06\x62\xdd\x75\xa8\xa9\x06\x57\x53\xfe\
+\x2e\x2c\x4f\x29\xa0\xbc\x4d\x4d\xf9\x9c\x9a\x72\x37\x35\xe5\xec\
+\xea\x23\xa4\x19\x8d\xe7\x2e\x64\x2b\xae\xb4\x74\x27\x3c\x68\x9b\
+\x17\xe1\x43\xdb\x34\xb4\xd4\xd2\xeb\xfc\x8e\x8a\xf8\x1f\x12\xf1\
+\x3b\x28\xa2\xe5\x7b\x7c\x08\x1f\xb2\x0d\xaf\x9d\xe2\xf5\x44\xae\
+\x23\x5c\x29\x6e\xb8\xf0\x75\x3f\x42\xbd\x51\xc1\x06\x05\xeb\x25\
+\xd6\x89\x63\x4e\x01\xeb\x14\xcf\xc9\x6c\x78\xc6\xe3\x75\x3a\xfb\
+\x67\x36\x89\xf5\xcc\x33\xa1\x63\x53\x6f\x95\xd8\xa6\x58\x32\x74\
+\xec\xea\xed\xd2\x52\x86\xce\x4b\xbd\xab\x30\xf6\x4b\xae\x17\xe2\
+\xe6\x93\xb7\xac\xff\xdd\x3b\x05\x36\xb0\xf1\xe6\x23\x8a\xd5\xd7\
+\x0b\xe1\x4d\xf5\x99\xf7\xa7\xc4\x79\x09\xaa\xe3\xbc\xa9\x3e\xf7\
+\x3e\xab\x58\x32\x64\x1f\xde\x64\x27\x3e\xf4\x58\x43\x4b\x2d\xe1\
+\x4b\xf5\x9c\xdf\x69\x71\x3e\x88\xe1\xb9\xe1\x40\x22\x88\x21\x1b\
+\x0a\xfa\x58\x5c\x06\x9e\x12\xe7\x0b\x02\xc8\x96\xfc\xd9\x46\xc8\
+\x56\x7c\xd9\x5e\x8e\x88\x76\xe3\x73\x58\x9c\x57\xf2\xa6\x3c\xd1\
+\x7b\xbf\xc4\x3e\xc5\xe3\xbd\x0a\xf6\x48\xcb\x7d\x12\x7b\x74\x9e\
+\x97\x5f\x23\xb3\xef\x39\xcf\xeb\x6e\xdf\xab\xb3\x6f\x7d\xeb\xf2\
+\x63\xe5\x71\x2a\xd7\x65\x0e\x88\xb8\x2e\xbf\xfe\x94\x15\x6f\x5f\
+\xff\xbb\x0a\xfd\x37\xdd\x7c\x48\x71\xf8\xba\xc8\x56\x62\xcb\x75\
+\x04\x51\xad\x1e\x74\x41\xe2\x73\x05\x9f\xe9\xf0\xa9\x04\x5f\xab\
+\xa7\x65\x30\xd9\x49\x08\x11\x2a\x43\xdb\xc3\x88\x70\x7a\x1c\x7e\
+\xb6\x28\x61\x64\x3f\xa1\xa7\x25\xc8\x1e\x42\x88\x60\x8a\x2f\xc1\
+\x64\x17\x41\x27\x5e\x81\xe3\x3a\x1c\x13\xaf\x1f\x14\xe2\x88\xc4\
+\xe1\x57\xe0\xc8\x6b\xbe\x4f\xf7\xbd\x3a\xf8\xac\xbc\x5e\x88\x5b\
+\xef\x40\x7f\xd9\x06\xb6\xde\x7a\x88\xc0\x1d\xd7\x11\xb8\x5d\x82\
+\xec\x20\xfa\x4b\xaa\xcf\xbf\xd0\xe1\x92\xc4\x45\x89\x0b\x12\x9f\
+\x17\x26\x86\x21\xdb\x88\xd5\xe5\x53\x89\xf3\x0a\xce\x49\xcb\x4f\
+\xc4\xfb\xbd\x98\xe8\xb3\x0a\xce\x28\x38\xad\xc3\xc7\xcf\xe1\x94\
+\x1e\x4e\x3e\x87\x13\x6f\x97\x40\xca\xb1\x04\x56\x8b\xbc\x2b\xfd\
+\x99\xed\xa4\x7f\xc4\x8e\x6b\x85\x48\xb9\x02\x91\xcb\x12\x5f\x49\
+\x7c\xa9\x87\x2f\x24\x2e\x49\x5c\x14\x49\x25\xdb\x48\xbd\x28\x71\
+\x41\x0f\x64\x13\xa9\x9f\x4b\x90\x5d\xa4\xe8\xe3\xbc\x82\x73\x3a\
+\x7c\xa2\xe0\xec\x4b\x72\xe6\x19\x9c\x7e\xbb\x44\xac\xa1\x7e\x5e\
+\xfb\x14\xd6\xff\xb7\xdf\x7e\x2b\xe0\x9f\xd6\xff\xce\x9d\xdb\x05\
+\xfa\xef\xbc\xf5\x00\x71\x3b\xaf\x15\x22\xf3\x2a\x9e\xf2\xb5\x1e\
+\xae\x48\x5c\x96\xf8\x4a\x87\x2f\x15\x90\x4d\x64\x7e\x21\x71\xe9\
+\x19\x5c\x54\x70\x41\xc1\xe7\xcf\xe1\x33\x1d\x3e\xd5\xe1\xfc\x6b\
+\x70\xee\xed\x10\xbf\xfe\x5a\x21\xde\x89\xfe\x92\x0d\xec\x21\xfd\
+\x53\x49\x73\x25\x95\xaf\xe1\xc5\x5c\x55\xf0\xb5\x1e\xae\x48\x5c\
+\xd6\x03\xd9\x48\xe5\x2f\x15\x4b\x99\x2f\x9e\xc3\x25\x1d\x2e\xbe\
+\x80\x0b\xcf\xe0\xf3\x17\xf0\xd9\x3f\x0c\xc7\xbb\x8d\xd7\x0a\xf1\
+\x54\xff\x5f\x85\xdf\x09\x79\x1b\xfa\xcb\x36\xb0\xef\xf6\x03\xa4\
+\xef\xba\x56\x88\xda\xdf\xe0\xe5\xb9\xae\x87\x6b\x0a\xae\xea\xe1\
+\x6b\x05\x57\x9e\xc1\x65\x1d\xbe\x7a\x01\x5f\xea\xe1\x8b\x37\xe0\
+\xd2\xdf\x8c\x62\xdf\x19\x5b\xae\x15\xe2\xd6\x93\xdf\x04\xdd\x65\
+\xfe\x71\xfd\x6f\xdf\x2a\xb0\x81\x83\xb7\xef\xa3\xfc\xee\x6b\x7f\
+\x2f\xbb\x5e\xc0\x4e\x05\x3b\x9e\xc1\xf6\x57\x64\xdb\x2b\xb2\xf5\
+\x1d\xf0\x8c\x63\x79\xdb\xfa\xdf\x66\xfd\x25\x1b\x38\x4c\xfa\x57\
+\xdd\x73\xed\x9f\x67\xf7\x33\xd8\xf5\x0c\x76\xbe\x22\x3b\x5e\x91\
+\xed\x2f\x4f\x35\x66\xdb\x2b\xb2\xfd\xe5\xb9\xf5\x84\x75\xff\x45\
+\x80\xbf\x03\xf4\x6d\xe8\x2f\xdb\xc0\x51\xd2\xbf\xf6\xde\x6b\xef\
+\x86\x3d\xaf\xc0\xee\x97\x60\xd7\x2b\xb2\xf3\xbf\x83\x5b\x8f\x7f\
+\x15\x74\x97\xf9\xc7\xf5\xbf\x75\xb3\xc0\x06\x4e\x90\xfe\x8d\xf6\
+\x5d\xfb\xef\x67\xaf\x0e\x7b\xfe\x77\x60\xff\x7f\xeb\xfa\x2b\x6c\
+\x40\xce\x05\x94\x75\xa1\x72\x8e\x50\x79\xbd\x50\x79\xef\x88\x12\
+\xe5\xdf\x14\x29\xff\xbe\x54\xf9\x5d\x13\xca\xef\x9d\x53\x7e\x07\
+\xa9\xf2\xf7\x08\x94\xbf\x4d\xa6\xfc\x9d\x72\xe6\xa7\x9f\x94\xfc\
+\x54\xc0\xe3\xc7\x4a\x1e\x17\xe2\xc9\x13\x25\x4f\xf4\xf2\xf3\xcf\
+\x4a\x7e\x7e\x69\x7e\xf9\x45\x1f\xbf\xbc\x24\x45\xdf\x2b\xef\xf7\
+\x9f\xd6\xff\x96\xac\xbf\x64\x03\xca\x7c\xf0\xee\x3f\x6c\x03\x45\
+\xed\xe0\xe1\x33\xed\xe0\xa9\x0d\xbc\xb9\x1d\xbc\xac\x2d\xbc\x89\
+\x3d\xfc\x5d\xbc\x86\xfe\xfc\x1d\xb0\xfc\x5d\xb0\xfc\x9d\xb0\xfc\
+\xdd\xb0\xfc\x1d\xb1\xfc\x5d\xb1\xfc\x9d\xb1\xbd\x8b\xe8\x7f\xf3\
+\xc6\x53\x1b\x50\xe4\x02\x7f\x87\x0d\x28\xff\xb6\x4c\xbf\x0d\xe8\
+\x8b\x05\xfa\x6c\xe0\xf5\xed\xe0\xef\xb4\x85\xa2\xf6\xf0\xcf\xdb\
+\x85\x1e\xfd\x5f\xf4\xfd\xbf\xaf\xa4\x3f\xeb\xf4\x76\x6d\xe0\xe5\
+\xc7\x83\x97\x8b\x05\x7f\x9f\x1d\xbc\xaa\x2d\xbc\xd8\x2e\x5e\x1f\
+\xde\xe7\x33\xea\xbf\xbf\x55\xff\xe2\xf6\xef\x6a\xaf\xa1\x7f\x45\
+\x95\xf8\x1b\xc2\xfc\xdb\x71\xbd\xde\xf5\xf1\x17\xb7\x37\x6b\x2a\
+\xf1\xf7\x7f\x3a\x49\x9a\x56\x7c\x8e\xfe\xfc\x9b\x40\xfc\xdb\x40\
+\xe5\x55\xe2\xef\x07\xf3\x6f\x46\x75\x7f\xd7\xc7\x5f\xdc\xde\xac\
+\xb1\x86\x92\x96\x8d\x25\x6d\x75\x7f\xff\x89\xe1\xdf\x02\xe3\xdf\
+\x04\x8b\x22\xca\xa8\xc4\xdf\x0c\xcd\x25\x3a\x9e\x3c\x79\xf2\x04\
+\xb5\x93\xc5\xfc\xfb\x60\xed\x54\xe2\x6f\x7f\xe5\x4a\x9a\x96\x91\
+\x34\x56\xfe\xfe\x1b\xff\x06\x20\xff\x16\x20\xff\x26\x20\xff\x4e\
+\x34\xff\x66\x78\x15\xa2\xbe\x54\x33\xf0\x7b\x5b\x29\x68\x5d\xcc\
+\x7f\x3d\xb2\x56\xb9\x92\x86\xf5\x25\x4d\xd3\x24\x8d\x95\xbf\xff\
+\xc8\xbf\x01\xca\xbf\x05\xca\xbf\x09\xea\x4b\xc4\x10\xa5\x54\xe2\
+\x6f\xc5\x55\x23\x6a\x10\xb5\x8a\xf9\x57\x52\x43\xd2\xb0\x82\xa4\
+\x69\x8c\xa4\xb1\xf2\xf7\x5f\x8d\x54\xe2\x3c\x00\xc7\x03\xb6\x0b\
+\x7f\x95\xf8\x3b\xc1\x3c\x4f\x90\xa2\x12\x6d\xa6\x64\x31\xff\x4a\
+\xd2\x24\x0d\x13\x24\x4d\xfd\x25\x8d\x6d\x25\xcd\x59\x7b\xfe\x0d\
+\x68\xb6\x03\x0b\x95\x98\x13\xb8\xa8\xc4\xfc\x80\xed\x84\x7f\x2b\
+\x38\x48\x87\xe0\x62\xfe\xeb\x51\xea\x15\x20\x69\xe9\x2d\x69\x6b\
+\x27\x69\x6d\x2c\x69\x6f\x20\x2d\x79\x2c\x30\x57\x89\xe3\x02\xcf\
+\x0d\x3a\xaa\xc4\x38\xe1\x5c\xcc\xbf\x1a\xb5\xa4\xa5\xbd\xa4\xad\
+\xb9\xa4\xb5\xac\xbd\x4a\xf5\xd4\x06\xd8\x26\xe4\xdf\x04\xb3\x90\
+\xb0\x2c\xe6\x5f\x8d\xac\xa3\x3c\xd7\xaf\xf4\x7b\x65\x33\x50\x3d\
+\xb5\x03\x23\x05\xc6\xc5\xfc\xab\x51\x6a\x29\xeb\xae\xab\xbd\x6e\
+\x33\x28\xe6\x7f\x92\x22\xed\x6f\x9c\x6a\x1a\x6a\xa0\x3b\xf5\x54\
+\x68\xf5\x2f\x95\x2a\x5d\xb9\xfe\x87\xce\xfa\xaf\x2a\x95\x46\xb9\
+\xfe\x90\x32\x95\x37\x5c\x37\xfb\x07\xd7\x7f\xe5\xde\x53\x1c\xf0\
+\x50\x5e\x57\xf4\x80\x4e\xf7\xfe\x25\xae\xa7\x5f\x2b\xdc\xfd\xe9\
+\xfb\x0b\xaf\x6b\x86\x16\x5e\xb7\x53\xfd\x6f\xaf\x6b\x74\xd6\xd3\
+\x75\xd6\x87\xe8\xac\xa3\xf0\xaa\x81\xce\xba\x46\x67\xdd\xee\x05\
+\xeb\x66\x3a\xeb\x46\x2f\xd8\xbf\xee\xe7\x17\x39\x3e\xdd\xe3\xd7\
+\x3d\x3f\xdd\xf3\x37\x7b\xc1\xba\x91\xce\xba\xbe\x31\xbb\xb8\x15\
+\xb7\xe2\x56\xdc\x84\x36\xb4\xf0\xaa\xc1\xfe\xc2\xeb\x46\xbf\x16\
+\x5e\xd7\xfc\x1f\x16\x78\xd3\x88\
+\x00\x00\x38\xc7\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x7d\x07\x7c\x55\xf5\xd9\xff\x45\x6c\xa1\
+\x5a\xff\xf6\x6d\xb5\x7d\xfb\xfa\xb6\xda\x3a\x5e\xad\xd5\xd6\xaa\
+\xd5\x3a\xa0\x5a\xad\x03\xb7\xa2\x88\x28\x7b\xca\x0a\x23\x61\x85\
+\x04\xc8\xde\x7b\xe7\x66\xef\xbd\x77\xc8\x20\x21\x09\x09\x01\x02\
+\x49\xd8\x01\xc2\x26\xac\x00\x61\xe6\xfb\x7f\x9e\xdf\x39\xe7\xe6\
+\xdc\x9b\x1b\x72\xb1\xb6\x26\x9a\x9f\x9f\xc7\x70\xee\x3a\xf7\x9e\
+\xef\xf3\xfb\x3e\xdf\xe7\xf9\x8d\xa3\xd1\x0c\xa3\xff\xac\xad\x35\
+\xf4\xff\x07\x34\x8f\x8e\x1c\xa6\xf9\xa5\x46\xa3\x79\x94\x8c\x1e\
+\xe2\x07\xc5\xe3\xa2\xd1\x73\x43\x6d\xa8\x0d\xb5\xa1\x36\xd4\x06\
+\x6d\x63\x12\x1f\x2e\xdb\xed\xf2\xdf\xdb\xe4\xc7\x87\xda\xf7\xb7\
+\x29\xb8\x8f\x20\xbb\x83\xec\x2e\xb2\xff\x47\xf6\x53\xf9\xf8\xc7\
+\xf2\xf3\x43\x7e\xf0\xfd\x6b\x8c\xe9\x8f\x34\x12\xce\xff\x45\xf6\
+\xdf\x64\xbf\x21\xfb\x2d\xd9\xff\x92\xfd\x4a\x7e\xfc\x4e\xcd\x90\
+\x1f\x7c\xdf\x9a\x82\x3d\xf7\xf3\x7b\xc9\x7e\x47\xf6\x07\xb2\x3f\
+\x93\xfd\x85\xec\x4f\xf2\xf1\xef\xc9\x7e\x4d\xf6\x33\xb2\x9f\x68\
+\xa4\xd8\x30\xe4\x03\x83\xbb\xa9\xb1\xff\xd5\x9d\x77\xde\xf9\xc4\
+\x53\x4f\x3d\x15\xf4\xd7\xbf\xfe\x75\xeb\xab\xaf\xbe\xda\x32\x66\
+\xcc\x98\xbc\xd1\xa3\x47\x2f\xbf\xfd\xf6\xdb\x5f\xa6\xe7\x9f\xd1\
+\x48\x7e\x70\x3f\xd9\x3d\x1a\x89\x0b\xf8\xbd\xb7\x7d\x57\x5f\x7e\
+\xa8\xfd\x4b\x4d\x0f\xfb\x9f\xff\xfc\xe7\xcf\x3f\xfd\xf4\xd3\x7b\
+\x9f\x7b\xee\x39\x10\xf6\xf8\xf0\xc3\x0f\x31\x69\xd2\x24\xcc\x9f\
+\x3f\x1f\x66\x66\x66\x07\xe8\xb1\x15\xf4\xba\x17\x34\x12\x2f\x3c\
+\x48\xf6\x4b\xf9\xbd\x43\x3e\x30\xf8\x9a\x1e\xf6\x0f\x3d\xf4\xd0\
+\xf3\x6f\xbf\xfd\xf6\xbe\x8f\x3f\xfe\x18\x93\x27\x4f\xc6\xac\x59\
+\xb3\x30\x65\xca\x14\x81\xbd\x85\x85\x85\xf8\xcb\x8f\x13\x1f\x94\
+\xde\x71\xc7\x1d\xff\xd4\x48\x71\xe1\x61\x8d\xa4\x0b\x14\x1f\x18\
+\x8a\x05\x83\xa3\xf5\xc2\xfe\xd3\x4f\x3f\xdd\x37\x61\xc2\x04\x81\
+\xb3\xbd\xbd\x3d\xc2\xc2\xc2\x90\x9e\x9e\x8e\x80\x80\x00\x2c\x58\
+\xb0\x40\x60\xff\xc9\x27\x9f\xe0\xad\xb7\xde\xc2\x4b\x2f\xbd\x74\
+\x80\xb8\xe2\x23\x7a\xef\xd3\x64\x0f\x69\x24\x1e\x60\xdd\x38\xa4\
+\x09\x07\x7e\x33\x09\xfb\xdc\xdc\x5c\x54\x55\x55\x89\xbf\xde\xde\
+\xde\xe0\xe7\x19\xfb\x51\xa3\x46\xe1\x99\x67\x9e\xc1\xe3\x8f\x3f\
+\x7e\xfc\xbe\xfb\xee\xfb\x84\x3e\xe3\x29\x8d\xa4\x17\x7f\xae\x91\
+\xf2\xc6\xa1\x38\x30\x70\xdb\x2d\x63\x1f\x11\x11\x01\x17\x17\x17\
+\x98\x9b\x9b\x0b\xfc\x65\xec\xf1\xe0\x83\x0f\xe2\xb1\xc7\x1e\xdb\
+\xff\x9b\xdf\xfc\xe6\x5d\xfa\xac\x27\xc8\xee\xd3\x48\xf5\x82\xdb\
+\xbf\xc3\xdf\x37\xd4\xfa\x6e\xdf\x18\xfb\xe5\xcb\x97\x63\xe6\xcc\
+\x99\xa0\xd7\x83\xb5\x21\x63\x7f\xff\xfd\xf7\xe3\x81\x07\x1e\xc0\
+\xf3\xcf\x3f\xbf\x7e\xe4\xc8\x91\x7f\xd3\x48\x71\x40\xe1\x80\xa1\
+\x18\x30\xb0\xda\xb7\x82\xfd\x1b\x6f\xbc\x81\x17\x5f\x7c\x11\x8f\
+\x3e\xfa\xa8\xc0\x9e\xfd\x80\xfe\x7d\xe5\xe5\x97\x5f\x5e\xa2\x91\
+\xf2\x42\xd6\x82\x5c\x17\x18\x8a\x01\x03\xa7\x7d\xab\xd8\x53\x7e\
+\x88\x67\x9f\x7d\x96\xb9\x1f\x8f\x3c\xf2\x88\xf8\xfb\xca\x2b\xaf\
+\xd4\x68\xa4\x18\xc0\xb5\x21\xae\x09\x0c\xe1\x3f\x30\xda\xbf\x05\
+\xfb\x17\x5e\x78\x01\xd4\xe7\x85\x0e\x78\xe2\x89\x27\xf8\xf8\xc4\
+\x6f\x7f\xfb\x5b\xae\x0b\x70\xcd\x78\xa8\xff\x0f\x8c\xf6\x6f\xc3\
+\x7e\xf4\xe8\xd1\x78\xed\xb5\xd7\x84\x0f\x3c\xf5\xd4\x53\x9c\x0f\
+\x76\x3c\xfc\xf0\xc3\xcf\xd1\x79\x7e\xa1\x19\x8a\xff\x03\xa1\xfd\
+\xdb\xb1\x1f\x33\x66\x0c\xde\x7b\xef\x3d\xf1\x38\x3d\x76\x40\x23\
+\x8d\x13\xdd\x25\x9f\x77\xa8\x7d\x77\xed\x3f\x82\xfd\x47\x1f\x7d\
+\x84\xcf\x3f\xff\x5c\x3c\x4e\xb6\x56\x33\x94\xff\x0f\x84\xf6\x1f\
+\xc5\x9e\x3f\x97\x9e\xcb\xd6\xf4\xe8\xfe\xe1\xdf\xe5\x8f\xff\x81\
+\xb7\xff\x28\xf6\x3c\x2e\xf4\xfe\xfb\xef\x2b\xd8\x0f\xd5\x7e\xbf\
+\xdb\xf6\x1f\xc7\x9e\x6c\x08\xfb\x81\xd1\xbe\x13\xec\xef\xbc\xf3\
+\xce\x21\xec\xbf\xfb\x36\x84\xfd\x0f\xb7\x0d\x61\xff\xc3\x6d\x43\
+\xd8\xff\x70\xdb\x10\xf6\x3f\xdc\x36\x84\xfd\x0f\xb7\x0d\x61\xff\
+\x9f\x6b\xc3\x0c\xec\x36\x4d\xcf\xfa\x27\xb5\xfd\x27\xbf\xcf\x10\
+\xf6\xdf\x7e\x53\x63\xcb\xbf\x91\xaf\x31\xaf\x6d\x19\x21\xdb\xc8\
+\x3e\x6c\x84\xfc\xba\x1f\xcb\xef\x51\xd6\xca\xfd\x3b\xd6\xc8\xf1\
+\xe7\xf1\x9c\x2a\x1e\x57\x1f\xc2\xfe\x5f\x6b\x0a\xde\x0a\xd6\x8c\
+\x23\xd7\xad\xf9\xda\xf2\xd8\xd5\xdd\x1a\x69\x8d\x13\x8f\x63\xf2\
+\xfa\x06\x5e\x0b\xf3\x4b\x03\xbb\x57\x7e\xee\x17\xf2\x6b\x7f\x26\
+\xbf\xf7\x4e\xf9\xb3\x46\x68\x7a\x7c\xe2\xdb\xf0\x87\xdb\xe4\xcf\
+\xbd\x87\xc7\x58\x09\xcb\xbd\x43\xd8\xdf\x52\x53\x30\xe7\x3e\xc4\
+\xfd\x95\xaf\x25\xf3\x28\xe3\xc6\x18\xf2\x6f\xfd\x1f\x8d\xb4\xd6\
+\xed\x01\x8d\xb4\xae\x81\xe7\xb5\xff\x9f\x46\xda\xe2\xe0\x31\x8d\
+\x34\xb7\xe9\x0f\xf2\xbf\x1f\x95\x9f\x7b\x58\x7e\xed\x03\xf2\x7b\
+\xff\x47\xfe\xac\x5f\xc8\x9f\xfd\x53\xf9\x5c\x3f\x96\xcf\xfd\x4d\
+\x7d\x81\xdf\x7b\xd7\x63\x8f\x3d\xf6\xd4\x10\xf6\xb7\xd4\x94\xb5\
+\xac\x0a\xe6\xdc\x47\x79\x8c\x92\x7f\x1f\xaf\x67\xe4\x39\xcb\x8f\
+\x68\x24\x5c\x9f\xd4\x48\xf3\x98\x79\x7d\xd3\x5f\x9f\x7c\xf2\xc9\
+\x37\x46\x8d\x1a\xf5\xd1\x33\x4f\x3d\xf9\xf1\xb8\x8f\x3f\x98\x35\
+\x6e\xec\x07\xb3\x9e\x7b\xe6\xa9\x8f\xff\xfe\xf7\xbf\x7f\xfc\xe0\
+\x83\x0f\xbe\x41\xaf\xe1\xf9\x8e\xcf\xf3\x6b\xe5\xf7\x3c\x25\x7f\
+\xc6\x1f\xe4\xcf\xe4\xcf\xbe\x4f\xd3\xb3\x66\xf2\x2e\x4d\x8f\x2f\
+\xdc\xea\x75\xfd\xd1\x73\xcf\x3d\xf7\xf0\x67\x9f\x7d\xb6\x7b\x08\
+\x7b\x93\x9a\x12\x2f\x99\x87\x99\x93\xb9\x2f\xf2\xef\xe2\x3e\xca\
+\x73\x54\x19\xa3\x3f\xdd\x7b\xef\xbd\x2f\x8c\x7d\xf7\xcd\x19\x0b\
+\x67\x4f\x72\x5f\x61\x36\x33\xcd\x6e\xa5\x59\xa3\xeb\x5a\x8b\xa3\
+\xbe\x8e\xab\xe1\x63\xbf\x02\x7e\x8e\x96\x08\x70\x5e\x8d\x40\x17\
+\x2b\x04\xb9\x58\x23\xc8\x75\x8d\xb0\x40\x36\x77\x9b\xeb\xbe\xce\
+\x6b\x8e\xba\xda\xac\xa8\x5f\xbb\x7c\x51\xea\xe2\xb9\xd3\xdd\x3f\
+\x18\xf3\xd6\xf4\x91\x23\x47\x8e\xd2\x48\x7e\xc1\x3e\xc1\x6b\x26\
+\x99\x2f\x1e\x94\xcf\xfd\x4b\xf9\xbb\xdc\x29\x7f\x37\x53\xd7\x4e\
+\xfe\xc8\xd1\xd1\x31\x7c\x08\xfb\x7e\x9b\x1a\x77\xe6\x5e\xe6\x61\
+\xe6\x64\xee\x8b\x8c\xc3\x9f\x3f\x7c\xe7\xad\xc9\x8b\x67\x4f\x0e\
+\xb6\x59\x3e\x7f\xbb\xeb\x9a\xc5\xd7\x3c\xd6\x2d\x85\x2f\x61\x1d\
+\xe4\x6c\x89\x50\xf7\x35\x88\xf0\xb6\x41\xb4\x9f\x03\xe2\x02\x9c\
+\x90\x18\xe4\x82\xa4\x10\x37\xa4\x68\x3d\x90\x1a\xe6\x89\xd4\x70\
+\x4f\xf1\x37\x85\x2c\x99\x1e\x4b\x0c\x75\x47\x7c\xb0\x1b\x62\x02\
+\x5c\x10\xe9\xe7\x88\x30\x2f\x7b\x04\x7b\xd8\x5f\x71\xb3\xb3\x6c\
+\x5c\x66\x36\x3b\xf0\xcd\xd7\xff\x31\x91\xce\xf9\x22\xd9\xb3\x1a\
+\xc9\x17\x1e\x95\xbf\xcb\xaf\xe5\xef\xf6\x53\x8d\x69\x7e\xf0\xa3\
+\xab\x57\xaf\xa6\x1e\x38\x70\x00\x5a\xad\x76\x08\xfb\xde\x4d\xbd\
+\x67\x81\x82\x3b\x73\x2f\xf7\xf5\x3f\xbe\xf1\xda\xa8\x4f\xcd\x66\
+\x7d\x15\x6d\xbb\x7c\xde\x71\x67\xcb\x05\xf0\x24\xcc\xfd\x1d\x56\
+\x20\xd4\xcd\x0a\x51\x84\x77\x7c\x80\x03\x52\x42\x5c\x90\x11\xe1\
+\x81\x9c\x68\x1f\x14\xc4\xfb\xa3\x38\x29\x08\xa5\x29\xa1\x28\x4b\
+\x0b\x43\x45\x46\x38\x2a\x33\x23\x50\x99\x15\x49\x16\x85\x8a\xcc\
+\x48\x94\x67\x44\xa2\x2c\x3d\x02\x25\xa9\x61\x28\x4c\x0a\x45\x5e\
+\x7c\x10\xb2\x62\xfc\x91\x1a\xe1\x83\x84\x50\x0f\x44\x93\x4f\x84\
+\x79\x3b\xc0\xd7\x65\x5d\xbb\xa5\xf9\x82\xa8\x51\x2f\xbe\x38\x5e\
+\x23\xad\x9b\xe4\xf5\x52\x8f\x6b\x24\x4e\xb8\x4f\xa3\xef\x07\xc6\
+\xae\x3d\x6b\x86\x11\xd1\xd1\xd1\x7f\xbe\x76\xed\xda\xf1\x1b\x37\
+\x6e\x60\xe7\xce\x9d\xa8\xae\xae\x1e\xc2\x5e\x6a\x7c\x7d\x58\x6b\
+\x33\xa7\x72\x6c\x17\xb8\xdf\x71\xc7\x1d\x7f\x9e\x32\xee\xa3\x55\
+\x96\x0b\xa7\x37\xd9\x2d\x9b\x03\x37\xab\x85\xf0\xb5\x33\x47\x88\
+\xcb\x2a\xc2\x7c\x2d\x12\x03\x1d\x90\x1e\xe6\x8a\xdc\x68\x6f\x14\
+\x25\xf8\x63\x7d\x4a\x30\x2a\xd3\xb5\xa8\xca\x8a\xc0\xc6\x9c\x28\
+\xd4\xe6\xc5\x60\x53\x7e\x2c\xea\x0b\xe2\xd1\x50\x94\x80\xcd\xc5\
+\x89\xd8\x52\x92\x8c\xad\xeb\x53\xb0\xad\x2c\x0d\xdb\xca\xc9\xca\
+\xd2\xb1\x95\xfe\xdd\xb8\x3e\x15\xf5\xc5\xc9\xa8\x29\x48\xc0\x86\
+\x9c\x18\x94\xa6\x45\xa0\x20\x31\x14\x99\x31\x01\x48\x0e\xf3\x46\
+\x4c\xa0\xab\xf0\x05\x57\x3b\xcb\x86\x69\x93\x26\xac\xa2\x18\x31\
+\x5a\x23\x71\x02\xcf\x97\x66\x1f\x65\x8e\x62\x8d\x70\x87\xa6\x67\
+\x1d\xad\xa2\x59\x59\x2f\xf0\xfe\x1b\xf7\xf9\x38\xad\x5b\x76\x60\
+\x4f\x2b\xd8\x07\x4e\x9d\x3a\x85\x84\x84\x84\x1f\x32\xf6\x4a\x9f\
+\xe7\x5c\x9c\x73\x36\x9e\x77\xfc\xfb\x7b\xee\xb9\xe7\xe9\x19\x13\
+\x3e\x76\xb1\x5c\x38\xf5\xb8\x9d\xc5\x6c\xc2\x7d\x01\xfc\x08\x77\
+\xad\xab\x25\xe2\x7c\xd7\x21\x35\xc4\x09\x39\x91\x1e\x28\x8c\xf3\
+\x45\x69\x52\x00\xca\x92\x83\x50\x9e\x1a\x8c\x8a\xb4\x50\x6c\x60\
+\xfc\x33\xc3\x51\xad\xf8\x40\x6e\x34\xea\xf2\x62\xb1\xa9\x20\x0e\
+\xf5\x85\xf1\xd8\x5c\x94\x88\xc6\x92\x24\x6c\x29\x4d\x21\x3f\x48\
+\x45\x53\x79\x3a\xb6\x57\x64\x60\xc7\x86\x2c\x34\x57\x65\xa3\xa5\
+\x3a\x47\xfc\x6d\xaa\xcc\xc4\xe6\xd2\x54\xd4\xe4\x27\xa0\x2c\x33\
+\x1a\x05\x49\x5a\x64\x46\xfb\x13\x2f\x78\x22\xc2\xd7\x09\x7e\xc4\
+\x09\x73\x67\x4e\x75\x18\x31\x62\xc4\xdf\x35\x92\x1f\x30\x1f\x70\
+\x5c\xf8\x95\xfc\x5b\xf8\x37\x29\x35\x08\xc6\xfe\x7f\xde\x79\xe9\
+\x4f\x1f\x2c\x9e\xf0\xf6\xd9\xc5\x5f\xbc\x85\x8c\xe8\x60\x74\x75\
+\x75\xa1\xa3\xa3\x03\x6e\x6e\x6e\x3f\x44\xec\xd5\x7d\x9e\xf9\x93\
+\xe7\x9d\x3e\x36\xf9\xf3\xf7\x56\xaf\x9c\x3b\xf1\x98\xcd\x92\x19\
+\x70\x5d\x35\x0f\x7e\x36\x4b\x08\xf7\x95\x88\xf3\x59\x87\xb4\x10\
+\x47\xe4\x44\xb8\xa3\x20\xc6\x0b\x85\xb1\xd4\xe7\xe3\x7c\x50\x92\
+\xe0\x87\xd2\x44\xea\xfb\x49\x81\x58\x4f\x7e\xb0\x3e\x25\x08\x65\
+\xc4\x03\xc2\x52\x43\xc8\x42\x51\x9e\xa6\x45\x45\x7a\x18\x2a\x29\
+\x06\x54\x11\xff\x6f\xcc\x21\x9f\x60\x5e\x28\x24\x4e\x20\x5f\xd0\
+\xf9\x41\x65\x06\x9a\xc9\x0f\x5a\x08\xff\xd6\x8d\xb9\xd8\x59\x93\
+\x27\x6c\xc7\x86\x6c\xf2\x85\x34\x54\xe7\xc5\xa3\x84\x78\x21\x27\
+\x2e\x08\x49\xc4\x09\x91\xfe\xce\xc2\x0f\xa6\x7d\x35\x61\x95\x46\
+\xd2\x08\xbc\x96\x9a\xf5\x01\xeb\x44\xae\x2d\xb0\x4e\x14\x7c\xc6\
+\xd8\x2f\x99\xf0\xf6\x19\xb3\xcf\xdf\xc0\xd2\xaf\xde\xc1\xca\xe9\
+\x1f\x21\xc4\x79\x15\x8e\x1e\x3e\x84\x93\x27\x4f\xc2\xd2\xd2\xf2\
+\x87\x84\xbd\x12\xe7\xb9\x5f\x70\x9f\x7f\xf0\xf5\xd1\x7f\xfb\x64\
+\xe9\xac\x09\xdb\xac\xcd\xa6\xc0\x71\xd9\x2c\x78\xad\x59\x88\x10\
+\xa7\x65\x88\xf5\xb2\x42\x6a\x90\x1d\x32\xb5\x4e\xc8\x0e\x77\x25\
+\xfc\xdd\x90\x17\xe9\x8e\xfc\x68\x4f\x61\x79\x64\xb9\xc4\x05\xd9\
+\xe4\x17\x99\xe1\xee\xc8\x08\x73\xa3\x98\x40\xa6\x95\xff\x86\xb9\
+\x23\x9d\x1f\x8f\xf0\x44\x56\xa4\x17\xb2\x29\x56\xe4\xc6\xfa\x91\
+\x3e\x08\x20\x7d\x10\x8c\xf5\xa9\xe4\x1b\x19\xcc\x15\x14\x2b\x88\
+\xfb\x1b\x89\x17\x9a\x2a\x64\x3f\x20\x2e\xd8\x49\x7e\xb0\xab\x36\
+\x1f\xbb\xeb\x0a\x84\x2f\x6c\xab\xc8\x44\x6d\x41\x12\xd6\x67\x44\
+\x21\x27\x3e\x18\x49\x5a\x2f\xe2\x03\x47\xb8\xda\x5a\x36\xbc\xf2\
+\xca\xe8\x2f\x35\x52\xde\xc0\x39\x24\xc7\x84\x07\xc8\x7e\xf7\xf6\
+\x8b\x4f\x7e\xc4\xfd\x5e\x8d\xbd\xed\xfc\x09\xf0\x5c\x39\x1b\x11\
+\xee\x56\x68\xda\xba\x19\x6d\x6d\x6d\x98\x36\x6d\xda\x0f\x05\x7b\
+\xe6\x46\xee\x1b\xf7\xfd\xf2\x97\xbf\x7c\xf2\xeb\x49\x63\x23\x2c\
+\xe7\x4f\xba\x66\x6f\x3e\x03\x1e\xab\xe7\x21\xd0\x6e\x29\x22\xdd\
+\x56\x21\xd1\x77\x2d\x52\x03\xed\x90\x1e\x6c\x8f\x0c\xea\xfb\xec\
+\x03\x6c\x19\xa1\x4e\xe4\x13\x0e\x48\x0a\xb0\x43\xbc\x9f\x2d\x62\
+\x7d\x6c\x10\x43\x7a\x20\xca\x6b\x2d\x22\x3d\xd7\x20\xdc\xc3\x5a\
+\x58\x98\x07\xff\x9b\x6d\x2d\x22\xbc\xd6\x21\x92\xf3\x02\x1f\x3b\
+\xc4\xfa\xd9\x23\x3e\xd0\x09\x49\xc1\x2e\x48\xd5\x92\x6f\x44\x7a\
+\x23\x87\x7c\xa2\x30\x91\xf8\x83\xb4\xe0\x86\x6c\xe2\x07\xd2\x0c\
+\x5b\x88\xff\xb7\x53\x1c\x68\x65\x3f\x20\xec\xd9\x0f\xf6\xd4\x15\
+\x62\x17\xf9\x42\x53\x65\x16\x6a\x0a\x93\x50\x9a\x1e\x29\x34\x42\
+\x5c\xb0\x3b\x42\x3c\xed\xaf\x98\x2f\x98\xe3\x2f\xc7\x04\xae\x29\
+\xfc\xe5\xb5\xbf\xfe\xe1\xf3\xbe\xb0\x0f\xb4\x5d\x42\xdf\xdd\x16\
+\x05\x29\x91\x28\x2d\x2e\x44\x65\x65\x25\xc6\x8f\x1f\xff\x7d\xc5\
+\x5e\xc9\xeb\xb8\x7e\xc2\x9c\xf8\xdb\xd7\x5e\x79\xe1\x3d\xf3\x99\
+\xe3\x5b\xd7\x2e\x9a\x0a\x97\x95\x5f\x13\xd7\x2f\x42\xb8\xeb\x0a\
+\x24\xf8\xac\x41\xb2\xff\x3a\xa4\x04\xd8\xe8\x2c\x99\x2c\x81\xfc\
+\x21\xd6\xcb\x1a\x91\x1e\xab\x11\xe6\xba\x8a\xf8\x93\x72\x3e\x87\
+\x65\xf0\xb7\xb3\x80\xaf\xad\x39\xbc\x6d\x96\xc2\x6b\xed\x12\xd2\
+\x0a\x16\x02\xfb\xc4\x60\x57\x11\xb3\xf3\x13\x28\x0e\x64\xc6\x52\
+\x9f\x8d\x11\x9a\x2e\x97\xf8\x9b\xf3\xc1\x58\x7f\x47\x84\x7b\xae\
+\x23\xdf\xb0\x45\x0c\xe5\x8b\x09\x94\x2b\xa6\x86\x79\x20\x2b\xda\
+\x17\x05\x09\xe4\x0b\x94\x37\x54\x13\x2f\xd4\x17\x25\x09\x4e\x68\
+\x91\xfd\x80\xb9\x60\xcf\x26\xf2\x83\xda\x02\x6c\x2d\xcf\x14\x71\
+\xa1\x20\x59\x8b\x94\x08\x5f\xca\x21\x9d\xe1\x6e\x67\xd9\xf4\xec\
+\xb3\x4f\x8f\x7f\xe9\x4f\x0f\x4f\x27\xec\xcf\xdd\x14\xfb\xe4\x70\
+\x6c\xdf\xb4\x01\xa7\x8e\x1f\x81\x9d\xed\x3a\x78\x78\x78\xe0\xdd\
+\x77\xdf\xfd\xbe\x62\xcf\xdf\x9b\xe3\xe2\xef\xbe\x1a\x3b\xc6\x62\
+\xe5\xdc\xaf\x2e\xda\x5b\xcc\x84\xa7\xf5\x02\x84\x38\x5a\x08\xae\
+\x57\xe3\xce\xff\x4e\xf0\x5d\x83\x68\x0f\x4b\x84\xb9\xac\x40\xb0\
+\x83\x05\x02\x88\x1b\x7c\xd6\x2d\xa2\xf7\x2c\x84\xdb\xea\xf9\x70\
+\xb5\x9c\x2f\xb0\x2e\x4a\x8b\xa6\xeb\x58\x89\x93\xed\xfb\x70\xf9\
+\xc2\x39\xdc\xb8\x7c\x09\xb8\x42\x76\xf9\x02\xd0\x45\x76\xe9\xbc\
+\x64\x17\xcf\x02\x17\xce\x90\x9d\xc6\x8d\x73\x27\x71\xf9\xc4\x21\
+\x1c\xdf\xb5\x05\xcd\x1b\x8b\x51\x96\x11\x2d\x6a\x05\x51\xbe\xf6\
+\xc2\x17\xd2\xc2\x3c\x89\x17\x28\x8f\x4c\x0e\x15\x39\x63\x5d\x61\
+\x22\xf1\x7f\x06\xf1\x41\x4f\x4c\x60\x3f\x68\xd9\x98\x87\xfa\x92\
+\x54\x11\x13\xb2\x62\x03\x11\x1b\xe4\x06\x2f\x7b\xcb\xce\x39\x63\
+\x5f\x3f\x6d\x0a\xf6\xe7\x4e\x9f\xc2\xb1\x03\xbb\x50\x9c\x12\x8e\
+\x4f\x3e\xfa\x50\xe8\xc0\xef\x21\xf6\xac\xf3\xee\xbd\xeb\xae\xbb\
+\x1e\x9e\xf3\xe5\x87\x21\xd6\x0b\x27\xc3\x79\xc5\x1c\xf8\x11\x96\
+\x11\xa4\xef\x12\x09\x67\x35\xee\x89\x32\xee\x5a\xe7\xe5\x14\x0f\
+\x96\xc0\x9b\xf4\x80\x9b\xe5\x5c\x38\x2d\x9f\x0d\x87\x65\xb3\x45\
+\x7d\xa7\x61\x43\x31\xce\x9e\x3c\x86\xee\x1b\xd7\x01\xb6\xeb\x6c\
+\xd7\x24\xbb\x76\x45\xb2\xab\x5d\x92\x0f\xf4\xc2\x9f\xac\xb3\x03\
+\x38\xcf\x76\x92\xec\x04\x70\xee\x04\x6e\x9c\x3e\x82\x8e\x3d\xdb\
+\xb0\x65\x7d\x16\x69\x06\x1f\xc1\x0b\xc9\xa1\x6e\x82\x13\x0a\x93\
+\x42\x50\x41\x7e\xb0\x89\xf9\x80\xe2\xc2\xce\x8d\x3d\x31\x61\x37\
+\x19\x6b\x83\xaa\xdc\x38\xe4\x25\x86\xc0\xc7\x76\x19\x3e\x7f\xeb\
+\x25\x4c\x79\xff\xef\x26\x61\x5f\x4b\x79\x46\xbc\xe7\x6a\x98\xcf\
+\x9c\x70\xee\x9d\x77\xde\x11\x1c\x30\x6e\xdc\x38\x81\xfd\x94\x29\
+\x53\xb2\x08\x7b\xae\x3b\x2a\x6b\x33\x06\x1b\xf6\xec\xb3\xf7\xfe\
+\xf8\xc7\x3f\x7e\xc4\x6c\xea\xb8\x02\xe6\x7b\xb7\x55\x73\x45\x9c\
+\x8f\xa1\xdf\xac\xee\xf3\x49\x7e\xc4\xf1\xf4\x58\x98\xcb\x72\xf1\
+\x3c\xe3\xee\xba\xea\x6b\x38\x10\x4f\xb8\x53\xfe\x5f\x92\x19\x8f\
+\x8e\xe3\x87\xd1\xdd\xdd\x0d\x80\x8c\xff\x76\xdf\x30\x82\xff\x55\
+\x95\x0f\x5c\x26\x1f\xb8\x28\xe3\x7f\x4e\x1f\x7f\xe1\x03\xa7\x74\
+\xf8\xe3\xec\x31\xe0\x0c\xdb\x51\x74\x77\xb4\xe3\x44\x6b\x03\x2a\
+\x33\x63\x44\x2d\x91\xb9\x81\xfd\xa0\x88\xf8\x80\x35\xc2\xe6\x92\
+\x14\x91\x2b\xaa\x63\x42\x33\x71\x43\x2d\xe9\x82\x78\x7a\xbd\xe5\
+\xdc\xaf\xf0\xe9\x1b\x2f\x60\xf6\xb8\xb7\xe0\xb1\x62\x56\xbf\xd8\
+\x7b\x2e\x9f\xbe\xfb\xcd\x97\x9e\x7a\xf2\xf5\xd7\x5f\xb7\xa1\xfe\
+\x7f\x8d\xf1\x27\xec\xd3\xef\xbe\xfb\x6e\xae\x2b\xb0\x66\x1a\x4c\
+\xd8\x73\xe3\xef\x2b\xc6\x3c\xff\xf7\x57\xbf\xfa\xa3\xf9\xac\xf1\
+\x0d\x36\x4b\xa6\x09\x8d\xc7\x7c\x1f\xef\x6d\xad\xc3\x5e\x70\x3d\
+\xc5\x7d\xd6\x7d\xc1\x0e\xe6\xf0\x59\x6b\x26\x7c\xc4\xc1\x62\x96\
+\xc0\xbd\xba\x38\x0b\x5d\x17\x3b\xd1\xab\x75\x2b\x3e\xa0\x70\x80\
+\x8c\xff\x75\x03\xfc\xaf\x30\x0f\x50\x3c\xe8\xa2\xcf\xb8\x78\x46\
+\x17\x03\x7a\xe3\x7f\x5c\x87\x3f\x4e\x1f\x06\x3a\xd8\xda\x71\xe1\
+\x60\x33\xe5\x8c\xc9\xa4\x1b\x5d\x90\x4c\x9a\x91\xe3\x42\x29\x69\
+\xc5\x1a\x8a\xfd\xdb\x28\x77\x6c\x55\xe5\x09\xad\x35\xf9\x14\x2b\
+\x92\x84\x3e\x59\x39\xe7\x0b\xcc\xf8\xec\x6d\x98\xcf\xf8\x9c\x34\
+\xaa\x8d\x84\x7d\xbd\x71\xec\xdf\x1a\xf5\x34\xd7\x92\x78\x8c\x69\
+\x04\xc5\xff\x67\x88\x07\x16\xfd\xfa\xd7\xbf\xe6\xbe\xa3\x8c\x3b\
+\x0e\xa6\xa6\xe8\xfc\x5f\xfc\xe6\x57\xbf\x7a\x7c\xc9\xcc\x71\x84\
+\xfd\x74\x78\x5a\xcd\x87\x96\xf2\x3a\xc6\x5a\xcd\xf7\x1c\xfb\xc3\
+\x88\xeb\x03\xa8\x8f\x78\xd0\x6b\x1c\x89\xe3\x1d\x89\xeb\xcb\x72\
+\x92\x8d\xe3\x7e\x2b\xf8\x5f\xbb\x2c\xc5\x01\xf6\x01\xd6\x04\xac\
+\x07\x4c\xc2\xff\x88\x0e\x7f\x74\x1c\x02\x4e\x1d\x44\xe7\xfe\xed\
+\x94\x2f\x46\x21\x2e\xd0\x19\x69\xe1\x5e\x42\x27\xb2\x36\x68\x28\
+\xee\xe1\x02\xf6\x83\x9d\xe4\x03\x1b\xf3\xe2\xc8\x97\x97\x61\xcd\
+\xc2\x29\x30\x9f\x33\x11\xee\x36\x2b\xd1\x44\x1a\xc5\x10\x7b\x8f\
+\x65\xd3\xf6\xc8\xd8\xab\xf7\x5f\xfb\x2e\xe6\x27\x7d\x5b\x4d\xd4\
+\xbb\xc9\xfe\x8b\x72\xa1\xdf\x5b\xcc\xfa\xa2\xd6\x96\xb0\xf7\x22\
+\x9d\xc7\x18\xab\x63\x3d\xf3\x3d\xc7\x79\xe6\x03\x5f\xea\xf3\xae\
+\xd4\xe7\xed\x96\xce\x40\xb4\xbf\x13\x4e\x1d\x6b\xef\x1b\xf7\x7f\
+\x05\x7f\xc5\x07\x2e\x9e\xb9\x65\xfc\x71\xf2\x00\xba\x8f\xef\xc7\
+\x91\xad\x55\x42\x1f\x26\x52\x4c\xc8\x8e\xf1\xa3\x5c\x21\x9c\x72\
+\xc6\x04\x29\x5f\x64\x2e\xa8\xd1\xf7\x01\xd7\xd5\x8b\xe0\xe7\xe9\
+\x8c\xc2\xbc\x5c\x43\xec\xf7\xbe\xfe\xc2\x9f\x78\x1f\x46\xae\x85\
+\x7c\x1f\xf6\xde\x53\xe6\xb8\xf1\xef\xf9\x5f\xb3\xa9\x9f\x66\x33\
+\xe7\x73\xbf\x97\xb0\x5f\xab\xc3\x9e\xfd\x80\xf9\x3e\xc8\x7e\xa9\
+\xf0\x0d\xa7\x15\xac\xed\x66\xa1\xae\x3c\x5f\xd4\xc7\x4d\x6a\xdf\
+\x08\xff\x8b\x92\x1e\x60\x5d\xc8\x7a\xf0\x16\xf1\xc7\x89\x36\x61\
+\x57\xdb\x77\xa2\x3a\x3b\x16\xb1\x14\xeb\xb9\x86\xc0\x79\xc2\x46\
+\xd2\x7f\x22\x1e\x88\xda\x91\x54\x3f\xdc\x98\x1b\x4b\x79\xaa\x05\
+\xb4\x3e\x4e\x88\xd2\x06\x51\x7e\xe1\x28\xb0\x77\x33\x9f\xba\xff\
+\xaf\x4f\x3c\xcc\xfb\xb1\x72\x0d\x4c\xd1\xf5\x83\xbd\x71\xac\x62\
+\x1e\xfb\xf5\xac\x09\x1f\x78\xad\x5d\x3c\x55\xf0\xb9\xd6\x79\x59\
+\x2f\xec\x59\xf7\xb3\xb6\xe7\xe7\x19\x77\x1f\xca\xe1\x8f\x1c\xd8\
+\x6b\x1a\xee\xfd\xe1\x6f\xa8\xff\xae\xa8\xf0\xbf\xac\xc2\xbf\x4b\
+\xf1\x81\xde\xfa\x4f\x1d\xff\x8d\xe1\x8f\xe3\xfb\xd0\x7d\x6c\x2f\
+\xf6\xd6\x14\x91\x3e\x74\x16\xe3\xca\x05\x89\xc1\xa8\xca\x8e\xa1\
+\xfc\x21\x4d\x57\x47\x66\xe3\x3a\x42\x90\xe3\x72\xca\x57\x17\x62\
+\xd9\xac\x2f\xb0\x6a\xf6\xf8\x03\x7f\x78\xe0\x37\xef\xd1\x75\xfa\
+\xa3\x46\x1a\xef\xfa\xa9\x66\xf0\xef\xc3\xac\x9b\xe3\xf6\xc5\xfb\
+\xaf\x4d\xe3\x5a\x2e\xe7\x6c\xcc\xed\x09\x2a\xce\x57\xb0\xe7\x58\
+\xef\x4e\x5a\xd0\xde\x7c\x26\x22\x7d\xec\x71\xe1\xdc\x99\x6f\x88\
+\xbd\x09\xfa\xdf\x18\xfe\x5d\x32\xfe\x5d\x72\x5e\x78\x33\xfc\x4f\
+\x19\xe2\xbf\x5f\xe0\x8f\x63\x6c\x7b\xd1\xd1\x5c\x8b\xe4\x10\x57\
+\xca\x15\xdd\x91\x1f\x1f\x88\x0d\xa4\x09\xb8\x96\xac\xd4\x91\x5b\
+\xaa\x72\x44\x2c\x88\xf3\x77\x80\xaf\xfd\x72\xf8\x3a\x59\x5d\x7f\
+\xff\xed\x37\xe7\x68\xa4\x39\x26\x3c\x8e\xcc\x75\x91\x91\x9a\xc1\
+\xa7\xf3\x94\xc6\x7e\xcb\xe3\x5d\x3f\x7b\xf9\x6f\x7f\x7e\x61\xd5\
+\xdc\x89\xe7\x38\xbf\x67\x6e\x67\x9d\x6f\x14\x7b\xcb\x79\x22\xd6\
+\x27\x87\xfb\xe2\xca\xe5\xae\x5b\xc3\xbe\x5f\xfc\xd5\xdc\x6f\x0c\
+\xff\x0b\xfa\xf8\x2b\xb5\x01\x1d\xff\x1f\xe9\x8d\xff\xc9\xbe\xf1\
+\xc7\xb1\x3d\xe8\xdc\xd3\x88\x34\xad\x27\xe5\x89\xae\xc8\x8b\x0b\
+\xa0\xbc\x51\xf2\x81\x1d\xa4\x09\x58\x1b\xb2\x36\xa8\xa2\x58\x90\
+\x15\x13\x80\x28\x3f\x27\x78\xd8\x5b\x9e\x78\xf4\xa1\x87\xde\xd1\
+\x48\xf3\x4a\x78\xfc\x8b\xc7\x0d\x07\xab\x06\x10\xbc\x3f\x72\xe4\
+\xc8\xdf\x90\xde\x6b\xe4\x7c\xdd\xdf\x66\x91\xc8\xe5\xd5\x5a\x2f\
+\xd2\x4d\xe2\x7c\x05\xfb\xf4\xe8\x00\x82\xeb\xea\xad\x63\xaf\xcb\
+\xfd\xbf\x81\xf6\xd3\xc3\xbf\xb3\x07\xff\x4b\x72\x6d\xa0\x17\xfe\
+\x87\x4c\xc2\x1f\x47\x77\xe3\xa2\xf0\x01\x0f\x51\x7b\xce\x95\x7d\
+\x80\xc7\x9a\x95\xb1\x45\x9e\x6b\x50\x96\x11\x89\xd4\x70\x6f\x84\
+\x7a\xda\xc2\xd6\x72\x69\xa5\x46\x9a\x87\xc8\x73\x9b\x58\x07\x70\
+\x9d\x6c\xb0\xe9\x00\xe6\x2c\x91\xeb\xcd\x9c\xf0\x9e\xed\xba\xc5\
+\xd3\x84\x9e\x63\xac\xd5\xf9\x3d\xeb\x7c\xe6\x03\x8f\xd5\xf3\x05\
+\xe7\x27\x86\x7a\x7d\x43\xec\xfb\xeb\xfb\x06\xdc\x7f\x2b\xf8\x8b\
+\xfa\xe0\x69\x15\xfe\xed\xfa\xf8\x2b\xb1\x5f\x0f\xff\x3d\x3a\xfc\
+\x71\x64\x17\x2e\xec\xde\x8c\xd4\x50\x37\x1d\x0f\x6c\xc8\x26\x1f\
+\xe0\x31\xe6\x8a\x74\xc1\x05\x3c\x9e\xc0\xb5\x44\x9e\x77\xe6\xef\
+\x6c\x8d\x99\xd3\xbe\xb2\xd7\x48\x73\x8a\x38\x0e\x0c\xc6\xfd\x77\
+\x84\xde\x7f\x73\xf4\x73\x2f\xad\x5e\x30\xf1\x32\xd7\xeb\x42\x29\
+\xc7\xe7\xfe\xde\x93\xdf\xaf\x16\x3a\x80\xfd\x82\xb9\x21\xcc\xcb\
+\x96\x38\xff\xd2\xbf\x8e\x7d\xbf\x7d\xbf\x1f\xed\x67\x0c\x7f\x36\
+\xce\x0b\x3b\x0c\xf1\x3f\x60\x04\x7f\xa5\xef\xf7\xe0\x8f\xc3\x3b\
+\x71\x7a\x47\x0d\xc5\x7a\x47\x51\x3b\x2e\x48\x08\x24\xfd\x17\x2d\
+\xe6\x1d\xf1\x3c\x03\xb6\x6a\x11\x07\xfc\x48\xf7\x38\xc0\xc3\x76\
+\xd5\xd9\x47\x1f\x7e\x78\x8c\xa6\xf7\xfe\xbb\x83\x21\x0e\x28\x9a\
+\xef\x5e\xf3\x99\xe3\xcb\x04\xef\xdb\x2e\x46\x9c\xb7\x95\x8e\xf7\
+\xe3\x7d\xac\x45\x1d\x9f\x6b\x7a\x5c\xbf\xf7\x58\xb3\x08\x9d\x67\
+\x3b\x24\x0c\x99\xc7\x4d\x07\xbe\x0f\xec\xfb\xe8\xfb\xfd\x72\xbf\
+\x1c\xfb\x75\xf8\x9f\xed\xc1\x9f\xe3\xc0\xb9\x93\x37\xd5\xfe\x37\
+\xc3\x1f\x87\x5b\x71\xa8\xae\x08\x51\x3e\x76\x62\x8c\xb9\x28\x29\
+\x18\x35\x79\xb1\xba\xb9\x67\xac\x0b\xb8\x7e\xc8\x73\x50\x79\x3e\
+\xf2\xea\xa5\xf3\x79\x1f\x16\x1e\x33\xe6\xf5\x08\x83\x49\x0b\x8a\
+\xbe\xff\xd5\xc7\x6f\x4e\xe0\xba\xbe\xa7\xf5\x7c\x3d\xde\x67\x0e\
+\x60\xbd\xe7\x6f\xb3\x58\x8c\xf1\xda\x11\xef\x1f\xdc\xd3\x2c\xe1\
+\x26\x30\xec\x36\xcd\x0f\xba\x4d\xc0\xbe\xbf\xbe\x6f\x0a\xf7\x0b\
+\x3b\xd3\x33\x46\xc0\xf9\x40\x3f\xda\x5f\x87\xff\x11\xc6\x7f\xa7\
+\x0e\xff\xee\x43\xcd\x68\xc8\x8d\x13\x3e\x90\x1e\xe1\x29\xe6\xa2\
+\x6e\x12\xf3\x0a\x92\xc5\x9c\xa3\xda\xfc\x38\xe4\xc6\xb2\x16\x74\
+\x80\x97\xdd\xca\xeb\x6f\xbf\xf1\xfa\x24\x8d\x34\x77\x84\xd7\x35\
+\x0c\x86\x3d\xb8\x75\x7d\x7f\xd9\xec\xf1\x3b\xb8\x6f\x73\xed\x5e\
+\xc9\xf5\xd8\x07\x78\x7c\x27\xc8\xde\x5c\xd4\xfc\x6d\x49\xef\x6d\
+\x28\x48\x97\x30\x53\xc6\xec\x04\x96\x37\x0c\xf0\xbd\x99\xf5\x8f\
+\x7d\x7b\x55\x3e\x9a\x62\x3c\xb1\x2d\xda\x13\x5b\xa3\x3c\xc8\xdc\
+\xb1\x25\xd2\x0d\x8d\x11\x6e\xd8\x1c\xe1\x8a\xcd\xe1\x2e\x68\x08\
+\x73\x41\x7d\x98\x33\x2e\x9f\x6c\xef\x8d\xff\x05\xd5\xf8\xc0\x85\
+\x0e\x49\x07\x88\xd8\x7f\x73\xed\x27\xfa\xbe\x0a\x7f\xb4\xb7\xe0\
+\xda\xfe\x2d\xc8\x0e\xf7\x44\x2c\xe5\x7d\xd9\xd1\x3e\x28\x4f\x0f\
+\x13\x73\x51\x79\x0e\x62\x63\x49\xb2\x98\x63\xa0\x70\x80\xb5\xc5\
+\x3c\xd6\x82\x86\x1c\x30\x90\x63\x00\xfb\xe7\xff\x9b\x34\xf6\xcd\
+\x29\xac\xf9\x78\xac\x8e\x35\x9e\xc2\xfb\x5c\xe3\x17\xbc\x4f\x8f\
+\xf3\x9c\x2e\xad\xfb\x5a\x5c\xe7\x3e\x28\xf0\x52\xf9\xc0\x8d\x1b\
+\x2a\x3f\xb8\x99\xa9\xde\xa3\x87\xbd\x3a\xdf\xbb\x82\x3a\xcf\xe5\
+\x48\xf8\xf0\x8f\x88\xfb\xe0\x71\xc4\xbe\xff\x07\x44\xbf\xf7\x18\
+\xa2\xde\x7d\x14\x11\xef\x3c\x8a\xf0\x31\xff\x07\xed\xdb\x8f\x20\
+\xf4\xcd\x87\x11\xfc\xe6\x43\x38\xdf\xd6\x6a\x9c\xfb\xd5\xf8\x73\
+\x7d\xd0\x44\xed\x27\x61\xdf\x83\x7f\xf7\xc1\x1d\x38\xd5\x58\x86\
+\x48\x2f\xca\x7d\x83\x9c\x91\x1f\xe7\x8f\x6a\xd2\x83\xca\x7c\x64\
+\x8e\x09\x3c\x96\x14\xe9\x6b\x0f\x4f\xdb\xe5\x78\xe3\xd5\x97\x27\
+\x69\x7a\x74\x80\x52\x13\x1a\x88\x8d\xfd\x92\x75\xea\x3d\x2b\xbe\
+\xfe\x72\x3b\xd7\x6e\x83\x1d\xcd\x91\xa8\xd2\x7c\x51\xee\xab\x44\
+\x9e\xcf\x7a\x90\x79\xff\xc8\x7e\xba\x2e\xd7\xaf\x48\x7d\x55\xd8\
+\x35\x95\x0f\xa8\x7c\x41\xcf\xae\xdf\x1c\x77\x23\x31\xbf\xce\x6b\
+\x39\x12\x3f\x7a\xc2\x24\x1f\x90\xf0\xef\x83\xfb\x95\xf1\x21\xb6\
+\x33\xc7\x6f\x21\xf6\xf7\xe0\x0f\x8a\x01\x57\xf7\x36\x62\x53\x66\
+\xa4\x98\x83\x96\xa6\x75\x43\x49\x52\x90\x98\x9b\xce\xf3\x91\x79\
+\x0e\x2a\xc7\x05\xce\x15\x02\x9c\xad\x88\x03\x16\x30\x07\xf0\x7c\
+\x62\x25\x17\xf8\xb1\x66\x60\x72\x00\xe7\xa8\x77\x4e\xfd\x6c\xcc\
+\x58\x8e\xfb\x5e\x06\x7d\x9f\x35\x1f\xe7\x00\xac\xf7\x39\xd7\xcb\
+\x4d\x08\x95\xe2\xb1\x82\x93\xce\x07\x14\x3f\x30\xe6\x0b\x8a\x5d\
+\xeb\x8d\x79\xaf\x78\xdf\x13\xf3\x37\x79\xad\x40\xd2\xc7\x4f\x98\
+\xe4\x03\x12\xfe\x37\xe9\xfb\xba\x39\x22\xa7\x24\x1d\xd0\x67\xec\
+\x37\xe0\xfe\xc3\x2d\x3a\xfc\x6f\xb4\x6d\xc3\x85\x1d\x55\x88\xf7\
+\xe5\xb9\x87\x76\xc8\x8e\xf2\x42\x45\xba\x56\x37\x2f\x9d\xf9\x20\
+\x33\xca\x1b\x61\x9e\x36\x70\x5f\x67\x81\x51\x2f\x3e\xff\xa9\x46\
+\x5a\xdf\xa6\x8c\x0b\x0c\x44\x1d\xc8\xba\xef\x67\x16\xb3\xbf\xc8\
+\x63\x6e\xe7\xbc\x3e\x51\x15\xf7\xa5\xbe\x2f\x69\x3e\x9e\xaf\xd3\
+\x79\xea\x98\x9c\x8b\xb3\x5d\x91\xfb\xec\x55\x03\x3f\xb8\xda\x07\
+\xce\xa6\x63\xcf\x7a\xbf\x9e\xf0\x4f\xf9\xe4\x49\x93\x7c\xe0\x7c\
+\x5b\x4b\xdf\x7d\xff\x82\x7a\x7e\x08\xe5\x02\xe7\x8e\xdf\x12\xf7\
+\x2b\xf8\x77\x1f\xdc\x8e\xcb\xbb\x36\xa1\xa5\x28\x51\xac\x57\x4a\
+\x0a\x76\x16\xeb\x93\xaa\xb3\x23\x05\x0f\xb0\x15\x52\x8e\x18\x1b\
+\xe0\x28\xd6\x2c\x2e\x99\x3b\x2d\x4e\x23\xad\x45\xe5\xfb\xf3\x29\
+\x35\xc1\x81\xd4\x98\x8f\x46\xbe\xf1\xe2\xb3\x8f\x5b\x2f\x9c\x7c\
+\x8d\xeb\x39\x11\x2a\xcd\x9f\xa0\xea\xfb\x76\xe6\x33\x50\x98\x12\
+\x29\x6b\xf0\xcb\x2a\x1f\x50\x71\xc1\xb5\xfe\xf0\x37\xf0\x15\x3d\
+\xdc\xf5\xb1\xe7\xf3\x34\x78\xaf\x40\xda\xd8\x3f\x99\xe4\x03\x9d\
+\x6a\xfc\x6f\xd6\xf7\xc5\x1c\xb1\x93\x92\x16\x34\x95\xfb\x65\xfc\
+\x71\x68\x07\xae\xed\xdd\x8c\xce\x6d\x15\x14\x1f\xed\xc4\x7a\xb5\
+\x8c\x70\x0f\xb1\x3e\x61\x23\xf9\x40\x4d\x6e\x34\xca\xd2\xb4\x48\
+\x09\x75\x43\x90\x8b\x15\x1c\x2d\x17\x9d\x1d\x39\x72\x24\xaf\x33\
+\x63\x1d\x38\x10\xf7\x62\x17\xdc\x6f\x36\xed\xd3\x55\xac\xe9\xfd\
+\x28\xb7\x53\x6a\xfc\x4a\x9d\x2f\xc0\x4e\x8a\xfb\xf6\x16\xb3\xd0\
+\x79\xe2\x88\x2a\x0f\xeb\xd2\xf7\x01\xe6\x82\xab\x86\x78\x5e\x35\
+\x62\x86\xaf\x91\x71\x37\xc0\x9e\x6d\xb3\xcf\x4a\xa4\x7f\xfa\x67\
+\x93\x7c\xa0\xb3\xad\xd9\xb4\xbe\xaf\x18\x8f\x11\x1d\xdf\x6f\x32\
+\xf7\x33\xf6\x38\xb4\x9d\x62\xc0\x56\x5c\x6a\xae\xc2\x56\xe2\xfa\
+\x10\x17\x4b\x24\x06\x3a\x92\x16\xf4\xc5\x86\x8c\x30\xb1\x56\xa9\
+\x2a\x33\x02\x59\x91\xde\x62\x3e\xb2\xeb\x9a\x25\xf8\xf2\xb3\x8f\
+\x96\x69\xa4\xb1\x41\x5e\x67\x3a\xd0\x62\x80\xe0\xfe\x95\x5f\x7f\
+\x59\xcb\x63\x3c\xea\x5a\x1f\x8f\xf1\xf2\x5c\x5d\xef\xb5\x0b\xc5\
+\xdc\xad\xb4\x70\x9f\x9e\x9a\x9b\xc8\xc1\x15\x1f\xe8\xea\xc7\x07\
+\xfa\xb2\xcb\x7d\xe2\xae\xe4\xf9\x8d\x84\x7f\xc6\x67\x4f\x99\xe4\
+\x03\x9d\xfb\x9b\x4d\xef\xfb\xe7\x64\xfc\xb9\x2e\x68\x22\xf7\x2b\
+\xf8\x77\x1f\xd8\x86\xae\x9d\x35\x38\xd3\x50\x48\x5c\xb9\x9a\xf2\
+\x81\x75\xc4\x01\xee\x58\x9f\x1c\x2c\x7c\x80\xd7\xac\x15\x50\x6e\
+\x10\xe3\x67\x0f\x2f\xdb\x65\xb0\x58\x30\xa3\x40\x23\xc5\x00\x1e\
+\x17\xe2\xb9\x14\x03\x25\x0f\x10\xba\x7f\xec\x5b\xa3\x9e\x58\x63\
+\x36\x05\x9e\x56\x0b\x44\xac\x57\x74\x1f\xd7\xfd\xb8\x06\xc0\xe3\
+\xba\x9c\x13\x1e\x6c\x69\x94\xea\x2d\xba\xba\xeb\xa5\x1e\x3f\xb8\
+\xaa\x36\x25\x26\x18\xb1\xab\xc6\xac\x37\xee\x8a\x6d\xf1\x5d\x89\
+\xac\x71\x7f\x31\xc9\x07\x24\xfe\xbf\x85\xbe\x7f\x56\x9e\x23\xc2\
+\x31\xc0\x44\xee\x97\xf0\x6f\xc2\x95\xdd\x75\x38\xbf\x75\x3d\xca\
+\x62\x7c\x74\x1c\x50\x10\xeb\x8b\x8a\xb4\x10\xb1\x6e\xb5\x94\xf2\
+\x82\xc4\x20\x27\xf8\x3b\xae\x84\xfd\xaa\x45\x97\xe4\xfb\x71\xa9\
+\xf3\x80\x81\xd0\x98\x87\xee\x30\x9b\xfc\xe9\x42\x9e\xd3\x25\xb8\
+\xdf\xc7\x5a\x4f\xf7\x71\xfd\xd7\x89\x78\xc1\xc7\xc6\x1c\xdd\x3c\
+\xdf\x96\x6b\x6d\x7a\x3e\x60\xe0\x07\x7a\x9c\x60\xc4\x27\x8c\xe2\
+\x7e\xa9\x37\xf6\xf2\x67\x6f\xf5\x5d\x85\xec\xcf\xff\x62\x92\x0f\
+\x08\xfc\x4d\xe9\xfb\x86\xf8\x73\x5d\xd8\x58\xcd\xc7\x08\xf7\xe3\
+\xa0\x64\x57\xf7\xd4\xa3\xb3\xa9\x1c\xfb\x8a\x13\xe0\x6f\xbf\x0c\
+\xd1\xde\xeb\xc4\x9a\x35\x5e\xbb\x58\xce\x6b\x15\x53\x82\x29\x3f\
+\x74\x45\xb0\xcb\x6a\x38\xae\x5a\x88\x4f\xde\x7f\x9b\xe7\x07\xf0\
+\x7a\x42\x9e\xfb\x3d\x50\x6a\x41\x1c\xfb\x7f\x4a\x39\x7f\x9a\x54\
+\xef\xb3\xe8\xe1\x7e\xbf\xb5\x62\xde\x36\xd7\x81\x38\xe7\x2b\x4e\
+\x8d\xea\xc6\xa5\x4e\xb9\xce\x2a\xd7\x5c\x8d\xfa\x40\x7f\x7e\xd0\
+\xbb\x8f\xf7\x32\xd5\xb8\xce\x36\xbf\x55\xc8\x1d\xff\xb4\x49\x3e\
+\x20\xe2\xbf\x21\xf6\x37\xed\xfb\xaa\x39\x62\x4a\xec\xef\xa7\xef\
+\x4b\xf8\x37\xe1\x3a\x69\xc0\x8b\xdb\x2b\xd0\x51\x97\x87\x08\x57\
+\x4b\xb1\x9e\x39\x39\xc8\x51\xac\x63\x5e\x9f\x1c\x28\xf0\xcf\x8a\
+\xf0\x40\x98\xfb\x1a\xb8\x5a\x2d\xc2\xdc\x69\x13\x42\x35\x03\xef\
+\x7e\x5c\x1c\x87\xee\x5e\xbd\x60\xd2\x61\x9e\x9f\x1d\x4e\xb1\x5e\
+\xd1\xfd\xac\x01\x83\x1d\x2d\x7a\xb8\xbf\x79\xb3\x5c\x5b\x53\x7c\
+\xa0\xb3\x37\x17\xdc\x0c\xd3\x9b\xda\x45\xd5\x3c\x3e\xfd\x31\xbd\
+\x26\xc2\x3f\xef\x8b\x67\x4c\xf2\x81\x0b\xfb\x8d\xe0\xdf\x2b\xee\
+\x9f\xd0\xef\xfb\xc2\x8e\x49\xe3\x01\x37\xed\xfb\x2a\xfc\x89\xff\
+\x6f\xec\x6b\xc4\xa5\x1d\x95\x38\xbd\x29\x1f\x25\x11\xee\x08\x70\
+\x58\x86\x58\x5f\x1b\xb1\x96\xbd\x24\xd1\x5f\xac\x65\xcf\x8d\xf6\
+\x42\x14\x69\x03\x8f\xb5\x4b\xb0\xd2\x6c\xe6\x66\x8d\x74\x8f\x6e\
+\x5e\x4f\xcc\xe3\x01\x03\x61\x5e\xc0\x8f\xc7\xbd\xfb\xca\xe3\x3c\
+\xb7\x8b\xf3\xbb\x18\x55\xcd\x87\x6b\xfd\x3c\xb7\x83\x73\x7e\x9e\
+\xbf\x7d\xf5\xec\xc9\x6e\x51\x5b\x13\x76\x5e\xe5\x03\x64\x97\x3b\
+\x65\x3f\x90\x7d\xe1\x4a\x5f\xa6\xf4\xef\x4b\x06\x58\x1b\xe0\xae\
+\x1a\xd3\xdb\xee\x6f\x89\x82\x09\xcf\x9a\xe4\x03\x12\xfe\xa6\xf2\
+\xbe\x01\xfe\x3c\x3f\xd4\xc4\xbe\x2f\xf0\xdf\xbf\x05\x5d\x94\x03\
+\x9c\xa9\x2f\x40\x53\x86\x16\xde\xeb\x16\x23\xc2\xc3\x0a\xe9\xa1\
+\xce\x62\x2d\x7b\x71\x82\x1f\xf2\x63\xbc\x11\x43\x3e\xe1\x4d\xb1\
+\x73\xdd\xb2\xb9\x97\x34\xd2\xfc\xb0\x07\x34\x52\x1d\x60\x20\x68\
+\xc0\x11\x66\x53\xc7\x4e\xe0\xb9\xfc\xbc\x76\x4b\x9d\xf7\xf1\xb8\
+\x1f\x3f\xc6\xf5\xa0\x28\x1f\xbb\x6e\x5d\x5e\xad\xf8\x40\xd7\x39\
+\x79\xbc\xb5\xd3\xc0\x2e\xe8\xfb\x82\xc9\xa6\x8f\xbb\x32\xa6\xc7\
+\xf8\x17\x7e\xf9\x57\x93\x7c\x40\xc2\xbf\x1f\xde\x37\xd6\xf7\x99\
+\xff\x39\x0f\x30\xda\xf7\x9b\x7b\xf5\x7d\x90\xfe\xef\x66\xfc\x5b\
+\xaa\x71\x96\x72\x80\xc3\x65\x49\x14\x27\xcd\xc4\x1a\x11\x5e\xc7\
+\xcc\x6b\xd9\x79\x4f\x83\x02\xb2\x78\x3f\x3b\xf8\xda\x5a\x60\x9d\
+\xf9\x6c\xbc\xfa\xea\xe8\xb1\x9a\x81\xa3\x01\x45\xdd\xc7\x7c\xce\
+\x84\x35\xdc\xbf\x79\x5c\x4f\xa9\xf9\xb1\x06\xe0\x58\x20\xc5\xfe\
+\x19\x28\x4d\x8b\xee\x16\xba\x5a\xd8\x59\x69\xdd\x95\xc2\x03\x97\
+\xce\x1b\xf8\x81\x21\x86\x17\xfa\xf0\x09\xd5\x63\x86\xfe\xa3\x8c\
+\xe5\x92\x35\x07\xac\x46\xf1\x57\xcf\x99\xe4\x03\x17\xf6\xef\x30\
+\x11\x7b\x15\xfe\x67\xe4\xbe\xcf\xe3\xbd\x26\xf6\x7d\x05\xff\xcb\
+\x84\xff\xb9\xcd\x85\x38\xbe\x21\x0d\x61\x8e\xcb\x10\x40\xd7\x30\
+\xd6\x67\xad\xd8\xdb\x40\xda\xd3\xc0\x0b\x09\xe4\x0f\xac\x0f\x6d\
+\x2d\xe6\x60\xfc\x27\xef\x9a\x6b\xa4\xbd\xe8\x78\x3c\xf0\xbb\xae\
+\x03\x09\xed\x6f\xb9\x60\x52\x94\xab\xe5\x3c\xd2\x7a\x2b\x7b\xc6\
+\xfa\xc8\x0f\xb8\x0e\xc0\xf3\xfc\x79\xbe\x7f\x4b\x6d\x69\xb7\xe0\
+\x55\x1d\xfe\xb2\x0f\x08\x3b\xdf\xe3\x07\x3a\x7f\x30\xc4\xf3\xc2\
+\x4d\xf0\xee\x34\xd0\x14\xe7\xa1\x9e\xc7\xc1\xf8\x97\x4c\x7c\xde\
+\x24\x1f\xd0\xe1\x2f\xb0\x37\x91\xf7\xb9\xdf\xab\xb1\x37\xa1\xef\
+\xa3\x4d\x1f\xff\x13\x84\x7f\xaa\xcf\x1a\xf8\x50\x0c\x88\x74\x5f\
+\x8d\xf4\x10\x27\xe4\x46\xba\x23\x2f\xca\x83\xf8\xc0\x5e\x68\x03\
+\xde\xf3\x68\xc6\x57\x63\x7d\x35\xd2\xdc\x40\xde\xaf\xf4\xbb\xce\
+\x01\x04\xfe\xeb\x96\xce\xd8\xe0\xb5\x66\x11\xa2\x3d\x29\x76\x85\
+\x38\x20\x2d\xd8\x5e\xac\xcd\x0f\x91\xb5\x1f\xcf\xf9\x3f\xb1\x67\
+\x7b\x37\x3a\x4f\xcb\xb1\xf5\x8c\x71\x3f\x50\xf3\x81\x0a\xcf\xf3\
+\x0d\x25\x38\x1c\x65\x8f\xf6\x28\x3b\x1c\x8a\x24\x8b\xb0\xc5\x81\
+\x08\x1b\x1c\x08\xb7\x41\x5b\x98\x0d\xf6\x6b\xd7\x61\x5f\xe8\x5a\
+\xec\x25\xdb\x13\xba\x06\xbb\x43\xd6\x60\x57\xb0\x35\x76\x06\x59\
+\xa1\x35\xd0\x0a\xb5\xe6\x1f\x63\xfd\xa4\xe7\x4d\xf2\x81\x3a\xc7\
+\xf9\x68\xf0\x30\xc7\x26\xf7\xa5\xa8\x73\x5b\x22\xac\xd6\x75\x31\
+\x6a\x5c\x16\x61\x23\x59\xb5\xb3\x19\xaa\x9c\xcc\xb0\xc1\x71\x21\
+\x2a\x1d\x17\xa0\xc2\x61\x01\xca\x6d\x66\xa3\x6c\xed\x2c\xb2\x99\
+\x26\xf7\x7d\x63\xf8\x17\x85\x3a\xc2\xc3\x6a\x01\xb4\xd4\x8f\x92\
+\x03\xed\x88\x03\x5c\xc4\xfe\x26\xc9\x81\xf6\x08\x24\xfc\xed\x97\
+\xcf\xc1\x82\x19\x13\x52\x35\x03\xe7\x9e\xcc\x7c\xee\x3b\x1d\x96\
+\x7f\xbd\xcf\xcf\x76\x29\xe2\x7d\xd7\x21\x2b\xcc\x19\x99\xa1\x4e\
+\xc4\xff\xeb\xc4\x7e\x2d\x6e\x96\x92\xf6\xbf\x7c\xa2\xbd\x5b\x68\
+\x29\xf6\x81\xce\xd3\xaa\x1c\xfb\x66\x3e\x20\xd9\xc9\xec\x50\xb4\
+\x2c\x7a\x03\xcd\x66\xff\xc4\x8e\x85\xaf\xa3\x69\xc1\x6b\xd8\x36\
+\xff\x1f\xd8\x32\xef\x1f\x68\x9c\xfb\x2a\x1a\xbe\x7e\x05\xf5\x73\
+\xfe\x8e\xba\x59\xa3\x51\x3b\x6b\x14\x6a\x66\x8e\x42\xf5\xf4\x97\
+\xb1\x61\xda\x4b\xa8\x9c\xfa\x22\xca\xa7\xbc\x80\xb2\xc9\x7f\x33\
+\xd9\x07\x4c\xad\x15\x1b\x9b\x3f\xd0\x1b\x7b\xe3\x7d\xbf\x07\xff\
+\x2a\x9c\x6b\x60\xfc\x53\x51\x15\xed\x2e\xd6\xbb\x05\x8b\xf5\x11\
+\x6b\xc5\x75\xe4\xeb\xc9\xbe\xa0\xe0\x6f\x36\x73\x42\xb9\x46\xaa\
+\x03\x0f\x84\xb1\x40\x51\xf7\x77\x5a\x39\xff\x54\xa0\xe3\x72\xa4\
+\x90\x9f\xe6\x92\xbf\x72\xec\x4a\x0e\xb0\x45\xa8\xf3\x72\xea\xff\
+\xf3\x49\xff\xcf\xc5\x8d\x33\x27\x24\xfc\xcf\x2b\xda\xca\x98\x0f\
+\x28\xfa\x50\x31\xc9\x1f\x4e\xe5\x84\x60\xe7\xe2\x37\x07\x85\x0f\
+\x48\xd8\xf7\xdf\xf7\xd1\xb6\x15\xdd\x94\xff\x5d\x26\xfd\x7f\xb6\
+\xa1\x00\xc7\x2b\x53\xb1\x39\xd1\x47\xcc\x87\xe4\xb1\x12\x5e\xff\
+\x2a\xf6\xb9\x21\x4e\x48\xa2\x6b\x19\xe8\x60\x01\xfb\x65\x02\x7f\
+\xce\x01\x07\x4a\x0d\x40\xd4\x7e\x3c\xd7\x2e\x46\xa8\xcb\x2a\x91\
+\xb7\x88\x3d\x98\xa2\xdc\x91\x12\x64\x2f\x78\x8c\xf9\xcc\xc7\x66\
+\xc9\x0d\x51\x2b\xd7\xc5\x54\x35\x0f\xa8\xfd\xe0\x8c\xbe\x1f\xc8\
+\x9c\xd0\x91\x13\x8a\x5d\x4b\xde\x1c\x14\x3e\xd0\x57\xad\xcf\xb0\
+\xef\x4b\xf8\x6f\x46\xd7\xf6\x0d\x38\x5b\x9f\x8f\xe3\x15\x29\x68\
+\x4a\xf1\x13\x79\x32\xef\x7b\xc3\x75\xd3\xd4\x40\x5b\xa4\xd1\x75\
+\x4c\xf2\xb3\x11\xba\xd0\xde\x62\x36\x96\xcd\x9d\xd4\xa6\x91\xe6\
+\x04\x0e\x18\xfc\x5d\x57\x2f\x44\xb8\xbb\x15\xb2\xc2\xdd\x50\x48\
+\x79\x2b\xef\xc7\x96\x46\xfa\x25\xdc\xcd\x12\x9e\x94\xd3\x84\xba\
+\x5a\xcb\xda\x99\x35\x94\xec\x03\x9d\x2a\x1e\xd0\xd9\x19\x7d\x4e\
+\x90\x79\xe1\x34\xe1\xbf\x67\xe9\x5b\x83\xc2\x07\x8c\xf2\xfe\xc1\
+\xde\xd8\xa3\x6d\x0b\x6e\xec\x6d\xc0\xa5\xed\x15\x38\xb3\x29\x17\
+\xc7\xca\x93\xd1\x9a\x1e\x28\xd6\x3d\xfa\x52\xce\xcc\xeb\x60\x75\
+\xe3\xe7\x14\x0b\xfc\x89\x13\x78\xce\xd4\xf2\x79\x53\x8f\x0c\x34\
+\xfc\xdd\xd7\x90\x66\xf5\x5c\x8b\xdc\x28\x4f\x94\x24\xf8\xa3\x28\
+\xde\x17\x19\x5a\x17\x44\x7a\x58\x4b\x35\x0d\x4f\x1b\x59\x33\xcb\
+\x63\x66\xe7\x65\x2e\xe8\x34\xf4\x83\x33\x06\x3e\x20\x19\xe3\xbf\
+\xd7\xfc\xed\x41\xe1\x03\xa6\xf0\xbe\x82\xff\xf5\x3d\xf5\xb8\xb8\
+\xad\x0c\xa7\x6b\x73\x70\xb4\x2c\x11\x2d\x69\xfe\x62\x8c\x54\xc2\
+\x7f\xa5\x5e\x1d\x95\x39\x81\xc7\xd6\x97\xcd\x9d\xc2\xf8\x0f\x24\
+\xfe\xbf\x93\xf7\x5b\x8e\xf6\xb6\x41\x5e\x8c\x8f\xa8\x5b\x97\x26\
+\x06\x10\x17\xb8\xd3\x63\x6b\xc5\x3e\x5c\x51\xde\x76\x72\xae\x74\
+\x42\xc5\x03\x06\xf1\xe0\xbc\x01\x1f\x5c\xe8\x89\x0d\x67\x72\x43\
+\xb1\xdf\x62\xcc\xa0\xf0\x01\x1d\xf6\x6c\x1c\x0b\x8c\xf0\x3e\x63\
+\x0f\xd2\x7e\xd7\x76\xd5\xe1\xc2\xd6\x52\x74\xd4\x64\xe1\xc8\xfa\
+\x78\x34\x13\xff\xf7\xf4\x7f\x7d\xfc\x7d\xd7\x99\x09\x1d\x6d\xf1\
+\xf5\x24\x05\xff\x81\xa0\xff\x84\xfe\xf7\xb1\x5b\x8e\x18\x5f\x3b\
+\x14\xc4\xf9\xc9\xe3\x56\x41\xc8\x21\x2e\x88\xf5\xb5\x85\x3f\xe9\
+\x56\xad\xdb\x9a\x1b\x62\xbe\x24\xfb\x00\xcf\x99\x52\xc7\x02\x25\
+\x1e\x18\xe5\x03\xc9\xce\x12\xfe\x6d\xcb\xde\x19\x14\x3e\x20\xf0\
+\xe7\x71\x40\x5e\x1f\xc0\xe3\x41\xc6\xb0\x17\xf8\x37\xe2\x6a\x6b\
+\x0d\x3a\x1b\x8b\x71\xaa\x3a\x03\xed\x25\xb1\xd8\x12\xef\x21\x6a\
+\xa5\x86\xfc\xcf\x63\xe8\xbc\x17\x06\xe7\xd1\xe6\x12\xfe\xbc\xb7\
+\xec\x40\xc9\xff\xee\xe0\x39\x4a\xbc\x87\x62\x61\x42\x80\x98\xbb\
+\xc0\xfb\xee\xe6\xc7\xfa\x22\x21\xc0\x01\x41\x4e\x2b\x11\xe0\xb0\
+\x42\xaa\x91\x29\x35\x13\xa5\x8e\xa6\xf8\xc1\xf9\xbe\xb8\x40\xb2\
+\x73\x79\xa1\x38\xb8\xfc\xdd\x41\xe1\x03\x62\x5e\xb8\xb2\x46\x88\
+\xe7\x04\x19\xe1\x7d\xc6\x9e\xb5\x1f\x6b\x7f\x25\xf7\x3b\x54\x14\
+\x8d\x86\x18\x37\xb1\xc7\x8d\xa2\xff\x14\xfc\x39\x17\xe0\xf9\x33\
+\x6b\x16\x4d\xc5\xbc\xc9\x63\x9b\x34\x52\xfd\x67\x20\x8c\x01\xf3\
+\xb9\x7f\xe2\xeb\xb0\xe2\x00\xaf\x67\x28\x4a\x0c\x44\x75\x56\xa4\
+\x98\xbb\x52\x4c\x31\x20\x39\xd8\x99\xb4\x9f\x15\xbc\x6c\xcc\x71\
+\xfd\xe4\xa1\x6e\x69\x1d\xed\xf1\x9e\x58\x70\xd6\xd0\x07\x4e\x1a\
+\x70\x81\x64\x8c\xff\xa1\x15\xef\x0d\x0a\x1f\x90\xb0\x97\xd7\x87\
+\x33\xfe\x46\x78\x9f\xf1\xbf\xb1\xb7\x5e\xd6\x7e\x79\x38\x56\x91\
+\x8c\x83\x05\x11\x28\x0f\xb5\x83\xf3\x8a\xd9\x62\xbe\x44\xb4\xc1\
+\x38\x1a\x8f\xad\x59\x2f\x9c\x02\xb3\x69\x9f\x37\x68\xa4\xfb\xd4\
+\x0c\x84\xfa\xaf\xa8\xff\xfb\x39\xae\xdc\xc6\x7b\x67\x32\xfe\x3c\
+\x77\x91\xf7\xd9\x2e\x4b\x09\x11\x7b\xed\x46\x90\x2e\xe4\xbd\xf9\
+\x3b\x0f\xee\xec\xc6\xe9\xa3\xf2\x5a\x6a\x43\x2e\x38\xa9\xd2\x04\
+\xb2\xa9\xf0\x3f\x9f\xa7\xc5\xe1\x95\xef\x0d\x0a\x1f\xe8\xd9\x1b\
+\xe2\x90\x34\x2f\xd0\x08\xef\xb3\x5d\xa7\xd8\x7f\x71\xeb\x7a\x9c\
+\xae\xc9\x26\xed\x97\x80\x36\xfa\x8d\xf9\xbe\x56\x70\x59\x39\x47\
+\x8c\x99\xc6\xa8\xd6\xc9\x33\x17\xf0\x9e\x28\xab\x17\x4c\xc2\xcc\
+\x09\x1f\x65\x69\xa4\x79\xa0\x03\x65\x2d\xc0\x08\x7f\x67\xcb\xbc\
+\x18\xc2\xbf\x30\x81\xd7\x31\xc4\x8a\xf9\xcb\xbc\xb7\x76\x76\x94\
+\xb7\xd0\x05\xbc\xbf\xc5\xe1\xed\x75\x10\xf8\x0b\x1f\x38\xaa\xef\
+\x03\xea\x98\xc0\xfb\xae\x18\x70\xc1\x8d\x13\x07\x71\xfd\x50\x2b\
+\xae\x09\xdb\x29\xff\x95\xec\x2a\xdb\xc1\x96\x5e\x76\xe5\x40\xb3\
+\xce\xf6\x07\xac\x30\xd9\x07\xce\x6e\xcc\x41\x57\x73\x35\x2e\xed\
+\xa8\x92\x8c\xf2\x73\x9d\x35\x55\xe2\x62\x53\x05\x2e\x36\xd7\xe0\
+\xe2\xae\xcd\xb2\x35\xe0\x02\xdb\x4e\xc9\x74\xd8\x9f\xe4\xfe\xbf\
+\xbf\x17\xef\x0b\x23\xee\xbf\xda\x5a\xad\x8b\xfd\x87\x29\xf6\xef\
+\xcb\x0e\x46\x92\x8b\x85\xd8\xe3\x2e\xc8\x61\x29\xe2\xbc\x7a\xd6\
+\xcb\x46\xb8\xae\x10\xfb\xa6\xac\x9a\x37\x11\xd3\xc7\x7f\xa0\xa5\
+\x6b\xfe\x7b\x8d\xb4\x5f\xf2\x40\x98\x07\xfe\x23\x3f\xa7\xd5\xbe\
+\xbc\xff\x26\xaf\x6b\xe6\x7d\x92\x79\x1d\x0b\xef\xa9\xce\x6b\x9b\
+\x12\x02\x9d\x10\xe8\x6c\x89\xad\xe5\xb9\xd2\x18\x19\xdb\x19\x35\
+\x0f\x28\x66\xa8\x0b\xfa\xe0\x85\x5e\x76\x4a\xff\x75\x86\xaf\xa7\
+\xcf\x3d\xa8\xb5\x36\x99\x07\x18\x7b\xfd\x39\x3c\xca\x98\x4e\xab\
+\xa4\xe7\x18\xdb\x0e\xf5\x3e\x40\xed\xfa\x9c\xaf\x87\xff\x3e\x23\
+\xd8\x53\xec\xdf\xd3\x80\xae\x1d\x95\x38\xbb\x29\x1f\xc7\x2b\x53\
+\x28\xf6\x47\x61\x4f\x66\x00\x82\xd7\xcc\xd3\xed\x85\x98\xa0\x9a\
+\x43\xc7\x7b\x25\x39\x13\x2f\xac\xf8\xfa\x4b\x7c\xf1\xf1\x18\x6b\
+\xcd\xc0\x9a\x03\x7a\x7b\x80\x93\xd5\x22\xde\xaf\x27\x2f\x3e\x40\
+\xe0\xbf\xb9\x38\x49\xac\x6b\x2d\x49\x0e\x41\x8a\xd6\x0d\x5a\xf7\
+\x35\xf4\xef\x08\xe9\x9a\xe9\xf0\x97\x4d\x8d\xff\x59\x63\xda\xe0\
+\x26\x3e\x61\xd4\xe4\xb1\x39\xb1\x46\xf3\x80\x98\x97\x79\x28\x74\
+\xb5\xc9\xb1\xa0\x8b\xfa\x7c\x2f\xec\x39\x8e\x33\xa6\x7a\xfb\x7f\
+\xf5\x83\xfd\x49\x59\xff\xab\xb1\x97\xf1\xbf\xb6\xab\x96\xf2\x7e\
+\x85\xfb\x13\xd1\x96\x1f\x86\xd6\x54\x1f\xb8\x2e\x9b\xd1\xb3\x27\
+\x9e\x3c\x87\x8e\xc7\xd1\x79\xfe\x2c\xe7\x85\xcb\x66\x7f\x81\x37\
+\xff\xf1\xf2\x17\x1a\x69\x2d\xe0\x40\xd9\x17\x64\xb8\x8f\xa3\xe5\
+\x3f\xc2\x29\xc7\xcf\x8e\xf5\x97\xf7\x49\x4f\x11\x3e\xc0\xfb\xe8\
+\xf3\x3a\x26\x5e\xef\xcc\xfb\x61\xe9\xf0\xd7\xe3\x01\x63\x3e\x60\
+\x2a\xfe\xaa\xc7\x05\xe6\x47\xa4\xeb\xae\xac\xc7\x93\xd7\xe5\xb4\
+\x13\xfe\xa6\xea\x01\x3d\xfc\xf9\xfd\x8c\xad\xf2\x7d\x6f\x05\x7b\
+\x81\xff\x6e\x9d\xde\xd3\xf5\xfd\xbd\x0d\xb8\xd2\x52\x85\xf3\x9b\
+\x8b\x70\xb2\x2a\x5d\xe6\xfe\x10\xd4\x86\xdb\xc1\x69\xd9\x6c\x91\
+\xe7\xeb\xaf\x9d\x59\x23\xf4\xa0\xed\xd2\xe9\x30\x9f\xf5\x05\x1e\
+\x7b\xf8\xe1\xe7\x34\x03\x23\xf7\x53\xda\xb0\x45\x8b\x66\xdc\x13\
+\xe1\xe3\x40\x58\xfb\x8a\x3d\xad\x78\xbf\x3b\x5e\xcf\xce\x6b\x59\
+\x79\xef\xab\xf8\x40\x67\x8a\x01\xab\x71\xe1\x40\xab\xec\x03\x8a\
+\x1f\xa8\x78\xa0\x57\x3c\x38\x26\xd7\x0a\x8c\xc4\x05\x5d\x1d\x41\
+\xc6\xfc\xd4\x41\x3d\xbc\x7b\xd6\xe2\x49\x76\x98\xf0\x37\x55\x13\
+\x76\xed\xa8\x96\xd6\x74\x9d\x56\xf9\x6a\xc7\xad\x60\xaf\xda\x17\
+\x88\x7d\x48\x85\x3d\xc7\xfd\x1b\xbb\x37\x91\x8e\x28\xc3\x99\xba\
+\x5c\x1c\x17\xba\x3f\x12\x7b\x32\xfc\x91\xed\xb9\x42\x70\x7c\x80\
+\xac\xfd\x75\xb9\x1f\xe9\x40\x9e\x43\xc3\x6b\x2a\xcd\xa6\x8d\xdb\
+\xaf\x19\x78\x6b\x80\xc4\x3e\x5f\x84\xff\x56\xde\xc3\x88\xf7\x41\
+\xe6\xbd\xf1\xd9\x1a\x88\x03\x4a\x53\xb5\x62\x1f\x3c\xad\xe7\x3a\
+\x6c\xaf\xcc\x97\xfb\x93\x9a\x07\x14\x4d\x78\xcc\xb8\x26\xe8\x65\
+\xc7\xa4\xf7\x2b\x98\x1b\xc1\x5b\xb7\x16\x47\xb6\x23\x5a\x2b\x93\
+\xf3\x82\xcb\x7b\xb7\xc8\x7b\xfd\xa8\xfb\xfc\x37\xc0\x9e\x8d\xeb\
+\x7f\x2a\xec\xb9\xef\x5f\x6d\x91\x74\x5f\x07\xe9\xbe\x23\xa5\x71\
+\xd8\x9f\x1b\x8a\x9d\xc4\xfd\x21\xd6\x73\xc5\x5c\x09\xe6\x7a\xf5\
+\x5e\x29\xbc\x57\x06\xef\x8d\xb5\x7a\xfe\x24\xcc\x99\xf8\x71\x86\
+\xa6\x67\xee\xdf\x40\xd0\x7e\x4a\xbb\x3d\xdc\xc7\xc1\x27\x31\xd4\
+\x03\xeb\xd3\x23\x09\xfb\x4c\x71\xff\x24\xe6\x01\xf6\x87\xec\x18\
+\x7f\x44\x53\x7e\x90\x17\x17\x2c\x5f\xbb\xc3\x06\x3e\x70\x44\xba\
+\xe6\x86\x5c\xa0\xb3\xa3\xd2\xfb\x78\xbf\x85\x7e\xb0\xd6\x33\x79\
+\x3d\xc6\x51\xc2\xdf\xd4\xdc\x50\xe0\xff\x6d\x60\xcf\xc6\x63\x01\
+\x32\xf6\x3d\x7d\xbf\x9c\x74\x5f\x9e\x18\xef\x63\xdd\xb7\x37\x33\
+\x10\x8d\xd1\x4e\x70\x32\x9f\x2e\xd6\x4c\x6b\x55\x7b\xa2\x72\xec\
+\x67\x2d\xe8\xbc\x7c\x36\x96\x7f\x3d\x01\x5f\x8d\x1d\xb3\x42\x33\
+\xb0\x62\xbf\xd2\x6e\x0b\x71\xb7\x7b\x8f\xef\x89\x56\x94\xac\xc5\
+\x96\xb2\x74\xb4\x54\xe7\x8a\xfb\x24\xf1\xde\xf8\xbc\x3f\x7a\x52\
+\xa8\x3b\xb4\x1e\xeb\xd0\xd5\xbe\xab\xc7\x07\x3a\xfa\xc2\xff\xa8\
+\xf4\x9c\x88\xe5\xfb\xfb\xc6\xd7\x28\xde\xf2\x1a\x1c\xc5\x48\xcb\
+\x1f\x0b\xb3\x32\xb9\x3e\x70\x79\xef\xd6\x9b\xe3\xde\xd1\x17\xee\
+\x06\xd8\xb3\x71\xed\x5f\xc6\x5e\xea\xfb\x55\xd4\xf7\x8b\x74\x7d\
+\x9f\x73\xfe\x5d\xd4\xf7\x73\xdc\x97\x89\xf5\x31\xbc\x76\x26\x52\
+\x55\xf7\xe3\x75\x34\xbc\x4f\x0e\xef\x8b\xc7\xb1\xff\xe9\x27\xff\
+\xf0\x92\x66\x60\xd4\xfd\x0c\xdb\xb0\x19\x33\xc6\xde\x4d\xf8\x77\
+\xf2\xbd\xb0\x36\x15\x25\xa3\xb5\x26\x0f\xad\x1b\xf3\x28\xef\xcb\
+\x40\x45\x66\x14\x32\xa3\xfd\x10\xe5\xeb\x40\xba\x20\x87\xae\x5d\
+\xbb\x64\xbd\x62\x81\x1c\x0f\xf8\xda\x1e\xdd\x63\xa2\xed\xee\x85\
+\xb7\xbe\xed\x14\xf8\x9b\x5a\x23\xba\xbc\x67\x4b\x1f\xb8\xdf\x22\
+\xf6\xcc\x55\xac\xfd\x04\xfe\x0d\xb8\x4e\x9a\xff\x12\x69\xfe\xb3\
+\x72\xdc\x3f\x54\x18\x29\xfa\x7e\x4b\x92\x3b\x7c\x57\xcc\xec\xe1\
+\x7e\x55\xde\x1f\xe5\x6e\x29\xee\x85\x62\x6d\x36\x19\x0b\xa7\x7e\
+\xb6\x43\xd3\x93\xf7\x7f\xd7\xf3\x7e\x8d\xb5\xdb\xa3\xfc\x5d\xe2\
+\xd2\x22\xfd\x50\x95\x1b\x4f\xd8\xe7\x8b\xfb\xe1\xb4\x54\xe7\x89\
+\xfb\xa4\xf0\xfd\x34\x13\x43\xdc\x91\x18\xec\x8e\x1b\x7c\x6d\x44\
+\x1e\xdd\xae\xea\x6b\x87\x7b\xf2\x03\x45\x3b\xdf\xcc\x8e\x18\xc3\
+\x5a\x5e\x7b\x75\x44\x95\xbf\xd1\x63\x27\x22\xd6\x98\x5c\x27\xec\
+\x13\xff\x3e\xf9\xbe\x0f\xec\x8f\xb7\xe9\xb0\xbf\xb1\x67\x13\x2e\
+\x53\xbe\x7f\xbe\xa1\x00\xa7\x48\xf3\x8b\xbe\x4f\x71\x9f\xfb\x7e\
+\x79\x80\x15\x9c\x2c\x66\xc2\x67\xed\x42\xb1\x4e\x56\xcd\xfd\x3c\
+\x7f\x96\xd7\xd3\xae\x9c\xfb\x25\xa6\x7c\xf6\xbe\xa7\xa6\x67\x0f\
+\x98\x81\xc4\xfd\x4a\xbb\x8d\xfa\xff\x58\xbe\x1f\x62\x69\x7a\x14\
+\xb6\x6f\xc8\xc1\x9e\x4d\x45\xd2\x7d\x50\xca\x33\x51\x91\x15\x2d\
+\xee\xbd\x14\xe5\xe7\x88\x7d\xf5\x15\xf2\xb5\x6c\xd7\xe7\x02\x45\
+\x17\xf0\x73\x46\xb1\x35\x82\xb3\x1a\x6b\xb5\x71\xdc\xe0\xcf\xa1\
+\xb8\x72\x22\xda\xd6\xe4\x5a\xf1\xe5\x3d\x8d\x7d\xf7\x79\x53\xb1\
+\xe7\x3d\x61\x98\x9b\x08\xfb\xee\xbd\xf5\xa2\xd6\x77\x61\x4b\x09\
+\xe5\xfb\x59\x38\x46\xf9\x3e\xd7\xfa\x59\xf3\x37\x27\xba\x41\x6b\
+\x3d\x47\xac\x8b\xe7\x9a\xaf\x5a\xf7\xf3\x98\x2f\x73\xbf\xad\xcc\
+\xfd\x7f\x79\xe2\x31\xde\x17\x7c\x20\xef\x01\x35\xec\x9d\x77\x9e\
+\xbe\x23\x51\xeb\x75\x32\x2f\x31\x14\xf5\xa5\x69\xd8\x53\x5f\x8c\
+\xbd\x64\x3b\x6b\x0a\x50\x47\x31\x81\xb5\x41\x92\xd6\x13\x19\x11\
+\x7e\x3d\x1c\xa0\xf8\x81\x1e\x17\xd0\xbf\x0f\x1b\xd6\xe0\xfa\x31\
+\xf6\x09\xd6\x86\x27\x0f\xa9\xf4\x84\x64\xa7\xa2\xed\x4c\x1e\x2f\
+\xb8\xa2\xc3\xff\x16\x71\x57\x63\xcf\xc6\x75\x23\x35\xef\x6f\xca\
+\xc5\x89\xca\x14\xb4\x17\x45\x8b\x5a\xef\xce\x64\x2f\x6c\x08\xb2\
+\x86\xa3\xd0\x7d\x0b\x44\x8d\x4f\xbd\x4f\x1a\xd7\x00\x78\x1f\x0d\
+\xab\x05\x93\x31\x77\xd2\x27\x1b\x35\xfa\xfb\x01\x0f\xd4\x36\x3c\
+\x49\xeb\xe3\x9e\x16\xe5\x8f\x0d\xb9\x09\xd8\x49\x7d\x7f\x7f\xe3\
+\x7a\xec\x6d\x28\x41\x53\x65\x36\x2a\x73\x62\x91\x1d\x1b\x28\xee\
+\xad\xbd\xab\xb6\xb4\xe7\xda\xea\xf5\x37\xd9\x07\xb8\xff\x2a\x75\
+\x57\xc3\x3a\xac\xf2\x18\xf7\x31\xbe\xd6\xa7\x94\x1a\xcd\x61\x03\
+\x93\x34\xc5\xa9\x18\x3b\x93\xc7\x8c\xae\xec\x6d\xd4\xc7\xfd\x9b\
+\x60\xcf\xf5\x03\xde\xe3\x61\x77\x1d\xba\xb6\x97\xe3\x7c\xbd\x9a\
+\xf7\xb5\xd8\x9d\xe6\x8b\x1d\xf1\xae\x08\xb6\x9c\x05\xd7\x95\x5f\
+\x8b\x3d\xb1\xd4\xe3\xbd\xec\x07\xbc\x7f\x0e\xcf\x05\x58\x3e\x67\
+\x02\xc6\xbd\xff\xcf\x79\x9a\x81\x55\xf3\xe9\xab\x0d\x8b\xf0\xb6\
+\x7b\x24\x31\xcc\xfb\x5a\x71\x5a\x24\xb6\x56\x64\xa3\x6d\x4b\x19\
+\xf9\x40\x19\x76\x6f\x2a\x46\x03\x71\x02\xdf\x2f\x95\xef\xa7\x9d\
+\x14\xe2\x81\x2b\x47\xf6\xe8\x73\x80\x5e\x2c\x68\x97\x72\x3b\x8e\
+\xf5\x42\xdf\xef\x95\x7c\xe2\xa4\xcc\x1b\xbd\xb0\x36\x62\xb2\x2f\
+\x75\x10\xfe\xa6\x8e\x1b\x8a\xfe\xdf\x27\xee\x7d\xf1\xbd\x01\xf6\
+\x64\x37\x28\xef\xbf\x42\x31\xbf\x73\x33\xe9\xfd\x8d\x99\xc4\xfb\
+\x09\x38\x98\x1f\x4e\xbc\x1f\x80\x96\x44\x77\x14\x79\x2d\x87\xa3\
+\xc5\x0c\x51\xdb\x11\x7d\xdf\xc7\x5a\x6f\xbc\x8f\xeb\xc0\x6b\xcc\
+\xa6\x62\xd1\xf4\x71\x47\x47\x8c\x18\xc1\xeb\xbd\x94\xf1\x9e\x81\
+\xc8\xfd\xea\x76\x7b\xa2\xd6\x3b\x36\x8b\x72\xfd\x9a\xc2\x14\xec\
+\x69\x28\xc5\x81\x6d\x15\xc2\x0f\x9a\x49\x13\x6e\x2c\x48\x44\x3e\
+\x69\x41\xbe\x9f\x7a\x6d\x7e\x8a\x14\x07\x4e\xf6\x81\xbf\x31\x7d\
+\xd8\x71\x73\xac\xf5\x4d\xfa\x8c\xd3\xb1\x76\x26\x8f\x1d\x0b\xfc\
+\x4f\xde\x4a\x9f\xef\x8d\x3d\xdf\x03\xe2\x4a\x73\x15\x2e\x50\xae\
+\xc7\x31\xff\x78\x59\x92\xd0\xfb\xfb\xb2\x82\xd0\x9a\xec\x89\xc6\
+\x28\x7b\x78\x58\xf4\xdc\xf3\x4c\x1d\xf7\x79\xfd\x1c\xe7\x01\x3c\
+\x0f\x9c\xc7\x7b\x26\x8d\x7d\xcb\x46\x23\xf5\xfd\xc1\x72\x3f\x90\
+\x61\x29\x51\xbe\xcf\x26\x85\xf9\x5c\x2b\xcd\x88\x41\x53\x55\x2e\
+\x0e\x6e\xab\x14\xc6\x3c\xb0\x95\xe2\x40\x45\x76\xac\xb8\x2f\x62\
+\x5c\x90\x1b\x8e\x6c\xaf\xc5\x8d\xe3\x8a\x0f\xdc\x84\x0b\x8c\x9a\
+\x71\xbc\x0d\xed\x4c\xac\xbd\xc9\xf3\x07\xae\xec\x6e\xec\x1f\x77\
+\x63\x7c\xaf\x60\x7f\x7c\x1f\xae\x1e\xdc\x41\xd8\x17\xe3\x4c\x6d\
+\x36\x4e\x50\xae\xd7\x5e\x14\x85\xfd\x39\x14\xf3\x53\xbc\xb1\x3d\
+\xce\x19\x31\x6b\xbf\x16\xf8\xf2\x9c\xae\x70\xa1\xf9\x7b\xe2\x7e\
+\xa4\xdc\xf7\xb9\xde\xbb\x68\xda\x67\x27\xee\xb9\xeb\x2e\x5e\xeb\
+\x37\xd8\xee\x03\x30\x3c\x25\xd2\x3f\x32\x3b\x3e\x04\xb5\x45\xa9\
+\xd8\xbb\x79\x3d\xda\xb7\x57\xe1\x50\xd3\x06\xd2\x84\x25\x68\x58\
+\x9f\x8e\xd2\x8c\x28\xa4\x47\xf9\x21\x2d\xc2\x17\x17\x0e\x34\x13\
+\x0f\xb4\xf5\x8e\xbb\x42\x1b\x28\xd6\x9f\x2f\xb4\xab\x5e\xdb\xd7\
+\xeb\x8d\x7c\xbe\x1e\xcf\xf7\xc3\xf5\x37\xe9\xf3\x0a\xf6\xd7\x48\
+\xb7\x5e\x6a\xad\xd1\x61\x7f\x98\xf4\x5e\x5b\x4e\x88\xc8\xf5\x76\
+\xc4\xbb\x10\xef\x2f\x83\xc3\xd2\x69\x62\x9f\x9c\x10\x07\xfd\x7b\
+\x9c\xf2\x58\x4f\xa0\x1c\xf7\xb9\xef\x4f\xfc\xf8\x2d\x6b\x8d\x54\
+\xef\x19\xe8\x71\xdf\xb0\x0d\x8b\xd1\x7a\x3c\x9c\x1a\xe5\xdf\x55\
+\x42\x1c\xb0\x6d\x43\x2e\xc9\xa1\x2a\x1c\xde\x51\x2d\x7c\xa0\xb5\
+\xb6\x90\xfc\x22\x05\x45\xa9\xe1\x48\x09\xf7\x41\x49\x4a\x24\xae\
+\x1c\xde\x8d\xeb\x22\x67\x3b\xa8\xb2\x43\x06\x98\xde\xc4\xfa\xf4\
+\x17\x53\x30\xff\x26\xb8\xeb\x63\x7f\x83\x38\xff\x5a\xfb\x4e\x5c\
+\x6e\xdb\x2e\xd6\x73\xf7\x60\x1f\x2a\xf4\x5e\x33\xe9\xbd\x8d\xc1\
+\xd6\x70\x5d\x2a\xdd\x03\x87\xd7\xf8\x70\x9c\x57\xef\x89\xcf\x5c\
+\xc0\xe3\xff\xd2\x3c\xaf\x4f\xdb\x28\xee\x3f\xa0\xe9\xb9\x0f\xd8\
+\x60\x6b\xc3\x33\x62\x03\xed\x33\x49\x07\x54\x17\x24\x63\x77\x7d\
+\x29\x8e\xb4\xd4\xe0\x70\xf3\x46\x11\x0b\x76\x54\xe7\xa1\x3a\x3f\
+\x89\xb4\x80\x16\x94\x33\xa2\xa1\x28\x1d\x57\xda\x77\xe1\x1a\xdf\
+\x43\x49\x68\xbc\x83\xc6\x71\xeb\xcf\xfa\xc2\xfb\x9b\xe2\xde\x4f\
+\x9f\x67\x4d\x7a\x83\xf2\x10\x9e\x87\xd4\xd5\xd6\x84\x0b\xbb\x1b\
+\x7a\xb0\xcf\x25\xec\xd3\x09\xfb\x04\x37\x34\x44\xd8\xc2\xc7\x62\
+\x8a\x98\xdf\xc5\x7b\x22\x30\xd6\xea\x7b\x20\xf1\x38\x1f\x3f\xce\
+\xfb\x23\xf2\x38\xff\xd8\x31\xff\x98\xa8\x91\xc6\xf9\x06\xcb\xbe\
+\xef\x86\x6d\x98\x8f\x95\xd5\x4f\xd3\x62\x02\x5b\x0b\x53\x23\xb1\
+\xb9\x3c\x8b\x74\xe0\x06\x1c\x6d\xad\x15\x7e\xd0\xb6\xb5\x42\xf0\
+\xc2\x86\xbc\x04\xe4\x26\x86\x22\x31\xd4\x13\xcd\x95\x79\xb8\xcc\
+\xf3\xbb\x8e\xee\x95\xeb\x03\x07\x6f\x62\x7d\x61\x7c\xb0\x1f\xbc\
+\x4d\xc4\xbc\x3f\xdc\x65\xbe\xbf\x7e\x64\x37\xae\x1c\x6c\x41\xd7\
+\xfe\x6d\xe2\x3e\x1f\x1d\x9b\x4b\x44\x8e\xcf\x9c\x2f\xfa\x3d\x61\
+\xdf\x18\x69\x87\xe0\x55\x33\x44\xcc\xe7\x3a\x1f\xdf\xef\x32\x5e\
+\x35\xc6\x97\x20\x6b\x3e\x1e\xff\xb5\x9c\x37\x11\x73\x26\x7c\xc8\
+\x73\xfc\x06\xeb\xbd\x5f\xd4\xed\xb6\xbc\xa4\xb0\xbf\xa7\xc7\x04\
+\x5d\x2b\xcf\x89\xc7\x8e\x8d\x05\x02\xfb\x63\x3b\xeb\xc4\xdf\x7d\
+\x5b\xca\x49\x0f\xe6\xa0\x32\x37\x01\x39\x09\xa1\x48\x22\x1e\xd8\
+\x5d\x53\x8c\x2e\x9e\xc3\x27\xc7\x83\x6e\x91\x1f\xc8\x58\xdd\xd4\
+\x1f\x64\x13\xaf\xbd\x19\xde\xfd\x60\x6e\x02\xd7\x8b\x3e\xaf\xf0\
+\xfd\x81\x1d\xb8\xb4\x6f\x2b\x3a\x77\x35\xe0\x6c\x33\xf9\x76\x59\
+\xa2\xd0\x7a\xbb\xd3\x7c\x74\xd8\x6b\x2d\x67\x50\x4c\x9f\x29\x74\
+\x9d\xb8\xaf\xb9\xea\x1e\xc7\xbc\x4e\x9a\xeb\xbe\x3c\xbf\x93\xe7\
+\x77\x2f\x9e\x3e\xae\xe3\x8f\x8f\xfc\x8e\xd7\x77\x7d\x5f\xee\xff\
+\x38\x3c\x27\x3e\xd4\x29\x9b\xf0\xdd\x58\x98\x8a\x5d\x14\x07\x18\
+\xff\xe3\xbb\x36\x09\x2e\xd8\x4b\x39\xc1\x96\x0a\xca\x09\xc8\x3f\
+\x72\x65\x1f\x68\xad\xcc\xc7\xa5\xb6\x1d\xc4\x05\xad\xb8\x76\x64\
+\x0f\xe5\x07\x6d\xfa\x7e\xf0\x8d\xac\x1f\xcc\x4d\xc1\x5d\xce\xed\
+\x44\x9f\x3f\xd4\x22\xf8\xfe\xe2\xde\x2d\x38\xbf\x73\x13\xce\x50\
+\x5c\x3b\xd9\xb8\x1e\xfb\xb2\x83\x48\xeb\x79\x8b\xfa\x8e\x0e\x7b\
+\xbe\xa7\x3d\xe9\x3d\xee\xe3\xea\x5c\x4f\xd9\x1f\x8f\xef\x83\xc2\
+\x75\x5e\x0b\xe2\xfd\x4f\xdf\x79\x65\xb2\x66\x70\xde\xf3\xa7\xcf\
+\x36\x71\xe2\xc4\x91\x59\x09\xda\x9a\x02\xd2\x79\xf5\xeb\x33\xb1\
+\x7f\x4b\x05\x4e\xec\xae\xef\xf1\x81\xcd\xec\x03\x12\x0f\xe4\x26\
+\x72\x8d\xd8\x1b\x8d\xc5\x69\xb8\xb8\x6f\x1b\x71\x41\x33\xe9\x02\
+\x39\x26\x18\xf2\xc1\xbf\x8a\xb7\x1e\xe6\xa6\xe1\xce\x71\x9e\x35\
+\x9e\xe8\xf3\x14\xeb\xcf\xb5\xd4\xe2\x34\x69\xdb\x53\x14\xcf\x0e\
+\xae\x4f\x10\x75\xdd\xed\x71\x2e\xd8\x14\xb6\x0e\x41\x2b\xa7\xeb\
+\xb0\xe7\xbd\x71\xf4\xf5\x9e\x14\xf3\x79\x6e\x17\xeb\xfd\x95\x73\
+\xbf\xc2\xcc\xf1\xef\xf3\xfe\x6e\x5c\xe3\x57\xee\xeb\xfe\x7d\x69\
+\xc3\xd2\xe2\xfc\x1f\xc8\x88\x0b\x39\xca\xf9\x40\x63\x45\x2e\x0e\
+\x6e\xaf\xc6\xc9\x3d\x0d\xc2\x0f\x98\x0f\xf6\x35\x4a\xb1\x60\x43\
+\x5e\x22\xf2\x93\xc3\x90\x42\x79\x61\x25\xbd\xf6\x1c\xf1\xea\xc5\
+\xfd\x4d\x3d\x7e\xc0\x7c\x70\x4c\xf1\x83\x6f\x68\x7d\x62\xde\x3b\
+\x9f\xbb\x21\x70\xdf\x25\xe1\x7e\x80\x71\x97\xe2\xfc\xb9\x56\xa9\
+\xcf\x77\x50\x3e\x73\x72\x4b\x19\x8e\xd6\x17\xa1\x95\xb0\x6f\x8a\
+\x75\x42\x55\xd0\x6a\x78\x2e\x9d\x2c\xe2\x3d\x73\x3e\xf7\x7b\x35\
+\xf6\xca\x9a\x2e\xce\xf5\x78\x7c\x8f\xe7\xf6\x2c\x9c\xf2\x49\xdd\
+\x4f\x7e\xf2\x13\x65\x6e\xc7\x40\x98\xd7\xfb\x6d\x37\xa1\x05\xb2\
+\xe2\x43\xbb\xca\xb2\xe3\xb1\xad\x2a\x1f\x87\x76\x10\x67\xee\xd9\
+\x2c\xfc\x80\xb9\x80\x79\xa1\xa9\x2a\x4f\xe4\x0b\x45\xa4\x19\xf9\
+\x5e\x80\xb9\x31\x41\x38\xd2\x58\x21\xee\xa5\x78\x91\x34\x56\xd7\
+\x01\x29\x2e\x5c\xa5\x5c\xe1\xfa\x51\xf6\x05\xca\x17\x18\xb7\x93\
+\x8a\x7d\x5b\x98\xef\x16\xf1\xfd\x0a\xf9\x9d\xd2\xdf\x19\xf7\xf3\
+\x84\xfb\xd9\xe6\x1a\x9c\x6e\xe2\x3e\x5f\x8e\xe3\x9b\x4b\x71\x74\
+\x53\x21\xf6\x15\x52\x9e\x1b\xed\x80\x5c\xb7\x25\x70\x5e\x3c\x59\
+\xe0\xca\xb5\x5d\xde\x0f\x93\x39\x5f\x8d\xbd\xd8\x17\x91\x7c\x82\
+\xc7\xfd\xac\x17\x4e\x86\xd9\xd4\xcf\x0e\x3d\xf7\xd4\x23\x1c\xf3\
+\x79\x4f\xbf\xef\x43\xcc\xef\xab\xdd\x96\x15\x1f\x32\x2e\x33\x3e\
+\xf4\x5a\x45\x6e\x22\x9a\xaa\x0b\x28\x1f\xac\xc1\xa9\xbd\xe4\x03\
+\x64\xc7\x77\xd5\xe3\x00\xf5\xa7\x1d\x1b\x0b\x51\x47\xfc\x5f\x9a\
+\x19\x03\xae\x21\x25\x93\x26\xd8\x52\x94\x8a\xb3\x74\xed\xcf\x13\
+\x06\x17\x28\xe6\x5e\x22\x4e\x60\xed\xc5\xda\xfb\xaa\xe0\x05\xd2\
+\x8b\x22\x46\xec\x93\xe2\x84\x88\x15\x86\x38\xf7\x98\x78\x5e\x60\
+\x2d\xe3\x4d\xbe\xc4\xb5\x1b\xee\xe7\x3a\xcc\xc9\xdf\x38\xbe\xb3\
+\xb6\x3b\xd7\x5a\xa7\xc2\x9d\xe2\x17\xc5\xfa\x63\xd4\xe7\x8f\xd4\
+\x92\x1f\x57\x67\xa3\x21\xca\x01\xe1\x56\xb3\x60\xbf\x44\xaa\xeb\
+\xf2\x1a\x4e\x1e\xbf\x8f\x51\x69\x3d\x65\x4e\x0f\x63\xcf\xaf\xe1\
+\xfd\x92\xcd\x67\x7e\x7e\x8e\xef\x93\xa7\x91\xf4\xde\x40\x58\xcf\
+\xf3\xef\x6e\xc3\x4b\xb3\xe2\x17\x13\x0f\xa0\x22\x37\x89\x7c\xa0\
+\x10\xed\xec\x03\xfb\x1a\xc9\x0f\x1a\x05\x17\xb4\x13\x2f\xec\xdc\
+\x54\x82\xcd\x65\x59\x42\x13\xe4\x27\x87\x23\x35\xd2\x9f\xb8\x20\
+\x10\xfb\xc9\x37\xce\x12\x16\xe7\xc9\x57\x3a\x75\xbe\x40\xbc\x40\
+\x78\x5d\x3e\x40\xb8\xf1\xda\x1f\xc1\x0f\x3b\x29\x87\xd8\x25\x30\
+\xbd\x76\x64\x97\xf0\x8f\x6b\xca\x31\xe3\x7c\x98\x9e\x6f\x6f\x15\
+\x3a\x4e\xe0\x4d\xbe\xc4\x7a\x8e\xf9\x9d\x31\x17\x7d\x9d\x74\x1d\
+\xc7\xf7\x33\x3b\x24\x9e\xe7\xfe\x2e\xe1\x5e\x8c\x23\x75\x05\x68\
+\xdf\x98\x8b\x03\x55\x59\x28\x09\x73\x81\xeb\xd2\xa9\xd2\xbd\xec\
+\x48\xc7\xf3\x78\x1e\x6b\x7a\xe6\x78\x35\xf6\x71\x72\xbf\xe7\xfa\
+\x0f\x63\xbf\x74\xc6\xb8\x0b\x63\xdf\x18\xc5\xf7\x7c\x56\xb0\xff\
+\x5e\xe8\x3d\x13\xda\xf0\x9c\xc4\xb0\xc5\xd9\x09\x61\x60\x1e\xd8\
+\x56\x55\x20\x62\x01\xfb\x40\x87\xf0\x83\xcd\xa4\x0b\xeb\x28\x37\
+\x28\xa7\xe7\xf2\x50\x43\x7d\x9f\xc7\x12\x72\x98\x0b\xc2\xbc\x51\
+\x9a\xa4\x45\x3b\xf9\xc7\x19\xf2\x1b\xf6\x85\x73\x3b\x99\x17\x1a\
+\x28\x46\x48\xfe\x70\x91\xb8\x9a\xb5\x23\xfb\x05\xf3\x84\xb0\x36\
+\xd9\x94\x63\xee\xdb\xfc\x3a\xc6\x9a\x62\x0b\xfb\x52\x27\xf9\x14\
+\xc7\xf5\xb3\x32\xe6\xa7\xb7\x13\xe6\xdb\x2a\x44\x7c\x67\x9e\x57\
+\xfa\xbb\x82\x7b\x6d\x5a\x18\x22\x5c\x57\x13\x8f\xcf\x83\xa7\xf5\
+\x42\xd2\x72\x4b\x44\x9f\xe7\x58\xcf\xb5\x5c\xb5\xce\xe7\xfb\x5d\
+\xf2\x98\x2e\x73\xbe\x82\xfd\xa7\xef\xbc\xfa\xae\xe6\x87\x87\xbd\
+\xd2\x86\x97\x66\xc7\xcf\xe4\x58\x50\x96\x93\x80\x2d\x95\x79\x68\
+\xdb\x56\x25\x38\xa0\x63\xff\x16\xe1\x0b\xac\x0d\x59\x27\xb6\xd6\
+\x15\x8b\xfa\x51\x55\x7e\x12\x8a\xd3\xa2\xc0\x63\x8b\x9c\x27\x16\
+\x27\x84\x60\x0f\x69\x46\xee\x9b\xa7\x77\x54\x0b\x7f\x38\x43\xd8\
+\x29\x3e\x21\x59\xbd\xe0\x0a\x61\x3b\x25\x3b\x27\x6c\x93\xc4\xe9\
+\x8c\x75\x4b\x8d\x8c\x77\xb5\xd4\xcf\xf5\x30\x2f\x16\xf1\xfd\xb0\
+\xc0\x3d\x07\xfb\x2b\x33\x50\x9d\x12\x82\x28\x37\x6b\x78\xae\x59\
+\xc4\x7b\x1b\x89\xbd\xb9\xb4\xae\x2b\xc5\xfe\x77\x89\x94\xcf\xa7\
+\x06\xda\x09\x13\xf9\xbd\x72\xff\x0b\xf2\x0d\x17\xd2\x04\x1c\xef\
+\x97\xce\xfc\xbc\xe3\xcb\x0f\xfe\xc9\xf7\x79\xe6\x78\xff\x43\xc4\
+\x5e\x69\xb7\x51\x8c\xff\x38\x33\x4e\xdb\x59\x92\x19\x87\x86\xb2\
+\x6c\xec\xa1\x3e\x7f\x9c\xfa\xf2\x69\xf2\x81\x8e\x7d\x5b\x24\x2e\
+\xa0\xfc\x80\xb5\xe1\x8e\x9a\x42\xca\x1f\x33\x44\x8e\x50\x94\x16\
+\x89\x6c\xf2\x83\x14\xe2\x83\xcc\x08\x1f\xd4\x66\xc5\xe0\x40\x4d\
+\x01\x4e\x52\x6c\x3e\xb5\xad\x12\xa7\x08\xc7\x8e\xed\x6c\x55\x7d\
+\x18\xe1\xdc\x54\x29\x5e\x7b\x92\x79\x9d\xf0\x66\x6e\x3f\xde\x50\
+\xa2\x8f\x79\x0d\xe5\x2a\x55\xd9\xd8\x9a\x1b\x83\xdc\x30\x0f\x04\
+\x3b\xae\x84\xaf\x9d\x05\x02\x1c\x97\x23\xd4\x75\x15\x22\x3d\xad\
+\x11\xe7\xbb\x4e\xec\xd1\x97\x11\xea\x8c\x2c\x8a\x05\x99\x5a\x27\
+\x64\x84\x38\x20\x59\x9e\xbf\xcf\x6b\x7a\x78\x5d\x3f\xaf\xdf\x5d\
+\x3a\xe3\xf3\x83\xef\xfc\xe3\x05\xde\xc7\x9f\xe7\xf1\x7d\x9f\xb5\
+\x9e\xa9\xed\xb6\xd2\xec\x98\xa7\xb3\x13\xc3\x0e\x15\xa6\x45\xa3\
+\xa6\x38\x1d\x2d\x75\x25\x38\x4c\xfd\x92\xf1\x97\xfc\x40\xd2\x05\
+\x87\xa9\x9f\x72\x4c\xd8\xbe\xb1\x40\xe7\x07\x25\xe9\xd1\xa2\x7e\
+\x9c\x1e\xed\x2f\xe6\x97\x66\x84\x7b\xa3\x82\xf2\xc7\xa6\xc2\x24\
+\x1c\xaa\x2d\x10\x7d\xd8\xa8\x31\xce\x0d\x84\xb3\xc0\x9a\x78\xbd\
+\x4e\xc1\x3b\x0f\x87\xa8\x9f\xb7\x14\x27\xa1\x26\x55\x8b\x1c\xad\
+\x3b\xc2\x5d\x29\x57\x23\xdc\x83\x5d\x2c\xa1\x75\xb7\x16\xfb\x71\
+\xc7\xf9\xd9\x89\xbd\xda\xd3\xb5\x2e\x62\xbf\x6e\x69\xaf\x56\x0f\
+\xb1\x67\x27\xef\xdb\xc8\x7b\xf6\x85\xbb\x71\x6d\x67\x11\xec\x29\
+\xbf\xe7\xb5\xbb\x0b\xa7\x8e\xad\x7a\x7b\xd4\x73\xbc\x77\x03\x8f\
+\xe5\x0f\x61\xdf\xd3\x86\x11\xfe\xff\x9d\x93\x18\x51\x40\xba\x00\
+\x15\x79\x49\xd8\xb2\x21\x0f\x7b\xb7\x54\xca\x5c\xb0\x55\x8a\x09\
+\x7b\x39\x26\x34\x88\x9c\x81\xfd\xa0\x99\xf8\x80\xe3\x02\xcf\x33\
+\x29\xcf\x8e\x43\x31\xe5\x8c\x5c\x43\xe4\xbc\x91\x75\x42\x5c\xa0\
+\x0b\x92\x82\x5c\x91\x15\xe1\x8d\xe2\xd8\x00\x54\x26\x87\x62\x63\
+\x5a\x04\xea\xd2\xc3\x51\x9f\x15\x25\x8c\x63\x78\x65\x52\x08\x4a\
+\x62\xfd\x90\x13\xee\x89\xa4\x00\x27\x84\xbb\xaf\x15\xfb\x56\x68\
+\x3d\xd6\x22\xc2\xcb\x46\x5a\xbf\xe8\xef\x20\xee\xc5\x91\x1a\xea\
+\x4a\x7c\x43\x38\x47\x7b\xa3\x30\xde\x4f\xec\x77\xa5\xec\x79\xc5\
+\xfb\x35\xe7\x10\xfe\xbc\x7f\xb3\x96\xb8\xc1\x8b\xb1\xb7\x20\xec\
+\x29\xbf\x5f\x3c\x7d\x5c\xe0\x5d\x77\xdd\xa5\x8c\xe7\x70\x6d\x67\
+\x08\x7b\xfd\xc6\xd7\x63\x78\x71\x46\xac\x79\x66\x42\x68\x17\xfd\
+\x45\x6d\x71\x06\x71\x7e\x31\x0e\x70\xad\x88\xe2\x80\x3a\x26\xb0\
+\x1f\x1c\x21\x8e\x68\x23\xfe\xe6\x5c\x81\xeb\x06\x0d\xeb\x33\x85\
+\x2f\x70\x2d\xb9\x94\x78\xa1\x80\x78\x20\x97\x34\x42\x26\xe5\x0d\
+\x3c\x2f\x3d\x85\xb8\x81\xe7\x9f\x26\x10\x4f\xf0\xbd\xd6\xe3\xc8\
+\x37\x24\x73\x11\x16\x4f\xff\x4e\x08\x76\x25\x1e\x71\x43\x72\xa8\
+\x3b\x52\x89\xef\x33\x22\xbc\xc4\x3e\x06\x79\xe4\x1f\xbc\xbf\x4d\
+\x49\x72\x30\xca\x53\x29\x77\x49\xd3\x8a\x7d\x6e\xca\x53\x83\xc5\
+\x9e\x57\x45\xe4\x0b\xbc\xff\x5d\x9c\xaf\x2d\x82\x9d\x57\xc2\xc3\
+\xda\x0c\xb6\xe6\xb3\xb0\x62\xde\xc4\xc3\xb3\xbf\xfc\x90\xf7\xec\
+\x66\xbe\xff\x21\xc7\x7a\x53\xdb\x6d\x59\x29\x91\x7f\xcc\x4b\x89\
+\xa8\xe1\xfc\x80\xb5\x61\xfd\xfa\x2c\x11\x13\x0e\x92\x46\x3b\x41\
+\x1a\x9f\x7d\x40\xc9\x13\x38\x2e\x70\xfd\xb0\x9d\xf4\x1f\x6b\x84\
+\x5d\xe4\x0b\xdb\xab\xf3\xc5\x98\xc2\xa6\x92\x74\xf2\x87\x64\x31\
+\x17\xb5\x3c\x2b\x16\xeb\x33\xa2\xc4\xfc\xc3\xa2\x94\x30\x14\x52\
+\x0e\x51\x40\x71\x23\x3f\x31\x44\x67\x05\x64\x85\xc4\x05\xbc\x5e\
+\xa9\x24\x45\x2b\xee\xc5\x5b\x9e\x11\x8e\x0d\x59\x91\x62\x4f\x93\
+\x1a\xd2\x00\xca\xfe\x26\x7c\x8f\xae\x0d\x99\x61\x62\x9f\x93\xfc\
+\x58\x1f\xa4\x84\xb8\x20\xd2\x6b\x2d\x02\x1c\x96\x83\xf7\x43\x5c\
+\xb7\x94\xb1\x9f\x14\xfb\xda\x8b\x4f\xf3\xbc\x5d\xae\xe7\x0e\x96\
+\xfb\xb7\x0f\x84\x26\x71\x41\x66\xcc\xcc\xac\xc4\xf0\xa3\xb9\xc9\
+\x11\x28\xa7\x3c\xb1\x9e\xf4\x61\x73\x6d\x31\xda\x9a\xaa\x70\x8c\
+\xf4\x3c\xc7\x03\xa9\x66\xb0\x59\x6f\x3c\xe1\x30\xf9\xc9\x01\xe2\
+\x05\x1e\x57\xd8\xb5\xa9\x18\x2d\xa4\x17\xb6\x6f\xc8\xc5\xd6\x8a\
+\x2c\x34\x96\x65\x88\x79\xa8\xf5\x25\xa9\xd8\x54\x94\x22\xe6\xa5\
+\xd7\x91\x56\x10\x56\x94\x24\xd6\xab\x35\x14\x27\x63\x73\x49\xb2\
+\xb8\x1f\x33\x1b\xff\xbb\xa1\x28\x51\xdc\x9b\x75\x53\x7e\x1c\x6a\
+\xc9\x0f\x36\x90\x5f\xf0\x7e\x37\x19\x14\x0b\x38\x36\x70\xbc\xe0\
+\x7b\x34\x38\xac\x9c\x87\x35\x4b\x66\x34\xcd\x99\x38\xf6\x4d\x8d\
+\x54\xcb\x1d\xea\xf3\xdf\xbc\x0d\x2b\x4a\x8d\xf8\x45\x7e\x72\xe4\
+\xda\xac\x78\xed\x99\xdc\xa4\x08\x94\x65\x27\xa0\xb6\x24\x03\xdb\
+\xaa\x0b\xb0\x9b\xf0\xe5\xba\xc1\x31\xc2\x9d\x79\x40\x19\x4f\x60\
+\x3f\x38\x46\x7e\x70\x94\xf4\xe2\x91\xe6\x8d\x62\xee\xd9\x41\xd2\
+\xfa\x6d\xa4\xf3\x79\x0e\xe2\x5e\xd2\x7f\x3c\x0f\x6d\x37\xe9\xbe\
+\x5d\xa4\xfb\x76\x92\x4e\x6c\xad\xc9\x17\xeb\xd5\x78\xdd\x62\x33\
+\xe9\x7d\x5e\xbf\xca\x6b\x98\x95\xb5\xec\xec\x07\xbc\xa7\xc5\x06\
+\xd2\x0c\xc5\x49\xc1\xc8\xa2\x98\x90\x10\xe4\x2c\xee\xcf\xe7\xe7\
+\xb0\x42\xdc\x9f\xc7\x7e\xf9\xbc\x7d\x96\x66\xd3\xe7\xdc\x7f\xff\
+\xfd\x3c\x57\x97\xc7\xef\x86\xe2\xfc\xb7\xd3\x6e\xa3\x18\x7e\x4f\
+\x6e\x72\x38\xfb\xc1\x51\x32\x14\xa7\x53\x1f\xcc\x27\x4c\x28\x36\
+\x70\x1d\x79\x57\xfd\x7a\xd2\x02\x1b\x44\x2d\x91\x6b\x47\x1c\x13\
+\xd8\x94\xf9\x26\x87\x9b\xab\x75\x73\x10\x0f\x52\x7e\x7f\x40\xf6\
+\x85\x7d\xe4\x0b\xbc\x3e\x41\x59\xab\xb4\xb3\x56\xf2\x83\xe6\xaa\
+\x1c\x81\xff\xe6\xd2\x14\xd4\xe4\xc7\x53\x1c\x88\xa0\xf8\x10\x84\
+\x8c\x48\xc6\xdd\x05\xe1\x5e\xb6\x08\x70\xb2\x84\xfb\xda\xa5\x70\
+\x5e\x6d\xb6\xcb\x7a\xc9\xac\xd9\x43\xb8\xff\xdb\xdb\x6d\x91\x91\
+\xce\x77\x12\x0f\x4c\xcc\x8a\xd3\x96\xa7\xc7\x86\x80\xf3\x05\xf6\
+\x05\xae\x23\xd6\x14\xa5\x89\x1a\x02\xd7\x0c\x9b\x6b\x8b\xc4\x5c\
+\x03\x8e\x01\xac\x0b\x78\xbe\x91\xce\xb6\xf4\xf0\xc0\x6e\xe2\x81\
+\x5d\x75\x45\x68\xa1\xfe\xcf\x6b\xd6\xb6\x50\x7c\xd8\x54\x9c\x82\
+\xea\xbc\x78\x94\x91\x5e\xe0\x75\x8b\xbc\x7e\x3d\x85\x74\x63\x6c\
+\x80\x33\xb4\x9e\x36\xf0\x23\xdc\x3d\x6c\x2c\xba\x5c\xad\x97\xa6\
+\xdb\xaf\x98\xff\xa1\x46\xca\xe7\x98\xe7\x87\x70\xff\xcf\x34\xa1\
+\x0f\xf2\x33\x22\x1f\xca\x4d\x0e\x5b\x9d\x1e\x13\x5c\x95\x16\x43\
+\x7d\x93\xfc\x21\x37\x89\xb4\x5d\x5a\x14\xd6\x67\xc5\x09\x9f\xa8\
+\x22\x8e\xe0\x79\x27\xb5\xc5\x69\xa8\x2b\x61\x4b\x97\xfe\x16\xa7\
+\x8a\x39\xa8\x1b\x0b\x92\xc4\x1c\xb4\x0a\xd2\x87\xbc\x6e\xb1\x90\
+\x73\x86\xf8\x60\x64\x44\xf9\x89\x1a\x63\x2c\xe5\x90\xe1\xde\xf6\
+\x08\x74\x5d\x43\xb8\xaf\xee\xf2\x76\x58\x55\xe4\xb2\xce\xe2\xeb\
+\xf9\x33\xbe\x64\x5d\xc7\xb9\x1c\xe7\xf1\x43\xb8\x7f\x77\x4d\xf8\
+\x02\xd7\x0f\xf2\x53\x22\xbf\x48\x8f\x0e\xf2\x23\x5f\x68\x48\x8d\
+\x0e\xec\x4a\x8a\xf0\x43\x6a\x54\x00\xd2\xc9\x37\x32\x63\x29\x66\
+\xc7\x85\x20\x2b\x3e\x44\xfa\x1b\x17\x4c\x8f\x05\x89\x5a\x41\x2a\
+\xe5\x86\x49\x61\xde\x88\x0f\xf1\x40\x74\xa0\x2b\xc2\x7d\x1d\x11\
+\xe2\x69\x0b\xad\x97\x7d\x67\x80\xcb\xda\x0a\x3f\xc7\xd5\xae\x6e\
+\x36\x16\xef\x8f\x1f\x3f\xe6\xbf\x34\x12\xbf\x0f\x61\x3e\x30\x1b\
+\xe3\xc1\x5a\x7b\xf8\xd8\xb1\x63\x7f\x52\x94\x14\xf1\x54\x4a\xb8\
+\xff\x27\x89\x61\x7e\x8b\x63\x43\xbd\x9c\x93\xc2\x7d\x23\xa3\x83\
+\x3c\x32\x13\xc3\x7d\x2b\x12\xc3\x7c\x2a\x12\xc2\xbc\x2b\xe2\x43\
+\x3c\x2b\x42\xbc\xec\x93\x62\x82\xdc\xa2\x42\x7d\x1c\x1c\x08\xf7\
+\x79\xfe\x6e\x36\xef\x07\xba\x58\xf1\x7d\x36\xb9\x7f\x33\xaf\x2b\
+\x78\xdf\xa6\x19\xc2\x7c\xb0\x35\xc5\x27\x84\x5f\xc8\x76\x7b\x1f\
+\xa6\x3c\xaf\xe0\x3c\x84\xf5\x50\x1b\x6a\x7d\x34\xdc\x4a\x3b\x7b\
+\xbf\xfe\x71\xd9\x08\xfd\x63\xeb\x61\xfa\xc7\x06\x1f\xdf\xad\xd1\
+\x58\xa9\x8f\xaf\x6b\x34\xa3\xd5\xc7\x97\x35\x1a\xbd\x13\x9c\xd5\
+\x68\xee\x56\x1f\xb7\x19\x1c\x97\x19\x1c\x5b\x53\x5c\xd7\x3f\xbd\
+\xde\x71\xb7\xc1\xf1\x75\x83\xe3\xcb\x06\xc7\x74\x7a\xbd\xcf\x6f\
+\x33\x38\xa6\xd3\xeb\x7d\x5f\x6b\x83\x63\xbe\xbc\xa3\xf5\x4f\xaf\
+\xfe\xfd\xd7\x0d\x2e\x3f\x9f\x5e\x7d\xfd\xf8\xf4\xc3\x0d\x4e\xaf\
+\xfe\x7a\x65\x06\x5f\x47\x75\xfa\xb3\xc3\xf5\x4e\x7f\x9d\x5f\xa8\
+\x3a\x3d\xbf\x53\x3a\xee\xf9\x62\xf7\x77\xeb\x4e\xcf\x5f\x44\x33\
+\xa2\x5b\x77\x7a\x3e\xb1\x66\x58\xcf\xd5\xb3\x16\x8e\xb3\x5a\x39\
+\x7d\xb7\xe4\x48\xff\xab\x9c\xfe\x7a\x8f\x73\x8d\x56\x7e\x87\xdc\
+\xac\x74\x1f\xa7\x72\xbe\x32\xdd\xe1\x30\xd5\xc7\x6b\x94\xd3\x77\
+\xf7\xbc\x7c\x84\xc1\xc7\xdf\xad\xfb\xb6\x52\xbb\xdf\xe0\x74\x86\
+\xa7\x87\xfe\xe9\x87\x1b\x9c\x7e\xb4\xc1\xe9\xad\x0c\x8e\xa5\xe7\
+\x0d\x3e\x5e\xf5\xf5\xee\x37\x76\x6c\xf8\x75\x55\xc7\x23\x0c\xbe\
+\xbe\xd1\x63\xd5\xd7\x1f\x6e\xec\xb8\xe7\xe7\x48\x97\xaf\xbf\xe3\
+\x9e\x9f\x2b\x5d\x8f\xfe\x8e\xad\x6f\x72\x6c\xf5\x2d\x1c\xab\x0e\
+\xc5\x05\x1d\xec\xc7\xd6\xaa\xe3\x6f\xe3\xfa\xa8\x8f\x6f\x11\x3f\
+\x93\xfc\x41\x75\x6c\xd4\xbf\x0c\x8f\xfb\xf3\xd7\x9b\xf8\xbb\xd1\
+\xfe\xa1\x3a\x36\xda\xbf\x7a\xf5\xc7\x9e\x1f\x08\xfd\x63\x99\x3b\
+\xdb\x0c\x8e\x75\x3f\x40\xe6\x52\xdd\x17\x96\xb9\x54\xf7\x05\x65\
+\x2e\xd5\x7d\xa1\xfb\xa5\x63\xdd\x17\x1a\x2d\x1f\x2b\x5f\xc8\x0a\
+\xfa\x5f\x40\x3e\x54\xbe\x80\x8e\xba\x2f\xeb\x9d\x4e\x77\x42\xe5\
+\xe3\x95\x13\x8c\xd6\x1d\x97\xe9\x7d\x9c\xfc\x0b\x54\x91\xe0\xba\
+\xea\xdb\xea\xbe\x91\x15\xf4\xde\xa0\x0e\x1c\xfc\x02\x2b\xf4\xd1\
+\xfe\x3f\x29\x88\x71\x6c\
+\x00\x00\x06\x85\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x9d\x4b\x88\x1c\x55\x14\x86\x4f\xa7\xd1\
+\x8e\xf8\x18\x51\x49\x94\xa0\xd3\xd9\xc8\xa8\xe0\xc6\xe7\x6e\x10\
+\x5d\x09\x2a\x62\xe2\x46\x71\x97\x95\x82\x82\x9b\x98\x85\xd3\x99\
+\xc5\x48\x40\x11\x7c\xe2\x46\x51\x22\x03\xba\xf2\xb1\x50\x32\xe0\
+\xa8\x1b\x5d\x24\x1a\x1f\x20\x3e\xa0\x21\x90\x01\x15\x99\x30\x8a\
+\x3d\xda\x76\x79\x4e\x57\x55\x77\x75\x4f\x75\xd7\xa9\x7b\xab\xba\
+\xaa\xfb\xfe\x9f\xfc\xe2\x3f\x49\x9f\x7b\xee\xfd\x4d\x77\x3d\x6e\
+\xaa\x89\x2a\xfc\x4f\xa3\x41\xfc\xef\x3a\x2d\xec\xae\xd0\x1e\x22\
+\x5a\x60\xf1\x8f\xe4\x87\xdd\x9f\x77\xe1\x5f\x03\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xf3\
+\x5c\xc9\x5a\x61\x9d\x66\x6d\xb3\x3c\xa8\x14\xda\x0e\x32\x91\x6c\
+\xae\x1a\x99\x9e\x1d\x07\x59\xe7\x4a\x30\x57\x68\xbc\xce\x05\x59\
+\x65\xc9\x01\x56\xa7\x04\x73\x83\x74\x92\xac\x1e\x88\x4d\x32\x3d\
+\x7b\x09\x7f\xee\xa7\x51\x9b\x41\x76\xb6\x2c\x97\x60\x2e\x90\x99\
+\x96\x63\xf2\x4c\xcb\xd7\x25\x98\x07\x64\xa6\x93\x31\x79\xa6\xa5\
+\x55\x82\x79\x40\x66\x6a\xc5\xe4\x99\x96\xa2\xe7\x00\xd9\xc9\x96\
+\xa2\xfb\x87\x90\x3f\x84\xfc\x21\xe4\x0f\x21\x7f\x08\xf9\x43\xc8\
+\x1f\x42\xfe\x10\xf2\x87\x90\x3f\x84\xfc\x21\xe4\xef\x9a\x34\x7b\
+\x72\x6c\x49\xaa\x7f\xac\x04\xeb\xe0\xaa\x9e\x50\xfc\x1e\x5b\x92\
+\xea\xef\x62\x7d\x58\x82\xb5\x70\x4d\xe1\xde\x8e\xa2\xf3\x17\x2e\
+\x66\x7d\x57\x82\x35\x71\x45\x2f\xa5\xcc\xc7\x06\x6d\xfd\xfd\xac\
+\xdf\x0b\x5a\x0f\x97\xf4\x36\x75\x9f\xea\x97\x3a\x1f\x53\xd2\xd4\
+\x5f\x24\xec\x17\xca\x53\xf2\x39\x7b\x9e\x45\x3e\x26\xa4\xad\x7f\
+\x28\xa3\xb9\x42\x83\xfa\x8c\x75\x41\x06\xf9\xa4\xc5\xa4\xfe\x0b\
+\xca\x39\x41\x3a\x7d\xc5\xba\x64\xc4\x5a\x97\x31\x7f\x39\x27\xf8\
+\x58\xf1\x5a\x28\x59\x3f\xb1\xae\x18\xb1\xce\xa4\x78\xbd\x2d\xa6\
+\xf5\x2f\x65\xfd\xa0\x78\x3d\x34\x5a\x67\x58\xd7\x8c\x59\x63\x52\
+\xd4\xb0\xc5\xa6\xfe\xb5\xac\x3f\x14\x35\xa0\x9d\xfa\x95\x75\x5d\
+\xc2\xfa\x92\xa2\x8e\x2d\xb6\xf5\xef\x64\xfd\xab\xa8\x03\xf5\x25\
+\x7f\xdf\xee\x16\xc5\xda\x92\xa2\x96\x2d\x59\xd4\x7f\x4c\x51\x07\
+\xf2\xf5\x37\xeb\x0e\xe5\xba\x92\xa2\x9e\x2d\x59\xd5\x7f\x55\x51\
+\xcb\x75\xb5\x59\xf7\xa6\x58\x53\x52\xd4\xb4\x25\xab\xfa\x72\xdd\
+\xe2\x13\x45\x3d\x57\x25\xf7\xf2\x1e\x49\xb1\x9e\x21\xd3\x92\xbf\
+\x70\x19\xeb\x67\x45\x4d\x17\xf5\x78\xca\xb5\x0c\x99\xa6\xfc\x05\
+\x39\xa6\xc5\xf3\x04\x06\x75\xd4\x60\x1d\x43\xa6\x2d\x7f\xe1\x6e\
+\xc2\x39\x41\xa8\x17\x0d\xd7\x30\x64\x1a\xf3\x17\x9e\x54\xd4\x9e\
+\x75\x1d\xb7\x58\xbf\x90\x69\xcd\x5f\x78\x43\x51\x7f\x56\xf5\x01\
+\xed\xbc\x97\x67\xc2\x34\xe7\x2f\xf3\xff\x5c\x31\xc6\xac\xe9\x53\
+\x8a\xbf\x97\x67\xc2\x34\xe7\x2f\xc8\xd7\x15\x36\x15\xe3\xcc\x8a\
+\x4e\xd1\xe8\x7b\x79\x26\x4c\x7b\xfe\xc2\x8d\xac\x2d\xc5\x58\x93\
+\x96\xdc\xbb\x78\x87\xf5\x1a\x65\xf3\x1c\xa4\x1f\x69\xfc\xbd\x3c\
+\x13\x66\x21\x7f\xe1\x3e\xd6\x7f\x8a\xf1\x26\xa5\xb7\x58\x17\x0d\
+\xf5\x78\x3f\xf9\xf7\x65\x4c\xea\xc9\xbd\xbc\xab\x6d\x17\x29\x86\
+\x59\xc9\x5f\x78\x4a\x31\xde\x24\xf4\xca\x98\x1e\xeb\xac\xef\x53\
+\xd6\x93\xff\x67\x16\x4c\x17\x25\x81\x59\xca\x5f\x38\xae\x18\x33\
+\x4f\xbd\xa9\xe8\x51\x3e\xbf\x3f\x52\xd6\x93\xe7\x30\xde\x6c\xb4\
+\x12\x3a\x66\x2d\xff\xdd\xac\x2f\x15\xe3\xe6\xa1\xf7\x59\x55\x65\
+\x9f\xb2\xc7\xe9\xe5\x84\x7a\x69\xef\xe5\x99\x30\x6b\xf9\x0b\xf2\
+\x9c\xf1\x33\x8a\xb1\xb3\x94\xe9\x39\xd9\xa3\xac\x7f\x62\xea\xc9\
+\xf5\xcd\x7b\x0c\xea\xa5\xe1\xfc\x98\x71\x67\x21\x7f\xe1\x26\xd6\
+\x5f\x8a\xf1\xb3\x90\xed\x39\xd9\xed\xac\x2f\x22\xf5\xe4\x5c\x61\
+\xd1\xa2\x9e\x96\x39\x4a\x9e\x9b\x2d\x45\xe5\x2f\x3c\x48\xf9\x9f\
+\x13\x24\xed\xaf\x4c\xc3\xe5\x19\xd6\xd2\x30\xeb\xf9\x0b\x0d\x45\
+\x0f\xa6\x92\xcf\x98\xf9\x09\xcc\x21\x2f\x5c\xc8\x5f\x78\x57\xd1\
+\x47\x5a\xfd\xc6\xba\x61\x42\xfd\xe7\x85\x2b\xf9\xcb\x71\xd9\x49\
+\x45\x2f\x5a\xfd\xc9\xba\x75\x42\xbd\xe7\x89\x2b\xf9\x0b\x72\xed\
+\x6c\x43\xd1\x4f\x92\xe4\xbb\x72\xee\x9a\x60\xdf\x79\xe2\x52\xfe\
+\xc2\x6d\xe4\x9f\x53\x9b\x66\x2f\xfb\x2b\x0f\x4c\xb8\xe7\x3c\x71\
+\x2d\x7f\xe1\x21\x45\x4f\x71\x92\xfd\x95\x87\x0a\xe8\x37\x4f\x5c\
+\xcc\x5f\x78\x46\xd1\xd7\xb0\x0e\x17\xd2\x69\xbe\xb8\x9a\xbf\x3c\
+\xff\xe0\x3d\x45\x6f\xa1\x9e\x2d\xa6\xcd\xee\x33\x31\x8e\xb0\xd6\
+\x58\x67\xc9\xff\xfc\x69\x07\xff\xbd\x16\xfc\xda\x7e\x8b\xfa\xae\
+\xe6\x2f\xc8\xbd\xd9\x6f\xc6\xf4\x15\xea\xf5\x02\x7a\xab\xb3\x56\
+\xc9\xcf\x5a\x73\x4c\xb2\x1a\xbc\x26\x2d\x2e\xe7\x2f\xec\xa3\xf1\
+\x7f\xc7\x58\xee\xe1\xef\x9a\x70\x4f\x72\x7c\x62\xb2\x97\x65\x2b\
+\x78\x6d\x1a\x5c\xcf\x5f\xb8\x90\xf5\x34\xeb\x17\xf2\xfb\x91\xfb\
+\x2e\x72\x2d\xfe\xe1\x02\x7a\x39\x4c\xe9\x73\xb7\x39\x4e\x41\xfe\
+\x83\xd4\x68\xf2\x7f\xde\x43\x4c\xcf\x4b\xe2\xa4\x7d\x1f\x40\xfe\
+\xe5\xa0\x4e\xd9\xee\x5f\xdc\x22\xdd\xf1\x00\xf2\x2f\x07\x72\xfc\
+\x96\x55\xf6\xa1\x56\x15\xe3\x22\xff\xe2\x91\xf3\x37\xcd\x71\x7e\
+\x5a\xb5\x29\xf9\xdc\x10\xf9\x17\x8f\x9c\xc3\x67\x9d\x7d\xa8\x23\
+\x09\x63\x23\xff\xe2\x39\x41\xf9\xe5\xbf\x96\x30\x36\xf2\x2f\x1e\
+\xb9\x96\x97\x57\xfe\x67\x13\xc6\x46\xfe\xc5\x93\xc7\x67\x7f\xa8\
+\x76\xc2\xd8\xc8\xbf\x78\xf2\x7c\x8e\x01\xf2\x2f\x3f\x78\xff\x77\
+\x1b\x1c\xff\xb9\x0d\xce\xff\xdc\x06\xd7\x7f\x00\xae\xff\xba\x4d\
+\x9d\x70\xff\xc7\x75\x70\xff\x17\x60\xff\x07\xc0\xfe\x2f\x50\x27\
+\xec\xff\x04\xfd\xfd\xdf\x72\x8d\x48\xae\xe5\xc9\xb5\xe2\x70\xff\
+\xf7\x09\xc2\xfe\x6f\x60\x07\xf2\x77\x1b\xe4\xef\x36\xc8\xdf\x6d\
+\x90\xbf\xdb\x94\x21\xff\x7d\x19\x8c\x01\xcc\xb8\x9e\x8a\xcf\xff\
+\xb9\x0c\xc6\x00\x66\x68\xbe\x67\xd9\x96\xa4\xfa\xf2\x5c\x85\x63\
+\x94\xcf\xb3\x8d\x41\x3c\xf3\xac\xe7\x29\x39\x9b\x49\xe4\x0f\x95\
+\x5b\xb6\xb4\x4a\x30\x07\xc8\x4c\xad\x98\x3c\xd3\x72\xba\x04\xf3\
+\x80\xcc\x74\x2a\x26\xcf\xb4\x2c\x97\x60\x1e\x90\x99\x96\x63\xf2\
+\x4c\xcb\x5e\xc2\xf7\x35\x4e\xa3\x24\xb3\x3d\x31\x79\x9a\x20\xcf\
+\xcc\x2b\xd3\x77\xb3\x40\xe3\xd5\xa1\xec\x9f\x73\x28\xcf\xe2\xc6\
+\xfb\x40\xf9\x25\x19\x1d\x1c\x91\xa1\x2d\xf2\xbd\x0c\x2b\xac\x6f\
+\x09\xe7\x05\x65\xd2\x76\x90\xc9\x4a\x90\x11\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\xc2\
+\x73\x9d\x66\x74\x35\x6a\x9e\xb7\x1e\xf5\x55\xcf\x6b\x44\x7d\xc5\
+\xf3\x86\x97\x0f\x7e\xb4\xaf\x88\x6f\xf4\x7d\x55\xfc\xfa\x90\x6f\
+\xf6\x7d\x4d\xfc\x66\xdf\xcf\x89\x8f\x6c\x61\x9f\x1f\xf2\x8b\xe2\
+\x23\x8f\x48\x5e\x12\xdf\x89\x74\x23\xbe\xdf\x51\xc5\xf7\xbd\x86\
+\xaa\xbe\xef\x35\x54\x1b\xf2\x73\xbe\xef\x35\x38\xef\xfb\x5e\x83\
+\x8b\xbe\xef\x35\xb4\xe4\xfb\x5e\x43\x9e\xef\x3b\x23\x7c\x25\xf0\
+\x61\x83\xd5\xd0\x37\xc2\x76\x02\xdf\x6d\xa8\xc9\xed\x04\x5e\x1a\
+\xaa\x6e\x72\x3b\x81\x97\x86\x6a\x2d\x6e\x27\xea\xdb\xdc\x4e\xe0\
+\x5b\xe1\x5c\x3a\xbe\x6f\x77\xe7\x72\xb4\xe7\x3b\xdd\xb9\x6c\xf4\
+\xbc\xd7\x9d\x8b\xd7\xf7\x8d\xe0\x7d\xa2\xef\x2b\x03\x7e\x5d\x7a\
+\x8f\xf8\xa6\xf4\x1e\xf1\x9b\xd2\x7b\xc4\xb7\xa4\xf7\x01\xbf\x28\
+\x66\x29\xf4\xdd\xde\xf9\x37\x85\xbe\x23\x9e\x8b\x84\xde\xab\xf8\
+\x83\xf4\xfc\x86\xdf\x44\xcf\x7b\x7e\x93\x63\x3d\xc9\x2e\xc9\x12\
+\xfb\xa4\xfe\x87\xe7\x1b\x5d\x0f\xcf\x1b\x5c\x2f\xcf\x1b\x58\xcf\
+\x60\xf1\x97\x06\xbc\xd7\xcf\xc3\xca\x2f\x25\xf8\xf9\xbe\x6f\xe5\
+\xf0\xfe\xd3\x88\xda\xca\xce\xf7\xf3\x66\xd4\xd7\x3c\xd7\xf9\x1f\
+\x85\xae\xee\x54\
+\x00\x00\x2f\xe9\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x7d\x07\x5c\x54\x67\xd6\x3e\xfb\x65\xbf\
+\xdd\xfd\x6f\x49\xa2\x62\x8c\xdd\x00\x0a\x1a\x63\x17\x5b\xd4\x14\
+\x8d\x05\xac\xd8\x41\x14\x44\x44\x7a\xef\xbd\x0f\xbd\xcd\x00\x43\
+\xef\x0a\x28\xf6\xde\x0b\xd6\xd8\xbb\xc6\x16\x13\x4b\x8a\xd9\xf6\
+\x25\xdf\xb7\x49\xce\xff\x9c\xf7\xbd\xf7\xce\x0c\x32\x8a\xd9\xc5\
+\x41\x33\x77\x7f\x67\x87\x8b\xec\x2a\xf7\x79\xee\x73\xce\x79\xdf\
+\xf3\x9e\x63\x60\xf0\x1b\xfc\x4f\x64\xa4\x01\xfe\x77\x2f\x03\xb3\
+\x3f\xfc\xc6\xe0\x2d\x03\x03\x03\x33\x34\xfc\x16\x7d\x93\x7d\x9f\
+\x5d\xf8\x67\xfa\x4b\x7f\xe9\x2f\xfd\xa5\xbf\xf4\x97\xfe\xd2\x5f\
+\xfa\x4b\x7f\xe9\x2f\xfd\xd5\x1a\x57\xbe\xa3\xc1\x7f\x03\xcb\x40\
+\xf4\xd7\xaf\xed\x9a\x3a\xfc\x8f\x6f\x47\x5a\xbf\x53\x92\xe3\x6a\
+\xba\x23\xd7\xdd\x2c\x53\xe1\xd1\xd7\x3e\xdb\xc5\x74\x58\x89\x6f\
+\xbf\xb7\x4b\x3c\x7a\xbe\x59\x12\xd1\xf3\x0f\x7a\x6e\xbc\x9a\x97\
+\xc5\x20\xc3\xde\x53\x86\x75\xd8\xe6\x3b\xb7\xe7\x4f\x89\xf6\xbd\
+\x20\x7a\x71\x37\xa0\xcf\x14\x47\xe3\x9f\xd3\x9d\x4c\xbe\xc9\x76\
+\xe9\xb3\x47\xee\x66\x9a\x8d\xdc\x58\x81\x9c\x98\x94\xe5\xda\x7b\
+\x60\xa6\x9b\xc9\xeb\xba\xfe\x77\xeb\xaf\x7f\xff\x9a\x34\xac\x83\
+\xa9\xc5\x70\xc3\xdd\x53\xcd\x0d\x21\x70\x7e\x4f\x88\xb4\xe9\x0a\
+\x9e\xd3\xdb\x31\xf3\x99\xd9\x1e\xfc\x66\x1b\x42\xc0\x9c\x8e\x10\
+\xb6\xb0\x33\xc4\xd8\x76\xff\x39\xd9\xc1\xe8\x71\xc6\x4a\x93\x5b\
+\x99\x4e\xbd\x8f\x67\x78\x8e\x6e\xc8\x0f\x1c\x9f\x98\xe7\x33\x6c\
+\x76\xba\xc7\x7b\xa6\x0a\x9f\x89\x6f\x55\x20\x2f\x90\x1b\xbf\xd7\
+\xf5\xef\xa5\xbf\x9e\x7d\x4d\x1d\xda\x7e\x04\xe2\x7e\xcc\x72\x44\
+\x47\x98\x3a\xdc\x10\xa2\x6c\x8d\x20\x74\xc1\xdb\x0c\x7b\xaf\x19\
+\xed\x25\xf3\x24\x13\x38\x41\xe6\x81\xe6\x6f\xd5\x01\x12\x82\x96\
+\xc2\xe1\xc6\x23\xb0\xbe\xbe\x12\x6a\xf2\xa3\xa0\x28\xd9\xf5\x96\
+\x22\x72\xd1\x06\x99\xc7\x04\x59\xa2\xfb\x84\x45\x19\xce\x7d\x3f\
+\xce\x75\x37\xea\x1d\x31\xb7\xdf\xef\x74\xfd\xbb\xea\x2f\x8d\xeb\
+\x37\x53\x87\xb5\x1b\x6d\x61\x6e\x78\x8e\xb0\x57\xc7\x3f\x64\x7e\
+\xa7\x27\xf0\x6f\xce\x3c\xa6\xbd\x01\xd9\x71\xae\xf0\xf8\xbb\xef\
+\xe0\x9b\x6f\xbe\x81\x87\x8f\x1e\xc1\x9d\x3b\x77\xe1\xfa\xb5\xab\
+\x70\xfe\xec\x09\x38\xb0\x6b\xc3\xbf\x1a\xaa\xf3\xbf\x2e\xca\x0c\
+\xb9\x2a\x8f\xb6\x3d\x94\x17\x36\xa3\x2e\xd7\x7f\xac\xaf\xdc\x73\
+\xe8\x27\x0a\xcf\x61\x46\x65\x81\x1f\x77\xa8\x8d\xe8\xf7\xe7\xda\
+\xb9\x06\xaf\xe9\xfa\x61\xfc\xda\xae\xa9\xc3\x3b\x4e\xb6\x30\xef\
+\x70\x43\xc4\x5e\xf3\xfd\xef\x8c\xf8\xb7\x7f\x26\x07\x3c\x09\xff\
+\x78\x37\x09\xff\xe6\xec\xdb\x6f\xbf\x85\xc7\x8f\xbf\x83\x2f\xef\
+\x3f\x80\x73\xe7\x2f\xc2\x9e\xdd\xbb\x60\x6d\x4d\x01\x54\xc8\x43\
+\x7e\x2c\x92\x39\x9d\x95\x87\xcf\x5b\x9d\xe0\xf6\x51\x40\xa2\xf3\
+\x98\x79\x69\x2b\xfa\x8c\xc1\xd8\xa2\x4b\x44\x84\xc1\x6f\x75\xfd\
+\x7c\x5e\xe5\xeb\x93\xc1\xaf\x9b\xa8\xbf\xf7\x4d\xf1\x0f\x5b\xd8\
+\x05\xf1\xed\xc0\x31\x16\xf4\xfe\x97\xe2\xdf\xac\x21\x27\xee\x23\
+\x1f\x6e\xdd\xbe\x0d\xd7\xae\x5c\x82\xd3\x27\x0e\xc3\xae\xcd\x75\
+\x3f\xd4\x57\xc8\xef\xe7\xca\x7c\xce\xc9\x23\x17\xee\xcf\x0b\xb6\
+\x54\xe6\xf9\x8c\x70\x54\x78\x0e\x19\x9b\xed\x37\xbd\x4b\x81\xd7\
+\xc8\xf6\xf9\x8e\x9d\xff\x88\xdc\xf8\x2f\x5d\x3f\xbf\x97\xfd\x9a\
+\x3c\xec\x8d\xc1\x88\xff\x6d\x6d\xf8\x87\x2f\xea\x0a\x3e\xb3\x0c\
+\x99\x49\x58\x37\xc3\x01\xc2\x3f\x27\xd1\x93\xbd\xdf\xcf\x85\xff\
+\x53\xb4\xe2\xdb\xc7\x8f\xe1\xcb\x2f\xef\xc3\x89\x93\xa7\x60\xfb\
+\xd6\x2d\x50\x5f\x91\x05\xe5\x99\x7e\xff\x2c\x4e\x74\x38\x9a\x11\
+\x38\x43\x19\xef\x3a\xde\x35\xc5\x65\xd8\xf4\x4c\x27\x93\xc1\x18\
+\x63\x76\xd4\xe7\xa3\xcf\x7f\x59\x0e\xef\xf0\xb1\xc5\x08\xc3\xaf\
+\x9b\xc3\x3f\xda\xd6\x18\xc2\xad\xbb\x81\xef\xec\x8e\xcc\x38\x07\
+\x3a\x34\xcb\x01\xc2\x5f\x91\x1a\x8e\xf8\x3f\xfe\x8f\xe0\xaf\xcd\
+\xbe\xf8\xe2\x4b\xb8\x79\xeb\x16\x5c\xbe\x78\x0e\x4e\x1c\xd9\xfb\
+\xf3\xf6\x8d\x35\x7f\xaf\x54\x26\xdd\xc9\x4b\x74\x39\xa5\x08\x9f\
+\xbf\x55\x19\x3c\x25\x39\xd7\xcb\xdc\x36\xdb\xa5\xff\xb0\x82\xa0\
+\x69\x9d\x68\xad\x42\x9f\x7f\x68\xbf\xa6\x0e\x6f\x87\xbe\xdf\xf0\
+\x71\x53\xfc\x67\x8e\xee\x08\xf1\x76\x26\x10\xb6\xa8\x1b\xf8\xcf\
+\x79\x1b\xe3\xfb\x4e\x12\x07\xbc\x67\x3e\xc9\x01\x86\x7f\x5a\x64\
+\xab\xe3\xdf\x7c\x4c\xf1\x98\xf9\x91\x9b\x37\x6f\xc3\xd1\x63\x27\
+\x60\xcb\x86\x3a\x58\x55\x24\x83\xb2\x0c\xef\xfb\xca\x98\xc5\xbb\
+\x52\xfd\x2c\x52\x13\x5c\xc7\x2e\x4d\x75\x1e\x3c\x39\xcb\xb1\xa7\
+\x59\x8e\x73\xbf\x3f\xeb\xfa\xb9\xb7\x95\x4b\x2b\xfe\xa3\x3a\x42\
+\x9c\x9d\x31\x84\x2e\xea\x0e\x01\x73\x3b\x6b\x70\xc0\x77\x36\x71\
+\x80\xf3\x80\x73\xa0\x9d\xce\xf0\xd7\x66\x5f\x7d\xfd\x35\xdc\xbb\
+\x77\x0f\x6e\xdc\xb8\x01\x17\xcf\x9f\x86\xa3\x07\x77\xfe\xb8\x69\
+\x4d\xd9\x77\x65\x8a\xd8\x6b\x8a\x68\xbb\x63\x79\x91\x0b\xd6\xe5\
+\x07\x8e\x0f\x53\x78\x0d\x5b\x90\xe1\x3e\xa2\x77\x51\xd0\xe4\x8e\
+\xb4\x86\xf5\x6b\x8b\x37\x9f\x85\x7f\x98\x75\x77\x08\x9a\xdf\x15\
+\x02\xe7\x75\x41\x1e\x20\x07\xe6\x74\x02\xbf\xd9\x9d\x04\x0e\x74\
+\x10\x38\x80\xf9\x9f\xe5\xeb\x90\x9b\x1e\xd5\x66\xf0\x7f\xba\x56\
+\x3c\x86\xcb\x57\xae\xc2\x81\x83\x07\x61\xd3\x9a\x72\xa8\xca\x8b\
+\xfe\xa9\x2c\xdd\xf3\xba\x22\x72\xc1\x06\x99\xe7\xa4\x60\x99\xf3\
+\x58\xeb\xd4\x95\xfd\xc7\xe7\x38\xf7\xea\x59\xb2\xa4\xe7\x1f\x74\
+\x8d\x51\x6b\x5e\x4f\xc7\xdf\x04\x22\x6c\x7a\x42\xf0\x02\xce\x01\
+\x32\xce\x81\xb7\xc1\xcf\xea\x2d\xc1\x1f\x08\x1c\xc0\xf7\xbf\xba\
+\x38\x83\x3d\x63\x5d\xe3\xfc\x7c\xf6\x2d\x3c\x78\xf8\x10\x3e\xff\
+\xfc\x1e\x5c\xbb\x76\x05\xce\x9f\x39\x0e\x87\xf6\x6c\xa2\xb5\x8a\
+\x87\x65\xd9\xa1\x17\x73\x22\x6c\x1a\x15\xe1\x73\x4b\x94\x7e\xa3\
+\x02\xf2\x3d\x87\x7e\x92\x1a\x3c\xb7\x6b\xbe\xf7\x50\xc3\x72\x9f\
+\x01\x7f\x7a\x15\xd6\x2a\x2c\x86\xb7\x9f\x85\xf8\xff\x53\xdb\xfb\
+\x1f\xb9\xf8\x1d\xf4\x01\x3d\x21\x64\x61\x77\xc6\x03\xae\x03\x9d\
+\x99\x11\x07\xc8\x58\x5c\x38\xfd\x4d\x58\x5d\x96\xfd\x12\xe2\xff\
+\x74\xad\x78\xf8\xf0\x11\x9c\xbf\x70\x09\xf6\xed\xdb\x0b\x6b\xaa\
+\x72\xa1\x52\x11\xf6\xbf\x25\x49\x2b\xce\xe5\x84\xcd\x2f\x95\xb9\
+\x7f\xe4\x93\xec\x36\x6a\x4e\x9a\xa3\xe9\xb0\xdc\x15\xbd\xbb\xbe\
+\x8c\x7c\x98\x32\xac\xbd\x5d\x53\xec\xa5\xf8\xcf\xde\x98\xaf\x01\
+\x58\x8b\x1c\xe8\x81\x1c\xe8\x26\xf8\x83\xae\x2a\x7f\x80\x1c\xf0\
+\xc6\x18\x70\x75\x59\xce\x2b\x83\xbf\x36\x7b\xf0\xe0\x01\xdc\xbe\
+\x7d\x07\xae\x5e\xb9\x04\x67\x4e\x1e\x86\x3d\xdb\xd6\x7c\x5f\x57\
+\x9e\x73\xb7\x20\xd9\xe3\x9c\x3c\x6a\xf1\x5e\x79\xc0\x44\x45\xae\
+\x87\xe9\x0a\x85\x9b\xd9\xc8\x42\x3f\xd3\x2e\x55\x81\xef\xb5\x4b\
+\xf5\xea\xf6\xff\xda\x6a\x6e\xaa\x0d\xff\x79\xe3\x3a\x81\xcc\xa1\
+\x37\x44\x2d\xc1\x1c\xd0\xc6\x08\x8d\x73\x20\x74\x91\xc8\x81\x6e\
+\x92\x16\x10\x07\x7c\x51\x03\x6a\xcb\xe5\xaf\x3c\xfe\x5a\xb5\xe2\
+\xbb\xef\xe0\xce\x9d\xcf\xa1\xa6\x38\x15\x62\x51\x37\x93\x1d\x8c\
+\x20\xcd\xd1\xe4\x71\xd6\xca\xde\x07\xe5\xee\x7d\x73\xb2\x5d\x4c\
+\x9d\xb2\x5c\xcd\x2c\xe4\x2b\xfb\x0c\x50\x38\x19\xbd\xa5\x6b\xdc\
+\xc5\x4b\x1b\xfe\xf3\xc7\x77\x82\x24\x86\x7f\x6f\x88\xb4\x35\x86\
+\x88\xc5\x9c\x03\x61\x8b\x7a\x31\x0e\x70\x7f\xa0\xe2\x80\xdf\xdc\
+\xee\x50\x5b\xa9\xfc\x55\xe2\x2f\xda\xa3\x47\x8f\x60\x6d\x65\x0e\
+\x78\xcc\xe8\xc8\xf4\xd0\x17\x63\x23\xff\x39\x1d\x21\x78\x5e\x27\
+\x88\xb2\xe9\xfa\x73\xa2\x7d\xcf\xbf\xa6\xad\x30\xbe\x99\xe9\x64\
+\x72\x3a\xd7\xcd\x6c\x7d\x95\x5f\xdf\xde\x6d\x1d\xff\x68\x3b\x53\
+\x81\x03\x26\x4d\x38\xa0\x8a\x09\x88\x07\xfe\xf3\x7a\x42\x6d\x55\
+\x81\x1e\x7f\xc4\xdf\x13\xf1\xd7\x58\x1b\x53\xdf\x2b\x9d\xd6\x8e\
+\xf1\x22\xd1\xae\x17\x94\xf9\xf5\x1f\xaf\x73\xfc\x87\xb7\x73\xd0\
+\x8e\x7f\x1f\xd4\x32\x33\x88\x51\xe3\x80\xa8\x05\x61\x36\xbd\x30\
+\x2e\x10\x63\x02\x8c\x0b\x17\xbc\x03\x75\x7a\xfc\x9b\xc5\xff\x89\
+\xb5\x72\xe4\x41\xcc\xe2\x6e\x90\xef\x65\xa6\x53\xfc\xe7\xf6\x33\
+\xf8\x9d\x85\x79\xfb\x04\xad\xf8\x2f\xef\x03\x71\x0e\xfd\x24\x0e\
+\x44\x2f\xed\xf3\xa4\x3f\xb0\xee\xc5\x39\xb0\xc8\x58\x8f\xff\x73\
+\xe2\x2f\x77\x35\x9b\xad\x4b\xfc\xfb\x21\xfe\x96\x23\x3a\xc4\x3f\
+\x0d\xff\x78\x87\x77\x21\x6e\x19\x72\xc0\xbe\x2f\x9a\x19\xe3\x00\
+\x19\x71\x80\x4c\xe2\x80\xb5\x09\x6c\x5d\x5f\xa3\xc7\xff\x39\xf0\
+\xcf\xf5\xe8\xb7\xbc\xad\xe2\x6f\xf3\x51\x67\x48\x5d\x61\x0a\x32\
+\xc7\x01\x8c\x03\x8c\x07\xc4\x81\x65\xc4\x01\x53\x81\x03\x82\x3f\
+\xa0\xdc\xc0\xa6\x0f\xec\xdd\xbe\x4e\xe7\x18\xe8\x1e\x7f\x39\x78\
+\xcc\x7c\xeb\x99\xf8\x47\x59\x77\x6d\xd3\xf8\xdb\x4e\x20\xfc\xcd\
+\x40\xb6\x62\x10\x72\xe0\x3d\x48\x58\xde\x9f\x59\x9c\xa0\x03\x31\
+\x76\xa2\x16\x50\x5c\x68\x0c\xa1\x8b\x4d\x11\xff\x06\x9d\x63\xa0\
+\x73\xfc\x57\x15\x81\xe7\xec\xae\xcf\xac\x97\xa2\xfa\xc9\xb6\x8f\
+\x7f\x5f\x48\x5a\x39\x18\x92\x9c\x06\x32\x1d\x48\x5c\x3e\x00\x39\
+\xc0\xfd\x01\xf1\x40\x3d\x26\x08\xb7\x35\x83\x7d\x3b\xf4\xef\xff\
+\xba\xda\x12\xf0\x9a\xdd\xed\xa5\xc0\xdf\x72\xa8\xc1\x1f\x2d\xcc\
+\x3b\x94\x68\xc5\xdf\xa9\x2f\xa4\x38\x0f\x81\x94\x95\x43\x50\x07\
+\x06\x32\x4b\x14\xb4\x20\x9e\x38\xb0\xac\x2f\xd3\x01\xe2\x41\x84\
+\xdd\x40\xd8\xb7\x73\xa3\xce\x31\xd0\xa5\x7d\xfd\xf5\xd7\xb4\x1e\
+\xf8\xd2\xbc\xff\xd3\x4d\x0d\xfe\x62\x31\xdc\xb0\x41\x1b\xfe\x69\
+\x2b\xfb\x41\xaa\xcb\x30\x48\x75\x1e\x8a\x1c\x20\x1d\x18\x24\x71\
+\x20\x71\xf9\x7b\xc8\x01\x31\x36\x34\x83\xc8\x65\xc3\x10\xff\x2d\
+\x3a\xc7\x40\xd7\xb6\x7f\xe7\xfa\xe7\xc0\xdf\xac\x4d\xe3\x9f\x8e\
+\xf8\xa7\xb9\x0e\x67\x96\xea\x3c\x0c\xb5\x40\xc5\x01\xee\x0f\xde\
+\x93\x62\xc3\x28\x87\xe1\xb0\x6f\x97\x1e\xff\xe7\xc1\x3f\xcf\xc3\
+\x2c\xa0\xad\xe2\x6f\x3f\xa9\x0b\x64\xba\xbc\x0b\x99\x1e\x23\x21\
+\xc3\xcd\x1c\xd2\x19\x07\x86\x32\x23\x0e\x90\x25\x12\x07\x98\x3f\
+\x78\x0f\x62\x1c\xcd\xf5\xf8\x3f\xef\xfb\xef\xde\x37\xbd\xad\xe2\
+\xbf\x7c\x4a\x57\xc8\x71\x1f\x88\xf8\x8f\x82\x0c\x8f\x11\x2a\x0e\
+\xb8\x0c\x67\x31\x41\xb2\xe4\x0f\x06\x30\x2d\x88\x59\x31\x12\x0e\
+\xef\xdf\xa9\xf3\xe7\xaf\x6b\x6b\x29\xfe\xa1\x6d\x00\xff\x09\x43\
+\xdb\xbd\x61\x61\x6e\xb8\x55\x2b\xfe\x1e\x83\x20\xdb\x6b\x0c\x64\
+\x79\x8e\xd2\xd4\x01\x21\x26\xe0\x1c\x18\xcc\xfc\x41\xac\xd3\x28\
+\x38\x7f\xe6\x98\xce\x9f\xbf\xae\xad\xa5\xf8\x07\xcd\x7d\x0b\x72\
+\x5c\x4d\x75\x8a\xbf\xe5\xd0\x3f\x1b\x22\xfe\x17\xb4\xe1\x2f\xf7\
+\x18\x0c\x39\xde\xef\x43\x0e\xe3\xc0\x18\xae\x05\xc8\x01\xb2\x34\
+\xe4\x00\x99\xa8\x05\xf1\x2b\x47\xeb\xf1\x7f\x29\xf1\xef\x70\x55\
+\x2b\xfe\x9e\x83\x41\xe1\x3b\x0e\xe4\xc4\x01\xb4\x2c\xcf\xd1\x90\
+\x85\x1c\xc8\x74\xe7\x5a\xc0\x63\x43\xce\x81\x04\xe7\x31\x7a\xfc\
+\x09\xff\x5d\x1b\x11\xff\xee\xaf\x04\xfe\x0a\xcf\x21\x90\xeb\x37\
+\x9e\x73\xc0\x67\xac\x8a\x03\xe4\x0f\xdc\x31\x26\x40\x4b\x17\x38\
+\x90\xe0\xfa\x01\xe2\x7f\x42\xe7\xcf\x5f\xd7\x76\x60\xef\x0e\xf0\
+\x9a\xf3\xce\x4b\x8d\x3f\xfa\x04\x58\x69\xd9\x0d\x72\xbd\x86\x42\
+\x7e\xc0\x47\x8c\x03\xb9\xbe\xe3\x25\x0e\x64\x7b\x8d\x66\x3c\xa0\
+\x98\x20\x53\xe0\x40\xbc\xfb\x44\x38\x77\xf6\x94\xce\x9f\xbf\xae\
+\xed\xd0\xfe\xdd\xe0\x3d\xcf\xb8\x45\xf8\xcb\x5d\x4d\x15\xba\xc4\
+\x7f\xf2\xa0\x3f\x77\x44\xac\xaf\x3f\xf9\xfe\x1b\x82\xf7\xec\x1e\
+\x90\xe7\x6d\x0e\xca\xc0\x09\xc8\x81\x0f\x91\x03\x1f\x20\x07\x3e\
+\xe0\x1c\xf0\xe1\x31\x01\xf1\x20\xd3\x63\x34\xe3\x40\xa2\xc7\x27\
+\x70\x5e\x8f\x3f\x9c\x38\x76\x08\x02\x16\x99\xb6\x08\x7f\x85\xbb\
+\xe9\x26\x5d\xe2\x3f\x7d\x74\x87\x2e\x98\xff\xfd\x4f\x73\xf8\x7b\
+\x21\xfe\x4a\xdf\x51\x50\x18\x3c\x11\x94\x01\x1f\x33\x1d\xc8\xf3\
+\xff\x50\xd3\x1f\x30\x0e\xf0\xb8\x50\xe6\x31\x09\xf1\x3f\xad\xf3\
+\xe7\xaf\x6b\x3b\x79\xfc\x30\x04\xda\x98\x3d\x13\xff\x60\x8e\xff\
+\x76\x5d\xe2\x3f\xd9\xbc\x7d\xb7\xe6\x7c\xbf\x84\xbf\xdf\x68\x28\
+\x0a\xfe\x04\x0a\x82\x26\x42\x41\xe0\xc7\xa8\x05\x1f\x43\x1e\xea\
+\x00\x99\x02\xfd\x81\xc2\x67\x9c\xe0\x0f\xc6\x40\x92\xd7\x14\x3d\
+\xfe\xcf\x81\x3f\xf5\x50\xc9\x71\xe9\xd3\xa6\xf1\x2f\xf0\x1f\x03\
+\xc5\xa1\x93\x51\x03\x3e\x61\x3a\x50\x10\x34\x81\x71\x20\x1f\x75\
+\x80\xb4\x80\x71\xc0\x57\xe0\x40\xb0\x15\x5c\xbd\x7c\x41\xe7\xcf\
+\x5f\xd7\xd6\x52\xfc\xfd\xac\x5e\x06\xfc\xdf\x87\x92\xb0\x29\xc8\
+\x81\x29\x4c\x07\x0a\x99\x16\x08\x1c\x40\x9f\x90\xe7\xff\x01\x8b\
+\x0b\x89\x03\x8a\xb0\x79\x70\xed\xca\x45\x9d\x3f\x7f\x5d\xdb\xab\
+\x80\xff\x34\xc4\xdf\x77\x4e\x0f\x28\x0c\x18\x0b\x65\x11\x16\x50\
+\x1a\x36\x15\x4a\x50\x07\x8a\x42\x26\x71\x1e\x20\x07\x88\x07\x14\
+\x13\xe4\xfb\x0b\xb1\x61\xb8\x1e\xff\x97\x0d\x7f\x8b\x11\x86\xbd\
+\x9b\xc3\x7f\xfa\x48\x43\x08\xb5\x7e\x07\x8a\x82\xc6\x41\x79\xe4\
+\x34\x28\x0f\xb7\x40\x1d\x20\x0e\x4c\x81\x92\x90\x29\xdc\x1f\x04\
+\x71\x7f\x90\x1f\xc8\x39\x90\x17\xb1\x90\xf5\xef\xd0\xf5\xf3\xd7\
+\xb5\x3d\x27\xfe\x3b\x75\x8a\xff\xb0\xf6\x13\xb4\xe1\x4f\x67\xbe\
+\x4a\x43\x3f\x81\x8a\xa8\xe9\x8c\x03\x65\x11\x96\x50\x1a\x3e\x95\
+\x69\x41\x71\x08\xd7\x02\x91\x03\xe4\x0f\x72\xa3\x96\xc0\x95\x2b\
+\x57\x75\xfe\xfc\x75\x6d\x9f\x9e\x3c\x86\xf8\xf7\x6b\x11\xfe\x72\
+\x17\xd3\x8b\xba\xc4\x9f\x7a\x7f\x3c\x0d\xff\xb2\xb0\x49\x50\x15\
+\x3d\x13\x6d\x06\xd7\x81\x48\x4b\x28\x0b\xe7\xfe\xa0\x58\xf0\x07\
+\x62\x6c\x98\x17\xbd\x54\x8f\x3f\xda\xa9\xd3\x67\x20\xd0\x76\x60\
+\xcb\xf0\x77\x35\xbd\xd3\x96\xf1\x2f\x8f\x98\x0c\xd5\xb1\xb3\xa1\
+\x2a\x66\x26\x54\x46\xcd\x40\x2d\x98\xc6\x78\x50\x4a\x1c\x08\x9f\
+\xca\xe2\xc2\x62\x21\x26\xc8\x8f\xb6\xd3\xe3\x8f\x76\xfa\xcc\x59\
+\x08\x5a\x32\xe8\xd9\xf8\xcf\x36\x24\xfd\x6f\xd3\xf8\x57\x44\x4e\
+\x81\x9a\x38\x2b\xa8\x61\x1c\x98\xcd\x74\xa0\x22\x5a\xf4\x07\x16\
+\x8c\x07\x14\x13\x90\x16\x28\x63\xed\xf5\xf8\xa3\x5d\xbe\x72\x0d\
+\xc2\x1d\x86\x3f\x13\x7f\xea\xa5\x9a\xed\xdc\xbb\x4d\xe2\x3f\x03\
+\xf1\xa7\x9a\xfe\xaa\x28\x0b\x58\x9d\x30\x17\x56\xc5\xcf\x41\x1e\
+\x10\x07\x66\x31\x2d\xa0\x98\x80\xc5\x05\x18\x13\x10\x0f\x28\x36\
+\x2c\x4d\x5a\x09\x37\x6e\x7c\xa6\xf3\xe7\xaf\x6b\xbb\x7a\xf5\x3a\
+\x44\xb4\x00\x7f\xef\x36\x80\xff\x34\x73\xc3\x65\xcd\xe1\x4f\x67\
+\xff\x13\xed\x4d\xa0\x3a\x7a\x1a\xd4\x26\xcc\x63\xc6\x39\x60\x05\
+\xd5\xc4\x01\x8c\x09\x2a\x51\x0b\x2a\xd5\x62\xc3\xaa\x74\x77\xb8\
+\x75\xeb\xb6\xce\x9f\xbf\xae\xed\xa5\xc2\x7f\x78\x7b\xb7\x66\xdf\
+\x7f\xc4\x3f\xd9\xd1\x0c\x56\xc5\xce\x84\x3a\xd9\x02\xa8\x4d\x9c\
+\x8f\x86\x1c\x88\x53\xe3\x00\x9a\x3a\x07\x8a\xe2\x97\xe1\xef\x7e\
+\x45\xe7\xcf\x5f\xd7\xf6\xca\xe0\xbf\xa2\x2f\xac\x8e\x9f\x0d\x6b\
+\x92\x16\x42\x7d\xd2\x02\xe4\xc1\x7c\xae\x03\x09\x73\x90\x07\x56\
+\x2c\x2e\xac\x8e\x15\xb5\x60\x3a\x14\x45\x58\xc1\xee\xed\xeb\xe1\
+\xab\xaf\xbe\xd2\x39\x06\x2f\x0b\xfe\x69\x8e\xc6\xf7\x72\x9c\x3b\
+\xea\xac\x17\xdd\xd3\xdf\xff\xbe\x88\xb7\x15\xac\x4d\xb1\x86\x35\
+\xc9\x8b\x90\x03\x0b\xa1\x8e\xe9\xc0\x7c\xe4\x85\x10\x13\x30\x0e\
+\xcc\x96\x38\xa0\x8c\x77\x82\x63\xc7\x8e\x22\x07\xbe\xd6\x39\x0e\
+\x2f\x03\xfe\xa9\x8e\xc6\x0f\x73\x9c\x8d\x4d\xda\x2a\xfe\xf5\x89\
+\x73\xa0\x21\xd5\x06\x1a\x52\x6c\x24\x0e\xd4\xa3\x3f\x20\x1e\x50\
+\x5c\x48\x3c\xa8\x11\xb5\x80\x72\x44\xe4\x41\x31\xfa\x81\x86\x55\
+\xc5\x70\xe4\xf0\x01\xb8\x72\xe9\x02\x7c\x7e\xf7\x0e\xdc\xbb\xf7\
+\x39\xdc\xbf\x7f\x9f\xf5\xce\x79\xd5\xf5\x81\xe3\x6f\x0e\xd4\x13\
+\xb1\xcd\xe3\x3f\xc2\x30\x4c\x5b\xfc\x97\x82\xfa\x5f\x2f\x9b\x07\
+\xeb\xd3\x6d\x91\x03\x8b\x19\x0f\x88\x03\x6b\x92\x16\x71\x0e\x08\
+\xfe\x80\x78\xa0\xca\x11\x67\xb1\x1c\xb1\x12\xe3\x01\x65\xb8\x15\
+\x64\x87\xcc\x87\xac\x70\x7b\x50\xa6\x04\x42\x6d\x49\x3a\x6c\x5e\
+\x5b\x0e\x07\x76\x6f\x86\x93\xc7\x0e\xc3\xd9\xb3\xe7\xe1\xfa\xf5\
+\x1b\xac\xbf\x2f\xeb\xf5\x2b\x98\xae\xf1\xfb\x8f\xe0\xef\x34\xee\
+\xd9\xfd\xd2\xf1\xcf\x93\x1c\xde\xd1\x35\xfe\xb9\xcd\xe1\x3f\x6b\
+\xcc\x5b\xa0\xf0\xe8\x8f\x58\xcf\x87\x0d\xe9\x4b\x90\x03\x4b\x60\
+\x5d\x2a\xe7\xc1\xda\x64\x6b\x34\xce\x81\x7a\x19\x8f\x0b\x59\x8e\
+\x28\xc4\x86\x55\x42\x6c\x58\x25\xac\x17\x55\x44\xf0\x35\xc3\xe2\
+\x50\x0b\x28\x08\xb5\x84\xbc\x60\xe2\xc6\x6c\x28\x8c\x5e\x04\x45\
+\x89\x2b\xa0\x38\xcd\x1f\x4a\xe4\x71\xa8\x19\x25\xb0\x63\xeb\x46\
+\x38\x7e\xe4\x10\x5c\xbf\x7a\x89\xe9\xc6\x17\xf7\xee\x31\xdd\x78\
+\xf8\xf0\x21\x3b\x5b\xa7\x6b\x6c\x5b\x86\xff\x35\x88\x72\x9d\x84\
+\xf8\xbe\xd9\xe6\xf1\xb7\xd0\x86\xff\xe8\xb7\x40\xe9\x3d\x08\xd6\
+\xa5\x2c\x82\x4d\x99\x76\xb0\x31\xc3\x8e\xf1\x80\x38\xb0\x8e\x38\
+\x90\x62\xcd\x78\x50\x2f\xc4\x86\x9c\x03\x6a\x39\x22\xf3\x07\xb3\
+\xd8\x9a\xa1\x2a\x47\xb4\x50\xdb\x3f\x98\xc4\xf7\x12\xd9\xfe\x01\
+\xd5\x95\x7c\x08\x4a\xff\xf1\x20\xf7\xfd\x10\x32\x7c\x27\x43\xb2\
+\xcf\x74\x48\x09\xb2\x85\xfc\x14\x7f\xd6\x4f\x6b\xd3\x9a\x32\x38\
+\xb8\x67\x2b\x9c\x3c\x71\x14\x2e\x5c\xbc\xc4\xf2\x4c\xea\x19\x4f\
+\xfd\xf9\xda\x9a\x6e\x5c\x43\x4d\x8b\x76\x9b\xfc\xd2\xe3\x5f\xe8\
+\x37\x14\x36\xa4\xd9\xc2\xa6\xac\x65\xb0\x31\xcb\x1e\x36\x65\xd8\
+\x73\x1d\x48\x17\x39\x60\xc3\x63\xc3\x24\x6b\xce\x01\x31\x3f\x20\
+\x0e\xc4\x5b\x61\xee\xa8\x5a\x2f\xaa\x14\xf6\x0f\xca\x22\x2d\xa1\
+\x3c\xdc\x92\xd5\x14\x90\x15\x51\x6d\x09\x72\xa0\x50\xd8\x43\x52\
+\x4a\xfb\xc9\xbc\xb6\x88\xea\xce\xb3\xbd\xc7\x42\x86\xd7\x78\x48\
+\xf3\xfc\x10\x32\xfd\xa6\x40\x4e\xc8\x6c\xc8\x8d\xb6\x83\x7c\x99\
+\x07\xea\x46\x2c\xac\x5d\x5d\x06\x3b\xb7\x6d\x82\x13\xc7\x1b\xe1\
+\xe6\x8d\xab\x5c\x37\xbe\xf8\x42\xd2\x8d\x17\x8d\x3f\xf5\x11\x4d\
+\xf0\x9e\xf6\x4a\xe0\xbf\x11\xf1\xde\x92\xbd\x1c\x36\x23\x07\x36\
+\x21\x07\x98\x0e\x64\x2c\xe5\x3c\x40\x6e\x50\x5c\xd8\xc0\x38\xb0\
+\x48\xc8\x11\x05\x2d\x90\xf2\x03\x2b\xb5\x1c\x11\xfd\x41\x93\x3d\
+\xa4\x12\x61\xff\x40\xdc\x43\xa2\x5a\x53\xa5\x54\x67\xc8\x6b\xcc\
+\x54\x35\xc7\x63\xa4\x9a\x63\xaa\x3b\xcf\xa0\xba\x73\x17\x3a\x9b\
+\x3e\x08\x64\x2b\x87\x43\xfc\xca\xb1\x10\x8d\xba\x2b\x0b\xb0\x86\
+\xdc\x24\x3f\xa8\x2a\x4c\x86\x8d\xf5\x65\xd0\x78\x60\x27\x7c\x7a\
+\xf2\x38\x5c\xba\x7c\x85\xcd\xa3\xa1\x7e\x9e\xdf\xb6\xa2\x6e\xdc\
+\xbb\xf7\x05\x24\xa2\x7e\xb5\x04\xff\xe4\xe5\x46\x8f\x72\x5d\x7b\
+\x0f\xd4\x15\xfe\xd3\x46\x76\x50\x6a\xc5\xdf\x77\x18\x6a\xff\x52\
+\xd8\x9a\xe3\xc8\x6c\x73\xb6\x03\xe3\xc1\x46\xf2\x07\x68\xeb\x85\
+\xb8\xa0\x41\xd0\x02\xe2\x00\x59\x9d\x10\x1b\xaa\xe7\x07\x35\x42\
+\x8e\xc8\x78\x20\xf8\x83\xf2\x26\xfb\x07\x45\x21\x93\xa5\x1a\xb3\
+\x02\xb5\x1a\xb3\x5c\xb1\xce\x90\x6a\x8e\xbd\xf9\x59\x34\x32\xc6\
+\x01\xe1\x0c\x0a\x3f\x8f\x36\x04\x92\xd9\xb9\xd4\x81\xec\x5c\x6a\
+\x82\xe3\x20\x88\x73\x1c\x0a\xb1\x8e\xe6\x90\xe8\x36\x0e\x52\x7c\
+\xa7\x42\x66\x98\x35\xe4\xc4\xbb\x43\x71\x0e\xe9\x46\x29\xec\xda\
+\xbe\x19\xce\x9c\x3a\x0e\x37\x3f\xbb\x26\xe9\x06\xe5\x28\xd4\xc7\
+\xe1\x97\xe2\x7f\x97\xbd\xff\x96\x2d\xc5\xff\xb1\xdc\xd5\xcc\x42\
+\x57\xf8\x5b\x8e\x34\xdc\xa1\x0d\xff\x22\x7c\xff\x37\xe3\x3b\xbf\
+\x5d\xe1\x04\xdb\xe4\x2b\x60\xab\xdc\x11\xb5\x80\x73\x60\x53\xa6\
+\xbd\x8a\x03\x69\x9c\x03\xa4\x05\x14\x13\xa8\xf2\x83\x05\x2c\x26\
+\xd0\xe0\x80\xb0\x76\xcc\xf6\x0f\xa4\x9a\x02\x0b\xee\x0f\xa8\xc6\
+\x4c\xd0\x02\x5e\x53\xa0\x56\x5f\xe4\xab\x5e\x73\xac\x3a\x83\x92\
+\xa1\x76\x06\x25\x55\x38\x8b\x46\xa6\xea\x53\x30\x80\xf7\xaa\x10\
+\x7b\x58\x51\xaf\x8a\xa5\xbd\x21\x8a\x7a\x57\x2d\xee\x05\xe1\xb6\
+\xfd\x20\x64\xe9\x50\x08\x76\xf8\x00\xe2\x7c\xe7\x83\x5c\xe6\x03\
+\x95\x05\xc9\xb0\x6d\x43\x0d\x1c\x46\xdd\x38\xf5\xe9\x49\xb8\x7a\
+\xed\x06\xdc\xbd\xfb\x39\x5b\xd3\x10\x75\xe3\x69\xf8\x9f\x3f\x7f\
+\x01\x42\xec\x31\xff\x6b\x41\xfc\x9f\xec\x60\xf4\x5d\x9e\x9b\xe9\
+\x34\x5d\xe1\x8f\xf1\xff\x9e\xe6\xce\x7e\x58\x7f\xf4\x36\x7b\xff\
+\xb7\xe4\x2c\x83\xed\xb9\x2b\x99\xa9\x73\x80\x8c\x71\x40\xcd\x1f\
+\xf0\x1c\x51\x2d\x3f\xa0\xf5\x22\xf2\x07\x09\x62\x7e\x60\xa5\xb6\
+\x76\x2c\xee\x27\xab\xf6\x90\x98\x3f\x08\xe3\x1c\x28\x0a\x11\x6a\
+\x8e\x83\x26\x68\xc4\x04\x4f\x9e\x41\x19\x25\xf9\x03\xf1\x2c\x1a\
+\xef\x55\x81\x1c\x58\x29\x9e\x51\x7f\x4f\xea\x53\x20\xf6\xaa\x10\
+\x7b\x17\x45\x2d\xe1\xbd\x8b\x22\x16\xbf\xc3\x7a\x19\xb2\xbe\xa6\
+\x8b\x8c\x21\xd8\xba\x37\x04\x23\x37\x22\x1c\x86\x42\x9c\xdb\x47\
+\x90\x14\x38\x0f\x32\x62\x9c\xa1\x98\xe2\x8d\xda\x72\xd8\xbb\x6b\
+\x1b\x9c\x3d\x7d\x12\x6e\xdd\xbc\x81\xfe\xfe\x2e\xe6\xb0\x5f\xb2\
+\x78\xe3\xf6\xad\x9b\xa0\xcc\x8a\x06\xcf\xd9\x5d\x9e\xb9\xfe\x43\
+\xf8\x27\xda\xf5\x6c\x93\xf8\x2f\xfe\xf8\x6d\x28\x0e\x18\x81\x98\
+\x3b\xc2\xae\x7c\x57\xd8\x99\xe7\x0c\x3b\xf2\x90\x07\xc8\x01\xb2\
+\x2d\x39\xcb\x59\x5c\x40\x1c\x20\xdb\x90\xae\x8a\x09\x9a\xe6\x07\
+\x62\x4c\x20\xc6\x86\xe2\xda\xb1\xc8\x81\x4a\x81\x03\xe5\x42\x7d\
+\x91\xca\x1f\x4c\x12\x62\x43\xf5\xf3\x07\x1f\xb0\xb8\x80\x38\x40\
+\x96\x2d\x9c\x41\xc9\xa2\x73\x48\x68\xe9\x74\x3e\xd9\x8d\xb4\x60\
+\xa8\xc6\x19\x75\xb1\x4f\x81\xd8\xab\x22\x76\x99\x7a\x2f\xbb\xde\
+\x02\x07\x8c\xa5\xde\xa6\x21\x42\x7f\x5b\xde\xf3\x5e\x98\x7b\x40\
+\xfd\xee\x69\xf6\xc9\x8c\x76\xe0\x6d\xd5\x0d\xbc\x17\xf4\x03\x1f\
+\xdb\xd1\x10\xed\x3d\x17\x75\xc3\x17\x8a\xd0\xa7\x24\x06\x2d\x06\
+\x8f\x99\x9d\x5b\x34\x2f\x8f\x7e\x26\xd6\xb6\x7b\x9b\xc5\xbf\x2c\
+\x78\x0c\xc3\x7d\x97\xd2\x1d\x76\x2a\x5d\xf0\x6b\x17\xd8\x41\x3a\
+\x90\x2b\xf8\x03\xb5\x98\x80\x71\x20\xd3\x8e\xf1\x80\xac\x21\x8d\
+\xaf\x17\xa9\xe7\x88\xf5\xb4\x66\x28\xe4\x89\xa2\x3f\xe0\x7b\x89\
+\xb3\x18\x07\x68\xad\xa0\x2c\x62\x9a\x94\x23\x96\xa8\xc5\x04\x85\
+\xc1\x13\x18\x07\xb8\x16\x7c\xa4\xe1\x0f\xb2\xd5\xcf\x21\x51\x9f\
+\x02\x77\x55\x9f\x82\x54\x17\xf5\x3e\x05\x5c\x0b\x12\x1c\xde\x13\
+\x7a\x17\x71\x7f\x40\xa6\xde\xdb\x54\xec\x67\xc8\x78\x20\xf4\x38\
+\x26\x13\x67\xa0\xf8\x59\xbd\xad\x36\x03\xa5\x3d\x5b\xe7\xa3\x9e\
+\xae\xd4\xf3\x8f\xe1\xde\x02\xec\x5f\x0e\xfc\xdf\x87\xdd\xf8\xee\
+\xef\x29\x70\x87\xdd\x4a\x37\xe4\x81\x9b\xa0\x03\xce\x3c\x26\x50\
+\x70\x0e\x90\x16\x88\x1c\x20\x5b\x9f\xb6\x98\xe9\x3f\xc5\x03\x6c\
+\xcd\x48\x88\x0d\xf9\xfe\x81\x4a\x0b\x38\x07\xac\xd4\xf6\x0f\x66\
+\x30\x3d\x28\x13\xd6\x8b\xd4\xeb\x8b\x0a\x83\x27\x09\x71\x61\xd3\
+\xfc\x60\x9c\xc6\x19\x14\x55\x9f\x02\xd5\xb9\x54\xd2\x02\xe2\x00\
+\x99\xcc\x49\x15\x13\x24\x88\xfd\x0c\x35\xfa\x98\x99\x30\x1e\x10\
+\x07\xc2\x9b\xed\x79\xdf\x99\x69\x81\x9f\x55\x27\x69\xee\x81\xe6\
+\x2c\xa4\x96\x61\xdf\x16\xf0\x9f\x38\xc0\xe0\x4f\x88\xf5\x51\x6d\
+\xf8\x97\x87\xbc\xcf\xb0\xdf\x5b\xe8\x89\xe6\x01\xbb\x0b\xd0\x94\
+\xe8\x0b\xf2\x5d\x18\x0f\x58\x5c\xc0\x62\x43\x9e\x1f\x10\xf6\x55\
+\x91\x53\x20\xd7\x73\x08\x64\xbb\x0f\x62\x67\xc7\xf3\x7d\x86\x43\
+\x51\xe0\x58\x28\x0b\x9d\x00\x95\xf8\x67\xab\x30\x17\x5c\x1d\x6f\
+\xc5\x8c\xfc\x80\x68\xd5\xe2\x3e\x52\xec\x3c\xa8\x88\xb1\x42\x2d\
+\x98\x29\x68\x81\x85\x70\xfe\x60\xb2\xe6\xf9\x83\x80\x66\xf2\x03\
+\x81\x03\xd9\xea\xb1\x21\xcb\x0f\x38\x07\x28\x26\x60\x1c\x10\xfa\
+\x98\xc9\x96\x0f\x90\x62\x02\xde\xc7\xcc\x54\xe8\x73\xdc\x47\xa3\
+\xbf\x2d\xef\x79\x4f\x33\x50\x88\x07\xe2\x1c\x9c\x2e\xc2\xdc\x83\
+\x4e\x1a\x73\xd1\x5a\x32\x27\x53\x03\xff\x25\xdd\xbf\xcb\xf7\xe8\
+\x3b\x53\x17\xf8\xf3\xb3\x9f\x1d\x4e\x3d\x0d\x7f\xc2\x7d\x7f\xb1\
+\x37\xec\x2b\x42\x0e\xa0\x49\x5a\x20\xc4\x04\x3c\x36\xe4\xfe\xa0\
+\x2e\x7e\x26\xa4\x3a\xf5\x63\xb1\x55\x24\xf5\x03\xa4\x1e\xd1\xa8\
+\xa3\x11\xd6\x34\x43\xba\x07\xc4\xd8\xf6\x80\x04\xbb\x9e\x20\x5b\
+\x66\x04\x69\x2b\xfb\x42\x8e\xc7\x10\x50\xfa\x8e\x86\x92\xe0\xf1\
+\x50\x95\x60\x0d\xab\xf3\xc2\x61\x5d\x6d\x19\xac\x5b\x5d\x04\xab\
+\x0b\x65\x50\x9d\x13\xcc\x6a\x4a\x2a\x92\x1c\xa1\x3c\xde\x06\x4a\
+\xa3\xe7\x41\x71\x98\x25\x3f\x7b\x10\xf8\x11\xf7\x05\x01\x1f\xaa\
+\xd6\x8b\x58\x9f\x82\xe6\xcf\xa8\xb3\xd8\x50\xad\x57\x85\x94\x1f\
+\x2c\x17\x7a\xd9\x39\x70\x0e\xf0\xd8\x50\xbd\xdf\xb9\xca\x1f\xa8\
+\xfa\x9d\x77\x63\xb3\x2f\x48\x0b\x5a\x32\x17\xed\xe9\xf8\xf7\xf8\
+\x9f\x3c\x0f\x33\xcf\xb6\x86\xbf\xc3\x94\x2e\x88\xff\x58\x86\xfb\
+\x81\x52\x1f\x38\x50\x42\x1c\xf0\x62\x5a\xb0\xa7\x10\x39\x50\x20\
+\x70\x00\xb5\x80\xe2\xc2\xad\xf2\xe5\x50\x18\x30\x06\x64\x8e\x42\
+\x7c\x45\xb1\x15\xbe\x47\xec\x1d\x42\x1d\x25\x0d\x15\x67\x48\x71\
+\xed\xec\xc8\xea\x1f\xd9\x2c\x71\x2b\x43\x28\xca\x08\x81\xc6\xc6\
+\x46\xb8\x73\xe7\x0e\xe6\x5a\x77\xe1\xd6\xad\x5b\x70\xed\xfa\x75\
+\x38\x7d\xfa\x0c\x34\x1e\x3e\x08\xbb\x77\x6c\x86\x8d\x0d\xab\xa0\
+\x61\x75\x09\xac\xa9\x54\xc0\xea\x82\x04\xa8\xca\x0e\x84\x52\xe4\
+\x46\x51\xf4\x02\x50\x06\x5b\x40\x7e\xd0\x24\xc8\xf5\x9f\x00\x0a\
+\xbf\x0f\x91\x03\x63\x35\xce\xa8\xab\xf2\x03\xea\x5d\x34\x54\xca\
+\x11\x93\x56\x88\xf9\x41\xff\x27\xf2\x03\xe2\x00\x19\x8f\x0d\x39\
+\x97\x55\xfd\xce\xbb\x3d\x31\x13\x4b\x15\x13\xb4\xcc\x1f\xd0\x9f\
+\xc7\xd9\x76\xff\x3e\xd7\xbd\xaf\x7f\x5b\xc3\xdf\x79\x5a\x37\xa8\
+\x08\x1d\xcf\x70\x3f\x54\xe6\x07\x07\x4b\x7d\x19\x0f\x88\x03\x4c\
+\x0b\x50\x07\x48\x0b\x76\xa1\x3f\x20\x1e\x50\x5e\x48\xbd\x02\x92\
+\x29\xe7\x5a\xc1\xfd\x2b\xbd\x4f\xa2\x4f\x15\x75\x94\xde\x1f\x75\
+\x0e\xd0\x73\x08\xb4\xee\xc3\x72\xaa\xa7\xed\x0b\x8b\x6b\x75\xb4\
+\x9e\x7b\xfb\xf6\x6d\xb8\x7a\xf5\x2a\x9c\x3a\x7d\x1a\x1a\x8f\x1c\
+\x85\xfd\x07\x0e\xc1\xee\xdd\x7b\x60\xe3\xda\x2a\xa8\x2f\xcf\x86\
+\x0a\x45\x14\x94\xa4\x78\x40\x61\xbc\x3d\xe4\x47\x2d\x80\xdc\xd0\
+\x19\x90\xe3\xf7\x31\x64\x22\x17\xd2\xd0\x0f\x90\xa5\xb2\x75\x82\
+\xc1\x4f\xf4\x31\xe3\xf9\x41\x3f\x21\x26\x30\x93\x7a\x9b\xaa\x38\
+\x80\xbf\x87\xc0\x01\x31\x3f\x90\x66\xa0\x08\x31\x01\xf1\x40\x35\
+\x1b\xaf\xbd\x56\x0e\x08\xfe\xbf\x6d\xe2\x6f\xd9\x0d\x6a\xa2\x26\
+\xc2\x91\x8a\x40\x38\x5c\xee\x0f\x87\xd0\x0e\x10\x07\x4a\x90\x03\
+\xc5\x9c\x03\x7b\x58\x4c\xc0\xfd\xc1\x76\x8c\x05\xf3\xbc\x87\xb3\
+\x67\x2b\xfa\x58\xce\x81\x7e\x92\x9e\x8a\xef\x90\xc8\x01\xd2\x4e\
+\x7a\x56\x54\x2b\xbb\x7f\xcf\x8e\x5f\xbc\x16\x4b\xbc\xa1\x35\x3b\
+\x5a\x77\x25\xed\x60\xb3\x41\xaf\x5c\x41\x7e\x9c\x82\xc3\x87\xf6\
+\xc3\xf6\x2d\xeb\x60\x5d\x5d\x39\xd4\x57\x29\x61\x55\x49\x06\x94\
+\xe7\x84\x42\x91\xcc\x19\x14\xe1\xf3\x21\xd3\xf7\x13\x48\xf3\x18\
+\x03\x29\x6e\x23\x21\xd9\x79\x18\xfe\xbb\x07\xb3\x5e\x76\x8c\x07\
+\xc4\x01\x96\x23\xaa\xe5\x07\x1a\xfe\xa0\x97\xa4\x6b\x7c\x2e\x1a\
+\xc6\x86\x1a\x73\xd1\x54\x1c\x68\x76\x5e\x2e\x7e\x2f\x72\x51\x97\
+\xef\xf3\x75\x84\xff\x84\xc1\x1d\xba\x20\xd6\x67\xb5\xe1\xbf\x2a\
+\xfa\x13\x38\x56\x15\x0c\x8d\x95\xc4\x81\x00\xd4\x01\x81\x03\xa8\
+\x03\xfb\x25\x7f\xe0\xc1\x8c\xf2\xc2\x7c\x1f\x73\x96\x7b\xf1\xf5\
+\xd8\x21\xc2\x3a\x2c\x7f\x96\x94\x63\x45\x2f\xe1\xfd\xc2\xc5\x79\
+\x01\xe2\x33\x8b\x71\x1e\x07\x87\x0f\xee\x6b\xb5\x3d\x3c\xf1\xff\
+\x97\xd6\x67\x88\x1b\x97\x2e\x5f\x66\x67\x34\x1a\x1b\x8f\xc2\xbe\
+\xfd\x07\x61\xe7\xf6\x6d\xb0\xbe\xae\x02\xaa\x94\x89\x50\x98\xea\
+\x03\xb9\xd1\xf6\x90\x15\x32\x17\xd2\xfd\xa6\x40\xb2\xc7\x78\x48\
+\x58\x31\x84\x6b\x41\x93\x1c\xf1\xc9\xfc\xa0\x9b\xda\x5c\xb4\x67\
+\xe7\x07\x74\x1f\xbe\xb0\xb3\xce\xf0\x9f\x38\xac\x5d\x7f\xc4\xfa\
+\x33\xed\xf8\x4f\x82\xe3\xd5\xa1\x70\xb4\x32\x88\x59\x23\x71\x00\
+\x75\x80\x7c\x01\x19\xc5\x85\x64\x14\x17\xee\xc2\x58\x30\xdf\xd7\
+\x1c\x63\xef\x51\x6c\x2d\x86\xe2\x6e\x96\x77\xb1\xde\x70\xe8\x0f\
+\x1c\xb8\x3f\x88\x59\x6a\xaa\xf2\x07\xa8\xa3\xc1\xa8\x05\x71\x6e\
+\x1f\xb4\x2a\xfe\x4f\x33\x5a\xe7\x27\x5e\x90\x76\x50\xec\x71\xf3\
+\xe6\x4d\xb8\x7c\xf9\x0a\x9c\x38\x7e\x1c\x0e\xec\xdb\x0d\xdb\x36\
+\xad\x85\xba\xea\x02\xb6\x97\x94\x11\x34\x0b\xf5\xa0\xaf\xda\x9a\
+\x61\xd3\x99\x58\xcd\xfb\x03\x75\x0e\xa8\xc7\x86\xba\xc6\x7f\xf2\
+\xe0\x37\x07\x58\x0c\x37\xbc\xa5\x0d\xff\xd5\x31\x93\xe0\x44\x4d\
+\x18\x72\x20\x84\xe9\xc0\x11\xe2\x40\x45\x00\xd3\x82\x83\x42\x4c\
+\xb0\xbf\x84\x6b\x01\xe5\x85\x4a\xbf\x91\x20\xf7\x51\xe5\xe1\x4c\
+\x0b\x30\xe6\x56\xf9\x03\xbe\xee\xc2\x63\x2b\xd2\x52\xee\x0f\x12\
+\xdc\x3f\xd6\x19\xfe\x2d\xd5\x0e\xe2\xc6\xde\x3d\x7b\x20\x3b\x6c\
+\x21\xd3\x81\x27\xe6\x21\x09\xf9\x81\x38\x0b\x49\x35\x17\xed\x6d\
+\x8d\x1c\x51\x5d\x0b\x44\xfc\x75\xe6\xff\x9f\x82\xbf\xc7\xac\xee\
+\xb0\x3a\x7a\x32\x7c\xba\x3a\x02\x39\x10\x0a\xc7\xd1\x88\x03\x4c\
+\x07\xc8\x1f\x54\x04\xf0\xb8\x10\x8d\xfc\xc1\x1e\xcc\x07\x0a\x10\
+\x7f\x5a\x9f\x15\xf3\xb0\x2c\x8c\xbf\xa9\x6f\x68\xba\xeb\x70\x29\
+\xde\x96\xfc\x81\xbd\x99\x34\x47\x46\xe6\x39\xb1\xd5\xf0\xa7\xb8\
+\xe0\xe8\x91\x46\x38\x7b\xfa\x53\xb8\x7e\xed\x2a\xdc\xfb\x5c\x55\
+\x87\x48\xb1\x24\xbd\xff\x2d\xa9\x2b\xa2\x9f\xa1\x3a\xb5\x0d\x18\
+\x63\xc6\x3b\x0e\x94\x62\x1a\xae\x05\x46\x10\x61\x63\xf4\x44\x8e\
+\x28\xc5\x04\xd2\x7a\x51\x47\x21\x36\x54\x71\x20\x7c\x51\x97\x7f\
+\xe9\xaa\x07\xa8\x36\xfc\xa7\x22\xfe\x34\xcb\x6b\x75\xcc\x64\x38\
+\x55\x1b\xc9\x38\x70\x72\x55\x18\xe7\x40\x75\x30\xd7\x02\x8c\x0b\
+\x1b\xd1\x28\x26\x20\xa3\x7c\x80\xd6\x7a\xd8\xbe\x2d\xad\xcf\xd1\
+\x1a\xbd\xf7\x58\xa1\x37\x10\x5f\x97\xe7\xeb\x70\x83\xa4\x79\x22\
+\xe2\xfc\x80\x64\x9f\xc9\x88\xff\xfe\x56\xc1\x9f\xf6\x65\x4a\xf2\
+\x53\x21\xce\x6b\x2a\xa4\x04\x2f\x82\xec\x78\x77\x28\x91\x47\x43\
+\x3d\xe6\x90\xdb\x36\xae\x86\x43\x07\x76\xc3\x85\x0b\x17\xe0\xea\
+\xb5\xeb\x2c\x36\xb8\x8b\xfc\x20\x6e\x68\xe3\xc4\xf1\xa3\x87\x21\
+\x23\x70\x46\xb3\xf3\x90\xd8\x8c\x44\x96\x23\xf6\x6a\x3e\x3f\x90\
+\x72\x44\x9e\x1f\x10\x07\x22\x16\x75\xa1\x1e\xd0\x85\xba\xc0\xdf\
+\xc2\xfc\xcd\x81\xf8\xae\x37\x8b\x7f\xc0\xfc\x77\x60\x7d\xf2\x1c\
+\x38\x55\x1f\x8d\xf8\x47\xa1\x85\x73\x5f\x80\x76\xac\x3a\x54\xf0\
+\x07\xc1\xcc\x1f\x50\x5c\xb0\xaf\xd0\x1d\x14\x9e\x83\xa1\x38\x94\
+\xef\xdf\xd2\xde\x6d\x9e\xb0\x3e\xcb\xd6\xe5\x84\xf5\x38\xb6\x06\
+\x43\x7b\x73\x42\x7e\x40\xfe\x20\xd5\x6f\x2a\x34\x1e\x6a\x3d\xfc\
+\x0b\xb2\xa3\xc0\xd7\xea\x6d\xb6\x1f\xef\x39\xed\x4d\xf0\x9a\x85\
+\x18\xcc\xc5\x58\x6d\xa1\x31\x04\x2d\xee\x07\xa1\xf6\x43\x20\xce\
+\x7d\x22\xa4\x87\x2e\x04\x65\xb2\x27\xd4\x94\x66\xc0\x41\x2d\x7a\
+\x74\x1a\x75\x44\x11\xbb\x0c\xff\xdd\xb4\x56\x84\xbe\xcc\xde\x54\
+\x63\x1e\x12\x5b\x2f\x5a\x2c\xec\x21\x31\x0e\xa8\xe7\x07\x5d\xa4\
+\x59\xa9\xa4\x05\xa4\x03\x91\x36\x5d\x21\xcf\x4d\x37\xf8\x5b\x0e\
+\x6d\xf7\xbe\xc5\xf0\x0e\x0f\xb4\xe1\xbf\x31\x6d\x01\x9c\xa9\x8f\
+\x81\xd3\x75\xd1\x6a\x3a\x80\x3c\x58\x25\xc4\x04\x68\x62\x6c\xb8\
+\xbf\xd8\x13\xf2\x30\xff\x2f\x13\xd6\x6b\x69\xef\x4e\xea\x1b\x47\
+\x7b\xb6\xe4\x0f\x30\xff\x16\xd7\x61\x54\xfe\x60\x00\x64\xf8\x4f\
+\x6b\x65\xfc\xa3\x11\xff\xce\xcf\x5c\x8b\x23\x6e\x78\x4c\x7b\x03\
+\x7c\x66\x77\x86\x0d\xf5\x65\x5a\xf0\x3f\x05\x79\xf1\x4e\x6c\xef\
+\x40\x9a\x87\xa4\xb6\x5e\xd4\x74\x0f\x49\xf4\x07\x94\x1b\x88\xfe\
+\x40\x7d\x76\x76\x84\xb5\xee\xf0\xd7\x36\xf7\x9b\xe3\x6f\x04\x9b\
+\xd3\x17\xc2\xd9\xb5\x71\x70\x66\x0d\x72\xa0\x9e\x73\x80\xf1\x00\
+\x39\x40\xfe\xe0\x04\xf3\x07\x5c\x0b\x0e\x96\x78\x61\xfe\x3f\x8c\
+\xed\xdf\x50\x7d\x17\xed\xdf\x89\xfb\xb7\x62\xcf\x30\x85\xd0\x2f\
+\x8e\x7a\xc5\x71\x7f\xc0\x63\xc3\xac\xa0\x19\x3a\xc7\x5f\xdd\x7c\
+\xe7\x74\x43\xfc\xcb\x9b\xfd\xf7\x9c\x41\xfc\xf3\x13\x56\x4a\x6b\
+\x86\x62\x5e\x13\xa7\x6d\x0f\xc9\xa6\x97\x46\x8e\xa8\xb9\x8f\xd8\
+\x09\xc2\x16\xea\x4e\xff\x9f\x85\xff\x96\x8c\x45\x70\xbe\x21\x01\
+\xce\x11\x07\x48\x07\xd0\x4e\xd5\x45\x31\x0e\x9c\x14\xb5\x40\x88\
+\x0d\x0f\x62\x0c\x48\xfe\x5f\xac\xf3\xaa\x10\x7a\x04\x94\x08\x7d\
+\xa3\x98\x3f\x60\xfd\xc2\xc6\x09\xeb\xf3\xa3\x24\x2d\xa0\x7a\xce\
+\x97\x09\x7f\x65\xe2\x4a\xde\xf3\x5e\xc8\x69\xc4\x75\x2e\xd5\x3e\
+\x62\x73\xf3\x52\x85\x1c\x91\xc5\x86\xaa\x98\x20\x7c\x51\xd7\x36\
+\x89\x7f\xc8\x42\xc4\x3f\xd3\x1a\x2e\xac\x4b\x44\x0e\xc4\xc3\xb9\
+\x86\x38\x38\xbb\x26\x56\xf0\x07\x9c\x03\x9f\xd6\x22\x07\x56\x73\
+\x0e\x1c\x2e\xf3\x05\x25\xe6\xff\xb5\x09\xf3\xa5\x33\x00\x62\x5d\
+\x07\xed\xe3\x92\x16\x14\x08\xf5\x5c\xb9\x52\x6c\xc8\xeb\x36\x14\
+\x61\x73\x11\xff\x03\x2f\x11\xfe\x2e\xd2\xba\xb1\xc6\x3c\x24\x07\
+\x61\x26\xd6\x13\x7b\x48\x22\x07\xde\x51\x9b\x9b\xcc\x39\x10\x61\
+\xdd\xad\xed\xe1\x3f\xdc\x10\xe2\xec\xfa\x20\xfe\x36\x70\x69\x43\
+\x12\x5c\x5c\x2f\x72\x20\x1e\xfd\x41\x2c\xe3\x01\xc5\x04\xc4\x03\
+\x16\x13\xa0\x35\x56\xf8\x41\xa1\xdf\x08\xb6\xc7\x4f\xe7\x03\x59\
+\xed\x6f\xcc\x6c\xa9\xee\x5b\xe4\x00\xd5\x72\x48\x1c\xa0\x3d\x5b\
+\xf4\x07\x79\x11\xf3\x5f\x2a\xfc\x0b\x65\x2e\xc2\xfe\x81\x58\x63\
+\xc6\x6b\x0a\x9e\xac\x31\x6b\x32\x2f\x55\x23\x3f\xe0\x73\x93\x69\
+\x5f\x34\xc7\xcd\xac\xa2\x76\xae\xc1\x6b\x2f\x1c\x7f\xf3\x0e\x33\
+\x10\xff\xbf\x37\x8b\x3f\xc6\xb5\x7b\xf2\x96\xc3\xa5\x8d\x29\x88\
+\xbf\x0c\x2e\x20\x07\x2e\xac\x4b\x60\x3c\xa0\x98\x80\x71\xa0\x3e\
+\x9a\xf1\xe0\x53\xd4\x82\x23\x98\x07\x14\xfa\x8f\x82\x86\x94\xc5\
+\xec\x8c\x58\x9d\xc8\x01\xd2\x02\xc1\x1f\x88\xb1\x61\xa1\x9a\x3f\
+\xa0\x7d\x5b\x65\xd4\x42\x68\x3c\xfc\xf2\xe0\x5f\x90\xe4\xc6\xf2\
+\x98\x54\x67\xb1\xc6\x6c\x88\x8a\x03\x4d\xf7\x90\xec\xcd\x9e\x9c\
+\x99\x6b\x6d\x24\xed\x23\x46\x2d\xee\x89\xf8\x9b\x6e\x2a\xf4\x33\
+\xfd\xcb\x8b\xc6\xdf\x62\x58\x7b\xfb\xe6\x6a\x7f\x09\xff\xf8\x65\
+\x66\x70\xb0\xd8\x1d\xae\x6c\x4a\x85\xcb\x1b\x93\xe1\x22\xd3\x01\
+\x19\xf7\x07\xc8\x03\x49\x07\x04\x0e\x90\xfe\x17\x05\x8c\x86\xf5\
+\x54\x0b\x9a\x6a\x8b\x1c\xb0\xe6\x75\xe0\xac\x67\x00\xf7\x07\xbc\
+\x8f\x98\xa5\x54\xe7\x2b\xf6\x0d\x2b\x8a\xb1\x81\x23\x8d\x07\xff\
+\xe3\xd8\xb7\x16\xfe\x45\x88\x3f\xd5\x18\xa6\xbb\xf2\x35\x0d\xd5\
+\x1c\x14\x3e\x0b\x87\xd7\x98\xf5\x57\x5b\xe3\x50\xd5\x19\x36\xad\
+\x29\x88\xb6\xed\x45\x33\x80\x37\x57\xb8\x99\xbc\xfe\xa2\xf1\xd7\
+\x36\xf7\x5d\xc4\xff\x50\x89\x07\x5c\xdd\x92\xc6\x39\xb0\x29\x85\
+\xf9\x02\x32\x55\x4c\x10\xcf\x38\x40\xb6\xb7\xd0\x05\x4a\x83\xc7\
+\xf1\xf3\x01\x19\x76\xac\x0e\x94\x6a\x40\xeb\x93\x16\x49\xfe\x80\
+\xea\x7b\xe8\x7c\x30\xf7\x07\x53\xa4\xbe\xb2\x25\x32\x47\x38\x73\
+\xe6\xcc\x4b\x81\xff\xd5\x2b\x97\x10\x7f\x77\xd5\xec\x03\x61\x0e\
+\x0a\xcd\x46\x4b\x76\x1e\xcc\xd7\xb7\x56\xa8\xd7\x98\x35\x8d\x0d\
+\xfb\xa8\xe5\x88\x46\x10\xbd\xc4\xa8\xcd\xe2\x7f\xb8\xd4\x0b\xae\
+\x6f\xcd\xd0\xe4\x80\xe8\x0f\xd6\x25\x32\x3b\x27\xf8\x83\xfd\x45\
+\x6e\x50\x1d\x39\x59\xaa\x0f\x27\x0e\x88\x35\xe1\xe2\x99\x90\xd5\
+\x42\xed\x6f\x25\xab\xff\x9f\x26\xf4\x0d\x9a\x02\x65\x29\x2e\xac\
+\x66\xbe\xcd\xe0\x6f\xd5\x55\x6b\xfe\x4f\x6b\xc8\xc5\x29\xee\x1a\
+\x67\x50\x18\x07\x28\x9f\x75\x6e\x52\x63\x26\xc4\x04\x62\x7e\x10\
+\xa7\x91\x1f\x98\x08\xf3\xb3\x11\x7f\xb7\xb6\x89\x7f\x63\x99\x37\
+\xdc\xd8\x96\x05\xd7\xb6\xa6\xc3\xb5\x2d\xe9\x70\x75\xb3\xa6\x0e\
+\x5c\x5c\x9f\x28\x68\x41\x02\x1c\x28\xf6\x80\x9a\xe8\x29\xac\x46\
+\x78\x9b\xc2\x89\x9f\x0f\x40\x2d\xa0\x5a\x60\xa6\x05\x54\x07\x2c\
+\xd4\x81\xd3\x39\x61\xf1\x6c\x68\x79\xc4\x34\xa8\x48\x73\x6b\x53\
+\xf8\x7b\x4c\x7b\x13\x1a\x56\x35\x3f\xc7\x9e\xf0\x2f\x49\xf5\x50\
+\xd5\x9d\x8b\x35\x66\x6a\xe7\x90\xc4\x98\x40\x63\x5e\xaa\x83\x58\
+\x63\xd6\x4f\xf0\x07\xa6\xcc\x1f\x10\x0f\xda\xda\xfb\x3f\x53\xe8\
+\xfd\x70\xa4\xdc\x07\x3e\xdb\x91\x8d\x1c\xc8\x44\x0e\x64\x08\x1c\
+\x20\x2d\x48\x61\x31\xc1\x25\x8a\x0b\x58\x6c\x28\x83\x83\x25\x9e\
+\xb0\x2a\xc6\x92\xd5\x83\x10\x07\x58\x4d\x20\xd5\x87\xb3\xba\x60\
+\xd1\x1f\xf0\xfe\x01\x8c\x03\xa4\x05\xb1\xbc\x9f\x5c\x55\x86\x07\
+\x9c\x6b\x45\xfc\x0b\x9f\x17\x7f\xcb\xd7\xa1\xa1\x26\xff\x29\xf8\
+\x7b\xb2\x73\xa9\xf2\x66\xce\x24\xaa\xd7\x1c\x4b\x35\x66\x4e\x03\
+\x35\x6a\xcc\xc4\x3d\x50\x56\x6f\x8a\xfe\x40\x17\xf8\x8f\x1f\x6f\
+\xf0\x5b\xcb\xe1\x86\xa1\xcd\xe2\x3f\x8a\xf0\xef\x07\x27\xaa\x03\
+\xe1\xe6\x0e\x39\x7c\xb6\x3d\x0b\x6e\xa0\x5d\x17\x39\xb0\x25\x15\
+\xae\xa0\x16\x5c\x11\x38\x70\x69\x7d\x12\x1c\x42\x5f\x51\x1b\x37\
+\x0d\xf6\x15\x79\x33\x0e\xec\xca\x77\x91\xce\x0c\x6d\xce\x72\x90\
+\xce\x8a\xad\x53\xf7\x07\x62\xdf\x88\x4c\xaf\x56\xc6\x3f\x06\xfc\
+\xe6\x74\x69\x71\x5d\xee\xb3\xf0\x2f\x4d\xf3\x82\x5c\x1f\x7e\xf6\
+\x40\xdc\xe3\xe2\xe7\x0f\x88\x03\x23\x19\x07\xf8\xf9\x03\x31\x3f\
+\x78\xb2\xc6\x4c\xcc\x11\xe3\x90\x03\x88\xff\xd6\xfc\x00\xa3\x37\
+\x5e\x24\xfe\x4f\x9b\xfb\x4d\xf8\xa7\x3a\xf5\x47\x5c\x13\xe1\xf6\
+\x2e\x39\xdc\xda\x99\x83\x3c\xc8\x66\x3c\x20\x0e\x70\x1e\xa4\xb1\
+\xb8\xe0\x32\xd3\x82\x14\x8c\xff\x7d\xa0\x3e\x7e\x3a\xdb\x0f\xde\
+\x5f\xec\xc5\x6a\xc3\xc4\x1a\x61\xe6\x0f\x72\x96\xf3\x73\xe4\x14\
+\x1b\xb2\xb3\x82\xd4\x53\x68\x21\x3f\x2b\x9c\xed\xd3\xaa\xf8\xd3\
+\xb9\x9c\x80\xf9\xdd\x85\x5a\xac\x76\xcf\xe4\xc1\xb3\xf0\x2f\xcf\
+\x0c\x80\x3c\xcc\x5b\xc5\xfd\x2d\xd5\x1c\x94\xd1\x6c\x6d\x9b\xce\
+\xa0\xa8\x9f\x43\xd2\xc8\x0f\x1c\xf9\xac\xcc\x04\x21\x47\xa4\x7d\
+\x24\xf4\xff\x27\x94\xfe\x26\xdd\xda\x12\xfe\x29\x84\xff\x46\x19\
+\xdc\xd9\x9d\xfb\x24\x07\xd0\x1f\x5c\xdf\x46\x1c\xc8\x60\x31\x01\
+\x59\x63\xb9\x2f\xac\x49\x98\x09\x47\x2a\x82\x04\x0e\x78\x0b\x67\
+\x06\x04\x7f\x80\x1c\xa0\xd8\x90\x69\x81\x18\x1b\x0a\xe7\x42\x6a\
+\x73\xfc\x5a\x15\xff\x62\x79\x1c\x04\x2f\xec\xc5\xf6\x5c\xd4\xeb\
+\x70\x7e\x09\xfe\x37\x6e\x5c\x87\xaa\xbc\x58\xc8\xf7\xff\x80\xad\
+\x5f\x68\x70\x80\xf5\x2a\x18\xc3\xe7\xe3\x91\x16\x78\x8c\x54\xcd\
+\x4b\x6d\x72\x0e\x49\xb6\x82\x9f\x43\x4a\x40\x0e\xe0\xfb\x7f\xba\
+\x2c\xa0\x5f\x8f\xb6\x86\xff\x95\x8d\x49\x70\x77\x4f\x1e\x72\x20\
+\x0f\x39\xa0\x40\x0e\xc8\x91\x03\x39\xc8\x81\x6c\x16\x17\x12\x0f\
+\xb8\x3f\x48\x47\xfc\x7d\xa0\x41\x36\x9b\xed\x0b\x1e\xad\x08\xe4\
+\x75\x21\x54\x23\x88\x5a\xb0\x5b\xa8\x13\xde\x99\x4b\x75\xe2\xe8\
+\x0f\x72\x1c\x58\x2f\x01\xc6\x81\x34\xf4\x07\x8a\x80\x56\xc5\xbf\
+\x44\x11\x0f\xa1\x36\xc6\x42\x5d\xde\x5b\xc2\x59\x0d\xed\x3a\xf0\
+\x74\xfc\x6f\x40\x75\x7e\xbc\x34\x0b\x87\xce\xa2\x89\x33\x30\xd4\
+\xfb\x14\xb0\x33\x28\x62\x4c\x20\xe6\x88\xac\xfe\x61\x88\x2a\x47\
+\x5c\xc1\xf3\x83\x36\x87\xff\x68\xae\xff\x57\x37\x25\xc3\xe7\x7b\
+\x95\x70\x77\x6f\x3e\xe3\x01\x71\x80\xf1\x60\x47\x0e\xe3\x01\xc5\
+\x04\x37\x98\x16\x64\xc2\xde\x7c\x27\x58\x9f\x3c\x97\xad\x05\xd3\
+\xbe\xf0\x91\x4a\x5e\x37\x7c\xb0\xcc\x97\x71\x80\xf9\x03\xa5\x1b\
+\x3b\x3b\xb6\x4d\x38\x3f\xca\xf2\x83\x8c\xa5\xb0\x36\x2f\xa8\x55\
+\xf1\x2f\x55\x24\x40\xc4\x12\x53\xa9\x2e\x4b\xac\x3b\xa6\xb3\x7b\
+\xcd\xf9\x03\xc2\x7f\x6d\x75\xde\x53\xf1\x2f\x0a\x9a\x28\x9d\x47\
+\x93\xe6\x62\xf9\x36\x3f\x27\xb1\x69\x9f\x02\xf5\x35\x43\x5a\x2f\
+\xca\x72\x79\xf1\xf8\x8f\xef\x69\xf0\x07\x0b\xf3\x0e\x99\xcd\xe1\
+\x3f\x6f\x5c\x27\xc8\x74\x79\x0f\xae\x6d\x4e\x81\x2f\xf6\x17\xc2\
+\xbd\x7d\x05\x8c\x03\x77\x88\x03\xcc\x1f\xa8\x6b\x41\x16\xcb\x11\
+\xf6\x2a\x57\xc0\x8e\x1c\x3b\xbe\x1e\x8c\x1c\xa0\x3d\xc1\xa3\xac\
+\x3e\x24\x50\xa8\x13\x54\x69\xc1\xce\x7c\x21\x3f\x90\xf3\xf3\xa3\
+\xeb\x94\xa1\xad\x8a\x7f\x59\x6e\x22\x44\xdb\xf7\x93\xd6\xdd\x83\
+\x16\x74\x65\x35\x59\xbe\xb3\x49\x0b\x9e\x3c\xaf\x43\xf8\x57\x15\
+\xa7\x6b\xc7\x5f\x99\xc0\xce\xa7\x4b\x73\xb1\xd8\x3a\xa6\xea\x4c\
+\x22\xad\x69\x8b\xe7\x90\xc4\xfc\x40\xbd\x4f\x01\x3f\x87\xa4\x8a\
+\x09\x74\x81\x3f\x9b\xfb\x6d\x6e\xb8\xa6\x39\xfc\xe7\x8f\x47\xfc\
+\x5d\x07\xe0\xbb\x9d\x0e\x5f\x1e\x28\xd2\xe0\x00\xe3\x01\xe3\x40\
+\x2e\xe3\x00\x8f\x0b\x72\x60\x5f\xc1\x4a\xd8\x83\x1a\x70\x6e\x6d\
+\xac\xb0\x27\x10\xc1\xea\x85\xa8\x36\x80\xea\x45\x0f\x33\x7f\xe0\
+\xcb\x6a\xc6\xd9\xb9\x11\x8c\x0d\xc5\xfc\x60\x7d\x41\x78\xeb\xe2\
+\x9f\x27\x83\x38\xf4\xb5\xe2\x9e\x7c\xa8\xb0\x17\xcf\xfc\x01\xd5\
+\x64\xcd\x32\xd4\xe0\x80\xc7\xb4\xd7\xa1\xb2\x30\x4d\x2b\xfe\x35\
+\x88\x3f\xad\x5d\xf2\x19\x18\x9f\x48\x67\xd4\x59\xaf\x0a\xa1\xf6\
+\x4d\xf4\x07\x62\x7e\x20\x9e\x4b\xa5\xb9\xb9\xe9\x82\x16\xf0\x73\
+\x48\x83\x75\x87\xbf\x96\xb9\xef\x84\x7f\xb6\xdb\x20\x78\x78\xb8\
+\x0c\xee\x1f\x2c\x41\x2b\x96\x38\xf0\xf9\x3e\x25\xfa\x04\xce\x81\
+\x3b\x82\x16\x90\xed\x2f\x74\x46\x0e\x38\xc3\x85\x75\x32\x5e\x33\
+\xc2\xea\x45\xa2\x58\x8d\xc0\xb1\x1a\xf4\x07\x55\xbc\x76\x58\xac\
+\x1b\x67\xb1\x21\xf9\x83\x7c\x67\xd8\x58\x14\xd1\xaa\xf8\x97\xe7\
+\xcb\xd0\xd7\x0e\x66\xf9\x36\xe7\x80\x91\x50\xab\xab\xe9\x0f\x44\
+\x0e\x3c\x13\xff\x82\x44\x7e\x46\x3d\x7c\xaa\xc0\x03\x9a\x7f\xa0\
+\xda\xcf\x10\xeb\x5d\xc4\x3d\x4e\xcd\x33\xea\xa3\xa4\x7a\xc8\x34\
+\x21\x47\xcc\x76\x31\x3b\xd5\xe6\xf0\x77\x1f\x0c\xdf\x1c\xaf\x42\
+\x0e\x94\xc2\x83\x43\x25\xa8\x03\xc5\x92\x16\x88\x1c\x60\xb1\x21\
+\x8b\x0f\x73\xe1\x40\x91\x0b\x9a\x2b\x5b\x0f\xa0\xbd\x42\x71\x6f\
+\x40\xe4\xc0\x09\xa1\x7e\x98\x71\x80\xf2\x83\x12\x7e\x6e\x80\x38\
+\xb0\xb9\x24\xaa\x55\xf1\xaf\xc8\x4f\x82\x24\xe7\x61\x2c\xef\x16\
+\xeb\xb4\x68\x0f\xa6\xe9\x39\x14\x3f\xa1\x36\xd7\xc3\xf2\x8d\xa7\
+\xe2\xbf\xaa\x50\xc6\xcf\xa8\x47\x8a\x73\x50\xa6\x70\x2d\x10\x7a\
+\x58\x89\x5a\x90\x47\xb1\x21\xeb\x59\x22\xe6\x88\x4d\xce\x24\xba\
+\xf1\x3e\x05\x59\xae\x7d\xef\x56\xf8\x60\x44\xd6\xd6\xf0\x3f\x51\
+\x03\x0f\x1b\xcb\x19\x07\x44\x1d\x20\x1e\x7c\xb1\xbf\x88\x6b\x01\
+\xc5\x86\x7b\xf2\x99\x11\xf6\xb4\x5f\x44\xf9\xc0\x95\x8d\xb4\x46\
+\x2c\xe3\xfb\x84\x6b\x62\xa5\x3d\x62\xa6\x05\xd5\xc1\x2c\x3f\x60\
+\xe7\xc9\x04\x7f\xb0\xa5\x2c\x01\xce\x9d\x3b\xdf\x7a\xf8\x2b\x93\
+\x21\xd5\x6d\x24\x5b\x7f\xe1\xb5\xe7\x7d\xa5\x7d\x18\xbe\x0f\xd7\
+\x53\xe5\x0f\xac\x3a\xb1\xb9\x0c\x55\x45\xcd\xfb\xff\xeb\xd7\xaf\
+\x23\xfe\x49\xbc\xaf\xa5\x5a\x4f\x43\xf1\x8c\x7a\xa1\x78\x46\x3d\
+\x50\x6d\x4e\xa2\xd4\xc7\x6c\xdc\x93\x7d\xcc\x90\x03\xd9\x2e\x7d\
+\x1f\x14\x79\xbd\xfb\x42\x7b\x80\x4d\x36\x6f\xff\x3a\xc6\x7f\x1b\
+\xb5\xe2\xef\x31\x18\x1e\x9f\x5c\x0d\x5f\x1d\xad\x84\x47\x47\xca\
+\x99\x2f\xe0\x3c\x28\x55\xd3\x82\x02\x89\x07\x07\x8b\x5d\xf9\x7e\
+\x11\xe6\x85\x94\x0f\x5e\xd9\x9c\x22\xec\x15\x0a\xf5\x63\x82\x16\
+\x50\x1d\x31\xcf\x0f\xf8\x79\xa2\x03\xa5\x7e\xb0\xb9\x32\x9d\xf5\
+\x81\x6d\x2d\xfc\x2b\x0b\x53\x20\xc3\x73\x8c\xb0\x2f\x33\x40\x75\
+\x2e\x51\x3a\x8b\xa4\xe9\x0f\x48\x07\xaa\x8a\x33\x9a\xc5\x9f\xce\
+\x07\xad\x46\xfc\x59\x8f\x5b\x69\x1f\xcb\x52\xda\xcb\x2a\x56\x9b\
+\x91\xa7\xea\x63\xd6\xa4\x87\x95\xc6\x19\xf5\x91\x88\x7f\xbf\x17\
+\x8e\x3f\xcd\xfd\x9e\x6a\x6e\x78\xbe\x39\xfc\x6d\x3e\xea\x0c\xb9\
+\x5e\x43\xe0\xbb\x4f\x6b\xe1\xeb\x63\x55\xf0\xd5\xb1\x4a\xe4\x41\
+\x39\x3c\x42\x2d\x78\x20\x70\x40\xa5\x05\x14\x17\x14\xe2\xbb\xef\
+\xce\xf6\x0b\x28\x26\x14\xd7\x09\x69\x8d\xf8\xb2\xb0\x47\xa0\xd2\
+\x82\x28\x96\x23\x4a\xb1\x21\x6a\xc1\x96\xaa\x4c\xf8\x0c\x9f\x6b\
+\x6b\xe1\x5f\x85\x5a\x9e\x8d\xef\x9e\x54\x77\xbc\x52\x38\x87\xb2\
+\x4c\x38\x97\xb8\xb4\x8f\x86\x3f\x08\xc4\xdc\xa0\xba\x38\xb3\x59\
+\xfc\xe9\xff\x8f\xf0\xa7\xfd\xab\x6a\x61\xfe\x81\x58\xd7\xc0\x7a\
+\x99\x69\xf4\xb0\xd2\xec\x59\xc2\xfa\xd6\xf8\x35\xcd\x11\x47\x41\
+\xb6\xeb\x8b\xc7\x5f\x38\xfb\xfb\xc4\xdc\x77\x32\xdb\x09\x9d\x21\
+\xcf\x7b\x28\xfc\xed\x74\x3d\xc6\x00\xd5\xf0\x0d\x72\x80\xf1\xe0\
+\x68\x05\xe3\x00\x69\xc1\x83\x43\x62\x5c\x50\xc4\x6c\xa7\x7c\x29\
+\x1c\xaf\xf2\x67\xbe\xe0\x16\xc6\x83\xb4\x46\x74\x7d\x2b\xad\x0f\
+\xa9\xf6\x0c\xd5\xfd\xc1\x29\xc9\x1f\x84\xc0\xb6\x9a\xec\x56\xc5\
+\xbf\xba\x28\x0d\xe4\x7e\x1f\xf2\xb8\x8b\x62\x2e\x21\xf7\x4a\x14\
+\xd6\x61\xc5\xbd\x79\xee\x0f\x88\x03\xdd\xa0\xa6\xe4\x29\xf8\x17\
+\x25\xb1\x3a\x57\x9a\x87\x53\x2d\xcd\xc0\x98\xa1\x31\x23\x4f\x9a\
+\x99\x1a\xa2\x9a\x93\xa8\x0c\x98\xa0\x9a\x95\xe9\x27\xae\x17\x61\
+\x5c\xe8\x36\x40\x27\xef\xbf\x36\xfc\x17\x23\xfe\x15\x61\x1f\x31\
+\xfc\xbf\xc5\x18\x80\x8c\x78\x40\x1c\x78\x44\x1c\x20\x7f\xd0\x58\
+\x26\xe4\x07\xc5\x2c\x36\xd8\x9e\xb5\x18\x71\x0d\xe3\x79\x22\x72\
+\x40\x5c\x27\xe2\xeb\x84\x5c\x0b\xd4\xfd\xc1\xd9\x35\x31\x3c\x36\
+\x44\x2d\xd8\xbe\x4a\xde\xaa\xf8\xd7\xa0\x2f\xcf\x0b\x98\x28\xf4\
+\x0d\x1c\x25\xf5\x87\x52\x3f\xa7\x1e\x2f\xf8\x03\xc6\x01\xf4\x05\
+\x35\x25\x59\x5a\xf1\xaf\x2d\x4a\xe6\xfb\x97\xe2\xfc\x03\xb5\x79\
+\x38\x7c\x46\x9e\xfa\x7c\x34\xf5\x39\x89\x13\xa5\x1e\xb7\x79\xea\
+\x1c\x68\x83\xf8\xaf\x8a\x9e\x02\x7f\x3f\xd3\x80\x3e\x60\x35\x8b\
+\x03\x1e\x9f\xe4\x1c\x60\x3c\xa0\x98\x80\xf1\xa0\x82\xf9\x03\xe2\
+\xc1\x4e\xf9\x12\x7c\xdf\xd3\xa4\x5c\x91\x71\x60\x77\xae\x86\x3f\
+\xa0\xbd\x63\xbe\x67\x9c\x08\x17\x1a\x12\x78\x4c\x80\x5a\xb0\xbd\
+\x56\xd1\xba\xf8\xa3\x2f\x2f\x08\x9e\x2c\x3d\x6f\x31\xf6\x6a\x7a\
+\x0e\x45\x3a\x97\x68\x6b\x04\xab\x4a\xb3\xb5\xe3\x5f\x9c\x02\xb5\
+\xd4\xdb\x54\x30\xb1\xdf\xb5\xd4\xe3\x56\xf4\x07\xc8\x81\xb2\x30\
+\x0b\xce\x81\xd0\x49\x52\x7e\xa0\x14\xcf\xc8\x05\xf0\xfc\xa0\x4d\
+\xe2\x1f\x33\x05\xfe\x71\xae\x01\xfe\x7a\xaa\x0e\xad\x56\xe0\xc1\
+\x2a\xd4\x02\xce\x01\x1e\x13\x54\xb2\xfc\x80\xf4\x60\x17\xea\xff\
+\xcd\x1d\x59\xec\x6b\xd1\x2f\x50\x9e\x28\xae\x1b\xb3\xf5\x62\xb6\
+\x5f\xc0\xf7\x0c\xa9\x9e\x90\xea\x46\x68\xad\x60\x57\x5d\x5e\xab\
+\xe2\xbf\xaa\x54\x0e\xc5\x51\x73\xa0\x20\x64\x0a\x7b\xde\x72\xd2\
+\x5c\x2f\x5e\xb7\x21\xee\xd3\xaa\x62\x43\xe4\x00\xc6\x03\xab\xcb\
+\x72\xb4\xe2\x5f\x57\x92\x0e\x75\x32\xcd\xde\x96\xda\xfa\x9b\x3e\
+\xd9\xd3\xb0\x69\x7e\xf0\x01\xc8\x3d\x06\xfe\xb5\xd8\xe7\xdd\xe1\
+\x2f\x12\xff\xa9\xc3\xff\xf8\xb6\x85\xb9\xe1\x23\x6d\xfe\x7f\x55\
+\xcc\x54\xf8\x9f\xf3\xeb\xe1\x6f\x67\xd6\xa0\x1f\xa8\x63\x3c\xe0\
+\x3a\xb0\x4a\xa5\x03\x2c\x26\xa8\x64\x5c\xd8\x95\x6b\xc7\xf6\x09\
+\xe9\xfb\xa4\x0b\x0f\x0f\x97\x48\xf1\x21\xe5\x07\x7c\xcd\xb8\x39\
+\x7f\x20\x83\x3d\x6b\xf2\x5b\x0d\x7f\x3a\xe3\x7b\xf8\xd0\x01\xd8\
+\xb5\xa5\x01\xb6\xac\xab\x86\xb5\xd5\x4a\xa8\x2d\x49\x83\x9a\xfc\
+\x18\x28\xcf\xf0\x86\xa2\x78\x07\x56\x7f\x9e\xe5\x3b\x11\xd2\x3d\
+\xde\x87\x14\x57\xcc\x13\x9d\x06\x43\x6d\xb9\x42\x3b\xfe\xe5\x72\
+\x58\x93\x62\x2b\xcd\x42\x51\xcd\x3f\xb0\xd2\xf0\x07\x1a\x33\xf2\
+\xc4\x1e\xb7\x61\xaa\x1e\xb7\x85\xc2\xba\xb1\xdc\x63\x10\x94\xf9\
+\xf5\x1f\xff\x22\xf1\xd7\x3e\xf7\xbd\x23\xd8\x7f\xd2\x05\xea\xe3\
+\x2d\xe1\x87\x4b\x9b\x51\x03\xd6\xc1\x3f\xce\xae\x45\x5f\x50\x2f\
+\xe8\x40\x2d\xe3\x81\x14\x13\x1c\xc7\xd8\x10\x3f\x77\xe7\xda\x23\
+\xce\xb9\x12\x3f\xbe\x22\x0e\x34\x96\x31\x2d\xa0\xf5\x02\xe2\xc0\
+\x1d\xc9\x1f\x64\xab\xf9\x83\x14\xd8\xbb\xb6\xa0\xd5\xf0\x17\x4d\
+\xbd\xd7\x37\xf5\x78\xa6\xf3\xfc\xd7\xae\x5d\x87\xb3\xe7\xce\xc3\
+\xa7\xa7\x78\x1f\xa1\x7d\xfb\xf6\xc2\xb6\x4d\x6b\x58\xed\xd7\xb6\
+\x2d\x1b\xb4\xe2\x5f\x5f\xa1\x80\x86\xb4\xa5\x42\xaf\x63\x91\x03\
+\xf3\x35\xfb\x9b\xaa\xcd\x47\xab\x60\x75\x6e\x6a\x3d\x6e\x9b\xf4\
+\x39\xa6\x73\xb3\x6d\x01\x7f\x0b\xfa\x34\x37\x04\xc7\xa9\x5d\x41\
+\xe9\x33\x04\xb6\x67\xdb\xc2\xbe\x22\x0f\x8c\xd3\x43\xe0\x22\xe2\
+\x74\x73\x4f\x21\xdc\xa7\xd8\x9f\xd6\x02\x1a\x11\xdf\x23\x14\x07\
+\x10\xfe\x35\x88\xff\x32\xb6\x1e\x40\x31\xa3\xc8\x0f\x31\x67\xa0\
+\x18\x81\xf9\x03\x61\xbd\x48\xdd\x1f\xd0\x5a\xc1\xbe\x86\x22\xf8\
+\xec\xb3\xd6\xc5\xbf\x25\x46\x7d\x84\x48\x2f\x08\x63\xe2\x88\x36\
+\x7f\x42\xf8\xaf\x4b\xb3\xe3\xfd\x4d\x53\x54\x1c\x90\xe6\xe1\xc4\
+\xcf\xd3\x98\x81\x21\x6a\x41\xb9\xba\x3f\x10\x66\x60\x28\x03\xc6\
+\xff\x9c\xed\x6a\xf6\xf7\x52\xff\x7e\xe6\xba\xc2\x9f\xfa\x3d\xd0\
+\x99\xaf\x59\x63\x3a\xc2\xf2\x29\x5d\xd9\x7a\x88\xcc\xc1\x04\x92\
+\x96\x9b\x40\x8a\xa3\x09\xa4\x0a\x96\xe6\x68\x04\x19\x6e\x03\x41\
+\xe1\x3f\x1e\xca\x63\x66\x40\x5d\xba\x1d\x6c\x55\x7a\xc1\xbe\xca\
+\x70\xfc\x9d\x67\xc2\xb1\x0a\x6f\xb8\xb4\x3e\x16\xae\x6e\x92\x61\
+\xec\x9f\x81\xef\xbb\x9c\x71\x82\x62\xc2\x47\xe8\x27\x28\x67\x14\
+\x79\x40\x35\x05\xb7\xd0\x5f\xdc\x40\x2d\xd8\xbf\xbe\xb8\x4d\xe0\
+\xdf\x12\x13\xf1\x5f\x9f\xb1\x8c\xcf\x3f\x10\xfb\x9e\x53\x7f\xd3\
+\x64\x3e\x1f\xad\x4e\x6d\x3e\x5a\x75\xdc\x6c\xa9\xee\x5d\x7d\xfe\
+\x01\xe5\x07\x45\x41\x1f\x63\xec\xd7\xff\x6f\x72\x97\x3e\xde\xf9\
+\x8e\x06\xff\xfd\xa2\xf1\xb7\x30\xe7\xef\xfb\x6c\xc4\xdd\xc9\xa2\
+\x2b\x5b\x0b\x8d\x59\x6a\x0c\xd1\x4b\x4c\x04\x33\xd6\x30\xfa\xb3\
+\x58\xc1\xe2\xec\x8c\x21\x1e\x2d\xd1\xde\x18\x64\xcb\x7b\x43\xf2\
+\xf2\x3e\x68\x26\x90\xe1\xdc\x17\xfd\xd9\x00\xd4\x8f\x61\x50\xe8\
+\x3f\x02\x4a\x82\xde\x67\x7d\xe4\x6a\xa2\x26\xc0\xba\xa4\x59\xb0\
+\x39\x7d\x01\xdb\x2b\x3c\x5c\xea\x09\x27\x6b\x82\xd9\x5e\xc1\x5e\
+\xf6\xfe\xbf\x1c\x73\x63\x19\xfe\x95\xb9\xb0\x31\x6b\xb9\xc6\xfc\
+\x03\x36\x1b\x4b\x6d\xfe\x01\x9b\x91\x97\x88\xf9\x41\x5c\x93\xf9\
+\x07\x51\x7c\x7e\x72\x71\xc8\x04\x90\xbb\xbf\xfb\x0f\xb9\x8b\xa9\
+\xc7\xde\x08\x83\xdf\xbe\x48\xec\xe9\x9a\x85\xf8\xcf\x79\xff\x2d\
+\x58\x89\xb8\x47\x2d\x36\x62\x98\x8a\xb8\xc7\x2c\x6d\xb9\x35\xc7\
+\x13\xd1\x18\x4f\x96\x72\x9e\x24\x2c\x33\x81\xc4\x65\xa4\x29\xc6\
+\x90\xe4\xc0\x2d\x79\x39\xf5\x01\x35\x83\xe2\xac\x70\x38\x7e\xfc\
+\x04\x5c\xbc\x78\x11\x7d\xf2\x35\xb6\xc7\x42\x3d\xfe\x3e\x17\x7a\
+\xb5\x90\x2e\xb7\x95\x19\x3f\x84\xff\x1a\xc4\x7f\x53\xb6\x63\x93\
+\x59\x28\xcd\xcd\x3f\x98\xcf\xe7\x1f\x68\xe4\x07\xe8\x0b\x30\x0e\
+\xc8\xf5\x1a\xf4\x43\x8e\x8b\xa9\x2c\xdf\xb1\xf3\x1f\x5f\x34\xf6\
+\x74\x45\xcc\xe8\xf9\x66\x94\xed\x3b\x35\x88\xc9\xce\x04\xfb\xde\
+\x17\x63\xed\x4c\xee\x44\x2f\x35\xbe\x8f\xb8\x3d\x42\xfb\x0e\xed\
+\xef\xd1\xb6\xc6\xdf\xc7\x2c\x31\xfe\xd7\xf3\xf0\x41\x83\x1b\x12\
+\x3f\x9a\x9a\x31\x44\x2e\xe9\x03\x21\x4b\x87\x80\x9f\x93\x15\x64\
+\xa4\xc9\xa0\xb4\xb4\x94\x59\x75\x75\x35\xd4\xd6\xd6\x42\x43\x43\
+\x03\x6c\xd8\xb0\x01\xb6\x6c\xd9\x02\xdb\xb7\x6f\x87\x9d\x3b\x77\
+\xc2\xe1\xc3\x87\xe1\xe8\xd1\xa3\xec\xac\xd0\xe5\xcb\x97\x19\x4f\
+\xee\xdd\xbb\x27\xf5\xde\x57\xef\xe9\xd3\x5a\x33\x06\x39\xfe\x79\
+\xb0\x39\xc7\x49\xe8\x77\xcd\x39\xb0\x21\x43\x35\x1f\x8d\xd7\xb6\
+\xf2\xb3\x4f\x75\x89\xaa\xf9\x68\xab\x13\xe6\x40\x25\x6a\x3f\x61\
+\x2f\x77\x33\x4b\xca\x71\xee\xa7\xb3\xb9\x9f\xcd\x5d\xa8\xef\xdd\
+\xa3\x6d\x7a\x0d\x8c\x5d\xfa\xce\xb4\x58\x3b\x63\xdb\x18\x3b\x23\
+\x7f\xfc\x5e\x3a\xe2\x55\x1c\xbd\xc4\x68\x1d\x7e\x6e\x47\x3b\x81\
+\x9c\xb8\x82\x9f\x0f\xf0\xf3\x9f\x2d\xe7\x03\xf9\x0f\x23\x08\x5d\
+\x6c\x06\x01\x4b\x47\x43\x80\xbb\x2d\xc4\xc4\xc6\x43\x6e\x6e\x2e\
+\xe4\xe7\xe7\x43\x5e\x5e\x9e\x56\x53\x2a\x95\x50\x54\x54\x04\xc5\
+\xc5\xc5\x8c\x23\x65\x65\x65\x50\x59\x59\x09\x55\x55\x55\xcc\x88\
+\x2f\xeb\xd7\xaf\x87\xad\x5b\xb7\xc2\xde\xbd\x7b\xe1\xc8\x91\x23\
+\x70\xe2\x04\xd7\x13\xe2\x09\xed\xd9\x91\x9e\x50\xcc\x4f\xf8\x89\
+\x33\xa1\x7e\x89\x9e\xd0\xff\x7e\x6d\x55\x1e\x6c\x51\x38\xab\xcd\
+\x42\x59\x26\xcc\x47\x5b\xaa\x36\xff\xc0\x46\x9a\x81\x21\xe6\x07\
+\x35\xb1\xb3\x10\xfb\xc1\xff\x87\x9a\xaf\x6c\x6b\xd8\x3f\xeb\x4a\
+\xb6\xe9\xf4\xa7\x84\x45\x3d\xda\x25\x3a\x98\x74\x4b\x5d\x66\x6c\
+\x92\xba\xa2\xf7\xc0\x64\xc7\xde\x23\x12\x96\x19\x7f\x80\xdc\x58\
+\x10\xbb\xd4\xc4\x39\xce\xde\x38\x3d\xde\xce\x44\x19\x6f\x6f\xb2\
+\x2d\xc1\xde\xe4\x2c\x7e\xde\x41\x9e\x7c\x19\xb5\xc4\xe4\xdb\x10\
+\xdb\xf7\x7e\xf2\x59\x36\x05\x42\x03\xdc\x21\x2d\x2d\x15\x14\x0a\
+\x05\xc3\xbd\x25\xf6\x34\x6e\x88\x3f\x43\x1c\x29\x28\x28\x80\xc2\
+\xc2\x42\x66\xc4\x95\x92\x92\x12\xa8\xa8\xa8\x80\x9a\x9a\x1a\xa8\
+\xaf\xaf\x87\x75\xeb\xd6\xc1\xa6\x4d\x9b\x98\xa6\xec\xd8\xb1\x83\
+\x71\x85\x34\xe5\xd4\xa9\x53\x70\xfe\xfc\x79\x89\x27\xa2\x9e\x88\
+\xf3\xc3\x48\x4f\xc4\x3e\x61\x0c\x7f\x7c\xff\xb7\xca\x57\xb2\xf9\
+\x17\x8c\x03\xc2\x59\x27\xc9\x1f\xa4\x2d\x55\xf3\x07\x8b\x58\x9d\
+\x3b\xbd\xfb\x05\xbe\xe6\xff\xca\x75\x37\x5b\x95\xef\xdd\xc7\x50\
+\xd7\x78\xbe\xa8\x2b\xd6\xb1\x47\x67\xff\xa5\x23\x26\xfa\xf9\x78\
+\x57\xc9\x15\x8a\xcd\x88\xd3\x51\xc4\xeb\x0c\x62\xf7\x39\x7e\x7e\
+\x8b\x9f\x3f\xb7\x94\x07\xcf\x63\xcf\xe2\x0c\x71\x45\xe4\x08\x69\
+\x0a\xf1\x44\xd4\x14\xf2\x41\x6b\xd7\xae\x65\x5c\xd9\xbd\x7b\x37\
+\x1c\x3a\x74\x88\xe9\xc9\xb9\x73\xe7\x98\xd5\x95\x65\x40\x65\xd4\
+\x14\xa8\x8e\x9c\x04\xb5\x71\xd3\xa1\x2e\x61\x16\x9b\x93\xbb\x36\
+\x69\x3e\xe2\xbd\x40\x98\x7b\x60\x83\x71\x01\xe7\xc1\x9a\xa4\x05\
+\x18\x0b\x8f\xfc\xbf\x1c\xe7\x3e\x6b\xcb\x7d\x8c\xde\xd2\x35\x26\
+\xba\xb8\xf0\x9d\xfb\x3d\x3e\xe3\xd7\xf1\xd9\x76\xc1\xe7\xdc\x13\
+\x3f\xdf\xc5\x67\x3d\x14\xbf\x1e\x87\x98\x4c\x43\x3c\x1c\xd1\x42\
+\x50\xe7\xb3\xd0\x36\xa0\xed\x46\xbb\x43\x3c\x41\x7b\x80\xf6\x0d\
+\xda\x63\xc4\xee\x9f\xf8\xf9\x3d\xda\x4f\xad\xc1\x0d\x91\x1f\xa4\
+\x27\x4d\x35\x85\xb8\x52\x52\x8c\x5f\x67\x45\x42\x92\xd3\x00\x96\
+\x1f\x53\xce\x93\xe6\x64\x0a\x99\xce\xfd\x40\xee\xd6\x1f\x14\xee\
+\xef\x91\x7f\x87\x3c\xef\xc1\x42\x0e\x34\x0a\x94\xbe\xc3\x7e\x94\
+\xbb\xf5\xdd\xf6\x6b\xc5\xfe\xdf\xb9\x22\x22\x22\x7e\x97\x93\x93\
+\x63\x82\x98\xbc\x8f\x78\x58\x22\x1e\xae\xf8\x75\x10\x7e\xad\x40\
+\xac\xca\xd1\x36\xe2\xfd\x1e\xfc\x3c\x8d\x76\x1d\xed\xd1\xbf\xc3\
+\x0d\x6d\x7c\x91\x67\x24\x42\x46\x8c\x3b\xc8\x7c\xa6\x41\x34\xeb\
+\x05\x6c\xf4\xd4\xbc\x27\xde\x9e\xe5\xc6\xff\x9b\xec\x60\xf2\x69\
+\x9a\x63\x6f\x45\xee\x0a\xd3\x5e\xba\x7e\x96\xaf\xda\x85\x71\xdf\
+\x6b\xf8\x5e\xfe\x05\x31\x32\xc4\x98\xb0\x07\xea\x8b\x29\xea\xc9\
+\x20\xd4\x95\xf7\x51\xdb\x3f\x42\x8e\x2c\x47\xf3\xc4\x9f\x49\x47\
+\x2d\xa9\xc1\xcf\x6d\xf8\x79\x19\x7f\x9e\x74\xe5\xbe\xc0\x95\xc7\
+\x68\x7f\x13\x34\xe5\x5f\x02\xde\x3f\xe7\xe5\x2a\x7e\x90\x67\xa5\
+\x7d\x9f\x11\xe7\xf5\x53\xa2\xe7\x64\x88\x75\x1c\xa2\x91\xeb\x36\
+\x9f\xef\x18\xff\x88\x71\xee\xe3\x28\x8c\x8f\xe3\xec\x4c\x52\xa3\
+\x96\x18\x7d\x9c\x82\x31\x75\x84\x81\xc1\x7f\xe9\xfa\x59\xe9\x2f\
+\xcd\x0b\x79\xd1\x0d\x73\x8f\x81\xa8\x27\x53\x11\x6f\x1b\xbc\x0f\
+\x40\x4b\x41\xfc\x8b\xf1\xbe\x5a\x91\x11\x1f\x96\xe8\x32\x36\x28\
+\x7a\x71\x0f\x45\xb4\xad\x51\x39\xe6\x3a\x1b\xf1\x9d\xdf\x83\x18\
+\x9f\xc6\xcf\xeb\x42\x9e\xfc\x13\x5f\x03\x31\xfe\x07\x7e\xaf\x11\
+\x7f\x4e\x19\xbb\xc4\xc8\x22\x62\xae\xc1\xef\x74\xfd\xfb\xe9\xaf\
+\x5f\x7e\x21\x07\x34\xd6\x62\xe7\xce\x35\x78\x4d\x66\xdf\xe1\x2f\
+\x29\x8e\x9d\x0d\x33\x1c\x8d\x7a\xc8\xec\x7b\x99\x26\x39\xf4\x1e\
+\x94\xe2\xd8\xe7\xfd\xd4\xe5\x26\xe3\x29\x0f\xa2\x38\x37\x22\x42\
+\xff\x9e\xeb\x2f\xfd\xa5\xbf\xf4\x97\xfe\xd2\x5f\xfa\x4b\x7f\xe9\
+\x2f\xfd\xa5\xbf\x5a\xf7\x82\x56\xbf\x7e\x8e\xd0\xbc\xff\xb1\xc9\
+\xdf\xf9\x83\x41\x4f\x8d\xfb\xef\x0c\x0c\xc6\xab\xdf\xdf\x36\x30\
+\x78\x4d\xfd\x3e\x12\xff\xd5\xbf\x6f\x72\x6f\xa0\xf6\x77\x34\xfd\
+\xbd\xf8\xfd\x1b\x4d\xee\x55\x7f\x87\x70\xff\x5a\x93\x7b\xe9\xef\
+\x90\x1e\x55\x44\x93\x7b\x83\xa6\xf7\x6f\x34\xb9\xe7\xbf\x98\xda\
+\xfd\x6b\x4d\xee\x0d\x5a\x70\xff\xb3\xfe\xfe\xd5\xbd\x8f\x78\xf5\
+\xee\x7f\xfc\x35\xdf\x8f\x6f\xfd\xfb\x1f\xf4\xf7\xff\xb9\xfb\x88\
+\x26\xf7\xa0\x79\xff\x1b\xd2\xe3\x7d\xaa\x7b\xee\x23\x22\xa5\x7b\
+\xc1\x45\x48\xaf\x80\xe8\x64\xc4\x9f\xe8\x29\xdc\x8b\x3f\x31\x5e\
+\xbc\x17\x50\x8d\x00\xd5\xf5\x83\xa6\x57\x03\xf8\xbe\x89\x5f\x6c\
+\x9d\xeb\xff\x03\x91\x6b\x46\xfb\
+\x00\x01\x08\x3e\
+\x00\
+\x00\x01\x00\x01\x00\x80\x80\x00\x00\x01\x00\x20\x00\x28\x08\x01\
+\x00\x16\x00\x00\x00\x28\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\
+\x00\x01\x00\x20\x00\x00\x00\x00\x00\x00\x08\x01\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xff\xff\xff\x03\xe9\xe9\xe9\x5d\xf1\xf1\xf1\x5f\xf4\xf4\xf4\
+\x5f\xf6\xf6\xf6\x5e\xf5\xf5\xf5\x66\xf5\xf5\xf5\x6a\xf5\xf5\xf5\
+\x6a\xf5\xf5\xf5\x6a\xf5\xf5\xf5\x6a\xf7\xf7\xf7\x69\xf5\xf5\xf5\
+\x71\xf4\xf4\xf4\x77\xf4\xf4\xf4\x77\xf4\xf4\xf4\x77\xf4\xf4\xf4\
+\x77\xf6\xf6\xf6\x77\xf4\xf4\xf4\x7d\xf7\xf7\xf7\x84\xf7\xf7\xf7\
+\x84\xf7\xf7\xf7\x84\xf7\xf7\xf7\x84\xf7\xf7\xf7\x84\xf7\xf7\xf7\
+\x89\xf8\xf8\xf8\x92\xf8\xf8\xf8\x92\xf8\xf8\xf8\x92\xf8\xf8\xf8\
+\x92\xf8\xf8\xf8\x92\xf8\xf8\xf8\x94\xf8\xf8\xf8\x9c\xf8\xf8\xf8\
+\x9c\xf8\xf8\xf8\x9c\xf8\xf8\xf8\x9c\xf8\xf8\xf8\x9c\xf8\xf8\xf8\
+\x9e\xf7\xf7\xf7\xa7\xf7\xf7\xf7\xa7\xf7\xf7\xf7\xa7\xf7\xf7\xf7\
+\xa7\xf7\xf7\xf7\xa7\xf8\xf8\xf8\xa7\xf9\xf9\xf9\xb1\xf9\xf9\xf9\
+\xb1\xf9\xf9\xf9\xb1\xf9\xf9\xf9\xb1\xf9\xf9\xf9\xb1\xf9\xf9\xf9\
+\xb1\xf8\xf8\xf8\xbc\xf9\xf9\xf9\xbc\xf9\xf9\xf9\xbc\xf9\xf9\xf9\
+\xbc\xf9\xf9\xf9\xbc\xf9\xf9\xf9\xbc\xf9\xf9\xf9\xc5\xf8\xf8\xf8\
+\xc7\xf8\xf8\xf8\xc7\xf8\xf8\xf8\xc7\xf8\xf8\xf8\xc7\xf9\xf9\xf9\
+\xc6\xfa\xfa\xfa\xce\xfa\xfa\xfa\xd0\xfa\xfa\xfa\xd0\xfa\xfa\xfa\
+\xd0\xfa\xfa\xfa\xd0\xf8\xf8\xf8\xd0\xf9\xf9\xf9\xd7\xf9\xf9\xf9\
+\xda\xf9\xf9\xf9\xda\xf9\xf9\xf9\xda\xf9\xf9\xf9\xda\xec\xec\xec\
+\xda\xe8\xe8\xe8\x86\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xff\xff\xff\x02\xe5\xe5\xe5\xe0\xf7\xf7\xf7\xff\xfe\xfe\xfe\
+\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\
+\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\
+\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\
+\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf6\xf6\xff\xf4\xf4\xf4\
+\xff\xf4\xf4\xf4\x75\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf8\xf8\xf8\xba\xf6\xf6\xf6\xff\xd9\xf5\xef\
+\xff\xc0\xf1\xe6\xff\xc1\xf2\xe8\xff\xc2\xf2\xe9\xff\xc2\xf3\xeb\
+\xff\xc3\xf4\xeb\xff\xba\xf2\xea\xff\xba\xf3\xea\xff\xba\xf4\xec\
+\xff\xb9\xf5\xec\xff\xb9\xf5\xed\xff\xb9\xf7\xef\xff\xb0\xf6\xef\
+\xff\xb0\xf7\xf0\xff\xb0\xf7\xf1\xff\xb5\xf8\xf3\xff\xb6\xfa\xf5\
+\xff\xb7\xfa\xf6\xff\xb2\xfb\xf7\xff\xb2\xfc\xf8\xff\xb3\xfd\xf9\
+\xff\xb4\xfe\xfa\xff\xb4\xff\xfc\xff\xb4\xff\xfd\xff\xb0\xff\xfe\
+\xff\xb0\xff\xfe\xff\xb0\xff\xff\xff\xb1\xff\xff\xff\xb1\xff\xff\
+\xff\xb1\xff\xff\xff\xa8\xff\xff\xff\xa8\xff\xff\xff\xa8\xff\xff\
+\xff\xa7\xff\xff\xff\xa0\xff\xff\xff\x9e\xff\xff\xff\x94\xff\xff\
+\xff\x94\xff\xfe\xff\x93\xff\xfc\xff\x97\xfe\xfc\xff\x97\xfe\xfa\
+\xff\x93\xfc\xf9\xff\x89\xfc\xf6\xff\x88\xfa\xf5\xff\x87\xf9\xf3\
+\xff\x85\xf7\xf1\xff\x84\xf6\xef\xff\x7f\xf5\xed\xff\x76\xf3\xe9\
+\xff\x75\xf2\xe7\xff\x74\xf0\xe4\xff\x72\xef\xe0\xff\x71\xec\xdd\
+\xff\x6b\xea\xd9\xff\x63\xe7\xd5\xff\x62\xe5\xd1\xff\x61\xe3\xcf\
+\xff\x60\xe1\xcb\xff\x5f\xdf\xc8\xff\x59\xdc\xc3\xff\x52\xd9\xbe\
+\xff\x52\xd7\xbc\xff\x51\xd5\xba\xff\x50\xd4\xb7\xff\x50\xd2\xb5\
+\xff\x49\xcf\xaf\xff\x47\xcc\xaa\xff\xef\xfa\xf8\xff\xfd\xfd\xfd\
+\xff\xf6\xf6\xf6\x57\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf7\xf7\xf7\x90\xff\xff\xff\xff\x8f\xe4\xd1\
+\xff\x0b\xc4\xa1\xff\x12\xcc\xaa\xff\x14\xce\xae\xff\x17\xd0\xb3\
+\xff\x19\xd3\xb5\xff\x1c\xd6\xb9\xff\x1e\xd9\xbf\xff\x20\xdd\xc4\
+\xff\x1b\xde\xc5\xff\x19\xde\xc8\xff\x1c\xe3\xcd\xff\x1e\xe5\xd2\
+\xff\x20\xe8\xd7\xff\x22\xea\xda\xff\x31\xee\xe1\xff\x35\xf0\xe5\
+\xff\x37\xf1\xe8\xff\x3a\xf4\xeb\xff\x3c\xf7\xee\xff\x3f\xfa\xf1\
+\xff\x41\xfb\xf3\xff\x42\xfd\xf6\xff\x45\xfe\xf9\xff\x48\xff\xfb\
+\xff\x4a\xff\xfd\xff\x4b\xff\xff\xff\x4d\xff\xff\xff\x4e\xff\xff\
+\xff\x4e\xff\xff\xff\x4e\xff\xff\xff\x4e\xff\xff\xff\x4e\xff\xff\
+\xff\x47\xff\xff\xff\x3c\xff\xff\xff\x3c\xff\xff\xff\x3c\xff\xff\
+\xff\x3b\xff\xfd\xff\x39\xff\xfc\xff\x43\xfe\xfa\xff\x42\xfe\xf8\
+\xff\x40\xfc\xf4\xff\x3f\xfb\xf2\xff\x3d\xf8\xef\xff\x39\xf6\xec\
+\xff\x37\xf3\xe8\xff\x34\xf2\xe5\xff\x31\xef\xe2\xff\x2f\xed\xde\
+\xff\x2c\xeb\xda\xff\x2a\xe8\xd7\xff\x26\xe5\xd3\xff\x24\xe3\xce\
+\xff\x22\xe0\xca\xff\x20\xde\xc7\xff\x1e\xdb\xc2\xff\x1c\xd9\xbf\
+\xff\x1a\xd7\xbb\xff\x19\xd5\xb7\xff\x18\xd2\xb4\xff\x17\xd1\xb1\
+\xff\x17\xce\xae\xff\x16\xcc\xab\xff\x14\xcb\xa8\xff\x13\xc9\xa6\
+\xff\x12\xc7\xa2\xff\x1c\xc2\x9a\xff\xfe\xff\xff\xff\xfd\xfd\xfd\
+\xff\xf5\xf5\xf5\x37\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf4\xf4\xf4\x61\xfe\xfe\xfe\xff\xb8\xee\xe2\
+\xff\x12\xc8\xa6\xff\x1d\xd4\xb5\xff\x20\xd6\xb9\xff\x24\xd8\xbd\
+\xff\x26\xda\xbf\xff\x26\xdc\xc3\xff\x29\xde\xc7\xff\x2d\xe1\xcb\
+\xff\x24\xe2\xcc\xff\x23\xe3\xce\xff\x27\xe6\xd3\xff\x28\xe8\xd7\
+\xff\x2a\xeb\xdb\xff\x2c\xed\xde\xff\x3f\xf0\xe5\xff\x41\xf3\xe8\
+\xff\x44\xf5\xeb\xff\x47\xf6\xee\xff\x49\xf9\xf0\xff\x4b\xfa\xf3\
+\xff\x4c\xfc\xf5\xff\x4f\xfd\xf7\xff\x50\xff\xfa\xff\x53\xff\xfc\
+\xff\x54\xff\xfe\xff\x56\xff\xff\xff\x57\xff\xff\xff\x58\xff\xff\
+\xff\x57\xff\xff\xff\x56\xff\xff\xff\x57\xff\xff\xff\x56\xff\xff\
+\xff\x47\xff\xff\xff\x43\xff\xff\xff\x42\xff\xff\xff\x41\xff\xff\
+\xff\x3f\xff\xfd\xff\x43\xff\xfc\xff\x4c\xff\xfa\xff\x49\xfe\xf8\
+\xff\x47\xfc\xf4\xff\x44\xfb\xf2\xff\x41\xf9\xef\xff\x40\xf6\xed\
+\xff\x3d\xf4\xe9\xff\x3a\xf2\xe6\xff\x36\xf0\xe3\xff\x33\xee\xdf\
+\xff\x30\xec\xdc\xff\x2e\xe9\xd8\xff\x2a\xe7\xd5\xff\x28\xe4\xd0\
+\xff\x25\xe2\xcd\xff\x23\xdf\xc9\xff\x21\xdc\xc4\xff\x1e\xda\xc0\
+\xff\x1c\xd8\xbd\xff\x1b\xd6\xba\xff\x19\xd4\xb6\xff\x18\xd2\xb3\
+\xff\x17\xcf\xb0\xff\x17\xce\xae\xff\x15\xcc\xaa\xff\x15\xca\xa8\
+\xff\x13\xc8\xa3\xff\x35\xc9\xa5\xff\xff\xff\xff\xff\xfc\xfc\xfc\
+\xfc\xf6\xf6\xf6\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf1\xf1\xf1\x39\xfd\xfd\xfd\xff\xde\xf9\xf3\
+\xff\x14\xc9\xa4\xff\x20\xd4\xb5\xff\x24\xd6\xb9\xff\x25\xd8\xbd\
+\xff\x27\xda\xbf\xff\x29\xdb\xc3\xff\x2c\xdd\xc7\xff\x2e\xe1\xcb\
+\xff\x23\xe1\xcb\xff\x23\xe3\xcd\xff\x26\xe6\xd3\xff\x27\xe8\xd7\
+\xff\x29\xea\xda\xff\x2d\xed\xde\xff\x42\xf1\xe4\xff\x45\xf2\xe8\
+\xff\x47\xf4\xeb\xff\x49\xf6\xee\xff\x4b\xf9\xf0\xff\x4d\xfa\xf3\
+\xff\x4f\xfb\xf4\xff\x50\xfc\xf7\xff\x53\xfe\xfa\xff\x54\xff\xfb\
+\xff\x56\xff\xfd\xff\x57\xff\xfe\xff\x58\xff\xff\xff\x59\xff\xff\
+\xff\x58\xff\xff\xff\x58\xff\xff\xff\x57\xff\xff\xff\x55\xff\xff\
+\xff\x42\xff\xff\xff\x42\xff\xff\xff\x41\xff\xff\xff\x40\xff\xfd\
+\xff\x3e\xff\xfc\xff\x4b\xff\xfb\xff\x4d\xfe\xf9\xff\x4b\xfd\xf7\
+\xff\x49\xfc\xf4\xff\x47\xfa\xf2\xff\x44\xf8\xef\xff\x41\xf6\xed\
+\xff\x3f\xf3\xe9\xff\x3c\xf1\xe6\xff\x39\xef\xe3\xff\x35\xed\xdf\
+\xff\x32\xeb\xdc\xff\x30\xe8\xd9\xff\x2d\xe6\xd5\xff\x2a\xe4\xd0\
+\xff\x27\xe2\xcc\xff\x24\xe0\xc9\xff\x22\xdc\xc4\xff\x20\xda\xc1\
+\xff\x1c\xd8\xbd\xff\x1b\xd5\xba\xff\x19\xd4\xb5\xff\x18\xd2\xb3\
+\xff\x17\xcf\xb0\xff\x17\xcd\xad\xff\x15\xcc\xa9\xff\x15\xca\xa7\
+\xff\x12\xc6\xa1\xff\x51\xd1\xb1\xff\xff\xff\xff\xff\xfa\xfa\xfa\
+\xf0\xff\xff\xff\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf2\xf2\xf2\x15\xfb\xfb\xfb\xf9\xfa\xff\xfe\
+\xff\x25\xcb\xa9\xff\x22\xd4\xb5\xff\x25\xd6\xba\xff\x27\xd8\xbd\
+\xff\x29\xd9\xbf\xff\x2b\xdc\xc3\xff\x2f\xde\xc7\xff\x2e\xe1\xca\
+\xff\x22\xe0\xca\xff\x23\xe3\xcd\xff\x26\xe6\xd2\xff\x27\xe7\xd6\
+\xff\x29\xea\xd9\xff\x30\xed\xde\xff\x45\xf1\xe4\xff\x46\xf3\xe7\
+\xff\x49\xf4\xea\xff\x4c\xf6\xed\xff\x4e\xf8\xf0\xff\x50\xfa\xf3\
+\xff\x52\xfc\xf4\xff\x54\xfc\xf6\xff\x56\xfd\xf8\xff\x57\xff\xfb\
+\xff\x59\xff\xfc\xff\x5a\xff\xfd\xff\x5b\xff\xfe\xff\x5b\xff\xff\
+\xff\x59\xff\xff\xff\x59\xff\xff\xff\x59\xff\xff\xff\x4f\xff\xff\
+\xff\x40\xff\xff\xff\x42\xff\xff\xff\x41\xff\xfd\xff\x40\xff\xfc\
+\xff\x40\xff\xfb\xff\x52\xff\xfa\xff\x50\xfe\xf9\xff\x4e\xfc\xf6\
+\xff\x4b\xfb\xf4\xff\x49\xf9\xf2\xff\x45\xf7\xee\xff\x43\xf5\xeb\
+\xff\x40\xf3\xe8\xff\x3d\xf1\xe5\xff\x3b\xf0\xe2\xff\x37\xed\xdf\
+\xff\x34\xeb\xdb\xff\x31\xe8\xd8\xff\x2e\xe6\xd4\xff\x2b\xe4\xcf\
+\xff\x29\xe2\xcc\xff\x26\xdf\xc8\xff\x23\xdc\xc4\xff\x21\xda\xc1\
+\xff\x1e\xd8\xbd\xff\x1c\xd5\xba\xff\x19\xd3\xb5\xff\x18\xd2\xb2\
+\xff\x17\xce\xaf\xff\x17\xcd\xac\xff\x15\xcc\xa9\xff\x15\xca\xa7\
+\xff\x10\xc5\x9f\xff\x73\xdb\xc1\xff\xff\xff\xff\xff\xfa\xfa\xfa\
+\xd6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfa\xfa\xfa\xe0\xff\xff\xff\
+\xff\x43\xd3\xb4\xff\x24\xd3\xb5\xff\x27\xd7\xba\xff\x2a\xd8\xbd\
+\xff\x2b\xda\xc0\xff\x2e\xdc\xc4\xff\x31\xde\xc8\xff\x2c\xdf\xc9\
+\xff\x21\xe0\xc9\xff\x23\xe2\xcc\xff\x26\xe5\xd1\xff\x27\xe7\xd5\
+\xff\x29\xe9\xd8\xff\x34\xed\xdd\xff\x48\xf1\xe4\xff\x4a\xf3\xe7\
+\xff\x4c\xf5\xea\xff\x4f\xf6\xed\xff\x51\xf7\xef\xff\x53\xf9\xf1\
+\xff\x55\xfb\xf4\xff\x57\xfc\xf6\xff\x58\xfd\xf7\xff\x59\xfe\xf9\
+\xff\x5b\xff\xfb\xff\x5c\xff\xfc\xff\x5d\xff\xfe\xff\x5b\xff\xfe\
+\xff\x5b\xff\xfe\xff\x5b\xff\xff\xff\x5b\xff\xff\xff\x46\xff\xfe\
+\xff\x40\xff\xfe\xff\x41\xff\xfd\xff\x40\xff\xfc\xff\x3f\xff\xfb\
+\xff\x47\xff\xfa\xff\x55\xfe\xfa\xff\x52\xfc\xf7\xff\x50\xfc\xf4\
+\xff\x4e\xfa\xf2\xff\x4b\xf9\xf0\xff\x48\xf7\xee\xff\x45\xf5\xeb\
+\xff\x42\xf3\xe8\xff\x3f\xf1\xe5\xff\x3d\xef\xe2\xff\x39\xed\xde\
+\xff\x36\xeb\xdb\xff\x32\xe8\xd8\xff\x31\xe6\xd4\xff\x2d\xe4\xcf\
+\xff\x2a\xe2\xcc\xff\x27\xdf\xc9\xff\x25\xdc\xc4\xff\x22\xda\xc1\
+\xff\x20\xd8\xbc\xff\x1a\xd5\xb8\xff\x19\xd3\xb4\xff\x18\xd0\xb2\
+\xff\x17\xce\xae\xff\x16\xcd\xac\xff\x15\xcc\xa9\xff\x14\xca\xa7\
+\xff\x0d\xc3\x9c\xff\x95\xe2\xcf\xff\xff\xff\xff\xff\xf9\xf9\xf9\
+\xb9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xf8\xf8\xb7\xff\xff\xff\
+\xff\x69\xdd\xc5\xff\x25\xd2\xb4\xff\x2a\xd6\xbb\xff\x2b\xd8\xbe\
+\xff\x2e\xda\xc0\xff\x30\xdc\xc4\xff\x33\xde\xc8\xff\x2a\xde\xc7\
+\xff\x20\xdf\xc8\xff\x23\xe2\xcc\xff\x25\xe4\xd0\xff\x27\xe6\xd5\
+\xff\x28\xe8\xd8\xff\x39\xed\xdd\xff\x4b\xf0\xe3\xff\x4c\xf2\xe6\
+\xff\x4f\xf4\xe9\xff\x51\xf6\xed\xff\x54\xf8\xee\xff\x56\xf9\xf1\
+\xff\x57\xfb\xf3\xff\x5a\xfc\xf5\xff\x5a\xfd\xf7\xff\x5c\xfd\xf9\
+\xff\x5d\xfe\xfa\xff\x5e\xff\xfb\xff\x5f\xff\xfc\xff\x5c\xff\xfd\
+\xff\x5c\xff\xfe\xff\x5c\xff\xfe\xff\x5a\xff\xfe\xff\x3e\xff\xfd\
+\xff\x3f\xff\xfc\xff\x40\xff\xfb\xff\x3e\xff\xfa\xff\x3d\xfe\xf9\
+\xff\x51\xfe\xfa\xff\x56\xfd\xf8\xff\x54\xfc\xf5\xff\x52\xfc\xf4\
+\xff\x4f\xfa\xf2\xff\x4d\xf8\xf0\xff\x4a\xf6\xed\xff\x47\xf4\xeb\
+\xff\x44\xf2\xe8\xff\x41\xf0\xe5\xff\x3f\xee\xe2\xff\x3b\xec\xdd\
+\xff\x39\xea\xda\xff\x35\xe8\xd7\xff\x32\xe6\xd2\xff\x2f\xe4\xcf\
+\xff\x2c\xe2\xcc\xff\x28\xdf\xc8\xff\x27\xdc\xc4\xff\x23\xda\xc0\
+\xff\x1e\xd7\xbc\xff\x19\xd4\xb7\xff\x18\xd3\xb3\xff\x18\xd0\xb1\
+\xff\x17\xce\xae\xff\x16\xcd\xab\xff\x15\xcb\xa8\xff\x14\xca\xa6\
+\xff\x09\xc1\x98\xff\xaf\xe9\xdb\xff\xff\xff\xff\xff\xf8\xf8\xf8\
+\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf7\xf7\xf7\x8e\xff\xff\xff\
+\xff\x96\xe6\xd6\xff\x25\xd0\xb1\xff\x2c\xd7\xbc\xff\x2e\xd8\xbd\
+\xff\x30\xd9\xc0\xff\x32\xdc\xc3\xff\x36\xde\xc8\xff\x27\xdd\xc5\
+\xff\x20\xde\xc7\xff\x23\xe1\xcb\xff\x25\xe4\xcf\xff\x27\xe6\xd3\
+\xff\x27\xe7\xd7\xff\x3f\xec\xdd\xff\x4d\xf0\xe3\xff\x4f\xf2\xe6\
+\xff\x52\xf3\xe8\xff\x54\xf5\xeb\xff\x57\xf7\xee\xff\x58\xf9\xf0\
+\xff\x5a\xfb\xf2\xff\x5c\xfb\xf4\xff\x5d\xfc\xf6\xff\x5f\xfd\xf7\
+\xff\x60\xfd\xf9\xff\x61\xfe\xfb\xff\x61\xff\xfb\xff\x5e\xff\xfb\
+\xff\x5e\xff\xfc\xff\x5e\xff\xfc\xff\x50\xff\xfc\xff\x3c\xff\xfa\
+\xff\x3e\xff\xfa\xff\x3e\xfe\xf9\xff\x3d\xfd\xf9\xff\x3f\xfd\xf8\
+\xff\x5a\xfd\xf8\xff\x59\xfd\xf6\xff\x56\xfc\xf5\xff\x54\xfb\xf3\
+\xff\x51\xf9\xf1\xff\x4f\xf7\xef\xff\x4d\xf5\xed\xff\x4a\xf3\xea\
+\xff\x46\xf2\xe7\xff\x43\xf0\xe4\xff\x40\xee\xe1\xff\x3e\xec\xdd\
+\xff\x3b\xea\xdb\xff\x37\xe7\xd7\xff\x34\xe5\xd4\xff\x31\xe3\xcf\
+\xff\x2e\xe1\xcb\xff\x2b\xde\xc7\xff\x27\xdc\xc3\xff\x24\xda\xbf\
+\xff\x1b\xd6\xba\xff\x19\xd4\xb6\xff\x18\xd2\xb3\xff\x18\xcf\xb0\
+\xff\x17\xce\xae\xff\x15\xcd\xaa\xff\x15\xca\xa8\xff\x14\xc9\xa6\
+\xff\x09\xbf\x96\xff\xcb\xf2\xe8\xff\xfe\xfe\xfe\xff\xf6\xf6\xf6\
+\x7a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf4\xf4\xf4\x60\xfe\xfe\xfe\
+\xff\xba\xef\xe4\xff\x22\xce\xad\xff\x2f\xd7\xbc\xff\x31\xd8\xbd\
+\xff\x32\xda\xc0\xff\x35\xdc\xc3\xff\x38\xde\xc8\xff\x22\xdb\xc3\
+\xff\x20\xdc\xc5\xff\x22\xe1\xca\xff\x25\xe3\xce\xff\x26\xe5\xd1\
+\xff\x27\xe7\xd5\xff\x45\xed\xde\xff\x50\xf0\xe3\xff\x53\xf1\xe5\
+\xff\x55\xf3\xe7\xff\x57\xf5\xea\xff\x59\xf6\xed\xff\x5b\xf7\xef\
+\xff\x5c\xf9\xf0\xff\x5f\xfb\xf3\xff\x61\xfc\xf4\xff\x62\xfc\xf6\
+\xff\x63\xfd\xf7\xff\x64\xfd\xf9\xff\x61\xfe\xf9\xff\x60\xff\xfa\
+\xff\x61\xff\xfb\xff\x61\xff\xfb\xff\x43\xfd\xf8\xff\x3c\xfd\xf8\
+\xff\x3d\xfd\xf9\xff\x3d\xfd\xf8\xff\x3c\xfc\xf6\xff\x4a\xfc\xf6\
+\xff\x5d\xfd\xf6\xff\x5b\xfc\xf5\xff\x59\xfb\xf4\xff\x57\xf9\xf2\
+\xff\x54\xf8\xf0\xff\x50\xf6\xee\xff\x4e\xf5\xec\xff\x4c\xf3\xe8\
+\xff\x49\xf1\xe6\xff\x46\xf0\xe3\xff\x42\xee\xe1\xff\x3f\xec\xdd\
+\xff\x3c\xe9\xda\xff\x3a\xe7\xd6\xff\x36\xe5\xd3\xff\x33\xe3\xce\
+\xff\x2f\xe1\xca\xff\x2d\xdd\xc7\xff\x29\xdb\xc3\xff\x1f\xd8\xbd\
+\xff\x1a\xd5\xb8\xff\x19\xd3\xb4\xff\x18\xd2\xb3\xff\x17\xcf\xaf\
+\xff\x17\xcd\xad\xff\x15\xcc\xaa\xff\x15\xca\xa7\xff\x14\xc9\xa5\
+\xff\x0c\xbf\x95\xff\xe8\xfa\xf6\xff\xfe\xfe\xfe\xff\xf3\xf3\xf3\
+\x58\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\xf1\xf1\x39\xfc\xfc\xfc\
+\xff\xdc\xf8\xf3\xff\x27\xce\xad\xff\x32\xd7\xbc\xff\x33\xd8\xbd\
+\xff\x35\xda\xc0\xff\x38\xdc\xc3\xff\x3a\xde\xc7\xff\x1f\xda\xc1\
+\xff\x20\xdc\xc3\xff\x22\xe0\xca\xff\x24\xe3\xcd\xff\x25\xe4\xcf\
+\xff\x27\xe6\xd3\xff\x4c\xed\xde\xff\x54\xef\xe2\xff\x55\xf1\xe5\
+\xff\x59\xf2\xe7\xff\x5a\xf4\xe9\xff\x5c\xf5\xec\xff\x5e\xf7\xee\
+\xff\x61\xf9\xef\xff\x62\xfa\xf1\xff\x63\xfb\xf3\xff\x64\xfc\xf4\
+\xff\x65\xfd\xf5\xff\x66\xfd\xf6\xff\x62\xfd\xf6\xff\x62\xfd\xf7\
+\xff\x62\xfd\xf8\xff\x5e\xfd\xf8\xff\x38\xfb\xf4\xff\x3b\xfb\xf5\
+\xff\x3c\xfc\xf5\xff\x3c\xfc\xf4\xff\x3a\xfb\xf3\xff\x59\xfc\xf6\
+\xff\x60\xfc\xf5\xff\x5d\xfb\xf4\xff\x5b\xfa\xf2\xff\x58\xf9\xf0\
+\xff\x56\xf7\xef\xff\x54\xf6\xed\xff\x51\xf4\xea\xff\x4d\xf2\xe7\
+\xff\x4b\xf1\xe5\xff\x49\xef\xe2\xff\x45\xee\xdf\xff\x41\xec\xdb\
+\xff\x3f\xea\xd9\xff\x3c\xe6\xd5\xff\x38\xe5\xd2\xff\x34\xe2\xcd\
+\xff\x31\xe0\xca\xff\x2e\xdd\xc7\xff\x26\xdb\xc1\xff\x1b\xd6\xba\
+\xff\x1a\xd4\xb7\xff\x19\xd3\xb4\xff\x18\xd0\xb2\xff\x17\xce\xae\
+\xff\x16\xcd\xab\xff\x15\xcb\xa9\xff\x14\xca\xa7\xff\x14\xc8\xa4\
+\xff\x1a\xc2\x9a\xff\xfa\xff\xfd\xff\xfd\xfd\xfd\xff\xf2\xf2\xf2\
+\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\xf1\xf1\x13\xfb\xfb\xfb\
+\xfa\xf9\xff\xfe\xff\x35\xd0\xb0\xff\x34\xd7\xbc\xff\x34\xd8\xbd\
+\xff\x37\xda\xbf\xff\x3b\xdb\xc3\xff\x39\xdd\xc5\xff\x1c\xd9\xbf\
+\xff\x1e\xdb\xc2\xff\x21\xdf\xc9\xff\x23\xe2\xcc\xff\x25\xe4\xcf\
+\xff\x27\xe6\xd2\xff\x52\xed\xde\xff\x57\xef\xe2\xff\x59\xf0\xe4\
+\xff\x5b\xf2\xe6\xff\x5d\xf3\xe9\xff\x5f\xf5\xea\xff\x61\xf6\xed\
+\xff\x63\xf7\xef\xff\x64\xf9\xf0\xff\x66\xfa\xf1\xff\x67\xfb\xf3\
+\xff\x68\xfc\xf4\xff\x67\xfc\xf5\xff\x64\xfc\xf5\xff\x64\xfd\xf6\
+\xff\x64\xfd\xf6\xff\x51\xfc\xf4\xff\x36\xfb\xf2\xff\x3b\xfb\xf3\
+\xff\x3a\xfb\xf3\xff\x3a\xfb\xf2\xff\x3e\xfb\xf2\xff\x64\xfc\xf5\
+\xff\x61\xfc\xf4\xff\x60\xfb\xf2\xff\x5e\xf9\xf0\xff\x5b\xf9\xef\
+\xff\x58\xf6\xed\xff\x56\xf5\xeb\xff\x53\xf4\xe8\xff\x51\xf2\xe6\
+\xff\x4d\xf1\xe4\xff\x4a\xef\xe1\xff\x48\xed\xde\xff\x43\xec\xda\
+\xff\x41\xe9\xd7\xff\x3d\xe7\xd4\xff\x3a\xe5\xd0\xff\x35\xe2\xcc\
+\xff\x33\xe0\xc9\xff\x2f\xdd\xc6\xff\x1d\xd8\xbd\xff\x1b\xd5\xba\
+\xff\x19\xd4\xb6\xff\x18\xd2\xb3\xff\x17\xcf\xb0\xff\x17\xce\xae\
+\xff\x16\xcd\xaa\xff\x15\xcb\xa8\xff\x14\xc9\xa6\xff\x13\xc8\xa3\
+\xff\x2c\xc7\xa2\xff\xff\xff\xff\xff\xfc\xfc\xfc\xff\xf6\xf6\xf6\
+\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x01\xf9\xf9\xf9\
+\xde\xff\xff\xff\xff\x4f\xd6\xb9\xff\x36\xd7\xbb\xff\x37\xd8\xbd\
+\xff\x3b\xda\xc0\xff\x3d\xdb\xc3\xff\x35\xdb\xc3\xff\x1a\xd8\xbd\
+\xff\x1d\xda\xc1\xff\x21\xde\xc7\xff\x22\xe1\xca\xff\x24\xe3\xcd\
+\xff\x29\xe5\xd1\xff\x58\xed\xdd\xff\x5a\xee\xe1\xff\x5c\xef\xe3\
+\xff\x5e\xf1\xe5\xff\x61\xf2\xe8\xff\x63\xf4\xe9\xff\x65\xf5\xec\
+\xff\x66\xf6\xee\xff\x67\xf8\xef\xff\x69\xf9\xf0\xff\x69\xfa\xf1\
+\xff\x6b\xfb\xf2\xff\x67\xfb\xf2\xff\x66\xfb\xf3\xff\x66\xfc\xf4\
+\xff\x67\xfc\xf4\xff\x3f\xf9\xf0\xff\x36\xf9\xf0\xff\x38\xfa\xf0\
+\xff\x38\xf9\xf0\xff\x37\xf9\xef\xff\x4d\xfa\xf1\xff\x67\xfb\xf3\
+\xff\x65\xfb\xf2\xff\x62\xfa\xf0\xff\x60\xf9\xef\xff\x5e\xf7\xee\
+\xff\x5b\xf5\xec\xff\x58\xf4\xea\xff\x56\xf3\xe7\xff\x53\xf1\xe5\
+\xff\x50\xf0\xe2\xff\x4d\xee\xe0\xff\x49\xed\xdc\xff\x47\xeb\xd9\
+\xff\x43\xe8\xd6\xff\x3f\xe6\xd3\xff\x3b\xe3\xcf\xff\x37\xe1\xcb\
+\xff\x35\xdf\xc8\xff\x25\xda\xc1\xff\x1b\xd6\xba\xff\x1a\xd4\xb8\
+\xff\x19\xd3\xb4\xff\x18\xd1\xb2\xff\x17\xce\xaf\xff\x17\xcd\xac\
+\xff\x15\xcc\xa9\xff\x15\xca\xa7\xff\x14\xc9\xa5\xff\x12\xc6\xa1\
+\xff\x49\xcf\xae\xff\xff\xff\xff\xff\xfa\xfa\xfa\xf1\xe5\xe5\xe5\
+\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xf8\xf8\
+\xb8\xff\xff\xff\xff\x73\xde\xc8\xff\x38\xd5\xb8\xff\x3b\xd8\xbd\
+\xff\x3d\xda\xc0\xff\x40\xdc\xc2\xff\x30\xd9\xc0\xff\x1b\xd7\xbb\
+\xff\x1c\xd9\xbf\xff\x21\xdd\xc6\xff\x22\xdf\xc9\xff\x23\xe2\xcb\
+\xff\x2e\xe5\xd1\xff\x5b\xed\xdd\xff\x5e\xee\xe0\xff\x60\xf0\xe2\
+\xff\x63\xf0\xe4\xff\x64\xf2\xe6\xff\x66\xf3\xe9\xff\x67\xf4\xeb\
+\xff\x69\xf5\xed\xff\x6b\xf6\xee\xff\x6c\xf7\xf0\xff\x6e\xf9\xf0\
+\xff\x6e\xfa\xf1\xff\x67\xfa\xf1\xff\x68\xfa\xf1\xff\x68\xfa\xf2\
+\xff\x62\xfa\xf2\xff\x33\xf6\xec\xff\x35\xf7\xed\xff\x37\xf7\xee\
+\xff\x36\xf7\xed\xff\x35\xf6\xec\xff\x62\xfa\xf1\xff\x68\xfa\xf1\
+\xff\x67\xf9\xf0\xff\x65\xf9\xef\xff\x63\xf7\xee\xff\x61\xf6\xec\
+\xff\x5d\xf5\xea\xff\x5b\xf4\xe8\xff\x58\xf2\xe6\xff\x55\xf0\xe3\
+\xff\x52\xef\xe1\xff\x4f\xed\xde\xff\x4c\xec\xdb\xff\x49\xe9\xd8\
+\xff\x45\xe8\xd6\xff\x40\xe5\xd1\xff\x3d\xe3\xce\xff\x3a\xe1\xcb\
+\xff\x32\xdd\xc6\xff\x1b\xd8\xbc\xff\x1b\xd5\xba\xff\x19\xd4\xb6\
+\xff\x18\xd2\xb3\xff\x18\xcf\xb1\xff\x17\xce\xae\xff\x16\xcd\xab\
+\xff\x15\xcb\xa9\xff\x14\xca\xa7\xff\x14\xc9\xa5\xff\x11\xc5\x9f\
+\xff\x69\xd8\xbd\xff\xff\xff\xff\xff\xfa\xfa\xfa\xda\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf7\xf7\xf7\
+\x8d\xff\xff\xff\xff\x9c\xe8\xd8\xff\x38\xd3\xb6\xff\x3e\xd8\xbd\
+\xff\x40\xda\xc0\xff\x44\xdc\xc3\xff\x28\xd7\xbc\xff\x1b\xd6\xba\
+\xff\x1c\xd9\xbe\xff\x1f\xdc\xc4\xff\x21\xdd\xc7\xff\x22\xe0\xca\
+\xff\x36\xe5\xd1\xff\x60\xed\xdd\xff\x61\xee\xe0\xff\x63\xf0\xe1\
+\xff\x65\xf0\xe3\xff\x68\xf1\xe5\xff\x69\xf2\xe7\xff\x6b\xf4\xe9\
+\xff\x6d\xf5\xeb\xff\x6f\xf5\xed\xff\x6f\xf6\xee\xff\x71\xf7\xef\
+\xff\x6f\xf8\xf0\xff\x6a\xf7\xf0\xff\x6a\xf9\xf0\xff\x6b\xf9\xf0\
+\xff\x51\xf6\xed\xff\x30\xf3\xe8\xff\x35\xf5\xeb\xff\x35\xf4\xeb\
+\xff\x34\xf4\xeb\xff\x3c\xf5\xec\xff\x6e\xf9\xf1\xff\x6b\xf9\xf0\
+\xff\x69\xf7\xef\xff\x67\xf6\xee\xff\x65\xf5\xec\xff\x63\xf4\xea\
+\xff\x61\xf3\xe8\xff\x5d\xf2\xe6\xff\x5b\xf1\xe4\xff\x58\xf0\xe3\
+\xff\x55\xee\xe0\xff\x52\xed\xdd\xff\x4f\xeb\xda\xff\x4b\xe9\xd7\
+\xff\x46\xe7\xd4\xff\x42\xe4\xd0\xff\x3f\xe2\xcd\xff\x3c\xe0\xca\
+\xff\x21\xd9\xbf\xff\x1b\xd6\xba\xff\x1a\xd4\xb7\xff\x19\xd3\xb4\
+\xff\x18\xd0\xb2\xff\x17\xcf\xaf\xff\x17\xcd\xad\xff\x15\xcc\xaa\
+\xff\x15\xca\xa8\xff\x14\xc9\xa6\xff\x14\xc9\xa5\xff\x11\xc4\x9e\
+\xff\x8f\xe1\xcd\xff\xff\xff\xff\xff\xf9\xf9\xf9\xbd\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf6\xf6\xf6\
+\x5f\xfe\xfe\xfe\xff\xbc\xef\xe4\xff\x37\xd1\xb1\xff\x40\xd8\xbd\
+\xff\x43\xd9\xbf\xff\x47\xdc\xc3\xff\x21\xd5\xb7\xff\x1a\xd4\xb8\
+\xff\x1b\xd8\xbc\xff\x1e\xdb\xc2\xff\x21\xdd\xc5\xff\x22\xdf\xc8\
+\xff\x3e\xe5\xd1\xff\x63\xed\xdc\xff\x64\xee\xde\xff\x67\xef\xe1\
+\xff\x68\xf1\xe3\xff\x6a\xf1\xe5\xff\x6d\xf2\xe6\xff\x6f\xf3\xe8\
+\xff\x71\xf4\xea\xff\x72\xf5\xec\xff\x73\xf5\xed\xff\x74\xf6\xee\
+\xff\x6f\xf6\xed\xff\x6d\xf6\xee\xff\x6e\xf7\xee\xff\x6f\xf7\xef\
+\xff\x3b\xf3\xe7\xff\x31\xf2\xe6\xff\x34\xf2\xe8\xff\x34\xf2\xe8\
+\xff\x33\xf2\xe7\xff\x52\xf5\xec\xff\x71\xf9\xf0\xff\x6e\xf7\xee\
+\xff\x6c\xf6\xee\xff\x6a\xf5\xec\xff\x68\xf4\xeb\xff\x66\xf3\xe9\
+\xff\x63\xf2\xe8\xff\x61\xf1\xe5\xff\x5d\xf0\xe4\xff\x5a\xef\xe2\
+\xff\x57\xee\xdf\xff\x54\xec\xdc\xff\x51\xea\xda\xff\x4d\xe8\xd6\
+\xff\x48\xe5\xd2\xff\x44\xe3\xcf\xff\x42\xe1\xcc\xff\x2e\xdc\xc4\
+\xff\x1b\xd7\xbb\xff\x1a\xd5\xb9\xff\x19\xd4\xb5\xff\x18\xd2\xb3\
+\xff\x17\xcf\xb0\xff\x17\xce\xae\xff\x16\xcd\xab\xff\x15\xcb\xaa\
+\xff\x14\xca\xa8\xff\x14\xc9\xa5\xff\x15\xc9\xa5\xff\x14\xc4\x9e\
+\xff\xa9\xe7\xd8\xff\xff\xff\xff\xff\xf7\xf7\xf7\xa0\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xf0\xf0\
+\x36\xfc\xfc\xfc\xff\xde\xf8\xf3\xff\x37\xcf\xae\xff\x43\xd8\xbc\
+\xff\x46\xd9\xc0\xff\x48\xdb\xc2\xff\x1b\xd3\xb4\xff\x19\xd4\xb5\
+\xff\x1b\xd7\xbc\xff\x1e\xda\xc0\xff\x20\xdc\xc3\xff\x21\xdd\xc6\
+\xff\x48\xe5\xd2\xff\x65\xec\xdb\xff\x68\xee\xdd\xff\x6b\xef\xe0\
+\xff\x6c\xf0\xe2\xff\x6f\xf1\xe4\xff\x70\xf2\xe6\xff\x72\xf3\xe7\
+\xff\x74\xf3\xe8\xff\x75\xf4\xea\xff\x76\xf4\xec\xff\x76\xf5\xec\
+\xff\x6f\xf5\xeb\xff\x6f\xf5\xec\xff\x70\xf6\xed\xff\x68\xf5\xec\
+\xff\x2d\xef\xe2\xff\x31\xf0\xe4\xff\x32\xf2\xe5\xff\x32\xf1\xe5\
+\xff\x31\xf1\xe4\xff\x6a\xf6\xed\xff\x73\xf6\xee\xff\x71\xf6\xed\
+\xff\x70\xf5\xec\xff\x6d\xf4\xec\xff\x6a\xf4\xe9\xff\x68\xf3\xe8\
+\xff\x66\xf1\xe6\xff\x63\xf0\xe4\xff\x60\xef\xe2\xff\x5c\xee\xe0\
+\xff\x5a\xec\xdd\xff\x57\xeb\xdb\xff\x54\xe9\xd9\xff\x4d\xe6\xd4\
+\xff\x4a\xe4\xd1\xff\x47\xe2\xce\xff\x3f\xe0\xca\xff\x1c\xd8\xbd\
+\xff\x1b\xd5\xba\xff\x19\xd4\xb6\xff\x18\xd3\xb4\xff\x18\xd0\xb2\
+\xff\x17\xce\xae\xff\x17\xcd\xac\xff\x15\xcd\xaa\xff\x15\xcb\xa8\
+\xff\x14\xc9\xa7\xff\x14\xc9\xa6\xff\x1e\xcb\xa8\xff\x13\xc3\x9a\
+\xff\xc6\xf0\xe6\xff\xff\xff\xff\xff\xf6\xf6\xf6\x7d\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\xf1\xf1\
+\x13\xfa\xfa\xfa\xf9\xf8\xfe\xfd\xff\x44\xd0\xb1\xff\x45\xd8\xbc\
+\xff\x49\xd9\xc0\xff\x46\xda\xc0\xff\x17\xd1\xb2\xff\x19\xd3\xb4\
+\xff\x1b\xd6\xba\xff\x1d\xd9\xbf\xff\x20\xdb\xc2\xff\x1e\xdc\xc4\
+\xff\x53\xe6\xd3\xff\x69\xeb\xdb\xff\x6c\xed\xdc\xff\x6e\xee\xe0\
+\xff\x70\xf0\xe1\xff\x72\xf0\xe3\xff\x75\xf1\xe4\xff\x75\xf2\xe6\
+\xff\x77\xf3\xe8\xff\x79\xf4\xe9\xff\x7a\xf4\xe9\xff\x78\xf4\xea\
+\xff\x71\xf4\xea\xff\x72\xf4\xea\xff\x72\xf5\xeb\xff\x52\xf1\xe5\
+\xff\x2b\xed\xdf\xff\x30\xef\xe2\xff\x30\xef\xe2\xff\x30\xef\xe2\
+\xff\x3c\xf0\xe4\xff\x79\xf6\xed\xff\x76\xf5\xec\xff\x75\xf5\xec\
+\xff\x72\xf5\xea\xff\x70\xf3\xe8\xff\x6e\xf2\xe7\xff\x6c\xf2\xe6\
+\xff\x69\xf1\xe5\xff\x66\xef\xe3\xff\x63\xef\xe1\xff\x60\xed\xdf\
+\xff\x5c\xec\xdc\xff\x5a\xea\xda\xff\x54\xe8\xd6\xff\x4e\xe5\xd2\
+\xff\x4c\xe4\xcf\xff\x4a\xe3\xcd\xff\x27\xda\xc0\xff\x1b\xd6\xba\
+\xff\x1a\xd4\xb7\xff\x19\xd3\xb4\xff\x18\xd1\xb2\xff\x17\xcf\xaf\
+\xff\x17\xcd\xad\xff\x16\xcd\xab\xff\x15\xcc\xa9\xff\x14\xcb\xa7\
+\xff\x13\xc9\xa6\xff\x1f\xcb\xaa\xff\x21\xcc\xaa\xff\x18\xc3\x9c\
+\xff\xe0\xf8\xf2\xff\xfd\xfd\xfd\xff\xf4\xf4\xf4\x5d\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xfa\xfa\xfa\xde\xff\xff\xff\xff\x5b\xd5\xb9\xff\x48\xd7\xbc\
+\xff\x4b\xda\xc0\xff\x40\xd8\xbd\xff\x16\xce\xaf\xff\x18\xd1\xb2\
+\xff\x1a\xd6\xb9\xff\x1c\xd8\xbd\xff\x1e\xd9\xc0\xff\x1d\xdb\xc1\
+\xff\x5e\xe7\xd6\xff\x6d\xea\xda\xff\x6f\xec\xdc\xff\x72\xee\xde\
+\xff\x74\xef\xe0\xff\x76\xf0\xe2\xff\x78\xf1\xe4\xff\x7a\xf2\xe5\
+\xff\x7b\xf3\xe6\xff\x7d\xf3\xe8\xff\x7e\xf4\xe9\xff\x77\xf3\xe8\
+\xff\x74\xf3\xe8\xff\x75\xf4\xe9\xff\x76\xf4\xe9\xff\x37\xec\xdd\
+\xff\x2b\xec\xdc\xff\x2e\xed\xde\xff\x2e\xed\xde\xff\x2d\xed\xde\
+\xff\x59\xf1\xe6\xff\x7c\xf5\xec\xff\x7a\xf4\xeb\xff\x78\xf4\xe9\
+\xff\x75\xf3\xe8\xff\x73\xf3\xe8\xff\x71\xf2\xe6\xff\x6f\xf1\xe5\
+\xff\x6c\xf0\xe3\xff\x69\xef\xe1\xff\x65\xee\xdf\xff\x63\xec\xdc\
+\xff\x60\xec\xdb\xff\x5b\xe9\xd8\xff\x55\xe6\xd4\xff\x51\xe5\xd2\
+\xff\x4e\xe4\xcf\xff\x3b\xde\xc7\xff\x1a\xd6\xbb\xff\x1a\xd5\xb8\
+\xff\x19\xd4\xb4\xff\x18\xd2\xb3\xff\x18\xcf\xb1\xff\x17\xce\xae\
+\xff\x17\xcd\xad\xff\x15\xcd\xac\xff\x14\xcb\xa9\xff\x13\xca\xa6\
+\xff\x1e\xcc\xa9\xff\x26\xcd\xad\xff\x23\xcc\xab\xff\x22\xc4\x9e\
+\xff\xf7\xfe\xfc\xff\xfd\xfd\xfd\xff\xf2\xf2\xf2\x3e\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xf7\xf7\xf7\xb6\xff\xff\xff\xff\x7c\xde\xc6\xff\x4a\xd6\xbb\
+\xff\x4e\xda\xc0\xff\x38\xd5\xb9\xff\x16\xce\xae\xff\x18\xcf\xb1\
+\xff\x1a\xd6\xb9\xff\x1c\xd7\xbb\xff\x1d\xd8\xbe\xff\x1f\xda\xc1\
+\xff\x69\xe7\xd7\xff\x71\xeb\xda\xff\x73\xec\xdc\xff\x76\xed\xde\
+\xff\x78\xee\xe0\xff\x7a\xf0\xe1\xff\x7c\xf0\xe3\xff\x7e\xf1\xe4\
+\xff\x7f\xf2\xe5\xff\x81\xf3\xe6\xff\x81\xf3\xe7\xff\x76\xf2\xe6\
+\xff\x77\xf2\xe6\xff\x78\xf3\xe7\xff\x6e\xf1\xe6\xff\x26\xe7\xd7\
+\xff\x2b\xea\xdb\xff\x2d\xec\xdc\xff\x2d\xec\xdc\xff\x2c\xeb\xdc\
+\xff\x76\xf3\xe9\xff\x7e\xf4\xea\xff\x7d\xf4\xe9\xff\x7c\xf3\xe8\
+\xff\x79\xf3\xe7\xff\x76\xf2\xe6\xff\x74\xf1\xe4\xff\x72\xf1\xe3\
+\xff\x6f\xf0\xe2\xff\x6c\xef\xe0\xff\x69\xee\xdf\xff\x66\xed\xdc\
+\xff\x62\xeb\xda\xff\x5b\xe7\xd6\xff\x57\xe5\xd3\xff\x54\xe4\xd0\
+\xff\x4d\xe2\xcc\xff\x1e\xd7\xbc\xff\x1a\xd5\xb9\xff\x19\xd4\xb5\
+\xff\x18\xd2\xb3\xff\x18\xd0\xb1\xff\x17\xce\xae\xff\x17\xcd\xad\
+\xff\x16\xcd\xac\xff\x16\xcb\xaa\xff\x14\xca\xa8\xff\x1a\xcb\xa8\
+\xff\x2b\xcf\xaf\xff\x28\xcf\xae\xff\x25\xcc\xac\xff\x35\xca\xa7\
+\xff\xff\xff\xff\xff\xfb\xfb\xfb\xfe\xf0\xf0\xf0\x23\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xf7\xf7\xf7\x8d\xff\xff\xff\xff\xa1\xe7\xd6\xff\x4b\xd5\xb8\
+\xff\x52\xda\xc1\xff\x2c\xd2\xb3\xff\x16\xcd\xad\xff\x17\xce\xaf\
+\xff\x1a\xd4\xb8\xff\x1b\xd6\xba\xff\x1c\xd8\xbc\xff\x22\xd9\xc0\
+\xff\x71\xe9\xd8\xff\x74\xea\xd9\xff\x77\xed\xdc\xff\x7a\xed\xdd\
+\xff\x7d\xee\xe0\xff\x7e\xee\xe2\xff\x80\xef\xe2\xff\x82\xf1\xe4\
+\xff\x83\xf2\xe5\xff\x85\xf2\xe6\xff\x81\xf2\xe5\xff\x7a\xf1\xe4\
+\xff\x7b\xf2\xe5\xff\x7c\xf2\xe6\xff\x52\xec\xdd\xff\x25\xe6\xd4\
+\xff\x2a\xe9\xd8\xff\x2a\xe9\xd8\xff\x2a\xe9\xd8\xff\x3d\xec\xdc\
+\xff\x86\xf4\xea\xff\x82\xf4\xe9\xff\x80\xf4\xe8\xff\x7f\xf3\xe8\
+\xff\x7d\xf3\xe6\xff\x7b\xf2\xe5\xff\x77\xf1\xe4\xff\x75\xf0\xe3\
+\xff\x72\xef\xe1\xff\x70\xee\xe0\xff\x6d\xed\xde\xff\x68\xec\xdb\
+\xff\x63\xe9\xd8\xff\x5c\xe6\xd4\xff\x59\xe5\xd2\xff\x57\xe4\xcf\
+\xff\x2f\xdb\xc1\xff\x19\xd5\xb9\xff\x19\xd4\xb5\xff\x18\xd3\xb3\
+\xff\x18\xd0\xb1\xff\x17\xce\xaf\xff\x17\xcd\xad\xff\x16\xcd\xad\
+\xff\x16\xcc\xab\xff\x15\xcb\xa8\xff\x17\xca\xa8\xff\x2e\xcf\xb1\
+\xff\x2e\xd0\xb0\xff\x2a\xcf\xaf\xff\x27\xcd\xac\xff\x4d\xd0\xb1\
+\xff\xff\xff\xff\xff\xfa\xfa\xfa\xf4\xe5\xe5\xe5\x0a\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xf6\xf6\xf6\x5d\xfe\xfe\xfe\xff\xc1\xef\xe3\xff\x4a\xd3\xb5\
+\xff\x56\xda\xc1\xff\x22\xcf\xae\xff\x15\xcd\xaa\xff\x17\xce\xae\
+\xff\x1a\xd4\xb6\xff\x1b\xd5\xb9\xff\x1b\xd7\xbb\xff\x29\xda\xc1\
+\xff\x78\xe9\xd8\xff\x79\xea\xd9\xff\x7c\xec\xdb\xff\x7e\xed\xdd\
+\xff\x80\xee\xdf\xff\x83\xef\xe0\xff\x84\xef\xe2\xff\x86\xf0\xe3\
+\xff\x88\xf1\xe4\xff\x89\xf2\xe5\xff\x80\xf0\xe3\xff\x7d\xf1\xe4\
+\xff\x7e\xf1\xe4\xff\x80\xf2\xe5\xff\x33\xe5\xd2\xff\x26\xe5\xd1\
+\xff\x28\xe7\xd5\xff\x29\xe7\xd5\xff\x27\xe7\xd5\xff\x61\xee\xe0\
+\xff\x88\xf4\xe8\xff\x87\xf3\xe7\xff\x84\xf3\xe7\xff\x82\xf3\xe6\
+\xff\x80\xf2\xe5\xff\x7d\xf1\xe4\xff\x7c\xf1\xe3\xff\x78\xf0\xe2\
+\xff\x75\xef\xe0\xff\x72\xee\xde\xff\x6f\xec\xdc\xff\x6c\xea\xda\
+\xff\x62\xe7\xd5\xff\x5f\xe6\xd3\xff\x5c\xe5\xd0\xff\x4a\xe0\xc9\
+\xff\x19\xd5\xb8\xff\x19\xd4\xb5\xff\x18\xd3\xb3\xff\x18\xd1\xb2\
+\xff\x17\xce\xaf\xff\x17\xcd\xad\xff\x16\xce\xad\xff\x16\xcd\xac\
+\xff\x15\xcc\xa9\xff\x14\xca\xa7\xff\x2e\xd0\xb1\xff\x32\xd1\xb3\
+\xff\x30\xd0\xb1\xff\x2e\xd0\xb0\xff\x28\xcc\xab\xff\x6d\xd9\xbf\
+\xff\xff\xff\xff\xff\xfa\xfa\xfa\xdd\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xf1\xf1\xf1\x37\xfc\xfc\xfc\xff\xdd\xf8\xf1\xff\x4e\xd2\xb4\
+\xff\x57\xda\xc0\xff\x19\xcb\xa9\xff\x15\xcb\xa9\xff\x16\xce\xac\
+\xff\x1a\xd3\xb5\xff\x1a\xd4\xb6\xff\x1b\xd6\xb9\xff\x34\xdb\xc2\
+\xff\x7d\xe9\xd9\xff\x7d\xea\xda\xff\x80\xec\xdb\xff\x82\xed\xdc\
+\xff\x84\xee\xde\xff\x87\xef\xe0\xff\x89\xf0\xe1\xff\x8b\xf0\xe3\
+\xff\x8c\xf0\xe4\xff\x8c\xf0\xe5\xff\x80\xef\xe2\xff\x80\xf0\xe3\
+\xff\x81\xf1\xe4\xff\x74\xee\xe0\xff\x21\xe1\xcb\xff\x26\xe5\xd1\
+\xff\x27\xe5\xd2\xff\x27\xe5\xd1\xff\x27\xe5\xd2\xff\x83\xf2\xe5\
+\xff\x8b\xf3\xe7\xff\x8a\xf3\xe7\xff\x88\xf2\xe6\xff\x86\xf2\xe5\
+\xff\x84\xf2\xe4\xff\x81\xf1\xe3\xff\x7f\xf0\xe2\xff\x7c\xef\xe1\
+\xff\x79\xee\xdf\xff\x75\xed\xdc\xff\x73\xec\xdb\xff\x69\xe8\xd7\
+\xff\x64\xe7\xd4\xff\x62\xe5\xd2\xff\x5d\xe4\xcf\xff\x22\xd6\xbb\
+\xff\x19\xd4\xb5\xff\x18\xd2\xb3\xff\x18\xd0\xb1\xff\x17\xcf\xaf\
+\xff\x17\xcd\xad\xff\x16\xcd\xac\xff\x16\xcd\xad\xff\x16\xcc\xab\
+\xff\x14\xcb\xa8\xff\x2b\xcf\xaf\xff\x38\xd3\xb5\xff\x34\xd2\xb3\
+\xff\x31\xd1\xb2\xff\x2f\xd0\xb0\xff\x29\xcc\xa9\xff\x8d\xe2\xcd\
+\xff\xff\xff\xff\xff\xf8\xf8\xf8\xc0\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xf0\xf0\xf0\x12\xfb\xfb\xfb\xf9\xf7\xfe\xfd\xff\x57\xd4\xb7\
+\xff\x54\xd9\xbe\xff\x12\xc9\xa5\xff\x14\xca\xa7\xff\x15\xcd\xac\
+\xff\x19\xd3\xb3\xff\x1a\xd3\xb5\xff\x19\xd4\xb7\xff\x41\xdd\xc5\
+\xff\x80\xe9\xd9\xff\x81\xea\xd9\xff\x83\xec\xdb\xff\x86\xed\xdd\
+\xff\x89\xee\xde\xff\x8b\xef\xe0\xff\x8c\xf0\xe1\xff\x8e\xf0\xe3\
+\xff\x8f\xf1\xe3\xff\x8b\xf0\xe2\xff\x82\xef\xe1\xff\x84\xf0\xe2\
+\xff\x85\xf0\xe3\xff\x52\xe7\xd4\xff\x1f\xdf\xc9\xff\x26\xe4\xce\
+\xff\x25\xe4\xce\xff\x25\xe4\xcf\xff\x40\xe8\xd5\xff\x93\xf3\xe7\
+\xff\x8e\xf2\xe6\xff\x8d\xf2\xe6\xff\x8c\xf2\xe5\xff\x8a\xf1\xe4\
+\xff\x88\xf0\xe3\xff\x85\xf0\xe2\xff\x82\xef\xe1\xff\x80\xee\xdf\
+\xff\x7c\xed\xdd\xff\x79\xec\xdc\xff\x72\xea\xd9\xff\x69\xe7\xd5\
+\xff\x67\xe6\xd3\xff\x65\xe4\xd1\xff\x3c\xdb\xc2\xff\x17\xd3\xb4\
+\xff\x18\xd2\xb3\xff\x18\xd0\xb1\xff\x17\xce\xaf\xff\x17\xcd\xad\
+\xff\x16\xcd\xac\xff\x16\xcd\xae\xff\x15\xcc\xab\xff\x14\xcb\xa8\
+\xff\x23\xce\xad\xff\x3e\xd5\xb8\xff\x3b\xd4\xb6\xff\x37\xd3\xb4\
+\xff\x33\xd2\xb3\xff\x31\xd1\xb2\xff\x27\xca\xa7\xff\xab\xe8\xda\
+\xff\xff\xff\xff\xff\xf8\xf8\xf8\xa4\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf9\xf9\xf9\xdc\xff\xff\xff\xff\x6c\xda\xbf\
+\xff\x4d\xd6\xba\xff\x11\xc8\xa4\xff\x14\xc9\xa6\xff\x16\xcc\xab\
+\xff\x18\xd1\xb3\xff\x18\xd3\xb3\xff\x18\xd3\xb5\xff\x51\xde\xc8\
+\xff\x84\xe8\xd8\xff\x86\xea\xd9\xff\x88\xec\xdb\xff\x8a\xed\xdc\
+\xff\x8c\xee\xde\xff\x8f\xee\xe0\xff\x91\xef\xe1\xff\x92\xf0\xe2\
+\xff\x94\xf1\xe3\xff\x89\xef\xe1\xff\x87\xef\xe1\xff\x88\xef\xe2\
+\xff\x8a\xef\xe2\xff\x2e\xde\xc7\xff\x22\xde\xc7\xff\x25\xe1\xcc\
+\xff\x24\xe1\xcc\xff\x21\xe1\xcb\xff\x6a\xeb\xdc\xff\x93\xf2\xe6\
+\xff\x91\xf2\xe6\xff\x90\xf1\xe5\xff\x8f\xf1\xe5\xff\x8d\xf0\xe4\
+\xff\x8b\xf0\xe3\xff\x89\xef\xe2\xff\x86\xef\xe1\xff\x83\xee\xe0\
+\xff\x80\xed\xdd\xff\x7d\xeb\xdb\xff\x70\xe8\xd6\xff\x6d\xe6\xd5\
+\xff\x69\xe6\xd3\xff\x5a\xe1\xcc\xff\x19\xd2\xb4\xff\x18\xd2\xb2\
+\xff\x18\xcf\xb1\xff\x17\xce\xaf\xff\x17\xcd\xad\xff\x15\xcd\xaa\
+\xff\x16\xce\xad\xff\x16\xcc\xac\xff\x15\xcb\xaa\xff\x1b\xcc\xab\
+\xff\x42\xd6\xb9\xff\x40\xd6\xb8\xff\x3d\xd4\xb6\xff\x3a\xd3\xb5\
+\xff\x35\xd3\xb4\xff\x32\xd1\xb3\xff\x27\xc8\xa5\xff\xc1\xef\xe4\
+\xff\xff\xff\xff\xff\xf5\xf5\xf5\x83\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf7\xf7\xf7\xb5\xff\xff\xff\xff\x89\xe1\xcc\
+\xff\x41\xd3\xb5\xff\x12\xc8\xa4\xff\x14\xc9\xa5\xff\x15\xcd\xab\
+\xff\x17\xd0\xb1\xff\x18\xd1\xb2\xff\x16\xd3\xb3\xff\x62\xe1\xcc\
+\xff\x88\xe9\xd8\xff\x8a\xe9\xd9\xff\x8c\xeb\xdb\xff\x8e\xed\xdd\
+\xff\x90\xee\xde\xff\x92\xee\xe0\xff\x94\xef\xe1\xff\x96\xf0\xe2\
+\xff\x96\xf0\xe2\xff\x89\xee\xdf\xff\x8a\xef\xe0\xff\x8b\xef\xe1\
+\xff\x7a\xec\xdc\xff\x1a\xd9\xbf\xff\x22\xde\xc8\xff\x22\xe0\xc9\
+\xff\x23\xe0\xc9\xff\x25\xe0\xc9\xff\x90\xf1\xe4\xff\x97\xf2\xe6\
+\xff\x96\xf1\xe6\xff\x94\xf1\xe5\xff\x92\xf1\xe4\xff\x90\xf0\xe4\
+\xff\x8e\xf0\xe3\xff\x8c\xef\xe1\xff\x89\xee\xe0\xff\x87\xed\xdf\
+\xff\x83\xec\xdd\xff\x79\xe9\xd9\xff\x72\xe7\xd5\xff\x6f\xe6\xd4\
+\xff\x6d\xe5\xd2\xff\x29\xd5\xb9\xff\x17\xd0\xb2\xff\x17\xcf\xb0\
+\xff\x17\xce\xae\xff\x17\xcd\xac\xff\x15\xcd\xaa\xff\x16\xcd\xac\
+\xff\x16\xcd\xac\xff\x15\xcc\xaa\xff\x15\xcc\xa9\xff\x43\xd6\xba\
+\xff\x47\xd7\xbc\xff\x42\xd6\xba\xff\x3f\xd5\xb8\xff\x3c\xd4\xb6\
+\xff\x38\xd3\xb5\xff\x35\xd2\xb4\xff\x2a\xc8\xa5\xff\xdc\xf7\xf1\
+\xff\xfe\xfe\xfe\xff\xf6\xf6\xf6\x5f\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf7\xf7\xf7\x8b\xff\xff\xff\xff\xab\xea\xdb\
+\xff\x32\xcd\xad\xff\x12\xc9\xa5\xff\x14\xc9\xa5\xff\x15\xcd\xac\
+\xff\x17\xcf\xb0\xff\x17\xd0\xb1\xff\x15\xd0\xb2\xff\x71\xe4\xcf\
+\xff\x8b\xe9\xd9\xff\x8e\xea\xd9\xff\x90\xec\xdb\xff\x92\xec\xdc\
+\xff\x95\xee\xde\xff\x96\xee\xe0\xff\x98\xef\xe1\xff\x99\xf0\xe2\
+\xff\x94\xef\xe1\xff\x8c\xee\xde\xff\x8d\xee\xe0\xff\x90\xef\xe1\
+\xff\x54\xe2\xcd\xff\x1b\xd8\xbd\xff\x21\xdd\xc6\xff\x21\xdd\xc6\
+\xff\x20\xde\xc6\xff\x43\xe3\xcf\xff\x9e\xf3\xe6\xff\x9a\xf2\xe5\
+\xff\x99\xf2\xe5\xff\x97\xf1\xe4\xff\x96\xf1\xe3\xff\x94\xf0\xe3\
+\xff\x91\xf0\xe2\xff\x8f\xef\xe1\xff\x8d\xee\xe0\xff\x8a\xed\xde\
+\xff\x84\xeb\xdb\xff\x78\xe8\xd6\xff\x75\xe7\xd5\xff\x73\xe6\xd3\
+\xff\x4c\xdd\xc5\xff\x16\xcf\xb0\xff\x17\xcf\xaf\xff\x17\xce\xad\
+\xff\x16\xcd\xac\xff\x15\xcc\xa9\xff\x15\xcc\xab\xff\x16\xcd\xad\
+\xff\x16\xcc\xab\xff\x14\xcb\xa9\xff\x3c\xd4\xb7\xff\x4d\xd8\xbe\
+\xff\x49\xd8\xbc\xff\x46\xd7\xbb\xff\x41\xd6\xb9\xff\x3e\xd5\xb7\
+\xff\x3b\xd4\xb6\xff\x37\xd2\xb4\xff\x31\xca\xa7\xff\xf1\xfd\xfb\
+\xff\xfd\xfd\xfd\xff\xf3\xf3\xf3\x44\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf4\xf4\xf4\x5e\xfd\xfd\xfd\xff\xc8\xf1\xe7\
+\xff\x21\xc8\xa3\xff\x14\xc9\xa5\xff\x14\xc9\xa5\xff\x16\xce\xae\
+\xff\x17\xcf\xb0\xff\x17\xcf\xb0\xff\x16\xcf\xb1\xff\x81\xe7\xd4\
+\xff\x8f\xea\xd9\xff\x91\xec\xda\xff\x94\xec\xdb\xff\x96\xed\xdc\
+\xff\x98\xed\xde\xff\x9a\xee\xe0\xff\x9b\xef\xe1\xff\x9d\xf0\xe2\
+\xff\x93\xee\xde\xff\x90\xee\xde\xff\x91\xee\xde\xff\x93\xef\xe0\
+\xff\x2b\xd8\xbd\xff\x1d\xd8\xbe\xff\x20\xdb\xc3\xff\x20\xdc\xc3\
+\xff\x1c\xdb\xc2\xff\x75\xea\xda\xff\x9f\xf2\xe5\xff\x9e\xf2\xe5\
+\xff\x9c\xf2\xe4\xff\x9b\xf1\xe4\xff\x9a\xf1\xe3\xff\x97\xf0\xe3\
+\xff\x95\xf0\xe1\xff\x93\xef\xe0\xff\x8f\xee\xde\xff\x8d\xed\xdc\
+\xff\x7f\xe9\xd8\xff\x7c\xe8\xd6\xff\x78\xe7\xd5\xff\x6d\xe3\xcf\
+\xff\x1a\xcf\xb0\xff\x17\xce\xae\xff\x17\xcd\xac\xff\x16\xcd\xaa\
+\xff\x15\xcc\xa9\xff\x15\xcb\xaa\xff\x16\xcd\xad\xff\x16\xcc\xaa\
+\xff\x14\xcb\xa9\xff\x31\xd2\xb4\xff\x55\xda\xc0\xff\x4f\xd9\xbf\
+\xff\x4b\xd8\xbd\xff\x48\xd7\xbc\xff\x44\xd6\xba\xff\x40\xd6\xb9\
+\xff\x3d\xd4\xb6\xff\x39\xd2\xb5\xff\x41\xcd\xad\xff\xfe\xff\xff\
+\xff\xfc\xfc\xfc\xff\xf1\xf1\xf1\x25\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf0\xf0\xf0\x34\xfc\xfc\xfc\xff\xe0\xf8\xf2\
+\xff\x12\xc2\x9a\xff\x14\xc9\xa4\xff\x14\xc9\xa5\xff\x17\xce\xaf\
+\xff\x17\xcf\xb0\xff\x17\xd0\xb0\xff\x1d\xd1\xb2\xff\x8d\xe8\xd6\
+\xff\x93\xea\xd9\xff\x96\xec\xdb\xff\x97\xed\xdc\xff\x9a\xee\xde\
+\xff\x9c\xee\xdf\xff\x9d\xee\xe0\xff\x9e\xef\xe1\xff\xa0\xef\xe1\
+\xff\x93\xed\xdd\xff\x94\xee\xde\xff\x95\xee\xe0\xff\x81\xe9\xd8\
+\xff\x16\xd2\xb3\xff\x1d\xd8\xbe\xff\x1e\xda\xc0\xff\x1e\xda\xc0\
+\xff\x23\xdb\xc2\xff\x9e\xf0\xe4\xff\xa3\xf2\xe5\xff\xa2\xf2\xe5\
+\xff\xa0\xf1\xe4\xff\x9f\xf1\xe3\xff\x9c\xf1\xe3\xff\x9a\xf0\xe2\
+\xff\x98\xef\xe1\xff\x96\xef\xe0\xff\x93\xee\xde\xff\x8a\xeb\xda\
+\xff\x80\xe8\xd7\xff\x7e\xe7\xd5\xff\x7d\xe7\xd5\xff\x34\xd5\xb9\
+\xff\x16\xcd\xad\xff\x16\xcd\xab\xff\x15\xcc\xaa\xff\x15\xcb\xa8\
+\xff\x15\xca\xa8\xff\x16\xcd\xac\xff\x16\xcd\xab\xff\x15\xcc\xaa\
+\xff\x24\xcf\xaf\xff\x5a\xdb\xc3\xff\x56\xda\xc1\xff\x53\xda\xbf\
+\xff\x4d\xd9\xbe\xff\x4b\xd8\xbd\xff\x47\xd7\xbc\xff\x42\xd6\xb9\
+\xff\x3f\xd5\xb7\xff\x3b\xd2\xb4\xff\x56\xd3\xb6\xff\xff\xff\xff\
+\xff\xfb\xfb\xfb\xf5\xec\xec\xec\x0e\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xf0\xf0\xf0\x12\xfa\xfa\xfa\xf8\xf3\xfd\xfb\
+\xff\x13\xc0\x97\xff\x13\xc8\xa4\xff\x14\xc9\xa5\xff\x17\xd0\xb0\
+\xff\x17\xd0\xb0\xff\x18\xd0\xb1\xff\x25\xd3\xb5\xff\x95\xea\xd9\
+\xff\x96\xea\xda\xff\x98\xec\xdb\xff\x9b\xed\xdd\xff\x9d\xee\xde\
+\xff\x9f\xee\xe0\xff\xa1\xef\xe1\xff\xa3\xef\xe1\xff\x9e\xee\xe0\
+\xff\x96\xed\xdd\xff\x98\xee\xde\xff\x9a\xee\xe0\xff\x55\xde\xc8\
+\xff\x17\xd2\xb4\xff\x1d\xd9\xbe\xff\x1d\xd9\xbe\xff\x1d\xd9\xbe\
+\xff\x4a\xe1\xcb\xff\xaa\xf3\xe7\xff\xa6\xf2\xe6\xff\xa5\xf2\xe5\
+\xff\xa4\xf1\xe4\xff\xa2\xf1\xe3\xff\xa1\xf0\xe3\xff\x9f\xf0\xe2\
+\xff\x9b\xf0\xe1\xff\x9a\xee\xe1\xff\x95\xed\xde\xff\x87\xe9\xd8\
+\xff\x84\xe8\xd7\xff\x81\xe7\xd5\xff\x5f\xde\xc8\xff\x14\xcc\xaa\
+\xff\x15\xcc\xaa\xff\x15\xcb\xa9\xff\x15\xca\xa8\xff\x14\xca\xa6\
+\xff\x15\xcc\xab\xff\x16\xcd\xab\xff\x16\xcd\xab\xff\x1a\xcd\xac\
+\xff\x5a\xdb\xc3\xff\x5d\xdc\xc4\xff\x58\xdb\xc2\xff\x55\xda\xc0\
+\xff\x51\xd9\xbf\xff\x4c\xd9\xbe\xff\x49\xd8\xbc\xff\x44\xd6\xbb\
+\xff\x41\xd5\xb9\xff\x3c\xd2\xb4\xff\x70\xdb\xc1\xff\xff\xff\xff\
+\xff\xfa\xfa\xfa\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xf9\xf9\xdc\xff\xff\xff\
+\xff\x28\xc5\x9f\xff\x12\xc8\xa3\xff\x14\xca\xa6\xff\x17\xd0\xb1\
+\xff\x18\xd0\xb1\xff\x18\xd0\xb1\xff\x34\xd6\xba\xff\x9a\xec\xdb\
+\xff\x99\xec\xdb\xff\x9c\xec\xdb\xff\x9f\xed\xdd\xff\xa1\xee\xde\
+\xff\xa3\xef\xe1\xff\xa5\xef\xe1\xff\xa6\xf0\xe2\xff\x9c\xed\xde\
+\xff\x9a\xed\xdd\xff\x9b\xee\xdf\xff\x9e\xee\xe0\xff\x27\xd2\xb4\
+\xff\x1a\xd3\xb6\xff\x1c\xd6\xbb\xff\x1c\xd7\xbb\xff\x19\xd6\xbb\
+\xff\x82\xe9\xda\xff\xaa\xf2\xe6\xff\xa9\xf2\xe6\xff\xa8\xf2\xe5\
+\xff\xa7\xf1\xe5\xff\xa5\xf1\xe4\xff\xa3\xf0\xe3\xff\xa2\xf0\xe3\
+\xff\x9f\xef\xe1\xff\x9d\xef\xe1\xff\x8f\xea\xda\xff\x8a\xe9\xd8\
+\xff\x87\xe8\xd7\xff\x80\xe6\xd3\xff\x1e\xce\xad\xff\x15\xcb\xa9\
+\xff\x15\xca\xa8\xff\x14\xca\xa7\xff\x14\xc9\xa5\xff\x14\xcb\xa9\
+\xff\x16\xcd\xad\xff\x16\xcd\xab\xff\x14\xcc\xaa\xff\x52\xda\xc0\
+\xff\x65\xde\xc7\xff\x60\xdc\xc6\xff\x5b\xdb\xc4\xff\x57\xdb\xc1\
+\xff\x54\xda\xbf\xff\x4e\xd9\xbe\xff\x4b\xd8\xbd\xff\x47\xd7\xbc\
+\xff\x43\xd6\xba\xff\x3c\xd2\xb2\xff\x8e\xe4\xcf\xff\xff\xff\xff\
+\xff\xf8\xf8\xf8\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xf9\xf9\xb3\xff\xff\xff\
+\xff\x4b\xcf\xaf\xff\x12\xc6\xa1\xff\x15\xcb\xa8\xff\x18\xd0\xb1\
+\xff\x18\xd0\xb1\xff\x17\xd0\xb1\xff\x45\xda\xc0\xff\x9d\xec\xdc\
+\xff\x9d\xed\xdc\xff\xa0\xed\xdd\xff\xa2\xee\xde\xff\xa4\xee\xe0\
+\xff\xa7\xef\xe1\xff\xa8\xf0\xe2\xff\xa9\xf0\xe3\xff\x9c\xed\xdd\
+\xff\x9d\xee\xde\xff\x9e\xee\xe0\xff\x87\xe8\xd6\xff\x13\xcc\xa9\
+\xff\x1a\xd4\xb8\xff\x1c\xd6\xba\xff\x1c\xd6\xba\xff\x24\xd7\xbc\
+\xff\xac\xf1\xe5\xff\xae\xf2\xe7\xff\xad\xf2\xe6\xff\xac\xf2\xe6\
+\xff\xaa\xf1\xe5\xff\xa9\xf1\xe4\xff\xa7\xf0\xe3\xff\xa5\xf0\xe3\
+\xff\xa3\xef\xe2\xff\x9b\xed\xde\xff\x8f\xea\xd9\xff\x8c\xe9\xd8\
+\xff\x8b\xe9\xd7\xff\x44\xd6\xbb\xff\x13\xca\xa7\xff\x14\xca\xa6\
+\xff\x14\xc9\xa6\xff\x14\xc9\xa5\xff\x14\xca\xa7\xff\x16\xce\xad\
+\xff\x16\xce\xad\xff\x14\xcc\xac\xff\x42\xd7\xbb\xff\x6c\xe1\xca\
+\xff\x66\xe0\xc8\xff\x63\xdd\xc7\xff\x5e\xdc\xc5\xff\x5a\xdb\xc2\
+\xff\x55\xda\xc1\xff\x51\xd9\xbf\xff\x4c\xd9\xbe\xff\x4a\xd8\xbd\
+\xff\x45\xd6\xbb\xff\x3b\xd1\xb1\xff\xaa\xe9\xda\xff\xff\xff\xff\
+\xff\xf7\xf7\xf7\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x1f\x1f\
+\x08\x2e\x2e\x2e\xa9\x2e\x2e\x2e\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\
+\xc5\x2d\x2d\x2d\xc5\x2c\x2c\x2c\xc5\x2c\x2c\x2c\xc5\x2d\x2d\x2d\
+\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\
+\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\xc5\x2e\x2e\x2e\
+\xc5\x2f\x2f\x2f\xc0\x2f\x2f\x2f\xba\x2f\x2f\x2f\xba\x31\x31\x31\
+\xba\x31\x31\x31\xba\x32\x32\x32\xba\x32\x32\x32\xba\x32\x32\x32\
+\xba\x34\x34\x31\xba\x33\x30\x25\xb9\xad\xac\xa7\xe4\xff\xff\xff\
+\xff\x78\xdc\xc4\xff\x10\xc4\x9e\xff\x15\xcb\xa9\xff\x18\xd0\xb1\
+\xff\x18\xd0\xb1\xff\x16\xd0\xb1\xff\x5a\xde\xc6\xff\xa0\xed\xdd\
+\xff\xa1\xed\xdd\xff\xa3\xee\xdf\xff\xa6\xee\xe0\xff\xa8\xef\xe1\
+\xff\xaa\xf0\xe2\xff\xab\xf0\xe2\xff\xa7\xee\xe0\xff\x9f\xed\xde\
+\xff\xa1\xee\xdf\xff\xa5\xef\xe1\xff\x55\xda\xc1\xff\x14\xcd\xab\
+\xff\x19\xd4\xb8\xff\x19\xd5\xb7\xff\x19\xd5\xb6\xff\x51\xe0\xc8\
+\xff\xb6\xf3\xe7\xff\xb2\xf2\xe6\xff\xb1\xf2\xe6\xff\xaf\xf2\xe6\
+\xff\xae\xf1\xe5\xff\xac\xf1\xe4\xff\xaa\xf1\xe4\xff\xa8\xf0\xe3\
+\xff\xa4\xef\xe1\xff\x96\xec\xdb\xff\x92\xea\xda\xff\x8f\xe9\xd9\
+\xff\x73\xe1\xcd\xff\x12\xc9\xa6\xff\x14\xc9\xa5\xff\x14\xc9\xa5\
+\xff\x14\xc9\xa5\xff\x14\xc9\xa5\xff\x16\xcd\xad\xff\x16\xce\xad\
+\xff\x14\xce\xac\xff\x2f\xd3\xb5\xff\x73\xe2\xcc\xff\x6e\xe1\xca\
+\xff\x69\xe0\xc9\xff\x65\xdf\xc8\xff\x61\xdd\xc6\xff\x5c\xdc\xc4\
+\xff\x58\xdb\xc2\xff\x54\xda\xc0\xff\x4f\xd9\xbf\xff\x4b\xd8\xbd\
+\xff\x48\xd7\xbc\xff\x3b\xd0\xaf\xff\xc1\xef\xe4\xff\xff\xff\xff\
+\xff\xa5\xa4\x9e\xe6\x34\x31\x25\xc4\x37\x35\x29\xc5\x37\x35\x29\
+\xc5\x37\x35\x29\xc5\x38\x37\x36\xc5\x37\x37\x37\xc5\x37\x37\x37\
+\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x38\x38\x38\
+\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x38\x38\x38\
+\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x37\x37\x37\xc5\x36\x36\x36\
+\xc5\x36\x36\x36\xc5\x36\x36\x36\xc5\x36\x36\x36\xc5\x36\x36\x36\
+\xc5\x37\x37\x37\xc5\x38\x38\x38\xc5\x38\x38\x38\xc5\x38\x38\x38\
+\xc5\x38\x38\x38\xc5\x37\x37\x37\xae\x2f\x2f\x2f\x10\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x3f\x3f\x28\x34\x34\x34\
+\xda\x34\x34\x34\xff\x33\x33\x33\xff\x32\x32\x32\xff\x32\x32\x32\
+\xff\x32\x32\x32\xff\x31\x31\x31\xff\x31\x31\x31\xff\x33\x33\x33\
+\xff\x33\x33\x33\xff\x33\x33\x33\xff\x33\x33\x33\xff\x33\x33\x33\
+\xff\x33\x33\x33\xff\x31\x31\x31\xff\x32\x32\x32\xff\x33\x33\x33\
+\xff\x33\x33\x33\xff\x33\x33\x33\xff\x35\x35\x35\xff\x36\x36\x36\
+\xff\x37\x37\x37\xff\x37\x37\x37\xff\x37\x37\x37\xff\x38\x38\x38\
+\xff\x39\x37\x34\xff\x37\x34\x28\xff\x7a\x78\x71\xff\xff\xff\xff\
+\xff\xa3\xe6\xd5\xff\x0b\xc0\x98\xff\x16\xcc\xaa\xff\x18\xcf\xb1\
+\xff\x18\xd0\xb1\xff\x14\xcf\xb0\xff\x6d\xe2\xcc\xff\xa1\xed\xdd\
+\xff\xa3\xed\xde\xff\xa6\xee\xe0\xff\xa8\xef\xe1\xff\xaa\xef\xe2\
+\xff\xad\xf0\xe3\xff\xaf\xf0\xe3\xff\xa4\xed\xdf\xff\xa2\xed\xde\
+\xff\xa4\xee\xe0\xff\xa6\xee\xe0\xff\x24\xcc\xac\xff\x17\xcf\xaf\
+\xff\x19\xd2\xb4\xff\x1a\xd2\xb4\xff\x15\xd0\xb3\xff\x8f\xea\xda\
+\xff\xb5\xf2\xe6\xff\xb4\xf2\xe6\xff\xb3\xf1\xe6\xff\xb2\xf1\xe5\
+\xff\xb1\xf1\xe5\xff\xaf\xf0\xe4\xff\xac\xf0\xe3\xff\xaa\xef\xe2\
+\xff\x9e\xed\xdd\xff\x98\xea\xda\xff\x95\xe9\xd9\xff\x91\xe8\xd7\
+\xff\x27\xcd\xac\xff\x14\xc8\xa4\xff\x14\xc8\xa4\xff\x14\xc8\xa4\
+\xff\x14\xc8\xa4\xff\x16\xcc\xac\xff\x17\xcd\xad\xff\x17\xcd\xad\
+\xff\x1f\xcf\xaf\xff\x74\xe1\xcb\xff\x74\xe2\xcc\xff\x71\xe1\xca\
+\xff\x6c\xe0\xc9\xff\x66\xde\xc8\xff\x63\xdc\xc6\xff\x5e\xdb\xc4\
+\xff\x5a\xda\xc1\xff\x55\xda\xc0\xff\x51\xd9\xbe\xff\x4c\xd8\xbd\
+\xff\x49\xd7\xbc\xff\x3b\xce\xad\xff\xd8\xf6\xef\xff\xff\xff\xff\
+\xff\x80\x7f\x78\xff\x37\x34\x29\xff\x38\x35\x2a\xff\x38\x35\x2a\
+\xff\x38\x35\x29\xff\x3c\x3a\x36\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\
+\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\
+\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\
+\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\
+\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\
+\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3c\x3c\x3c\
+\xff\x3c\x3c\x3c\xff\x3c\x3c\x3c\xff\x3e\x3e\x3e\xe6\x4b\x4b\x4b\
+\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x45\x45\x5c\x3a\x3a\x3a\
+\xff\x3a\x3a\x3a\xff\x3a\x3a\x3a\xff\x38\x38\x38\xff\x38\x38\x38\
+\xff\x38\x38\x38\xff\x36\x36\x36\xff\x37\x37\x37\xff\x39\x39\x39\
+\xff\x39\x39\x39\xff\x39\x39\x39\xff\x39\x39\x39\xff\x39\x39\x39\
+\xff\x38\x38\x38\xff\x37\x37\x37\xff\x38\x38\x38\xff\x38\x38\x38\
+\xff\x38\x38\x38\xff\x39\x39\x39\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\
+\xff\x3d\x3d\x3d\xff\x3d\x3d\x3d\xff\x3e\x3e\x3e\xff\x3e\x3e\x3e\
+\xff\x3b\x3a\x34\xff\x35\x32\x27\xff\x56\x53\x4a\xff\xfb\xfb\xfc\
+\xff\xc5\xee\xe4\xff\x07\xb9\x90\xff\x14\xc8\xa7\xff\x16\xcb\xab\
+\xff\x16\xcb\xab\xff\x12\xcb\xaa\xff\x7c\xe1\xcd\xff\x9e\xe8\xd9\
+\xff\xa1\xe9\xda\xff\xa4\xea\xdb\xff\xa6\xea\xdd\xff\xa8\xeb\xde\
+\xff\xaa\xec\xdf\xff\xaa\xeb\xdf\xff\xa0\xe8\xda\xff\xa1\xe9\xda\
+\xff\xa3\xe9\xdb\xff\x88\xe2\xd0\xff\x0e\xc1\x9e\xff\x17\xcb\xad\
+\xff\x17\xcc\xae\xff\x17\xcc\xae\xff\x23\xcf\xb2\xff\xb3\xed\xe2\
+\xff\xb3\xed\xe2\xff\xb2\xed\xe2\xff\xb1\xed\xe1\xff\xb0\xec\xe1\
+\xff\xae\xec\xe0\xff\xac\xec\xe0\xff\xaa\xeb\xdf\xff\xa4\xea\xdc\
+\xff\x97\xe6\xd7\xff\x95\xe5\xd6\xff\x94\xe5\xd6\xff\x54\xd4\xba\
+\xff\x0f\xc1\x9e\xff\x11\xc1\x9f\xff\x11\xc1\x9f\xff\x11\xc1\x9f\
+\xff\x13\xc6\xa5\xff\x15\xc9\xa8\xff\x15\xc8\xa8\xff\x15\xc9\xa7\
+\xff\x67\xdb\xc5\xff\x77\xde\xca\xff\x72\xde\xc8\xff\x6d\xdc\xc6\
+\xff\x69\xdb\xc4\xff\x64\xda\xc2\xff\x60\xd9\xc1\xff\x5b\xd7\xbf\
+\xff\x57\xd7\xbe\xff\x53\xd5\xbc\xff\x4f\xd5\xbb\xff\x4a\xd3\xb9\
+\xff\x46\xd2\xb7\xff\x3e\xca\xaa\xff\xeb\xf9\xf7\xff\xfd\xfd\xfd\
+\xff\x63\x61\x59\xff\x34\x32\x27\xff\x34\x32\x27\xff\x34\x32\x27\
+\xff\x35\x32\x27\xff\x3c\x3b\x35\xff\x41\x41\x41\xff\x42\x42\x42\
+\xff\x43\x43\x43\xff\x43\x43\x43\xff\x43\x43\x43\xff\x43\x43\x43\
+\xff\x43\x43\x43\xff\x43\x43\x43\xff\x43\x43\x43\xff\x43\x43\x43\
+\xff\x42\x42\x42\xff\x40\x40\x40\xff\x40\x40\x40\xff\x40\x40\x40\
+\xff\x40\x40\x40\xff\x40\x40\x40\xff\x42\x42\x42\xff\x42\x42\x42\
+\xff\x42\x42\x42\xff\x42\x42\x42\xff\x42\x42\x42\xff\x41\x41\x41\
+\xff\x40\x40\x40\xff\x40\x40\x40\xff\x45\x45\x45\xff\x59\x59\x59\
+\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5a\x5a\x5a\x66\x40\x40\x40\
+\xff\x40\x40\x40\xff\x40\x40\x40\xff\x3f\x3f\x3f\xff\x3e\x3e\x3e\
+\xff\x3e\x3e\x3e\xff\x3e\x3e\x3e\xff\x40\x40\x40\xff\x42\x42\x42\
+\xff\x41\x41\x41\xff\x41\x41\x41\xff\x42\x42\x42\xff\x42\x42\x42\
+\xff\x3e\x3e\x3e\xff\x3e\x3e\x3e\xff\x3e\x3e\x3e\xff\x3e\x3e\x3e\
+\xff\x3f\x3f\x3f\xff\x41\x41\x41\xff\x43\x43\x43\xff\x43\x43\x43\
+\xff\x45\x45\x45\xff\x45\x45\x45\xff\x45\x45\x45\xff\x48\x48\x48\
+\xff\x38\x37\x30\xff\x31\x2d\x24\xff\x39\x35\x2c\xff\xe7\xe7\xe7\
+\xff\xe3\xef\xec\xff\x0b\xae\x84\xff\x12\xbe\x9d\xff\x12\xc0\xa0\
+\xff\x12\xc0\xa0\xff\x10\xc0\xa1\xff\x82\xda\xc9\xff\x96\xde\xd0\
+\xff\x99\xdf\xd1\xff\x9c\xe0\xd2\xff\x9e\xe0\xd3\xff\xa1\xe1\xd5\
+\xff\xa3\xe2\xd6\xff\x9e\xe0\xd3\xff\x97\xde\xd1\xff\x99\xdf\xd1\
+\xff\x9d\xe0\xd3\xff\x4d\xc9\xaf\xff\x0e\xba\x98\xff\x14\xc2\xa4\
+\xff\x14\xc2\xa3\xff\x13\xc2\xa3\xff\x51\xcf\xb9\xff\xaf\xe4\xda\
+\xff\xac\xe3\xd8\xff\xab\xe3\xd8\xff\xa9\xe3\xd7\xff\xa7\xe2\xd7\
+\xff\xa6\xe2\xd7\xff\xa4\xe1\xd6\xff\xa2\xe1\xd4\xff\x93\xdd\xcf\
+\xff\x8f\xdd\xcd\xff\x8d\xdc\xcc\xff\x7a\xd6\xc4\xff\x11\xb7\x95\
+\xff\x0f\xb7\x94\xff\x0f\xb7\x94\xff\x0f\xb7\x94\xff\x10\xba\x98\
+\xff\x12\xbe\x9d\xff\x12\xbe\x9d\xff\x10\xbd\x9c\xff\x4c\xcc\xb3\
+\xff\x75\xd6\xc3\xff\x6e\xd4\xc0\xff\x69\xd3\xbe\xff\x65\xd2\xbc\
+\xff\x61\xd1\xba\xff\x5c\xd0\xb9\xff\x58\xcf\xb7\xff\x55\xcd\xb5\
+\xff\x50\xcc\xb4\xff\x4c\xcb\xb1\xff\x49\xca\xb0\xff\x45\xc9\xae\
+\xff\x40\xc7\xac\xff\x41\xc0\xa1\xff\xf3\xf5\xf4\xff\xf0\xf0\xf0\
+\xff\x47\x45\x3d\xff\x2f\x2c\x23\xff\x2f\x2c\x23\xff\x2f\x2c\x23\
+\xff\x31\x2d\x24\xff\x3a\x38\x31\xff\x4a\x4a\x4b\xff\x4b\x4b\x4b\
+\xff\x4b\x4b\x4b\xff\x4b\x4b\x4b\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\
+\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\
+\xff\x47\x47\x47\xff\x46\x46\x46\xff\x46\x46\x46\xff\x46\x46\x46\
+\xff\x46\x46\x46\xff\x48\x48\x48\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\
+\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\xff\x48\x48\x48\xff\x46\x46\x46\
+\xff\x46\x46\x46\xff\x46\x46\x46\xff\x4e\x4e\x4e\xff\x6a\x6a\x6a\
+\x59\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x83\x83\x83\x69\x4e\x4e\x4e\
+\xff\x49\x49\x49\xff\x48\x48\x48\xff\x47\x47\x47\xff\x47\x47\x47\
+\xff\x46\x46\x46\xff\x46\x46\x46\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\
+\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\xff\x4a\x4a\x4a\xff\x49\x49\x49\
+\xff\x45\x45\x45\xff\x45\x45\x45\xff\x46\x46\x46\xff\x46\x46\x46\
+\xff\x47\x47\x47\xff\x4c\x4c\x4c\xff\x4c\x4c\x4c\xff\x4c\x4c\x4c\
+\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x4e\x4e\x4e\xff\x4e\x4e\x4e\
+\xff\x32\x30\x29\xff\x28\x25\x1d\xff\x24\x21\x19\xff\xc4\xc3\xc2\
+\xff\xe5\xe4\xe5\xff\x1c\xa3\x7d\xff\x0e\xaf\x8e\xff\x0e\xb1\x91\
+\xff\x0e\xb1\x92\xff\x11\xb1\x93\xff\x80\xcd\xbe\xff\x89\xcf\xc1\
+\xff\x8c\xd0\xc2\xff\x8f\xd1\xc3\xff\x91\xd1\xc5\xff\x93\xd2\xc6\
+\xff\x97\xd2\xc7\xff\x8c\xd0\xc2\xff\x8b\xd0\xc2\xff\x8d\xd0\xc3\
+\xff\x8f\xd1\xc4\xff\x19\xab\x8a\xff\x0d\xaf\x8e\xff\x0e\xb2\x94\
+\xff\x0e\xb2\x94\xff\x0b\xb1\x92\xff\x80\xcd\xbe\xff\x9f\xd4\xca\
+\xff\x9e\xd4\xca\xff\x9e\xd4\xca\xff\x9d\xd4\xc9\xff\x9b\xd3\xc8\
+\xff\x99\xd3\xc8\xff\x97\xd2\xc7\xff\x8e\xd0\xc3\xff\x86\xcf\xc0\
+\xff\x82\xce\xbf\xff\x82\xcd\xbf\xff\x27\xb0\x91\xff\x0b\xa8\x83\
+\xff\x0b\xa8\x83\xff\x0b\xa8\x83\xff\x0c\xa9\x85\xff\x0d\xae\x8e\
+\xff\x0d\xae\x8f\xff\x0c\xad\x8d\xff\x2d\xb7\x9b\xff\x6c\xc8\xb6\
+\xff\x65\xc6\xb4\xff\x61\xc5\xb1\xff\x5b\xc4\xb0\xff\x58\xc3\xad\
+\xff\x53\xc1\xac\xff\x50\xc1\xaa\xff\x4c\xbf\xa8\xff\x49\xbe\xa6\
+\xff\x45\xbd\xa5\xff\x42\xbb\xa2\xff\x3e\xba\xa0\xff\x3b\xb9\x9e\
+\xff\x35\xb6\x9a\xff\x47\xb5\x97\xff\xe9\xe6\xe8\xff\xd7\xd7\xd7\
+\xff\x2e\x2c\x24\xff\x27\x24\x1b\xff\x27\x24\x1b\xff\x27\x25\x1c\
+\xff\x28\x26\x1d\xff\x35\x32\x2b\xff\x55\x56\x56\xff\x53\x53\x53\
+\xff\x53\x53\x53\xff\x53\x53\x53\xff\x52\x52\x52\xff\x52\x52\x52\
+\xff\x52\x52\x52\xff\x52\x52\x52\xff\x51\x51\x51\xff\x4d\x4d\x4d\
+\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\
+\xff\x50\x50\x50\xff\x52\x52\x52\xff\x52\x52\x52\xff\x52\x52\x52\
+\xff\x51\x51\x51\xff\x4e\x4e\x4e\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\
+\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x5a\x5a\x5a\xff\x74\x74\x74\
+\x5e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x64\x64\x64\x6b\x68\x68\x68\
+\xff\x4f\x4f\x4f\xff\x4f\x4f\x4f\xff\x4f\x4f\x4f\xff\x4e\x4e\x4e\
+\xff\x4e\x4e\x4e\xff\x4f\x4f\x4f\xff\x54\x54\x54\xff\x53\x53\x53\
+\xff\x53\x53\x53\xff\x53\x53\x53\xff\x53\x53\x53\xff\x4e\x4e\x4e\
+\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x4d\x4d\x4d\xff\x4e\x4e\x4e\
+\xff\x52\x52\x52\xff\x55\x55\x55\xff\x55\x55\x55\xff\x55\x55\x55\
+\xff\x55\x55\x55\xff\x56\x56\x56\xff\x55\x55\x55\xff\x53\x53\x54\
+\xff\x21\x1f\x1b\xff\x18\x14\x12\xff\x12\x0e\x0b\xff\x93\x92\x91\
+\xff\xd5\xd1\xd3\xff\x35\x9b\x7b\xff\x09\x9c\x7c\xff\x0a\x9e\x7e\
+\xff\x0a\x9e\x7f\xff\x13\xa1\x83\xff\x75\xbb\xae\xff\x79\xbd\xaf\
+\xff\x7c\xbe\xb0\xff\x7f\xbe\xb2\xff\x82\xbf\xb3\xff\x84\xc0\xb4\
+\xff\x84\xc0\xb4\xff\x7a\xbd\xaf\xff\x7c\xbe\xb0\xff\x7e\xbe\xb1\
+\xff\x65\xb6\xa5\xff\x04\x94\x70\xff\x0a\x9f\x81\xff\x0a\x9f\x81\
+\xff\x0a\x9f\x81\xff\x17\xa3\x87\xff\x91\xc3\xb9\xff\x91\xc3\xb9\
+\xff\x90\xc2\xb8\xff\x8e\xc2\xb8\xff\x8d\xc2\xb7\xff\x8b\xc1\xb7\
+\xff\x8a\xc1\xb6\xff\x85\xc0\xb5\xff\x78\xbd\xaf\xff\x76\xbb\xae\
+\xff\x74\xbb\xad\xff\x49\xad\x97\xff\x05\x94\x70\xff\x07\x94\x71\
+\xff\x07\x94\x71\xff\x07\x95\x71\xff\x09\x9b\x7b\xff\x09\x9c\x7b\
+\xff\x09\x9b\x7b\xff\x15\x9f\x81\xff\x5c\xb5\xa3\xff\x5a\xb4\xa2\
+\xff\x55\xb3\xa1\xff\x51\xb3\x9f\xff\x4b\xb1\x9e\xff\x47\xaf\x9b\
+\xff\x44\xaf\x9a\xff\x41\xad\x97\xff\x3e\xad\x96\xff\x3b\xab\x94\
+\xff\x38\xaa\x92\xff\x35\xa9\x90\xff\x32\xa7\x8e\xff\x2d\xa5\x8a\
+\xff\x29\xa2\x85\xff\x4d\xa8\x8e\xff\xd7\xd3\xd4\xff\xb5\xb5\xb4\
+\xff\x15\x14\x0d\xff\x16\x15\x0f\xff\x16\x14\x0e\xff\x16\x15\x0e\
+\xff\x18\x16\x10\xff\x25\x22\x1d\xff\x5e\x5e\x5e\xff\x5a\x5a\x5a\
+\xff\x5a\x5a\x5a\xff\x5a\x5a\x5a\xff\x5a\x5a\x5a\xff\x5a\x5a\x5a\
+\xff\x5a\x5a\x5a\xff\x58\x58\x58\xff\x54\x54\x54\xff\x54\x54\x54\
+\xff\x54\x54\x54\xff\x54\x54\x54\xff\x54\x54\x54\xff\x57\x57\x57\
+\xff\x59\x59\x59\xff\x59\x59\x59\xff\x59\x59\x59\xff\x59\x59\x59\
+\xff\x55\x55\x55\xff\x53\x53\x53\xff\x53\x53\x53\xff\x53\x53\x53\
+\xff\x53\x53\x53\xff\x54\x54\x54\xff\x64\x64\x64\xff\x73\x73\x73\
+\x5f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5e\x5e\x5e\x69\x70\x70\x70\
+\xff\x56\x56\x56\xff\x56\x56\x56\xff\x55\x55\x55\xff\x55\x55\x55\
+\xff\x55\x55\x55\xff\x57\x57\x57\xff\x5b\x5b\x5b\xff\x5b\x5b\x5b\
+\xff\x5b\x5b\x5b\xff\x5b\x5b\x5b\xff\x59\x59\x59\xff\x54\x54\x54\
+\xff\x54\x54\x54\xff\x54\x54\x54\xff\x55\x55\x55\xff\x55\x55\x55\
+\xff\x5b\x5b\x5b\xff\x5c\x5c\x5c\xff\x5c\x5c\x5c\xff\x5c\x5c\x5c\
+\xff\x5d\x5d\x5d\xff\x5d\x5d\x5d\xff\x58\x58\x58\xff\x57\x56\x56\
+\xff\x13\x10\x0e\xff\x0c\x0b\x09\xff\x0a\x07\x05\xff\x5f\x5e\x5d\
+\xff\xbd\xba\xbb\xff\x4a\x93\x7b\xff\x03\x86\x66\xff\x05\x88\x6b\
+\xff\x05\x88\x6b\xff\x16\x8f\x74\xff\x66\xa8\x9b\xff\x68\xa8\x9b\
+\xff\x6b\xa9\x9d\xff\x6d\xaa\x9e\xff\x70\xaa\x9f\xff\x72\xab\xa0\
+\xff\x6f\xaa\x9e\xff\x69\xa8\x9c\xff\x6b\xa9\x9c\xff\x6f\xaa\x9e\
+\xff\x2f\x92\x79\xff\x03\x83\x62\xff\x05\x8b\x6e\xff\x05\x8b\x6d\
+\xff\x04\x8b\x6d\xff\x39\x9a\x85\xff\x82\xae\xa6\xff\x7f\xad\xa5\
+\xff\x7f\xad\xa4\xff\x7e\xad\xa3\xff\x7c\xad\xa3\xff\x7a\xac\xa2\
+\xff\x79\xac\xa2\xff\x6c\xa9\x9d\xff\x68\xa8\x9b\xff\x65\xa7\x9a\
+\xff\x5b\xa4\x95\xff\x08\x82\x61\xff\x02\x80\x5d\xff\x02\x80\x5d\
+\xff\x02\x80\x5d\xff\x03\x85\x65\xff\x05\x87\x69\xff\x04\x87\x68\
+\xff\x05\x87\x69\xff\x44\x9e\x8b\xff\x4d\xa1\x90\xff\x48\xa0\x8e\
+\xff\x45\x9e\x8d\xff\x3f\x9e\x8b\xff\x3b\x9c\x89\xff\x36\x9b\x87\
+\xff\x34\x9a\x85\xff\x31\x99\x83\xff\x2e\x98\x83\xff\x2c\x96\x80\
+\xff\x2a\x95\x7f\xff\x27\x93\x7b\xff\x23\x91\x77\xff\x21\x90\x76\
+\xff\x1e\x8d\x71\xff\x53\x97\x82\xff\xbd\xbb\xbc\xff\x90\x8f\x8f\
+\xff\x0a\x08\x05\xff\x0f\x0d\x09\xff\x0f\x0d\x09\xff\x0f\x0d\x09\
+\xff\x11\x0f\x0b\xff\x1b\x18\x13\xff\x62\x62\x61\xff\x61\x61\x61\
+\xff\x61\x61\x61\xff\x60\x60\x60\xff\x61\x61\x61\xff\x60\x60\x60\
+\xff\x5d\x5d\x5d\xff\x59\x59\x59\xff\x59\x59\x59\xff\x59\x59\x59\
+\xff\x59\x59\x59\xff\x59\x59\x59\xff\x5e\x5e\x5e\xff\x60\x60\x60\
+\xff\x60\x60\x60\xff\x60\x60\x60\xff\x60\x60\x60\xff\x5a\x5a\x5a\
+\xff\x59\x59\x59\xff\x59\x59\x59\xff\x59\x59\x59\xff\x59\x59\x59\
+\xff\x59\x59\x59\xff\x59\x59\x59\xff\x6c\x6c\x6c\xff\x69\x69\x69\
+\x5e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6b\x69\x6b\x66\x72\x72\x72\
+\xff\x5a\x5a\x5a\xff\x5c\x5c\x5c\xff\x5b\x5b\x5b\xff\x5b\x5b\x5b\
+\xff\x5b\x5b\x5b\xff\x5f\x5f\x5f\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x5d\x5d\x5d\xff\x5a\x5a\x5a\
+\xff\x5a\x5a\x5a\xff\x5a\x5a\x5a\xff\x5a\x5a\x5a\xff\x5f\x5f\x5f\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x5f\x5f\x5f\xff\x5c\x5c\x5c\xff\x53\x52\x52\
+\xff\x08\x06\x05\xff\x04\x02\x02\xff\x03\x01\x01\xff\x34\x34\x33\
+\xff\xa3\xa3\xa3\xff\x5f\x8c\x7d\xff\x00\x6f\x4f\xff\x00\x75\x58\
+\xff\x00\x75\x58\xff\x18\x7e\x67\xff\x56\x92\x86\xff\x57\x92\x86\
+\xff\x59\x93\x87\xff\x5c\x94\x89\xff\x5e\x94\x8a\xff\x62\x95\x8b\
+\xff\x59\x93\x87\xff\x58\x92\x87\xff\x5a\x93\x88\xff\x5c\x94\x89\
+\xff\x08\x70\x50\xff\x00\x73\x56\xff\x00\x76\x5b\xff\x00\x76\x5b\
+\xff\x00\x76\x5a\xff\x58\x92\x87\xff\x6e\x98\x91\xff\x6e\x98\x91\
+\xff\x6d\x98\x90\xff\x6c\x98\x90\xff\x6a\x98\x8f\xff\x69\x97\x8f\
+\xff\x62\x95\x8b\xff\x59\x93\x87\xff\x57\x92\x86\xff\x57\x92\x87\
+\xff\x1c\x79\x5f\xff\x00\x6c\x4a\xff\x00\x6c\x4a\xff\x00\x6c\x4a\
+\xff\x00\x6f\x50\xff\x00\x73\x56\xff\x00\x73\x55\xff\x00\x72\x55\
+\xff\x2a\x84\x70\xff\x41\x8d\x7e\xff\x3d\x8b\x7c\xff\x39\x8b\x7a\
+\xff\x35\x89\x79\xff\x30\x88\x77\xff\x2c\x87\x76\xff\x27\x86\x74\
+\xff\x24\x85\x72\xff\x22\x84\x70\xff\x20\x83\x6e\xff\x1e\x82\x6c\
+\xff\x1c\x80\x6a\xff\x19\x7d\x65\xff\x17\x7c\x64\xff\x16\x7b\x63\
+\xff\x08\x6d\x4d\xff\x4e\x84\x71\xff\xa5\xa4\xa4\xff\x66\x65\x64\
+\xff\x03\x02\x01\xff\x06\x04\x02\xff\x06\x04\x02\xff\x06\x05\x02\
+\xff\x08\x06\x03\xff\x0e\x0b\x08\xff\x61\x61\x60\xff\x66\x66\x66\
+\xff\x66\x66\x66\xff\x66\x66\x66\xff\x66\x66\x66\xff\x63\x63\x63\
+\xff\x5e\x5e\x5e\xff\x5e\x5e\x5e\xff\x5e\x5e\x5e\xff\x5f\x5f\x5f\
+\xff\x5e\x5e\x5e\xff\x63\x63\x63\xff\x66\x66\x66\xff\x66\x66\x66\
+\xff\x66\x66\x66\xff\x64\x64\x64\xff\x5f\x5f\x5f\xff\x5e\x5e\x5e\
+\xff\x5e\x5e\x5e\xff\x5e\x5e\x5e\xff\x5e\x5e\x5e\xff\x5e\x5e\x5e\
+\xff\x5e\x5e\x5e\xff\x5d\x5d\x5d\xff\x72\x72\x72\xff\x63\x61\x61\
+\x5c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8e\x89\x89\x64\x6c\x6c\x6c\
+\xff\x63\x63\x63\xff\x61\x61\x61\xff\x61\x61\x61\xff\x61\x61\x61\
+\xff\x60\x60\x60\xff\x67\x67\x67\xff\x68\x68\x68\xff\x69\x69\x69\
+\xff\x68\x68\x68\xff\x67\x67\x67\xff\x5f\x5f\x5f\xff\x5f\x5f\x5f\
+\xff\x5f\x5f\x5f\xff\x5f\x5f\x5f\xff\x61\x61\x61\xff\x68\x68\x68\
+\xff\x68\x68\x68\xff\x69\x69\x69\xff\x69\x69\x69\xff\x69\x69\x69\
+\xff\x68\x68\x68\xff\x61\x61\x61\xff\x62\x62\x62\xff\x49\x48\x48\
+\xff\x02\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x16\x15\x15\
+\xff\x88\x88\x88\xff\x68\x80\x79\xff\x00\x58\x3a\xff\x00\x5f\x45\
+\xff\x00\x5f\x46\xff\x1a\x6c\x58\xff\x44\x7b\x70\xff\x45\x7c\x71\
+\xff\x48\x7c\x72\xff\x4a\x7d\x73\xff\x4d\x7d\x74\xff\x4f\x7d\x75\
+\xff\x45\x7b\x70\xff\x48\x7c\x72\xff\x4a\x7c\x72\xff\x37\x75\x66\
+\xff\x00\x57\x38\xff\x00\x60\x47\xff\x00\x61\x47\xff\x00\x61\x47\
+\xff\x0a\x65\x4e\xff\x5d\x82\x7a\xff\x5c\x82\x79\xff\x5c\x81\x79\
+\xff\x5c\x81\x79\xff\x5a\x81\x79\xff\x59\x81\x79\xff\x55\x80\x78\
+\xff\x4b\x7d\x73\xff\x49\x7c\x72\xff\x46\x7c\x72\xff\x2f\x71\x62\
+\xff\x00\x57\x37\xff\x00\x58\x38\xff\x00\x58\x38\xff\x00\x59\x3b\
+\xff\x00\x5f\x44\xff\x00\x5e\x43\xff\x00\x5e\x42\xff\x14\x69\x54\
+\xff\x35\x77\x6b\xff\x31\x76\x69\xff\x2d\x75\x67\xff\x29\x74\x65\
+\xff\x25\x73\x64\xff\x21\x72\x62\xff\x1e\x71\x61\xff\x18\x70\x5f\
+\xff\x15\x6f\x5d\xff\x14\x6e\x5c\xff\x13\x6d\x5a\xff\x11\x6b\x56\
+\xff\x0e\x69\x53\xff\x0d\x68\x51\xff\x0c\x66\x50\xff\x02\x5c\x3f\
+\xff\x00\x51\x2f\xff\x58\x77\x6a\xff\x8a\x89\x89\xff\x44\x43\x43\
+\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\
+\xff\x01\x01\x00\xff\x06\x04\x01\xff\x59\x59\x58\xff\x6c\x6c\x6c\
+\xff\x6b\x6b\x6b\xff\x6b\x6b\x6b\xff\x67\x67\x67\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x68\x68\x68\xff\x6b\x6b\x6b\xff\x6b\x6b\x6b\xff\x6b\x6b\x6b\
+\xff\x68\x68\x68\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x6c\x6c\x6c\xff\x82\x7f\x7f\
+\x5a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9d\x98\x98\x61\x7a\x77\x78\
+\xff\x67\x67\x67\xff\x64\x64\x64\xff\x64\x64\x64\xff\x64\x64\x64\
+\xff\x64\x64\x64\xff\x6d\x6d\x6d\xff\x6e\x6e\x6e\xff\x6d\x6d\x6d\
+\xff\x6d\x6d\x6d\xff\x66\x66\x66\xff\x63\x63\x63\xff\x63\x63\x63\
+\xff\x63\x63\x63\xff\x63\x63\x63\xff\x68\x68\x68\xff\x6e\x6e\x6e\
+\xff\x6e\x6e\x6e\xff\x6e\x6e\x6e\xff\x6e\x6e\x6e\xff\x6d\x6d\x6d\
+\xff\x65\x65\x65\xff\x64\x64\x64\xff\x66\x66\x66\xff\x3a\x39\x38\
+\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x01\x01\x01\
+\xff\x68\x68\x68\xff\x64\x6f\x6c\xff\x00\x47\x2b\xff\x00\x4d\x35\
+\xff\x00\x4d\x34\xff\x16\x5b\x4b\xff\x34\x66\x5d\xff\x36\x67\x5d\
+\xff\x39\x68\x5e\xff\x3b\x69\x5f\xff\x3e\x6a\x61\xff\x3b\x68\x60\
+\xff\x37\x67\x5e\xff\x39\x68\x5f\xff\x3c\x6a\x60\xff\x15\x54\x40\
+\xff\x00\x48\x2d\xff\x00\x4f\x38\xff\x00\x4f\x37\xff\x00\x4f\x37\
+\xff\x20\x5d\x4e\xff\x4e\x6d\x67\xff\x4c\x6d\x65\xff\x4c\x6d\x65\
+\xff\x4b\x6d\x65\xff\x4a\x6c\x66\xff\x4a\x6c\x65\xff\x41\x6a\x62\
+\xff\x3c\x69\x60\xff\x3b\x69\x5f\xff\x36\x67\x5d\xff\x05\x4a\x30\
+\xff\x00\x46\x2a\xff\x00\x46\x2a\xff\x00\x46\x2a\xff\x00\x4c\x33\
+\xff\x00\x4d\x33\xff\x00\x4d\x33\xff\x06\x52\x3b\xff\x29\x64\x59\
+\xff\x27\x64\x58\xff\x24\x64\x57\xff\x21\x63\x56\xff\x1d\x61\x54\
+\xff\x19\x60\x52\xff\x16\x5f\x51\xff\x12\x5f\x50\xff\x0e\x5e\x4e\
+\xff\x0a\x5d\x4d\xff\x09\x5c\x4a\xff\x08\x5a\x47\xff\x06\x58\x44\
+\xff\x05\x57\x42\xff\x04\x54\x3f\xff\x00\x49\x2d\xff\x00\x46\x2a\
+\xff\x00\x41\x22\xff\x53\x69\x61\xff\x73\x73\x73\xff\x25\x25\x25\
+\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\
+\xff\x00\x00\x00\xff\x00\x00\x00\xff\x4e\x4d\x4d\xff\x70\x70\x70\
+\xff\x6f\x6f\x6f\xff\x6a\x6a\x6a\xff\x65\x65\x65\xff\x65\x65\x65\
+\xff\x65\x65\x65\xff\x65\x65\x65\xff\x65\x65\x65\xff\x6c\x6c\x6c\
+\xff\x6f\x6f\x6f\xff\x6f\x6f\x6f\xff\x70\x70\x70\xff\x6a\x6a\x6a\
+\xff\x65\x65\x65\xff\x65\x65\x65\xff\x66\x66\x66\xff\x65\x65\x65\
+\xff\x65\x65\x65\xff\x65\x65\x65\xff\x65\x65\x65\xff\x65\x65\x65\
+\xff\x65\x65\x65\xff\x65\x65\x65\xff\x79\x77\x77\xff\x9b\x95\x95\
+\x57\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9f\x97\x9a\x5b\x9f\x99\x9a\
+\xff\x70\x6f\x6f\xff\x60\x60\x60\xff\x65\x65\x65\xff\x67\x67\x67\
+\xff\x69\x69\x69\xff\x72\x72\x72\xff\x72\x72\x72\xff\x71\x71\x71\
+\xff\x70\x70\x70\xff\x66\x66\x66\xff\x66\x66\x66\xff\x66\x66\x66\
+\xff\x66\x66\x66\xff\x66\x66\x66\xff\x71\x71\x71\xff\x71\x71\x71\
+\xff\x71\x71\x71\xff\x72\x72\x72\xff\x72\x72\x72\xff\x6b\x6b\x6b\
+\xff\x67\x67\x67\xff\x67\x67\x67\xff\x68\x68\x68\xff\x64\x64\x64\
+\xff\x37\x36\x36\xff\x30\x30\x30\xff\x31\x31\x31\xff\x31\x31\x31\
+\xff\x66\x66\x66\xff\x6f\x6f\x6f\xff\x36\x69\x5a\xff\x33\x6b\x5e\
+\xff\x34\x6c\x5e\xff\x51\x77\x6f\xff\x5f\x7c\x76\xff\x61\x7c\x77\
+\xff\x63\x7d\x78\xff\x64\x7e\x78\xff\x65\x7c\x78\xff\x5b\x75\x6f\
+\xff\x5b\x75\x70\xff\x5c\x75\x71\xff\x5e\x76\x72\xff\x38\x65\x57\
+\xff\x36\x66\x59\xff\x35\x68\x5c\xff\x34\x67\x5b\xff\x34\x67\x5a\
+\xff\x5b\x74\x6f\xff\x67\x78\x74\xff\x67\x79\x74\xff\x67\x79\x75\
+\xff\x67\x79\x74\xff\x62\x74\x70\xff\x5d\x70\x6c\xff\x59\x6f\x6b\
+\xff\x57\x6f\x6a\xff\x57\x6f\x6a\xff\x43\x67\x5e\xff\x34\x5b\x4c\
+\xff\x33\x5b\x4c\xff\x33\x5b\x4c\xff\x33\x5e\x50\xff\x33\x5f\x52\
+\xff\x33\x5f\x51\xff\x33\x5e\x51\xff\x48\x6a\x62\xff\x4c\x6b\x64\
+\xff\x44\x64\x5e\xff\x41\x63\x5c\xff\x40\x62\x5b\xff\x3e\x61\x5b\
+\xff\x3c\x60\x59\xff\x3a\x5f\x58\xff\x38\x5f\x57\xff\x36\x5e\x56\
+\xff\x34\x5e\x55\xff\x31\x5c\x53\xff\x2f\x5b\x51\xff\x2f\x5b\x51\
+\xff\x2e\x5a\x4f\xff\x2e\x52\x44\xff\x2b\x4f\x41\xff\x24\x47\x38\
+\xff\x24\x45\x35\xff\x48\x4d\x4b\xff\x4f\x4e\x4e\xff\x2d\x2d\x2c\
+\xff\x21\x21\x21\xff\x23\x23\x23\xff\x24\x24\x24\xff\x24\x24\x24\
+\xff\x24\x24\x23\xff\x28\x28\x28\xff\x68\x68\x67\xff\x73\x73\x73\
+\xff\x6c\x6c\x6c\xff\x67\x67\x67\xff\x67\x67\x67\xff\x67\x67\x67\
+\xff\x67\x67\x67\xff\x67\x67\x67\xff\x6f\x6f\x6f\xff\x72\x72\x72\
+\xff\x72\x72\x72\xff\x72\x72\x72\xff\x6b\x6b\x6b\xff\x67\x67\x67\
+\xff\x67\x67\x67\xff\x67\x67\x67\xff\x67\x67\x67\xff\x67\x67\x67\
+\xff\x67\x67\x67\xff\x67\x67\x67\xff\x65\x65\x65\xff\x60\x60\x60\
+\xff\x5f\x5f\x5f\xff\x7e\x7b\x7c\xff\x9b\x96\x97\xff\x99\x93\x96\
+\x53\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x9a\x9d\x56\xa1\x9b\x9c\
+\xff\xa3\x9d\x9f\xff\x8f\x8b\x8c\xff\x78\x76\x76\xff\x70\x6e\x6f\
+\xff\x74\x73\x73\xff\x78\x77\x77\xff\x78\x77\x77\xff\x78\x77\x77\
+\xff\x71\x70\x70\xff\x6b\x6a\x6a\xff\x6b\x6a\x6a\xff\x6a\x69\x69\
+\xff\x69\x68\x68\xff\x6d\x6d\x6d\xff\x74\x73\x73\xff\x73\x72\x73\
+\xff\x72\x72\x72\xff\x6f\x6f\x6f\xff\x6e\x6d\x6d\xff\x65\x63\x64\
+\xff\x65\x64\x64\xff\x64\x64\x64\xff\x64\x63\x63\xff\x64\x63\x64\
+\xff\x67\x66\x67\xff\x68\x67\x67\xff\x69\x67\x67\xff\x69\x68\x68\
+\xff\x68\x66\x67\xff\x68\x66\x67\xff\x6a\x67\x67\xff\x6a\x67\x68\
+\xff\x6b\x68\x68\xff\x6b\x68\x68\xff\x6b\x69\x69\xff\x6b\x6a\x6a\
+\xff\x6d\x6b\x6b\xff\x6d\x6c\x6c\xff\x6f\x6d\x6d\xff\x70\x6f\x6f\
+\xff\x71\x6f\x6f\xff\x71\x70\x70\xff\x73\x71\x71\xff\x75\x73\x73\
+\xff\x76\x73\x74\xff\x76\x74\x74\xff\x78\x76\x76\xff\x79\x77\x77\
+\xff\x78\x77\x77\xff\x79\x78\x78\xff\x7a\x79\x79\xff\x7c\x7a\x7a\
+\xff\x7c\x7b\x7c\xff\x7d\x7c\x7d\xff\x7e\x7d\x7e\xff\x7f\x7e\x7e\
+\xff\x80\x7f\x7f\xff\x81\x80\x80\xff\x82\x80\x80\xff\x81\x7f\x80\
+\xff\x80\x7e\x7f\xff\x7f\x7e\x7e\xff\x7f\x7d\x7e\xff\x7e\x7c\x7c\
+\xff\x7d\x7a\x7b\xff\x7d\x7a\x7b\xff\x7a\x79\x79\xff\x79\x78\x78\
+\xff\x79\x78\x78\xff\x78\x76\x77\xff\x77\x76\x76\xff\x76\x74\x75\
+\xff\x74\x73\x73\xff\x74\x73\x73\xff\x73\x72\x72\xff\x71\x70\x71\
+\xff\x71\x6f\x6f\xff\x70\x6e\x6f\xff\x6f\x6d\x6d\xff\x6d\x6c\x6c\
+\xff\x70\x6e\x6e\xff\x6f\x6d\x6e\xff\x6e\x6c\x6d\xff\x6e\x6b\x6c\
+\xff\x6c\x6a\x6b\xff\x6b\x6a\x6a\xff\x6b\x6a\x6a\xff\x6a\x6a\x6a\
+\xff\x6b\x6a\x6b\xff\x74\x73\x73\xff\x74\x73\x73\xff\x74\x73\x73\
+\xff\x74\x73\x73\xff\x73\x72\x72\xff\x70\x6f\x6f\xff\x69\x67\x68\
+\xff\x64\x63\x63\xff\x64\x64\x64\xff\x64\x63\x64\xff\x65\x64\x64\
+\xff\x65\x64\x65\xff\x6c\x6c\x6c\xff\x70\x6f\x6f\xff\x70\x6f\x6f\
+\xff\x71\x70\x70\xff\x6a\x6a\x6a\xff\x67\x66\x67\xff\x67\x66\x67\
+\xff\x67\x67\x67\xff\x67\x66\x67\xff\x67\x66\x66\xff\x67\x66\x66\
+\xff\x68\x66\x67\xff\x6b\x69\x6a\xff\x73\x71\x72\xff\x86\x82\x83\
+\xff\x9a\x95\x96\xff\x9e\x98\x99\xff\x9d\x97\x98\xff\x9c\x99\x99\
+\x4e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x9a\x9a\x51\xa2\x9b\x9d\
+\xff\xa4\x9d\x9f\xff\xa5\xa0\xa1\xff\xa8\xa2\xa4\xff\xaa\xa4\xa6\
+\xff\xab\xa6\xa7\xff\xac\xa6\xa7\xff\xad\xa7\xa8\xff\xad\xa7\xa8\
+\xff\xae\xa8\xa9\xff\xae\xa8\xa9\xff\xaf\xa9\xaa\xff\xaf\xa9\xab\
+\xff\xb0\xa9\xab\xff\xb0\xab\xac\xff\xb0\xab\xac\xff\xb0\xab\xac\
+\xff\xb0\xac\xad\xff\xb0\xab\xac\xff\xb1\xab\xad\xff\xb2\xac\xad\
+\xff\xb1\xac\xad\xff\xb2\xac\xae\xff\xb2\xac\xae\xff\xb2\xac\xae\
+\xff\xb2\xad\xae\xff\xb2\xad\xae\xff\xb2\xad\xae\xff\xb3\xae\xaf\
+\xff\xb3\xae\xaf\xff\xb3\xaf\xb0\xff\xb4\xaf\xb1\xff\xb5\xb0\xb1\
+\xff\xb6\xb1\xb2\xff\xb6\xb2\xb3\xff\xb7\xb2\xb4\xff\xb9\xb3\xb5\
+\xff\xba\xb4\xb6\xff\xbb\xb5\xb7\xff\xbc\xb7\xb9\xff\xbd\xb9\xba\
+\xff\xbe\xb9\xba\xff\xbf\xba\xbc\xff\xc0\xbc\xbd\xff\xc1\xbc\xbd\
+\xff\xc1\xbd\xbe\xff\xc1\xbe\xbf\xff\xc2\xbf\xc0\xff\xc3\xbf\xc0\
+\xff\xc5\xc0\xc1\xff\xc6\xc2\xc2\xff\xc7\xc3\xc4\xff\xc8\xc4\xc5\
+\xff\xc9\xc5\xc6\xff\xca\xc6\xc7\xff\xcb\xc7\xc8\xff\xcc\xc9\xc9\
+\xff\xcd\xc9\xcb\xff\xce\xcb\xcb\xff\xce\xcb\xcc\xff\xcf\xcc\xcc\
+\xff\xd0\xcc\xcd\xff\xd0\xcc\xcd\xff\xd0\xcd\xcf\xff\xd0\xcd\xcd\
+\xff\xd1\xcd\xce\xff\xd0\xcd\xce\xff\xd0\xcc\xcd\xff\xd0\xcc\xcd\
+\xff\xcf\xcb\xcc\xff\xce\xcb\xcb\xff\xcd\xca\xcb\xff\xcd\xca\xca\
+\xff\xcc\xc9\xca\xff\xcb\xc8\xc8\xff\xca\xc6\xc7\xff\xc9\xc5\xc6\
+\xff\xc8\xc4\xc5\xff\xc7\xc2\xc4\xff\xc5\xc1\xc2\xff\xc4\xc0\xc1\
+\xff\xc3\xbf\xc0\xff\xc3\xbf\xc0\xff\xc1\xbd\xbe\xff\xc0\xbc\xbd\
+\xff\xbf\xbb\xbc\xff\xbe\xba\xbb\xff\xbd\xb8\xba\xff\xbc\xb7\xb9\
+\xff\xbb\xb6\xb7\xff\xba\xb4\xb5\xff\xb8\xb3\xb4\xff\xb6\xb2\xb3\
+\xff\xb5\xb1\xb2\xff\xb4\xaf\xb0\xff\xb3\xae\xaf\xff\xb3\xae\xaf\
+\xff\xb2\xae\xaf\xff\xb2\xad\xae\xff\xb1\xac\xad\xff\xb0\xac\xad\
+\xff\xb0\xac\xad\xff\xb0\xab\xad\xff\xb0\xab\xac\xff\xb0\xaa\xab\
+\xff\xaf\xa9\xab\xff\xaf\xa9\xaa\xff\xae\xa8\xa9\xff\xab\xa6\xa8\
+\xff\xaa\xa4\xa6\xff\xa8\xa3\xa4\xff\xa6\xa1\xa2\xff\xa5\x9f\xa1\
+\xff\xa3\x9d\x9f\xff\xa3\x9c\x9e\xff\xa1\x9b\x9c\xff\xa0\x99\x9b\
+\xff\xa0\x99\x9a\xff\xa0\x99\x9a\xff\xa0\x99\x9a\xff\xa0\x99\x99\
+\x49\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x9c\x9c\x4b\xa2\x9b\x9d\
+\xff\xa4\x9d\x9f\xff\xa6\xa0\xa2\xff\xa7\xa2\xa3\xff\xa9\xa4\xa5\
+\xff\xaa\xa5\xa7\xff\xad\xa7\xa9\xff\xaf\xa9\xaa\xff\xb0\xaa\xab\
+\xff\xb0\xab\xac\xff\xb2\xac\xae\xff\xb3\xae\xaf\xff\xb3\xae\xaf\
+\xff\xb3\xae\xb0\xff\xb4\xaf\xb0\xff\xb4\xaf\xb0\xff\xb4\xb0\xb1\
+\xff\xb5\xb0\xb1\xff\xb5\xb1\xb2\xff\xb5\xb1\xb2\xff\xb5\xb1\xb2\
+\xff\xb5\xb1\xb2\xff\xb5\xb1\xb3\xff\xb5\xb1\xb3\xff\xb6\xb2\xb3\
+\xff\xb7\xb2\xb3\xff\xb7\xb2\xb3\xff\xb7\xb2\xb3\xff\xb7\xb2\xb3\
+\xff\xb7\xb2\xb4\xff\xb8\xb3\xb4\xff\xba\xb4\xb6\xff\xba\xb5\xb6\
+\xff\xbb\xb6\xb8\xff\xbc\xb7\xba\xff\xbe\xb9\xbb\xff\xbf\xba\xbc\
+\xff\xc0\xbc\xbd\xff\xc1\xbd\xbf\xff\xc3\xbf\xc0\xff\xc5\xc1\xc1\
+\xff\xc7\xc2\xc3\xff\xc8\xc5\xc5\xff\xca\xc6\xc8\xff\xcb\xc8\xc9\
+\xff\xcd\xca\xca\xff\xcf\xcc\xcc\xff\xd0\xcc\xce\xff\xd2\xcf\xd0\
+\xff\xd3\xd0\xd1\xff\xd4\xd1\xd2\xff\xd6\xd3\xd4\xff\xd7\xd4\xd5\
+\xff\xd9\xd7\xd7\xff\xdb\xd9\xd9\xff\xdc\xda\xdb\xff\xde\xdc\xdc\
+\xff\xdf\xdd\xde\xff\xe0\xde\xdf\xff\xe1\xdf\xe0\xff\xe2\xe0\xe0\
+\xff\xe3\xe1\xe1\xff\xe3\xe1\xe2\xff\xe4\xe2\xe2\xff\xe4\xe2\xe2\
+\xff\xe4\xe1\xe2\xff\xe4\xe2\xe2\xff\xe3\xe1\xe1\xff\xe3\xe1\xe1\
+\xff\xe1\xdf\xe0\xff\xe0\xdf\xdf\xff\xe0\xde\xdf\xff\xdf\xdd\xdd\
+\xff\xde\xdc\xdc\xff\xdc\xd9\xda\xff\xda\xd7\xd8\xff\xd8\xd5\xd7\
+\xff\xd7\xd4\xd5\xff\xd6\xd2\xd3\xff\xd4\xd1\xd1\xff\xd2\xcf\xd0\
+\xff\xd0\xcd\xce\xff\xcf\xcb\xcc\xff\xcd\xca\xca\xff\xcb\xc8\xc9\
+\xff\xc9\xc6\xc7\xff\xc8\xc4\xc5\xff\xc6\xc2\xc3\xff\xc4\xc0\xc1\
+\xff\xc2\xbf\xc0\xff\xc1\xbd\xbe\xff\xbf\xbc\xbd\xff\xbe\xb9\xbb\
+\xff\xbd\xb8\xb9\xff\xbb\xb7\xb8\xff\xba\xb5\xb7\xff\xb9\xb4\xb5\
+\xff\xb8\xb3\xb4\xff\xb7\xb2\xb3\xff\xb6\xb1\xb3\xff\xb5\xb1\xb2\
+\xff\xb5\xb1\xb2\xff\xb5\xb1\xb2\xff\xb5\xb0\xb2\xff\xb5\xb0\xb1\
+\xff\xb4\xaf\xb0\xff\xb3\xaf\xb0\xff\xb3\xae\xaf\xff\xb1\xac\xae\
+\xff\xaf\xaa\xab\xff\xae\xa8\xa9\xff\xaa\xa5\xa6\xff\xa8\xa2\xa4\
+\xff\xa6\xa0\xa1\xff\xa4\x9e\xa0\xff\xa2\x9c\x9e\xff\xa1\x9b\x9d\
+\xff\xa1\x9a\x9c\xff\xa0\x99\x9b\xff\xa0\x99\x9a\xff\x9e\x97\x9b\
+\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9e\x97\x9b\x45\xa1\x9b\x9c\
+\xff\xa4\x9e\xa0\xff\xa6\xa1\xa2\xff\xa8\xa3\xa4\xff\xaa\xa5\xa6\
+\xff\xad\xa7\xa8\xff\xaf\xaa\xab\xff\xb1\xac\xae\xff\xb2\xae\xaf\
+\xff\xb4\xaf\xb1\xff\xb5\xb1\xb2\xff\xb6\xb2\xb3\xff\xb7\xb3\xb4\
+\xff\xb8\xb3\xb4\xff\xb8\xb4\xb5\xff\xb8\xb4\xb5\xff\xb8\xb4\xb5\
+\xff\xb9\xb4\xb5\xff\xba\xb4\xb5\xff\xba\xb5\xb5\xff\xba\xb5\xb6\
+\xff\xba\xb4\xb6\xff\xba\xb5\xb6\xff\xba\xb5\xb6\xff\xba\xb5\xb6\
+\xff\xba\xb6\xb6\xff\xba\xb6\xb6\xff\xbb\xb6\xb6\xff\xbb\xb6\xb6\
+\xff\xbb\xb6\xb7\xff\xbc\xb6\xb8\xff\xbc\xb8\xba\xff\xbe\xb9\xbb\
+\xff\xbf\xbb\xbc\xff\xc0\xbd\xbd\xff\xc2\xbe\xbf\xff\xc4\xc0\xc0\
+\xff\xc6\xc2\xc3\xff\xc8\xc4\xc4\xff\xca\xc6\xc7\xff\xcc\xc8\xc9\
+\xff\xcd\xca\xcb\xff\xcf\xcc\xcd\xff\xd2\xcf\xcf\xff\xd4\xd1\xd2\
+\xff\xd6\xd4\xd4\xff\xd8\xd6\xd6\xff\xda\xd8\xd8\xff\xdd\xda\xda\
+\xff\xde\xdd\xdd\xff\xe1\xde\xdf\xff\xe3\xe1\xe2\xff\xe5\xe3\xe4\
+\xff\xe7\xe5\xe5\xff\xe9\xe7\xe7\xff\xeb\xe9\xea\xff\xed\xeb\xec\
+\xff\xef\xed\xee\xff\xf0\xef\xef\xff\xf1\xf0\xf0\xff\xf3\xf1\xf1\
+\xff\xf4\xf2\xf3\xff\xf5\xf4\xf4\xff\xf5\xf5\xf5\xff\xf6\xf5\xf5\
+\xff\xf5\xf4\xf5\xff\xf5\xf4\xf5\xff\xf4\xf3\xf3\xff\xf3\xf1\xf2\
+\xff\xf1\xf0\xf0\xff\xf0\xef\xef\xff\xef\xee\xee\xff\xee\xec\xec\
+\xff\xec\xea\xea\xff\xe9\xe7\xe8\xff\xe7\xe6\xe6\xff\xe5\xe4\xe4\
+\xff\xe4\xe1\xe2\xff\xe1\xdf\xdf\xff\xdf\xdd\xdd\xff\xdd\xda\xdb\
+\xff\xda\xd8\xd9\xff\xd8\xd6\xd7\xff\xd7\xd4\xd4\xff\xd5\xd1\xd2\
+\xff\xd2\xcf\xcf\xff\xd0\xcd\xcd\xff\xcd\xca\xcb\xff\xcc\xc8\xc9\
+\xff\xca\xc5\xc6\xff\xc8\xc3\xc5\xff\xc5\xc1\xc2\xff\xc3\xbf\xc0\
+\xff\xc1\xbd\xbe\xff\xc0\xbc\xbd\xff\xbe\xba\xbb\xff\xbd\xb9\xba\
+\xff\xbb\xb7\xb9\xff\xbb\xb6\xb7\xff\xba\xb5\xb6\xff\xb9\xb4\xb5\
+\xff\xb9\xb5\xb5\xff\xb9\xb4\xb5\xff\xb9\xb4\xb5\xff\xb8\xb4\xb5\
+\xff\xb8\xb3\xb4\xff\xb6\xb2\xb3\xff\xb5\xb1\xb2\xff\xb4\xb0\xb1\
+\xff\xb3\xae\xaf\xff\xb0\xab\xac\xff\xad\xa7\xa9\xff\xaa\xa5\xa6\
+\xff\xa7\xa2\xa4\xff\xa5\x9f\xa1\xff\xa4\x9d\x9f\xff\xa3\x9d\x9e\
+\xff\xa2\x9b\x9d\xff\xa1\x9a\x9c\xff\xa1\x9a\x9c\xff\xa0\x9c\x9c\
+\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9e\x96\x9a\x3d\xa1\x9a\x9c\
+\xff\xa3\x9d\xa0\xff\xa6\xa1\xa2\xff\xa9\xa4\xa5\xff\xab\xa6\xa7\
+\xff\xaf\xa9\xaa\xff\xb1\xac\xad\xff\xb3\xae\xb0\xff\xb5\xb0\xb1\
+\xff\xb7\xb2\xb4\xff\xb9\xb4\xb5\xff\xbb\xb6\xb7\xff\xbc\xb6\xb8\
+\xff\xbc\xb7\xb8\xff\xbc\xb7\xb8\xff\xbc\xb8\xba\xff\xbd\xb8\xba\
+\xff\xbd\xb8\xba\xff\xbd\xb8\xba\xff\xbd\xb8\xba\xff\xbd\xb8\xba\
+\xff\xbd\xb8\xba\xff\xbd\xb9\xbb\xff\xbd\xb9\xbb\xff\xbd\xba\xbb\
+\xff\xbe\xba\xbb\xff\xbe\xba\xbb\xff\xbe\xba\xbb\xff\xbe\xba\xbb\
+\xff\xbf\xbb\xbb\xff\xbf\xbb\xbc\xff\xc0\xbc\xbe\xff\xc2\xbe\xbf\
+\xff\xc3\xbf\xc0\xff\xc5\xc1\xc1\xff\xc8\xc3\xc4\xff\xc8\xc5\xc6\
+\xff\xcb\xc7\xc8\xff\xcc\xc9\xca\xff\xcf\xcc\xcc\xff\xd1\xcd\xcf\
+\xff\xd3\xd0\xd1\xff\xd6\xd3\xd4\xff\xd8\xd5\xd6\xff\xda\xd8\xd8\
+\xff\xdd\xda\xda\xff\xdf\xdc\xde\xff\xe1\xdf\xe0\xff\xe4\xe2\xe3\
+\xff\xe6\xe4\xe5\xff\xe9\xe6\xe7\xff\xea\xe9\xe9\xff\xed\xec\xec\
+\xff\xf0\xee\xef\xff\xf1\xf0\xf0\xff\xf3\xf2\xf2\xff\xf5\xf4\xf4\
+\xff\xf7\xf7\xf7\xff\xf9\xf7\xf8\xff\xfb\xfa\xfa\xff\xfc\xfb\xfb\
+\xff\xfd\xfd\xfd\xff\xfe\xfd\xfe\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\
+\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\xff\xfd\xfd\xfd\xff\xfd\xfc\xfc\
+\xff\xfb\xfb\xfb\xff\xf9\xf8\xf8\xff\xf7\xf7\xf7\xff\xf6\xf5\xf5\
+\xff\xf4\xf3\xf3\xff\xf2\xf0\xf1\xff\xf0\xef\xef\xff\xee\xec\xec\
+\xff\xeb\xe9\xea\xff\xe9\xe7\xe8\xff\xe7\xe5\xe5\xff\xe4\xe2\xe3\
+\xff\xe2\xe0\xe0\xff\xdf\xdd\xde\xff\xdd\xda\xdb\xff\xdb\xd8\xd9\
+\xff\xd8\xd6\xd7\xff\xd6\xd3\xd4\xff\xd4\xd0\xd1\xff\xd0\xce\xce\
+\xff\xce\xcb\xcc\xff\xcc\xc9\xc9\xff\xca\xc6\xc7\xff\xc8\xc3\xc5\
+\xff\xc5\xc1\xc2\xff\xc3\xbf\xc0\xff\xc1\xbd\xbe\xff\xbf\xbb\xbd\
+\xff\xbe\xba\xbb\xff\xbd\xb8\xba\xff\xbc\xb7\xb9\xff\xbb\xb6\xb8\
+\xff\xbc\xb7\xb8\xff\xbc\xb8\xb9\xff\xbc\xb8\xb9\xff\xbc\xb8\xba\
+\xff\xbc\xb7\xb8\xff\xbc\xb6\xb8\xff\xba\xb5\xb6\xff\xb9\xb4\xb4\
+\xff\xb7\xb2\xb3\xff\xb4\xaf\xb0\xff\xb0\xaa\xac\xff\xae\xa7\xa8\
+\xff\xa9\xa4\xa5\xff\xa7\xa2\xa3\xff\xa5\x9f\xa0\xff\xa3\x9d\x9f\
+\xff\xa2\x9c\x9d\xff\xa2\x9b\x9d\xff\xa1\x9a\x9c\xff\x9f\x9a\x9a\
+\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9e\x99\x99\x35\xa1\x9a\x9b\
+\xff\xa3\x9d\xa0\xff\xa6\xa1\xa2\xff\xa9\xa4\xa5\xff\xad\xa7\xa8\
+\xff\xb0\xab\xac\xff\xb2\xae\xaf\xff\xb5\xb1\xb2\xff\xb9\xb4\xb4\
+\xff\xbb\xb6\xb7\xff\xbc\xb8\xba\xff\xbe\xba\xbb\xff\xbf\xbb\xbc\
+\xff\xc0\xbc\xbc\xff\xc0\xbc\xbc\xff\xc0\xbc\xbd\xff\xc0\xbc\xbd\
+\xff\xc0\xbc\xbd\xff\xc0\xbd\xbe\xff\xc1\xbd\xbe\xff\xc0\xbd\xbe\
+\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\
+\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\xff\xc1\xbd\xbf\
+\xff\xc2\xbe\xc0\xff\xc2\xbf\xc0\xff\xc4\xc0\xc1\xff\xc5\xc1\xc2\
+\xff\xc7\xc3\xc4\xff\xc9\xc4\xc6\xff\xca\xc7\xc8\xff\xcc\xc9\xc9\
+\xff\xce\xcb\xcb\xff\xd0\xcd\xcd\xff\xd2\xcf\xcf\xff\xd5\xd2\xd2\
+\xff\xd7\xd4\xd5\xff\xd9\xd7\xd7\xff\xdb\xd9\xd9\xff\xde\xdb\xdc\
+\xff\xe0\xde\xdf\xff\xe3\xe1\xe1\xff\xe5\xe3\xe4\xff\xe7\xe6\xe6\
+\xff\xea\xe8\xe8\xff\xec\xeb\xeb\xff\xef\xed\xee\xff\xf1\xef\xf0\
+\xff\xf2\xf2\xf2\xff\xf4\xf3\xf4\xff\xf7\xf6\xf6\xff\xf9\xf8\xf8\
+\xff\xfb\xfa\xfb\xff\xfc\xfc\xfc\xff\xfe\xfe\xfe\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xfe\xfe\xff\xfd\xfc\xfc\xff\xfb\xfb\xfb\xff\xfa\xf9\xf9\
+\xff\xf7\xf6\xf7\xff\xf5\xf4\xf5\xff\xf3\xf3\xf3\xff\xf1\xf0\xf1\
+\xff\xf0\xee\xee\xff\xed\xec\xed\xff\xeb\xe9\xe9\xff\xe8\xe7\xe7\
+\xff\xe6\xe4\xe5\xff\xe4\xe2\xe2\xff\xe1\xdf\xe0\xff\xdf\xdc\xdd\
+\xff\xdc\xda\xda\xff\xda\xd7\xd8\xff\xd7\xd4\xd5\xff\xd5\xd1\xd2\
+\xff\xd1\xce\xcf\xff\xcf\xcb\xcd\xff\xcc\xc9\xca\xff\xca\xc7\xc7\
+\xff\xc7\xc3\xc4\xff\xc5\xc1\xc2\xff\xc3\xbf\xc0\xff\xc1\xbd\xbe\
+\xff\xc0\xbc\xbc\xff\xbe\xbb\xbb\xff\xbd\xba\xbb\xff\xbd\xb9\xba\
+\xff\xbd\xb9\xbb\xff\xbe\xba\xba\xff\xbe\xba\xbb\xff\xbe\xba\xbb\
+\xff\xbe\xba\xbb\xff\xbf\xbb\xbb\xff\xbe\xba\xbb\xff\xbc\xb8\xb9\
+\xff\xbb\xb6\xb7\xff\xb7\xb3\xb4\xff\xb3\xaf\xb0\xff\xb0\xaa\xac\
+\xff\xac\xa6\xa8\xff\xa8\xa3\xa5\xff\xa6\xa1\xa2\xff\xa5\x9f\xa0\
+\xff\xa3\x9d\x9e\xff\xa2\x9c\x9d\xff\xa1\x9a\x9c\xff\x9c\x96\x9c\
+\x31\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9e\x99\x99\x2d\xa0\x9a\x9b\
+\xff\xa4\x9e\x9f\xff\xa6\xa1\xa3\xff\xaa\xa5\xa5\xff\xae\xa8\xa9\
+\xff\xb2\xad\xae\xff\xb5\xb0\xb2\xff\xb9\xb4\xb5\xff\xbc\xb7\xb8\
+\xff\xbe\xba\xbb\xff\xc1\xbd\xbd\xff\xc2\xbf\xc0\xff\xc3\xbf\xc0\
+\xff\xc3\xbf\xc1\xff\xc4\xc0\xc1\xff\xc4\xc0\xc1\xff\xc4\xc0\xc1\
+\xff\xc4\xc1\xc1\xff\xc5\xc0\xc1\xff\xc4\xc0\xc1\xff\xc4\xc0\xc1\
+\xff\xc4\xc0\xc1\xff\xc4\xc0\xc2\xff\xc5\xc1\xc2\xff\xc5\xc1\xc2\
+\xff\xc5\xc1\xc2\xff\xc5\xc2\xc3\xff\xc6\xc2\xc3\xff\xc7\xc2\xc3\
+\xff\xc7\xc3\xc3\xff\xc7\xc3\xc3\xff\xc8\xc4\xc5\xff\xca\xc6\xc7\
+\xff\xcb\xc7\xc8\xff\xcc\xc9\xc9\xff\xcd\xca\xcb\xff\xcf\xcc\xcd\
+\xff\xd1\xce\xcf\xff\xd3\xd0\xd0\xff\xd5\xd3\xd3\xff\xd7\xd4\xd5\
+\xff\xd9\xd6\xd7\xff\xdb\xd9\xda\xff\xde\xdb\xdc\xff\xe1\xde\xdf\
+\xff\xe2\xe1\xe1\xff\xe5\xe3\xe3\xff\xe7\xe5\xe6\xff\xe9\xe7\xe8\
+\xff\xec\xea\xe9\xff\xee\xed\xed\xff\xf0\xef\xef\xff\xf2\xf1\xf1\
+\xff\xf4\xf3\xf3\xff\xf6\xf5\xf5\xff\xf8\xf7\xf7\xff\xfa\xf9\xf9\
+\xff\xfc\xfb\xfb\xff\xfd\xfd\xfd\xff\xff\xff\xfe\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xfe\xfd\xfd\xff\xfc\xfc\xfc\xff\xfb\xfa\xfa\
+\xff\xf9\xf8\xf8\xff\xf6\xf5\xf6\xff\xf5\xf4\xf4\xff\xf3\xf2\xf2\
+\xff\xf1\xef\xf0\xff\xef\xee\xee\xff\xed\xeb\xeb\xff\xeb\xe8\xe8\
+\xff\xe8\xe6\xe7\xff\xe6\xe4\xe5\xff\xe4\xe2\xe2\xff\xe1\xdf\xdf\
+\xff\xde\xdc\xdc\xff\xdb\xd9\xd9\xff\xd8\xd6\xd7\xff\xd6\xd3\xd4\
+\xff\xd3\xcf\xd1\xff\xd0\xcd\xce\xff\xcd\xc9\xca\xff\xca\xc7\xc8\
+\xff\xc7\xc4\xc5\xff\xc5\xc1\xc2\xff\xc3\xbf\xc0\xff\xc1\xbd\xbe\
+\xff\xc0\xbc\xbd\xff\xbf\xbb\xbc\xff\xbe\xba\xbb\xff\xbe\xba\xbb\
+\xff\xbe\xba\xbb\xff\xbe\xba\xbc\xff\xbf\xbb\xbc\xff\xbf\xbc\xbd\
+\xff\xc0\xbc\xbd\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\xff\xc1\xbd\xbe\
+\xff\xc0\xbb\xbc\xff\xbc\xb7\xb8\xff\xb7\xb3\xb4\xff\xb3\xaf\xb0\
+\xff\xaf\xa9\xab\xff\xab\xa6\xa7\xff\xa8\xa3\xa4\xff\xa6\xa1\xa2\
+\xff\xa5\x9f\xa0\xff\xa3\x9d\x9e\xff\xa1\x9b\x9c\xff\xa1\x9b\x9b\
+\x29\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9e\x97\x97\x25\xa0\x99\x9a\
+\xff\xa4\x9e\xa0\xff\xa7\xa2\xa3\xff\xab\xa6\xa7\xff\xaf\xaa\xab\
+\xff\xb3\xaf\xb0\xff\xb7\xb3\xb4\xff\xbc\xb7\xb8\xff\xbe\xbb\xbc\
+\xff\xc1\xbe\xbf\xff\xc4\xc0\xc1\xff\xc7\xc2\xc3\xff\xc7\xc3\xc5\
+\xff\xc8\xc3\xc5\xff\xc8\xc4\xc4\xff\xc8\xc3\xc5\xff\xc8\xc3\xc4\
+\xff\xc7\xc2\xc3\xff\xc7\xc2\xc3\xff\xc6\xc2\xc2\xff\xc6\xc2\xc3\
+\xff\xc6\xc2\xc3\xff\xc6\xc2\xc3\xff\xc7\xc2\xc3\xff\xc7\xc2\xc4\
+\xff\xc7\xc3\xc5\xff\xc8\xc3\xc6\xff\xc9\xc5\xc7\xff\xc9\xc5\xc7\
+\xff\xca\xc7\xc8\xff\xca\xc7\xc8\xff\xcb\xc8\xc9\xff\xcc\xc9\xca\
+\xff\xcd\xca\xcb\xff\xcf\xcb\xcc\xff\xd0\xcd\xce\xff\xd2\xce\xcf\
+\xff\xd4\xd0\xd1\xff\xd5\xd2\xd3\xff\xd7\xd4\xd5\xff\xd9\xd7\xd7\
+\xff\xdb\xd8\xd9\xff\xdd\xda\xdb\xff\xdf\xdc\xdd\xff\xe1\xdf\xe0\
+\xff\xe3\xe1\xe2\xff\xe5\xe3\xe4\xff\xe7\xe5\xe5\xff\xe9\xe7\xe8\
+\xff\xec\xe9\xea\xff\xed\xec\xec\xff\xef\xee\xee\xff\xf1\xf0\xf0\
+\xff\xf2\xf1\xf2\xff\xf4\xf3\xf3\xff\xf6\xf5\xf5\xff\xf8\xf7\xf7\
+\xff\xfa\xfa\xfa\xff\xfb\xfb\xfb\xff\xfd\xfc\xfc\xff\xfe\xfd\xfd\
+\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xff\xfe\xfe\xfe\
+\xff\xfd\xfc\xfd\xff\xfc\xfb\xfb\xff\xfb\xfa\xfa\xff\xf9\xf8\xf8\
+\xff\xf7\xf6\xf6\xff\xf5\xf4\xf4\xff\xf3\xf2\xf3\xff\xf2\xf1\xf1\
+\xff\xf0\xef\xef\xff\xee\xed\xed\xff\xed\xeb\xeb\xff\xea\xe8\xe9\
+\xff\xe8\xe6\xe7\xff\xe6\xe4\xe5\xff\xe4\xe2\xe3\xff\xe2\xdf\xe0\
+\xff\xde\xdc\xdd\xff\xdb\xd9\xda\xff\xd8\xd6\xd7\xff\xd6\xd3\xd4\
+\xff\xd3\xcf\xd0\xff\xcf\xcc\xcd\xff\xcc\xc8\xc9\xff\xca\xc6\xc7\
+\xff\xc7\xc2\xc3\xff\xc4\xc0\xc1\xff\xc2\xbe\xbf\xff\xc0\xbc\xbd\
+\xff\xbf\xbb\xbc\xff\xbe\xba\xba\xff\xbe\xb9\xba\xff\xbd\xb9\xba\
+\xff\xbe\xba\xbb\xff\xbe\xbb\xbc\xff\xbf\xbc\xbd\xff\xc0\xbc\xbd\
+\xff\xc1\xbd\xbe\xff\xc2\xbe\xbf\xff\xc2\xbf\xc0\xff\xc3\xbf\xc0\
+\xff\xc3\xbf\xc0\xff\xc0\xbc\xbd\xff\xbb\xb6\xb7\xff\xb6\xb2\xb3\
+\xff\xb2\xad\xae\xff\xae\xa8\xaa\xff\xaa\xa5\xa6\xff\xa8\xa2\xa4\
+\xff\xa6\xa0\xa1\xff\xa4\x9e\x9f\xff\xa2\x9b\x9c\xff\x9d\x96\x96\
+\x22\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x95\x95\x1d\x9e\x98\x99\
+\xff\xa5\x9f\xa1\xff\xa8\xa3\xa4\xff\xad\xa7\xa8\xff\xb1\xac\xae\
+\xff\xb6\xb1\xb2\xff\xba\xb6\xb6\xff\xbf\xbb\xbb\xff\xc2\xbe\xbf\
+\xff\xc6\xc1\xc2\xff\xc8\xc5\xc5\xff\xcb\xc7\xc8\xff\xcb\xc7\xc8\
+\xff\xcb\xc7\xc8\xff\xca\xc7\xc8\xff\xca\xc6\xc7\xff\xc9\xc5\xc6\
+\xff\xc8\xc4\xc6\xff\xc7\xc3\xc4\xff\xc7\xc2\xc3\xff\xc7\xc2\xc3\
+\xff\xc6\xc2\xc2\xff\xc7\xc2\xc3\xff\xc7\xc3\xc3\xff\xc8\xc4\xc4\
+\xff\xc9\xc5\xc6\xff\xca\xc7\xc7\xff\xcb\xc7\xc8\xff\xcc\xc9\xc9\
+\xff\xcd\xca\xca\xff\xce\xca\xcb\xff\xce\xcc\xcc\xff\xcf\xcc\xcd\
+\xff\xd0\xcd\xce\xff\xd2\xce\xcf\xff\xd3\xcf\xd0\xff\xd4\xd1\xd2\
+\xff\xd6\xd3\xd4\xff\xd7\xd4\xd5\xff\xd9\xd6\xd7\xff\xda\xd7\xd8\
+\xff\xdb\xd9\xda\xff\xdd\xda\xdb\xff\xdf\xdb\xdd\xff\xe0\xde\xdf\
+\xff\xe2\xe0\xe0\xff\xe4\xe2\xe2\xff\xe6\xe4\xe4\xff\xe7\xe5\xe6\
+\xff\xe8\xe7\xe7\xff\xea\xe8\xe9\xff\xec\xea\xea\xff\xee\xec\xec\
+\xff\xef\xee\xee\xff\xf0\xef\xef\xff\xf2\xf1\xf1\xff\xf4\xf3\xf3\
+\xff\xf5\xf4\xf4\xff\xf7\xf5\xf5\xff\xf8\xf7\xf7\xff\xf9\xf8\xf8\
+\xff\xfa\xf9\xfa\xff\xfa\xfa\xfa\xff\xfb\xfa\xfb\xff\xfb\xfa\xfa\
+\xff\xfa\xfa\xfa\xff\xfa\xf9\xf9\xff\xfa\xf8\xf8\xff\xf8\xf8\xf8\
+\xff\xf7\xf7\xf7\xff\xf7\xf5\xf5\xff\xf5\xf4\xf4\xff\xf3\xf2\xf3\
+\xff\xf3\xf1\xf1\xff\xf1\xf0\xf0\xff\xf0\xef\xef\xff\xee\xed\xed\
+\xff\xed\xeb\xec\xff\xec\xe9\xea\xff\xea\xe8\xe8\xff\xe8\xe6\xe7\
+\xff\xe6\xe5\xe5\xff\xe4\xe2\xe3\xff\xe2\xe0\xe1\xff\xdf\xdc\xdd\
+\xff\xdc\xd9\xda\xff\xda\xd7\xd8\xff\xd7\xd4\xd5\xff\xd3\xd0\xd1\
+\xff\xcf\xcc\xcd\xff\xcc\xc9\xca\xff\xc9\xc6\xc7\xff\xc7\xc3\xc4\
+\xff\xc4\xc0\xc1\xff\xc2\xbe\xbf\xff\xc0\xbc\xbd\xff\xbe\xba\xbb\
+\xff\xbd\xb9\xba\xff\xbc\xb7\xb9\xff\xbd\xb7\xb9\xff\xbc\xb7\xb9\
+\xff\xbd\xb9\xba\xff\xbe\xba\xbb\xff\xbf\xbb\xbc\xff\xc1\xbd\xbe\
+\xff\xc2\xbe\xbf\xff\xc3\xbf\xc0\xff\xc5\xc1\xc2\xff\xc6\xc1\xc2\
+\xff\xc6\xc1\xc2\xff\xc4\xbf\xc0\xff\xbf\xbb\xbc\xff\xbb\xb6\xb7\
+\xff\xb6\xb1\xb2\xff\xb1\xac\xad\xff\xae\xa7\xa9\xff\xaa\xa5\xa6\
+\xff\xa8\xa2\xa3\xff\xa5\xa0\xa2\xff\xa2\x9c\x9d\xff\xa3\x99\x99\
+\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\x93\x93\x13\x9c\x96\x98\
+\xfe\xa6\xa0\xa1\xff\xaa\xa5\xa6\xff\xaf\xa9\xab\xff\xb4\xaf\xb0\
+\xff\xb9\xb4\xb6\xff\xbe\xb9\xba\xff\xc2\xbe\xbf\xff\xc6\xc2\xc3\
+\xff\xc9\xc6\xc7\xff\xcc\xc9\xc9\xff\xcd\xca\xcb\xff\xce\xcb\xcb\
+\xff\xcd\xca\xcb\xff\xcc\xc9\xca\xff\xcb\xc7\xc8\xff\xc9\xc6\xc6\
+\xff\xc7\xc3\xc4\xff\xc5\xc1\xc2\xff\xc4\xc0\xc2\xff\xc3\xbf\xc0\
+\xff\xc3\xbf\xc0\xff\xc4\xc0\xc1\xff\xc5\xc0\xc1\xff\xc6\xc2\xc3\
+\xff\xc8\xc4\xc5\xff\xca\xc5\xc7\xff\xcb\xc8\xc8\xff\xcd\xc9\xca\
+\xff\xce\xcb\xcb\xff\xd0\xcd\xce\xff\xd1\xce\xcf\xff\xd2\xce\xcf\
+\xff\xd3\xcf\xd0\xff\xd4\xd0\xd0\xff\xd5\xd1\xd2\xff\xd5\xd2\xd3\
+\xff\xd6\xd4\xd4\xff\xd7\xd5\xd5\xff\xd8\xd6\xd6\xff\xd9\xd7\xd7\
+\xff\xda\xd8\xd8\xff\xdb\xd9\xd9\xff\xdd\xda\xda\xff\xde\xdb\xdc\
+\xff\xdf\xdd\xdd\xff\xe1\xde\xdf\xff\xe2\xe0\xe0\xff\xe3\xe1\xe2\
+\xff\xe4\xe2\xe3\xff\xe5\xe3\xe4\xff\xe6\xe5\xe5\xff\xe7\xe6\xe7\
+\xff\xe9\xe7\xe7\xff\xe7\xe5\xe6\xff\xde\xdd\xdd\xff\xde\xdd\xdd\
+\xff\xdf\xdd\xdd\xff\xdf\xde\xde\xff\xe0\xde\xde\xff\xe0\xde\xde\
+\xff\xe1\xdf\xdf\xff\xe1\xdf\xdf\xff\xe0\xdf\xdf\xff\xef\xee\xee\
+\xff\xf1\xf0\xf0\xff\xf1\xf0\xf0\xff\xf1\xef\xf0\xff\xf0\xef\xef\
+\xff\xf0\xee\xee\xff\xef\xed\xed\xff\xee\xec\xed\xff\xed\xeb\xeb\
+\xff\xec\xea\xeb\xff\xeb\xe9\xe9\xff\xea\xe8\xe8\xff\xe9\xe7\xe7\
+\xff\xe7\xe6\xe6\xff\xe6\xe4\xe5\xff\xe5\xe4\xe4\xff\xe4\xe2\xe2\
+\xff\xe2\xe0\xe1\xff\xe0\xde\xde\xff\xdd\xdb\xdc\xff\xdb\xd9\xd9\
+\xff\xd8\xd5\xd6\xff\xd5\xd2\xd3\xff\xd2\xcf\xd0\xff\xce\xcb\xcc\
+\xff\xcb\xc8\xc8\xff\xc8\xc4\xc5\xff\xc5\xc1\xc2\xff\xc3\xbf\xbf\
+\xff\xc0\xbc\xbd\xff\xbf\xba\xbb\xff\xbd\xb9\xba\xff\xbc\xb7\xb9\
+\xff\xbb\xb6\xb7\xff\xba\xb5\xb6\xff\xba\xb5\xb6\xff\xbb\xb5\xb7\
+\xff\xbb\xb7\xb9\xff\xbd\xb9\xba\xff\xbf\xbb\xbc\xff\xc0\xbd\xbe\
+\xff\xc2\xbf\xbf\xff\xc4\xc1\xc1\xff\xc6\xc2\xc3\xff\xc8\xc3\xc5\
+\xff\xc8\xc4\xc5\xff\xc7\xc2\xc3\xff\xc3\xbf\xc0\xff\xbf\xbb\xbc\
+\xff\xba\xb5\xb6\xff\xb5\xb0\xb2\xff\xb0\xab\xad\xff\xad\xa8\xa8\
+\xff\xa9\xa5\xa6\xff\xa7\xa2\xa3\xff\xa2\x9c\x9d\xfd\x9b\x9b\x9b\
+\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x91\x91\x91\x0e\x9b\x95\x96\
+\xf9\xa6\xa0\xa2\xff\xac\xa6\xa7\xff\xb2\xad\xae\xff\xb7\xb2\xb3\
+\xff\xbd\xb9\xba\xff\xc2\xbd\xbf\xff\xc7\xc3\xc4\xff\xca\xc6\xc8\
+\xff\xcd\xca\xcb\xff\xcf\xcc\xcd\xff\xd1\xce\xce\xff\xd0\xcd\xce\
+\xff\xcf\xcc\xcc\xff\xcd\xc9\xca\xff\xca\xc7\xc8\xff\xc7\xc3\xc4\
+\xff\xc5\xc1\xc2\xff\xc2\xbe\xc0\xff\xbb\xb7\xb8\xff\xb1\xac\xae\
+\xff\xb0\xaa\xad\xff\xb0\xaa\xac\xff\xb0\xab\xad\xff\xb0\xab\xad\
+\xff\xb0\xab\xad\xff\xb0\xab\xad\xff\xb0\xab\xad\xff\xb1\xac\xad\
+\xff\xb1\xac\xad\xff\xb2\xac\xae\xff\xb2\xad\xaf\xff\xb3\xae\xaf\
+\xff\xb3\xaf\xb0\xff\xb4\xaf\xb1\xff\xb5\xb0\xb2\xff\xb6\xb1\xb3\
+\xff\xb7\xb2\xb3\xff\xb8\xb3\xb4\xff\xb9\xb4\xb5\xff\xba\xb6\xb7\
+\xff\xbb\xb7\xb8\xff\xbd\xb8\xb9\xff\xbe\xba\xbb\xff\xbf\xbb\xbc\
+\xff\xc1\xbd\xbd\xff\xc2\xbe\xbf\xff\xc3\xbf\xc0\xff\xc4\xc0\xc1\
+\xff\xc5\xc2\xc2\xff\xc7\xc3\xc4\xff\xc8\xc4\xc5\xff\xc9\xc5\xc6\
+\xff\xc9\xc6\xc6\xff\xc9\xc6\xc6\xff\xd2\xcf\xcf\xff\xd1\xcf\xcf\
+\xff\xd2\xcf\xcf\xff\xd2\xcf\xcf\xff\xd2\xd0\xd0\xff\xd2\xd0\xd0\
+\xff\xd2\xd0\xd0\xff\xd2\xd0\xd0\xff\xd0\xce\xce\xff\xd3\xd0\xd0\
+\xff\xd3\xd1\xd1\xff\xd3\xd0\xd1\xff\xd3\xd0\xd0\xff\xd2\xcf\xd0\
+\xff\xd2\xcf\xcf\xff\xd1\xce\xcf\xff\xd0\xcd\xce\xff\xcf\xcc\xcd\
+\xff\xcf\xcb\xcc\xff\xcd\xca\xcb\xff\xcc\xc9\xca\xff\xcb\xc7\xc8\
+\xff\xca\xc6\xc7\xff\xc9\xc5\xc6\xff\xc8\xc4\xc5\xff\xc6\xc3\xc4\
+\xff\xc5\xc1\xc2\xff\xc4\xc0\xc1\xff\xc3\xbf\xc0\xff\xc2\xbd\xbf\
+\xff\xc0\xbc\xbd\xff\xbf\xbb\xbc\xff\xbe\xba\xbb\xff\xbd\xb8\xba\
+\xff\xbc\xb7\xb8\xff\xbb\xb6\xb7\xff\xba\xb5\xb6\xff\xb9\xb4\xb5\
+\xff\xb8\xb3\xb4\xff\xb7\xb2\xb3\xff\xb6\xb1\xb2\xff\xb5\xb0\xb2\
+\xff\xb5\xb0\xb1\xff\xb4\xaf\xb1\xff\xb4\xaf\xb0\xff\xb4\xaf\xb0\
+\xff\xb4\xb0\xb1\xff\xbc\xb8\xb8\xff\xbe\xba\xbb\xff\xc1\xbd\xbe\
+\xff\xc3\xbf\xc0\xff\xc6\xc1\xc2\xff\xc8\xc4\xc5\xff\xc9\xc6\xc7\
+\xff\xca\xc7\xc8\xff\xc9\xc6\xc7\xff\xc7\xc3\xc4\xff\xc3\xc0\xc0\
+\xff\xbf\xba\xbb\xff\xba\xb5\xb6\xff\xb4\xb0\xb1\xff\xb0\xab\xac\
+\xff\xac\xa7\xa8\xff\xa8\xa4\xa5\xff\xa3\x9b\x9d\xf7\x9c\x9c\x9c\
+\x0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\x7f\x99\x0a\x9a\x94\x95\
+\xf2\xa7\xa2\xa3\xff\xaf\xa9\xaa\xff\xb5\xb0\xb1\xff\xbc\xb7\xb8\
+\xff\xc1\xbd\xbe\xff\xc6\xc2\xc3\xff\xcb\xc8\xc9\xff\xcf\xcb\xcc\
+\xff\xd1\xce\xce\xff\xd4\xcf\xd1\xff\xd5\xd1\xd2\xff\xd3\xd0\xd0\
+\xff\xd0\xcd\xce\xff\xcd\xca\xcb\xff\xca\xc7\xc8\xff\xc6\xc2\xc3\
+\xff\xc2\xbf\xbf\xff\xbc\xb8\xb9\xff\xaa\xa4\xa6\xff\x53\x4e\x4d\
+\xff\x2f\x2b\x29\xff\x30\x2b\x29\xff\x30\x2b\x29\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x32\x2d\x2b\xff\x33\x2d\x2b\xff\x33\x2d\x2b\
+\xff\x33\x2d\x2b\xff\x33\x2d\x2b\xff\x33\x2d\x2c\xff\x33\x2d\x2b\
+\xff\x33\x2d\x2b\xff\x33\x2d\x2b\xff\x33\x2d\x2b\xff\x34\x2e\x2c\
+\xff\x34\x2e\x2d\xff\x34\x2e\x2d\xff\x34\x2f\x2d\xff\x34\x2f\x2d\
+\xff\x34\x2e\x2d\xff\x34\x2e\x2d\xff\x34\x2e\x2d\xff\x34\x2e\x2d\
+\xff\x34\x2e\x2c\xff\x36\x2f\x2e\xff\x37\x31\x30\xff\x3a\x34\x32\
+\xff\x3d\x36\x34\xff\x3f\x38\x36\xff\x44\x3d\x3a\xff\x47\x40\x3c\
+\xff\x4a\x42\x40\xff\x4d\x45\x42\xff\x51\x49\x45\xff\x53\x4b\x47\
+\xff\x56\x4d\x4a\xff\x58\x4f\x4c\xff\x59\x50\x4d\xff\x57\x4e\x4b\
+\xff\x55\x4b\x49\xff\x52\x49\x46\xff\x4e\x46\x44\xff\x4b\x43\x41\
+\xff\x47\x40\x3d\xff\x44\x3d\x3b\xff\x41\x3a\x39\xff\x3e\x37\x35\
+\xff\x3b\x35\x33\xff\x39\x33\x30\xff\x37\x31\x2f\xff\x35\x2f\x2e\
+\xff\x33\x2e\x2c\xff\x33\x2d\x2c\xff\x32\x2d\x2c\xff\x33\x2d\x2c\
+\xff\x33\x2d\x2c\xff\x32\x2d\x2c\xff\x32\x2d\x2b\xff\x32\x2d\x2b\
+\xff\x32\x2d\x2b\xff\x32\x2d\x2b\xff\x32\x2d\x2b\xff\x32\x2c\x2b\
+\xff\x32\x2d\x2b\xff\x32\x2d\x2b\xff\x32\x2d\x2b\xff\x32\x2d\x2b\
+\xff\x32\x2d\x2b\xff\x32\x2c\x2b\xff\x32\x2c\x2b\xff\x32\x2c\x2b\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x30\x2c\x2a\
+\xff\x30\x2b\x29\xff\x30\x2b\x29\xff\x2f\x2b\x29\xff\x30\x2b\x29\
+\xff\x84\x7f\x7f\xff\xb5\xb0\xb1\xff\xbf\xbb\xbb\xff\xc1\xbd\xbe\
+\xff\xc4\xc0\xc1\xff\xc7\xc3\xc4\xff\xca\xc6\xc7\xff\xcc\xc8\xc9\
+\xff\xcc\xc9\xca\xff\xcd\xc9\xca\xff\xcb\xc7\xc8\xff\xc8\xc4\xc5\
+\xff\xc3\xbf\xc0\xff\xbf\xba\xbc\xff\xb9\xb4\xb6\xff\xb4\xb0\xb0\
+\xff\xb0\xaa\xab\xff\xab\xa5\xa6\xff\xa2\x9b\x9d\xf1\xaa\x8d\xaa\
+\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\x99\x99\x05\x99\x92\x94\
+\xeb\xa9\xa3\xa5\xff\xb1\xac\xae\xff\xb9\xb4\xb5\xff\xc0\xbc\xbd\
+\xff\xc7\xc3\xc3\xff\xcc\xc8\xc9\xff\xd0\xcd\xce\xff\xd4\xd0\xd1\
+\xff\xd6\xd3\xd4\xff\xd8\xd5\xd6\xff\xd8\xd5\xd6\xff\xd6\xd3\xd4\
+\xff\xd2\xce\xcf\xff\xce\xcb\xcb\xff\xc9\xc5\xc7\xff\xc4\xc0\xc1\
+\xff\xbf\xbb\xbc\xff\xb5\xb0\xb2\xff\x8c\x86\x87\xff\x1e\x19\x16\
+\xff\x25\x21\x1e\xff\x27\x22\x1f\xff\x27\x22\x1f\xff\x28\x23\x20\
+\xff\x28\x23\x21\xff\x29\x24\x21\xff\x29\x24\x22\xff\x29\x24\x22\
+\xff\x2b\x24\x22\xff\x2b\x24\x23\xff\x2b\x24\x23\xff\x2b\x24\x23\
+\xff\x2a\x24\x22\xff\x2a\x24\x22\xff\x2a\x24\x22\xff\x2b\x26\x23\
+\xff\x2d\x27\x25\xff\x2d\x28\x25\xff\x2c\x27\x24\xff\x2c\x26\x24\
+\xff\x2c\x26\x24\xff\x2b\x26\x24\xff\x2b\x26\x24\xff\x2b\x26\x24\
+\xff\x28\x23\x21\xff\x29\x23\x21\xff\x29\x23\x21\xff\x29\x24\x22\
+\xff\x29\x24\x22\xff\x2a\x24\x22\xff\x2c\x26\x24\xff\x2c\x26\x24\
+\xff\x2d\x27\x24\xff\x2d\x27\x24\xff\x2d\x27\x24\xff\x2c\x26\x23\
+\xff\x2c\x26\x24\xff\x2c\x26\x24\xff\x2c\x27\x24\xff\x2c\x26\x24\
+\xff\x2b\x26\x23\xff\x2b\x26\x23\xff\x2b\x25\x23\xff\x2a\x25\x22\
+\xff\x2a\x25\x22\xff\x2a\x24\x22\xff\x29\x24\x22\xff\x29\x24\x21\
+\xff\x29\x23\x21\xff\x28\x23\x21\xff\x28\x23\x21\xff\x28\x23\x21\
+\xff\x28\x23\x21\xff\x27\x23\x21\xff\x27\x23\x21\xff\x27\x23\x21\
+\xff\x27\x23\x21\xff\x27\x23\x21\xff\x27\x23\x21\xff\x27\x23\x21\
+\xff\x27\x23\x21\xff\x27\x23\x21\xff\x27\x23\x21\xff\x28\x23\x21\
+\xff\x27\x23\x21\xff\x28\x23\x21\xff\x28\x23\x21\xff\x28\x23\x21\
+\xff\x28\x23\x21\xff\x28\x23\x21\xff\x28\x23\x21\xff\x27\x23\x20\
+\xff\x27\x23\x1f\xff\x27\x22\x1f\xff\x27\x22\x1f\xff\x26\x22\x1f\
+\xff\x26\x21\x1f\xff\x26\x22\x1e\xff\x26\x21\x1e\xff\x24\x1e\x1c\
+\xff\x43\x3f\x3d\xff\xb5\xb0\xb1\xff\xbe\xbb\xbb\xff\xc2\xbe\xbf\
+\xff\xc6\xc2\xc3\xff\xc9\xc6\xc7\xff\xcd\xc9\xca\xff\xcf\xcc\xcd\
+\xff\xd0\xcd\xce\xff\xd0\xcd\xce\xff\xcf\xcc\xcc\xff\xcd\xc9\xca\
+\xff\xc9\xc5\xc6\xff\xc4\xc0\xc0\xff\xbe\xba\xbb\xff\xb9\xb4\xb5\
+\xff\xb3\xae\xaf\xff\xac\xa8\xa9\xff\xa2\x9b\x9c\xea\x99\x99\x99\
+\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x98\x92\x93\
+\xe3\xab\xa5\xa7\xff\xb5\xb0\xb1\xff\xbd\xb9\xba\xff\xc5\xc1\xc1\
+\xff\xcb\xc8\xc8\xff\xd1\xcd\xcf\xff\xd6\xd3\xd3\xff\xd8\xd6\xd6\
+\xff\xda\xd8\xd8\xff\xdb\xd9\xd9\xff\xdb\xd8\xd9\xff\xd8\xd5\xd6\
+\xff\xd4\xd0\xd1\xff\xce\xcb\xcc\xff\xc8\xc4\xc5\xff\xc1\xbe\xbf\
+\xff\xbd\xb9\xba\xff\xb2\xad\xae\xff\x7d\x78\x78\xff\x21\x1b\x19\
+\xff\x28\x23\x20\xff\x2a\x24\x22\xff\x2a\x24\x22\xff\x2b\x25\x22\
+\xff\x2c\x25\x23\xff\x2d\x26\x23\xff\x2e\x27\x25\xff\x2e\x27\x25\
+\xff\x2e\x27\x25\xff\x2f\x28\x25\xff\x2f\x27\x25\xff\x2f\x28\x25\
+\xff\x2f\x28\x25\xff\x2e\x28\x25\xff\x2e\x27\x25\xff\x31\x2a\x28\
+\xff\x34\x2e\x2c\xff\x34\x2e\x2b\xff\x34\x2e\x2b\xff\x33\x2d\x2a\
+\xff\x33\x2c\x2b\xff\x33\x2c\x2a\xff\x32\x2c\x29\xff\x31\x2b\x29\
+\xff\x2c\x26\x23\xff\x2d\x26\x23\xff\x2c\x26\x23\xff\x2c\x26\x23\
+\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x30\x2a\x27\xff\x30\x29\x27\
+\xff\x30\x29\x27\xff\x30\x29\x26\xff\x2f\x28\x25\xff\x2d\x26\x24\
+\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2d\x26\x24\
+\xff\x2d\x26\x24\xff\x2d\x26\x23\xff\x2d\x26\x23\xff\x2d\x26\x24\
+\xff\x2d\x26\x24\xff\x2d\x26\x23\xff\x2d\x26\x24\xff\x2d\x26\x23\
+\xff\x2d\x26\x23\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2d\x26\x24\
+\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2d\x26\x23\xff\x2d\x26\x23\
+\xff\x2d\x26\x23\xff\x2d\x26\x23\xff\x2d\x25\x23\xff\x2d\x26\x23\
+\xff\x2d\x26\x23\xff\x2d\x26\x24\xff\x2d\x26\x23\xff\x2d\x26\x23\
+\xff\x2d\x26\x23\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2d\x26\x24\
+\xff\x2d\x26\x23\xff\x2d\x26\x23\xff\x2d\x26\x23\xff\x2c\x25\x23\
+\xff\x2c\x25\x23\xff\x2b\x25\x22\xff\x2a\x25\x22\xff\x2a\x24\x22\
+\xff\x2a\x24\x22\xff\x29\x24\x21\xff\x29\x24\x21\xff\x26\x21\x1f\
+\xff\x3e\x3a\x38\xff\xb4\xaf\xb0\xff\xbf\xbb\xbc\xff\xc3\xbf\xc0\
+\xff\xc8\xc4\xc5\xff\xcc\xc9\xc9\xff\xcf\xcc\xcd\xff\xd3\xcf\xd0\
+\xff\xd5\xd1\xd2\xff\xd5\xd2\xd2\xff\xd4\xd0\xd1\xff\xd2\xce\xcf\
+\xff\xcd\xca\xcb\xff\xc9\xc5\xc6\xff\xc3\xbf\xbf\xff\xbd\xb8\xba\
+\xff\xb6\xb2\xb3\xff\xaf\xaa\xab\xff\xa1\x9c\x9c\xe3\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x98\x90\x92\
+\xdb\xac\xa6\xa8\xff\xb8\xb4\xb5\xff\xc1\xbd\xbe\xff\xca\xc6\xc7\
+\xff\xd0\xcd\xce\xff\xd6\xd3\xd4\xff\xda\xd8\xd9\xff\xdd\xda\xdb\
+\xff\xdf\xdd\xdd\xff\xdf\xdd\xdd\xff\xde\xdb\xdc\xff\xda\xd8\xd9\
+\xff\xd6\xd2\xd3\xff\xcf\xcc\xcc\xff\xc8\xc4\xc5\xff\xc1\xbd\xbe\
+\xff\xbb\xb6\xb7\xff\xae\xa9\xab\xff\x71\x6b\x6b\xff\x23\x1e\x1c\
+\xff\x29\x23\x21\xff\x2a\x25\x22\xff\x2a\x25\x22\xff\x2b\x25\x23\
+\xff\x2d\x26\x24\xff\x2e\x27\x24\xff\x2e\x27\x25\xff\x2f\x28\x25\
+\xff\x2f\x28\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x34\x2e\x2b\
+\xff\x3b\x34\x32\xff\x3a\x34\x31\xff\x39\x33\x31\xff\x39\x33\x30\
+\xff\x39\x32\x30\xff\x38\x32\x2f\xff\x38\x32\x2f\xff\x37\x31\x2e\
+\xff\x2f\x28\x25\xff\x2f\x28\x25\xff\x2f\x28\x25\xff\x2f\x28\x25\
+\xff\x2f\x28\x25\xff\x30\x29\x26\xff\x35\x2f\x2c\xff\x34\x2f\x2b\
+\xff\x34\x2e\x2b\xff\x34\x2e\x2a\xff\x33\x2d\x29\xff\x2f\x28\x25\
+\xff\x2f\x28\x25\xff\x2f\x28\x25\xff\x2f\x28\x25\xff\x2f\x28\x25\
+\xff\x2f\x28\x25\xff\x2e\x28\x25\xff\x2e\x28\x25\xff\x2e\x28\x25\
+\xff\x2e\x28\x25\xff\x2e\x28\x25\xff\x2f\x28\x25\xff\x2e\x27\x25\
+\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x28\x25\xff\x2e\x27\x25\
+\xff\x2e\x28\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\
+\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\
+\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x28\x25\
+\xff\x2e\x28\x25\xff\x2e\x28\x25\xff\x2e\x27\x25\xff\x2e\x27\x25\
+\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x28\x25\xff\x2e\x27\x24\
+\xff\x2e\x27\x24\xff\x2d\x26\x24\xff\x2d\x26\x24\xff\x2c\x26\x23\
+\xff\x2c\x25\x23\xff\x2b\x25\x23\xff\x2b\x25\x23\xff\x28\x23\x20\
+\xff\x3b\x36\x35\xff\xb1\xab\xad\xff\xc0\xbc\xbd\xff\xc6\xc1\xc2\
+\xff\xca\xc7\xc8\xff\xcf\xcc\xcd\xff\xd3\xd0\xd0\xff\xd6\xd4\xd4\
+\xff\xd9\xd6\xd7\xff\xd9\xd7\xd7\xff\xd8\xd5\xd6\xff\xd6\xd4\xd4\
+\xff\xd2\xcf\xd0\xff\xce\xca\xcb\xff\xc7\xc3\xc5\xff\xc0\xbc\xbd\
+\xff\xba\xb5\xb6\xff\xb0\xab\xac\xff\xa1\x9b\x9c\xdc\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x97\x8f\x91\
+\xd2\xac\xa7\xa9\xff\xbc\xb7\xb8\xff\xc5\xc1\xc2\xff\xcd\xca\xcb\
+\xff\xd6\xd3\xd3\xff\xda\xd8\xd9\xff\xdf\xdd\xdd\xff\xe2\xe0\xe0\
+\xff\xe4\xe2\xe2\xff\xe4\xe1\xe2\xff\xe2\xdf\xe0\xff\xdd\xda\xdb\
+\xff\xd7\xd4\xd5\xff\xd0\xcd\xcd\xff\xc8\xc4\xc5\xff\xc0\xbc\xbd\
+\xff\xbb\xb6\xb7\xff\xad\xa8\xaa\xff\x62\x5c\x5c\xff\x25\x1f\x1d\
+\xff\x29\x25\x21\xff\x2a\x25\x22\xff\x2b\x25\x23\xff\x2d\x26\x23\
+\xff\x2d\x27\x24\xff\x2e\x27\x25\xff\x2f\x28\x25\xff\x30\x29\x26\
+\xff\x31\x2a\x26\xff\x31\x2a\x27\xff\x31\x2a\x27\xff\x31\x2a\x27\
+\xff\x32\x2a\x28\xff\x31\x2a\x27\xff\x31\x2a\x27\xff\x39\x32\x2f\
+\xff\x41\x3b\x38\xff\x40\x3a\x38\xff\x3f\x3a\x37\xff\x3f\x39\x36\
+\xff\x3f\x39\x35\xff\x3e\x38\x35\xff\x3e\x38\x35\xff\x3c\x36\x33\
+\xff\x31\x29\x27\xff\x30\x29\x27\xff\x31\x2a\x27\xff\x31\x2a\x27\
+\xff\x31\x2a\x27\xff\x32\x2b\x28\xff\x3a\x34\x31\xff\x39\x33\x30\
+\xff\x38\x32\x2f\xff\x38\x32\x2f\xff\x37\x31\x2e\xff\x31\x2a\x27\
+\xff\x30\x2a\x27\xff\x31\x2a\x27\xff\x31\x2a\x27\xff\x31\x2a\x27\
+\xff\x30\x2a\x27\xff\x30\x2a\x27\xff\x31\x2a\x27\xff\x31\x2a\x26\
+\xff\x31\x2a\x27\xff\x31\x2a\x27\xff\x32\x2b\x28\xff\x31\x2a\x27\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x27\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x30\x28\x26\xff\x2f\x28\x26\xff\x2e\x28\x25\xff\x2e\x28\x25\
+\xff\x2e\x27\x25\xff\x2d\x26\x24\xff\x2d\x27\x24\xff\x29\x24\x21\
+\xff\x39\x32\x31\xff\xaf\xa9\xab\xff\xc1\xbd\xbf\xff\xc8\xc4\xc5\
+\xff\xcd\xca\xcb\xff\xd3\xcf\xd0\xff\xd7\xd4\xd5\xff\xda\xd8\xd8\
+\xff\xdc\xda\xdb\xff\xdd\xdb\xdb\xff\xdc\xda\xda\xff\xdb\xd8\xd9\
+\xff\xd7\xd5\xd5\xff\xd3\xcf\xd0\xff\xcc\xc8\xc9\xff\xc4\xc0\xc2\
+\xff\xbd\xb8\xba\xff\xb1\xac\xad\xff\xa1\x9a\x9b\xd5\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x96\x8e\x91\
+\xc8\xac\xa7\xa8\xff\xbe\xba\xbb\xff\xc8\xc4\xc5\xff\xd1\xce\xcf\
+\xff\xd9\xd6\xd7\xff\xdf\xdc\xdd\xff\xe3\xe1\xe2\xff\xe5\xe4\xe4\
+\xff\xe7\xe5\xe5\xff\xe7\xe5\xe5\xff\xe4\xe2\xe3\xff\xdf\xdd\xde\
+\xff\xd8\xd6\xd6\xff\xd1\xcd\xce\xff\xc9\xc5\xc6\xff\xc0\xbc\xbd\
+\xff\xbb\xb5\xb7\xff\xac\xa6\xa8\xff\x53\x4d\x4c\xff\x26\x21\x1e\
+\xff\x2a\x24\x22\xff\x2b\x25\x23\xff\x2b\x25\x23\xff\x2d\x26\x24\
+\xff\x2e\x27\x24\xff\x2e\x28\x25\xff\x2f\x28\x26\xff\x30\x29\x27\
+\xff\x31\x2a\x27\xff\x32\x2a\x28\xff\x32\x2c\x28\xff\x32\x2c\x28\
+\xff\x33\x2c\x29\xff\x33\x2d\x29\xff\x33\x2d\x29\xff\x3c\x36\x33\
+\xff\x47\x41\x3f\xff\x47\x41\x3e\xff\x46\x40\x3e\xff\x46\x40\x3d\
+\xff\x46\x3f\x3c\xff\x45\x3e\x3c\xff\x44\x3e\x3b\xff\x42\x3c\x39\
+\xff\x32\x2b\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\
+\xff\x32\x2b\x28\xff\x34\x2e\x2b\xff\x3f\x39\x35\xff\x3e\x38\x35\
+\xff\x3d\x37\x34\xff\x3d\x36\x33\xff\x3b\x35\x32\xff\x32\x2c\x28\
+\xff\x32\x2c\x28\xff\x32\x2c\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\
+\xff\x32\x2b\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\
+\xff\x32\x2b\x28\xff\x34\x2d\x2a\xff\x34\x2d\x2a\xff\x34\x2d\x2a\
+\xff\x33\x2c\x29\xff\x33\x2c\x29\xff\x32\x2b\x28\xff\x32\x2a\x28\
+\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\
+\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\
+\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\xff\x32\x2a\x28\
+\xff\x32\x2b\x28\xff\x32\x2c\x28\xff\x32\x2b\x28\xff\x32\x2b\x28\
+\xff\x32\x2a\x28\xff\x32\x2b\x28\xff\x31\x2a\x27\xff\x31\x2a\x27\
+\xff\x31\x2a\x27\xff\x30\x29\x27\xff\x30\x29\x26\xff\x30\x29\x26\
+\xff\x2f\x28\x26\xff\x2e\x28\x25\xff\x2e\x27\x24\xff\x2b\x25\x22\
+\xff\x35\x2f\x2d\xff\xac\xa6\xa8\xff\xc3\xbf\xbf\xff\xca\xc6\xc7\
+\xff\xd0\xcc\xcd\xff\xd5\xd2\xd3\xff\xda\xd7\xd8\xff\xde\xdb\xdc\
+\xff\xe0\xde\xde\xff\xe1\xdf\xe0\xff\xe1\xde\xdf\xff\xdf\xdc\xdd\
+\xff\xdb\xd8\xd9\xff\xd6\xd3\xd4\xff\xcf\xcc\xcd\xff\xc8\xc4\xc4\
+\xff\xbf\xbb\xbc\xff\xb1\xac\xae\xff\xa0\x9a\x9b\xcb\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x97\x90\x91\
+\xbd\xad\xa6\xa8\xff\xbe\xba\xbb\xff\xc1\xbc\xbd\xff\xc6\xc3\xc4\
+\xff\xcd\xc9\xca\xff\xd2\xce\xcf\xff\xd6\xd2\xd3\xff\xd7\xd5\xd5\
+\xff\xd8\xd6\xd6\xff\xd8\xd6\xd6\xff\xd6\xd3\xd4\xff\xd2\xcf\xd0\
+\xff\xce\xca\xcc\xff\xc8\xc4\xc5\xff\xc1\xbd\xbe\xff\xba\xb6\xb7\
+\xff\xb5\xb0\xb2\xff\xa9\xa4\xa6\xff\x46\x40\x3f\xff\x28\x22\x20\
+\xff\x2a\x24\x22\xff\x2a\x25\x22\xff\x2b\x25\x23\xff\x2d\x26\x23\
+\xff\x2e\x27\x24\xff\x2f\x28\x25\xff\x30\x29\x26\xff\x31\x2a\x27\
+\xff\x32\x2a\x28\xff\x33\x2b\x29\xff\x33\x2d\x29\xff\x34\x2d\x29\
+\xff\x34\x2e\x2a\xff\x34\x2e\x2a\xff\x34\x2e\x2a\xff\x40\x39\x36\
+\xff\x4d\x48\x44\xff\x4c\x46\x43\xff\x4b\x45\x42\xff\x4b\x45\x42\
+\xff\x4a\x44\x41\xff\x4a\x43\x41\xff\x49\x42\x40\xff\x47\x40\x3e\
+\xff\x33\x2d\x29\xff\x33\x2d\x29\xff\x33\x2d\x29\xff\x34\x2d\x2a\
+\xff\x34\x2d\x2a\xff\x37\x31\x2d\xff\x43\x3d\x3b\xff\x42\x3c\x39\
+\xff\x41\x3c\x38\xff\x40\x3b\x37\xff\x3f\x38\x35\xff\x34\x2d\x2a\
+\xff\x34\x2d\x2a\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\
+\xff\x33\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\
+\xff\x34\x2d\x29\xff\x36\x2f\x2d\xff\x35\x2f\x2c\xff\x36\x2f\x2c\
+\xff\x35\x2e\x2b\xff\x35\x2e\x2a\xff\x34\x2e\x2a\xff\x33\x2d\x29\
+\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\
+\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x2a\xff\x34\x2d\x2a\
+\xff\x34\x2d\x2a\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\
+\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\xff\x34\x2d\x29\
+\xff\x33\x2d\x29\xff\x33\x2d\x29\xff\x32\x2d\x29\xff\x32\x2c\x29\
+\xff\x32\x2b\x28\xff\x32\x2a\x28\xff\x31\x2a\x27\xff\x31\x2a\x27\
+\xff\x30\x29\x26\xff\x2f\x28\x26\xff\x2f\x28\x25\xff\x2c\x26\x23\
+\xff\x33\x2e\x2b\xff\xa9\xa3\xa5\xff\xc1\xbc\xbe\xff\xc8\xc4\xc5\
+\xff\xcf\xca\xcc\xff\xd3\xd0\xd1\xff\xd8\xd5\xd5\xff\xdb\xd9\xda\
+\xff\xde\xdc\xdc\xff\xe0\xdd\xde\xff\xdf\xdd\xde\xff\xde\xdc\xdc\
+\xff\xda\xd7\xd8\xff\xd5\xd2\xd3\xff\xce\xcc\xcc\xff\xc9\xc5\xc5\
+\xff\xc2\xbe\xbf\xff\xb1\xac\xae\xff\xa1\x9a\x9b\xc1\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x97\x90\x92\
+\xb2\x9c\x96\x97\xff\x9a\x94\x95\xff\x9c\x96\x97\xff\x9e\x99\x9b\
+\xff\xa0\x9a\x9c\xff\xa1\x9c\x9e\xff\xa2\x9d\x9f\xff\xa3\x9e\xa0\
+\xff\xa4\x9f\xa1\xff\xa7\xa0\xa1\xff\xa7\xa1\xa3\xff\xa8\xa2\xa3\
+\xff\xa9\xa2\xa3\xff\xa9\xa2\xa4\xff\xa9\xa3\xa4\xff\xaa\xa3\xa6\
+\xff\xaa\xa4\xa7\xff\xad\xa7\xaa\xff\x3e\x38\x36\xff\x2d\x26\x24\
+\xff\x2e\x28\x25\xff\x2e\x29\x25\xff\x30\x29\x27\xff\x31\x2a\x27\
+\xff\x32\x2c\x29\xff\x35\x2d\x2a\xff\x36\x2e\x2b\xff\x37\x30\x2d\
+\xff\x39\x31\x2e\xff\x3a\x32\x2f\xff\x3b\x34\x2f\xff\x3c\x35\x30\
+\xff\x3c\x35\x31\xff\x3d\x35\x31\xff\x3e\x36\x32\xff\x4b\x45\x41\
+\xff\x5d\x57\x54\xff\x5c\x56\x52\xff\x5c\x56\x52\xff\x5c\x56\x51\
+\xff\x5b\x55\x51\xff\x5b\x54\x50\xff\x5a\x53\x4f\xff\x58\x51\x4d\
+\xff\x3e\x36\x32\xff\x3f\x37\x33\xff\x3f\x37\x33\xff\x3f\x37\x33\
+\xff\x3f\x37\x33\xff\x45\x3e\x3a\xff\x55\x4d\x4b\xff\x54\x4c\x49\
+\xff\x52\x4b\x48\xff\x52\x4a\x46\xff\x50\x48\x44\xff\x40\x38\x34\
+\xff\x40\x38\x34\xff\x40\x38\x34\xff\x40\x38\x34\xff\x40\x38\x34\
+\xff\x40\x38\x34\xff\x40\x38\x34\xff\x3f\x38\x34\xff\x3f\x38\x34\
+\xff\x3f\x38\x34\xff\x43\x3c\x38\xff\x43\x3d\x39\xff\x42\x3b\x37\
+\xff\x41\x39\x36\xff\x3f\x38\x34\xff\x3f\x37\x33\xff\x3e\x36\x32\
+\xff\x3c\x35\x32\xff\x3c\x35\x31\xff\x3c\x35\x31\xff\x3c\x34\x30\
+\xff\x3c\x34\x30\xff\x3c\x34\x30\xff\x3c\x34\x30\xff\x3b\x34\x30\
+\xff\x3b\x34\x30\xff\x3b\x34\x2f\xff\x3b\x34\x30\xff\x3b\x34\x30\
+\xff\x3b\x34\x30\xff\x3b\x34\x2f\xff\x3a\x33\x2f\xff\x3a\x34\x2f\
+\xff\x3a\x33\x2f\xff\x3a\x32\x2e\xff\x39\x32\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2d\xff\x37\x30\x2c\xff\x36\x2f\x2c\xff\x35\x2d\x2a\
+\xff\x34\x2d\x2a\xff\x32\x2c\x29\xff\x31\x2b\x28\xff\x2f\x28\x25\
+\xff\x33\x2d\x2a\xff\xa8\xa3\xa5\xff\xaa\xa5\xa6\xff\xaa\xa5\xa6\
+\xff\xaa\xa4\xa6\xff\xa8\xa3\xa4\xff\xa7\xa2\xa3\xff\xa6\xa0\xa1\
+\xff\xa5\x9f\xa0\xff\xa4\x9e\xa1\xff\xa3\x9d\x9f\xff\xa2\x9c\x9d\
+\xff\xa2\x9b\x9c\xff\xa1\x9b\x9c\xff\xa2\x9b\x9c\xff\xa2\x9c\x9d\
+\xff\xa9\xa3\xa4\xff\xab\xa6\xa7\xff\xa0\x99\x9b\xb8\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x96\x8e\x91\
+\xa8\x9f\x99\x9a\xff\xa7\xa2\xa3\xff\xa9\xa5\xa7\xff\xac\xa9\xaa\
+\xff\xae\xa9\xab\xff\xaf\xab\xad\xff\xb0\xad\xae\xff\xb1\xae\xaf\
+\xff\xb2\xb0\xb0\xff\xb3\xb1\xb2\xff\xb5\xb2\xb3\xff\xb7\xb4\xb6\
+\xff\xb9\xb6\xb7\xff\xba\xb7\xb8\xff\xbc\xb9\xb9\xff\xbd\xba\xbb\
+\xff\xbe\xbc\xbc\xff\xbb\xb8\xb9\xff\x46\x3f\x3c\xff\x3f\x38\x35\
+\xff\x43\x3a\x38\xff\x43\x3c\x38\xff\x45\x3c\x39\xff\x46\x3e\x3a\
+\xff\x48\x40\x3c\xff\x4a\x41\x3e\xff\x4c\x43\x3f\xff\x4e\x45\x40\
+\xff\x51\x48\x43\xff\x53\x49\x45\xff\x55\x4b\x46\xff\x57\x4c\x48\
+\xff\x58\x4d\x49\xff\x59\x4e\x4a\xff\x59\x4f\x4a\xff\x71\x67\x62\
+\xff\x8a\x81\x7d\xff\x8a\x81\x7c\xff\x8a\x81\x7d\xff\x8a\x81\x7d\
+\xff\x8a\x80\x7d\xff\x8a\x80\x7c\xff\x8a\x80\x7b\xff\x86\x7b\x76\
+\xff\x5f\x52\x4e\xff\x60\x54\x4f\xff\x60\x54\x4f\xff\x62\x54\x50\
+\xff\x62\x55\x50\xff\x71\x65\x60\xff\x85\x7b\x76\xff\x83\x79\x73\
+\xff\x83\x78\x73\xff\x81\x76\x72\xff\x75\x6a\x65\xff\x64\x58\x53\
+\xff\x65\x59\x53\xff\x65\x59\x54\xff\x65\x59\x54\xff\x65\x59\x54\
+\xff\x64\x58\x54\xff\x64\x58\x53\xff\x63\x57\x53\xff\x63\x57\x52\
+\xff\x63\x57\x52\xff\x6b\x5f\x5c\xff\x6a\x5e\x5a\xff\x68\x5c\x58\
+\xff\x65\x59\x55\xff\x64\x59\x54\xff\x64\x58\x54\xff\x62\x56\x52\
+\xff\x61\x54\x50\xff\x5f\x53\x4e\xff\x5e\x52\x4e\xff\x5d\x51\x4d\
+\xff\x5d\x51\x4d\xff\x5c\x50\x4b\xff\x5b\x50\x4b\xff\x5b\x4f\x4a\
+\xff\x5a\x4f\x49\xff\x59\x4e\x49\xff\x58\x4d\x48\xff\x57\x4b\x47\
+\xff\x56\x4a\x47\xff\x55\x4a\x46\xff\x54\x49\x45\xff\x53\x48\x44\
+\xff\x53\x47\x44\xff\x51\x47\x43\xff\x50\x46\x41\xff\x4f\x45\x40\
+\xff\x4d\x44\x3f\xff\x4b\x41\x3e\xff\x4a\x40\x3c\xff\x48\x3f\x3b\
+\xff\x46\x3d\x39\xff\x45\x3c\x37\xff\x42\x3a\x36\xff\x3e\x36\x33\
+\xff\x45\x3c\x38\xff\xb9\xb6\xb7\xff\xbd\xbb\xbc\xff\xbd\xbb\xbb\
+\xff\xbc\xb9\xba\xff\xbb\xb8\xba\xff\xbc\xb8\xba\xff\xbc\xb7\xb9\
+\xff\xbb\xb7\xb8\xff\xba\xb6\xb7\xff\xb9\xb5\xb6\xff\xb8\xb4\xb5\
+\xff\xb6\xb3\xb4\xff\xb6\xb2\xb3\xff\xb5\xb1\xb2\xff\xb2\xae\xb0\
+\xff\xac\xa6\xa8\xff\xa1\x9a\x9c\xff\xa2\x9a\x9c\xad\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\xa7\xa9\
+\x9e\xaa\xa6\xa8\xff\xba\xb7\xb8\xff\xc5\xc3\xc4\xff\xc9\xc8\xc8\
+\xff\xcb\xc9\xca\xff\xcc\xca\xcb\xff\xce\xcc\xcd\xff\xcf\xcd\xce\
+\xff\xd1\xcf\xd0\xff\xd2\xd0\xd1\xff\xd3\xd1\xd2\xff\xd4\xd2\xd3\
+\xff\xd5\xd3\xd4\xff\xd6\xd4\xd4\xff\xd7\xd5\xd6\xff\xd7\xd5\xd6\
+\xff\xd7\xd6\xd7\xff\xd9\xd7\xd8\xff\x96\x94\x93\xff\x91\x8e\x8d\
+\xff\x91\x8e\x8d\xff\x8c\x89\x87\xff\x87\x83\x82\xff\x82\x7e\x7d\
+\xff\x7e\x79\x78\xff\x79\x75\x73\xff\x75\x71\x6f\xff\x72\x6d\x6a\
+\xff\x6e\x69\x67\xff\x6a\x65\x63\xff\x67\x61\x5f\xff\x64\x5d\x5b\
+\xff\x60\x5a\x57\xff\x5c\x56\x54\xff\x59\x53\x50\xff\x6c\x66\x64\
+\xff\x70\x6a\x67\xff\x6d\x67\x65\xff\x6a\x65\x62\xff\x67\x63\x60\
+\xff\x66\x60\x5d\xff\x63\x5d\x5a\xff\x61\x5a\x58\xff\x51\x4a\x47\
+\xff\x40\x39\x36\xff\x3f\x38\x34\xff\x3d\x36\x33\xff\x3d\x35\x32\
+\xff\x3d\x36\x32\xff\x51\x4b\x48\xff\x51\x4a\x48\xff\x4f\x49\x46\
+\xff\x4e\x47\x44\xff\x4a\x43\x3f\xff\x38\x31\x2e\xff\x37\x30\x2d\
+\xff\x37\x30\x2d\xff\x37\x30\x2d\xff\x37\x30\x2d\xff\x37\x30\x2d\
+\xff\x37\x30\x2d\xff\x37\x30\x2d\xff\x37\x30\x2d\xff\x37\x30\x2c\
+\xff\x3d\x35\x32\xff\x3e\x36\x33\xff\x3d\x35\x33\xff\x3d\x35\x32\
+\xff\x3c\x34\x31\xff\x3b\x33\x30\xff\x3a\x32\x2f\xff\x3b\x33\x2f\
+\xff\x3a\x33\x30\xff\x39\x32\x2f\xff\x3a\x32\x2f\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x3b\x33\x30\xff\x3c\x33\x30\xff\x3d\x35\x32\
+\xff\x3d\x35\x33\xff\x3e\x36\x33\xff\x3f\x37\x34\xff\x40\x39\x35\
+\xff\x40\x3a\x36\xff\x41\x3b\x37\xff\x43\x3c\x39\xff\x44\x3d\x3a\
+\xff\x44\x3e\x3b\xff\x45\x3e\x3c\xff\x46\x40\x3d\xff\x47\x41\x3e\
+\xff\x48\x40\x3e\xff\x48\x42\x3f\xff\x49\x42\x3f\xff\x49\x42\x3f\
+\xff\x49\x42\x40\xff\x49\x43\x40\xff\x49\x43\x41\xff\x46\x41\x3f\
+\xff\x4f\x49\x46\xff\xaf\xac\xad\xff\xb1\xae\xaf\xff\xb2\xae\xaf\
+\xff\xb3\xaf\xb0\xff\xb3\xb0\xb1\xff\xb4\xb1\xb2\xff\xb5\xb2\xb3\
+\xff\xb6\xb2\xb4\xff\xb6\xb3\xb4\xff\xb6\xb2\xb4\xff\xb6\xb2\xb3\
+\xff\xb5\xb2\xb3\xff\xb6\xb2\xb3\xff\xb6\xb2\xb3\xff\xb5\xb1\xb2\
+\xff\xb5\xb1\xb2\xff\xb2\xad\xaf\xff\xa2\x9b\x9e\xa2\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xad\xaa\xac\
+\xa6\xb7\xb4\xb5\xff\xcb\xc9\xca\xff\xcc\xca\xcb\xff\xce\xcc\xcd\
+\xff\xd0\xce\xce\xff\xd1\xcf\xd0\xff\xd4\xd1\xd2\xff\xd5\xd3\xd4\
+\xff\xd6\xd4\xd5\xff\xd8\xd6\xd7\xff\xd9\xd7\xd8\xff\xda\xd9\xd9\
+\xff\xdb\xd9\xda\xff\xdb\xda\xdb\xff\xdc\xda\xdb\xff\xdd\xdb\xdc\
+\xff\xdd\xdb\xdc\xff\xde\xdb\xdc\xff\xa3\xa0\xa0\xff\x92\x8e\x8e\
+\xff\x90\x8d\x8c\xff\x8c\x89\x87\xff\x87\x84\x82\xff\x82\x7e\x7d\
+\xff\x7e\x79\x78\xff\x79\x75\x73\xff\x75\x71\x6f\xff\x72\x6d\x6a\
+\xff\x6e\x69\x66\xff\x6a\x65\x63\xff\x67\x62\x5e\xff\x64\x5e\x5b\
+\xff\x61\x5b\x58\xff\x5d\x57\x55\xff\x5c\x56\x52\xff\x73\x6f\x6d\
+\xff\x71\x6c\x6a\xff\x6f\x69\x67\xff\x6c\x66\x64\xff\x69\x64\x62\
+\xff\x67\x61\x5f\xff\x65\x5f\x5c\xff\x61\x5b\x59\xff\x44\x3d\x39\
+\xff\x40\x3a\x36\xff\x3f\x39\x35\xff\x3d\x36\x34\xff\x3c\x35\x33\
+\xff\x4b\x45\x42\xff\x55\x4e\x4c\xff\x53\x4d\x4a\xff\x51\x4c\x49\
+\xff\x4f\x4a\x47\xff\x3c\x35\x32\xff\x37\x31\x2e\xff\x37\x31\x2e\
+\xff\x37\x31\x2e\xff\x37\x31\x2e\xff\x37\x31\x2e\xff\x37\x31\x2e\
+\xff\x37\x31\x2e\xff\x37\x30\x2d\xff\x37\x30\x2d\xff\x3d\x37\x34\
+\xff\x41\x3b\x37\xff\x40\x3a\x36\xff\x3f\x37\x34\xff\x3e\x36\x33\
+\xff\x3d\x35\x33\xff\x3c\x35\x32\xff\x3c\x35\x32\xff\x3b\x34\x31\
+\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x3a\x33\x30\
+\xff\x3b\x33\x30\xff\x3c\x34\x31\xff\x3d\x35\x33\xff\x3d\x35\x33\
+\xff\x3e\x37\x34\xff\x40\x39\x36\xff\x40\x3a\x36\xff\x42\x3b\x37\
+\xff\x43\x3d\x39\xff\x44\x3d\x3b\xff\x46\x3f\x3c\xff\x48\x40\x3e\
+\xff\x49\x42\x3f\xff\x49\x43\x40\xff\x4b\x43\x41\xff\x4c\x45\x42\
+\xff\x4d\x46\x43\xff\x4d\x47\x44\xff\x4d\x48\x45\xff\x4e\x48\x46\
+\xff\x4f\x49\x47\xff\x4f\x4a\x47\xff\x50\x4a\x48\xff\x50\x4b\x48\
+\xff\x62\x5c\x5b\xff\xbb\xb7\xb9\xff\xb9\xb5\xb7\xff\xba\xb7\xb7\
+\xff\xbb\xb7\xb8\xff\xbc\xb8\xb9\xff\xbc\xb8\xba\xff\xbc\xb9\xba\
+\xff\xbc\xb8\xba\xff\xbd\xb9\xbb\xff\xbd\xb9\xba\xff\xbc\xb8\xba\
+\xff\xbb\xb7\xba\xff\xbc\xb8\xb9\xff\xbb\xb7\xba\xff\xbb\xb7\xb8\
+\xff\xb9\xb5\xb7\xff\xb3\xaf\xb1\xff\xb7\xb2\xb5\x99\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa8\xa4\xa5\
+\x9d\xbc\xb9\xba\xff\xce\xcb\xcc\xff\xcf\xcd\xce\xff\xd1\xce\xcf\
+\xff\xd3\xd0\xd2\xff\xd5\xd3\xd4\xff\xd6\xd4\xd5\xff\xd8\xd6\xd6\
+\xff\xd9\xd7\xd8\xff\xda\xd8\xd9\xff\xdb\xd9\xda\xff\xdc\xda\xdb\
+\xff\xdd\xdb\xdc\xff\xde\xdc\xdc\xff\xdf\xdc\xdd\xff\xe0\xdd\xde\
+\xff\xe0\xde\xdf\xff\xdf\xdd\xdd\xff\xb0\xae\xae\xff\x92\x8d\x8c\
+\xff\x8f\x8c\x8b\xff\x8b\x88\x86\xff\x86\x82\x81\xff\x81\x7d\x7c\
+\xff\x7c\x79\x76\xff\x78\x74\x72\xff\x74\x70\x6e\xff\x71\x6c\x69\
+\xff\x6d\x68\x66\xff\x69\x64\x62\xff\x66\x61\x5f\xff\x63\x5d\x5b\
+\xff\x60\x5a\x57\xff\x5c\x56\x54\xff\x65\x60\x5d\xff\x77\x72\x70\
+\xff\x73\x6f\x6d\xff\x71\x6c\x69\xff\x6f\x69\x66\xff\x6c\x66\x64\
+\xff\x69\x64\x61\xff\x67\x62\x5f\xff\x56\x50\x4e\xff\x42\x3b\x38\
+\xff\x41\x3b\x37\xff\x3f\x39\x35\xff\x3e\x36\x34\xff\x41\x3b\x38\
+\xff\x59\x53\x50\xff\x57\x51\x4d\xff\x55\x4e\x4c\xff\x54\x4e\x4b\
+\xff\x44\x3e\x3a\xff\x38\x31\x2e\xff\x37\x31\x2e\xff\x37\x31\x2e\
+\xff\x37\x31\x2e\xff\x37\x31\x2e\xff\x37\x31\x2e\xff\x37\x31\x2e\
+\xff\x37\x31\x2e\xff\x37\x30\x2d\xff\x3f\x37\x34\xff\x44\x3e\x3b\
+\xff\x43\x3d\x39\xff\x42\x3b\x37\xff\x40\x3a\x36\xff\x40\x39\x35\
+\xff\x3e\x37\x34\xff\x3e\x36\x34\xff\x3d\x36\x33\xff\x3b\x33\x30\
+\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3b\x33\x30\xff\x3c\x34\x31\
+\xff\x3c\x35\x32\xff\x3d\x36\x33\xff\x3f\x37\x34\xff\x40\x39\x35\
+\xff\x41\x3a\x36\xff\x42\x3b\x38\xff\x43\x3d\x3a\xff\x45\x3e\x3b\
+\xff\x47\x40\x3d\xff\x48\x41\x3f\xff\x49\x43\x40\xff\x4b\x44\x41\
+\xff\x4d\x46\x43\xff\x4d\x47\x44\xff\x4f\x49\x46\xff\x50\x4a\x47\
+\xff\x51\x4b\x49\xff\x52\x4c\x4a\xff\x54\x4d\x4b\xff\x54\x4e\x4c\
+\xff\x54\x4e\x4c\xff\x55\x50\x4d\xff\x56\x50\x4e\xff\x5a\x54\x51\
+\xff\x76\x70\x6f\xff\xc4\xbf\xc1\xff\xc1\xbd\xbf\xff\xc1\xbe\xc0\
+\xff\xc2\xbe\xbf\xff\xc2\xbe\xc0\xff\xc2\xbe\xc0\xff\xc2\xbf\xc0\
+\xff\xc2\xbf\xc0\xff\xc2\xbe\xc0\xff\xc2\xbe\xbf\xff\xc1\xbd\xbf\
+\xff\xc0\xbd\xbe\xff\xc1\xbe\xbf\xff\xc0\xbc\xbd\xff\xbf\xbc\xbd\
+\xff\xbf\xbb\xbd\xff\xb9\xb5\xb7\xff\xbb\xb7\xb9\x8c\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xa6\xa8\
+\x73\xb7\xb4\xb5\xff\xd0\xce\xcf\xff\xd2\xcf\xd0\xff\xd4\xd1\xd2\
+\xff\xd5\xd3\xd4\xff\xd7\xd5\xd6\xff\xd9\xd7\xd7\xff\xd9\xd7\xd8\
+\xff\xdb\xd9\xda\xff\xdc\xda\xdb\xff\xdd\xdb\xdc\xff\xde\xdb\xdc\
+\xff\xdf\xdc\xdd\xff\xe0\xdd\xdf\xff\xe1\xdf\xe0\xff\xe2\xe0\xe0\
+\xff\xe2\xe0\xe1\xff\xe1\xdf\xe0\xff\xc0\xbe\xbe\xff\x90\x8c\x8b\
+\xff\x8d\x8a\x89\xff\x8a\x86\x85\xff\x84\x81\x80\xff\x80\x7c\x7b\
+\xff\x7b\x77\x75\xff\x77\x73\x71\xff\x73\x6f\x6c\xff\x6f\x6a\x68\
+\xff\x6c\x67\x65\xff\x68\x63\x61\xff\x66\x60\x5d\xff\x63\x5c\x5a\
+\xff\x5f\x59\x57\xff\x5b\x55\x52\xff\x72\x6c\x6a\xff\x78\x73\x71\
+\xff\x75\x70\x6e\xff\x73\x6e\x6b\xff\x70\x6a\x68\xff\x6e\x68\x66\
+\xff\x6c\x66\x64\xff\x68\x62\x60\xff\x47\x41\x3e\xff\x42\x3b\x38\
+\xff\x41\x3b\x37\xff\x40\x38\x35\xff\x3e\x36\x33\xff\x55\x4f\x4d\
+\xff\x5b\x55\x51\xff\x59\x52\x50\xff\x57\x51\x4e\xff\x4e\x48\x46\
+\xff\x39\x31\x2e\xff\x3a\x32\x2f\xff\x39\x31\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x37\x30\x2d\xff\x3f\x37\x34\xff\x47\x40\x3d\xff\x46\x3f\x3c\
+\xff\x44\x3e\x3b\xff\x43\x3d\x39\xff\x42\x3b\x37\xff\x41\x3a\x36\
+\xff\x40\x3a\x36\xff\x3f\x37\x34\xff\x3b\x33\x30\xff\x3a\x33\x30\
+\xff\x3a\x33\x30\xff\x3b\x33\x30\xff\x3c\x34\x31\xff\x3d\x36\x33\
+\xff\x3e\x36\x34\xff\x3f\x38\x34\xff\x40\x39\x36\xff\x41\x3b\x37\
+\xff\x43\x3c\x39\xff\x45\x3e\x3b\xff\x47\x3f\x3c\xff\x48\x41\x3e\
+\xff\x4a\x43\x40\xff\x4b\x45\x42\xff\x4d\x47\x43\xff\x4e\x49\x46\
+\xff\x50\x4a\x47\xff\x52\x4c\x49\xff\x53\x4d\x4b\xff\x55\x4e\x4c\
+\xff\x56\x50\x4d\xff\x57\x51\x4e\xff\x58\x52\x50\xff\x5a\x54\x51\
+\xff\x5a\x55\x52\xff\x5b\x56\x53\xff\x5b\x56\x54\xff\x65\x5e\x5b\
+\xff\x8b\x87\x87\xff\xc9\xc6\xc7\xff\xc8\xc4\xc6\xff\xc8\xc5\xc7\
+\xff\xc8\xc5\xc6\xff\xc8\xc5\xc7\xff\xc9\xc5\xc7\xff\xc8\xc4\xc6\
+\xff\xc8\xc5\xc6\xff\xc8\xc4\xc6\xff\xc7\xc3\xc5\xff\xc6\xc2\xc4\
+\xff\xc5\xc1\xc3\xff\xc5\xc1\xc2\xff\xc4\xc0\xc2\xff\xc4\xbf\xc1\
+\xff\xc3\xbf\xc1\xff\xbc\xb8\xb9\xff\xbc\xb8\xba\x7b\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xad\xad\
+\x48\xb6\xb2\xb3\xff\xd3\xd0\xd1\xff\xd4\xd1\xd2\xff\xd5\xd3\xd4\
+\xff\xd7\xd5\xd6\xff\xd9\xd6\xd7\xff\xda\xd8\xd9\xff\xdb\xd9\xda\
+\xff\xdd\xdb\xdb\xff\xde\xdc\xdc\xff\xe0\xdd\xde\xff\xe1\xde\xdf\
+\xff\xe2\xe0\xe1\xff\xe3\xe1\xe1\xff\xe3\xe2\xe2\xff\xe4\xe2\xe3\
+\xff\xe5\xe2\xe3\xff\xe4\xe2\xe3\xff\xd1\xcf\xd0\xff\x8f\x8c\x89\
+\xff\x8a\x87\x86\xff\x89\x85\x84\xff\x83\x7f\x7e\xff\x7e\x7b\x79\
+\xff\x7a\x75\x74\xff\x75\x71\x6f\xff\x71\x6d\x6b\xff\x6e\x69\x67\
+\xff\x6a\x65\x64\xff\x67\x63\x60\xff\x64\x5f\x5c\xff\x62\x5b\x59\
+\xff\x5d\x58\x56\xff\x5d\x57\x54\xff\x7b\x75\x74\xff\x7a\x75\x72\
+\xff\x77\x72\x70\xff\x74\x70\x6d\xff\x72\x6d\x6a\xff\x70\x6a\x67\
+\xff\x6e\x68\x66\xff\x5d\x56\x54\xff\x43\x3c\x3a\xff\x42\x3b\x37\
+\xff\x40\x3a\x36\xff\x3f\x37\x34\xff\x49\x42\x40\xff\x5f\x59\x57\
+\xff\x5c\x56\x54\xff\x5a\x55\x51\xff\x57\x51\x4e\xff\x3c\x35\x32\
+\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x37\x30\x2d\
+\xff\x3e\x37\x34\xff\x4a\x42\x40\xff\x49\x41\x3f\xff\x47\x40\x3d\
+\xff\x46\x3f\x3c\xff\x44\x3d\x3b\xff\x43\x3d\x39\xff\x42\x3b\x37\
+\xff\x40\x39\x36\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3b\x33\x30\
+\xff\x3b\x33\x30\xff\x3c\x34\x31\xff\x3d\x35\x32\xff\x3e\x36\x34\
+\xff\x3f\x38\x34\xff\x40\x3a\x36\xff\x42\x3b\x37\xff\x43\x3d\x3a\
+\xff\x45\x3e\x3c\xff\x47\x40\x3d\xff\x49\x42\x3f\xff\x4b\x43\x41\
+\xff\x4d\x47\x43\xff\x4e\x48\x45\xff\x51\x4b\x48\xff\x52\x4c\x4a\
+\xff\x55\x4e\x4b\xff\x56\x50\x4d\xff\x58\x52\x4f\xff\x59\x54\x51\
+\xff\x5b\x55\x52\xff\x5c\x56\x55\xff\x5d\x58\x55\xff\x5f\x59\x57\
+\xff\x60\x5b\x58\xff\x61\x5c\x59\xff\x61\x5b\x5a\xff\x6d\x67\x63\
+\xff\xa2\x9e\x9e\xff\xcf\xcb\xcc\xff\xce\xcb\xcc\xff\xcf\xcb\xcd\
+\xff\xce\xcb\xcc\xff\xcf\xcb\xcd\xff\xcf\xcb\xcd\xff\xce\xcb\xcc\
+\xff\xcf\xcb\xcc\xff\xce\xca\xcc\xff\xcd\xca\xcb\xff\xcd\xca\xcb\
+\xff\xcc\xc8\xc9\xff\xcb\xc8\xc9\xff\xcb\xc7\xc9\xff\xca\xc6\xc8\
+\xff\xc9\xc5\xc7\xff\xbf\xbb\xbd\xff\xbe\xbb\xbb\x4b\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\xb7\xb7\
+\x20\xb8\xb4\xb6\xfd\xd4\xd1\xd3\xff\xd6\xd4\xd5\xff\xd8\xd5\xd6\
+\xff\xda\xd7\xd8\xff\xdb\xd9\xda\xff\xdd\xdb\xdc\xff\xdf\xdc\xdd\
+\xff\xe1\xde\xdf\xff\xe2\xe0\xe1\xff\xe3\xe1\xe2\xff\xe4\xe1\xe2\
+\xff\xe5\xe2\xe3\xff\xe5\xe3\xe4\xff\xe6\xe4\xe5\xff\xe6\xe4\xe5\
+\xff\xe7\xe5\xe6\xff\xe7\xe4\xe5\xff\xdf\xdd\xde\xff\x91\x8d\x8c\
+\xff\x87\x84\x83\xff\x87\x82\x81\xff\x81\x7d\x7c\xff\x7c\x78\x77\
+\xff\x78\x73\x72\xff\x73\x6f\x6e\xff\x70\x6b\x69\xff\x6c\x67\x65\
+\xff\x69\x64\x62\xff\x66\x61\x5e\xff\x63\x5e\x5b\xff\x61\x5b\x58\
+\xff\x5d\x57\x55\xff\x67\x61\x5f\xff\x7e\x79\x77\xff\x7b\x76\x74\
+\xff\x79\x73\x71\xff\x76\x71\x6f\xff\x73\x6f\x6c\xff\x71\x6c\x69\
+\xff\x6f\x69\x67\xff\x4a\x43\x41\xff\x43\x3d\x3a\xff\x42\x3b\x37\
+\xff\x40\x3a\x36\xff\x40\x39\x36\xff\x5f\x58\x56\xff\x60\x5a\x58\
+\xff\x5f\x58\x56\xff\x5d\x57\x54\xff\x45\x3e\x3a\xff\x39\x32\x2f\
+\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x37\x30\x2d\xff\x3d\x36\x33\
+\xff\x4c\x45\x42\xff\x4b\x44\x41\xff\x4a\x42\x40\xff\x49\x41\x3f\
+\xff\x47\x40\x3d\xff\x46\x3f\x3c\xff\x44\x3e\x3b\xff\x42\x3b\x38\
+\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3b\x33\x30\
+\xff\x3c\x34\x31\xff\x3d\x36\x33\xff\x3e\x36\x34\xff\x40\x38\x35\
+\xff\x40\x3a\x36\xff\x42\x3b\x38\xff\x43\x3d\x3a\xff\x46\x3e\x3c\
+\xff\x48\x41\x3e\xff\x4a\x42\x40\xff\x4c\x45\x42\xff\x4e\x48\x44\
+\xff\x50\x4a\x47\xff\x53\x4c\x49\xff\x55\x4e\x4b\xff\x56\x50\x4e\
+\xff\x59\x53\x4f\xff\x5a\x55\x52\xff\x5c\x56\x54\xff\x5e\x58\x56\
+\xff\x61\x5a\x58\xff\x62\x5c\x59\xff\x63\x5e\x5b\xff\x64\x60\x5d\
+\xff\x66\x61\x5f\xff\x67\x63\x61\xff\x66\x61\x5f\xff\x76\x6f\x6c\
+\xff\xba\xb6\xb7\xff\xd6\xd3\xd4\xff\xd6\xd2\xd4\xff\xd6\xd2\xd4\
+\xff\xd7\xd3\xd5\xff\xd7\xd3\xd5\xff\xd7\xd3\xd5\xff\xd6\xd2\xd4\
+\xff\xd6\xd2\xd3\xff\xd5\xd1\xd2\xff\xd5\xd1\xd2\xff\xd4\xcf\xd1\
+\xff\xd2\xce\xcf\xff\xd1\xcd\xcf\xff\xcf\xcc\xce\xff\xcf\xcb\xcd\
+\xff\xce\xca\xcc\xff\xc3\xbe\xc0\xfc\xc3\xc3\xc3\x1e\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaa\xaa\
+\x03\xbc\xb8\xb9\xe7\xd3\xd1\xd2\xff\xd9\xd7\xd8\xff\xdb\xd8\xd9\
+\xff\xdd\xda\xdb\xff\xdf\xdb\xdd\xff\xe0\xdd\xdf\xff\xe2\xe0\xe0\
+\xff\xe4\xe1\xe2\xff\xe4\xe2\xe3\xff\xe5\xe3\xe4\xff\xe6\xe4\xe5\
+\xff\xe7\xe5\xe5\xff\xe8\xe5\xe6\xff\xe8\xe6\xe7\xff\xe9\xe6\xe7\
+\xff\xe9\xe6\xe7\xff\xe9\xe7\xe8\xff\xe9\xe6\xe7\xff\x97\x93\x91\
+\xff\x88\x84\x83\xff\x84\x80\x7f\xff\x7f\x7c\x7a\xff\x7b\x76\x75\
+\xff\x76\x72\x70\xff\x72\x6e\x6c\xff\x6e\x69\x67\xff\x6b\x66\x63\
+\xff\x67\x63\x61\xff\x64\x5f\x5c\xff\x62\x5c\x5a\xff\x60\x59\x57\
+\xff\x5b\x55\x53\xff\x75\x70\x6e\xff\x7f\x7a\x77\xff\x7d\x78\x75\
+\xff\x7a\x75\x73\xff\x78\x73\x70\xff\x75\x70\x6e\xff\x73\x6e\x6b\
+\xff\x62\x5d\x5a\xff\x44\x3d\x3b\xff\x43\x3d\x3a\xff\x42\x3b\x37\
+\xff\x3f\x38\x35\xff\x54\x4d\x4a\xff\x64\x5e\x5c\xff\x62\x5c\x5a\
+\xff\x61\x5a\x58\xff\x51\x4b\x47\xff\x3a\x32\x2f\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x39\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x3c\x35\x32\xff\x4f\x48\x45\
+\xff\x4d\x47\x43\xff\x4c\x45\x42\xff\x4b\x44\x41\xff\x4a\x43\x40\
+\xff\x49\x41\x3f\xff\x47\x40\x3d\xff\x43\x3b\x39\xff\x3a\x32\x2f\
+\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3b\x33\x30\xff\x3c\x34\x31\
+\xff\x3d\x35\x32\xff\x3e\x36\x34\xff\x3f\x38\x35\xff\x40\x3b\x37\
+\xff\x42\x3c\x38\xff\x44\x3e\x3b\xff\x46\x3f\x3c\xff\x48\x41\x3e\
+\xff\x4a\x43\x40\xff\x4c\x46\x42\xff\x4e\x48\x45\xff\x50\x4a\x48\
+\xff\x54\x4d\x4a\xff\x56\x4f\x4d\xff\x58\x53\x4f\xff\x5a\x54\x52\
+\xff\x5d\x57\x54\xff\x5e\x59\x57\xff\x61\x5b\x58\xff\x63\x5e\x5b\
+\xff\x65\x60\x5d\xff\x67\x62\x5f\xff\x69\x64\x62\xff\x6b\x66\x64\
+\xff\x6c\x67\x65\xff\x6e\x69\x67\xff\x6c\x67\x66\xff\x7e\x77\x75\
+\xff\xcf\xcc\xcd\xff\xdc\xd8\xda\xff\xdc\xd9\xda\xff\xdc\xd9\xdb\
+\xff\xdc\xd9\xda\xff\xdc\xd8\xda\xff\xdb\xd7\xd9\xff\xdb\xd7\xd9\
+\xff\xdb\xd7\xd9\xff\xda\xd7\xd8\xff\xd9\xd6\xd7\xff\xd8\xd5\xd6\
+\xff\xd7\xd3\xd5\xff\xd6\xd2\xd3\xff\xd5\xd0\xd2\xff\xd4\xcf\xd1\
+\xff\xd0\xcb\xcd\xff\xc6\xc0\xc2\xe3\xff\xff\xff\x01\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xc0\xbc\xbd\xbb\xd1\xce\xcf\xff\xdb\xd8\xda\xff\xdc\xda\xdb\
+\xff\xdf\xdb\xdc\xff\xe0\xdd\xdf\xff\xe3\xe0\xe1\xff\xe4\xe1\xe2\
+\xff\xe5\xe3\xe4\xff\xe6\xe4\xe5\xff\xe7\xe5\xe6\xff\xe8\xe6\xe7\
+\xff\xe9\xe6\xe7\xff\xea\xe7\xe8\xff\xea\xe8\xe9\xff\xeb\xe8\xe9\
+\xff\xec\xe9\xea\xff\xec\xe8\xe9\xff\xee\xeb\xec\xff\xa0\x9c\x9b\
+\xff\x8a\x86\x84\xff\x81\x7e\x7d\xff\x7d\x7a\x78\xff\x78\x74\x72\
+\xff\x73\x70\x6e\xff\x6f\x6b\x69\xff\x6c\x67\x65\xff\x68\x64\x62\
+\xff\x65\x61\x5e\xff\x63\x5d\x5b\xff\x61\x5b\x58\xff\x5d\x58\x56\
+\xff\x5c\x57\x54\xff\x80\x7b\x79\xff\x7f\x7b\x79\xff\x7e\x78\x76\
+\xff\x7c\x76\x74\xff\x79\x74\x72\xff\x76\x72\x6f\xff\x74\x6f\x6e\
+\xff\x4d\x47\x44\xff\x45\x3e\x3b\xff\x43\x3c\x39\xff\x41\x3b\x37\
+\xff\x45\x3e\x3b\xff\x67\x61\x5f\xff\x65\x60\x5d\xff\x64\x5e\x5b\
+\xff\x5e\x57\x54\xff\x3b\x34\x31\xff\x3a\x33\x30\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x39\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x3b\x34\x31\xff\x51\x4a\x47\xff\x50\x4a\x48\
+\xff\x4f\x49\x45\xff\x4d\x47\x43\xff\x4c\x45\x42\xff\x4b\x44\x41\
+\xff\x4a\x42\x40\xff\x43\x3c\x39\xff\x39\x31\x2e\xff\x3a\x33\x30\
+\xff\x3a\x33\x30\xff\x3b\x33\x30\xff\x3c\x34\x31\xff\x3d\x35\x32\
+\xff\x3e\x36\x34\xff\x3f\x38\x34\xff\x40\x3a\x36\xff\x42\x3b\x38\
+\xff\x44\x3d\x3b\xff\x47\x3f\x3c\xff\x48\x41\x3e\xff\x4a\x43\x40\
+\xff\x4c\x46\x42\xff\x4f\x49\x46\xff\x52\x4b\x49\xff\x54\x4e\x4b\
+\xff\x57\x51\x4e\xff\x59\x54\x51\xff\x5b\x56\x54\xff\x5e\x59\x56\
+\xff\x62\x5b\x59\xff\x63\x5d\x5b\xff\x66\x61\x5e\xff\x68\x63\x61\
+\xff\x6a\x65\x63\xff\x6d\x67\x65\xff\x6f\x6a\x67\xff\x71\x6c\x6a\
+\xff\x72\x6e\x6c\xff\x74\x70\x6e\xff\x74\x6f\x6e\xff\x8a\x83\x81\
+\xff\xdf\xdb\xdd\xff\xe2\xde\xe1\xff\xe2\xde\xdf\xff\xe1\xde\xdf\
+\xff\xe2\xde\xdf\xff\xe2\xde\xdf\xff\xe1\xdd\xde\xff\xe1\xdd\xde\
+\xff\xdf\xdc\xdd\xff\xdf\xda\xdc\xff\xdd\xda\xdb\xff\xdc\xd9\xda\
+\xff\xdb\xd7\xd9\xff\xd9\xd6\xd7\xff\xd8\xd4\xd6\xff\xd7\xd3\xd5\
+\xff\xd1\xcd\xce\xff\xc9\xc4\xc5\xb6\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xc7\xc2\xc3\x8a\xd0\xcc\xce\xff\xdf\xdb\xdc\xff\xe0\xdc\xde\
+\xff\xe1\xde\xe0\xff\xe3\xe0\xe1\xff\xe5\xe2\xe3\xff\xe6\xe3\xe4\
+\xff\xe7\xe5\xe6\xff\xe8\xe6\xe7\xff\xe9\xe6\xe8\xff\xeb\xe8\xe9\
+\xff\xeb\xe8\xe9\xff\xed\xe9\xeb\xff\xed\xe9\xeb\xff\xed\xea\xec\
+\xff\xed\xeb\xec\xff\xed\xeb\xec\xff\xef\xec\xed\xff\xad\xaa\xa9\
+\xff\x8d\x88\x85\xff\x7e\x7b\x79\xff\x7a\x77\x75\xff\x75\x72\x71\
+\xff\x72\x6e\x6c\xff\x6d\x69\x67\xff\x69\x65\x63\xff\x66\x62\x60\
+\xff\x63\x5e\x5c\xff\x61\x5b\x59\xff\x5f\x59\x57\xff\x5b\x56\x54\
+\xff\x67\x61\x5e\xff\x84\x7f\x7e\xff\x81\x7c\x7a\xff\x7f\x7a\x77\
+\xff\x7d\x78\x76\xff\x7b\x75\x73\xff\x79\x73\x71\xff\x69\x64\x61\
+\xff\x45\x3e\x3b\xff\x44\x3d\x3b\xff\x42\x3b\x38\xff\x40\x3a\x36\
+\xff\x60\x5a\x57\xff\x69\x64\x62\xff\x67\x62\x60\xff\x66\x60\x5d\
+\xff\x44\x3d\x39\xff\x3a\x32\x2f\xff\x3a\x33\x30\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x38\x31\x2e\
+\xff\x3a\x33\x30\xff\x52\x4b\x48\xff\x54\x4d\x4b\xff\x52\x4c\x49\
+\xff\x50\x4a\x48\xff\x4f\x49\x45\xff\x4d\x47\x43\xff\x4c\x46\x42\
+\xff\x42\x3b\x38\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x3a\x33\x30\
+\xff\x3b\x33\x30\xff\x3c\x34\x31\xff\x3d\x35\x32\xff\x3d\x36\x33\
+\xff\x3f\x38\x34\xff\x40\x3a\x36\xff\x42\x3b\x37\xff\x43\x3d\x3a\
+\xff\x46\x3f\x3c\xff\x48\x41\x3e\xff\x4a\x43\x40\xff\x4d\x46\x43\
+\xff\x4f\x49\x46\xff\x52\x4b\x49\xff\x55\x4e\x4c\xff\x57\x51\x4e\
+\xff\x5a\x54\x51\xff\x5d\x57\x55\xff\x60\x5a\x57\xff\x63\x5c\x5a\
+\xff\x65\x60\x5e\xff\x68\x63\x60\xff\x6a\x65\x63\xff\x6d\x68\x66\
+\xff\x70\x6b\x68\xff\x72\x6e\x6b\xff\x74\x70\x6e\xff\x77\x72\x70\
+\xff\x79\x74\x72\xff\x7b\x77\x74\xff\x7f\x7a\x78\xff\x94\x8f\x8d\
+\xff\xe9\xe5\xe7\xff\xe6\xe3\xe4\xff\xe6\xe3\xe4\xff\xe6\xe3\xe4\
+\xff\xe6\xe3\xe4\xff\xe6\xe2\xe4\xff\xe5\xe2\xe3\xff\xe5\xe1\xe3\
+\xff\xe4\xe0\xe2\xff\xe2\xdf\xe0\xff\xe2\xde\xe0\xff\xe1\xdc\xde\
+\xff\xde\xdb\xdc\xff\xdd\xd9\xdb\xff\xdb\xd8\xd9\xff\xda\xd6\xd8\
+\xff\xd1\xcc\xce\xff\xcc\xc8\xca\x84\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xcb\xc5\xc8\x54\xd0\xca\xcd\xff\xe1\xdd\xdf\xff\xe2\xde\xdf\
+\xff\xe3\xe0\xe2\xff\xe4\xe1\xe3\xff\xe6\xe3\xe4\xff\xe8\xe5\xe6\
+\xff\xe9\xe6\xe7\xff\xea\xe7\xe8\xff\xec\xe8\xe9\xff\xec\xe9\xea\
+\xff\xed\xe9\xeb\xff\xee\xea\xec\xff\xee\xeb\xec\xff\xef\xec\xed\
+\xff\xef\xec\xed\xff\xef\xec\xed\xff\xef\xec\xed\xff\xbe\xbb\xbb\
+\xff\x8f\x88\x85\xff\x7b\x76\x75\xff\x78\x74\x72\xff\x73\x70\x6e\
+\xff\x6f\x6a\x69\xff\x6b\x66\x65\xff\x67\x63\x61\xff\x64\x60\x5d\
+\xff\x62\x5c\x5a\xff\x5f\x5a\x57\xff\x5c\x57\x55\xff\x59\x53\x51\
+\xff\x77\x71\x70\xff\x84\x7f\x7d\xff\x82\x7e\x7c\xff\x80\x7b\x79\
+\xff\x7e\x79\x76\xff\x7c\x77\x75\xff\x7a\x75\x73\xff\x50\x4b\x48\
+\xff\x45\x3e\x3c\xff\x43\x3d\x3a\xff\x41\x3b\x37\xff\x4e\x48\x45\
+\xff\x6f\x68\x66\xff\x6b\x65\x64\xff\x69\x64\x62\xff\x52\x4b\x48\
+\xff\x3a\x32\x2f\xff\x3a\x33\x30\xff\x3a\x33\x30\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x39\x32\x2e\
+\xff\x53\x4c\x49\xff\x57\x50\x4e\xff\x56\x4f\x4c\xff\x54\x4d\x4b\
+\xff\x52\x4c\x49\xff\x50\x4a\x48\xff\x4f\x49\x45\xff\x41\x3a\x37\
+\xff\x39\x31\x2e\xff\x3a\x32\x2f\xff\x3a\x33\x30\xff\x3a\x33\x30\
+\xff\x3b\x33\x30\xff\x3d\x35\x32\xff\x3d\x36\x33\xff\x3f\x37\x34\
+\xff\x40\x39\x36\xff\x42\x3b\x37\xff\x43\x3d\x3a\xff\x46\x3e\x3c\
+\xff\x48\x41\x3e\xff\x4a\x43\x40\xff\x4c\x46\x42\xff\x4f\x49\x46\
+\xff\x52\x4b\x49\xff\x55\x4e\x4b\xff\x57\x51\x4e\xff\x5a\x54\x52\
+\xff\x5d\x57\x55\xff\x61\x5b\x58\xff\x64\x5d\x5b\xff\x66\x61\x5f\
+\xff\x6a\x64\x62\xff\x6d\x67\x65\xff\x70\x6a\x68\xff\x72\x6e\x6b\
+\xff\x75\x70\x6e\xff\x78\x73\x71\xff\x7b\x75\x74\xff\x7d\x79\x77\
+\xff\x7f\x7c\x79\xff\x81\x7d\x7b\xff\x8c\x86\x84\xff\xa2\x9e\x9d\
+\xff\xed\xea\xec\xff\xe9\xe7\xe8\xff\xe9\xe6\xe7\xff\xe8\xe6\xe7\
+\xff\xe8\xe5\xe7\xff\xe8\xe5\xe6\xff\xe7\xe4\xe5\xff\xe7\xe4\xe5\
+\xff\xe6\xe2\xe4\xff\xe5\xe1\xe3\xff\xe4\xe0\xe2\xff\xe2\xdf\xe0\
+\xff\xe0\xdd\xdf\xff\xdf\xdc\xdd\xff\xdd\xda\xdc\xff\xdd\xd9\xdb\
+\xff\xd0\xcb\xcd\xff\xcf\xc8\xcc\x50\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xcc\xc4\xcc\x23\xce\xc9\xcb\xff\xe1\xdc\xde\xff\xe2\xde\xe0\
+\xff\xe3\xe1\xe2\xff\xe4\xe1\xe3\xff\xe7\xe3\xe5\xff\xe7\xe4\xe6\
+\xff\xe9\xe6\xe7\xff\xeb\xe7\xe8\xff\xec\xe8\xe9\xff\xed\xe9\xeb\
+\xff\xee\xea\xec\xff\xef\xec\xed\xff\xef\xec\xed\xff\xef\xec\xed\
+\xff\xef\xec\xed\xff\xef\xec\xee\xff\xef\xec\xed\xff\xd0\xcd\xce\
+\xff\x8c\x84\x82\xff\x76\x72\x71\xff\x75\x71\x70\xff\x70\x6d\x6b\
+\xff\x6c\x68\x66\xff\x68\x64\x63\xff\x65\x61\x5e\xff\x62\x5d\x5b\
+\xff\x5f\x5a\x58\xff\x5c\x58\x55\xff\x5a\x55\x53\xff\x59\x54\x51\
+\xff\x84\x7f\x7d\xff\x85\x80\x7e\xff\x82\x7e\x7c\xff\x81\x7c\x7b\
+\xff\x7f\x7a\x77\xff\x7d\x78\x76\xff\x6f\x68\x67\xff\x45\x3e\x3b\
+\xff\x43\x3d\x3a\xff\x42\x3b\x37\xff\x41\x3a\x37\xff\x6b\x65\x62\
+\xff\x6e\x68\x66\xff\x6d\x67\x65\xff\x62\x5b\x59\xff\x3a\x33\x30\
+\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x39\x31\x2e\xff\x38\x31\x2e\
+\xff\x37\x31\x2e\xff\x37\x30\x2d\xff\x37\x31\x2d\xff\x52\x4d\x49\
+\xff\x5a\x54\x51\xff\x58\x52\x4f\xff\x56\x50\x4e\xff\x55\x4e\x4c\
+\xff\x53\x4d\x4b\xff\x51\x4b\x48\xff\x3e\x38\x35\xff\x37\x31\x2e\
+\xff\x38\x32\x2f\xff\x39\x32\x2f\xff\x3a\x33\x30\xff\x3a\x33\x30\
+\xff\x3c\x34\x31\xff\x3d\x36\x32\xff\x3e\x36\x34\xff\x40\x38\x35\
+\xff\x41\x3a\x37\xff\x43\x3c\x39\xff\x45\x3e\x3b\xff\x47\x40\x3d\
+\xff\x49\x42\x40\xff\x4b\x45\x42\xff\x4e\x48\x45\xff\x51\x4b\x48\
+\xff\x54\x4e\x4b\xff\x57\x51\x4e\xff\x5a\x55\x52\xff\x5d\x57\x55\
+\xff\x61\x5b\x58\xff\x64\x5f\x5c\xff\x68\x63\x60\xff\x6a\x65\x63\
+\xff\x6f\x69\x67\xff\x71\x6c\x69\xff\x74\x70\x6d\xff\x77\x73\x71\
+\xff\x7b\x76\x74\xff\x7e\x79\x77\xff\x80\x7c\x7b\xff\x83\x7f\x7d\
+\xff\x86\x82\x80\xff\x87\x83\x82\xff\x95\x90\x8c\xff\xb0\xae\xad\
+\xff\xee\xea\xeb\xff\xec\xe8\xe9\xff\xec\xe8\xe9\xff\xeb\xe8\xe9\
+\xff\xeb\xe7\xe8\xff\xe9\xe6\xe8\xff\xe9\xe6\xe7\xff\xe8\xe5\xe7\
+\xff\xe7\xe4\xe6\xff\xe7\xe3\xe5\xff\xe5\xe2\xe3\xff\xe4\xe1\xe2\
+\xff\xe2\xde\xe0\xff\xe0\xdd\xdf\xff\xdf\xdb\xdc\xff\xdd\xd9\xdb\
+\xff\xce\xc9\xcb\xff\xca\xca\xca\x22\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xbf\xbf\xbf\x04\xcf\xca\xcc\xe5\xde\xda\xdc\xff\xe2\xde\xe0\
+\xff\xe3\xe0\xe2\xff\xe5\xe2\xe3\xff\xe6\xe3\xe5\xff\xe8\xe4\xe6\
+\xff\xe9\xe6\xe7\xff\xeb\xe7\xe8\xff\xec\xe8\xe9\xff\xed\xe9\xea\
+\xff\xed\xe9\xeb\xff\xed\xea\xeb\xff\xee\xea\xec\xff\xee\xeb\xed\
+\xff\xee\xec\xed\xff\xef\xec\xed\xff\xef\xec\xed\xff\xe2\xdf\xe0\
+\xff\x86\x80\x7e\xff\x73\x6f\x6e\xff\x72\x6e\x6d\xff\x6e\x69\x67\
+\xff\x69\x65\x64\xff\x65\x61\x5f\xff\x62\x5d\x5b\xff\x60\x5a\x58\
+\xff\x5c\x57\x56\xff\x5a\x56\x53\xff\x58\x53\x50\xff\x64\x5e\x5d\
+\xff\x88\x84\x82\xff\x86\x81\x7f\xff\x83\x7f\x7d\xff\x82\x7d\x7c\
+\xff\x80\x7c\x7a\xff\x7f\x7a\x78\xff\x53\x4d\x4b\xff\x45\x3e\x3b\
+\xff\x42\x3c\x39\xff\x41\x39\x36\xff\x5a\x53\x51\xff\x73\x6d\x6a\
+\xff\x70\x6a\x68\xff\x6d\x67\x65\xff\x41\x3a\x37\xff\x3a\x32\x2f\
+\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x39\x31\x2e\xff\x38\x31\x2e\
+\xff\x37\x30\x2d\xff\x37\x2f\x2c\xff\x51\x4b\x48\xff\x5c\x57\x54\
+\xff\x5b\x55\x52\xff\x59\x54\x50\xff\x57\x51\x4f\xff\x56\x4f\x4d\
+\xff\x53\x4c\x49\xff\x3d\x36\x33\xff\x36\x30\x2d\xff\x38\x31\x2e\
+\xff\x38\x31\x2e\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x3b\x33\x30\
+\xff\x3c\x34\x31\xff\x3d\x35\x33\xff\x3e\x36\x33\xff\x40\x39\x35\
+\xff\x42\x3b\x37\xff\x43\x3d\x3a\xff\x46\x3f\x3c\xff\x48\x41\x3e\
+\xff\x4b\x43\x40\xff\x4d\x47\x43\xff\x50\x49\x47\xff\x53\x4d\x4a\
+\xff\x56\x50\x4d\xff\x59\x54\x50\xff\x5d\x57\x55\xff\x61\x5a\x58\
+\xff\x64\x5e\x5c\xff\x68\x62\x60\xff\x6b\x66\x63\xff\x6f\x69\x67\
+\xff\x72\x6d\x6b\xff\x75\x71\x6f\xff\x79\x74\x72\xff\x7d\x79\x76\
+\xff\x80\x7c\x7a\xff\x83\x7f\x7d\xff\x86\x82\x80\xff\x89\x85\x83\
+\xff\x8c\x88\x87\xff\x8c\x89\x88\xff\x9b\x95\x92\xff\xc1\xbf\xbf\
+\xff\xee\xeb\xed\xff\xed\xea\xec\xff\xed\xe9\xeb\xff\xed\xe9\xea\
+\xff\xec\xe8\xe9\xff\xeb\xe8\xe9\xff\xea\xe7\xe8\xff\xe9\xe6\xe8\
+\xff\xe8\xe5\xe6\xff\xe7\xe4\xe5\xff\xe5\xe2\xe3\xff\xe4\xe1\xe2\
+\xff\xe2\xe0\xe1\xff\xe1\xdd\xdf\xff\xe0\xdb\xdc\xff\xdb\xd7\xd8\
+\xff\xcc\xc7\xca\xe7\xbf\xbf\xbf\x04\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xcf\xcb\xcc\xb6\xdb\xd6\xd8\xff\xe2\xde\xe0\
+\xff\xe3\xe0\xe1\xff\xe5\xe2\xe3\xff\xe6\xe3\xe4\xff\xe7\xe4\xe5\
+\xff\xe8\xe5\xe6\xff\xea\xe7\xe8\xff\xec\xe8\xe9\xff\xec\xe8\xea\
+\xff\xed\xe9\xea\xff\xed\xe9\xeb\xff\xee\xea\xec\xff\xee\xea\xec\
+\xff\xee\xea\xec\xff\xee\xea\xec\xff\xee\xeb\xed\xff\xed\xea\xeb\
+\xff\x87\x81\x7f\xff\x72\x6e\x6c\xff\x6f\x6a\x68\xff\x6a\x66\x65\
+\xff\x66\x62\x60\xff\x63\x5e\x5c\xff\x5f\x5a\x58\xff\x5c\x58\x56\
+\xff\x59\x55\x53\xff\x58\x53\x50\xff\x55\x4f\x4d\xff\x76\x71\x6f\
+\xff\x88\x84\x82\xff\x86\x81\x80\xff\x84\x80\x7e\xff\x82\x7e\x7c\
+\xff\x80\x7d\x7a\xff\x74\x6f\x6d\xff\x44\x3d\x3a\xff\x43\x3c\x39\
+\xff\x41\x3b\x37\xff\x45\x3e\x3c\xff\x74\x6f\x6d\xff\x73\x6e\x6b\
+\xff\x72\x6c\x6a\xff\x4e\x48\x45\xff\x39\x32\x2f\xff\x39\x31\x2e\
+\xff\x38\x31\x2e\xff\x38\x31\x2e\xff\x37\x30\x2d\xff\x37\x30\x2d\
+\xff\x35\x2e\x2b\xff\x4f\x49\x46\xff\x60\x59\x58\xff\x5d\x58\x56\
+\xff\x5c\x56\x54\xff\x5a\x55\x52\xff\x58\x53\x4f\xff\x53\x4d\x4a\
+\xff\x3a\x33\x30\xff\x36\x2f\x2c\xff\x37\x30\x2d\xff\x38\x31\x2e\
+\xff\x39\x31\x2e\xff\x3a\x32\x2f\xff\x3a\x32\x2f\xff\x3b\x33\x30\
+\xff\x3d\x35\x32\xff\x3d\x35\x33\xff\x3f\x38\x34\xff\x40\x3a\x37\
+\xff\x42\x3c\x38\xff\x45\x3e\x3b\xff\x47\x40\x3e\xff\x4a\x43\x40\
+\xff\x4c\x46\x42\xff\x4e\x49\x46\xff\x51\x4c\x49\xff\x55\x4f\x4d\
+\xff\x58\x53\x50\xff\x5b\x56\x54\xff\x60\x5a\x58\xff\x63\x5d\x5b\
+\xff\x67\x62\x60\xff\x6a\x65\x63\xff\x6e\x6a\x67\xff\x72\x6e\x6c\
+\xff\x76\x71\x6f\xff\x7a\x75\x73\xff\x7e\x79\x77\xff\x81\x7d\x7b\
+\xff\x85\x81\x7f\xff\x89\x85\x83\xff\x8c\x88\x87\xff\x8f\x8b\x8a\
+\xff\x92\x8e\x8c\xff\x92\x8f\x8d\xff\x9d\x98\x95\xff\xd3\xd0\xd0\
+\xff\xee\xec\xed\xff\xee\xec\xed\xff\xee\xeb\xec\xff\xed\xea\xec\
+\xff\xed\xe9\xeb\xff\xec\xe9\xea\xff\xec\xe8\xe9\xff\xea\xe7\xe8\
+\xff\xe9\xe6\xe7\xff\xe7\xe4\xe5\xff\xe6\xe3\xe4\xff\xe4\xe2\xe3\
+\xff\xe3\xe0\xe1\xff\xe2\xde\xe0\xff\xe0\xdc\xdd\xff\xd7\xd3\xd4\
+\xff\xcc\xc6\xc9\xba\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xce\xca\xcc\x7e\xd5\xd1\xd3\xff\xe1\xdd\xde\
+\xff\xe2\xdd\xdf\xff\xe3\xe0\xe1\xff\xe5\xe1\xe3\xff\xe6\xe3\xe4\
+\xff\xe7\xe4\xe5\xff\xe9\xe6\xe7\xff\xea\xe7\xe8\xff\xeb\xe7\xe8\
+\xff\xeb\xe7\xe9\xff\xec\xe8\xea\xff\xed\xe8\xea\xff\xed\xe9\xeb\
+\xff\xee\xe9\xec\xff\xee\xe9\xec\xff\xee\xea\xec\xff\xf0\xec\xee\
+\xff\x8c\x87\x86\xff\x71\x6c\x6b\xff\x6a\x66\x65\xff\x66\x62\x61\
+\xff\x63\x5e\x5c\xff\x5f\x5a\x59\xff\x5b\x57\x55\xff\x59\x55\x53\
+\xff\x57\x51\x4f\xff\x55\x4f\x4d\xff\x54\x4e\x4c\xff\x84\x80\x7e\
+\xff\x87\x82\x80\xff\x85\x80\x7f\xff\x83\x7f\x7d\xff\x81\x7d\x7c\
+\xff\x81\x7d\x7a\xff\x54\x50\x4d\xff\x42\x3c\x39\xff\x41\x3b\x37\
+\xff\x3e\x37\x34\xff\x65\x60\x5e\xff\x74\x70\x6e\xff\x73\x6e\x6c\
+\xff\x5f\x5a\x58\xff\x38\x31\x2d\xff\x37\x31\x2e\xff\x36\x30\x2c\
+\xff\x36\x30\x2d\xff\x36\x2f\x2c\xff\x35\x2f\x2b\xff\x34\x2e\x2a\
+\xff\x4b\x45\x42\xff\x61\x5b\x59\xff\x5f\x59\x57\xff\x5d\x57\x56\
+\xff\x5b\x56\x53\xff\x5a\x55\x53\xff\x52\x4c\x49\xff\x37\x30\x2d\
+\xff\x35\x2e\x2b\xff\x35\x2e\x2b\xff\x36\x2f\x2c\xff\x36\x2f\x2c\
+\xff\x37\x30\x2d\xff\x37\x30\x2e\xff\x39\x31\x2f\xff\x3a\x33\x30\
+\xff\x3b\x34\x31\xff\x3d\x35\x32\xff\x3e\x37\x34\xff\x40\x39\x36\
+\xff\x42\x3c\x39\xff\x44\x3e\x3b\xff\x47\x40\x3e\xff\x4a\x43\x40\
+\xff\x4c\x46\x43\xff\x4f\x4a\x47\xff\x53\x4d\x4a\xff\x57\x50\x4e\
+\xff\x5a\x54\x51\xff\x5d\x58\x55\xff\x61\x5b\x59\xff\x65\x60\x5d\
+\xff\x68\x64\x62\xff\x6d\x67\x65\xff\x72\x6d\x6a\xff\x75\x71\x6f\
+\xff\x7a\x74\x73\xff\x7d\x79\x77\xff\x81\x7d\x7c\xff\x86\x81\x7f\
+\xff\x89\x86\x83\xff\x8d\x8a\x88\xff\x90\x8d\x8b\xff\x94\x91\x8f\
+\xff\x97\x95\x93\xff\x96\x93\x92\xff\x9e\x99\x97\xff\xe0\xde\xdf\
+\xff\xef\xed\xee\xff\xef\xec\xed\xff\xee\xec\xed\xff\xee\xea\xec\
+\xff\xed\xe9\xeb\xff\xec\xe9\xea\xff\xeb\xe8\xe9\xff\xea\xe7\xe8\
+\xff\xe9\xe6\xe7\xff\xe7\xe5\xe6\xff\xe6\xe3\xe4\xff\xe4\xe1\xe3\
+\xff\xe3\xdf\xe1\xff\xe0\xdd\xde\xff\xe0\xdc\xdd\xff\xd2\xce\xcf\
+\xff\xcc\xc8\xc8\x87\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xce\xcb\xce\x45\xd1\xcd\xcf\xff\xe0\xdc\xdd\
+\xff\xe0\xdc\xde\xff\xe2\xde\xe0\xff\xe3\xe0\xe1\xff\xe4\xe2\xe3\
+\xff\xe5\xe2\xe4\xff\xe6\xe3\xe4\xff\xe8\xe5\xe6\xff\xe8\xe5\xe6\
+\xff\xe9\xe6\xe7\xff\xe9\xe6\xe7\xff\xeb\xe8\xe8\xff\xec\xe8\xe9\
+\xff\xec\xe8\xe9\xff\xec\xe8\xe9\xff\xec\xe8\xe9\xff\xee\xeb\xec\
+\xff\x95\x92\x91\xff\x6c\x68\x65\xff\x63\x5f\x5e\xff\x60\x5b\x5a\
+\xff\x5c\x58\x56\xff\x58\x54\x52\xff\x55\x51\x4f\xff\x53\x4e\x4c\
+\xff\x50\x4c\x4a\xff\x4f\x4a\x48\xff\x5a\x55\x53\xff\x82\x7e\x7c\
+\xff\x80\x7b\x7a\xff\x7e\x7a\x78\xff\x7c\x78\x76\xff\x7b\x76\x74\
+\xff\x71\x6c\x69\xff\x40\x39\x36\xff\x3e\x38\x35\xff\x3c\x35\x33\
+\xff\x49\x43\x40\xff\x71\x6c\x6a\xff\x6e\x68\x66\xff\x68\x62\x60\
+\xff\x39\x33\x2f\xff\x35\x2e\x2b\xff\x34\x2e\x2a\xff\x33\x2d\x29\
+\xff\x33\x2d\x29\xff\x32\x2c\x28\xff\x32\x2b\x28\xff\x44\x3e\x3b\
+\xff\x5e\x59\x56\xff\x5b\x56\x54\xff\x5a\x54\x52\xff\x58\x53\x50\
+\xff\x57\x51\x4f\xff\x4c\x46\x43\xff\x33\x2c\x29\xff\x32\x2b\x28\
+\xff\x32\x2b\x28\xff\x32\x2c\x28\xff\x33\x2d\x29\xff\x34\x2e\x2a\
+\xff\x34\x2e\x2a\xff\x35\x2e\x2b\xff\x36\x2f\x2d\xff\x37\x31\x2e\
+\xff\x39\x32\x2f\xff\x3b\x33\x30\xff\x3c\x35\x32\xff\x3e\x38\x34\
+\xff\x40\x3a\x36\xff\x42\x3d\x3a\xff\x45\x3f\x3c\xff\x48\x41\x3f\
+\xff\x4b\x45\x42\xff\x4d\x48\x45\xff\x51\x4b\x49\xff\x55\x4f\x4d\
+\xff\x58\x52\x50\xff\x5c\x57\x54\xff\x61\x5b\x58\xff\x64\x5f\x5c\
+\xff\x68\x63\x61\xff\x6c\x67\x65\xff\x70\x6c\x69\xff\x75\x70\x6e\
+\xff\x79\x74\x73\xff\x7d\x79\x77\xff\x81\x7e\x7c\xff\x86\x82\x80\
+\xff\x8b\x87\x85\xff\x8e\x8b\x89\xff\x93\x8f\x8d\xff\x97\x93\x92\
+\xff\x9a\x97\x95\xff\x99\x96\x94\xff\x9e\x99\x98\xff\xea\xe8\xea\
+\xff\xef\xed\xee\xff\xee\xec\xed\xff\xee\xec\xed\xff\xee\xea\xec\
+\xff\xed\xe9\xeb\xff\xec\xe9\xea\xff\xeb\xe8\xe9\xff\xe9\xe7\xe8\
+\xff\xe8\xe5\xe6\xff\xe7\xe4\xe5\xff\xe5\xe2\xe3\xff\xe3\xe1\xe2\
+\xff\xe2\xdf\xe0\xff\xe0\xdd\xdf\xff\xe0\xdb\xdd\xff\xcc\xc7\xca\
+\xff\xc9\xc6\xc6\x51\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xc5\xc5\xc5\x16\xce\xc8\xca\xfa\xdc\xd8\xda\
+\xff\xde\xda\xdb\xff\xdf\xdb\xdd\xff\xe1\xdc\xdf\xff\xe2\xde\xe0\
+\xff\xe4\xe0\xe2\xff\xe5\xe1\xe3\xff\xe5\xe2\xe4\xff\xe6\xe3\xe4\
+\xff\xe7\xe3\xe5\xff\xe7\xe4\xe5\xff\xe8\xe5\xe6\xff\xe9\xe5\xe7\
+\xff\xe9\xe6\xe7\xff\xea\xe6\xe8\xff\xea\xe7\xe8\xff\xeb\xe7\xe9\
+\xff\xa7\xa3\xa3\xff\x63\x5f\x5d\xff\x5b\x57\x56\xff\x58\x54\x53\
+\xff\x55\x51\x4f\xff\x51\x4d\x4c\xff\x4e\x4a\x49\xff\x4c\x48\x46\
+\xff\x4a\x45\x44\xff\x48\x43\x41\xff\x65\x61\x5f\xff\x78\x73\x72\
+\xff\x77\x72\x70\xff\x75\x71\x6f\xff\x73\x6f\x6d\xff\x72\x6e\x6d\
+\xff\x4e\x49\x46\xff\x3b\x35\x33\xff\x3a\x34\x31\xff\x38\x32\x2f\
+\xff\x61\x5d\x5b\xff\x67\x63\x61\xff\x65\x62\x60\xff\x40\x3a\x38\
+\xff\x32\x2b\x28\xff\x30\x2a\x27\xff\x30\x29\x26\xff\x30\x29\x27\
+\xff\x2f\x29\x26\xff\x2e\x28\x25\xff\x3c\x37\x34\xff\x58\x53\x51\
+\xff\x56\x51\x4e\xff\x55\x50\x4d\xff\x54\x4e\x4c\xff\x53\x4d\x4b\
+\xff\x44\x3e\x3c\xff\x2e\x27\x25\xff\x2e\x27\x25\xff\x2e\x28\x25\
+\xff\x2e\x28\x25\xff\x2f\x28\x26\xff\x30\x29\x26\xff\x31\x2a\x27\
+\xff\x31\x29\x27\xff\x31\x2b\x28\xff\x33\x2d\x2a\xff\x34\x2e\x2c\
+\xff\x35\x2f\x2d\xff\x37\x31\x2e\xff\x39\x32\x30\xff\x3b\x35\x32\
+\xff\x3d\x37\x34\xff\x40\x3a\x37\xff\x42\x3d\x3a\xff\x45\x3f\x3d\
+\xff\x48\x42\x40\xff\x4b\x46\x43\xff\x4f\x49\x47\xff\x52\x4d\x4a\
+\xff\x56\x51\x4e\xff\x59\x55\x53\xff\x5e\x59\x57\xff\x62\x5d\x5b\
+\xff\x66\x62\x60\xff\x6a\x65\x64\xff\x6f\x6a\x69\xff\x73\x6f\x6d\
+\xff\x78\x73\x72\xff\x7d\x78\x76\xff\x81\x7e\x7c\xff\x87\x82\x80\
+\xff\x8b\x88\x85\xff\x8f\x8c\x8b\xff\x94\x90\x8e\xff\x98\x95\x94\
+\xff\x9b\x98\x97\xff\x9a\x97\x96\xff\xa1\x9e\x9c\xff\xf0\xed\xee\
+\xff\xef\xed\xee\xff\xee\xed\xed\xff\xee\xec\xed\xff\xee\xeb\xec\
+\xff\xed\xe9\xeb\xff\xec\xe9\xea\xff\xeb\xe7\xe9\xff\xe9\xe6\xe7\
+\xff\xe8\xe5\xe6\xff\xe6\xe4\xe5\xff\xe4\xe2\xe3\xff\xe3\xe1\xe2\
+\xff\xe1\xde\xdf\xff\xe0\xdc\xdd\xff\xdd\xd9\xdb\xff\xc7\xc2\xc3\
+\xfd\xc4\xbd\xc4\x23\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcb\xc6\xc7\xd5\xd6\xd3\xd4\
+\xff\xdb\xd7\xd9\xff\xdc\xd8\xd9\xff\xde\xda\xdb\xff\xdf\xdb\xdd\
+\xff\xe1\xdc\xdf\xff\xe2\xde\xe0\xff\xe3\xdf\xe1\xff\xe4\xe0\xe2\
+\xff\xe5\xe1\xe3\xff\xe5\xe1\xe3\xff\xe6\xe2\xe4\xff\xe6\xe2\xe4\
+\xff\xe7\xe3\xe5\xff\xe7\xe4\xe5\xff\xe8\xe4\xe6\xff\xe8\xe5\xe6\
+\xff\xbc\xb8\xb9\xff\x57\x53\x51\xff\x52\x4e\x4c\xff\x50\x4c\x4b\
+\xff\x4d\x4a\x48\xff\x4a\x46\x45\xff\x48\x44\x41\xff\x45\x41\x3f\
+\xff\x43\x3f\x3e\xff\x41\x3e\x3c\xff\x69\x65\x63\xff\x6c\x68\x66\
+\xff\x6b\x67\x65\xff\x6a\x66\x64\xff\x68\x64\x63\xff\x61\x5d\x5b\
+\xff\x37\x32\x30\xff\x35\x31\x2e\xff\x34\x2e\x2b\xff\x47\x42\x40\
+\xff\x5f\x5c\x59\xff\x5d\x59\x57\xff\x48\x44\x41\xff\x2d\x27\x24\
+\xff\x2d\x27\x24\xff\x2c\x26\x24\xff\x2c\x25\x23\xff\x2c\x25\x23\
+\xff\x2b\x25\x22\xff\x34\x2e\x2c\xff\x50\x4b\x49\xff\x4f\x4a\x48\
+\xff\x4e\x49\x47\xff\x4d\x48\x45\xff\x4c\x47\x44\xff\x3a\x35\x33\
+\xff\x29\x24\x21\xff\x2a\x24\x22\xff\x2a\x24\x22\xff\x2a\x24\x22\
+\xff\x2a\x24\x22\xff\x2c\x25\x23\xff\x2c\x26\x24\xff\x2c\x26\x24\
+\xff\x2d\x27\x24\xff\x2e\x28\x25\xff\x2f\x29\x26\xff\x30\x2b\x27\
+\xff\x32\x2c\x29\xff\x33\x2e\x2b\xff\x35\x2f\x2d\xff\x36\x32\x2f\
+\xff\x3a\x34\x31\xff\x3c\x36\x34\xff\x3f\x39\x36\xff\x41\x3c\x3a\
+\xff\x44\x3f\x3d\xff\x48\x42\x40\xff\x4b\x46\x43\xff\x4e\x4a\x48\
+\xff\x52\x4d\x4b\xff\x56\x52\x4f\xff\x5a\x56\x54\xff\x5e\x59\x58\
+\xff\x63\x5e\x5d\xff\x66\x63\x61\xff\x6b\x67\x65\xff\x70\x6c\x6a\
+\xff\x75\x71\x6f\xff\x7c\x77\x74\xff\x80\x7d\x7b\xff\x87\x81\x80\
+\xff\x8b\x87\x86\xff\x90\x8c\x8b\xff\x95\x91\x8f\xff\x99\x96\x95\
+\xff\x9d\x99\x98\xff\x9b\x98\x97\xff\xa7\xa4\xa3\xff\xf2\xf1\xf2\
+\xff\xef\xed\xee\xff\xef\xed\xed\xff\xee\xec\xed\xff\xed\xeb\xec\
+\xff\xed\xe9\xea\xff\xec\xe9\xe9\xff\xeb\xe8\xe8\xff\xe9\xe7\xe7\
+\xff\xe7\xe5\xe6\xff\xe6\xe3\xe4\xff\xe4\xe2\xe3\xff\xe3\xe0\xe1\
+\xff\xe1\xdd\xdf\xff\xde\xdb\xdc\xff\xd8\xd5\xd7\xff\xc2\xbd\xc0\
+\xe7\xff\xff\xff\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xca\xc5\xc7\xa1\xd1\xce\xcf\
+\xff\xd9\xd6\xd6\xff\xd9\xd6\xd7\xff\xdb\xd7\xd8\xff\xdc\xd8\xda\
+\xff\xdd\xda\xdb\xff\xdf\xdb\xdd\xff\xe0\xdc\xdd\xff\xe1\xdc\xde\
+\xff\xe2\xdd\xe0\xff\xe3\xde\xe0\xff\xe3\xe0\xe1\xff\xe4\xe1\xe2\
+\xff\xe4\xe1\xe2\xff\xe5\xe2\xe3\xff\xe5\xe2\xe3\xff\xe6\xe3\xe4\
+\xff\xd0\xcc\xcd\xff\x4d\x48\x47\xff\x49\x45\x44\xff\x47\x45\x42\
+\xff\x45\x41\x40\xff\x42\x3f\x3e\xff\x40\x3c\x3b\xff\x3f\x3a\x39\
+\xff\x3c\x38\x37\xff\x43\x3f\x3d\xff\x61\x5e\x5c\xff\x5f\x5c\x5a\
+\xff\x5e\x5b\x59\xff\x5d\x59\x58\xff\x5c\x59\x57\xff\x43\x3e\x3c\
+\xff\x31\x2d\x2a\xff\x30\x2b\x28\xff\x31\x2c\x2a\xff\x54\x4f\x4e\
+\xff\x53\x50\x4d\xff\x4b\x48\x46\xff\x2a\x25\x23\xff\x29\x24\x22\
+\xff\x28\x23\x20\xff\x27\x22\x1f\xff\x27\x21\x1f\xff\x27\x21\x1f\
+\xff\x2c\x27\x24\xff\x47\x43\x40\xff\x46\x41\x40\xff\x46\x41\x3f\
+\xff\x45\x40\x3e\xff\x44\x3f\x3d\xff\x31\x2c\x29\xff\x25\x21\x1d\
+\xff\x26\x21\x1e\xff\x26\x21\x1e\xff\x26\x21\x1e\xff\x26\x21\x1e\
+\xff\x26\x22\x1f\xff\x27\x22\x1f\xff\x27\x22\x20\xff\x28\x23\x20\
+\xff\x29\x23\x21\xff\x29\x24\x22\xff\x2b\x26\x24\xff\x2c\x27\x24\
+\xff\x2e\x28\x26\xff\x2f\x29\x28\xff\x31\x2c\x29\xff\x33\x2e\x2b\
+\xff\x35\x30\x2f\xff\x37\x33\x30\xff\x3b\x35\x33\xff\x3d\x38\x36\
+\xff\x40\x3c\x39\xff\x43\x3f\x3d\xff\x47\x42\x40\xff\x4b\x46\x44\
+\xff\x4e\x4a\x48\xff\x52\x4d\x4c\xff\x56\x52\x50\xff\x5a\x56\x54\
+\xff\x5e\x5a\x59\xff\x62\x5f\x5d\xff\x67\x63\x62\xff\x6d\x68\x66\
+\xff\x73\x6f\x6d\xff\x79\x74\x73\xff\x7f\x7b\x79\xff\x85\x81\x7f\
+\xff\x8b\x87\x86\xff\x8f\x8c\x8b\xff\x95\x92\x90\xff\x99\x97\x96\
+\xff\x9e\x9a\x99\xff\x9a\x97\x96\xff\xb2\xaf\xaf\xff\xf2\xf0\xf1\
+\xff\xef\xee\xee\xff\xef\xed\xee\xff\xef\xed\xed\xff\xee\xec\xec\
+\xff\xed\xea\xec\xff\xec\xe9\xeb\xff\xea\xe8\xe9\xff\xe9\xe7\xe8\
+\xff\xe8\xe5\xe6\xff\xe6\xe3\xe4\xff\xe5\xe2\xe3\xff\xe2\xe0\xe1\
+\xff\xe0\xdd\xdf\xff\xde\xdb\xdc\xff\xd2\xce\xd0\xff\xc0\xbc\xbe\
+\xb9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc8\xc3\xc5\x66\xcc\xc6\xc8\
+\xff\xd7\xd2\xd4\xff\xd7\xd4\xd5\xff\xd8\xd5\xd6\xff\xd9\xd5\xd7\
+\xff\xda\xd7\xd8\xff\xdb\xd8\xd9\xff\xdc\xd9\xda\xff\xdd\xda\xdb\
+\xff\xde\xdb\xdc\xff\xdf\xdb\xdc\xff\xe0\xdc\xdd\xff\xe1\xdc\xde\
+\xff\xe2\xdd\xdf\xff\xe3\xde\xe1\xff\xe3\xe0\xe1\xff\xe3\xe1\xe2\
+\xff\xdf\xdb\xdc\xff\x48\x44\x43\xff\x40\x3d\x3c\xff\x40\x3d\x3b\
+\xff\x3d\x3a\x38\xff\x3b\x37\x36\xff\x39\x35\x34\xff\x37\x33\x32\
+\xff\x36\x32\x30\xff\x46\x43\x41\xff\x53\x51\x4f\xff\x52\x4f\x4e\
+\xff\x52\x4e\x4d\xff\x51\x4d\x4c\xff\x4c\x49\x47\xff\x2d\x29\x27\
+\xff\x2d\x27\x25\xff\x2a\x26\x23\xff\x3f\x3a\x39\xff\x49\x45\x43\
+\xff\x47\x43\x42\xff\x2b\x27\x25\xff\x25\x21\x1e\xff\x24\x1f\x1c\
+\xff\x23\x1f\x1c\xff\x23\x1e\x1b\xff\x23\x1e\x1b\xff\x26\x20\x1e\
+\xff\x3d\x39\x37\xff\x3e\x39\x38\xff\x3d\x39\x37\xff\x3c\x38\x35\
+\xff\x3b\x36\x34\xff\x29\x24\x21\xff\x21\x1c\x1a\xff\x22\x1c\x1a\
+\xff\x22\x1c\x1a\xff\x22\x1c\x1a\xff\x22\x1c\x1a\xff\x22\x1c\x1a\
+\xff\x23\x1d\x1b\xff\x23\x1e\x1b\xff\x23\x1f\x1c\xff\x23\x1f\x1c\
+\xff\x24\x1f\x1c\xff\x26\x21\x1e\xff\x26\x22\x20\xff\x27\x23\x21\
+\xff\x29\x24\x22\xff\x2a\x26\x24\xff\x2c\x28\x26\xff\x2f\x2a\x28\
+\xff\x31\x2c\x2a\xff\x33\x2f\x2d\xff\x36\x31\x30\xff\x39\x34\x32\
+\xff\x3c\x38\x35\xff\x3f\x3b\x39\xff\x42\x3e\x3d\xff\x46\x41\x3f\
+\xff\x49\x45\x44\xff\x4d\x49\x48\xff\x51\x4d\x4b\xff\x55\x51\x50\
+\xff\x59\x56\x54\xff\x5d\x5a\x58\xff\x63\x5e\x5d\xff\x69\x65\x63\
+\xff\x70\x6c\x6a\xff\x76\x72\x70\xff\x7d\x79\x77\xff\x83\x7f\x7d\
+\xff\x89\x86\x84\xff\x8f\x8c\x8a\xff\x95\x91\x90\xff\x9a\x97\x97\
+\xff\x9e\x9b\x99\xff\x97\x94\x93\xff\xbf\xbc\xbc\xff\xf2\xf0\xf1\
+\xff\xf0\xef\xef\xff\xf0\xee\xef\xff\xef\xee\xee\xff\xee\xec\xed\
+\xff\xed\xeb\xec\xff\xed\xea\xec\xff\xeb\xe8\xe9\xff\xe9\xe7\xe8\
+\xff\xe8\xe5\xe6\xff\xe6\xe4\xe5\xff\xe5\xe3\xe3\xff\xe2\xe0\xe1\
+\xff\xe1\xdd\xdf\xff\xe0\xdc\xdd\xff\xca\xc6\xc8\xff\xc1\xbb\xbd\
+\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc8\xc3\xc3\x2f\xc5\xc1\xc2\
+\xff\xd3\xce\xd0\xff\xd4\xcf\xd1\xff\xd5\xd1\xd3\xff\xd6\xd2\xd4\
+\xff\xd7\xd4\xd5\xff\xd8\xd5\xd6\xff\xd9\xd6\xd7\xff\xda\xd7\xd8\
+\xff\xdb\xd7\xd9\xff\xdc\xd8\xda\xff\xdd\xd9\xda\xff\xde\xda\xdc\
+\xff\xe0\xdc\xdd\xff\xe0\xdb\xdd\xff\xe1\xdd\xde\xff\xe2\xde\xe0\
+\xff\xe5\xe1\xe3\xff\x50\x4d\x4c\xff\x39\x36\x34\xff\x38\x35\x33\
+\xff\x36\x33\x32\xff\x34\x31\x2f\xff\x32\x2f\x2d\xff\x31\x2e\x2c\
+\xff\x30\x2c\x2a\xff\x45\x42\x41\xff\x47\x44\x42\xff\x46\x43\x42\
+\xff\x45\x42\x40\xff\x45\x41\x40\xff\x35\x31\x2f\xff\x27\x24\x22\
+\xff\x26\x23\x21\xff\x2b\x27\x25\xff\x3f\x3c\x3a\xff\x3e\x3a\x38\
+\xff\x2e\x2a\x29\xff\x22\x1c\x1a\xff\x21\x1c\x1a\xff\x1f\x1b\x19\
+\xff\x1f\x1a\x18\xff\x1f\x1a\x18\xff\x20\x1c\x1a\xff\x33\x2f\x2d\
+\xff\x35\x31\x30\xff\x34\x30\x2f\xff\x33\x2f\x2e\xff\x31\x2e\x2c\
+\xff\x22\x1d\x1b\xff\x1d\x19\x17\xff\x1e\x19\x17\xff\x1e\x19\x17\
+\xff\x1e\x19\x17\xff\x1e\x19\x17\xff\x1e\x19\x17\xff\x1e\x19\x17\
+\xff\x1f\x1a\x18\xff\x1f\x1a\x18\xff\x20\x1a\x19\xff\x20\x1a\x19\
+\xff\x20\x1b\x1a\xff\x22\x1d\x1b\xff\x23\x1e\x1c\xff\x24\x1f\x1d\
+\xff\x25\x21\x1f\xff\x26\x23\x21\xff\x28\x24\x22\xff\x2a\x26\x24\
+\xff\x2c\x28\x26\xff\x2f\x2b\x28\xff\x31\x2e\x2b\xff\x34\x30\x2f\
+\xff\x37\x33\x31\xff\x3b\x36\x34\xff\x3d\x3a\x38\xff\x40\x3d\x3b\
+\xff\x44\x40\x3f\xff\x48\x44\x43\xff\x4c\x49\x47\xff\x4f\x4c\x4b\
+\xff\x54\x50\x4f\xff\x58\x55\x53\xff\x5e\x59\x58\xff\x65\x61\x5f\
+\xff\x6d\x68\x66\xff\x73\x6f\x6e\xff\x7a\x76\x75\xff\x81\x7e\x7c\
+\xff\x88\x84\x83\xff\x8e\x8b\x8a\xff\x95\x91\x90\xff\x9a\x97\x96\
+\xff\x9d\x9b\x9a\xff\x92\x90\x8e\xff\xcc\xca\xca\xff\xf1\xf0\xf1\
+\xff\xf1\xef\xf0\xff\xf0\xee\xef\xff\xef\xee\xef\xff\xef\xed\xee\
+\xff\xee\xec\xed\xff\xed\xea\xec\xff\xec\xe9\xe9\xff\xe9\xe7\xe8\
+\xff\xe8\xe6\xe7\xff\xe7\xe5\xe5\xff\xe5\xe3\xe4\xff\xe3\xe1\xe2\
+\xff\xe1\xdd\xdf\xff\xdf\xdc\xdd\xff\xc3\xbf\xc0\xff\xc1\xbb\xbe\
+\x4b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb6\xb6\xb6\x07\xc1\xbd\xbf\
+\xec\xce\xca\xcc\xff\xd0\xcd\xce\xff\xd2\xce\xd0\xff\xd4\xcf\xd1\
+\xff\xd5\xd0\xd2\xff\xd6\xd2\xd4\xff\xd2\xcf\xd0\xff\xd4\xd1\xd1\
+\xff\xd6\xd3\xd3\xff\xd7\xd4\xd5\xff\xd9\xd6\xd7\xff\xd0\xcc\xcd\
+\xff\xd1\xcd\xce\xff\xd3\xcf\xd0\xff\xd4\xd0\xd1\xff\xd5\xd1\xd2\
+\xff\xe3\xdf\xe0\xff\x61\x5e\x5e\xff\x31\x2f\x2d\xff\x31\x2e\x2c\
+\xff\x2f\x2c\x2b\xff\x2e\x2a\x29\xff\x2c\x28\x27\xff\x2b\x27\x26\
+\xff\x2d\x2a\x28\xff\x3c\x39\x38\xff\x3c\x38\x37\xff\x3b\x38\x36\
+\xff\x3a\x36\x35\xff\x38\x34\x33\xff\x24\x20\x1f\xff\x23\x1e\x1c\
+\xff\x22\x1e\x1c\xff\x32\x2e\x2c\xff\x34\x30\x2f\xff\x2e\x2a\x29\
+\xff\x1d\x19\x18\xff\x1d\x19\x17\xff\x1c\x18\x16\xff\x1b\x17\x16\
+\xff\x1b\x17\x15\xff\x1c\x17\x16\xff\x2a\x25\x24\xff\x2c\x28\x27\
+\xff\x2b\x27\x26\xff\x2b\x27\x25\xff\x29\x24\x23\xff\x1c\x18\x16\
+\xff\x1a\x16\x14\xff\x1a\x16\x14\xff\x1a\x16\x14\xff\x1a\x16\x14\
+\xff\x1a\x16\x14\xff\x1a\x16\x14\xff\x1a\x16\x14\xff\x1a\x16\x14\
+\xff\x1a\x16\x15\xff\x1a\x16\x15\xff\x1b\x17\x16\xff\x1b\x18\x16\
+\xff\x1c\x19\x17\xff\x1d\x19\x17\xff\x1f\x1a\x19\xff\x20\x1b\x1a\
+\xff\x21\x1d\x1b\xff\x23\x1f\x1c\xff\x25\x21\x1f\xff\x27\x23\x21\
+\xff\x28\x25\x23\xff\x2a\x27\x25\xff\x2d\x29\x28\xff\x30\x2c\x2a\
+\xff\x32\x2f\x2d\xff\x35\x32\x30\xff\x38\x35\x33\xff\x3c\x38\x37\
+\xff\x3f\x3c\x3a\xff\x42\x3f\x3e\xff\x46\x43\x42\xff\x4a\x47\x46\
+\xff\x4e\x4b\x4a\xff\x53\x4f\x4e\xff\x59\x55\x53\xff\x62\x5d\x5b\
+\xff\x69\x65\x63\xff\x71\x6c\x6b\xff\x78\x74\x73\xff\x80\x7c\x7b\
+\xff\x87\x83\x82\xff\x8e\x8b\x89\xff\x95\x91\x90\xff\x9b\x98\x97\
+\xff\x9d\x9a\x99\xff\x8e\x8c\x8a\xff\xda\xd7\xd8\xff\xf2\xf0\xf1\
+\xff\xf2\xf0\xf0\xff\xf1\xef\xf0\xff\xf0\xef\xef\xff\xef\xed\xee\
+\xff\xee\xec\xed\xff\xee\xec\xec\xff\xec\xe9\xeb\xff\xea\xe8\xe9\
+\xff\xe8\xe6\xe7\xff\xe7\xe5\xe6\xff\xe5\xe3\xe4\xff\xe3\xe1\xe2\
+\xff\xe1\xdd\xdf\xff\xdc\xda\xda\xff\xbe\xba\xbb\xfa\xb7\xb7\xb7\
+\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc1\xba\xbc\
+\x9d\xc4\xc0\xc2\xff\xcc\xc8\xca\xff\xd0\xcc\xce\xff\xd2\xcd\xcf\
+\xff\xd3\xce\xcf\xff\xd4\xcf\xd1\xff\xe2\xdf\xdf\xff\xe5\xe2\xe2\
+\xff\xe7\xe3\xe4\xff\xe7\xe3\xe4\xff\xe5\xe1\xe3\xff\xd9\xd5\xd6\
+\xff\xe0\xdd\xde\xff\xe1\xde\xdf\xff\xe1\xde\xde\xff\xe1\xde\xde\
+\xff\xe0\xdb\xdd\xff\x7b\x77\x77\xff\x29\x26\x25\xff\x2a\x27\x26\
+\xff\x29\x26\x25\xff\x27\x25\x23\xff\x26\x23\x22\xff\x24\x22\x20\
+\xff\x2b\x29\x27\xff\x31\x2e\x2d\xff\x30\x2d\x2c\xff\x30\x2c\x2b\
+\xff\x2f\x2c\x2b\xff\x27\x24\x22\xff\x1f\x1b\x19\xff\x1e\x1a\x19\
+\xff\x23\x1f\x1e\xff\x2a\x27\x25\xff\x28\x26\x23\xff\x1c\x18\x16\
+\xff\x1a\x16\x14\xff\x19\x15\x13\xff\x19\x15\x13\xff\x18\x14\x12\
+\xff\x18\x15\x13\xff\x21\x1e\x1b\xff\x24\x21\x1f\xff\x24\x20\x1e\
+\xff\x23\x1f\x1e\xff\x20\x1c\x1b\xff\x18\x14\x11\xff\x16\x13\x10\
+\xff\x16\x13\x10\xff\x16\x13\x10\xff\x16\x13\x10\xff\x16\x13\x10\
+\xff\x16\x13\x10\xff\x16\x13\x10\xff\x16\x13\x10\xff\x16\x13\x10\
+\xff\x17\x13\x12\xff\x18\x13\x12\xff\x18\x14\x12\xff\x18\x15\x13\
+\xff\x19\x16\x14\xff\x1a\x16\x15\xff\x1a\x18\x16\xff\x1c\x18\x17\
+\xff\x1e\x1a\x18\xff\x20\x1b\x1a\xff\x21\x1d\x1b\xff\x23\x1f\x1d\
+\xff\x25\x21\x20\xff\x26\x23\x22\xff\x29\x25\x24\xff\x2c\x28\x27\
+\xff\x2f\x2b\x29\xff\x31\x2e\x2d\xff\x34\x31\x30\xff\x37\x34\x32\
+\xff\x3b\x37\x36\xff\x3e\x3b\x3a\xff\x41\x3f\x3d\xff\x45\x42\x41\
+\xff\x49\x46\x45\xff\x4d\x4a\x49\xff\x55\x50\x4e\xff\x5e\x59\x57\
+\xff\x66\x62\x5f\xff\x6f\x6b\x68\xff\x77\x73\x72\xff\x7f\x7c\x7a\
+\xff\x87\x84\x82\xff\x8f\x8c\x8b\xff\x96\x93\x92\xff\x9c\x9a\x99\
+\xff\x9d\x9b\x9a\xff\x88\x86\x85\xff\xe5\xe2\xe3\xff\xf3\xf1\xf1\
+\xff\xf2\xf0\xf1\xff\xf1\xf0\xf0\xff\xf1\xef\xf0\xff\xf0\xee\xef\
+\xff\xef\xed\xee\xff\xee\xec\xed\xff\xed\xea\xeb\xff\xea\xe8\xe9\
+\xff\xe9\xe7\xe8\xff\xe7\xe5\xe6\xff\xe5\xe3\xe4\xff\xe4\xe1\xe2\
+\xff\xde\xdc\xdc\xff\xca\xc5\xc7\xff\xbe\xba\xbb\xba\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbf\x9f\xbf\
+\x08\xc2\xbc\xbe\x86\xc2\xbd\xc0\xeb\xc3\xbf\xc1\xff\xc6\xc2\xc4\
+\xff\xc8\xc4\xc5\xff\xca\xc4\xc6\xff\xcf\xca\xcc\xff\xd1\xcc\xce\
+\xff\xd1\xcd\xce\xff\xd2\xcd\xcf\xff\xd1\xcd\xcf\xff\xce\xcb\xcb\
+\xff\xd1\xcd\xce\xff\xd2\xcd\xcf\xff\xd3\xce\xcf\xff\xd2\xce\xcf\
+\xff\xd3\xcf\xd1\xff\x8e\x8a\x8b\xff\x0e\x0c\x0b\xff\x13\x11\x0f\
+\xff\x13\x11\x10\xff\x13\x10\x0f\xff\x13\x10\x0f\xff\x12\x10\x0f\
+\xff\x1c\x19\x17\xff\x1d\x1a\x18\xff\x1d\x1a\x1a\xff\x1d\x1a\x19\
+\xff\x1d\x1a\x19\xff\x14\x10\x0f\xff\x13\x10\x0e\xff\x13\x10\x0e\
+\xff\x1c\x19\x18\xff\x1d\x19\x18\xff\x16\x13\x11\xff\x13\x0e\x0d\
+\xff\x12\x0e\x0e\xff\x12\x0e\x0e\xff\x12\x0e\x0d\xff\x12\x0e\x0d\
+\xff\x18\x15\x13\xff\x1c\x18\x17\xff\x1c\x19\x18\xff\x1d\x19\x18\
+\xff\x1d\x18\x17\xff\x18\x13\x12\xff\x19\x14\x13\xff\x1b\x16\x14\
+\xff\x1c\x17\x15\xff\x1d\x19\x17\xff\x1f\x1a\x18\xff\x20\x1b\x19\
+\xff\x22\x1c\x1a\xff\x24\x1d\x1b\xff\x24\x1d\x1b\xff\x22\x1c\x1a\
+\xff\x21\x1b\x1a\xff\x21\x1a\x19\xff\x1f\x19\x18\xff\x1d\x18\x17\
+\xff\x1c\x16\x15\xff\x1b\x16\x14\xff\x19\x15\x13\xff\x18\x14\x13\
+\xff\x17\x14\x11\xff\x16\x13\x10\xff\x16\x12\x11\xff\x15\x12\x11\
+\xff\x15\x12\x11\xff\x16\x12\x11\xff\x16\x13\x12\xff\x17\x14\x13\
+\xff\x18\x15\x13\xff\x19\x15\x14\xff\x1a\x17\x14\xff\x1a\x17\x16\
+\xff\x1c\x18\x17\xff\x1c\x19\x18\xff\x1e\x1a\x19\xff\x1e\x1b\x1a\
+\xff\x1f\x1c\x1b\xff\x20\x1d\x1c\xff\x22\x1e\x1e\xff\x24\x20\x1f\
+\xff\x25\x22\x21\xff\x27\x23\x22\xff\x28\x25\x24\xff\x2b\x28\x26\
+\xff\x2e\x2a\x29\xff\x30\x2d\x2b\xff\x32\x2f\x2d\xff\x32\x2f\x2e\
+\xff\x31\x2e\x2d\xff\x2c\x29\x28\xff\xc9\xc5\xc7\xff\xd4\xd0\xd1\
+\xff\xd4\xcf\xd1\xff\xd4\xd0\xd1\xff\xd4\xcf\xd1\xff\xd4\xcf\xd0\
+\xff\xd3\xce\xcf\xff\xd3\xcd\xcf\xff\xd1\xcd\xce\xff\xd0\xcc\xcd\
+\xff\xce\xcb\xcc\xff\xcd\xca\xcb\xff\xcc\xc9\xca\xff\xc8\xc2\xc5\
+\xff\xc1\xbc\xbe\xfd\xbe\xba\xbc\xb7\xb4\xb4\xb4\x18\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xb6\xb6\xb6\x07\xbf\xbf\xbf\x34\xc2\xbf\xc2\
+\x54\xc5\xc0\xc3\x66\xc6\xc1\xc3\x67\xc8\xc1\xc3\x67\xc8\xc3\xc3\
+\x67\xc8\xc3\xc3\x67\xc8\xc3\xc6\x67\xc8\xc3\xc8\x67\xcb\xc6\xc8\
+\x67\xcb\xc6\xc8\x67\xcb\xc6\xc8\x67\xcd\xc8\xcb\x67\xcd\xcb\xcd\
+\x67\xcf\xcb\xcd\x67\x9b\x94\x96\x7d\x19\x17\x16\xee\x19\x17\x16\
+\xf9\x0d\x0a\x09\xa9\x22\x20\x1f\xf1\x1b\x19\x18\xf7\x2e\x2b\x2b\
+\xff\x3c\x39\x38\xff\x3b\x39\x39\xff\x2c\x29\x27\xff\x2c\x29\x28\
+\xff\x27\x24\x23\xff\x21\x1e\x1d\xff\x29\x26\x25\xff\x2f\x2c\x2b\
+\xff\x31\x2d\x2c\xff\x2a\x26\x25\xff\x24\x20\x1f\xff\x24\x20\x1f\
+\xff\x24\x20\x1f\xff\x24\x20\x1f\xff\x24\x20\x1f\xff\x29\x25\x24\
+\xff\x2d\x29\x28\xff\x2d\x29\x28\xff\x2d\x29\x29\xff\x2a\x27\x25\
+\xff\x26\x22\x21\xff\x27\x22\x21\xff\x27\x23\x22\xff\x27\x23\x22\
+\xff\x28\x24\x23\xff\x29\x25\x23\xff\x29\x25\x24\xff\x2a\x25\x24\
+\xff\x2a\x26\x25\xff\x2b\x26\x25\xff\x2b\x26\x25\xff\x2a\x26\x25\
+\xff\x2a\x25\x24\xff\x29\x25\x24\xff\x29\x25\x23\xff\x28\x24\x23\
+\xff\x28\x24\x22\xff\x26\x22\x21\xff\x25\x20\x1f\xff\x24\x20\x1e\
+\xff\x23\x20\x1e\xff\x23\x1f\x1e\xff\x22\x1f\x1e\xff\x22\x1e\x1d\
+\xff\x22\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\
+\xff\x21\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\
+\xff\x21\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\xff\x21\x1e\x1d\
+\xff\x26\x23\x22\xff\x22\x1d\x1c\xf7\x0e\x0b\x09\xa2\x0f\x0c\x0a\
+\xa4\x1e\x1a\x19\xd3\x1c\x19\x18\xd1\x0f\x0c\x0a\xa4\x0e\x0b\x09\
+\xa1\x0e\x0b\x09\xa1\x0c\x0b\x09\xa1\x0c\x0b\x09\xa1\x0c\x09\x07\
+\xa1\x0a\x07\x07\xa3\x45\x43\x41\x71\xcb\xc6\xcb\x67\xc8\xc3\xc6\
+\x67\xc8\xc3\xc6\x67\xc8\xc3\xc6\x67\xc8\xc3\xc6\x67\xc8\xc3\xc6\
+\x67\xc8\xc1\xc3\x67\xc8\xc1\xc3\x67\xc6\xc1\xc3\x67\xc6\xc1\xc3\
+\x67\xc3\xc1\xc1\x67\xc3\xbe\xc1\x67\xc3\xbe\xc1\x67\xc0\xbd\xbd\
+\x5a\xc2\xbb\xbb\x26\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x3f\x3b\x3b\x40\x3d\x3a\x3a\xff\x3c\x39\x38\
+\xff\x47\x44\x43\xc4\x59\x56\x55\xff\x58\x54\x53\xff\x5e\x5a\x59\
+\xff\x72\x6f\x6f\xff\x67\x64\x63\xff\x53\x50\x50\xff\x48\x44\x44\
+\xff\x4d\x4a\x49\xff\x50\x4d\x4d\xff\x54\x51\x51\xff\x56\x53\x52\
+\xff\x5f\x5b\x5a\xff\x56\x52\x51\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x53\x52\
+\xff\x57\x53\x51\xff\x57\x53\x51\xff\x56\x53\x51\xff\x57\x53\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x53\x52\xff\x57\x53\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x53\x52\xff\x56\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x56\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\xff\x57\x54\x52\
+\xff\x57\x54\x52\xff\x50\x4d\x4c\xff\x40\x3e\x3c\xff\x41\x3f\x3e\
+\xff\x4c\x49\x49\xff\x60\x5d\x5c\xeb\x4a\x41\x41\x3a\x51\x4e\x4e\
+\xa3\x5b\x58\x58\xff\x49\x46\x46\xff\x46\x3f\x3f\x28\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x57\x50\x50\x46\x5a\x56\x56\xff\x5e\x59\x59\
+\xff\x79\x75\x74\xff\x80\x7b\x7b\x91\x7f\x7a\x77\x64\x94\x90\x8f\
+\xff\xa0\x9c\x9b\xff\x94\x90\x8f\xf6\x7a\x75\x74\xa9\x7a\x74\x74\
+\xa9\x80\x7b\x7b\xa9\x80\x7b\x79\xb4\x79\x73\x72\xcf\x70\x6a\x69\
+\xec\x6d\x67\x66\xf3\x30\x2b\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\xff\x31\x2c\x2a\
+\xff\x31\x2c\x2a\xff\x42\x3d\x3d\xa5\x59\x56\x55\x9c\x5a\x55\x55\
+\xaa\x75\x70\x70\xc5\x82\x7f\x7e\xff\x5d\x58\x58\xff\x72\x6f\x6e\
+\xff\x7b\x77\x77\xff\x62\x5d\x5d\xff\x61\x5b\x5b\x2a\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x75\x70\x70\x3d\x79\x74\x73\xff\x7e\x7a\x78\
+\xff\x9a\x95\x95\xa7\x8b\x73\x73\x0b\x83\x7b\x7b\x1f\xac\xa8\xa8\
+\xd4\xab\xa8\xa8\xd6\x92\x8d\x8d\x96\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x05\x02\x60\x0c\x07\x05\
+\xfe\x0c\x07\x05\xfe\x0e\x09\x08\xff\x0e\x09\x08\xff\x0f\x09\x08\
+\xff\x10\x09\x08\xff\x10\x0a\x09\xff\x10\x0a\x09\xff\x10\x0a\x09\
+\xff\x10\x0a\x09\xff\x11\x0a\x09\xff\x11\x0b\x0a\xff\x11\x0b\x0a\
+\xff\x11\x0c\x0a\xff\x12\x0c\x0a\xff\x11\x0c\x0a\xff\x11\x0c\x0a\
+\xff\x11\x0c\x0a\xff\x11\x0c\x0a\xff\x11\x0c\x0a\xff\x11\x0c\x0a\
+\xff\x11\x0c\x0b\xff\x11\x0c\x0b\xff\x11\x0c\x0b\xff\x11\x0c\x0b\
+\xff\x11\x0c\x0b\xff\x11\x0c\x0a\xff\x11\x0c\x0a\xff\x12\x0c\x0a\
+\xff\x12\x0c\x0a\xff\x12\x0c\x0a\xff\x11\x0c\x0a\xff\x11\x0b\x0a\
+\xff\x11\x0b\x0a\xff\x11\x0b\x09\xff\x10\x0a\x09\xff\x10\x0a\x09\
+\xff\x10\x0a\x09\xff\x10\x0a\x09\xff\x0f\x09\x08\xff\x0f\x09\x08\
+\xff\x0f\x09\x08\xff\x0e\x09\x08\xff\x0e\x09\x08\xff\x0e\x09\x08\
+\xff\x0e\x08\x07\xff\x11\x0a\x08\x75\x00\x00\x00\x00\x00\x00\x00\
+\x00\xc4\xc4\xc4\x0d\xa7\xa3\xa3\x3d\x8c\x88\x88\x3a\xb2\xaf\xaf\
+\xb7\xb0\xad\xad\xff\x96\x92\x91\xff\x8e\x88\x88\x2b\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x7f\x7f\x7f\x14\x85\x7f\x7f\x56\x8d\x8a\x8a\
+\x53\xaa\xaa\xaa\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4b\x43\x41\x66\x4b\x45\x43\
+\xff\x4d\x47\x45\xff\x50\x4a\x48\xff\x55\x4e\x4c\xff\x5a\x54\x50\
+\xff\x60\x58\x55\xff\x65\x5e\x5a\xff\x6a\x63\x60\xff\x71\x68\x65\
+\xff\x76\x6d\x6a\xff\x7a\x72\x6e\xff\x7e\x75\x72\xff\x84\x7a\x76\
+\xff\x88\x7e\x7a\xff\x8a\x81\x7c\xff\x90\x87\x81\xff\x93\x88\x84\
+\xff\x95\x8a\x86\xff\x97\x8c\x88\xff\x98\x8d\x89\xff\x99\x8e\x8a\
+\xff\x99\x8f\x8a\xff\x99\x8f\x8b\xff\x99\x8e\x8a\xff\x98\x8e\x89\
+\xff\x96\x8b\x87\xff\x92\x88\x83\xff\x90\x86\x81\xff\x8d\x83\x7f\
+\xff\x8b\x81\x7d\xff\x88\x7e\x7a\xff\x83\x7a\x76\xff\x7f\x76\x72\
+\xff\x7c\x73\x6f\xff\x77\x6f\x6a\xff\x70\x69\x65\xff\x6a\x63\x5f\
+\xff\x64\x5d\x5a\xff\x60\x59\x55\xff\x5b\x54\x51\xff\x57\x51\x4e\
+\xff\x55\x4e\x4c\xff\x52\x4c\x4a\xff\x51\x4c\x49\xff\x51\x4c\x49\
+\xff\x51\x4b\x49\xff\x50\x49\x47\x68\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb4\xb4\xb4\
+\x1f\xb6\xb2\xb2\x35\x9b\x97\x92\x36\x7f\x7f\x7f\x08\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x44\x41\x61\x4c\x47\x44\
+\xff\x4e\x48\x45\xff\x50\x4a\x48\xff\x55\x4e\x4c\xff\x58\x52\x4e\
+\xff\x5d\x56\x53\xff\x62\x5b\x58\xff\x66\x5f\x5c\xff\x6c\x64\x60\
+\xff\x70\x67\x64\xff\x74\x6c\x69\xff\x79\x70\x6c\xff\x7d\x74\x70\
+\xff\x80\x77\x73\xff\x85\x7c\x78\xff\x8b\x82\x7e\xff\x8d\x84\x80\
+\xff\x90\x87\x82\xff\x92\x89\x84\xff\x94\x8a\x86\xff\x96\x8b\x87\
+\xff\x96\x8c\x88\xff\x97\x8c\x88\xff\x95\x8b\x87\xff\x94\x8a\x86\
+\xff\x90\x87\x82\xff\x8e\x84\x7f\xff\x8b\x81\x7d\xff\x89\x7f\x7b\
+\xff\x87\x7d\x78\xff\x83\x7a\x76\xff\x7f\x76\x72\xff\x7c\x73\x70\
+\xff\x78\x6f\x6c\xff\x73\x6b\x68\xff\x6e\x67\x63\xff\x69\x62\x5e\
+\xff\x64\x5d\x5a\xff\x5f\x58\x55\xff\x5b\x54\x51\xff\x57\x51\x4e\
+\xff\x56\x4f\x4d\xff\x54\x4d\x4b\xff\x53\x4d\x4a\xff\x53\x4d\x4a\
+\xff\x53\x4c\x4a\xff\x53\x4b\x48\x62\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x45\x42\x5c\x4d\x48\x44\
+\xff\x4e\x48\x45\xff\x51\x4a\x48\xff\x55\x4e\x4b\xff\x58\x51\x4e\
+\xff\x5c\x55\x53\xff\x61\x5a\x57\xff\x66\x5e\x5b\xff\x6a\x63\x5f\
+\xff\x6f\x66\x63\xff\x73\x6b\x67\xff\x76\x6e\x6a\xff\x7b\x72\x6f\
+\xff\x7e\x75\x71\xff\x85\x7c\x78\xff\x88\x80\x7c\xff\x8b\x82\x7e\
+\xff\x8d\x85\x81\xff\x8f\x87\x82\xff\x90\x88\x84\xff\x92\x89\x85\
+\xff\x93\x8a\x86\xff\x93\x8a\x86\xff\x93\x89\x85\xff\x92\x88\x83\
+\xff\x8c\x82\x7e\xff\x8b\x81\x7d\xff\x88\x7f\x7b\xff\x87\x7d\x79\
+\xff\x84\x7a\x76\xff\x81\x77\x74\xff\x7e\x75\x71\xff\x7c\x72\x6f\
+\xff\x77\x6f\x6b\xff\x72\x69\x66\xff\x6c\x65\x62\xff\x68\x61\x5d\
+\xff\x64\x5c\x5a\xff\x5f\x59\x55\xff\x5b\x55\x51\xff\x57\x51\x4e\
+\xff\x55\x4e\x4c\xff\x54\x4d\x4b\xff\x53\x4d\x4a\xff\x53\x4d\x4a\
+\xff\x54\x4d\x4a\xff\x52\x4c\x4a\x5d\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x46\x40\x40\x57\x49\x44\x41\
+\xff\x49\x43\x42\xff\x4c\x46\x44\xff\x4f\x49\x46\xff\x52\x4d\x49\
+\xff\x56\x50\x4e\xff\x5b\x54\x52\xff\x5f\x58\x55\xff\x63\x5c\x59\
+\xff\x67\x60\x5d\xff\x6b\x64\x60\xff\x6f\x66\x63\xff\x72\x6a\x67\
+\xff\x76\x6d\x6a\xff\x7d\x75\x71\xff\x80\x77\x74\xff\x82\x79\x76\
+\xff\x84\x7c\x78\xff\x86\x7d\x79\xff\x87\x7f\x7b\xff\x88\x80\x7b\
+\xff\x89\x80\x7d\xff\x88\x80\x7d\xff\x88\x80\x7c\xff\x85\x7c\x79\
+\xff\x81\x79\x75\xff\x80\x77\x74\xff\x7f\x76\x72\xff\x7d\x73\x71\
+\xff\x7b\x72\x6e\xff\x77\x6f\x6c\xff\x76\x6e\x6b\xff\x73\x6b\x68\
+\xff\x6f\x67\x64\xff\x6b\x64\x60\xff\x66\x5f\x5c\xff\x61\x5a\x57\
+\xff\x5d\x56\x54\xff\x59\x52\x50\xff\x55\x4f\x4d\xff\x53\x4e\x4b\
+\xff\x50\x4a\x48\xff\x4e\x48\x46\xff\x4d\x48\x45\xff\x4d\x48\x45\
+\xff\x4f\x49\x47\xff\x4d\x47\x47\x56\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x39\x33\x33\x50\x3b\x36\x35\
+\xff\x3a\x35\x34\xff\x3c\x37\x36\xff\x3e\x3a\x39\xff\x41\x3d\x3c\
+\xff\x45\x3f\x3e\xff\x48\x42\x42\xff\x4b\x46\x45\xff\x4e\x49\x48\
+\xff\x51\x4c\x4b\xff\x54\x4e\x4d\xff\x57\x51\x50\xff\x59\x54\x53\
+\xff\x5e\x58\x57\xff\x65\x5f\x5d\xff\x67\x61\x5f\xff\x68\x62\x61\
+\xff\x6a\x64\x62\xff\x6b\x65\x64\xff\x6d\x66\x65\xff\x6e\x67\x65\
+\xff\x6e\x67\x66\xff\x6e\x67\x66\xff\x6e\x67\x65\xff\x67\x61\x5f\
+\xff\x66\x5f\x5d\xff\x65\x5e\x5c\xff\x64\x5c\x5b\xff\x62\x5b\x5a\
+\xff\x61\x5a\x58\xff\x60\x59\x58\xff\x5f\x59\x58\xff\x5c\x56\x55\
+\xff\x59\x53\x53\xff\x56\x50\x4f\xff\x52\x4c\x4b\xff\x4e\x49\x48\
+\xff\x4a\x45\x44\xff\x48\x42\x41\xff\x44\x40\x3f\xff\x42\x3e\x3d\
+\xff\x41\x3d\x3c\xff\x3e\x3b\x3a\xff\x3e\x3a\x39\xff\x3e\x3a\x39\
+\xff\x3f\x3a\x3b\xff\x3d\x3a\x3a\x4f\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3a\x33\x33\x4a\x3c\x38\x37\
+\xff\x3b\x36\x35\xff\x3c\x38\x36\xff\x3f\x3b\x3a\xff\x41\x3d\x3c\
+\xff\x45\x40\x3f\xff\x48\x42\x42\xff\x4b\x45\x44\xff\x4e\x49\x48\
+\xff\x51\x4b\x4a\xff\x54\x4e\x4d\xff\x56\x51\x4f\xff\x58\x53\x51\
+\xff\x60\x5a\x59\xff\x65\x5f\x5d\xff\x66\x60\x5f\xff\x68\x62\x61\
+\xff\x69\x63\x62\xff\x6a\x64\x63\xff\x6b\x65\x64\xff\x6d\x65\x64\
+\xff\x6d\x66\x65\xff\x6b\x65\x64\xff\x69\x62\x61\xff\x64\x5d\x5c\
+\xff\x64\x5d\x5c\xff\x63\x5c\x5b\xff\x62\x5b\x5a\xff\x60\x59\x58\
+\xff\x5f\x58\x57\xff\x62\x5b\x5a\xff\x5e\x58\x57\xff\x5b\x55\x54\
+\xff\x58\x53\x51\xff\x55\x50\x4f\xff\x52\x4d\x4c\xff\x4e\x49\x48\
+\xff\x4b\x46\x44\xff\x48\x42\x42\xff\x45\x40\x3f\xff\x42\x3e\x3d\
+\xff\x41\x3d\x3c\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\
+\xff\x40\x3c\x3c\xff\x3f\x3c\x3c\x48\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x39\x35\x35\x43\x3d\x38\x38\
+\xff\x3b\x36\x35\xff\x3c\x38\x36\xff\x3f\x3b\x3a\xff\x41\x3d\x3c\
+\xff\x45\x3f\x3e\xff\x48\x43\x42\xff\x4a\x44\x43\xff\x4d\x48\x47\
+\xff\x4f\x4b\x4a\xff\x53\x4c\x4b\xff\x55\x4f\x4e\xff\x57\x51\x50\
+\xff\x61\x5b\x5a\xff\x63\x5d\x5c\xff\x65\x60\x5e\xff\x66\x61\x60\
+\xff\x67\x62\x61\xff\x69\x63\x62\xff\x69\x64\x62\xff\x6a\x64\x63\
+\xff\x6a\x64\x63\xff\x6a\x64\x63\xff\x64\x5d\x5c\xff\x62\x5b\x5a\
+\xff\x61\x5a\x59\xff\x61\x5a\x58\xff\x5f\x58\x57\xff\x5e\x57\x56\
+\xff\x5f\x59\x58\xff\x61\x5a\x59\xff\x5d\x57\x56\xff\x5a\x55\x54\
+\xff\x57\x51\x50\xff\x54\x4e\x4e\xff\x52\x4c\x4c\xff\x4e\x49\x48\
+\xff\x4c\x47\x45\xff\x48\x43\x42\xff\x45\x41\x40\xff\x42\x3e\x3d\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\
+\xff\x41\x3d\x3d\xff\x3d\x39\x39\x42\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3a\x32\x32\x3d\x3e\x39\x39\
+\xff\x3a\x36\x35\xff\x3c\x38\x36\xff\x3e\x3a\x3a\xff\x41\x3d\x3c\
+\xff\x43\x3f\x3e\xff\x48\x42\x42\xff\x4a\x44\x43\xff\x4d\x48\x46\
+\xff\x4e\x4a\x49\xff\x51\x4b\x4a\xff\x54\x4d\x4c\xff\x57\x51\x50\
+\xff\x61\x5b\x5a\xff\x62\x5c\x5b\xff\x64\x5e\x5c\xff\x65\x5f\x5e\
+\xff\x65\x61\x5f\xff\x66\x62\x60\xff\x67\x62\x61\xff\x67\x63\x61\
+\xff\x68\x63\x62\xff\x66\x61\x60\xff\x5f\x59\x58\xff\x5f\x58\x57\
+\xff\x5e\x58\x57\xff\x5d\x57\x56\xff\x5c\x56\x55\xff\x5b\x56\x54\
+\xff\x60\x5a\x59\xff\x5e\x58\x58\xff\x5c\x56\x55\xff\x5a\x54\x53\
+\xff\x57\x51\x50\xff\x54\x4e\x4d\xff\x51\x4c\x4b\xff\x4d\x4a\x49\
+\xff\x4b\x47\x45\xff\x49\x43\x43\xff\x45\x41\x40\xff\x42\x3e\x3d\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\
+\xff\x43\x3e\x3e\xff\x3c\x38\x38\x3b\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x37\x33\x33\x37\x3f\x3a\x39\
+\xff\x3a\x36\x35\xff\x3c\x37\x36\xff\x3f\x3b\x3a\xff\x41\x3d\x3c\
+\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x4a\x44\x43\xff\x4b\x47\x45\
+\xff\x4e\x49\x48\xff\x50\x4b\x4a\xff\x52\x4c\x4b\xff\x59\x53\x52\
+\xff\x61\x5a\x59\xff\x62\x5b\x5a\xff\x63\x5c\x5b\xff\x64\x5d\x5c\
+\xff\x64\x5e\x5d\xff\x65\x60\x5d\xff\x66\x60\x5e\xff\x66\x60\x5e\
+\xff\x66\x61\x5f\xff\x60\x5b\x59\xff\x5c\x56\x55\xff\x5c\x56\x55\
+\xff\x5b\x56\x55\xff\x5b\x55\x54\xff\x5a\x54\x53\xff\x5c\x57\x56\
+\xff\x60\x59\x58\xff\x5d\x57\x56\xff\x5a\x55\x55\xff\x58\x54\x53\
+\xff\x56\x50\x4f\xff\x54\x4f\x4e\xff\x50\x4c\x4b\xff\x4d\x49\x48\
+\xff\x4b\x47\x46\xff\x49\x43\x42\xff\x45\x41\x40\xff\x41\x3d\x3c\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x3a\
+\xff\x44\x40\x40\xff\x3a\x3a\x3a\x34\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x35\x35\x2f\x30\x40\x3c\x3b\
+\xff\x3b\x36\x35\xff\x3c\x37\x36\xff\x3e\x3a\x3a\xff\x41\x3c\x3c\
+\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x49\x43\x42\xff\x4c\x47\x45\
+\xff\x4d\x49\x48\xff\x4f\x4a\x49\xff\x50\x4b\x4a\xff\x5b\x56\x55\
+\xff\x5e\x5a\x58\xff\x60\x5b\x5a\xff\x61\x5b\x5a\xff\x62\x5c\x5b\
+\xff\x63\x5d\x5c\xff\x64\x5d\x5c\xff\x64\x5e\x5d\xff\x64\x5e\x5d\
+\xff\x65\x5e\x5d\xff\x5a\x55\x54\xff\x59\x54\x53\xff\x59\x54\x53\
+\xff\x59\x53\x52\xff\x58\x53\x51\xff\x58\x52\x51\xff\x5f\x59\x58\
+\xff\x5e\x58\x57\xff\x5c\x56\x55\xff\x5a\x54\x53\xff\x58\x53\x52\
+\xff\x55\x50\x4f\xff\x53\x4e\x4d\xff\x50\x4c\x4b\xff\x4e\x49\x48\
+\xff\x4b\x46\x45\xff\x49\x43\x42\xff\x44\x3f\x3e\xff\x41\x3d\x3c\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x3a\
+\xff\x45\x41\x41\xff\x38\x38\x38\x2d\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x36\x30\x30\x2a\x42\x3c\x3b\
+\xff\x3a\x36\x35\xff\x3c\x37\x36\xff\x3e\x3a\x39\xff\x40\x3c\x3c\
+\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x49\x43\x42\xff\x4b\x46\x44\
+\xff\x4d\x49\x48\xff\x4e\x49\x48\xff\x52\x4c\x4c\xff\x5d\x57\x56\
+\xff\x5e\x58\x57\xff\x5f\x59\x58\xff\x60\x5a\x59\xff\x61\x5b\x5a\
+\xff\x62\x5b\x5a\xff\x62\x5c\x5b\xff\x62\x5c\x5b\xff\x62\x5d\x5c\
+\xff\x5e\x59\x58\xff\x58\x51\x50\xff\x58\x51\x50\xff\x57\x51\x50\
+\xff\x57\x51\x50\xff\x57\x50\x4f\xff\x5a\x54\x53\xff\x5d\x59\x58\
+\xff\x5c\x58\x57\xff\x5a\x56\x55\xff\x5a\x54\x53\xff\x57\x52\x50\
+\xff\x55\x4f\x4e\xff\x53\x4e\x4d\xff\x50\x4c\x4b\xff\x4e\x49\x48\
+\xff\x4b\x47\x46\xff\x48\x42\x41\xff\x42\x3e\x3d\xff\x41\x3d\x3c\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x3a\
+\xff\x47\x42\x42\xff\x3c\x35\x35\x26\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x33\x33\x23\x43\x3e\x3d\
+\xff\x3a\x35\x34\xff\x3c\x37\x36\xff\x3e\x3a\x39\xff\x40\x3c\x3b\
+\xff\x43\x3f\x3e\xff\x46\x40\x40\xff\x49\x43\x42\xff\x4b\x45\x44\
+\xff\x4c\x48\x47\xff\x4e\x49\x48\xff\x55\x50\x4f\xff\x5c\x58\x57\
+\xff\x5d\x58\x57\xff\x5f\x5a\x58\xff\x60\x5a\x59\xff\x60\x5b\x5a\
+\xff\x61\x5b\x5a\xff\x61\x5b\x5a\xff\x62\x5c\x5b\xff\x62\x5b\x5a\
+\xff\x58\x52\x51\xff\x56\x4f\x4e\xff\x56\x4f\x4e\xff\x55\x4f\x4e\
+\xff\x55\x4f\x4e\xff\x55\x4f\x4e\xff\x5d\x58\x57\xff\x5c\x57\x56\
+\xff\x5c\x56\x55\xff\x5a\x55\x54\xff\x58\x54\x53\xff\x57\x52\x50\
+\xff\x55\x4f\x4e\xff\x54\x4e\x4d\xff\x50\x4c\x4b\xff\x4e\x4a\x49\
+\xff\x4c\x47\x46\xff\x44\x3f\x3f\xff\x42\x3e\x3d\xff\x41\x3d\x3c\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x39\
+\xff\x48\x44\x44\xff\x3d\x36\x36\x21\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x31\x31\x31\x1f\x44\x3f\x3e\
+\xff\x39\x35\x34\xff\x3c\x37\x36\xff\x3e\x3a\x3a\xff\x40\x3c\x3b\
+\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x49\x43\x42\xff\x4b\x45\x44\
+\xff\x4c\x48\x47\xff\x4d\x48\x47\xff\x58\x54\x53\xff\x5c\x58\x57\
+\xff\x5d\x58\x57\xff\x5e\x59\x58\xff\x5e\x59\x58\xff\x60\x5a\x59\
+\xff\x60\x5b\x5a\xff\x60\x5b\x5a\xff\x60\x5b\x5a\xff\x5e\x58\x57\
+\xff\x54\x4e\x4d\xff\x54\x4e\x4d\xff\x54\x4e\x4d\xff\x54\x4e\x4d\
+\xff\x54\x4e\x4d\xff\x58\x53\x52\xff\x5c\x58\x57\xff\x5c\x57\x56\
+\xff\x5c\x56\x55\xff\x59\x54\x53\xff\x58\x54\x53\xff\x57\x53\x51\
+\xff\x55\x50\x4f\xff\x53\x4e\x4d\xff\x51\x4c\x4b\xff\x4e\x4a\x49\
+\xff\x48\x43\x43\xff\x44\x3f\x3e\xff\x42\x3e\x3d\xff\x40\x3c\x3c\
+\xff\x40\x3c\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x39\
+\xff\x49\x45\x45\xfe\x36\x36\x36\x1c\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x31\x31\x31\x1a\x44\x40\x3f\
+\xfe\x39\x34\x34\xff\x3b\x37\x36\xff\x3e\x3a\x38\xff\x40\x3c\x3b\
+\xff\x43\x3e\x3d\xff\x46\x40\x40\xff\x48\x43\x42\xff\x4a\x45\x44\
+\xff\x4c\x47\x45\xff\x4f\x4a\x49\xff\x5c\x57\x56\xff\x5c\x57\x56\
+\xff\x5d\x58\x57\xff\x5f\x59\x58\xff\x60\x59\x58\xff\x60\x5a\x59\
+\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x57\x52\x51\
+\xff\x53\x4d\x4c\xff\x53\x4d\x4c\xff\x53\x4d\x4c\xff\x53\x4d\x4c\
+\xff\x52\x4d\x4c\xff\x5c\x57\x56\xff\x5d\x57\x56\xff\x5b\x57\x56\
+\xff\x5b\x57\x56\xff\x5a\x55\x54\xff\x59\x54\x53\xff\x57\x51\x50\
+\xff\x55\x50\x4f\xff\x54\x4f\x4e\xff\x52\x4d\x4c\xff\x4d\x48\x47\
+\xff\x46\x41\x40\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3c\
+\xff\x3f\x3b\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x39\
+\xff\x4a\x46\x46\xfb\x35\x35\x35\x18\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2e\x2e\x2e\x16\x46\x40\x40\
+\xfb\x39\x34\x33\xff\x3c\x37\x36\xff\x3e\x3a\x38\xff\x40\x3c\x3b\
+\xff\x42\x3e\x3d\xff\x45\x40\x40\xff\x48\x42\x41\xff\x4a\x44\x43\
+\xff\x4c\x47\x45\xff\x53\x4e\x4d\xff\x5c\x58\x57\xff\x5d\x58\x57\
+\xff\x5d\x59\x58\xff\x5e\x5a\x59\xff\x5e\x5a\x59\xff\x5f\x5a\x59\
+\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x5f\x5a\x59\xff\x51\x4c\x4b\
+\xff\x51\x4c\x4b\xff\x51\x4c\x4b\xff\x51\x4c\x4b\xff\x50\x4b\x4a\
+\xff\x57\x52\x51\xff\x5d\x58\x57\xff\x5d\x58\x57\xff\x5c\x57\x56\
+\xff\x5b\x56\x55\xff\x59\x55\x54\xff\x59\x54\x53\xff\x58\x53\x51\
+\xff\x56\x50\x4f\xff\x54\x4f\x4e\xff\x52\x4c\x4b\xff\x49\x44\x43\
+\xff\x46\x41\x40\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3c\
+\xff\x3f\x3b\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x39\x39\
+\xff\x4e\x49\x49\xf8\x35\x35\x35\x13\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x2a\x2a\x12\x45\x40\x3f\
+\xf8\x38\x34\x33\xff\x3b\x36\x35\xff\x3d\x38\x38\xff\x3f\x3b\x3b\
+\xff\x42\x3e\x3d\xff\x45\x40\x3f\xff\x48\x42\x41\xff\x4a\x44\x43\
+\xff\x4b\x47\x45\xff\x57\x53\x52\xff\x5d\x58\x58\xff\x5e\x59\x58\
+\xff\x5e\x59\x58\xff\x5e\x59\x58\xff\x5f\x59\x58\xff\x60\x5a\x59\
+\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x59\x54\x53\xff\x50\x4b\x4a\
+\xff\x51\x4c\x4b\xff\x51\x4c\x4b\xff\x51\x4c\x4b\xff\x51\x4c\x4b\
+\xff\x5c\x58\x57\xff\x5d\x58\x57\xff\x5c\x58\x57\xff\x5c\x57\x56\
+\xff\x5c\x57\x56\xff\x5a\x55\x54\xff\x59\x55\x54\xff\x58\x54\x53\
+\xff\x57\x51\x50\xff\x55\x50\x4f\xff\x4d\x48\x47\xff\x48\x42\x41\
+\xff\x46\x41\x40\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3c\
+\xff\x3f\x3b\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x3e\x3a\x3a\
+\xff\x52\x4e\x4d\xf5\x36\x36\x36\x0e\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x36\x24\x24\x0e\x47\x41\x40\
+\xf4\x38\x33\x33\xff\x3b\x36\x35\xff\x3d\x38\x37\xff\x3f\x3b\x3a\
+\xff\x42\x3d\x3c\xff\x44\x40\x3f\xff\x48\x42\x41\xff\x49\x44\x43\
+\xff\x4c\x47\x46\xff\x5c\x57\x56\xff\x5e\x59\x58\xff\x5f\x5a\x59\
+\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x60\x5a\x59\xff\x61\x5b\x5a\
+\xff\x61\x5b\x5a\xff\x60\x5a\x59\xff\x52\x4d\x4c\xff\x50\x4b\x4a\
+\xff\x50\x4b\x4a\xff\x50\x4b\x4a\xff\x4f\x4a\x49\xff\x57\x52\x51\
+\xff\x5e\x59\x58\xff\x5d\x58\x57\xff\x5d\x58\x57\xff\x5c\x58\x57\
+\xff\x5c\x57\x56\xff\x5b\x56\x55\xff\x5a\x55\x54\xff\x59\x54\x53\
+\xff\x57\x53\x51\xff\x53\x4e\x4d\xff\x4a\x44\x43\xff\x48\x42\x41\
+\xff\x46\x41\x40\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3c\
+\xff\x3f\x3b\x3b\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x41\x3d\x3d\
+\xff\x54\x4f\x4e\xf1\x38\x38\x38\x09\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x1c\x1c\x09\x46\x41\x40\
+\xf1\x37\x33\x32\xff\x3b\x36\x35\xff\x3c\x38\x37\xff\x3e\x3a\x3a\
+\xff\x41\x3d\x3c\xff\x44\x3f\x3e\xff\x47\x41\x41\xff\x49\x43\x42\
+\xff\x50\x4b\x4a\xff\x5e\x59\x58\xff\x5e\x59\x58\xff\x5f\x5a\x59\
+\xff\x60\x5b\x5a\xff\x60\x5b\x5a\xff\x60\x5b\x5a\xff\x61\x5b\x5b\
+\xff\x61\x5b\x5b\xff\x5d\x58\x57\xff\x4f\x4a\x49\xff\x50\x4b\x4a\
+\xff\x50\x4b\x4a\xff\x50\x4b\x4a\xff\x50\x4b\x4a\xff\x5e\x59\x58\
+\xff\x5e\x5a\x59\xff\x5e\x5a\x59\xff\x5e\x59\x58\xff\x5d\x58\x57\
+\xff\x5d\x58\x57\xff\x5b\x57\x56\xff\x5b\x56\x55\xff\x59\x54\x53\
+\xff\x57\x52\x51\xff\x4c\x47\x46\xff\x4a\x44\x43\xff\x48\x42\x41\
+\xff\x46\x41\x40\xff\x43\x3f\x3e\xff\x42\x3e\x3d\xff\x40\x3c\x3b\
+\xff\x3f\x3b\x3a\xff\x3f\x3b\x3a\xff\x44\x40\x3f\xff\x42\x3e\x3e\
+\xff\x55\x4f\x4f\xee\x33\x33\x33\x05\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x33\x33\x05\x47\x41\x40\
+\xed\x36\x32\x31\xff\x39\x35\x34\xff\x3c\x37\x36\xff\x3e\x3a\x39\
+\xff\x40\x3c\x3b\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x48\x42\x41\
+\xff\x56\x52\x51\xff\x5d\x59\x58\xff\x5f\x5a\x59\xff\x61\x5b\x5a\
+\xff\x61\x5b\x5a\xff\x61\x5b\x5b\xff\x61\x5b\x5b\xff\x61\x5b\x5b\
+\xff\x61\x5b\x5b\xff\x55\x50\x4f\xff\x4f\x4a\x49\xff\x4f\x4a\x49\
+\xff\x4f\x4a\x49\xff\x4f\x4a\x49\xff\x58\x52\x51\xff\x61\x5b\x5a\
+\xff\x60\x5a\x59\xff\x5f\x5a\x59\xff\x5f\x5a\x59\xff\x5d\x59\x58\
+\xff\x5d\x58\x57\xff\x5c\x57\x56\xff\x5b\x56\x55\xff\x5a\x55\x54\
+\xff\x51\x4d\x4c\xff\x4b\x46\x44\xff\x49\x44\x43\xff\x48\x42\x41\
+\xff\x46\x40\x40\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3b\
+\xff\x3f\x3b\x3a\xff\x43\x3f\x3e\xff\x46\x41\x40\xff\x43\x3f\x3e\
+\xff\x56\x51\x51\xeb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x45\x40\x3f\
+\xea\x35\x32\x31\xff\x38\x34\x33\xff\x3b\x36\x35\xff\x3e\x39\x38\
+\xff\x40\x3c\x3b\xff\x42\x3e\x3d\xff\x45\x40\x3f\xff\x48\x43\x41\
+\xff\x5b\x57\x56\xff\x5e\x59\x58\xff\x60\x5a\x59\xff\x61\x5b\x5a\
+\xff\x61\x5c\x5b\xff\x61\x5c\x5b\xff\x61\x5c\x5b\xff\x62\x5d\x5c\
+\xff\x60\x5b\x5a\xff\x4f\x4a\x49\xff\x4f\x4a\x49\xff\x4f\x4a\x49\
+\xff\x4f\x4a\x49\xff\x50\x4a\x49\xff\x5f\x5a\x59\xff\x60\x5b\x5a\
+\xff\x60\x5b\x5a\xff\x61\x5b\x5a\xff\x5f\x5a\x59\xff\x5d\x59\x58\
+\xff\x5d\x59\x58\xff\x5d\x58\x57\xff\x5b\x56\x55\xff\x57\x52\x51\
+\xff\x4c\x47\x46\xff\x4b\x46\x44\xff\x49\x43\x42\xff\x48\x42\x41\
+\xff\x46\x40\x3f\xff\x43\x3f\x3e\xff\x42\x3d\x3c\xff\x40\x3c\x3b\
+\xff\x43\x3f\x3e\xff\x47\x42\x41\xff\x47\x42\x41\xff\x44\x3f\x3f\
+\xff\x57\x53\x53\xe6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x52\x4b\x49\
+\xe6\x40\x3b\x38\xff\x43\x3d\x3b\xff\x46\x40\x3d\xff\x49\x42\x40\
+\xff\x4c\x45\x42\xff\x4e\x48\x45\xff\x51\x4b\x48\xff\x59\x52\x50\
+\xff\x69\x64\x61\xff\x6a\x65\x62\xff\x6c\x66\x63\xff\x6e\x67\x64\
+\xff\x6e\x67\x65\xff\x6f\x68\x65\xff\x6f\x68\x66\xff\x70\x68\x66\
+\xff\x68\x60\x5e\xff\x5c\x56\x52\xff\x5d\x56\x53\xff\x5d\x57\x54\
+\xff\x5d\x57\x54\xff\x66\x60\x5d\xff\x6f\x68\x65\xff\x6f\x68\x65\
+\xff\x6f\x67\x65\xff\x6e\x67\x64\xff\x6e\x67\x64\xff\x6c\x66\x63\
+\xff\x6d\x65\x63\xff\x6b\x65\x62\xff\x6a\x64\x61\xff\x5d\x57\x54\
+\xff\x5a\x54\x50\xff\x59\x52\x4f\xff\x57\x50\x4e\xff\x55\x4e\x4b\
+\xff\x53\x4c\x4a\xff\x50\x4a\x48\xff\x4f\x49\x45\xff\x4f\x49\x46\
+\xff\x54\x4e\x4c\xff\x53\x4d\x4b\xff\x53\x4c\x4a\xff\x50\x4a\x48\
+\xff\x66\x60\x5d\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x49\x46\
+\xe0\x3f\x3a\x38\xff\x42\x3d\x3b\xff\x45\x40\x3d\xff\x48\x41\x3f\
+\xff\x4b\x44\x42\xff\x4e\x48\x45\xff\x50\x4a\x47\xff\x5f\x5a\x56\
+\xff\x69\x63\x61\xff\x6b\x65\x63\xff\x6c\x66\x63\xff\x6e\x68\x65\
+\xff\x6f\x68\x65\xff\x6f\x69\x66\xff\x6f\x69\x66\xff\x6f\x69\x66\
+\xff\x5f\x58\x55\xff\x5d\x56\x53\xff\x5d\x56\x54\xff\x5d\x56\x54\
+\xff\x5f\x57\x54\xff\x6f\x68\x65\xff\x70\x69\x66\xff\x6f\x69\x66\
+\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6f\x68\x65\xff\x6e\x67\x64\
+\xff\x6d\x67\x64\xff\x6d\x65\x63\xff\x64\x5c\x59\xff\x5c\x55\x52\
+\xff\x5b\x54\x50\xff\x59\x53\x4f\xff\x57\x50\x4d\xff\x55\x4e\x4b\
+\xff\x53\x4c\x4a\xff\x50\x4a\x48\xff\x50\x4a\x47\xff\x56\x50\x4d\
+\xff\x55\x4f\x4d\xff\x54\x4e\x4c\xff\x54\x4d\x4b\xff\x51\x4c\x49\
+\xff\x66\x5f\x5c\xda\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4e\x47\x45\
+\xda\x3f\x3a\x37\xff\x41\x3c\x3a\xff\x43\x3e\x3c\xff\x47\x41\x3e\
+\xff\x4a\x43\x41\xff\x4d\x47\x43\xff\x4f\x49\x46\xff\x65\x5f\x5d\
+\xff\x69\x63\x61\xff\x6a\x65\x62\xff\x6b\x66\x63\xff\x6e\x67\x65\
+\xff\x6f\x68\x65\xff\x6f\x68\x66\xff\x6f\x69\x66\xff\x6b\x64\x61\
+\xff\x5b\x54\x50\xff\x5c\x55\x51\xff\x5c\x55\x51\xff\x5b\x55\x51\
+\xff\x66\x5f\x5c\xff\x70\x68\x66\xff\x70\x68\x66\xff\x70\x68\x66\
+\xff\x70\x68\x65\xff\x6f\x68\x65\xff\x6f\x68\x65\xff\x6f\x67\x65\
+\xff\x6e\x67\x64\xff\x69\x62\x60\xff\x5c\x55\x52\xff\x5c\x55\x52\
+\xff\x5a\x54\x50\xff\x59\x52\x4f\xff\x57\x4f\x4d\xff\x55\x4d\x4b\
+\xff\x53\x4c\x49\xff\x50\x4a\x47\xff\x57\x52\x4e\xff\x57\x51\x4f\
+\xff\x55\x4f\x4d\xff\x54\x4e\x4c\xff\x54\x4e\x4b\xff\x52\x4c\x49\
+\xff\x66\x5f\x5b\xd3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4b\x45\x43\
+\xd4\x3e\x39\x36\xff\x40\x3b\x39\xff\x43\x3e\x3b\xff\x46\x40\x3e\
+\xff\x48\x42\x40\xff\x4b\x45\x42\xff\x53\x4c\x49\xff\x67\x61\x5f\
+\xff\x68\x63\x61\xff\x6b\x65\x63\xff\x6c\x66\x63\xff\x6e\x67\x65\
+\xff\x6e\x67\x65\xff\x6f\x68\x66\xff\x6f\x68\x67\xff\x60\x59\x57\
+\xff\x5a\x54\x50\xff\x5a\x54\x50\xff\x5b\x54\x50\xff\x5c\x56\x52\
+\xff\x6f\x68\x65\xff\x70\x69\x66\xff\x6f\x69\x66\xff\x6f\x68\x65\
+\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6e\x67\x65\xff\x6e\x67\x64\
+\xff\x6d\x66\x64\xff\x5e\x57\x54\xff\x5c\x55\x51\xff\x5b\x54\x50\
+\xff\x5a\x53\x4f\xff\x58\x52\x4e\xff\x56\x4f\x4c\xff\x54\x4d\x4a\
+\xff\x52\x4b\x48\xff\x57\x51\x4e\xff\x59\x53\x51\xff\x57\x51\x4f\
+\xff\x56\x50\x4d\xff\x54\x4e\x4c\xff\x54\x4e\x4b\xff\x53\x4d\x4a\
+\xff\x66\x5e\x5c\xcd\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x44\x41\
+\xcd\x3e\x38\x36\xff\x40\x3b\x38\xff\x42\x3d\x3b\xff\x44\x3f\x3d\
+\xff\x48\x41\x3f\xff\x4a\x43\x41\xff\x59\x53\x51\xff\x67\x61\x5e\
+\xff\x68\x63\x61\xff\x6a\x65\x63\xff\x6b\x65\x63\xff\x6d\x67\x64\
+\xff\x6e\x68\x65\xff\x6e\x68\x65\xff\x6c\x66\x63\xff\x59\x51\x4f\
+\xff\x59\x52\x4f\xff\x59\x53\x4f\xff\x59\x52\x4f\xff\x65\x5e\x5b\
+\xff\x6f\x68\x66\xff\x6f\x69\x66\xff\x6f\x69\x66\xff\x6f\x68\x65\
+\xff\x6f\x68\x65\xff\x6e\x67\x65\xff\x6e\x67\x65\xff\x6e\x67\x64\
+\xff\x63\x5d\x59\xff\x5b\x55\x51\xff\x5b\x54\x50\xff\x5a\x53\x4f\
+\xff\x59\x52\x4f\xff\x57\x50\x4d\xff\x55\x4e\x4b\xff\x54\x4d\x4a\
+\xff\x57\x51\x4e\xff\x5b\x56\x54\xff\x59\x54\x50\xff\x57\x51\x4f\
+\xff\x56\x50\x4e\xff\x55\x4e\x4c\xff\x54\x4d\x4c\xff\x53\x4d\x4a\
+\xff\x65\x5d\x5a\xc7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x42\x40\
+\xc7\x3e\x38\x36\xff\x3f\x3a\x37\xff\x41\x3c\x3a\xff\x44\x3f\x3d\
+\xff\x47\x41\x3f\xff\x49\x43\x40\xff\x61\x5b\x59\xff\x67\x62\x5f\
+\xff\x68\x63\x61\xff\x6a\x65\x63\xff\x6b\x66\x63\xff\x6d\x67\x64\
+\xff\x6e\x68\x65\xff\x6f\x68\x66\xff\x63\x5d\x5a\xff\x57\x50\x4d\
+\xff\x58\x51\x4e\xff\x58\x51\x4e\xff\x59\x52\x50\xff\x6d\x67\x64\
+\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6f\x68\x65\
+\xff\x6e\x67\x65\xff\x6e\x67\x65\xff\x6e\x67\x65\xff\x69\x63\x60\
+\xff\x5a\x54\x50\xff\x5a\x53\x50\xff\x5a\x53\x50\xff\x59\x52\x4f\
+\xff\x58\x51\x4e\xff\x57\x4f\x4d\xff\x54\x4d\x4a\xff\x56\x50\x4d\
+\xff\x5e\x58\x55\xff\x5a\x55\x53\xff\x59\x54\x50\xff\x57\x51\x4e\
+\xff\x55\x4f\x4d\xff\x54\x4e\x4b\xff\x54\x4d\x4b\xff\x53\x4d\x4b\
+\xff\x63\x5c\x58\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x47\x42\x3e\
+\xc1\x3e\x38\x36\xff\x3f\x3a\x37\xff\x41\x3c\x3a\xff\x43\x3e\x3c\
+\xff\x47\x41\x3f\xff\x4d\x46\x44\xff\x65\x60\x5d\xff\x67\x62\x60\
+\xff\x69\x63\x61\xff\x6a\x65\x63\xff\x6d\x67\x64\xff\x6e\x67\x65\
+\xff\x6e\x67\x66\xff\x6e\x67\x65\xff\x58\x52\x4f\xff\x57\x50\x4d\
+\xff\x57\x50\x4d\xff\x57\x4f\x4d\xff\x63\x5d\x5b\xff\x6f\x69\x66\
+\xff\x6e\x68\x65\xff\x6e\x68\x65\xff\x6e\x67\x65\xff\x6e\x67\x65\
+\xff\x6e\x67\x65\xff\x6e\x67\x64\xff\x6d\x66\x64\xff\x5c\x55\x52\
+\xff\x5a\x53\x4f\xff\x59\x52\x4f\xff\x58\x51\x4e\xff\x58\x50\x4e\
+\xff\x57\x50\x4d\xff\x55\x4e\x4b\xff\x55\x4e\x4c\xff\x60\x59\x57\
+\xff\x5d\x58\x55\xff\x5b\x55\x52\xff\x59\x54\x50\xff\x57\x50\x4e\
+\xff\x55\x4f\x4d\xff\x54\x4e\x4c\xff\x54\x4d\x4b\xff\x53\x4d\x4a\
+\xff\x5e\x57\x55\xba\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x47\x40\x3f\
+\xba\x3e\x38\x36\xff\x3f\x3a\x37\xff\x41\x3c\x3a\xff\x43\x3e\x3c\
+\xff\x47\x41\x3e\xff\x54\x4f\x4c\xff\x66\x61\x5e\xff\x67\x63\x61\
+\xff\x69\x64\x61\xff\x6c\x65\x63\xff\x6d\x66\x65\xff\x6e\x67\x66\
+\xff\x6e\x68\x66\xff\x68\x61\x5f\xff\x55\x4e\x4b\xff\x56\x4f\x4c\
+\xff\x56\x4f\x4c\xff\x57\x51\x4e\xff\x6d\x67\x65\xff\x6f\x69\x66\
+\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6e\x68\x65\xff\x6e\x67\x65\
+\xff\x6e\x67\x65\xff\x6e\x67\x65\xff\x61\x5b\x58\xff\x58\x50\x4e\
+\xff\x58\x51\x4e\xff\x58\x50\x4e\xff\x57\x50\x4d\xff\x57\x50\x4d\
+\xff\x56\x4e\x4c\xff\x55\x4d\x4b\xff\x5f\x59\x56\xff\x5f\x59\x57\
+\xff\x5c\x57\x55\xff\x5a\x54\x52\xff\x58\x53\x50\xff\x56\x50\x4d\
+\xff\x55\x4e\x4d\xff\x53\x4e\x4b\xff\x53\x4d\x4b\xff\x4e\x48\x45\
+\xff\x55\x4d\x4b\xb4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x3f\x3c\
+\xb4\x3e\x38\x36\xff\x3f\x3a\x37\xff\x41\x3c\x3a\xff\x43\x3e\x3c\
+\xff\x47\x40\x3e\xff\x5e\x59\x57\xff\x66\x60\x5e\xff\x68\x63\x61\
+\xff\x6a\x64\x62\xff\x6c\x66\x65\xff\x6d\x67\x65\xff\x6f\x68\x66\
+\xff\x6f\x69\x66\xff\x5c\x55\x53\xff\x56\x4e\x4c\xff\x56\x4f\x4c\
+\xff\x55\x4e\x4b\xff\x63\x5d\x5a\xff\x6f\x69\x66\xff\x6f\x68\x66\
+\xff\x6f\x68\x66\xff\x6f\x68\x66\xff\x6e\x68\x65\xff\x6e\x68\x65\
+\xff\x6d\x67\x65\xff\x68\x62\x60\xff\x57\x4f\x4d\xff\x57\x50\x4d\
+\xff\x57\x50\x4d\xff\x57\x4f\x4d\xff\x56\x4f\x4c\xff\x56\x4e\x4c\
+\xff\x54\x4d\x4a\xff\x5e\x57\x55\xff\x61\x5b\x59\xff\x5f\x59\x56\
+\xff\x5c\x57\x55\xff\x59\x54\x51\xff\x58\x51\x4f\xff\x55\x50\x4d\
+\xff\x54\x4e\x4c\xff\x53\x4d\x4b\xff\x4d\x47\x45\xff\x47\x41\x3f\
+\xff\x51\x4b\x48\xaf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x3d\x3c\
+\xae\x3e\x3a\x36\xff\x3f\x3a\x38\xff\x41\x3c\x3a\xff\x43\x3e\x3c\
+\xff\x49\x43\x41\xff\x64\x5f\x5c\xff\x67\x62\x5f\xff\x69\x64\x61\
+\xff\x6a\x65\x63\xff\x6d\x67\x65\xff\x6e\x68\x65\xff\x6f\x69\x66\
+\xff\x6c\x66\x64\xff\x55\x4d\x4b\xff\x55\x4e\x4b\xff\x55\x4e\x4b\
+\xff\x58\x50\x4e\xff\x6e\x68\x66\xff\x70\x6a\x67\xff\x6f\x69\x66\
+\xff\x6f\x69\x66\xff\x6f\x68\x66\xff\x6e\x68\x65\xff\x6e\x68\x65\
+\xff\x6d\x67\x64\xff\x59\x52\x4f\xff\x56\x4f\x4c\xff\x56\x4f\x4c\
+\xff\x56\x4f\x4c\xff\x56\x4e\x4c\xff\x55\x4e\x4b\xff\x54\x4d\x4a\
+\xff\x5b\x55\x52\xff\x63\x5d\x5b\xff\x61\x5b\x58\xff\x5e\x59\x56\
+\xff\x5b\x56\x54\xff\x59\x54\x50\xff\x57\x51\x4f\xff\x55\x4f\x4d\
+\xff\x54\x4e\x4b\xff\x4b\x46\x44\xff\x45\x40\x3e\xff\x47\x41\x3f\
+\xff\x4f\x49\x46\xaa\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x43\x3d\x3a\
+\xa9\x3f\x3a\x37\xff\x40\x3b\x38\xff\x42\x3d\x3b\xff\x43\x3e\x3c\
+\xff\x51\x4c\x49\xff\x66\x61\x5e\xff\x68\x63\x61\xff\x69\x65\x62\
+\xff\x6b\x66\x63\xff\x6e\x68\x65\xff\x6f\x68\x66\xff\x6f\x69\x67\
+\xff\x61\x5b\x59\xff\x54\x4d\x4a\xff\x55\x4e\x4b\xff\x55\x4d\x4b\
+\xff\x64\x5d\x5b\xff\x70\x69\x68\xff\x70\x69\x68\xff\x70\x69\x67\
+\xff\x70\x69\x67\xff\x6f\x69\x66\xff\x6f\x68\x66\xff\x6f\x68\x66\
+\xff\x61\x5a\x58\xff\x55\x4e\x4b\xff\x56\x4f\x4c\xff\x56\x4f\x4c\
+\xff\x56\x4e\x4c\xff\x55\x4e\x4b\xff\x55\x4d\x4b\xff\x59\x51\x4f\
+\xff\x66\x60\x5d\xff\x63\x5d\x5a\xff\x61\x5b\x58\xff\x5e\x59\x56\
+\xff\x5b\x56\x54\xff\x58\x53\x50\xff\x57\x50\x4f\xff\x55\x4f\x4d\
+\xff\x4c\x46\x44\xff\x44\x3f\x3d\xff\x45\x3f\x3d\xff\x46\x3f\x3d\
+\xff\x4b\x45\x44\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x3c\x39\
+\xa4\x3f\x3b\x37\xff\x40\x3b\x39\xff\x43\x3e\x3b\xff\x44\x3f\x3c\
+\xff\x5b\x57\x54\xff\x66\x62\x5f\xff\x68\x63\x62\xff\x6a\x65\x63\
+\xff\x6d\x67\x64\xff\x6e\x68\x66\xff\x6f\x69\x67\xff\x70\x6a\x67\
+\xff\x57\x4f\x4d\xff\x55\x4e\x4b\xff\x55\x4e\x4b\xff\x57\x50\x4d\
+\xff\x71\x6a\x68\xff\x71\x6a\x68\xff\x71\x6a\x68\xff\x70\x69\x68\
+\xff\x70\x69\x68\xff\x70\x69\x67\xff\x6f\x68\x66\xff\x69\x63\x61\
+\xff\x55\x4e\x4b\xff\x56\x4f\x4c\xff\x56\x4e\x4c\xff\x56\x4e\x4c\
+\xff\x56\x4e\x4c\xff\x55\x4d\x4b\xff\x56\x4f\x4c\xff\x66\x60\x5d\
+\xff\x66\x5f\x5d\xff\x63\x5d\x5b\xff\x61\x5b\x59\xff\x5d\x58\x56\
+\xff\x5b\x56\x54\xff\x58\x54\x50\xff\x57\x51\x4f\xff\x4b\x46\x44\
+\xff\x44\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x44\x3f\x3d\
+\xff\x49\x44\x41\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x3c\x39\
+\x9f\x40\x3b\x38\xff\x41\x3c\x3a\xff\x43\x3e\x3c\xff\x47\x41\x3e\
+\xff\x64\x5f\x5d\xff\x67\x63\x61\xff\x69\x64\x62\xff\x6b\x66\x64\
+\xff\x6e\x68\x66\xff\x6f\x69\x66\xff\x70\x6a\x68\xff\x68\x62\x5f\
+\xff\x54\x4c\x4a\xff\x55\x4e\x4b\xff\x54\x4d\x4a\xff\x65\x5e\x5b\
+\xff\x72\x6b\x6a\xff\x72\x6b\x69\xff\x72\x6b\x69\xff\x71\x6a\x68\
+\xff\x71\x6a\x68\xff\x70\x69\x68\xff\x6f\x68\x66\xff\x59\x51\x4f\
+\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x55\x4e\x4b\
+\xff\x55\x4e\x4b\xff\x55\x4e\x4b\xff\x65\x5f\x5c\xff\x68\x62\x60\
+\xff\x65\x60\x5d\xff\x63\x5d\x5b\xff\x61\x5b\x59\xff\x5e\x58\x57\
+\xff\x5b\x56\x54\xff\x59\x53\x51\xff\x4d\x48\x44\xff\x44\x3f\x3d\
+\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3c\
+\xff\x48\x41\x3e\x9b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x3c\x39\
+\x98\x41\x3c\x39\xff\x42\x3d\x3a\xff\x44\x3f\x3c\xff\x50\x4a\x47\
+\xff\x67\x62\x60\xff\x68\x64\x62\xff\x6a\x65\x63\xff\x6c\x67\x65\
+\xff\x6f\x69\x66\xff\x70\x6a\x68\xff\x71\x6c\x69\xff\x5b\x54\x52\
+\xff\x55\x4e\x4b\xff\x55\x4e\x4b\xff\x57\x50\x4d\xff\x71\x6c\x69\
+\xff\x73\x6d\x6a\xff\x72\x6c\x6a\xff\x72\x6b\x6a\xff\x72\x6b\x69\
+\xff\x71\x6a\x68\xff\x71\x6a\x68\xff\x62\x5b\x59\xff\x55\x4d\x4b\
+\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x55\x4e\x4b\
+\xff\x55\x4d\x4b\xff\x63\x5b\x59\xff\x69\x64\x61\xff\x68\x62\x60\
+\xff\x66\x60\x5d\xff\x64\x5e\x5b\xff\x61\x5b\x59\xff\x5f\x59\x57\
+\xff\x5b\x57\x54\xff\x4e\x48\x46\xff\x46\x40\x3e\xff\x44\x3f\x3c\
+\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3b\
+\xff\x45\x40\x3d\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x3d\x3a\
+\x91\x42\x3d\x3b\xff\x43\x3e\x3c\xff\x44\x3f\x3d\xff\x5b\x56\x53\
+\xff\x67\x63\x61\xff\x6a\x65\x63\xff\x6b\x66\x65\xff\x6e\x68\x66\
+\xff\x6f\x6a\x67\xff\x71\x6b\x69\xff\x6e\x69\x66\xff\x54\x4d\x4a\
+\xff\x55\x4e\x4b\xff\x54\x4d\x4a\xff\x66\x5f\x5d\xff\x74\x6f\x6c\
+\xff\x74\x6e\x6b\xff\x73\x6e\x6a\xff\x73\x6d\x6a\xff\x72\x6c\x6a\
+\xff\x72\x6b\x69\xff\x6c\x66\x64\xff\x55\x4d\x4b\xff\x56\x4e\x4c\
+\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x56\x4e\x4c\xff\x55\x4d\x4b\
+\xff\x5d\x58\x55\xff\x6b\x65\x63\xff\x69\x64\x61\xff\x68\x62\x61\
+\xff\x66\x61\x5d\xff\x64\x5e\x5b\xff\x62\x5c\x59\xff\x5f\x59\x57\
+\xff\x50\x4a\x48\xff\x47\x41\x3e\xff\x46\x40\x3e\xff\x44\x3f\x3c\
+\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3c\xff\x43\x3e\x3b\
+\xff\x45\x40\x3c\x8b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x3d\x3b\
+\x7c\x44\x3f\x3d\xff\x45\x40\x3d\xff\x48\x41\x3f\xff\x64\x60\x5d\
+\xff\x69\x64\x62\xff\x6a\x65\x64\xff\x6d\x68\x65\xff\x6f\x69\x67\
+\xff\x70\x6a\x68\xff\x72\x6c\x6a\xff\x61\x5b\x58\xff\x54\x4d\x4a\
+\xff\x55\x4d\x4b\xff\x57\x50\x4d\xff\x72\x6d\x6b\xff\x72\x6e\x6b\
+\xff\x72\x6d\x6b\xff\x72\x6d\x6a\xff\x72\x6d\x69\xff\x71\x6c\x68\
+\xff\x71\x6b\x68\xff\x59\x52\x4f\xff\x54\x4d\x4a\xff\x54\x4d\x4a\
+\xff\x54\x4d\x4a\xff\x54\x4c\x4a\xff\x54\x4c\x4a\xff\x59\x52\x4f\
+\xff\x6b\x65\x63\xff\x6a\x64\x62\xff\x69\x64\x61\xff\x67\x62\x60\
+\xff\x66\x60\x5e\xff\x64\x5e\x5b\xff\x62\x5c\x5a\xff\x53\x4c\x4a\
+\xff\x4a\x44\x41\xff\x48\x42\x3f\xff\x46\x40\x3e\xff\x44\x3f\x3c\
+\xff\x43\x3e\x3c\xff\x43\x3e\x3b\xff\x43\x3e\x3b\xff\x42\x3d\x3b\
+\xfc\x42\x3e\x3a\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x1f\x1f\
+\x08\x47\x40\x3e\x7a\x49\x42\x3f\xc0\x51\x4b\x49\xd4\x6d\x68\x66\
+\xda\x70\x6a\x68\xd9\x74\x6f\x6c\xd9\x77\x71\x6f\xd9\x7b\x74\x73\
+\xd9\x7d\x79\x76\xd9\x81\x7b\x79\xd9\x65\x5c\x59\xd9\x63\x5a\x58\
+\xd9\x64\x5c\x59\xe1\x7a\x73\x70\xe3\x8d\x87\x84\xe3\x8e\x89\x85\
+\xe3\x90\x8a\x86\xe3\x90\x8a\x87\xe3\x92\x8b\x87\xe3\x93\x8c\x89\
+\xe3\x80\x79\x74\xe3\x6c\x65\x61\xe3\x6c\x65\x60\xe3\x6b\x63\x5f\
+\xe3\x6b\x63\x5f\xeb\x69\x61\x5e\xed\x6a\x62\x5e\xed\x82\x7a\x78\
+\xed\x81\x79\x77\xed\x7e\x77\x74\xed\x7b\x74\x72\xed\x77\x72\x6e\
+\xed\x74\x6d\x6a\xed\x6f\x69\x66\xed\x5d\x57\x53\xed\x51\x4b\x49\
+\xed\x4f\x49\x46\xf4\x4b\x46\x43\xf6\x49\x43\x40\xf6\x46\x40\x3e\
+\xf6\x44\x3f\x3c\xf6\x43\x3d\x3a\xf7\x42\x3d\x3b\xd2\x41\x3e\x3b\
+\x56\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\
+\x80\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\x80\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\
+\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xf8\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
+\xfc\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\
+\xfe\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\
+\xfe\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf8\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xfc\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfc\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfc\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfc\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfe\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfe\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xc0\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xc0\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
+\xc0\x1e\x00\x00\x00\x00\x00\x01\x80\xff\xff\xff\xff\xff\xff\xff\
+\xc3\xfe\x00\x00\x00\x00\x00\x01\xf0\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xfe\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\
+\x00\x00\x05\xaf\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\xdd\xcf\x6b\x1c\x65\x18\x07\xf0\x89\x1e\
+\x22\xa1\xb8\x9e\x3c\xe8\x21\x1e\x54\x7a\x92\x42\x83\xd7\xfc\x01\
+\x16\x6f\xc5\x8b\xc5\x52\x4b\x05\x41\x30\x69\xb3\xbb\x78\x99\xb6\
+\x84\xc8\xce\xa2\x4d\x6d\x69\x69\x66\xda\x82\x8a\xa0\x22\x94\xd6\
+\x92\x5c\x3c\x68\x2b\xd1\x52\xf0\xd2\x83\xf5\x64\x09\x24\xde\x5c\
+\x11\x4b\x0b\x25\x6f\xe7\x99\xec\x94\xc9\x6b\xbb\x3f\x66\xde\x9f\
+\xfb\x7c\xbf\xe5\x69\x79\xb6\xcb\xbb\x33\xfd\xbc\xc9\x0e\xd3\x77\
+\xdf\x04\xc1\x58\xfa\xeb\xe8\xd1\x20\xfd\xfd\xa5\x60\xe7\x33\x63\
+\xc1\xf3\x41\x10\xec\x4c\x2b\x7d\x88\x1e\xcc\x1e\xcf\x92\xfe\x1d\
+\x82\x20\x08\x82\x20\x08\xa2\x36\x97\xc3\x3d\x13\x57\x3f\x7a\x73\
+\x4a\x47\xd1\xd8\xb6\xcf\x0f\xe9\x9d\xef\x9b\x6f\xec\x4e\xad\x84\
+\xa6\x9a\xb2\x7d\x7e\x48\xef\xe4\xfe\x37\x16\x0f\x8a\xdf\x2f\xcc\
+\x2a\x29\x1a\x0b\xfe\x7e\x24\xf7\x27\xb7\xce\x72\x5b\x49\xd1\x58\
+\xf0\xf7\x23\xf0\xe7\x1d\xf8\xf3\x0e\xfc\x79\x07\xfe\xbc\x03\x7f\
+\xde\x81\x3f\xef\xc0\x9f\x77\xe0\xcf\x3b\xf0\xe7\x1d\xf8\xf3\x0e\
+\xfc\x79\x87\xbb\xff\xcd\x73\x87\x26\xae\x9f\xfa\x70\x8a\x6b\xfd\
+\xd0\x3a\xb0\x6f\x25\xdc\x2b\x6e\x25\xb3\x62\xfd\xd2\x82\x92\xba\
+\x95\x1c\x16\x34\x26\x8d\x5d\xe5\xd8\xc8\x46\xb7\xff\xb5\x33\x87\
+\x77\x5f\x3f\x73\x44\xa0\x1c\xac\x74\x0e\x98\xf2\xbf\x7d\x65\x51\
+\x6c\xac\x7e\x81\x72\xa0\xc8\xc2\xb4\xff\xc6\xea\xe7\x42\xfc\xf5\
+\x13\xca\x81\xa2\x39\x00\x7f\xbe\x05\x7f\xde\x05\x7f\xde\x05\x7f\
+\xde\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\
+\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\x05\x7f\xde\x05\
+\x7f\xde\x05\x7f\xde\x05\x7f\xde\xe5\xbb\xff\x7f\x7f\x5c\xcd\xc6\
+\x43\x95\x2b\xdf\xd7\x7f\x3d\x9a\xbf\x28\x6f\xd6\x7f\xea\xf0\xff\
+\xe6\x44\x5d\x7c\xf5\x69\xe3\xe7\x1f\x3f\x9b\x79\x9d\x5e\xc7\xc5\
+\xa2\x35\xda\xcb\xdd\xf5\xdf\x1b\x97\x16\x94\x14\xad\xff\x5e\xee\
+\xae\xff\xae\x72\x6c\x26\xd7\x7f\xeb\xf0\x27\xfb\xa4\xdd\x14\x71\
+\xab\xf9\x96\xee\xf3\x28\x1b\xee\x9f\xff\xd0\xe9\x4f\x5f\xf7\x2e\
+\xdb\x53\xe0\xaf\xf1\xfd\x5f\x7a\xff\x3a\x1d\xbe\xbf\x23\x0c\x83\
+\xa7\x6c\x9d\xeb\xe3\x02\x7f\x33\xfe\x64\x1f\x47\x8d\x5f\xe2\x76\
+\xf3\x7c\x18\x86\xce\xcc\x01\xf8\x9b\xf1\x17\x22\x18\x23\x7b\xba\
+\x1e\x48\xa2\xc6\x05\x57\xe6\x00\xfc\xcd\x7d\xff\xa7\xef\xfd\x64\
+\x9f\x44\xcd\x95\x93\x27\x3f\x18\xb7\x75\xce\xc5\xc0\xdf\x9c\x3f\
+\x85\xe6\x80\x2b\xf6\x14\xf8\x9b\xf5\x2f\x86\xde\x03\x96\xda\xf5\
+\x77\x6d\xbe\x17\xc0\xdf\x9e\x3f\xd9\x6f\xdd\x1f\xa8\x5f\xb4\x35\
+\x07\xe0\x6f\xf7\xeb\x9f\xec\xb3\x6b\xc2\x76\x63\xde\xd4\x39\x17\
+\x03\x7f\x7b\xfe\x14\x9a\x03\x64\x7f\x76\x7e\xe6\x45\x13\xe7\x2b\
+\x07\xfe\x76\xfd\x6d\x07\xfe\x6e\xf9\xc7\xed\xc6\xcc\x92\xc1\xfb\
+\x03\xf0\x77\xcb\x9f\xec\xe9\x7a\x60\x6b\x0e\xe8\xbf\x57\x0c\x7f\
+\xb7\xfc\xc9\x9c\xec\xe3\xa8\xd9\x39\xdb\x9a\x7b\x45\xc7\x39\x17\
+\x03\x7f\xb7\xfc\x29\x74\xaf\xd8\x84\x3d\x05\xfe\xee\xf9\xcb\x89\
+\xa3\x23\xaf\xe9\xba\x1e\x80\xbf\xdb\xfe\x64\x9f\xbe\x17\xdc\xd5\
+\x75\x8f\x08\xfe\x6e\xfb\x17\xef\x11\xc5\x51\x23\x51\x71\xce\xc5\
+\xc0\xdf\x6d\x7f\x4a\x36\x07\x52\xfb\xb4\xde\x56\x31\x5e\x31\xf0\
+\x77\xdf\x5f\x67\xe0\xef\x9f\x7f\xfc\x49\xf3\xe5\xf3\x51\x33\x52\
+\x71\x3d\x00\x7f\x0f\xfd\x53\x7b\x55\xff\x6f\x08\x7f\xff\xfc\xb7\
+\x5d\x13\x56\x5c\x5f\x0c\x7f\xff\xfc\x29\x5b\x73\xa0\xfa\xda\x72\
+\xf8\xfb\xe9\x2f\x67\x6b\x6d\xf9\xf0\xef\x05\xf0\xf7\xdf\x9f\xec\
+\x93\xa8\xf1\x6b\x99\xeb\x01\xf8\xfb\xef\xbf\xfd\x7a\x60\xb8\x39\
+\x00\x7f\xff\xfd\x29\x8f\xe6\xc0\x90\x6b\xcb\xe1\x3f\x1a\xfe\x14\
+\x9a\x03\xc3\xae\x2d\x87\xff\xe8\xf8\x17\x33\xe8\xda\x72\xf8\x8f\
+\xa6\x7f\xbe\xb6\xbc\xdf\x5a\x32\xf8\x8f\xa6\x7f\xbe\x8e\xa8\xbb\
+\xb6\xfc\xf8\x93\x9e\x07\xff\xd1\xf4\xa7\x64\x9f\x37\x4c\xed\x4f\
+\xb5\xe6\x5e\x78\xd2\x73\xe0\x3f\xba\xfe\x83\x04\xfe\x7c\xfc\x69\
+\x6d\xb9\xfc\xd9\x73\xf8\xf3\xf1\x4f\xba\xd7\x03\xc5\x7b\x44\xf0\
+\xe7\xe3\x9f\xdf\x23\x8a\xa3\xc6\xdf\xb4\x86\x80\x1e\x83\x3f\x1f\
+\x7f\x4a\x36\x07\xba\xf6\x14\xf8\xf3\xf2\x97\xf3\xed\xb1\x7d\x7b\
+\x7d\xf6\xbf\x1c\xee\x99\xa0\xd7\x29\x5b\xd9\xcf\xa8\xd7\xe4\x4f\
+\x63\x57\x39\x36\xdd\x45\xf6\x5f\xce\xbf\x77\xd7\x67\xff\xfc\xfb\
+\x57\xd9\xa2\x7d\x2a\x75\xf9\xaf\xa4\x63\x57\x39\x36\x93\xe5\xbb\
+\xff\x8d\xc5\x83\xd9\xeb\x0e\x5b\xb4\x57\xa9\x2e\x7f\x1a\xbb\xcc\
+\x31\xd9\xa8\xf5\xef\x8e\x79\xed\x5f\x76\xfe\xd2\x7e\xb5\xba\xfc\
+\xd7\xd3\xb1\x55\xfd\x9b\xfa\x54\xf0\x87\x3f\xfc\xe1\x0f\x7f\xf8\
+\xc3\xdf\xbe\x07\xfc\xe1\x0f\x7f\xf8\xc3\x1f\xfe\xf0\x87\x3f\xfc\
+\xe1\x0f\x7f\xf8\xc3\x1f\xfe\xf0\x87\x3f\xfc\xe1\x0f\x7f\xf8\xc3\
+\x1f\xfe\xf0\x87\x3f\xfc\xe1\xef\x9b\x7f\xf9\xf5\x5f\xb3\x1a\xd7\
+\x7f\xd9\x5f\xd7\x65\xa3\xc8\x02\xeb\x3f\xfd\x5a\xff\xa9\xa3\xbe\
+\x3e\xbe\xff\x80\xee\x9f\x63\x42\xeb\xbf\x69\x0e\x94\x2d\xdd\xeb\
+\xbf\xab\x1c\x9b\xcf\x45\xf6\x49\x6b\xee\x81\xcd\x9f\x6d\x37\x48\
+\xb8\x7f\xfe\x43\x57\x74\xef\x5b\xae\x2a\xf0\xd7\x17\x9d\xfb\x96\
+\xab\x0a\xfc\x79\x07\xfe\xe6\xb2\xb4\x30\xfb\x6a\xac\x68\xdf\x72\
+\x55\x81\xbf\xb9\xc4\x51\x3d\x1a\x64\x4f\x2a\x93\x81\xbf\xb9\x14\
+\xf7\xa4\x52\xb1\x77\xb5\x8a\xc0\xdf\x6c\x68\x0e\xc4\xad\x39\x27\
+\xec\x29\xf0\xb7\x9b\xb2\xfb\x96\xab\x0a\xfc\xed\xa5\xca\xbe\xe5\
+\xaa\x02\x7f\x7b\xa9\xb2\x6f\xb9\xaa\xc0\xdf\x6e\xca\xee\x5b\xae\
+\x2a\xf0\xb7\x9f\x32\xfb\x96\xab\x0a\xfc\xdd\xca\xa0\xfb\x96\xab\
+\x4a\xee\x7f\xfb\xca\x62\x36\x07\x54\x14\x8d\x05\xff\x72\xc9\xf7\
+\x2d\x8f\xdb\xf5\x77\x4c\xbc\x5e\xee\xaf\xa5\xe0\x3f\x74\xb2\xeb\
+\x81\xd4\x5e\x04\xc1\x98\x89\xd7\xbb\x79\xee\xd0\x04\xcd\x01\x1d\
+\x45\x63\x9b\x38\x07\x04\x41\x10\x04\x41\x90\x51\x8e\x50\x96\x4e\
+\x10\xd4\x38\xf6\x9d\xe2\x3f\x67\x0d\xbd\x85\xfe\x69\xc9\x63\x5c\
+\xea\x9f\x0d\xb7\xf7\x3b\xa6\xa5\x7e\x52\x7a\xbe\xd4\xd7\xa4\xe7\
+\xd7\xd6\xa4\xfe\x4e\x9f\xfe\x1f\xa9\xff\xdf\x9f\x93\x52\x5f\xeb\
+\xd3\x5f\x94\xfa\xfb\x52\xdf\xe9\xd3\xdf\xeb\x73\x3c\xe2\x84\xd4\
+\x7f\xdc\xa7\xff\x4d\xea\x1f\x48\xfd\xbd\x50\xea\xa7\xa5\xe7\x4b\
+\xfd\xa6\xf4\x7c\xb1\x2a\xf5\xd7\xfa\xf4\x6b\xbd\xcf\x4f\x6c\xee\
+\x92\xfa\xe7\x7a\xf7\x62\xd7\x63\xc7\x71\x60\xf6\xf3\xe9\xc7\xa5\
+\x7e\xdb\xd7\x3d\xcd\x01\xa9\x5f\x93\x7a\x21\xf5\x9b\xd3\x52\x3f\
+\xd9\xbb\x17\xd2\xf3\xc5\xbf\x52\x7f\x47\xea\xff\x94\xfa\x8e\xd4\
+\xdf\x97\x8f\x6f\x72\xc8\xbe\x72\x1e\x02\xb9\x06\xe8\x81\
+\x00\x00\x05\xf4\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x9d\xcd\x8e\x1c\x35\x10\xc7\x3d\x33\x91\
+\x92\x48\x68\xc2\xe6\xc0\x95\x3d\xe6\xbc\x91\x00\x71\x21\x0f\xc0\
+\x23\x20\xf6\x3d\xb8\x64\x2f\xdc\xb9\x84\x70\x43\x3c\x02\x47\xb8\
+\xf0\x08\xa0\xe4\x01\xe6\x1e\x31\x1b\xa4\x5c\x48\xc2\xee\xe0\xda\
+\x76\x65\x7a\x67\xfb\xcb\x2e\x7b\xdb\xfe\xbb\x7e\x51\x65\xd6\xfd\
+\xe1\x76\xfd\xab\xed\x99\x6e\xbb\xdb\xc6\x2c\xec\xbf\xb3\x33\x63\
+\xff\x3f\x36\x8f\xee\x2d\xcc\x27\xc6\x98\x47\xd6\xec\x22\x5a\x78\
+\xb5\xbc\x61\x61\xbe\xf8\xdb\x5c\x99\xa2\x28\x8a\xa2\x28\x8a\xa2\
+\xf4\xb0\x48\x6c\xb5\xa3\xfa\x2a\xb9\x42\xe7\xcf\x03\x6b\x47\xd6\
+\x3e\x76\x9f\x31\x8c\xf3\x7a\x60\xea\x3e\x47\x73\xd5\x97\xf7\xa1\
+\xfd\x37\xd6\xde\x58\xdb\x5a\x3b\x8f\x64\x5b\x97\xe7\xc6\x1d\xa3\
+\x7d\xcc\x1a\xc8\x5d\x5f\xde\xf6\xc8\xe5\xb7\xb3\x76\xe9\x3e\x63\
+\x18\xe7\x75\xee\x8e\xe1\x5b\xbe\xd2\xc9\x5d\x5f\xde\x96\xda\x91\
+\xad\xcb\xeb\xc2\xe5\x1b\xc3\x2e\x5c\x9e\x5b\x77\x0c\xdf\xf2\x95\
+\x4e\xee\xfa\xe6\x7e\x7e\x96\x4e\xee\xfa\xe6\x5e\xbe\xd2\xc9\x5d\
+\x5f\x9f\xf2\x69\xfb\xef\x4f\xcc\xf6\x7f\xee\xf8\x6b\xfd\xf7\x27\
+\x77\x7d\xa7\x96\x8f\x96\xfd\xe3\xb6\x79\x6d\xf4\xfa\x6f\x2a\xd2\
+\xeb\x3f\xd6\x9a\xb4\xef\x8b\x4b\xca\xf8\xf3\xdf\x74\xfc\x63\x6b\
+\x1f\x59\x7b\x68\xf4\xfe\x8f\x2f\xa1\xf7\x7f\x48\x6b\xd2\xfc\xd8\
+\x34\x31\xe8\x8b\x4f\xea\xf8\xd7\xda\x7e\xcf\x4d\xea\xf8\x4c\xcd\
+\x9f\xda\xa1\x87\x6e\xdb\xa5\xd1\xfe\x89\x10\x42\x34\x5b\xba\x7d\
+\x49\x7b\x8a\x81\xd6\xff\xba\xc8\xa5\xfe\x6b\xfc\xe7\x41\xe3\x5f\
+\x37\x1a\xff\xba\xd1\xf8\xd7\x8d\xc6\xbf\x6e\x34\xfe\x75\xa3\xf1\
+\xaf\x1b\x8d\x7f\xdd\x68\xfc\xeb\xe6\xb6\xe2\xdf\xd7\x3f\x1d\xab\
+\xff\x3e\xe4\xde\x27\xa2\x85\xe8\x46\xa4\x8a\x4f\xca\xf3\x6b\x65\
+\xed\x8e\x67\x79\xd0\x21\x2d\x48\x93\x95\xc7\xf6\x44\xea\xfa\xdf\
+\xd7\x3f\x1d\xd2\x7f\x4f\xeb\xdb\xfe\x51\x1f\xc6\xda\xc4\x1f\xfb\
+\x5e\x8a\xb1\xcf\x6b\xb3\xef\xcf\x31\x4e\xa3\x29\x5a\x12\x31\xe3\
+\xd3\x77\x9c\xae\xfe\x69\xdf\xfe\xfb\x76\xec\x4f\xac\x3d\xb7\xf6\
+\xc2\xda\x2b\xe3\x37\x6e\x04\xcd\x5e\x3b\x0d\x5e\x38\x4d\x4e\x9c\
+\x46\xdc\x97\x3a\x45\xd7\x18\xf1\x49\x09\x1f\xff\x9e\xb5\x67\x26\
+\xee\x38\x27\x44\xfb\xd1\x69\xd5\xd6\x6e\x4e\x24\xbf\x5d\x78\xfd\
+\x5d\x6b\xbf\x99\xc6\xbf\xf7\xce\x62\x8e\x77\x2f\xdd\x2e\x5a\xba\
+\xec\x9c\x56\x77\x0f\x34\x1c\xd2\x38\xe6\x6f\xcb\x98\xf0\xf7\x1a\
+\xd5\x7b\xf2\xeb\xad\xd1\xfa\x3f\x64\x97\x4e\xa3\x9d\xd3\xac\xad\
+\x61\x69\x70\xb9\x3f\x37\xd7\xaf\x49\xd4\xc6\xcf\x01\x6e\x1b\x3f\
+\x3b\xd0\xb2\x24\xee\xb8\x4f\xfa\x3e\x23\xbf\xb8\x6d\xeb\xf2\xb7\
+\x66\xeb\xd2\x84\xb5\xe2\x36\x80\xb5\x2c\x91\xbf\x4c\xe3\x8b\xd6\
+\xff\xe9\xc6\x5a\xfd\x19\xa0\x77\x0e\xf0\xef\x0e\xba\xb6\xa5\xeb\
+\x1b\xae\xe7\x5d\x75\x3f\xe4\xf9\x81\xd2\x6d\xea\xf8\xfd\x57\x4e\
+\xc3\xb6\xa6\x25\x30\xf5\xfe\x54\xe8\xf3\x03\xa5\x9b\xcf\xf8\xfd\
+\x12\x9f\x8f\x6b\xdf\x9f\x1e\x8a\x3f\xad\x3b\x3a\xd8\xa7\x06\x7c\
+\xee\xdf\x96\x1c\xff\x31\xff\x62\x3c\x3f\x50\xa2\xa5\x1e\xbf\x3f\
+\x37\xa9\xfb\x27\x4a\x07\x5d\x1f\x74\xff\xa4\xa0\xeb\x83\xee\x9f\
+\x14\x74\x7d\xd0\xfd\x93\x82\xae\x0f\xba\x7f\x52\xd0\xf5\x41\xf7\
+\x4f\x0a\xba\x3e\xe8\xfe\x49\x41\xd7\x07\xdd\x3f\x29\xe8\xfa\xa0\
+\xfb\x27\x05\x5d\x1f\x74\xff\xa4\xa0\xeb\x83\xee\x9f\x14\x74\x7d\
+\xd0\xfd\x93\x82\xae\x0f\xba\x7f\x52\xd0\xf5\x41\xf7\x4f\x0a\xba\
+\x3e\xe8\xfe\x49\x41\xd7\x07\xdd\x3f\x29\xe8\xfa\xa0\xfb\x27\x05\
+\x5d\x1f\x74\xff\xa4\xa0\xeb\x83\xee\x9f\x14\x74\x7d\xd0\xfd\x93\
+\x82\xae\x0f\xba\x7f\x52\xd0\xf5\x41\xf7\x4f\x0a\xba\x3e\xe8\xfe\
+\x49\x41\xd7\x07\xdd\x3f\x29\xe8\xfa\xa0\xfb\x27\x05\x5d\x1f\x74\
+\xff\xa4\xa0\xeb\x83\xee\x9f\x14\x74\x7d\xd0\xfd\x93\x82\xae\x0f\
+\xba\x7f\x52\xd0\xf5\x41\xf7\x4f\x0a\xba\x3e\xe8\xfe\x49\x41\xd7\
+\x07\xdd\x3f\x29\xe8\xfa\xa0\xfb\x27\x05\x5d\x1f\x74\xff\xa4\xa0\
+\xeb\x83\xee\x9f\x14\x74\x7d\xd0\xfd\x93\x82\xae\x0f\xba\x7f\x52\
+\xd0\xf5\x41\xf7\x4f\x0a\xba\x3e\xe8\xfe\x49\x41\xd7\x07\xdd\x3f\
+\x29\xe8\xfa\xa0\xfb\x27\x05\x5d\x1f\x74\xff\xa4\xa0\xeb\x33\xd5\
+\x3f\x7d\xff\x2b\xf6\xfb\x5f\xf5\xfd\xcf\xdd\xf8\xd4\x7f\xe4\xf7\
+\x3f\xeb\xfb\xdf\xb1\xdf\xff\xbe\x36\x3a\xff\x43\x97\xd5\x32\xff\
+\x03\xa1\xf3\xbf\xf8\x5b\xe9\xf3\xbf\x10\x3c\xdf\xa7\xce\xff\x34\
+\x6c\x5d\x9a\x20\xcc\xff\xa4\xf3\xbf\x85\x19\x6b\x45\x9f\x25\xcf\
+\xff\x46\x70\xb9\xb9\x0d\xd0\xf9\x1f\xc7\x63\x9f\xdb\xfc\x8f\x63\
+\xd7\xb2\x63\xfb\x12\x3a\xff\xeb\xb0\x1d\xce\xff\xfa\xbb\xc1\x98\
+\xff\x95\xe0\x32\xd0\x9c\xc6\xdc\x0e\xa8\xf5\xdb\x73\x93\xcf\xfc\
+\xcf\x74\xfc\x58\xf3\xbf\x73\x3b\xf6\xd8\xda\x4f\xd6\x5e\x1a\x9d\
+\xff\x9d\xe7\x7f\x7f\xe9\x34\x79\xec\x34\x9a\x7b\xfe\x77\xde\x87\
+\xf6\xdf\x58\x7b\x63\x6d\xdb\x2a\xf7\xd6\x2d\xdb\xb8\x6d\xda\xfb\
+\x0c\xe5\xb9\x6a\xa5\xc9\xc7\x75\x47\xd9\x6b\x31\xf6\x79\x6d\xae\
+\x7f\xc7\xaf\x26\x6a\x49\xc4\x8c\x4f\x57\xfe\x47\x66\xf8\xfe\xdd\
+\xb9\xdb\xc6\x27\x7f\xf2\xaf\xc4\xeb\x99\xd4\x90\x26\xab\xd1\xad\
+\x1a\x52\xf7\x1f\xb5\xef\xdf\x6f\x5d\x5e\xed\xdf\x6b\x7c\x2d\xb7\
+\x35\xe1\xf7\x27\xe7\xee\x83\xc9\xcd\x7c\xb5\x23\x52\xc5\x27\xf5\
+\xf9\xa5\xc8\xb8\xad\xfa\xaf\xf1\xcf\x13\x8d\x7f\xdd\x68\xfc\xeb\
+\x46\xe3\x5f\x37\x1a\xff\xba\xd1\xf8\xd7\x8d\xc6\xbf\x6e\x34\xfe\
+\x75\xa3\xf1\xaf\x9b\x5c\xe2\x1f\x63\xfc\x7e\xed\x84\x68\x96\xfa\
+\xf9\x01\xad\xff\x79\x93\x4b\xfd\x0f\x1d\xbf\x2f\xed\x9f\x46\x81\
+\x7c\xef\xea\xbf\x1f\x33\x9f\xe7\x07\x52\xc4\xbf\x7d\x9c\x90\xf1\
+\xfb\xd2\xfe\xe9\xd2\x61\x5f\xfb\xfa\xef\xa7\x8c\x1b\xa1\xcf\xb1\
+\xe7\x07\x52\xc7\x3f\xd4\x6a\xff\xfe\xc8\x5d\x5f\x9f\xf2\x85\x8e\
+\x77\xa4\x7d\x25\xe3\x07\x4a\x66\xac\xff\xde\xc7\xe6\x8e\xbf\xd6\
+\x7f\x7f\x72\xd7\x37\xf7\xf2\x95\x4e\xee\xfa\xc6\x6c\x9f\xb4\xfd\
+\xbf\x49\xee\xfa\xe6\x7e\x7e\x96\x4e\xee\xfa\x4a\xaf\x4f\xf4\xfa\
+\x6f\x98\x52\xf4\x0d\xbd\x3f\xa1\xf7\x7f\xa6\xa1\xfa\x2a\xb9\x13\
+\xd2\x3f\xa1\xfd\x3f\xd3\x51\x7d\x15\x45\x51\x14\x45\x51\x94\x5b\
+\x63\x17\x99\x77\x36\xcf\xd3\x1b\x7f\xf6\xaf\xcf\x2f\xdd\x2a\xf2\
+\x3b\x4a\x3f\xd9\xaf\x5f\x76\xad\xcf\x2e\xfd\x2f\xc7\xf6\xd3\x26\
+\xfd\xeb\xd3\x66\xed\xe5\xf7\x4d\xfa\x6b\x5e\x7f\x72\x95\xfe\xf6\
+\x07\x4e\xdf\xff\x8e\x32\xbb\x78\xc2\xe9\xe5\x1f\x94\xe5\x37\x67\
+\x9c\x5e\x7c\x49\xeb\xff\xdb\xa7\xbf\xa2\x6c\xdf\xee\x4f\xa6\x9f\
+\xbb\xd2\xef\xf7\xe9\x0d\xcb\xec\x38\xed\x4e\x7f\xd0\xdb\xa5\x5d\
+\x81\x96\x7d\xeb\x35\xad\xe9\x9c\xd2\x63\xe7\xeb\xf0\xf9\x7f\x58\
+\x5f\xc6\xea\xd7\xf5\xfa\x78\xb3\xbe\x1e\xd6\xe7\xeb\xf5\xfd\x66\
+\x7b\x70\xfa\xcb\xd3\xa6\xbc\xdc\x5e\x1c\xb6\x27\xbb\x0f\x64\x99\
+\x1e\x6b\xaf\xe7\xfe\x7e\x19\x4e\xef\x0e\x18\x5b\x2f\xe5\x7f\xc9\
+\xd5\x1d\x98\
+\x00\x00\x0e\x9b\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x5d\x6b\x6c\x1c\x57\x15\x9e\x59\xdb\xad\
+\x1d\xda\xd4\x76\x69\x49\x88\x13\xef\x75\x6c\x27\x21\x21\x01\x44\
+\x80\xa6\x51\xb2\xa0\x20\xa2\x56\x22\x06\xa2\x22\x01\x92\xf3\xa3\
+\x08\x09\x51\x5e\x12\xd0\x54\xa2\xb6\x10\xd0\x88\x87\x92\x96\x47\
+\xa9\x2a\xb5\xc1\x55\x9b\xf0\x90\x8a\xa0\x02\x95\x87\xd2\x16\xa1\
+\x26\x14\xd4\x06\x02\xe2\xdd\x50\xd2\xd2\x06\x15\xd2\x90\x86\xda\
+\xb1\x3d\x9c\x33\x73\xce\xcc\x99\xeb\x99\xf5\xae\xbd\xbb\xf3\xba\
+\x5f\x75\x3a\x3e\x6b\x6f\xf6\xde\xfb\x9d\x7b\xee\xb9\xe7\x3e\xd6\
+\xb2\x6c\xf8\x6f\x7c\xdc\x82\xff\x97\xad\xb5\x9d\xb6\x75\xa5\x65\
+\x59\x6b\x41\xe0\x25\x7c\xd1\x7d\xdd\x83\x6d\x9d\xdf\xe2\x89\x81\
+\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\
+\x81\x81\x81\x81\x81\x81\x81\x81\x41\x14\xca\xe5\xb2\xa5\x94\x92\
+\x62\x1b\x69\x9e\x60\x7b\x4b\x49\x12\x03\x03\x03\x92\xf7\x12\x89\
+\xab\xaf\x5e\xbd\x3a\xd1\xb2\xe5\x09\xd8\x96\xcb\x96\x2d\xb3\x56\
+\xad\x5a\x85\x6d\xdb\x46\xe2\xb7\x7d\x52\x90\x65\xe8\xef\xef\xe7\
+\xbe\x7f\x19\x48\x0f\x48\x37\x3d\x8d\x2c\x4e\xba\x45\x5b\x76\xca\
+\xfe\x36\x38\x38\xe8\xda\x46\x52\x36\x30\x3c\x3c\xcc\xfd\x1e\x9f\
+\x65\x90\x9f\x80\xfc\x07\xe4\xdf\x46\x9a\x22\x4f\x81\x7c\x1b\xe4\
+\x75\xd4\xe6\xbe\x1f\x40\xdf\xd0\x6a\x28\xaf\xdf\xdb\x14\x03\xfc\
+\x0c\xc4\x01\x99\xa6\xa7\x91\xc6\xcb\x2c\x3d\x67\x40\x46\x89\xfb\
+\x12\x8e\xc3\x49\xc4\x02\xca\xf3\xf7\xf8\x5c\x0e\xf2\x02\x95\x6f\
+\x86\x9e\x46\x1a\x2f\xd8\xb6\x17\xc8\x06\xa6\x40\x36\xb3\x0d\xb4\
+\x9c\xfc\x30\xff\x38\x2e\xfd\x45\x94\x2b\xe9\x7e\x92\x77\xe1\x36\
+\x3e\x44\xed\xdf\x96\x50\xff\x97\x63\xd0\x6e\x90\x49\x2a\xd7\xb4\
+\x32\xe3\x40\x33\x65\x86\x9e\x7f\x53\x41\x4c\xd8\xf2\x4d\x9d\x18\
+\x7b\xa2\xc0\xf8\xc3\x31\xe0\x10\xc8\xfd\xa2\x9c\xd3\xa2\xac\x46\
+\x1a\x27\x1c\x07\x60\x4c\xd8\x9d\x14\xff\x32\x0f\x01\x9f\x5f\x82\
+\xa7\x4d\x65\x79\x2b\xc8\x6f\x84\xad\x4e\x8b\x32\x1b\xc9\x09\xff\
+\x08\x8e\x3d\xd9\x06\x40\xda\xc8\x2f\x74\xc0\xcf\x1f\x02\xf9\x97\
+\x66\x07\x49\xb7\x5d\x1e\x24\x35\xfc\x23\x30\x0f\xa1\xc2\x39\xe0\
+\x36\x15\xe4\x05\xae\x00\xf9\x9a\x0a\xe2\x56\x33\x26\x34\x96\xff\
+\x9e\xa4\xf9\x67\x68\x36\x60\x6b\x76\xb0\x09\xe4\xa7\xa2\xfc\x66\
+\x4c\xc8\x19\xff\x0c\xcd\x0e\xdc\x31\x01\xf3\x53\x2b\x56\xac\x40\
+\xfd\x9d\x20\x7f\xa6\xf2\x9b\x31\x21\x87\xfc\x23\x56\xae\x5c\x19\
+\x35\x26\xb4\x51\x9c\xd0\x05\xb2\x17\xe4\x2c\xd5\xc3\xcc\x17\x73\
+\xc6\x3f\x03\xe3\x43\x29\x64\x07\x25\xfa\x79\x25\xc8\x3d\xa2\x3e\
+\x26\x36\xc8\x19\xff\x0c\x15\x1d\x1b\xd8\x64\x07\x57\x81\x3c\x2a\
+\xea\x66\x62\x83\x9c\xf1\xcf\xc0\xb2\x0a\x5f\xe0\xc7\x06\x7d\x7d\
+\x7d\x68\x13\xa3\x20\xa7\xa8\x6e\x26\x36\xc8\x21\xff\x08\x5e\xb3\
+\xc6\x58\xa0\xb7\xb7\x37\xb4\xa7\x01\xec\x02\xf7\x0f\xdc\x02\x72\
+\x9e\xea\x68\x62\x83\x9c\xf1\xcf\xe0\xfd\x43\x22\x7f\x24\xe7\x8b\
+\x26\x97\x9c\x73\xfe\x19\xda\x1e\x42\x9b\xec\xc0\x56\x26\x97\x5c\
+\x08\xfe\x19\x68\x07\x62\x4f\xa1\xc9\x25\x17\x8c\x7f\x84\xc9\x25\
+\x17\x9b\x7f\x86\x8a\x9e\x2f\x9a\x5c\x72\x41\xf8\x67\x68\x76\x60\
+\x72\xc9\x05\xe3\x1f\x61\x72\xc9\xc5\xe6\x9f\x61\x72\xc9\xc5\xe6\
+\x9f\xa1\x4c\x2e\xb9\xd0\xfc\x33\x54\x71\x73\xc9\x86\x7f\x42\x41\
+\x73\xc9\x86\x7f\x0d\x05\xcb\x25\x1b\xfe\x63\x50\x90\x5c\x72\x21\
+\xf8\xe7\x73\xcf\x9b\x37\x6f\x8e\x8a\xf9\xe2\xc4\xf7\x05\x39\xce\
+\x25\xe7\x92\x7f\xe6\x57\xf4\x61\xe4\x13\xfb\x6f\x3b\x49\x49\xf6\
+\x6f\x86\x76\x0e\x41\xf6\xf7\xbc\xe6\x92\x73\xc3\x3f\xf3\x49\x4f\
+\xc9\x77\x1c\x87\x28\x17\x81\x5c\xaa\xe6\xde\x35\x70\x91\x0a\xfa\
+\x7b\xdc\xfb\xf9\x33\xb2\x9c\x4b\xce\x34\xff\x43\x43\x43\x2e\x17\
+\xeb\xd6\xad\xe3\x9f\x91\x8b\x76\xf0\xd7\x36\x9f\x27\xd9\xb0\x61\
+\x03\xbe\xbe\x0c\x64\x07\xc8\xc7\x40\xee\x00\x79\x10\xe4\x71\x90\
+\xbf\x82\x3c\x0b\xf2\xbc\x0a\xdf\x37\xf0\x24\xc8\x2d\xf0\xfe\x25\
+\xe2\x3e\x0a\xdf\x57\x68\x76\x90\xe5\x5c\x72\x26\xf9\xe7\xbe\x8e\
+\xf9\xdc\xdd\xbb\x77\xfb\x73\x35\xe4\x00\xf9\x82\xdf\xe3\xd8\x7c\
+\x35\xc8\xe7\x94\x97\xc3\xf9\x6f\x9d\xed\xc2\xfe\xfb\x87\xc3\xc3\
+\xc3\x36\xad\x25\x86\xda\x25\x27\xb9\xe4\xcc\xf1\xcf\xfd\x5a\xf6\
+\x3d\xc1\xc1\x6a\x90\xcf\x80\xfc\x29\x86\xd3\x0b\x24\x3c\x46\xc7\
+\xdd\x31\x80\xaf\xf3\x19\xe4\xf7\xd2\xbf\xdd\x1e\x57\x9e\x0c\xe7\
+\x92\x33\xc3\x7f\xd4\x7c\x8c\xfd\x3c\xfc\xfc\x5a\x90\xc3\x20\x2f\
+\x69\x75\x63\xae\x17\x32\x0e\x73\x3c\x77\x97\x0a\xfa\x77\x6c\xf9\
+\x54\x74\x6c\x90\xf6\x5c\x72\x26\xf8\x57\x11\xe3\x2d\xfd\x3c\xa0\
+\xbc\xbb\x0b\x66\x44\x7d\x2e\xa8\xc6\xf4\xb1\xba\xf8\x97\x65\xcd\
+\x50\x2e\x39\xf5\xfc\x63\x99\x70\xfc\x5d\xbe\x7c\xb9\xcb\x01\x8e\
+\xef\xd0\xb6\xc8\xc5\xa7\x40\x5e\x14\x6d\x79\x61\x01\x7d\xaa\xda\
+\xfd\x28\xec\xff\xdf\xc3\xfc\xd7\x5a\xe6\x0c\xe5\x92\x53\xcd\xbf\
+\x0a\xf7\xfb\x76\x15\x8c\xf1\xbf\x58\x40\x1f\xe2\xbf\xad\x65\x4c\
+\xf0\xe3\xbf\x35\x6b\xd6\x30\x9f\x75\xb7\x4b\x06\x72\xc9\xa9\xe5\
+\x3f\x86\xfb\xb7\x83\x9c\x51\x81\x7f\x9e\xaf\xbf\xcf\xe7\x17\xf0\
+\x77\x38\x37\xd0\xef\x9a\x3b\x09\xb2\x0f\xe4\x65\xdc\x26\x8b\xb9\
+\x1b\x2b\xc5\xb9\xe4\x54\xf2\x1f\xc3\xfd\x87\x45\x99\xe7\xeb\xf3\
+\x51\x7d\xe9\x1f\x20\xdf\x03\x19\x03\xb9\x0e\xe4\x4d\x20\x43\xc0\
+\x0d\xe6\x06\x7a\x55\xf8\x7e\xc4\x8b\x55\x44\xfe\x67\xb1\x48\xe1\
+\xbe\xe4\xd4\xf1\xcf\xfd\x8c\xda\x89\xb9\xbf\xa9\x0a\xaf\xd5\x78\
+\xc7\x79\xe0\xe7\x41\xae\x82\x7f\xaf\x4b\xde\x33\x1b\xf7\xd9\x7c\
+\x17\x91\xd2\xf2\xbf\x18\x77\x34\x02\x29\xdb\x97\x9c\x2a\xfe\x65\
+\x5b\x0b\xee\x3f\xae\xe6\xf7\xf7\xba\x4f\xc0\xfb\x43\xaf\x51\x41\
+\x1e\xd7\xea\xea\xea\xe2\xb6\xe6\x35\x00\xb7\xdd\xe9\xae\xa1\x39\
+\xc2\xf9\x3c\xb4\xc5\xf5\xeb\xd7\x37\xad\xae\x2a\x3c\x26\xb4\x3a\
+\x97\x9c\x4a\xfe\x55\x30\xbf\xbb\x4e\xf4\x83\xb8\xfa\x4b\x5f\x79\
+\x14\x64\xbb\x88\xb7\x6c\xc1\x35\xfe\xec\xf6\x6d\xe4\x16\xfb\x7a\
+\x1a\xa0\xd9\x41\xab\x73\xc9\xa9\xe1\x5f\x6b\x03\x7c\x6e\x50\xde\
+\x5d\xa0\x5c\xf7\x38\x7f\x8f\x4f\x9c\x07\xde\x00\xed\x66\x93\xef\
+\xe0\xf9\x96\x2d\xdb\x37\xad\x48\x30\x97\x9c\x0a\xfe\xe5\x3a\x2d\
+\xfd\x8c\xf1\xd0\xa3\x2a\xcc\xb1\x2e\x3c\x46\xfe\x8e\x6c\xc5\x6f\
+\x37\xed\x3e\xf9\x56\x57\x67\xc1\x48\x20\x97\x9c\x0a\xfe\x95\x52\
+\xb2\xbe\xf8\xbc\x51\xe3\x38\x8e\x7b\xbc\x2b\xfa\x32\x15\xcc\x13\
+\xfc\xfe\xbe\xd0\xb9\x5a\x1a\xa0\xf9\x02\x5b\x35\x2f\x97\x9c\x1a\
+\xfe\xd9\xce\x41\xca\xca\x9b\x8f\x3b\x31\xf5\x62\x7f\xf0\x63\xe0\
+\xf8\x62\x91\x57\xc9\x5c\x7f\x9f\x0f\xdc\x2f\x9a\x98\x4b\x4e\x9c\
+\xff\x88\xbe\xff\x95\x2a\x7d\x9f\xfd\xdd\xe3\xf0\x9e\xa5\x62\x9e\
+\x96\x3b\xee\x19\x4d\xce\x25\xa7\x82\x7f\x15\xc4\x7c\xab\x54\x90\
+\xdf\xd3\xfb\x3e\xeb\x18\x07\xad\x57\xe1\x79\x42\xa6\xfd\x7d\x2d\
+\x68\x52\x2e\x39\x71\xfe\xa9\x2e\x3c\xd7\xff\x64\x95\xbe\xcf\x76\
+\x7d\x83\x0a\xe7\x05\xdd\xef\x0f\x29\x0a\x1a\x9c\x4b\x4e\x94\x7f\
+\x19\xa7\x53\xbd\x1e\xd3\xfc\xbc\xee\xf7\x7f\x05\x7f\xd7\x4e\xef\
+\xe3\x3a\xb7\xaa\xb8\xa9\x42\x83\x72\xc9\x89\xf2\xaf\xf9\xfe\x57\
+\x89\x72\xea\x36\xcb\xaf\xf3\x5e\x9c\x36\x9a\xe7\xb7\xaa\xa8\xa9\
+\x44\x03\x72\xc9\x89\xde\xff\xac\xf9\xf1\xeb\x35\xae\xf5\xbe\x7f\
+\x12\xec\xfd\x12\xd9\xf7\x0d\x3c\x68\x36\xc0\x63\x42\x2d\xb9\x64\
+\x7e\x3e\x9f\x60\xff\x67\xfe\xef\x50\xd1\x63\x3f\xeb\x77\x0a\x1b\
+\x2f\x7c\xdf\x8f\x82\x66\x07\xfe\x3e\x29\x1a\x5b\x31\x97\xcc\xdf\
+\xad\xc3\xeb\xe2\xfc\xfd\x2f\x7f\x87\xbf\xe9\xe2\x9c\x79\xab\xca\
+\x4b\x6b\x7d\x6c\xa7\x0f\xc7\xf4\xff\x39\xbe\x3f\x2d\xb9\xfb\x34\
+\x22\x2e\x97\x4c\x3f\x63\x2e\x19\xd7\x52\x39\x97\xcc\x7d\xeb\xb3\
+\x49\xb4\x2d\xee\xdf\xc4\x98\x05\xc6\x31\xf4\x01\x7f\xd4\xfc\xbd\
+\x2e\xfc\x5d\x75\xa5\xbc\xcf\xf5\x1a\x01\x19\x5b\xcb\x5c\x32\xbd\
+\xd6\x0f\xb2\x1f\xe4\x01\x90\x0f\xe0\xf7\xee\xf0\xdf\xb7\x12\x2a\
+\x88\xe1\x2f\x01\xf9\xa7\x36\x26\xc9\x9f\xcf\x81\xbc\x92\xc7\x27\
+\xd3\xff\x6b\x47\x54\x6c\x20\x72\x8a\x72\x9d\xb4\xe5\x39\x34\xf1\
+\xb9\xdd\x14\x83\xc4\xf1\x8f\xf9\xe0\xde\x56\xc7\x27\xcd\x82\xc6\
+\x49\x48\x9a\xe5\xdb\x22\x62\x03\x5e\x17\x6f\x97\xbf\x6b\xc6\x5e\
+\x87\x2a\x65\x62\xfe\x97\x82\x9c\xae\xc2\x3f\xae\x03\x5f\x99\x75\
+\xfe\x69\xef\xb2\x25\xe6\x30\x92\x03\x37\xb7\xdf\xd3\xd3\xd3\xb4\
+\x3e\xa8\xaf\x8b\xb2\xbd\xb1\xb4\x1a\x7c\x7e\x03\x62\x00\xfc\xee\
+\xb9\x27\x23\xc6\x7f\xb9\xd6\xb9\x4e\xd8\x6e\xcb\xcb\xba\x58\xe8\
+\xdf\x71\xce\x75\xe7\x3d\x67\x1b\x37\x6e\xf4\x63\x9b\xa4\xf8\x68\
+\x35\xb0\x2d\xc4\xf7\xfe\x1e\x53\xd1\xf1\x3f\xdb\xc3\x35\x4a\xcc\
+\xff\xb2\x06\xcd\xf7\xe2\x13\xf7\x9d\x62\x2c\x7e\x1f\xc8\xad\x20\
+\x6f\x94\x6b\x99\x9c\xe7\xcd\x33\x24\x9f\xca\x3b\xbf\x15\xc5\xbf\
+\x3e\x47\x69\xcf\x62\xdb\x88\x35\x5c\x7c\xe2\xf7\xed\x3e\x27\xec\
+\x9b\xfd\xdc\x5e\xde\xf7\x4a\xfb\x12\x33\x57\xcf\x7a\xc0\x7c\xaa\
+\xea\x6b\x3f\xdc\xff\x1f\xc3\x75\x1e\xf0\x95\x99\x6c\x17\x11\xeb\
+\x60\x7e\xfe\x38\xd5\x69\x52\x85\xcf\xa4\xe2\x6b\x37\x0b\x3b\xcf\
+\x64\x5d\x6b\x05\x9d\xd9\xe7\xfe\xbf\x35\x22\xfe\xd3\x65\x8b\xe6\
+\x43\x93\xae\x42\xcd\x10\xf5\xdc\x16\xe3\xe7\xf8\xec\xe2\x1c\x1b\
+\xc8\x6b\x3c\xa0\xcd\x3d\x97\xa8\xe8\x18\x50\xb6\x95\xff\x3d\xd5\
+\xbc\x2f\xa2\xaf\xaf\x2f\xe9\x6a\xd4\x04\xc1\xff\xae\x18\xfe\x0b\
+\x69\x03\x5a\x0c\xf0\xf5\x98\x31\x40\xfa\x85\x6d\xda\x7b\x92\xae\
+\x42\x4d\x10\x3e\xeb\xd5\x2a\x38\x63\x1a\xb7\x26\xcb\xf5\xff\x74\
+\xde\xe3\x01\x2d\x2e\xda\x52\x65\x0c\xe0\xf6\xfa\x35\xb4\x45\xe7\
+\xda\xb5\x6b\x43\x79\xab\xb4\x43\x1b\xb7\x0e\x51\x5d\xa6\x22\xea\
+\x39\xc7\x06\x54\x8e\xe3\x01\xb9\xf7\x9b\x9e\x0f\x56\xf1\x8f\xfc\
+\xda\xed\x51\x6d\x92\xe6\xb1\x80\xcf\x10\x53\x7d\x31\xdf\xfd\x50\
+\x15\x5f\x57\x75\x2c\xc8\x93\x0d\x88\xbc\x08\xfb\xf3\x1d\x5a\x7f\
+\x8f\xb3\x81\x1b\x55\x10\x4f\xfb\x6d\x82\x39\xb4\x34\x82\xcb\xa7\
+\xe8\x6c\x19\xf0\x78\xe9\x42\x6d\x20\x4b\x7e\xaf\x16\xa8\x20\xdf\
+\xc1\xeb\x50\xdf\x9a\xa7\x5d\xd8\x06\x3e\x21\x6c\xa7\x24\xd7\x35\
+\xd2\x06\xe4\x5c\xd8\x40\x89\xee\xa9\x5a\xb0\x1f\xc8\x93\x0d\xc8\
+\x76\xa1\x27\xde\xeb\x12\xb5\x1e\x24\xdb\x84\x6d\xe0\x80\xb8\x07\
+\x28\xd5\x67\x40\x70\x7c\xd2\x6d\x60\x31\x63\x41\xde\x6c\x40\x3b\
+\xcb\x31\x5a\x47\x9b\x3c\x02\x32\x28\x6c\xc8\x6d\x1b\xb9\x57\xb6\
+\x95\xeb\x5a\xd5\xa0\xed\xcf\x28\x2d\x36\x1e\xe0\x7a\xa6\xcd\xd6\
+\xeb\x05\xf7\x0d\x2d\x27\xc4\x67\x41\xe2\xe2\x64\x39\x16\xe0\x3d\
+\x1e\x98\x43\xec\x54\x41\x3c\x19\x3a\xfb\xcb\x92\x74\x8c\xa0\xdb\
+\x80\xf1\x03\x1e\xd0\x87\x6f\xdd\xba\xd5\xe5\x0e\xf3\xbc\xd0\x4e\
+\xd8\x97\x1f\xa8\xd1\x06\x38\x5e\xc4\x3b\x3d\xdf\x8f\xed\x49\xfd\
+\x42\x8e\x0d\xed\x2a\xb8\xd3\x23\x64\x13\x09\x0b\xdb\x00\xc6\x84\
+\x0f\xd7\x63\x03\x32\x3f\x90\x07\x3f\x20\xda\xc4\x46\x9f\x00\xf5\
+\xc1\xbc\xe0\x91\x1a\x6c\x40\xdf\xdb\xfa\x34\xc8\x97\x40\x5e\x8f\
+\x67\x06\xb8\x6d\xb0\xbd\xd0\xc7\x88\xfb\x62\xdb\x52\x22\x17\xe1\
+\x5d\xa3\x50\x46\xdc\x0b\xf1\x73\x55\x7d\x0e\x94\x5b\x3f\xa0\x9d\
+\x6f\x29\x21\x4f\xc0\x19\xde\xc3\xf4\x23\x61\x03\xf3\xdd\xdd\x35\
+\xad\xb5\xd5\x1f\x40\xbe\x01\xf2\x3e\x90\xd7\x80\xf4\x40\x7f\x2b\
+\xd1\x3c\x2c\xe9\x2a\xfb\x10\xfc\xe1\xbd\x25\x3f\xa8\xc7\x06\xb4\
+\xfb\x72\x32\x6d\x03\x7c\xb6\x83\x6d\x00\xe3\x7b\xe0\x09\xfb\xc8\
+\x9d\x2a\xf0\xf7\xf3\x9d\x73\x8c\xbb\xfb\x0b\x75\x9c\x5b\x9c\x50\
+\x9e\xaf\xc5\x76\xfe\x8e\xf2\xe6\x9c\x69\x90\xef\x82\x4c\xa8\x60\
+\xdc\xab\x26\x51\x7e\xc0\x5d\x1b\x41\xbb\xc6\x38\x23\xab\xe0\x3b\
+\x5a\xa8\x4e\x38\x86\xf3\xbd\x0e\x1f\x54\xc1\x3d\xaf\xb5\xde\xf5\
+\xc9\xb6\x90\x96\x7b\x57\x1b\x29\xd2\x06\x6e\x52\x62\x1e\x9d\xf5\
+\x7d\xb2\x2a\x1c\x23\xd9\x2a\xf0\x6f\xb8\x86\x72\x54\xe3\xb6\x1e\
+\x5e\x79\xfd\x65\x3a\xa5\x52\xef\x1d\xb6\x72\x3d\xe9\x6a\x6a\xa3\
+\x9a\xef\x2b\x4d\x33\xe4\x7e\x38\xce\x0f\x50\x1c\x87\xb6\x80\xbe\
+\x40\xee\x1b\x4d\xdb\xfd\xda\xad\x14\xf6\x01\xfb\x55\x10\x0f\x26\
+\x4d\x5f\xc3\xc0\xb1\xbb\xbc\x0b\x83\xea\x79\xb9\xf2\xee\x7c\xe7\
+\xf3\xae\xdc\x17\xb8\x0f\xe5\xcd\xdf\xc7\x09\xc7\x43\xf7\x28\xb1\
+\x9e\x92\x27\xa8\xb9\xe3\x81\xbc\x17\x07\xed\xe0\xa3\x20\xbf\x8d\
+\x69\x1b\x79\xef\x7f\x1e\x6d\x82\xe7\xc6\xbc\x2e\x96\xab\xfe\x2f\
+\xa1\x7d\x07\x84\x4d\x75\x75\xcf\x92\xd1\xb8\x80\xfb\x08\xbe\xac\
+\xbc\xbb\xc1\xaa\xcd\x13\xd2\x1c\x03\xd4\x63\xa3\x5c\xc7\x67\xca\
+\xde\x7d\xb6\x6e\xbb\x24\xcd\x53\xb3\xa1\x22\xe2\x43\x9c\x2b\xa2\
+\x4e\xb6\x80\xfe\x01\xcf\x0d\xec\x51\xde\x59\x78\xcc\xab\x3c\x05\
+\xf2\xbf\x14\xf4\xd7\xf9\xa4\x56\xfe\x39\xde\xc1\x33\x32\x1c\xfb\
+\x95\xf6\xec\xd9\x93\xe9\x1c\x40\x3d\x50\x34\xd7\xe1\x3d\x81\x4a\
+\x7c\xf7\x57\xc4\xbd\x39\x78\xce\x19\xef\x19\xc2\xf3\xa4\x6f\x56\
+\xde\x9d\xe2\xbb\x95\x77\xd7\x68\x1a\x04\xcf\x39\xe3\x3d\x2e\xfb\
+\x6b\xb0\x83\x28\xee\xdb\xd2\xba\x06\xde\x6c\x50\xbe\xd8\xb5\x83\
+\xa5\x4b\x97\xb2\x4f\xe0\xf5\xc0\x39\xdf\x05\x97\x26\x50\xce\x4b\
+\xde\xd9\xf0\xcc\x3c\xfc\x4b\xee\xb7\x2a\x31\xe6\xb3\xbd\x17\x1d\
+\x1c\x27\x08\xbf\x20\x6d\x22\x2d\xb9\x7f\x5e\xa3\xe4\x75\x4b\xdc\
+\xdf\xca\xe7\xf3\x0d\xf7\x39\x85\x36\x9f\x65\xee\xd0\x87\x9f\xd1\
+\x38\xae\x89\x7b\xb9\xbe\x65\x90\x6e\x18\xee\x8b\x0b\x9e\xb7\x1a\
+\xee\x8b\x07\xc3\x7d\x71\xa1\x9d\xff\x37\xdc\x17\x0c\x82\xfb\x36\
+\xc3\x7d\xf1\xa0\x9d\x73\x7b\x83\xe1\xbe\x58\x50\x41\xee\x09\x7d\
+\x3f\x9f\xff\x8f\xdb\xe3\x19\x95\xd7\x33\xdc\x67\x18\xc2\xef\xc7\
+\x9d\xff\xaf\x29\xb7\x63\xb8\xcf\x26\x04\xff\xd5\xce\xff\x47\x72\
+\xcf\xb9\x02\x93\xd7\xcb\x2e\xc4\xd8\x2f\xcf\xff\xcb\xfc\xee\x05\
+\x15\xe1\xf3\xb9\xcf\x1b\xee\xb3\x0d\x25\xf6\x65\xaa\xe0\xfc\x3f\
+\xef\x49\x61\x5f\x70\x26\x2a\xd6\x53\x29\x5b\xab\x32\xa8\x1f\x7c\
+\xfe\x9f\xb8\xc5\xb3\x5e\xf7\x69\x3e\xff\xf7\x20\x9b\xcb\xe1\xef\
+\x43\x31\xdc\xe7\x04\x82\x4f\xb4\x01\x9b\xce\x83\xe3\xf7\x18\xe1\
+\xde\x83\x6d\xe0\xe3\x3b\xf9\x9e\x66\x33\xde\xe7\x0f\xda\xf9\x7f\
+\x5b\x8c\x05\x91\xaf\x19\xee\xf3\x07\x8d\x6f\x8e\x07\xfc\x33\xca\
+\x72\xaf\x92\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\x81\
+\x81\x81\x41\xda\xe0\xe4\x0e\x07\x83\xca\x75\xa0\x7e\x6d\xf0\xab\
+\xdb\xc6\x1c\x67\x76\x3c\xf8\x7d\xe7\x11\x78\xb1\x12\xe8\x25\xd0\
+\x67\x85\x6e\xf7\x87\xff\xde\x3a\xa2\xe9\x77\x87\xff\xde\x1a\x05\
+\xfd\x60\x58\x77\x76\x6a\xfa\xa0\xa6\x1f\xd7\xf4\x73\x95\xb0\x3e\
+\xd9\x1d\xd6\x67\x77\x86\x75\x67\x42\xd3\x9f\x1d\x0f\xeb\x67\x2b\
+\x61\x7d\xe6\x40\x58\x77\x76\x68\xfa\x71\x4d\x3f\x35\x1e\xd6\xa7\
+\xca\x61\x7d\x76\x5f\x58\x77\x06\x34\xfd\x98\xa6\xfb\x55\x24\x7d\
+\xa6\x3b\xac\xfb\x55\x24\xdd\xf9\xbe\xa6\x73\x15\x59\xe7\x12\x91\
+\xfe\x50\xfb\x01\xa9\x9f\xeb\x98\xd8\x21\xf5\x6f\x8e\x74\xbd\x43\
+\xb6\x47\xa7\x55\xba\xbe\x12\xe8\xe7\xcb\x96\xbd\xb7\x1c\xe8\x47\
+\xc7\x2d\xfb\xe6\x7d\x81\x0e\xed\x6d\x6f\x9f\xf0\x75\x2c\xac\xbd\
+\xfd\x98\xaf\xcf\x40\xd9\xec\xb1\xf3\x15\xd6\xa7\x2a\xa8\x7b\x55\
+\x74\xf9\x85\xdf\x97\xc6\xbc\x46\x47\xfd\x39\x78\x76\x8d\x39\xb7\
+\xb1\xfe\x88\x65\xed\x9a\xa0\x2a\xa2\x7e\xc2\x2a\x8d\x77\x50\x15\
+\x51\x3f\x6c\x75\xf7\xc3\x63\x7a\x1f\xe9\x23\xd6\x80\x5b\xab\x41\
+\xd2\xcb\xd6\x17\x7d\x16\x47\xd1\x1e\xed\x4d\x7e\xa3\xa3\x5e\x29\
+\xdd\xed\xea\x93\x65\xd2\x3b\xc6\xbc\x46\x3f\xea\xea\xd3\xe3\x4b\
+\xa8\x51\x27\x48\xbf\x22\x68\x74\x57\x6f\x23\x1d\xec\x0a\xf4\x19\
+\x6b\xbd\xe3\xb3\x08\xfa\xa4\xb5\x86\x74\xa8\xa2\xab\xef\x62\xfd\
+\x56\x4d\x3f\x35\x0e\x25\x99\x0a\xf4\xa9\xf2\x11\xd4\x99\x54\x67\
+\xf6\x0b\xa3\x81\xfe\x12\x56\x4d\xfc\xfe\x89\x8f\x38\xce\x0b\x4e\
+\xa0\xdf\xfb\x0a\xef\x4d\xfc\xef\x8f\x5c\x1b\xd6\xcb\x43\xac\xbf\
+\xcd\x7d\x56\x7a\xa9\xd4\x54\xde\x4a\xd7\x18\xe9\xab\x3d\xbd\xfd\
+\x88\xfb\xe4\xfa\x57\x4a\xa3\xa4\x97\xbc\x7f\x8f\x9a\x75\x9a\xde\
+\x58\xb6\x6e\xf7\x0a\x4d\x6f\x1c\xb1\xbc\x02\xcc\x96\x4b\x6e\x01\
+\x0e\x5b\x54\x00\xfa\xc3\x13\x16\x15\x60\xc4\xda\x81\x8f\xd3\x16\
+\x15\x60\x9f\xd5\xbd\x1d\x1e\x2f\x5a\x54\x80\x83\x56\x3b\x9a\x46\
+\x69\x9c\x0a\x70\xc2\xb2\x3c\xeb\xa6\x02\x9c\x26\x3f\x77\x90\x0a\
+\x70\xce\xef\xbd\x5e\x45\xa7\xb8\xb3\x51\x45\x67\xfc\xde\xeb\xb5\
+\xd8\xac\xef\x0e\x2e\xf7\x0a\x34\xa8\xe9\xc7\x35\xfd\x54\x25\xf4\
+\x7e\x67\xb2\x93\x74\xaf\x3c\x8e\xf3\x16\xfa\x83\x77\x93\x7e\x72\
+\x93\x57\xef\xfb\x49\x9f\x75\x7f\x5b\xb1\x7d\xe2\x11\x67\xc7\xc9\
+\x2e\x09\x4f\x5b\x1d\xdb\xa5\xfe\x4b\x6b\xc9\x98\xd4\xbf\x6a\xbd\
+\x5c\xaa\xd0\xbe\xeb\x42\xfa\x88\xf5\xae\x90\x5e\xb6\x0e\x85\x74\
+\xed\xe3\x9d\x4a\xf8\xe3\x9d\x4a\xf8\xe3\x9d\x4a\xf8\xe3\x9d\x72\
+\xf8\xe3\x9d\x72\xf8\xe3\x9d\x9d\xe1\x8f\x77\xee\x5d\x13\xd6\x9f\
+\x18\x75\xd2\x80\xff\x03\x09\x6a\xbc\x31\
+\x00\x00\x04\x48\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x9d\x31\x4e\x1b\x41\x14\x86\xd7\xa2\x70\
+\x3a\x52\xa5\x35\x36\x12\xa2\x4c\x4b\xe5\x22\x07\x48\x05\x7b\x06\
+\xea\x1c\xc0\xae\x68\x5d\xa7\xca\x11\x52\xa7\xf3\x01\x22\x71\x05\
+\x72\x82\x10\xa5\xa1\x40\x4c\xe6\x8d\x41\xbb\x7e\x31\xc6\xde\x9d\
+\xf5\xcc\xec\x7c\x5f\xf4\x88\x9e\x43\xcc\xdb\xf7\xfd\x8c\x63\x2c\
+\x39\x45\x31\xb0\xbf\xe6\xf3\xc2\x7e\x3c\x29\xce\xdf\x0d\x8a\x0f\
+\x45\x51\x9c\xdb\xb2\x37\xc9\x8d\xee\x76\x87\xfd\x33\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x5d\x39\xbd\
+\x34\x17\x93\xd2\x5c\x8f\x4b\xb3\x18\x5f\x99\xaf\x54\x83\xb2\xbb\
+\x93\x1d\x8e\x2e\xcd\xc7\xd0\x3e\x77\xc5\xce\x7c\x66\x67\xbe\x09\
+\xbe\xbb\x9e\x95\xdb\xa9\xdd\x6d\x68\xbf\xdb\x90\xef\xf9\xd0\x7b\
+\xea\x7b\xc9\x8e\x43\x7b\xde\x04\xee\xf3\xcd\x80\x9c\x4b\xa1\x77\
+\x92\x5d\x45\xf4\x58\xc0\xe3\xfd\xe1\x4b\x76\x1e\xda\xbb\xc0\xb9\
+\x1f\xae\x62\x78\x5e\xe0\x9e\xe3\x45\xb0\x8b\x1c\x4b\x76\x1f\xda\
+\x3f\xcf\xef\x03\x96\xdd\x7d\x70\xff\xa1\x77\x90\x79\x25\xe3\x7f\
+\x75\x4e\x7c\xa1\x76\xa8\x3d\xce\xd4\x64\xfc\xdb\xeb\x0a\x3d\x6b\
+\x2a\x3c\xe7\x00\xff\x99\x82\xff\xbc\xc1\x7f\xde\xe0\x3f\x6f\xf0\
+\x9f\x37\xf8\xcf\x1b\xfc\xe7\x0d\xfe\xf3\x06\xff\x79\x83\xff\xee\
+\x90\xd7\x4c\xc7\xa5\xf9\x3e\xfa\x6c\xde\x87\x9e\xe5\x35\xf0\xdf\
+\x0d\xe2\x7e\x52\x9a\xdf\xb6\x8c\xad\xdb\x58\x33\x80\x7f\xff\x28\
+\xf7\x26\xe6\x0c\xe0\xdf\x2f\xaf\xb8\x8f\x36\x03\xf8\xf7\xc7\x1b\
+\xee\xa3\xcc\x00\xfe\xfd\xb0\xa3\xfb\xe8\x32\x80\xff\xf6\xec\xe9\
+\x3e\xaa\x0c\xe0\xbf\x1d\xa3\xd2\x9c\x34\x70\x1f\x4d\x06\xf0\xdf\
+\x0e\xf1\x27\x1e\x1b\xfa\x0f\x9e\x01\xfc\xb7\x27\xe5\x0c\xe0\xdf\
+\x0f\xa9\x66\x00\xff\xfe\x48\x31\x03\xf8\xf7\x4b\x6a\x19\xc0\xbf\
+\x7f\x52\xca\x00\xfe\xbb\x21\x95\x0c\xe0\xbf\x3b\x52\xc8\x00\xfe\
+\xbb\x25\xf6\x0c\xe0\xbf\x7b\x62\xce\x00\xfe\x0f\x43\xac\x19\xc0\
+\xff\xe1\x88\x31\x03\xf8\x3f\x2c\xb1\x65\x20\x29\xff\xa5\xf9\xb9\
+\x4b\x4d\xae\xcc\x0f\xfb\xfb\x3c\xe2\x5a\xb4\xf0\xef\x35\x03\x29\
+\xf9\x6f\xb9\xb3\xbe\x95\x97\x0c\xe0\x3f\xe9\x6a\x9d\x01\xfc\x27\
+\x5f\xad\x32\x80\xff\x5e\x54\xe3\x0c\xe0\xbf\x37\x75\xdb\x64\xa7\
+\xf8\xef\x47\x59\x3f\xdf\x9a\xec\x14\xff\xe9\x57\x53\xf7\x02\xfe\
+\xd3\xae\x36\xee\x05\xfc\xa7\x5b\x6d\xdd\x0b\xf8\x4f\xb3\x7c\xb8\
+\x17\x52\xf2\xcf\xcf\x7f\xfd\xba\x77\x3b\x4d\xc9\xff\x8e\x73\x8e\
+\x7b\xfc\xfa\x8f\x4f\xf7\x02\xfe\x0f\x47\x6c\xee\x05\xfc\x1f\x86\
+\x18\xdd\x0b\xf8\xef\x9e\x58\xdd\x0b\xf8\xef\x96\x98\xdd\x0b\xf8\
+\xef\x8e\xd8\xdd\x0b\xf8\xef\x86\x14\xdc\x0b\xf8\xf7\x4f\x2a\xee\
+\x05\xfc\xfb\x25\x25\xf7\x02\xfe\xfd\x91\x9a\x7b\x01\xff\x7e\x48\
+\xd1\xbd\x80\xff\xf6\xa4\xea\x5e\xc0\x7f\x3b\x52\x76\x2f\xe0\xbf\
+\x1d\x6d\xde\xff\x2d\xb4\x7b\x01\xff\xed\x69\xf2\xfe\x8f\x31\xb8\
+\x17\xf0\xef\x87\x7d\x32\x10\x8b\x7b\x01\xff\xfe\xd8\x25\x03\x31\
+\xb9\x17\xf0\xef\x97\x6d\x19\x88\xcd\xbd\x80\x7f\xff\x6c\xca\x40\
+\x8c\xee\x05\xfc\x77\x43\x3d\x03\xb1\xba\x17\xf0\xdf\x1d\xcf\xff\
+\xff\xd3\x22\xf4\x1c\xdb\xc0\x7f\xde\xe0\x3f\x6f\xf0\x9f\x37\xf8\
+\xcf\x1b\xfc\xe7\x0d\xfe\xf3\x06\xff\x79\x83\xff\xbc\xc1\x7f\xde\
+\xe0\x3f\x6f\x7a\xe9\xbf\x34\x8b\xe7\xeb\xa2\xde\xaa\xd5\xae\xfa\
+\xe5\x9f\xea\xa4\x82\xfb\xdf\x23\xab\x94\xe7\x8a\xe0\x75\xac\x49\
+\x69\xae\x83\xef\x21\xd3\x92\xdd\x87\xf6\x7f\x7a\x69\x2e\x42\xef\
+\x21\xd7\x92\xd7\xb2\x43\xfb\x17\x6c\x0e\x6f\x42\xef\x22\xb7\x92\
+\x9d\x87\xf6\xfe\x82\x7d\x1c\x3a\x0b\xbd\x8f\xec\xca\xee\x3c\xb4\
+\xf7\x3a\x36\x8f\x9f\x82\xef\x24\x93\x92\xc7\xdc\xd0\xbe\x37\x41\
+\x06\xf2\x75\xff\x82\x9c\x4b\xfc\x7b\xc0\x7f\xb9\x9d\x46\x76\xe6\
+\x6f\x43\x72\xea\x9e\x1b\xf2\xf3\x81\xe6\xb5\x7a\x4f\xd2\xeb\xd8\
+\xbf\xe7\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x20\x2c\x26\x7b\x1e\xab\x65\x4c\xa5\xbf\xaf\xfa\x63\xe9\xef\
+\xaa\x7e\x28\xfd\xb2\xea\x8f\xa4\x9f\x57\xfd\x60\x53\xaf\xb7\xdd\
+\xba\x1f\xbd\x4c\xfe\x10\x6f\xff\x47\xf5\x77\xaa\x5f\xce\xd6\xfb\
+\xf9\x74\xbd\x77\x1f\xaa\xfe\xc9\xa9\xa8\xfa\x47\xa7\xa2\xea\x1f\
+\x9c\x8a\x7a\x3f\x50\x9f\x5f\xa8\xfb\x2b\x66\xeb\x5f\x4f\xdc\xd7\
+\xe7\x59\xdd\x4b\x35\xaf\x0c\x50\xbf\x1e\x19\xa0\xd6\xdf\xcb\x00\
+\xb5\xde\x0d\x50\xeb\xdd\x00\xb5\xde\x0d\x50\xdf\x9f\x0c\x50\xef\
+\x65\x80\x87\x35\xff\xc7\xaa\x1f\xaa\xfe\x48\xf5\x03\xd5\x17\x7b\
+\xf6\xfa\xef\xeb\xfb\xd7\x5f\x5f\xcf\x37\x52\xd7\x33\x55\xd7\x3b\
+\x53\xfb\x50\xfb\x1a\xa8\x7d\x1e\xa9\x7d\x0f\x95\x8f\x63\xe5\x6b\
+\xa4\x7c\x4e\x95\xef\x99\xca\x83\xca\xcb\x7a\x7e\xfe\xcf\xd7\x50\
+\x7d\xfe\x7a\x3e\x9f\x54\x7e\x8d\x3b\x5a\xea\xf3\xcc\xd6\xfb\xa5\
+\x59\xef\x7f\xa9\xfe\xaf\xea\x4d\xc4\xbd\xe7\xf3\x6e\x5e\xb5\x1b\
+\xcf\xd7\x65\xd5\xbb\xf3\xf8\xae\xea\xdd\x79\xad\xcf\x73\x7d\xde\
+\xe7\xcd\x3f\x9d\x9a\x34\x2c\
+\x00\x00\x13\xcd\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x5d\x7d\x6c\x1c\xc7\x75\x9f\x3d\x52\x32\
+\x29\xc5\x32\xef\x83\x16\x6f\x8f\x32\x29\xd9\x8e\xa5\x90\xb7\x7b\
+\x67\x52\x2e\x82\x16\x36\xe1\x38\x89\x5d\xe4\xc3\x0d\x8a\x3a\x8e\
+\x0b\xe8\x9f\x06\x71\x82\x00\x71\x11\x3b\x6d\x80\x18\xa4\x3e\x48\
+\xde\x1d\x45\x59\x6d\x05\x14\x45\xfe\x88\xed\xd8\xb1\x81\xa4\x70\
+\x82\xf8\xef\x48\x7f\xb8\x70\x81\xa4\x8d\x52\x2b\xb6\x93\x20\x41\
+\xe2\x38\xb1\x44\x1e\x8f\x94\x22\xb5\x16\x45\xf2\xfa\xde\xcc\x9b\
+\xdd\xd9\xe5\x1e\xef\xc8\xbb\xe3\x1d\x79\xf3\x13\x9e\xf6\x76\xef\
+\xb8\x3b\x3b\xef\x63\xde\xbc\x99\x79\xc3\x98\x01\xff\xc6\xc6\x18\
+\xfc\xdf\xcf\x0e\x76\x18\xec\x56\xc6\xd8\x41\x20\xb8\x84\x17\xf9\
+\x75\x01\x83\x3d\x73\x13\xe3\xa4\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\
+\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xa1\
+\xa1\xa1\xa1\xa1\xa1\xa1\xa1\xb1\x55\xd1\xdf\xdf\xcf\xcc\x58\x17\
+\x4b\x20\x75\x87\x05\xc1\x67\xbc\x86\xdf\x69\x6c\x5f\x24\x62\x51\
+\x66\x46\x23\x92\x42\x40\xed\x44\x21\x79\x1d\x7f\xa3\xb1\x3d\xa1\
+\xf0\xde\x88\x0b\x62\x44\x06\x5d\xe3\xdf\x6b\x6c\x4f\x10\x7f\x0d\
+\x92\x81\xdb\x81\x26\x88\x0e\x28\x72\xd1\xe8\x62\x6a\xd4\x09\x8a\
+\x9d\x4f\x00\xfd\x01\xa8\x48\xf4\x47\xa0\x5e\xd9\x2e\x34\xba\x9c\
+\x1a\xf5\x01\xb5\xf5\x78\x7c\x82\xf8\xfe\x7f\x44\xf8\xf9\x2b\xf4\
+\x5d\x7b\xa3\xcb\xa9\x51\x1f\x28\xfc\x1f\x25\x9e\xdf\x20\x2a\xd2\
+\x35\xcd\xff\x6d\x0c\xcd\xff\xd6\x86\xe6\x7f\x6b\x43\xe1\xff\x98\
+\xe6\x7f\xeb\x41\xf3\xbf\xb5\xa1\xf9\xdf\xda\xd0\xfc\x6f\x1e\x24\
+\xa0\xae\xf7\x85\xbb\x38\x51\x5c\xa6\x4d\x89\xcd\xd5\x25\x0e\xdb\
+\x28\xff\x2f\x1e\x83\xfb\x46\x88\xc4\x3b\xe2\xbb\x86\x12\xd1\x18\
+\x33\x63\x40\xd1\xd6\x1a\x73\x50\x79\x8c\xf5\xb0\xeb\x80\x33\x2e\
+\x63\x28\x31\x3a\xb6\x17\x64\xa3\xc6\xcf\xdd\x74\xfe\xf7\x44\xc2\
+\x5c\xd6\x13\xf4\xae\x70\x34\xf0\xf3\x6d\x07\x6e\x15\x72\x8f\xb2\
+\xc1\x29\x5c\xcb\xc7\x36\x35\x4c\xa8\x93\x5b\xbb\xc2\x7c\xdc\x25\
+\x8e\xf2\x1f\x8b\xdc\x05\x75\x71\xaf\x19\x0d\xef\x8e\xc3\x77\x54\
+\x4f\xbc\xce\xf6\x46\x6a\x27\x03\x9b\xcd\xff\x78\xd8\xcb\x7b\xb2\
+\x01\xbb\xc5\xbb\x46\x0e\x26\xa2\x61\x3c\x37\x7a\xf6\x80\xfc\x47\
+\x5a\xc7\x06\x98\xd1\xb0\x1a\x8b\xff\x86\xe9\xc6\xe1\xdf\xc2\x7a\
+\x91\x7c\x90\x75\xd7\x53\x23\x3b\xa0\xf0\xff\x0b\xf4\xbc\xf7\x89\
+\x8a\x74\xad\x66\xfc\x97\x7a\x2f\xef\x49\x47\x94\xf3\x37\x95\xf7\
+\xfd\x86\xb8\x1e\x0d\xd5\xa3\xbd\x6b\x56\x28\xbc\x47\x5e\x2f\x2a\
+\xba\x88\xc7\xdf\x07\xcb\x40\xf5\xf6\x51\xb4\x2f\x28\x7b\xe1\x3d\
+\xf0\xf9\x27\x0a\x1f\x7e\x42\xd7\xf8\x6f\xaa\x7d\x8e\x63\xf3\x63\
+\x1e\xde\x1f\xa4\x77\x53\xdf\x75\x51\x79\xd7\x96\x19\x77\x22\xff\
+\x87\x91\x1d\x2c\x56\x2a\x03\xd5\xb6\x05\x09\xd1\xb6\x18\xa6\x98\
+\x07\x82\xfc\xfe\x1c\x52\x02\x3f\xf3\x6b\x51\x23\x51\xe5\x33\x7c\
+\x36\x7f\x2d\xde\xcb\xe3\xbd\xf4\x9b\xb6\xaa\x1e\xbc\x85\x80\x3c\
+\xc0\x79\x36\x40\x1d\xf0\xf9\x0d\x5f\x7d\x2c\x05\xca\x40\x4c\xe8\
+\x53\x35\x32\x60\xba\xf6\xd8\x88\x47\xc3\x4e\x5f\x83\x3e\x3b\xe7\
+\x1b\x45\x05\xbc\x5f\xf2\xbd\xeb\xff\x80\xdf\x77\x13\xfa\x7e\xb5\
+\xb0\x3b\x5b\x05\xf1\xae\x5b\xd4\x36\xe0\xae\x80\xfa\x51\x65\xe0\
+\x90\xc7\x0e\x54\x21\x03\x89\xa8\x67\xfe\x97\x61\xba\xf3\xbf\x1c\
+\xde\x27\x36\xd8\x17\x93\xbc\x0f\x68\xef\x4b\xbd\xdb\xbb\x71\xc5\
+\xf6\x47\xa3\xb7\x6c\xe8\xb9\x5b\x11\x0a\x0f\x2a\x91\x81\x77\x15\
+\x19\x68\x93\x75\xbc\xb7\x3b\x56\xf6\x39\xe9\x89\x3f\x31\x3b\x3b\
+\xc7\xac\x93\x05\x96\x9a\x80\xe3\xd4\x1c\x9e\x1b\x40\xa1\x12\x84\
+\xdf\xb1\xd4\x54\x81\xd9\xc7\x81\x72\x79\x7e\x8f\x72\xd8\xe7\x9d\
+\x57\xd8\xb6\xce\x77\x72\xfa\xbb\xad\x02\xf2\xff\xd7\xa5\x2b\x6a\
+\x7d\xf5\xae\xa1\xa7\xa9\xf1\x4b\xcc\xca\xcd\xb1\x7b\xc6\x16\xd8\
+\xc0\xc9\x19\xc9\xef\x36\xa0\xf6\x54\x06\x78\x7c\x32\xcf\x90\x52\
+\xa3\x97\x9d\xbf\x19\xc8\x5e\x66\xa9\x4c\x9e\x13\xc9\x41\x3b\xfd\
+\x8d\x91\xca\x15\xd8\x9d\x93\xe7\xe0\x7a\x81\x0d\x4d\x5d\x0c\x7c\
+\x66\x3c\x12\x91\x73\xcb\x54\xbf\xb6\x92\x77\x69\x97\xf2\xdc\x6a\
+\xf3\xce\x4a\xd8\xcb\xb5\xea\x0d\xaf\xdf\x2e\x65\xc0\x7f\xbf\x14\
+\xf0\x07\x75\xd7\x46\x1e\x66\xb8\x9e\x23\xff\xda\x06\x9e\x29\xb0\
+\x81\x33\xf0\xdd\xc4\x2c\xb3\x4f\xa0\x3c\xe4\x3b\xe0\x7a\x02\x68\
+\x10\x7e\x37\xc4\x09\x3f\x8b\x6b\x1d\xa8\xf3\x78\x9f\x81\xdc\x15\
+\x4e\xf2\x3e\x36\xc8\x94\x95\xe5\xf7\x65\x28\x13\x7e\x28\xbc\xc7\
+\x32\xbe\xb3\xc6\x3b\x78\xfd\xda\x2a\x7d\x9a\xad\x8c\x40\x7f\x29\
+\x12\x28\x03\xb2\x7f\xf0\x92\x6b\x63\x85\xfe\xa7\x9e\xb9\x2a\x6c\
+\x3c\xf2\x27\x57\x20\x7e\xe5\x43\xa9\xcc\x3c\xe8\x33\x9e\x17\xc2\
+\x70\xed\x93\x40\xd3\x40\xe7\x80\x7e\x07\x74\x0d\x68\x19\xa8\x48\
+\xb4\x4c\xd7\xf0\xbb\xb3\xf4\xdb\x4f\x00\x85\x93\x20\x57\x83\xe2\
+\xbe\x21\x71\x6f\x92\x33\x94\x83\x67\x44\xdb\x40\x71\x5d\x69\xf7\
+\x5f\xf2\x95\xb9\x6e\xfe\xec\x76\x80\x23\x03\xb1\x92\x32\xb0\xa8\
+\xd4\xe5\xeb\xa6\xeb\xbb\x39\xfa\x48\xc4\xf9\x93\x1c\x9f\x65\xc9\
+\x71\x6e\xf7\xef\x05\xfa\x36\x50\x9e\x78\xbc\xa2\xf0\xbb\x1c\xc9\
+\xdf\xce\xd1\x3d\xee\x1b\x98\x9a\x37\x06\x1d\xf9\xe2\xcf\xa2\xe7\
+\xe6\xb9\xed\xde\x07\x65\xea\x15\x65\xfb\xcf\x80\x72\x6b\xde\xaf\
+\x81\x1e\xbf\x1d\x88\x04\xca\x00\x1e\xc7\xa4\xfe\xf7\xa5\x1e\x52\
+\x79\xdf\x96\xc2\xb6\x5a\xb4\xdf\x0f\x00\xbd\xe6\xe3\x27\xea\xf7\
+\x62\x00\xdd\x20\x0a\xfa\x6e\xd9\x77\x8f\xff\x00\xfa\x68\x3a\x3b\
+\x8f\x6d\x0d\xf7\x29\x2c\x68\x67\x90\xfa\x52\x1f\x57\xf5\xff\xa8\
+\xaf\xcc\x25\xe2\x59\x9a\xf7\x2a\x7a\xbc\xfe\x80\xac\x4b\x6c\x4b\
+\xbf\x0b\xf4\x33\x5e\xaf\xb1\xf0\x0e\xbe\x76\xab\xc7\x34\xc8\x0e\
+\x1b\xc2\x57\xe3\x9f\x6f\x03\x7a\xc5\xc7\x73\xe4\xed\x12\x1d\xd7\
+\xab\xff\xea\xdf\xaa\xb2\xf0\x7d\x7a\x16\x23\x3f\x91\xf7\x19\x12\
+\x3d\x09\x11\x57\x8a\x45\x77\x90\x0c\xfc\x8c\xca\x2e\x7d\x96\xb6\
+\x5a\xc6\x32\xb7\x23\x7a\xfc\xe3\x25\xb2\x5f\x0e\xf5\x1a\xef\xee\
+\xc6\x7e\x83\xd1\x37\xfc\x29\x96\x7c\xfa\x2d\xf4\xf1\x0c\xa5\x3d\
+\xfe\x2c\xd0\x3c\xf1\x67\xc9\x47\x2a\x4f\x7f\x0b\xf4\x2a\xd0\x29\
+\xa0\xa7\x80\x1e\x27\x7a\x8a\xae\xbd\x4a\xbf\x51\x65\x25\xe8\x7e\
+\x0b\xf4\x4c\x21\x03\x99\xbc\x91\x7c\xfa\x4d\xd6\x37\xf4\x09\x1e\
+\x43\xec\xd9\xbb\x87\x8f\xe9\x91\x9d\xe7\x63\x9a\xd2\xe6\x6b\xde\
+\xaf\x0d\xac\x1f\xd3\x1b\x1f\x68\x4b\xc4\x78\x7c\xae\x0d\xf5\xfe\
+\xce\xcf\x4c\x30\x6b\xe2\xa2\x91\x02\x1f\x6f\x68\xf2\x22\xd6\x7f\
+\x4e\xd1\xf7\x25\xe2\xdd\x92\xc2\xc3\x5f\x01\x1d\x05\x1a\x06\xba\
+\x09\xdb\x6b\xd9\x6e\x48\xd8\xe3\x97\x79\x5f\xdf\x9e\x9a\x95\xfd\
+\x83\x61\xfa\x9b\x5f\x29\xb2\xa3\xde\x5b\xda\x83\xec\x20\xf4\x2b\
+\x2c\xf4\x07\xa0\x4c\x58\x36\x2c\x23\x96\xb5\x97\xca\x6c\xd6\x71\
+\x3c\x7b\xbb\xa2\x17\xf5\x1d\xfb\xc4\x11\x77\x9e\x40\xdf\xe1\x4f\
+\xb3\xe4\xd1\x5f\x73\x9b\x8f\xbc\x3f\x34\x71\x19\xf5\xff\x79\xe2\
+\xc3\x22\xf1\x46\xca\x00\x5e\xfb\x39\xd0\x23\xe0\x17\xec\x4c\xa1\
+\xaf\x0e\x34\x78\xec\x3d\xb5\x7f\x1f\x44\xa1\x91\x33\x6f\x88\xfe\
+\x84\x90\x91\x9d\x78\x0f\xa0\x0b\x8a\x2d\x58\x56\xda\x07\xbc\xf6\
+\x7c\x3a\x37\x6b\x58\x19\x11\x3f\x4a\x8e\xfd\x9a\xdb\x01\xb9\x96\
+\x90\xc7\x06\x80\xf6\xe9\x75\xa5\x1b\x06\xea\xec\x87\xc6\x17\x38\
+\x0f\x2d\xe0\x7d\x32\x87\x7a\x3a\xf7\x9c\xc2\xfb\xa2\xc2\xf7\xff\
+\x05\xfa\x9a\x9d\x2b\xec\x00\x92\xbe\x9a\x13\xcf\x41\xde\x26\xe1\
+\x7e\x87\x32\x57\x58\x1a\x3e\xa7\x41\xef\x3f\x38\x71\x0d\xfa\x8e\
+\xa0\xc7\x19\xc7\xa7\xe0\xf1\x22\x8b\x7e\x0f\xb4\x03\xe8\x49\xba\
+\xb7\xfa\x2c\xf9\xec\xe7\x6d\xb7\x0f\xc2\xec\xd3\x60\x97\x32\xab\
+\x63\x04\x1a\xeb\x87\x35\xc9\x63\x30\xec\xee\xc9\xa2\xec\x7b\xe1\
+\x31\xeb\xab\x7f\xa9\x8b\x6f\x01\xd9\xf4\x1b\x11\xf3\x03\x1e\xa6\
+\x49\xff\x2d\xe8\x1f\x94\x03\xd8\x16\xae\xfb\x96\xc7\xbf\x74\x9e\
+\x6b\xd1\x33\x82\x64\x20\x2b\x9f\x7b\xcf\x99\xdf\x88\x36\x66\xfa\
+\x72\xd9\xe7\x69\xac\x0d\x9b\x78\xa7\xf0\xe0\x31\x1f\xcf\xe5\xf1\
+\x1c\xd8\x89\x30\xb5\xef\xc2\x2f\xcf\xcd\x39\x31\xc1\x75\x3f\x37\
+\xe7\x89\x2d\x48\x39\x40\xd9\xe8\xb2\x45\x8c\x28\xa8\x0c\x8f\xd9\
+\xde\xb2\xd6\xa1\x46\x5a\x07\xa9\xa9\x79\xae\xb3\xb6\x1b\x6f\xb9\
+\xdd\x16\x31\x19\xd5\x27\xc3\xcf\x3f\x4a\xe5\xe6\x77\xd9\x53\x7f\
+\x72\xea\xde\xe2\x71\xda\xea\xeb\xdf\x22\xf9\x93\x32\x38\x34\x95\
+\x87\x36\x63\xae\x13\x9f\xa9\xd8\x01\xe9\x6b\x62\xac\xe9\x80\xd3\
+\x16\xf0\x31\x05\xdd\x0e\x6c\x14\xa2\xee\x0b\x2a\xff\xbf\xe7\xf3\
+\xc3\xa4\x9f\x17\x21\x7d\x75\xf4\x0e\xed\x77\xad\x60\x67\xf2\xaa\
+\x2d\x90\x71\x9f\x08\x3d\x5b\x8d\x35\xe0\xe7\xef\xd2\xf8\x83\x13\
+\x23\xd4\x58\x3f\x86\x4f\xa2\x0f\x35\xab\xf2\xf4\x21\xa5\xae\xa5\
+\xbe\xa1\x3f\x96\x96\x7c\x91\x7a\x7a\xa8\x0e\x75\x9e\x56\xe2\xfe\
+\x4a\x99\xee\xb6\x5d\x9f\x50\xf6\x3f\x8a\x54\x56\xf1\x3b\x90\x85\
+\xf4\x89\x99\x9a\x97\x67\xbb\x03\xf5\x17\xf5\x3f\x3d\x99\x37\x80\
+\x98\x68\xdf\x3d\xf1\x18\xfc\xfc\x14\xd5\x73\x7b\x8a\xfa\xf5\x87\
+\x6a\xa8\xf7\x7e\xdc\x7d\x6a\x5e\xd8\x96\x8c\x13\xfb\xc3\xe3\xd7\
+\x02\xca\x75\xce\x12\x63\x52\xa2\xff\x10\x30\x5e\xa8\xb1\x36\x28\
+\xae\x27\xf5\xec\x7e\x45\xf7\xa5\x8e\xfd\x14\xf8\xb0\x73\xdf\x93\
+\x57\xa4\x7f\xc6\xc7\x00\xeb\x0d\x65\xcc\xc9\xf8\x8b\xa7\xdf\x83\
+\xf6\x1d\x63\x4a\x73\xe7\x03\x6c\xd3\xfd\x4e\x7b\xa1\xdb\x80\x75\
+\x61\x70\xfc\x12\xd7\x19\x85\xff\x32\xce\x73\x43\xd1\xb1\x47\xdd\
+\xf6\xb8\x50\xd3\xf6\xbe\x1c\xd0\xaf\xb4\xa7\x3c\xed\xc0\xe7\x14\
+\x1b\x20\xfd\x80\xe7\xd4\x76\xa9\x92\x79\x44\x1a\x02\xa2\xde\x0a\
+\x34\xc6\x53\x88\xc2\xf9\x25\xa5\x7e\xf1\xf8\xb6\x95\xcd\x77\x24\
+\xb3\xb3\x8e\xee\x37\xa6\x8c\x3c\x16\x89\x31\x03\x8c\x19\xff\xc2\
+\x57\xc6\x8b\x40\x51\xf9\x3b\x8c\x2f\x6b\x54\x06\xea\xc3\x4b\xdd\
+\xfa\x74\x80\x8f\x7d\x4c\xb6\xfb\x32\x56\xb3\xd9\x10\x73\x4b\x3c\
+\x7e\xc0\x31\xc5\x46\xc9\x36\xea\x53\x8e\x0d\xc8\xe8\x36\xa0\x52\
+\x28\x31\x1c\x3c\x9e\x52\xea\x55\x8e\xc9\x1d\xa6\xef\x42\xa9\x06\
+\xb6\xad\xbe\x7e\xde\x3d\x4a\xf9\x64\x59\x4f\xba\x32\xb2\x7d\xf5\
+\x3f\x5e\x3a\xaf\x66\xa5\x64\x98\x34\x37\x3b\x1e\x0d\x4b\x1f\x4b\
+\xd6\xab\xf4\xfb\x65\x9c\xf5\x37\x36\xce\xd3\x23\xbb\x9a\xdc\x40\
+\x6c\xaf\x56\xa0\x3e\x87\x6c\xa7\x3a\xa8\x6c\x6a\x59\xcf\x72\x19\
+\xc1\xb1\x21\xf0\x19\xcc\xd2\xf3\xcf\x2b\xa5\x90\xcc\x59\xd9\xdb\
+\x24\x6b\x86\xef\xb8\x43\xac\xe5\x4e\x44\xf8\xb8\xbd\x01\x47\x83\
+\x7f\x8e\x94\x9f\xcf\x2a\xeb\x22\x41\xf9\x37\xe5\xb9\xed\x8c\xbb\
+\x14\x30\xce\xf6\x8e\xaf\x4e\x7f\xe8\xd8\xd4\x4d\xf0\xf7\xcb\xc1\
+\xf2\xf6\x53\x5e\xf5\x95\x15\xe7\x13\x76\x4a\x59\xf5\xf2\x3e\x5c\
+\xf1\x7a\x13\x7f\x9e\x52\xf9\x77\xcd\x90\xaf\x98\xeb\x6c\x78\x0f\
+\x53\xca\x75\x1b\xd0\x57\x69\x0e\xcc\x68\x19\x3a\x06\xf4\x45\xd0\
+\x8b\x88\xd0\x8d\xa8\x61\x86\xc3\xaa\xee\xe3\x9c\xdc\xab\xbe\x3a\
+\x9d\x76\x6c\x6a\x13\xb4\xa9\x56\x6e\x2e\xa8\xad\x92\x65\xc5\xb2\
+\x9b\xb2\xad\x32\xbb\xc2\x6a\x3d\x85\xc5\xbb\xf3\x3a\x28\x57\x4f\
+\x47\xa9\x4e\xfb\xa4\xfc\x24\xc2\x1d\x3c\x6f\x75\x33\x40\x99\xe3\
+\xd0\x6f\x8a\x5c\x9a\x38\xef\x6d\xc5\x74\xd7\x57\x96\xa2\x65\xd3\
+\x59\x7f\xc9\xd7\x45\xf3\x77\x53\xf8\x8f\xf3\xb2\x57\x7c\x75\xea\
+\xc4\x7c\xd2\x4d\x10\x57\xb1\xb2\xf3\x41\xb1\x20\x59\x56\x2c\xfb\
+\x80\xc3\x7f\x5a\xfb\x0f\xb4\x0b\x3e\xff\xd8\x57\x07\x6b\x91\xac\
+\xcb\xf7\x80\xf6\xcb\x76\xb6\xd1\xef\x8e\x48\x74\x77\xa9\xf3\xf7\
+\x8f\x9b\x6e\x5e\xcd\x1b\x15\x10\xce\x91\x94\xeb\xaf\x1f\xa5\x7b\
+\xa8\xe3\xad\xc3\x4a\x3d\x4a\x9f\xea\x71\xc9\xff\xd4\xc9\xc6\xf3\
+\x3f\xed\xed\x03\x3c\xae\xf8\x7f\x52\x6e\x87\x14\xfe\xcb\x7a\x7a\
+\xd4\x74\xd7\x9f\x2f\x56\x58\x57\x32\x4f\xe9\x71\x59\x4f\x98\xbb\
+\xbe\xd1\xa0\x9c\xea\x8d\xe1\xff\x64\x13\xf0\x5f\xcc\x45\xd9\x4c\
+\xfe\x9f\x68\x26\xfe\x23\x14\xfb\xbf\x7f\x83\xf6\xff\xc7\x60\x13\
+\x77\x27\xd6\x69\xff\x1b\xd9\xf7\x93\xa0\x38\x65\xc5\xf6\x9f\xfc\
+\x9c\xed\x63\xff\x71\xed\x72\xf8\x03\xaa\x5f\x83\x3e\x8a\xdf\xff\
+\x1b\xf3\x91\xcf\xff\x03\x5f\x28\x46\xeb\xb2\xbb\x5c\xff\x2f\xb5\
+\x15\xfc\x3f\x6f\xac\x62\x3a\xc0\xff\x4b\xac\xf2\xff\x62\x25\xfd\
+\xbf\x52\xf5\xb4\xda\xff\x8b\x34\x87\xff\xd7\xdb\xdb\x5b\x75\xff\
+\xcf\xdc\x60\xff\xcf\x6e\x02\xfd\xb7\x72\x65\xfa\x7f\xb9\x7c\x27\
+\xc5\xb3\x8c\x52\xef\x5b\x0e\xa5\xfa\x7f\xa6\x69\x6e\xc2\x1b\x96\
+\x47\x6d\xe2\x3f\x4e\x2c\x40\x8c\xaf\x64\xd6\x88\xff\xe0\x98\x9b\
+\x88\xbd\x19\x56\x6e\xbe\x61\xef\x2d\xe6\x26\x15\xd6\x8c\xff\x60\
+\xdc\x17\xd7\x1d\xa3\x9c\xd4\x22\xfe\x23\xff\xbe\x59\xe2\x3f\xf5\
+\x80\x95\x0d\xec\x53\xab\xf1\xdf\x61\x69\x53\x1b\x19\x57\x75\xcb\
+\xc0\x8f\x87\x95\xf2\xc9\xb2\x3a\x6d\x55\x4a\x8f\xff\x54\x8c\x12\
+\xe3\x3f\xea\xd8\xea\x51\x5b\x95\x91\x06\xf8\x01\xb6\x3b\x0f\xa0\
+\xa2\xf1\x1f\x1c\x2f\xd6\xa8\x0c\xb6\x3b\xe7\x16\x6d\x41\xcc\x0e\
+\x1a\xff\xcd\x15\x6e\x42\xdb\x2f\xec\x6f\xe3\xc6\x7f\x29\xdf\x00\
+\xda\xfe\xb7\x7d\x65\xf4\x8c\xff\x36\x43\x5f\x65\xab\x60\x20\x37\
+\x23\xe7\x58\x05\xcd\xff\x90\xba\x25\xd7\xdf\xb5\x25\xa1\x6d\xb5\
+\x36\xd1\x06\x60\xfb\x34\xe8\x2d\xdf\xa3\x01\x36\x4a\xae\x09\x69\
+\xc3\xb1\x62\xab\x44\xee\x10\x8d\x60\x58\xde\x36\xe0\x23\xf6\xea\
+\xf9\x5f\xff\x9d\x9a\x9c\xdb\xd9\xf9\xfa\x05\xb9\x16\x94\xcf\x15\
+\xae\x7f\xb9\x9c\x71\x7f\xe3\xe1\xe3\x57\xb0\x8f\x8a\x6b\xc4\x7e\
+\x1a\x50\x3e\x67\xfe\xd7\x66\x94\x6b\xbb\x41\xce\xb3\x03\x39\x30\
+\x48\x16\xce\x29\x3a\x26\x6d\xec\x93\xae\x7f\x25\x7e\xff\xa1\xe9\
+\xab\x75\x2b\x53\x72\x4a\xf0\x3e\xe5\x6d\xf7\x9f\x0a\x28\xd7\x39\
+\xe1\xc3\xe4\x65\x3f\xb6\x6e\x65\xda\xae\x48\x8f\xcf\xb0\x74\xc6\
+\x63\x03\xfe\x52\xd1\x31\x19\x13\xc4\x9c\x2d\xab\xe6\x7f\x27\x4f\
+\x5d\xab\x79\x79\x06\xb3\xde\x35\x00\x74\xc4\x67\xaf\x3d\xff\x7b\
+\x02\xca\x74\xe2\x52\xcd\xcb\xd3\x0a\xb0\x45\x1c\x00\x8f\x21\x5a\
+\xdf\xf1\xef\x8a\xae\xc9\xba\xbe\x60\xe7\x0a\x61\x7b\x6a\x5e\xe5\
+\x0b\xab\xa5\xbf\xe5\xcb\x33\x23\x9f\xe1\x5f\xff\x21\x75\xff\x7b\
+\xb6\xda\x2f\x6c\x82\x39\x0a\x5b\x15\x29\x31\xb6\xaa\xf6\xb1\x4b\
+\xae\xff\x4a\x67\xe7\x3b\x87\xdc\x7c\x5d\x0e\xbf\xaa\x05\xe6\x0c\
+\xa4\x18\x0e\xbf\x77\xfa\xe4\x65\xcc\xff\x55\x6a\xfd\x17\x96\xcd\
+\x59\xff\x65\xf1\xf5\x5f\x8d\x8b\x4f\x6d\x07\xd8\xd4\xbf\x57\xf8\
+\xfa\xb7\x76\xf0\xda\xcb\xb3\xd0\xce\x76\x29\xe3\x31\x86\x23\x07\
+\x1b\x58\x83\x47\xfc\x96\xeb\x40\xf9\xfa\x4f\x31\xd7\x54\xaf\xff\
+\xdc\x4c\xd8\x13\x62\xfd\x77\xec\x8c\x67\xfd\xb7\xcc\xf9\xe1\x5f\
+\xff\xfd\x26\x50\x52\xe1\x01\xe6\x06\xe2\x79\xa1\xf8\xba\xee\x0a\
+\x62\xc5\xb4\xde\x54\xf8\x78\x99\x35\xd7\x7f\xdf\xf0\x95\xc1\x59\
+\xff\xfd\xe1\x7f\x2b\x0a\xdf\x75\xf2\xca\x26\xd4\xd0\xf6\x07\xfa\
+\xd2\x03\x99\x05\xb2\xe9\xf9\x90\x3d\x39\xa3\xc6\x04\x82\xf2\x3f\
+\x80\x4f\x9e\xdf\x81\x76\x23\x25\x7c\x70\x37\x9f\x27\xe9\xe5\x9f\
+\x7f\xe9\x1d\xb0\xed\x3c\x6e\xcf\xee\x3d\xfa\x47\x3e\x8f\x2b\x9d\
+\xf5\xe6\x7f\x80\x3e\x85\x91\x06\x99\x81\xeb\x98\xff\xe1\xab\xb6\
+\xf0\x37\xd5\x67\x39\xf9\x1f\x78\xbb\x90\x2d\xf0\x76\xea\x70\xae\
+\xb2\x5c\x03\x1a\xc1\xe8\x73\xf7\xca\x71\xc6\x16\x0f\x7c\xf8\x31\
+\x66\x1d\xff\x1d\xc5\xdc\x66\x43\xc3\xd3\x57\xcb\xe5\x7f\xc1\x9c\
+\x2d\x7f\x03\xed\xc1\x4e\x69\x8b\xd3\x53\x9e\xfc\xae\xab\x08\xf3\
+\xf8\xec\x3f\xce\xfb\x6d\x9c\x7f\x40\x3b\xf9\x3d\xb2\x73\x6f\xd8\
+\x5e\xbf\xd3\x93\xff\x25\x39\x39\x6f\x70\xb9\xc4\xf1\xa8\x13\xbf\
+\x67\xfd\xf7\xfd\x9d\xbb\xdf\x0f\x51\x6f\x57\xe3\xc7\x6a\xb7\x02\
+\x82\xf2\x3f\xc5\x63\x94\x07\xaa\x27\x61\x7c\xf0\xb3\xff\x04\x76\
+\xf5\x92\x81\x63\x6a\xc3\x13\x7c\xee\xcd\x94\xed\xf5\xc1\xfd\xf9\
+\x9f\x7e\x09\x34\x06\x34\x64\x61\xfe\x27\x8a\x13\x0c\x28\x6d\xf3\
+\xd0\x38\xae\x1d\x04\x7e\x63\xfe\xa7\x5c\x1e\xd7\xf3\xe1\x9c\x9d\
+\x4a\xf2\x3f\xe5\x70\x6d\x6f\x0a\x7d\xbd\xc9\x8b\x50\xb6\x7f\x61\
+\x89\x78\xaf\xc8\xfb\x14\x73\xf6\xb4\xd2\xf9\x9f\x2a\x04\xcf\xff\
+\x26\xf6\x05\xe0\xbc\xc7\xdc\x69\x22\x6f\x5a\x94\x45\xc4\x3e\x61\
+\xc6\x1d\x1f\xfb\x7b\xd7\x0e\x88\x5c\xaf\x32\xfe\xba\xa0\xe8\xe8\
+\x5a\xf9\xdf\x70\xfe\x00\x8e\xcb\x61\xec\x48\xe6\x7f\x7b\x92\xae\
+\xfd\xd0\xae\x2c\xff\xdb\x65\x5b\x59\x7f\xc8\xf5\xfe\xd8\x6f\xd9\
+\x1d\x1f\xfd\x32\xdf\x4b\xe0\x03\xb7\x44\x65\xee\xb7\x80\xfc\x6f\
+\x5a\x06\x82\x50\x22\xff\xe3\x01\xa0\xef\x98\x62\x7e\xf0\xd7\x13\
+\xdd\x3c\x17\x1c\xd7\x31\x9b\x8f\xfd\xb8\x79\x59\x80\xfa\x6c\x91\
+\x9b\x51\xf2\xad\x5e\xf9\x1f\x7f\x40\xcf\x72\xfb\x19\x53\xf3\x58\
+\x26\x66\x76\x87\x59\xbc\x9b\x97\xfd\x1f\x68\x7e\xd7\x4b\xf4\x0e\
+\xbe\xfc\x8f\x5a\x06\x54\xac\xca\xff\xba\x3a\x17\xb8\xcc\xa5\xfa\
+\x8f\xb2\x2e\xf7\xff\xd9\x5f\x7b\x62\x32\x16\x9f\x0b\xc2\xdb\x83\
+\x8f\xd9\x22\x57\xab\xca\xcf\x6a\xf2\xbf\x4a\xb9\x79\x1d\xe8\xe3\
+\xa9\x29\xcc\x15\x58\x90\x3e\x22\x7f\x7e\xff\xe1\xcf\xa8\x32\xfb\
+\x75\x5f\x99\x75\xfe\xd7\x35\x50\x61\xfe\xe7\xeb\xf4\xf9\x35\x31\
+\x87\x26\xc6\xf7\x71\xb2\xbd\x31\x59\x9e\xff\x39\xfd\xcd\x59\x96\
+\x7e\x8e\xfb\xfc\x98\xff\xf9\x05\x7b\xed\xfc\xcf\x2b\x6b\x5c\x97\
+\xf1\x1c\xbc\xc7\x7d\xe9\x53\x0b\x46\x7a\xda\x89\x31\x2a\xf9\x9f\
+\xe7\xc4\xfe\x7d\x61\xb0\xf3\xc2\x67\x7d\x8d\xca\x7a\xbd\xa4\x0c\
+\xe8\xfc\xcf\x1c\x1b\xc8\xff\xfe\x82\xd3\x3e\xd0\x7e\x89\xd6\xc4\
+\x55\x45\x06\xdc\xfc\xef\x62\x5c\x9e\xe7\x72\xc3\xfc\xef\x38\x0f\
+\x03\xe7\x11\xe1\x18\x12\xce\x27\xbc\xe6\xe3\xfb\x0a\x5d\x7b\x87\
+\x7e\x33\xcd\xff\x26\x33\x17\x49\xe2\x58\xaf\x22\x5f\x3c\xf7\x0f\
+\xc9\x1d\x3e\x9b\xbf\x87\x98\xd7\x25\xf5\xff\x45\x5f\x99\x75\xfe\
+\xf7\x00\xd4\x7a\xff\x07\x0b\xe3\xff\x39\xdc\xbb\x25\xaf\xe6\x66\
+\x68\x4b\x9f\x5c\x80\x7e\xdf\x3c\xdf\xd3\x45\xe8\x2f\x9f\xa7\xd7\
+\x0b\x34\x08\xb2\x31\x6c\x89\xb9\x64\x83\xf0\xb7\x89\x54\xae\xd0\
+\x91\x3a\x0d\xbf\x99\x2e\xb0\x54\x06\xfc\xfa\xdc\x25\xe7\x3e\x3c\
+\x97\x64\x4e\xc4\x03\x93\xb9\x85\x55\xef\x63\xea\xfd\x1f\x2a\x46\
+\xb5\xfb\xbf\x98\xdd\x70\xec\x0e\xae\x33\x1b\x7d\x00\x9c\x0f\x72\
+\xfc\x22\x4b\x4d\x2f\x78\xe3\x39\xd8\x4f\xe3\xf9\x1d\xf3\xec\xb0\
+\x32\x26\x7b\x98\xe7\x1a\xca\xf3\x3e\xa0\xed\xdb\xff\xe5\x6e\xb8\
+\xdf\x9e\xa7\x6f\x88\xf8\xc1\x44\xf0\x38\x5e\x4f\x2c\x06\x7e\x5f\
+\x4c\x95\x81\x8a\xf7\x7f\x91\xf5\x80\xeb\x9e\x5b\x05\x0a\xef\x37\
+\xbc\xff\x53\xa2\xab\xfc\x7e\x59\x43\xe3\xb3\x3c\xae\x37\x0c\xba\
+\x2c\xf3\x49\xd9\xde\xfd\x9f\xda\x94\xf6\x5c\xc4\x6f\xb2\x22\x8f\
+\x90\x3d\x35\xc3\xc7\x1d\x70\x2e\x52\xd9\xf7\x11\xfb\x99\xf9\xfb\
+\x2e\x95\xca\x80\xb3\xd7\x6d\xab\x20\xde\x75\x33\xf1\x3e\xba\x1e\
+\xde\x6f\xca\xfe\x6f\x66\x05\xeb\x16\x82\x50\x41\x1f\x26\xe8\xdd\
+\x9c\xfd\xdf\xcc\x16\x8a\x0f\x9a\xee\x3a\xa8\x4e\xf8\x7c\xc1\xf4\
+\xee\x89\x58\xb7\xb6\x52\xe5\x3d\xc6\x69\xd0\xe6\x8a\x3d\x1b\xd6\
+\xb7\x1e\xa3\x14\xd6\x21\x03\xf2\x5d\xdf\x48\x74\x47\x3a\x68\x0f\
+\xf0\x96\xd9\xff\x51\xb1\x91\x1f\x31\xbd\xbe\x72\xf0\xfe\xaf\x35\
+\xf2\x95\x71\x6f\x57\x9e\x63\x20\xea\xdd\xff\x15\x74\x7e\x0f\xf5\
+\xdd\x8c\x9e\x68\x75\xcf\xa8\x40\x06\x6e\xf8\xde\xf9\x7e\xd9\x6e\
+\x54\xf5\xe0\x2d\x04\xa5\xdd\xb7\x4c\x77\x6d\x63\x5d\xf7\xfe\xa5\
+\xe7\x96\xda\xff\xf9\xbf\x40\x26\xf6\x90\x5c\x54\xbf\xff\x33\x8f\
+\x63\x57\xb4\xff\x33\xbe\x7b\x52\xb6\x01\x55\xbf\xe0\x16\x81\xd3\
+\xe6\x89\xe3\xb8\xc2\x87\xb7\x83\x78\x5f\xab\x3d\x53\x14\x5e\xd4\
+\x7d\xff\xf7\xbd\xa5\xf7\x00\xff\x85\xf2\xbe\xe3\x64\xfb\x43\x1b\
+\xf5\x3b\xb6\x22\x70\x1f\xee\x68\xaf\x89\x47\xa3\x57\xac\x89\x45\
+\x1d\x78\x00\xe8\x66\xda\xf3\xa3\x2e\xfb\xe5\x28\x7c\x18\x55\xf4\
+\x50\xea\xe2\x68\x2d\xf9\x8f\x10\x32\x10\x95\x7e\x67\x48\xc4\x89\
+\xa2\x37\xd3\xbb\x26\xcd\xee\x3d\xf0\x5d\x97\x11\x8e\xc5\x79\x9d\
+\xb4\x0a\x14\x3f\x8c\xd7\x4b\x4f\xc4\x89\x07\x18\x66\x1d\xc7\x4b\
+\x37\x9b\xff\x08\xe5\xdd\xa4\xcd\x13\x7e\xa6\xb8\x1e\x52\xeb\xa2\
+\x55\x10\xa1\xb9\x1d\x71\xd4\x6f\x65\x9c\xdf\x54\xfb\x61\x75\xa8\
+\x8f\x46\xf0\x5f\x3c\x77\x55\xbf\x93\xcf\x0b\x88\x47\xa2\xce\x77\
+\x91\x16\xb2\xff\x8d\x82\xc2\xff\xb1\xcd\xe4\xbf\x46\x73\x40\xf3\
+\xbf\xb5\xa1\xf9\xdf\xda\xd0\xfc\x6f\x6d\x34\xca\xff\xd3\x68\x0e\
+\x68\xfe\xb7\x36\x34\xff\x5b\x1b\x0a\xff\x9f\x30\xdd\x3c\xa5\x32\
+\xaf\xe6\x13\x9a\xff\xdb\x1b\x4a\xbc\x2d\x01\xf4\x07\xd3\x8d\xc3\
+\x63\xce\xd2\x5e\x19\xa3\x6b\x74\x39\x35\xea\x83\xb8\x1b\x7f\xc3\
+\x23\xce\xcb\x9f\x20\x92\x73\xf4\x8d\x78\x0b\xc5\x61\x5b\x0d\x6a\
+\x0c\x36\x11\x0d\x23\x31\xa2\x9a\xcc\xff\xd0\x68\x6e\xf4\x94\xce\
+\x53\xea\x8c\xc3\xe0\x6f\x34\xb6\x2f\x70\xcf\x14\xcc\x9b\xcc\xa9\
+\x3b\x2c\x88\xce\x9b\x61\x3f\x15\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\
+\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\
+\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x8d\xf5\xa2\xa8\x81\x58\x19\xf5\x9e\
+\x5f\xb5\xbd\xe7\x97\xfe\xd5\x7b\xfe\xee\x5d\xde\xf3\x8b\x7b\x9b\
+\xe7\x7c\x79\xb7\x38\x3f\x7f\x56\x9c\x2f\xde\x29\xce\xbf\x73\x84\
+\xce\x73\xe2\xfc\xaf\xe8\xfc\xfa\x8e\x51\x3c\x5f\x79\xf6\x5b\xf4\
+\x7d\xe8\x2c\x9e\x2f\x8f\xc8\xdf\x1b\x47\xf0\x7d\x17\xc7\xe4\x39\
+\x7b\x05\xeb\xe3\x1a\x93\x7f\xcf\x1e\xc1\xfa\x9a\x61\xf2\xef\xc7\
+\x06\x8a\xe7\xda\x8a\x17\x0c\xfa\x7e\x79\xa4\xfb\xfd\xdd\xe7\x8f\
+\xbc\x1c\xa2\xf2\xac\x3c\xbb\xfb\xe2\xe9\xce\xbd\xe7\xe1\xb1\x02\
+\x0f\x77\x3e\xc7\xd8\xf8\xe9\x5d\xf2\x05\x5e\xee\x78\x90\xb1\x48\
+\x57\xb7\x3c\xbf\xd0\xd9\xc5\x58\xc7\xe9\x01\x79\x3e\xb3\x6b\x84\
+\xb1\xd0\xc3\x8f\xc8\xf3\xab\x2f\x8c\x31\x66\xdc\xe9\xb0\x6c\xb1\
+\x93\x75\x9e\x66\xa7\x8f\x38\x15\xd2\xc5\x46\x42\xac\xe3\xac\x53\
+\x43\x27\x8c\xb6\x73\x63\xfb\xdd\x1a\x7b\xb9\xfd\xc8\x62\x7f\xb7\
+\x7b\xfe\x70\xe7\xe8\x8a\x5b\x9c\x62\xb1\x3f\x56\x2c\x1e\x6c\x77\
+\x4e\x57\xfa\xa1\x28\x17\xda\x47\x9d\xf3\x11\x28\xca\x4c\xc8\x39\
+\x5f\x1a\x79\xa5\x58\xbc\x16\xba\xcf\x39\x1f\x83\x9a\xb9\x6e\xb8\
+\xe7\x47\xa1\x68\x8b\x47\x9d\xf3\x65\xfc\x6a\x69\xcc\x29\xdf\x75\
+\xbc\xd5\xca\xc8\xb7\x82\xcf\xcf\xb3\x43\x21\x3c\x8e\x9c\x61\xbb\
+\xf1\xf8\xe2\xca\x3f\xf3\xa2\xf5\x3f\x34\xfa\xa2\xf8\xfe\x80\x38\
+\x7f\x40\x7c\xff\x2c\x8b\x88\xf3\x07\xd9\x0e\x7e\x64\x11\x7e\x7c\
+\xf6\x41\xd6\x1e\x74\xee\xff\xbd\xff\x7e\xab\x9f\xe7\x2d\x4f\xb9\
+\xf2\xaf\x7e\x5f\x7f\x7d\x2c\x8d\xf5\x79\xeb\xcb\x57\x9f\xfe\xfa\
+\xf6\xf3\xc3\xcf\xaf\x55\xfc\xf4\xf3\xdb\x27\x0f\x7e\x79\x01\x79\
+\xda\xad\xca\xd3\xd5\x13\x28\x6f\xfb\x1d\x79\xf3\xcb\xa3\x5f\x5e\
+\xfd\xf2\xec\x93\x77\xbf\x3e\xf8\xf5\xc5\xaf\x4f\xab\xf4\xcd\xa7\
+\x8f\xab\xf4\xd5\xa7\xcf\x7e\x7d\x7f\x5f\xda\x83\x3e\xfa\xfd\xe7\
+\xbd\xf6\xc2\x6f\x4f\x10\xcd\x64\xef\x10\x7e\x7b\xec\xb7\xd7\x7e\
+\x7b\xee\xb7\xf7\x2d\x8b\xff\x07\x3e\xdd\x87\x0a\
+\x00\x00\x0e\x66\
+\x00\
+\x01\x08\x3e\x78\x9c\xed\x5d\x0b\x6c\x5c\x47\x15\x7d\x6f\xed\x38\
+\xce\x87\x36\x76\x94\x26\xcd\xd7\x63\xe7\xe3\xc6\x10\x17\x82\x80\
+\x12\x20\x06\x12\x29\x11\x12\x0d\x6a\x55\x22\x01\x0a\x08\x04\x12\
+\xa8\x82\x4a\x50\x28\x02\x6c\x21\x0a\x6a\x23\x91\xd0\x16\xb5\xa8\
+\xa8\xb1\xa0\x21\xe1\x23\x21\x7e\x82\xa0\xb4\x21\x50\x95\x36\x42\
+\xa0\x46\xe5\x53\x01\x05\x42\x28\x69\x45\x4a\x71\x53\xa8\x1d\x7b\
+\x97\x7b\xdf\xdc\xfb\xde\x9d\xc9\xee\x7a\x77\xfd\x76\xdf\x67\xe7\
+\x44\x37\x6f\xef\xdb\xdd\xe7\x99\x39\x77\xee\xcc\xdc\xf9\xac\xe7\
+\xf9\xf0\x6f\x6c\xcc\x83\xff\xfb\xbc\xc1\x6e\xdf\xbb\xc2\xf3\xbc\
+\x41\x10\xb8\x85\x37\x83\xfb\x1a\xbe\xf7\xdf\xd7\x6a\x71\x70\x70\
+\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\
+\x70\x70\x70\x70\x70\x70\x70\x28\x87\x75\xeb\xd6\x79\xfd\xfd\xfd\
+\xde\xc0\xc0\x40\x70\x55\x4a\xf9\x4e\x9a\x2a\x9e\x94\x24\x61\xa5\
+\xa5\x03\x65\xc3\x86\x0d\xde\xe6\xcd\x9b\x03\xbb\x70\x88\x07\x56\
+\x39\x17\x48\x02\x1d\xeb\x5c\x12\xe8\xeb\xeb\xf3\xd6\xae\x5d\xeb\
+\xad\x5e\xbd\xda\x93\xe9\x01\xe9\x06\xe9\x01\x59\x42\xd2\xe3\x64\
+\xce\xc2\xe5\x78\x39\xfa\x00\xac\x5b\x58\xfe\x2c\x49\x70\x6f\xd5\
+\x7b\xbc\x6e\x05\xf9\x16\xc8\x19\x90\x67\x9d\x34\x45\xfe\x0d\xf2\
+\x53\x90\x3e\x2a\xf3\x42\x12\xf5\x1f\xff\xf6\x9a\x35\x6b\x64\xbd\
+\x7f\x37\xc8\x0c\x48\x09\xa4\x48\x57\x27\xf1\xcb\x34\x5d\x1f\xa0\
+\x3e\x97\x9f\x44\xfd\x27\x1b\x60\xee\x5f\x05\x72\x91\xd2\x75\x91\
+\xec\xa0\xe8\xa4\x29\xc2\x65\xfb\x1c\xc8\x95\x54\xfe\x2d\x5f\xcc\
+\xa5\x4c\xbf\x7f\x44\x70\x9f\x74\xfd\xc8\xbb\x4c\xd1\xf5\x8f\x50\
+\xef\xe7\x53\x3b\x9c\x04\xff\xbe\x8a\xfa\x7a\x4f\x52\x9a\x66\x9a\
+\x94\x67\x27\xba\x6c\xd9\xf7\xa3\x0d\x5c\xa7\x44\x1d\x4c\x90\x7f\
+\xec\x97\x3e\x4b\xe9\x72\xed\x7e\xf3\x78\xe7\xb2\xfd\x1e\xc8\x46\
+\x15\x8d\x03\x13\xe9\xff\x3b\xfe\x9b\x2e\x45\xe2\x9d\x7d\xea\xe3\
+\x20\xbb\x68\xbc\x87\x65\x5f\xe0\xb1\x9f\x72\xf5\x3f\x6f\x32\xad\
+\x22\x5f\xff\x2f\x90\x0f\x43\x5f\xbf\x8b\x62\xab\xe8\xef\xc3\x7a\
+\x9f\x54\xec\x47\xf0\xdf\xe3\xf8\x8f\x4d\x64\x1b\x8f\x7d\xe9\x7b\
+\x40\x96\xab\xc8\xd7\x77\x20\xdf\x64\x07\x89\xf8\x7d\xc7\x7f\x53\
+\x84\x7d\x3d\x97\xdf\x83\x20\xaf\x90\xbc\x2b\x2b\xee\x9f\x34\x1c\
+\xff\xb1\x89\x6c\xe3\xff\x0c\x72\xbd\x68\xd7\x43\x5f\x9f\x16\xde\
+\x19\x8e\xff\x58\x78\x67\x5f\xff\x3c\xc8\xa7\x40\x16\x2a\x31\x8f\
+\x26\x79\x4f\x13\xf7\x08\xc7\x7f\xc3\x22\xdb\x78\x94\xc3\x20\x6b\
+\x95\xe9\xeb\x43\xce\xd3\x3a\x87\xea\xf8\xaf\x5b\xec\x36\xfe\x51\
+\x90\xd7\x51\x19\xfa\xca\x6a\xe3\x93\xec\xdb\xd5\x02\xc7\x7f\x5d\
+\x22\xdb\xf8\xa7\x40\xde\x33\x30\x30\x50\xb0\xc7\x73\xa8\xa7\x9d\
+\x77\x86\xe3\xbf\x26\x91\xbe\xfe\x7f\x20\xb7\x2b\x1d\x2f\x31\xda\
+\x78\x8e\xe1\x24\x35\x96\x6f\x04\x8e\xff\x9a\x79\x47\xf9\x3e\xc8\
+\x26\x95\xe2\xf1\x5c\xbd\x70\xfc\x97\x95\xd9\x62\xb6\x99\xe7\x9d\
+\xe1\xf8\xbf\x44\x6a\x8a\xd9\xb2\x0c\x0d\x0d\x25\x4d\xe1\x9c\xe0\
+\xf8\x0f\x25\x33\x31\xdb\x38\xe1\xf8\xcf\x5e\xcc\x36\x4e\xb4\x39\
+\xff\x99\x8c\xd9\xc6\x89\x36\xe5\x3f\xd3\x31\xdb\x38\xd1\x66\xfc\
+\xe7\x22\x66\x1b\x27\xda\x84\xff\x5c\xc5\x6c\xe3\x44\x1b\xf0\x9f\
+\xbb\x98\x6d\x9c\xc8\x31\xff\xb9\x8d\xd9\xc6\x89\x1c\xf2\x9f\xfb\
+\x98\x6d\x9c\xc8\x11\xff\x6d\x13\xb3\x8d\x13\x39\xe1\xbf\xae\x98\
+\x2d\xee\x77\xe4\xfd\x36\x55\x24\xec\x0b\x0e\x0f\x0f\x7b\x2b\x57\
+\xae\x0c\xce\x45\xc8\x1b\x32\xce\x7f\x5d\x31\x5b\x21\xbe\xfd\x1e\
+\x83\xe3\x3f\x38\xf6\xa3\x67\x74\x92\x04\xfe\x03\x3f\xbf\x71\xe3\
+\xc6\xf0\x59\x5b\xb7\x6e\x4d\x90\xbd\xb9\x23\xa3\xfc\xd7\x1d\xb3\
+\xb5\xb8\x67\x7f\xd0\xa5\x2e\xdd\x93\xff\x12\xba\x5f\xee\xbb\xfc\
+\xfd\xd0\x1e\xb8\xff\x98\xd5\xb1\x43\x06\xf9\xaf\x3b\x66\x2b\xce\
+\x38\xf0\xa9\xbe\x63\xac\xef\xf3\x20\x7f\x51\xe6\x7e\xfc\xf3\x20\
+\xe7\xe8\xb9\xbf\x01\x39\xa6\xb4\x4f\xb9\x09\x64\x07\xc8\x8a\xbd\
+\x7b\xf7\x06\xe7\x64\x88\xf6\x03\x6d\xa1\x80\x67\xa5\x1c\x3f\x7e\
+\x3c\x73\xb6\x90\x21\xfe\xe7\x14\xb3\xc5\x7c\xe2\x19\x27\xd0\xf6\
+\x63\x7e\x7f\xa4\xa2\xf6\xa3\x9e\x34\xe0\xdf\xfd\x25\xc8\x17\x40\
+\xb6\x01\xcf\xf3\xb0\x9d\xc0\xe7\x72\x1a\x56\xac\x58\xc1\xe7\x29\
+\x64\xa2\x8f\x99\x01\xfe\x63\x89\xd9\x2a\x5d\x4f\xf1\xfa\x4e\x7a\
+\xce\xa4\xaa\x7c\xbe\xc1\x8c\xf8\xbb\x17\x55\x74\x16\x82\x9d\xb6\
+\x27\x40\x3e\x0b\x32\xa0\xa2\x58\x42\x2a\xf6\x75\xd5\x8a\x14\xf3\
+\x1f\x5b\xcc\x56\x45\x3e\x02\xaf\xf7\xd1\xf3\x1a\x39\xe3\x80\xd3\
+\x74\xd1\x2a\xa3\x17\x41\xbe\x09\xf2\x72\x1c\x23\x94\x4b\x9f\x4a\
+\xa9\x2f\x48\x29\xff\xb1\xc6\x6c\x63\xe4\xbf\x9c\x6f\x92\xb6\x80\
+\x3a\x9e\xa1\xa1\xc4\xdf\x4c\xf5\x1c\x72\xca\xf8\x6f\x5a\xcc\x56\
+\xd5\xe7\xff\xeb\xcd\x7f\x51\x99\x6d\xc4\x0b\x20\x37\x83\xcd\x76\
+\x70\xdf\x00\xe3\x07\xd8\x47\x4c\x9b\x0d\xa4\x84\xff\xa6\xc7\x6c\
+\xf1\xfb\xe8\x9b\xd1\x8f\xc0\xeb\x9f\x88\xbf\x5b\x8d\x53\xf6\xf5\
+\xd3\xb3\x7c\xb6\x92\xef\x7a\x18\x64\x3d\xa5\xb9\xb3\x5c\xbc\x21\
+\x69\x24\xcc\x7f\x4b\x62\xb6\x7c\xae\xa9\x8a\xc6\xeb\x8b\x41\x6e\
+\x03\xf9\xab\xba\xf4\x4c\xb6\xe7\x55\xe5\xb6\xc1\xae\xe7\xb3\xf9\
+\x03\x7c\x8d\xe7\x3b\xbd\x95\x6d\x60\xae\x79\x89\x1b\x09\xf2\xdf\
+\xd2\x75\xb6\xe2\x59\xbe\x8a\xfa\xe7\xf3\x95\x79\xbe\x65\x2f\xdc\
+\x5b\x01\xd7\x0d\x20\xaf\x01\xb9\x01\x64\x54\xe9\xb3\x5a\xfe\x6e\
+\xa5\xdf\xf6\x59\x95\xf2\xc8\x65\x79\xa3\x4a\xa1\x1f\x48\x80\xff\
+\x44\xd6\xd9\x52\x3c\x57\xda\x40\x07\xb5\x07\x15\xfb\x11\xd4\x76\
+\x73\x5a\x16\x80\x5c\xa3\x74\xdc\xe8\x89\x3a\xec\x40\xbe\x7f\x8b\
+\x4a\x99\x1f\x68\x21\xff\x89\xaf\xb3\xdd\xb4\x69\x53\x60\x4f\xab\
+\x56\xad\x0a\xb8\xa5\x36\xc6\x10\x3e\x93\x87\xd2\x13\xc6\xfe\xbb\
+\xba\xba\xc2\x73\x72\xc1\x96\xe6\xc1\xbd\x5d\x4a\x9f\xdf\x59\xae\
+\xae\x57\x6b\x0f\x6e\xb2\x6d\xa0\x0d\xce\xff\xc8\xdc\x3a\x5b\x45\
+\xf3\x84\xe8\x1f\x44\xac\x97\x6d\x82\xed\x05\xef\xbf\x01\xe4\x91\
+\x32\xf9\xac\x64\xff\xf8\xfa\x06\x65\x8e\x49\x93\xcc\x67\x33\xf9\
+\xcf\xcd\x3a\x5b\xae\xa7\x74\x5e\x33\xdb\x42\x07\xfa\x14\x18\xd7\
+\xa1\x8e\xed\xfb\x05\x91\xef\x4a\x6d\x01\x5e\xff\x03\xf2\x52\x15\
+\xf9\xbe\xc4\x7c\x40\x93\xf8\xcf\xed\x3a\x5b\xeb\xbc\x6c\xdb\x8e\
+\x87\x40\x7e\xab\xa2\xbe\x4d\xa5\x3a\x81\xd7\x87\x21\xdf\x9d\x38\
+\x5f\x20\x38\x68\x79\x7e\x62\xe6\xbf\x6d\xd6\xd9\x72\x1e\xc4\xef\
+\x64\x70\xbf\x1e\xe7\x90\x1f\x98\xc5\x06\xf8\xfe\xc7\xd9\x86\x92\
+\x1a\x0f\xc4\xc8\x7f\x5b\xae\xb3\xb5\x7d\xc1\xe0\xe0\x20\x5e\x71\
+\x5c\x79\xcc\xaa\xef\x76\x3d\xc1\x2b\xc6\x1b\xfa\x84\x5f\x4c\x22\
+\xfd\x73\xe5\xbf\xed\xd7\xd9\x5a\xeb\x8b\x3a\xa8\x6f\x7b\x99\xd2\
+\x6b\x08\x64\xbb\x5f\xce\x07\xdc\x91\xa4\x0f\x98\x03\xff\x6e\x9d\
+\xad\x40\x39\x1b\x50\xba\x3f\x30\x51\xa1\x4c\xa5\x0f\x58\x93\x94\
+\x0f\x68\x80\x7f\xb7\xce\xb6\x02\xe8\xf7\x73\x58\x78\x7c\x7f\xa3\
+\xaa\xdc\x0e\xb0\x0f\xf8\x18\x7f\xa7\xd5\xfe\xb1\x4e\xfe\xdb\xea\
+\x6c\x84\x46\x20\xf3\x8f\xb1\x03\xec\xe3\xc3\xeb\x5f\x55\x68\x07\
+\x58\x3f\x85\x71\xa5\xe5\xcb\x97\x87\x71\x87\x16\xa6\x97\xf9\xaf\
+\x76\xfe\x73\x5b\x9e\x8d\xd0\x28\xb8\x0c\x54\x34\x2e\xe4\x39\x67\
+\xdb\x07\x14\xc5\xfd\xcd\x5c\x9e\x38\x4f\xdc\xc2\xb4\xca\xfa\x7f\
+\xde\x4a\x57\xe2\x31\xdb\xac\x42\x45\x63\x5e\xbc\xe2\x9a\xe2\xbf\
+\x55\xf0\x01\x6c\x13\xef\x93\xed\x46\x0b\xd3\xc9\x69\x5c\x20\xd2\
+\x38\xa5\xcc\x79\xce\x20\x66\x4b\xb1\xef\xd4\xc6\x6c\xd3\x04\xd1\
+\x1f\x64\x1f\xf0\x55\xe1\x3f\xcb\xf5\x01\xee\x49\x88\x7f\x99\xc6\
+\xcf\x59\x69\xc2\xbe\x6b\x66\x63\xb6\x49\x43\xf2\x59\xa5\x0d\x60\
+\xfd\x24\xf5\xa1\x5b\xfe\x3b\x70\x8a\x62\xb0\x20\x58\xa7\x3f\x00\
+\xf2\x43\x90\x03\x20\x32\x36\x61\xb4\xf1\x59\x8a\xd9\x26\x05\x51\
+\x76\x78\xdd\x6a\xf1\x6e\xf7\x01\xff\x20\x6c\xa5\x65\xbf\x03\xa5\
+\xa8\xaf\xc2\x73\x5c\xd8\xf7\xe4\xf5\x32\xa2\x5f\xef\xda\xf8\x06\
+\x60\xf1\xbf\x4a\x45\xf3\x43\xb2\x7f\xcd\xaf\xff\xa9\xf4\xba\xa4\
+\x96\xf2\x8f\xf3\x57\x96\x0d\xf0\xde\xa6\xce\x56\xb4\xf1\x65\xe6\
+\x53\x72\xd5\xb6\x60\x4c\x84\xca\xb6\x57\xe9\x58\x4f\x25\xfe\xb1\
+\xef\xbd\xa4\xd5\xfc\x8b\x74\x4a\x1b\xb8\x64\x1c\xdb\x0c\xe0\xb3\
+\xf1\xf7\xa5\xc9\x06\x3b\x2c\xdb\x0b\x7d\x4e\x96\xdb\x1a\xce\x07\
+\xf8\xd2\x2b\x54\xf9\x58\x20\xbf\x7e\x06\xe4\xb2\xa4\xf8\x6f\x35\
+\x2c\x7b\x2b\x6c\xd9\xb2\x45\xfe\xee\x3c\x5e\x7d\xe9\x7f\xb2\x38\
+\x6f\x60\xf9\xff\xcd\xa2\xaf\x27\xf9\xe7\xf6\xff\xc9\xbe\x04\x7f\
+\x07\xb2\x95\x60\x4e\x39\x46\x42\x9c\xe3\x6f\xcf\x7e\x09\xe4\x1b\
+\x4a\xaf\x93\xbb\xd2\x2a\xbf\xa4\x93\x5d\x37\x94\x39\xb6\x7a\x8b\
+\xaa\xde\xff\x7f\x94\xfa\x5c\x7e\x16\xf3\x5a\x2b\x44\xbb\x82\xf9\
+\xec\x24\xee\x6f\x11\xf5\x82\xeb\xc3\xd3\x20\xaf\x64\x1b\xc8\x5a\
+\xfd\x17\xe3\x7f\xee\xd3\xdf\xaa\xca\x8f\xff\x99\xff\xa3\xd2\x5e\
+\xf2\x08\x9b\x7b\x7a\xfd\x69\x51\x0e\xbc\xd7\x72\x92\xee\x3d\xa6\
+\x12\x18\x13\xc5\x01\xe9\xe3\x68\x1d\x71\xa5\x39\x00\xb6\x87\x9b\
+\xd9\x5e\xf0\xf3\x79\x83\x1c\x63\x96\xe1\xde\xde\x4f\x29\xeb\xc5\
+\xeb\xb9\x5e\x24\x9d\x87\x5a\xc1\xfb\x7e\x45\xdb\xb5\xad\x4c\xbb\
+\x6f\xf7\xff\x78\x9d\x54\xb0\xa6\x30\x4f\x10\x6d\x7d\xad\xdc\x4b\
+\xfe\xaf\xcd\x12\xff\xbc\xcf\x80\xf6\x01\x73\xdb\x7f\xb4\x42\xdb\
+\x1f\xf6\xfd\x94\x8e\xbf\x07\x65\x94\xa7\xf9\x33\xe1\x07\x65\x7b\
+\x3f\x1b\xf7\x5c\x36\xf8\x5e\xb8\x4e\x36\xe9\xbc\xd4\x02\xd1\xc6\
+\x31\xf7\xdb\xab\xd4\x7d\xf6\xfd\x5f\x56\x39\x6c\xfb\x95\x2a\xdb\
+\xd7\xab\x85\xfb\x29\xba\x1e\x21\xdb\xc9\x44\xff\x4f\xe6\x77\xf1\
+\xe2\xc5\xd8\x06\x74\xc3\xeb\x5f\x5b\x75\xbd\x9c\xef\xbf\x86\x6d\
+\x3c\x2f\x75\xdf\xe6\xbe\x46\x9f\x2f\xeb\xc4\x49\x28\xbf\xc5\x3c\
+\x26\x4a\x33\xff\xb8\xb7\xbb\x42\x7e\xef\xae\xe0\xf7\xe5\xbd\x63\
+\x9c\x47\x8e\xbd\x65\x1d\x71\x70\xaf\xf4\x9c\x79\x18\x3f\x4b\x6b\
+\xb9\x58\xf1\x52\x4c\xeb\x3c\x7a\xfd\x89\x2a\xdc\x4b\x7f\xb0\x43\
+\xfa\xfe\xac\xd7\x7f\xa5\xcc\x35\xf1\x73\xe4\x3e\x8c\xfd\xa4\x31\
+\x06\x2c\x78\xe7\xb4\x72\x7e\x3f\x3a\x0b\xf7\x9c\xd7\xa3\x4a\xb4\
+\x6f\x79\xe0\x3e\x8e\x7a\xcf\x31\x61\x7e\x5e\xda\xca\xc5\xe2\x3d\
+\xc8\x2b\xde\x87\x76\x00\x5f\x1f\x10\xdc\x57\x1b\xef\xe1\x7c\x8f\
+\x62\xdb\xe1\xf9\xd6\xac\x82\x79\xe2\xf2\xa0\xd7\x73\xae\xf7\x69\
+\x29\x13\x5e\xdb\x2b\xe6\xc5\xd9\xc6\x39\xad\xfd\x20\x3f\xaf\x23\
+\xbf\xfb\x94\x39\x4e\x48\x3a\x8b\x0d\xa3\x59\xf5\x3e\xe9\x32\x11\
+\xe7\x04\xcb\xf8\x55\x30\x3f\xc9\x7d\x52\xea\xe3\x63\xec\x6e\xc2\
+\xca\x53\xb5\x71\xcd\x1d\xbc\xb6\x82\xcf\x0a\x44\xfb\xca\x22\xc4\
+\x3c\x9e\xaf\xea\x1b\xe3\xcd\xca\x7d\xc2\xe2\x93\x84\x67\x00\xd3\
+\xdc\x0c\x9f\x21\x8a\x6b\x35\xde\x0f\xf2\x27\x15\xf5\xe7\xaa\x9d\
+\x03\xc1\xdc\xff\x40\x69\x7f\x1f\x3c\x6b\xd9\xb2\x65\xa9\xf1\x71\
+\xf5\x62\x0e\xf5\x9e\xfb\xbe\xbf\x00\xb9\x6c\xfd\xfa\xf5\xf8\xbd\
+\x2e\x15\xad\x2f\x4c\x5a\x0a\x98\x26\x5c\x87\xcd\xfd\x32\x3a\x2f\
+\x02\xdf\xc3\x39\x29\xdc\xe3\x76\x56\x45\xed\x79\xb5\xb3\x1f\x24\
+\xf7\x0f\xc2\x33\x78\x2d\x25\x96\x59\xea\xfa\x36\xb5\xc2\xaa\x2b\
+\xf5\xc6\xf5\x82\x7a\x00\x79\xef\x4a\xd3\x7c\x77\xa9\x54\x0a\xc6\
+\x19\xe4\xf7\xb1\xde\xe3\x9a\xf8\xab\x41\xde\xa5\xf4\xfa\xdc\xdf\
+\x5b\xf9\x9a\xed\x5c\xb0\xa2\xe0\xfe\xc7\x20\x8b\xd2\xd6\xc6\x35\
+\x02\xdc\xb3\x8e\xf9\xc0\x73\xd0\xb1\x4e\xd4\xd1\xd7\x93\x82\x6b\
+\x4c\xbf\x06\xf2\x1d\xa5\xcf\xce\x4c\x83\x7c\x5b\x69\xff\x7c\x52\
+\xe9\x7d\xfc\xe7\xcb\xe4\xa5\xd6\x33\xc0\xe4\x5e\xa9\x7b\x55\xb4\
+\x8e\x32\xd5\x63\xda\x5a\xc0\x3e\x51\xe4\xe5\x93\x75\x72\x9f\x25\
+\x91\xe7\x00\xd6\x72\x06\x20\x9f\x09\x8a\xaf\x71\x3f\xf4\x07\x55\
+\xd4\xcf\xcf\x3c\xf7\x0c\x15\x8d\x5b\xb6\x89\x7c\xd7\xbb\x6f\x9c\
+\xcf\x56\x4c\xa3\xd4\x9b\x1f\xdb\x2f\xe0\x99\x40\x2f\xa3\x32\x32\
+\xd6\x33\xaa\x0c\xfa\x7c\x09\xb1\x4e\x18\xaf\x1c\xef\x88\xe3\x3c\
+\xdd\x2c\x0a\xf7\xfb\xe5\x3a\xce\x0f\x81\x74\x88\x73\xe1\x43\xde\
+\xb3\xda\xdf\x93\x50\x66\xdc\xe2\xeb\x94\xef\xd9\xce\x42\xcc\x8b\
+\xf0\x1a\x35\xae\xeb\xcc\x3b\xee\x87\xc6\xfd\x53\x4b\x55\x19\x7f\
+\x9f\x07\xde\x19\x56\xfd\xe7\xb5\x7b\x53\x0d\x96\x67\x9a\x85\xb9\
+\x96\x6b\xd3\xec\xcf\x9c\x06\xf9\x88\xe0\xdd\x57\xd6\x9e\x99\xac\
+\x8e\xef\xab\x41\xe4\x0f\xd7\xe9\x3e\xa5\xea\xf7\x01\xdc\xaf\x4a\
+\xa3\x54\xeb\xe7\xe1\xfb\x78\xe6\xc5\x17\x41\xb6\xe1\x19\xdf\x14\
+\xbf\xe0\x3a\x1f\xf2\x9e\xa7\x3a\x2f\x81\xf9\xda\xbd\x7b\xb7\xec\
+\xff\x63\x1f\xf0\x39\x2a\x9f\x5a\xcf\xc9\xce\xc2\x38\x01\xfb\xef\
+\x67\x40\x1e\x02\xf9\x0a\xc8\x7b\x41\xae\x82\xfa\x1c\xee\x85\xa4\
+\x38\x5e\xae\xfa\x77\xb5\x40\xe4\x55\x8e\x03\x6a\xb1\x01\xe6\x1d\
+\xd7\xfa\xef\x04\x79\x87\xd2\xe7\x61\xa6\x41\xae\x57\xfa\xac\xee\
+\x37\x2a\x7d\xce\x01\x9e\xcb\xd3\x5d\x66\x5f\x14\x73\x1e\xe4\x5d\
+\xee\x5b\x69\x17\x58\xe7\x1d\x71\x5f\xa0\x16\x1b\x90\xfb\x1d\xaf\
+\xa6\xef\xa5\x6e\xdd\x93\xac\xcb\xa2\x8e\xf3\x7c\x9f\xbf\x74\xe9\
+\x52\x23\x36\xdc\x8e\xe0\x75\xce\x64\x0b\x8d\xd8\x00\x9e\x09\xbb\
+\x9d\xbe\xd7\xad\xcc\x3d\x80\x49\x4b\x81\xb9\x66\x3b\xe0\xb3\x80\
+\xf3\xd8\x9f\x6b\x14\xec\x17\x1b\xb0\x01\x79\x16\x2e\xaf\x7d\x4f\
+\xcd\xb9\xe8\x0e\xb5\xa3\x59\x36\xe0\xea\x59\x76\x10\xb7\x0d\x70\
+\x9f\xcb\xd9\x40\x76\xe0\x6c\xc0\xc1\xb5\x05\x0e\x31\xdb\x40\xe6\
+\xd7\x47\xb6\x23\x62\xb2\x81\x57\xd3\xf7\x32\xb1\xff\xcb\xc1\xc4\
+\x1c\x6c\x80\xe7\x11\x32\xbb\xff\xdf\x41\x63\x0e\x31\xa2\xcc\xee\
+\xff\x77\x30\xd1\xa0\x0d\x64\x72\xff\xbf\x43\x79\xd4\x60\x03\x72\
+\x6e\x9d\xe7\xdd\x33\xb7\xff\xdf\xa1\x32\x6a\xe8\x0f\xf0\xfc\x3b\
+\xdb\xc2\x11\xe6\xde\xf5\xff\xf3\x81\x0a\x7e\x00\xf7\x54\xfc\x4e\
+\xd4\x7d\xbc\xe2\x39\x70\xe1\x1e\x70\xd7\xff\xcf\x0f\x2c\x1b\xe0\
+\xb5\x14\x38\xff\x87\xbf\xa5\x89\x73\xf0\x43\xf4\x5b\x18\xbe\x4a\
+\xf9\xfe\x7f\x87\xc6\x20\xce\xc8\x62\xff\x1e\xf2\x5c\xee\x5e\xd6\
+\xd7\xcb\x3b\x5c\x0a\xab\x3f\x80\x5c\x87\x73\xef\x62\x7d\x95\x8b\
+\xfd\x3a\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\
+\x38\x10\x4a\xb9\xc3\x78\x94\xb9\x79\xa0\x16\x77\x47\x6f\x9d\x06\
+\x99\x59\x12\xbd\xef\x8f\x82\x3e\x12\xe9\x05\x78\xff\xc5\x31\xa1\
+\xe3\xfb\x9e\xf9\xf9\x49\x4b\x9f\xf2\xcc\xcf\x4b\x7d\x9e\xa5\xf7\
+\x96\x4c\x7d\xbd\xa5\xef\x37\xf5\xc2\xb0\xa9\x77\x1f\x32\xf5\xde\
+\x51\x53\xdf\x59\x32\x74\x7f\xb9\xa9\x17\xae\x35\xf5\xee\x13\xa6\
+\xde\x5f\x32\xf5\xfd\xa6\xee\x6f\x32\xf5\xce\x7d\xa6\xde\x33\x6a\
+\xea\x3b\x4a\xa6\x7e\xa7\xa9\x07\x99\x13\xba\x4e\x4d\xa4\xf7\x8e\
+\x9a\xfa\xce\x92\xa1\xeb\xcc\x45\x3a\xa5\x26\xd4\x17\xf4\x75\x18\
+\x7a\xff\xce\xf1\xcb\xa5\x7e\xfb\xc1\x85\xb7\x0a\xbd\xb0\x71\xc4\
+\x5b\x22\xca\xa3\xf3\xbe\x31\xaf\x73\x38\xd2\x7b\x3e\x33\xe6\xf9\
+\x4b\x23\x7d\xe7\xf4\x98\x51\xde\x77\xa2\x1e\xf1\x51\x18\x2e\x82\
+\xee\x9f\x60\xbd\xfb\x04\xea\x85\x7d\xac\xf7\x97\x8a\x23\xf0\x7e\
+\xc8\xef\xee\x52\xf1\x20\x5c\xee\x26\x1d\x33\xb7\x73\xc2\xf3\xde\
+\x4c\x3a\x66\x6e\xdc\x1f\xf1\x86\x48\xef\xd9\x8e\x86\xda\xed\x2d\
+\x23\x7d\x7d\x90\x93\x1d\xde\x42\xd2\x35\x73\x8f\x79\x9d\x5a\xa7\
+\xa2\xbe\x30\x46\xf6\xd8\x79\x28\xd0\x27\x47\xc8\x5e\x89\xb9\xe2\
+\x38\xe9\x5c\xd4\x7b\xfc\xed\xa8\x87\x45\x7d\x54\xeb\xda\x8e\x00\
+\x3f\xd3\x3a\x33\x57\x7a\xdc\x3b\x81\x7a\x3f\xa9\xa5\xb3\xde\x21\
+\xd4\x6f\x63\x7d\x02\xf5\x49\xb2\x23\xd6\x67\x42\xe6\x40\x87\x97\
+\x53\x6f\x1b\x65\x7d\x0a\xf5\x19\xcc\xc4\xba\x48\x2f\x1d\x80\x0f\
+\x2e\x12\x3a\xe0\xdc\x61\x53\x3f\xbd\x30\x7a\x3e\xe2\xfe\x4e\x53\
+\xdf\x55\x08\x2e\x67\x48\x2f\x1e\x2c\x50\x7a\x75\x4e\x66\xfa\xb4\
+\xfe\x10\xe9\x53\x23\x85\x28\xff\x25\x2c\x48\xfd\xbc\x11\xd2\x9f\
+\x0e\x0a\x1a\x1f\xa3\xf5\xd3\x01\x11\xf8\x18\x9d\x95\xfb\x03\xa2\
+\x4a\x13\x23\x9d\x5a\xdf\x15\x10\xc9\x5f\x43\xea\xdf\x8e\xd7\x7e\
+\xfd\x35\xf8\x9e\xf7\x5d\xb8\x4c\x77\x7b\x3d\xf4\xe7\x81\x7a\x40\
+\x5f\xe0\xcf\xf0\xcf\x6b\x0b\xf7\xf4\x63\xe0\x39\xc1\xfd\x71\x4f\
+\x3f\x06\xb2\xc5\x18\xa6\x6c\x71\x95\xd3\xc5\x73\x2e\xac\xc1\x3a\
+\x7b\x8f\xb0\xbe\x60\xd4\xd4\xb5\x59\x45\xfa\xfe\x92\xf1\xfd\x02\
+\x11\x79\x81\xf4\x25\x54\xba\xcf\xd0\xdb\x6f\xd2\x6a\xe9\x05\x9d\
+\xcf\x0b\xf3\x49\x9f\x18\xd3\xab\x32\x46\x49\x9f\x1c\xf1\xd9\xa2\
+\x02\x4c\x8f\x7b\x47\xa4\x5e\xdc\xe3\x5d\x27\xf5\xd2\xa0\x77\x95\
+\xa1\xdf\xa5\xcb\x37\xc4\x29\x2a\x48\xc6\x3f\xa8\xa0\x19\x90\x00\
+\x43\x9f\x1c\x31\xf5\xe9\x71\x53\x2f\xee\x31\xf5\xd2\xa0\xf9\xbc\
+\xd2\x5d\x96\x7e\xaa\xd7\xd4\xcf\x1e\x36\xf5\xa9\x45\xa5\xb4\xe0\
+\xff\x9f\x30\xcc\x47\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x21\
+\x00\xa5\x1d\x7f\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x6f\x00\x75\x00\x74\x00\x5f\x00\x7a\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x73\x00\x65\x00\x61\x00\x72\
+\x00\x63\x00\x68\x00\x5f\x00\x66\x00\x69\x00\x6e\x00\x64\x00\x5f\x00\x31\x00\x35\x00\x33\x00\x30\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\
+\x00\x0a\
+\x01\x0b\x56\xdf\
+\x00\x72\
+\x00\x65\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0e\
+\x02\x82\x37\x1f\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x31\x00\x31\x00\x34\x00\x36\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x20\
+\x02\xbb\x83\x7f\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x69\x00\x6e\x00\x5f\x00\x7a\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x73\x00\x65\x00\x61\x00\x72\x00\x63\
+\x00\x68\x00\x5f\x00\x66\x00\x69\x00\x6e\x00\x64\x00\x5f\x00\x31\x00\x35\x00\x33\x00\x31\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x1e\
+\x04\xc0\x94\xdf\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\x00\x2e\
+\x00\x63\x00\x6f\x00\x6d\x00\x5f\x00\x35\x00\x30\x00\x33\x00\x36\x00\x36\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0e\
+\x06\xd6\x1b\x7f\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x5f\x00\x32\x00\x31\x00\x34\x00\x31\x00\x31\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0f\
+\x06\xec\x5b\x7f\
+\x00\x50\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x5f\x00\x32\x00\x32\x00\x33\x00\x32\x00\x36\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x08\
+\x09\x63\x46\xdf\
+\x00\x43\
+\x00\x72\x00\x6f\x00\x70\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x1d\
+\x0a\xff\x1d\x9f\
+\x00\x66\
+\x00\x69\x00\x74\x00\x5f\x00\x74\x00\x6f\x00\x5f\x00\x63\x00\x65\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x5f\x00\x69\x00\x63\x00\x6f\
+\x00\x6e\x00\x5f\x00\x32\x00\x31\x00\x35\x00\x36\x00\x36\x00\x33\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x23\
+\x0c\x7d\x7a\xdf\
+\x00\x72\
+\x00\x6f\x00\x74\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x66\x00\x69\x00\x6c\x00\x6c\
+\x00\x65\x00\x64\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x32\x00\x30\x00\x31\x00\x39\x00\x33\x00\x38\x00\x2e\x00\x69\
+\x00\x63\x00\x6f\
+\x00\x1c\
+\x0d\x72\x7c\x1f\
+\x00\x69\
+\x00\x63\x00\x5f\x00\x65\x00\x78\x00\x69\x00\x74\x00\x5f\x00\x74\x00\x6f\x00\x5f\x00\x61\x00\x70\x00\x70\x00\x5f\x00\x31\x00\x32\
+\x00\x38\x00\x5f\x00\x32\x00\x38\x00\x34\x00\x31\x00\x38\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x10\
+\x0d\xca\x82\x3f\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x61\x00\x73\x00\x74\x00\x5f\x00\x73\x00\x75\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x22\
+\x0f\x60\x08\xdf\
+\x00\x72\
+\x00\x6f\x00\x74\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x66\x00\x69\x00\x6c\x00\x6c\x00\x65\
+\x00\x64\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x32\x00\x30\x00\x31\x00\x32\x00\x33\x00\x38\x00\x2e\x00\x69\x00\x63\
+\x00\x6f\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x58\x00\x01\x00\x00\x00\x01\x00\x00\x38\x1f\
+\x00\x00\x00\x72\x00\x01\x00\x00\x00\x01\x00\x00\x44\xc4\
+\x00\x00\x00\x94\x00\x01\x00\x00\x00\x01\x00\x00\x88\x61\
+\x00\x00\x00\xda\x00\x01\x00\x00\x00\x01\x00\x00\xc1\x2c\
+\x00\x00\x01\x1c\x00\x01\x00\x00\x00\x01\x00\x00\xc7\xb5\
+\x00\x00\x01\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xf7\xa2\
+\x00\x00\x01\x62\x00\x01\x00\x00\x00\x01\x00\x01\xff\xe4\
+\x00\x00\x01\x78\x00\x01\x00\x00\x00\x01\x00\x02\x05\x97\
+\x00\x00\x01\xb8\x00\x01\x00\x00\x00\x01\x00\x02\x0b\x8f\
+\x00\x00\x02\x04\x00\x01\x00\x00\x00\x01\x00\x02\x1a\x2e\
+\x00\x00\x02\x42\x00\x01\x00\x00\x00\x01\x00\x02\x1e\x7a\
+\x00\x00\x02\x68\x00\x01\x00\x00\x00\x01\x00\x02\x32\x4b\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x00\x58\x00\x01\x00\x00\x00\x01\x00\x00\x38\x1f\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x00\x72\x00\x01\x00\x00\x00\x01\x00\x00\x44\xc4\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x00\x94\x00\x01\x00\x00\x00\x01\x00\x00\x88\x61\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x00\xda\x00\x01\x00\x00\x00\x01\x00\x00\xc1\x2c\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x01\x1c\x00\x01\x00\x00\x00\x01\x00\x00\xc7\xb5\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x01\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xf7\xa2\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x01\x62\x00\x01\x00\x00\x00\x01\x00\x01\xff\xe4\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x01\x78\x00\x01\x00\x00\x00\x01\x00\x02\x05\x97\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x01\xb8\x00\x01\x00\x00\x00\x01\x00\x02\x0b\x8f\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x02\x04\x00\x01\x00\x00\x00\x01\x00\x02\x1a\x2e\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x02\x42\x00\x01\x00\x00\x00\x01\x00\x02\x1e\x7a\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+\x00\x00\x02\x68\x00\x01\x00\x00\x00\x01\x00\x02\x32\x4b\
+\x00\x00\x01\x93\xbf\xf5\x56\x78\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
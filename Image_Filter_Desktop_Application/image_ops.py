@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorised image operations working directly on the raw QImage buffer.
+
+Every function here takes and returns a QImage, but the pixel work is done
+on NumPy views of the image memory so that no Python code runs per pixel.
+The work is split into bands of rows and spread over the cores by the
+parallel module.
+"""
+
+# Built-in/Generic Imports
+import ctypes
+import functools
+
+# Libs
+import numpy as np
+from PyQt5 import sip
+from PyQt5.QtCore import QPoint, QRect
+from PyQt5.QtGui import QImage
+
+# Own modules
+import parallel
+
+
+# Luma weights as (red, green, blue, shift). The 'qt' mode reproduces
+# QImage.convertToFormat(QImage.Format_Grayscale8), i.e. qGray().
+LUMA_WEIGHTS = {
+    'qt': (11, 16, 5, 5),
+    'rec601': (77, 150, 29, 8),
+    'rec709': (54, 183, 19, 8),
+    'average': (85, 86, 85, 8),
+}
+
+# Byte offsets of the red, green and blue samples for the formats handled
+# natively. 32-bit formats are stored as BGRA on little-endian machines.
+# Premultiplied images are converted first: their samples are not colours.
+_CHANNELS = {
+    QImage.Format_RGB32: (2, 1, 0),
+    QImage.Format_ARGB32: (2, 1, 0),
+    QImage.Format_RGB888: (0, 1, 2),
+    QImage.Format_Grayscale8: (0, 0, 0),
+}
+
+# to_array() also views premultiplied buffers, for code that filters them
+_DEPTH = {
+    QImage.Format_RGB32: 4,
+    QImage.Format_ARGB32: 4,
+    QImage.Format_ARGB32_Premultiplied: 4,
+    QImage.Format_RGB888: 3,
+    QImage.Format_Grayscale8: 1,
+}
+
+
+def supported(image):
+    """Return image in a format this module can read without conversion"""
+    if image.format() in _CHANNELS:
+        return image
+    if image.hasAlphaChannel():
+        return image.convertToFormat(QImage.Format_ARGB32)
+    return image.convertToFormat(QImage.Format_RGB32)
+
+
+def channels(image):
+    """Return the (red, green, blue) channel offsets of a supported image"""
+    return _CHANNELS[image.format()]
+
+
+def to_array(image, writable=False):
+    """Return a (height, width, depth) uint8 view of the image buffer.
+
+    The view shares memory with the image and keeps it alive. Pass
+    writable=True to get a mutable view; this detaches the QImage from any
+    implicitly shared copy first.
+    """
+    depth = _DEPTH[image.format()]
+    width, height, stride = image.width(), image.height(), image.bytesPerLine()
+    ptr = image.bits() if writable else image.constBits()
+    buffer = (ctypes.c_ubyte * (stride * height)).from_address(int(ptr))
+    buffer.image = image
+    array = np.frombuffer(buffer, np.uint8)
+    array.flags.writeable = writable
+    return array.reshape(height, stride)[:, :width * depth].reshape(height, width, depth)
+
+
+def from_array(array, image_format):
+    """Build a QImage that owns a copy of a (height, width, depth) uint8 array"""
+    array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    image = QImage(array.data, width, height, array.strides[0], image_format)
+    return image.copy()
+
+
+def region(image, rect):
+    """Return rect of image as a QImage that shares its pixels.
+
+    The region reads the parent buffer in place and keeps it alive; like
+    any implicitly shared QImage it detaches a private copy when written
+    to. Regions whose last row would reach past the end of the parent
+    buffer, and images with less than a byte per pixel, are copied.
+
+    A QImage that does not own its pixels, such as a region or a cached
+    image mapped from disk, holds whatever does as its pixel_owner
+    attribute; the region sets it too, to keep that chain alive.
+    """
+    rect = rect.intersected(image.rect())
+    stride, depth = image.bytesPerLine(), image.depth() // 8
+    offset = rect.y() * stride + rect.x() * depth
+    if rect.isEmpty() or image.depth() % 8 or offset + rect.height() * stride > image.sizeInBytes():
+        return image.copy(rect)
+    if hasattr(image, 'pixel_owner'):
+        # The pixels belong to something else, e.g. the parent of a region
+        # or a cache mapping, that a copy of image would not keep alive.
+        parent = image
+    else:
+        parent = QImage(image)  # Holds the pixels even if image is detached later
+    # A read-only pointer selects the const uchar * constructor, which never
+    # writes through to the parent.
+    pointer = sip.voidptr(int(parent.constBits()) + offset, rect.height() * stride, False)
+    view = QImage(pointer, rect.width(), rect.height(), stride, image.format())
+    view.pixel_owner = parent
+    return view
+
+
+def _first_difference(before, after, reverse=False, band=16):
+    """Return the index along axis 0 of the first line where two arrays differ, or None"""
+    starts = range(0, before.shape[0], band)
+    for start in (reversed(starts) if reverse else starts):
+        found = np.flatnonzero((before[start:start + band] != after[start:start + band]).any(axis=(1, 2)))
+        if found.size:
+            return start + int(found[-1] if reverse else found[0])
+    return None
+
+
+def changed_rect(before, after):
+    """Return the QRect bounding the pixels that differ between two images.
+
+    Scans inwards from each edge and stops at the first difference, so an
+    edit of the whole image costs a few rows and columns. Returns an empty
+    QRect for equal images and None when the sizes or formats differ.
+    """
+    if (before is None or before.size() != after.size() or before.format() != after.format()
+            or after.format() not in _DEPTH):
+        return None
+    old, new = to_array(before), to_array(after)
+    top = _first_difference(old, new)
+    if top is None:
+        return QRect()
+    bottom = _first_difference(old, new, reverse=True)
+    # Columns are the rows of the transposed band that holds the changes
+    old, new = old[top:bottom + 1].transpose(1, 0, 2), new[top:bottom + 1].transpose(1, 0, 2)
+    left, right = _first_difference(old, new), _first_difference(old, new, reverse=True)
+    return QRect(QPoint(left, top), QPoint(right, bottom))
+
+
+def new_image(width, height, image_format):
+    """Return an uninitialised QImage together with a writable view of it"""
+    image = QImage(width, height, image_format)
+    return image, to_array(image, writable=True)
+
+
+def luma(array, rgb, mode='qt', intensity=0, out=None, band=32, table=None):
+    """Write the weighted luma of an RGB array, plus intensity, into out.
+
+    Works through the image in bands of rows so that the 16-bit
+    intermediates stay in cache. table, a 256-entry lookup table, is applied
+    to the result in the same pass. Returns out, a (height, width) uint8 array.
+    """
+    if mode not in LUMA_WEIGHTS:
+        raise ValueError('Unknown luma mode: %s' % mode)
+    height, width = array.shape[:2]
+    if out is None:
+        out = np.empty((height, width), np.uint8)
+    red, green, blue = rgb
+    weights = LUMA_WEIGHTS[mode]
+    total = np.empty((band, width), np.uint16)
+    term = np.empty((band, width), np.uint16)
+    for top in range(0, height, band):
+        rows = array[top:top + band]
+        count = rows.shape[0]
+        acc, tmp = total[:count], term[:count]
+        if red == green == blue:
+            acc[...] = rows[:, :, red]
+        else:
+            np.multiply(rows[:, :, red], weights[0], out=acc, dtype=np.uint16)
+            np.multiply(rows[:, :, green], weights[1], out=tmp, dtype=np.uint16)
+            acc += tmp
+            np.multiply(rows[:, :, blue], weights[2], out=tmp, dtype=np.uint16)
+            acc += tmp
+            acc >>= weights[3]
+        if intensity > 0:
+            acc += intensity
+            np.minimum(acc, 255, out=acc)
+        elif intensity < 0:
+            np.maximum(acc, -intensity, out=acc)
+            acc -= -intensity
+        out[top:top + count] = acc if table is None else table[acc]
+    return out
+
+
+def _luma_kernel(source, out, above, rgb, mode, intensity, table):
+    luma(source, rgb, mode, intensity, out[:, :, 0], table=table)
+
+
+def grayscale(image, intensity=0, mode='qt', isCancelled=None, table=None):
+    """Return a Grayscale8 copy of image with intensity added to every pixel.
+
+    intensity is clamped into the 0..255 range exactly like the slider of the
+    Gray filter; mode selects the luma weights from LUMA_WEIGHTS. table is an
+    optional 256-entry lookup table applied to the grey values afterwards.
+    """
+    if mode not in LUMA_WEIGHTS:
+        raise ValueError('Unknown luma mode: %s' % mode)
+    image = supported(image)
+    result, out = new_image(image.width(), image.height(), QImage.Format_Grayscale8)
+    parallel.run_bands(_luma_kernel, to_array(image), out, isCancelled=isCancelled,
+                       rgb=channels(image), mode=mode, intensity=intensity, table=table)
+    return result
+
+
+def _qt_div_257(value):
+    """Convert 16-bit QColor components to 8 bits the way QColor does"""
+    return (value + 128) // 257
+
+
+@functools.lru_cache(maxsize=1)
+def hue_table():
+    """Return the table of hue positions used by brightness().
+
+    Indexed by (rising << 16 | span << 8 | offset), where span is
+    max - min of a pixel and offset is channel - min, it gives the position
+    of that channel between min and max in sixtieths, after rounding the hue
+    to whole degrees the way QColor.hue() does.
+    """
+    span, offset = np.meshgrid(np.arange(256), np.arange(256), indexing='ij')
+    fraction = 6000.0 * offset / np.maximum(span, 1)
+    rising = np.floor(np.floor(fraction + 0.5) / 100)
+    falling = 60 - np.floor(np.floor(6000 - fraction + 0.5) / 100)
+    table = np.stack([falling, rising]).clip(0, 60)
+    return table.astype(np.uint8).ravel()
+
+
+@functools.lru_cache(maxsize=8)
+def lightness_table(adjustment):
+    """Return the output table used by brightness() for one adjustment.
+
+    Indexed by ((max << 8 | min) * 61 + position), with position taken from
+    hue_table(), it gives the channel value QColor produces for
+    setHsl(hue(), saturation(), lightness() + adjustment). The floating
+    point steps follow QColor so that the results match it.
+    """
+    high, low = np.meshgrid(np.arange(256), np.arange(256), indexing='ij')
+    fmax, fmin = high * 257 / 65535.0, low * 257 / 65535.0
+    light = _qt_div_257(np.floor(0.5 * (fmax + fmin) * 65535 + 0.5).astype(np.int64))
+    sat = np.where(high > 0, (fmax - fmin) / np.where(high > 0, fmax, 1), 0)
+    sat = _qt_div_257(np.floor(sat * 65535 + 0.5).astype(np.int64))
+
+    light = np.clip(light + adjustment, 0, 255) * 257 / 65535.0
+    sat = sat * 257 / 65535.0
+    temp2 = np.where(light < 0.5, light * (1 + sat), light + sat - light * sat)
+    temp1 = 2 * light - temp2
+    achromatic = (sat == 0) | (high == low)
+    temp2 = np.where(achromatic, light, temp2).reshape(-1, 1)
+    temp1 = np.where(achromatic, light, temp1).reshape(-1, 1)
+
+    value = temp1 + (temp2 - temp1) * (np.arange(61) / 60.0)
+    value = _qt_div_257(np.floor(value * 65535 + 0.5).astype(np.int64))
+    return value.astype(np.uint8).ravel()
+
+
+def _lighten_rows(rows, rgb, table, out):
+    """Apply brightness() to one band of rows, writing RGB into out"""
+    red, green, blue = (rows[:, :, c] for c in rgb)
+    top = np.maximum(np.maximum(red, green), blue)
+    bottom = np.minimum(np.minimum(red, green), blue)
+    key = top.astype(np.int32)
+    key <<= 8
+    key |= bottom
+    key *= 61
+
+    # The hue decides where the middle channel lands between the new min
+    # and max; it rises with hue when red, green, blue are in cyclic order.
+    rising = red > green
+    rising ^= green > blue
+    rising ^= red > blue
+    base = rising.astype(np.int32)
+    base <<= 8
+    base += top
+    base -= bottom
+    base <<= 8
+    base -= bottom
+
+    positions = hue_table()
+    index = np.empty_like(base)
+    for channel, value in zip(rgb, (red, green, blue)):
+        np.add(base, value, out=index)
+        np.add(key, positions.take(index), out=index)
+        out[:, :, channel] = table.take(index)
+
+
+def _brightness_kernel(source, out, above, rgb, adjustment, band=32):
+    if rgb[0] == rgb[1] == rgb[2]:
+        luma(source, rgb, intensity=adjustment, out=out[:, :, 0])
+        return
+    table = lightness_table(adjustment)
+    if source.shape[2] == 4:
+        out[:, :, 3] = source[:, :, 3]
+    for top in range(0, source.shape[0], band):
+        _lighten_rows(source[top:top + band], rgb, table, out[top:top + band])
+
+
+def brightness(image, adjustment=0, isCancelled=None):
+    """Return a copy of image with the HSL lightness of every pixel shifted.
+
+    Matches calling QColor.setHsl(hue(), saturation(), lightness() + adjustment)
+    on each pixel, but works on bands of the buffer through lookup tables.
+    """
+    image = supported(image)
+    result, out = new_image(image.width(), image.height(), image.format())
+    parallel.run_bands(_brightness_kernel, to_array(image), out, isCancelled=isCancelled,
+                       rgb=channels(image), adjustment=adjustment)
+    return result
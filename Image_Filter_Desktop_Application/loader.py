@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Image loading built on QImageReader.
+
+Files are decoded once, and only at the resolution that is needed: the
+view gets a decode scaled to the viewport (the JPEG reader does this in the
+DCT domain, so a 100 MP JPEG never materialises at full size), and the full
+resolution image is decoded lazily the first time an operation needs it.
+Full decodes are kept in the on-disk cache, so reopening the same file
+maps the pixels from there instead of decoding them again.
+
+A full decode is converted in place to the most compact format the filters
+take: Grayscale8 when every pixel is grey, RGB888 for other opaque images
+and ARGB32 only when there is transparency. It is the one full resolution
+buffer of a document; renders, the view and exports read it through
+implicitly shared QImages and NumPy views instead of copying it.
+"""
+
+# Built-in/Generic Imports
+import threading
+
+# Libs
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader
+
+# Own modules
+import cache
+import profiling
+
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+
+def _reader(path):
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    return reader
+
+
+def _transposed(reader):
+    return bool(reader.transformation() & QImageIOHandler.TransformationRotate90)
+
+
+@profiling.traced('decode')
+def read_image(path, scaledSize=None, clipRect=None):
+    """Decode path, optionally only clipRect and/or scaled to scaledSize.
+
+    clipRect and scaledSize are in the coordinates of the file as stored,
+    before any EXIF orientation is applied. Raises IOError on failure.
+    """
+    reader = _reader(path)
+    if clipRect is not None:
+        reader.setClipRect(clipRect)
+    if scaledSize is not None:
+        reader.setScaledSize(scaledSize)
+    image = reader.read()
+    if image.isNull():
+        raise IOError('Cannot load %s: %s' % (path, reader.errorString()))
+    return image
+
+
+def compact(image):
+    """Convert image in place to Grayscale8, RGB888 or ARGB32, whichever holds it in the fewest bytes"""
+    if image.hasAlphaChannel():
+        target = QImage.Format_ARGB32
+    elif image.allGray():
+        target = QImage.Format_Grayscale8
+    else:
+        target = QImage.Format_RGB888
+    if image.format() != target:
+        image.convertTo(target)  # In place, without a second full size buffer
+    return image
+
+
+class ImageSource:
+    """An image file decoded at reduced size first and in full on demand"""
+    def __init__(self, path):
+        reader = _reader(path)
+        if not reader.canRead():
+            raise IOError('Cannot load %s: %s' % (path, reader.errorString()))
+        self.path = path
+        self._storedSize = reader.size()
+        self._transposed = _transposed(reader)
+        self._transformed = reader.transformation() != QImageIOHandler.TransformationNone
+        self._full = None
+        self._previews = {}
+        self._lock = threading.Lock()
+
+    def size(self):
+        """Return the full resolution size as displayed, without decoding"""
+        size = QSize(self._storedSize)
+        return size.transposed() if self._transposed else size
+
+    def isLoaded(self):
+        return self._full is not None
+
+    def full(self):
+        """Return the full resolution image, decoding it on first use"""
+        with self._lock:
+            if self._full is None:
+                self._decodeFull()
+            return self._full
+
+    @profiling.traced('decode.full')
+    def _decodeFull(self):
+        self._full = cache.lookup(self.path, 'full')
+        if self._full is None:
+            self._full = compact(read_image(self.path))
+            cache.store(self.path, 'full', self._full)
+        self._previews.clear()
+
+    def preview(self, size):
+        """Return the image scaled to fit size, decoding as little as possible"""
+        with self._lock:
+            key = (size.width(), size.height())
+            if key not in self._previews:
+                target = self.size().scaled(size, Qt.KeepAspectRatio)
+                if target.width() >= self.size().width():
+                    if self._full is None:
+                        self._decodeFull()
+                    return self._full
+                if self._full is not None:
+                    import resize  # Qt's smooth scaling would first convert the whole image to 32 bits
+                    with profiling.span('scale.preview'):
+                        self._previews[key] = resize.resize(self._full, target.width(), target.height(), 'bilinear')
+                else:
+                    self._previews[key] = read_image(self.path, target.transposed() if self._transposed else target)
+            return self._previews[key]
+
+    def canClip(self):
+        """Return True when region() can decode part of the file"""
+        return not self._transformed
+
+    def region(self, rect, size):
+        """Decode rect of the full resolution image scaled to size.
+
+        Only files shown as stored can be clipped: for the others rect
+        would have to be mapped back through their EXIF orientation.
+        """
+        if not self.canClip():
+            raise ValueError('%s is stored turned and cannot be clipped' % self.path)
+        return read_image(self.path, size, rect)
+
+    def images(self):
+        """Return the decoded images, the full one first when it is loaded"""
+        with self._lock:
+            return ([self._full] if self._full is not None else []) + list(self._previews.values())
+
+    def memoryUsage(self):
+        """Return the bytes held by the decoded images"""
+        return sum(image.sizeInBytes() for image in self.images())
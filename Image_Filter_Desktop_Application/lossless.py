@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Lossless JPEG rotation.
+
+A JPEG that is only turned by quarter turns does not need to be decoded and
+encoded again: jpegtran rearranges the DCT blocks instead, which is exact
+and leaves every pixel as it was. This is used for exports whose operations
+are nothing but quarter turns when jpegtran is installed; everything else
+goes through the normal render and encoder.
+"""
+
+# Built-in/Generic Imports
+import os
+import shutil
+import subprocess
+
+# Libs
+from PyQt5.QtGui import QImageIOHandler, QImageReader
+
+
+JPEG_SUFFIXES = ('.jpg', '.jpeg')
+
+
+def jpegtran():
+    """Return the path of the jpegtran executable, or None"""
+    return shutil.which('jpegtran')
+
+
+def quarter_turns(operations):
+    """Return the clockwise quarter turns operations amount to, or None.
+
+    None means that the operations do more than turn the image.
+    """
+    turns = 0
+    for op in operations:
+        params = dict(op.params)
+        if op.name == 'orient':
+            turns += params['turns']
+        elif op.name == 'rotate' and params['angle'] % 90 == 0:
+            turns += params['angle'] // 90
+        else:
+            return None
+    return turns % 4
+
+
+def can_rotate(path, target, operations):
+    """Return True when target can be written from path by a lossless rotation"""
+    if quarter_turns(operations) is None or jpegtran() is None:
+        return False
+    if not (path.lower().endswith(JPEG_SUFFIXES) and target.lower().endswith(JPEG_SUFFIXES)):
+        return False
+    # The EXIF orientation is kept by jpegtran, so it would be applied twice.
+    return QImageReader(path).transformation() == QImageIOHandler.TransformationNone
+
+
+def rotate(path, target, turns, progressive=False):
+    """Write path turned clockwise by quarter turns to target with jpegtran.
+
+    -perfect makes jpegtran fail rather than drop the partial blocks at the
+    edges, which it would otherwise do for sizes that are not a multiple of
+    the block size. progressive rewrites the scans as a progressive JPEG,
+    which is lossless too. Raises IOError on failure.
+    """
+    command = [jpegtran(), '-copy', 'all', '-perfect']
+    if progressive:
+        command.append('-progressive')
+    if turns % 4:
+        command += ['-rotate', str(90 * (turns % 4))]
+    partial = target + '.part'
+    result = subprocess.run(command + ['-outfile', partial, path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise IOError('jpegtran cannot rotate %s: %s' % (path, result.stderr.decode(errors='replace').strip()))
+    os.replace(partial, target)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Accounting of the memory held by decoded images and caches.
+
+QImages are implicitly shared, so one buffer is often held in several
+places: the proxy of a small image is the source itself, a crop is a view
+into the image before it, and the canvas shows the latest render stage.
+report() counts every buffer once, against the first holder that lists it,
+so that its rows add up to what is really allocated.
+"""
+
+# Libs
+from PyQt5.QtGui import QImage
+
+# Own modules
+import profiling
+
+
+def _buffer(image):
+    """Return (identifier, bytes) of the buffer holding the pixels of image"""
+    # image_ops.region() views, possibly of views, down to the image owning the buffer
+    while isinstance(getattr(image, 'pixel_owner', None), QImage):
+        image = image.pixel_owner
+    return int(image.constBits()), image.sizeInBytes()  # constBits() never detaches
+
+
+def report(holders):
+    """Return [(name, bytes)] for holders, a list of (name, images, other bytes)"""
+    seen = set()
+    rows = []
+    for name, images, other in holders:
+        total = other
+        for image in images:
+            if image is None or image.isNull():
+                continue
+            key, size = _buffer(image)
+            if key not in seen:
+                seen.add(key)
+                total += size
+        rows.append((name, total))
+    return rows
+
+
+def format_report(rows):
+    """Return the rows of report() as text, with their total and the resident set size"""
+    lines = ['%-26s %9.1f MB' % (name, size / 2 ** 20) for name, size in rows]
+    lines.append('%-26s %9.1f MB' % ('Total', sum(size for name, size in rows) / 2 ** 20))
+    rss = profiling.rss()
+    if rss is not None:
+        lines.append('%-26s %9.1f MB' % ('Process resident', rss / 2 ** 20))
+    return '\n'.join(lines)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Neighborhood filters: blurs, sharpening, edges and median.
+
+Box and Gaussian blurs are separable. Each pass runs along the rows of the
+image, and along its columns by running the same kernel on the transposed
+buffer, so neither pass needs halo rows between bands. A pass turns every
+line into its prefix sums (one axis of a summed-area table), which gives
+the sum of any window with one subtraction: the cost per pixel does not
+depend on the radius. A Gaussian is approximated by three box passes of
+sizes chosen for its standard deviation.
+
+Sobel edges and the median look at a small square around each pixel and
+run over bands of rows with halo rows from parallel.run_bands. The median's
+cost grows with the square of its radius, so its radius is kept small.
+"""
+
+# Built-in/Generic Imports
+import math
+
+# Libs
+import numpy as np
+from PyQt5.QtGui import QImage
+
+# Own modules
+import image_ops
+import parallel
+
+
+CHUNK = 16  # Lines filtered together, keeping the prefix sums in cache
+MAX_MEDIAN_RADIUS = 5
+
+
+def _box_line(lines, radius):
+    """Return the mean over 2 * radius + 1 samples along axis 1 of lines"""
+    size = 2 * radius + 1
+    length = lines.shape[1]
+    index = np.clip(np.arange(-radius, length + radius), 0, length - 1)  # Repeat the edges
+    total = np.cumsum(lines.take(index, axis=1), axis=1, dtype=np.uint32)
+    window = np.empty((lines.shape[0], length) + lines.shape[2:], np.uint32)
+    window[:, 0] = total[:, 2 * radius]
+    np.subtract(total[:, 2 * radius + 1:], total[:, :length - 1], out=window[:, 1:])
+    window += radius
+    window //= size
+    return window.astype(np.uint8)
+
+
+def _box_kernel(source, out, above, radii):
+    for top in range(0, source.shape[0], CHUNK):
+        lines = source[top:top + CHUNK]
+        for radius in radii:
+            if radius > 0:
+                lines = _box_line(lines, radius)
+        out[top:top + CHUNK] = lines
+
+
+def _separable_box(image, radii, isCancelled=None):
+    """Return a copy of image filtered by box passes of radii along both axes"""
+    image = image_ops.supported(image)
+    result, out = image_ops.new_image(image.width(), image.height(), image.format())
+    if not any(radii):
+        out[...] = image_ops.to_array(image)
+        return result
+    across = np.empty_like(out)
+    parallel.run_bands(_box_kernel, image_ops.to_array(image), across, isCancelled=isCancelled, radii=radii)
+    parallel.run_bands(_box_kernel, across.transpose(1, 0, 2), out.transpose(1, 0, 2),
+                       isCancelled=isCancelled, radii=radii)
+    return result
+
+
+def box_blur(image, radius=1, isCancelled=None):
+    """Return image averaged over squares of 2 * radius + 1 pixels"""
+    return _separable_box(image, (max(0, int(round(radius))),), isCancelled)
+
+
+def gaussian_radii(sigma, passes=3):
+    """Return the radii of box passes that together approximate a Gaussian of sigma"""
+    if sigma <= 0:
+        return (0,) * passes
+    ideal = math.sqrt(12.0 * sigma * sigma / passes + 1)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    smaller = round((12.0 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes)
+                    / (-4 * lower - 4))
+    return tuple((lower if index < smaller else upper) // 2 for index in range(passes))
+
+
+def gaussian_blur(image, sigma=1.0, isCancelled=None):
+    """Return image blurred with a Gaussian of standard deviation sigma"""
+    return _separable_box(image, gaussian_radii(sigma), isCancelled)
+
+
+def unsharp_mask(image, sigma=1.0, amount=100, threshold=0, isCancelled=None):
+    """Return image sharpened by adding amount percent of its difference to a blur.
+
+    Differences smaller than threshold are left alone, so noise in flat
+    areas is not amplified.
+    """
+    image = image_ops.supported(image)
+    result = gaussian_blur(image, sigma, isCancelled)
+    # The blur is sharpened in place, band by band
+    parallel.run_bands(_unsharp_kernel, image_ops.to_array(image), image_ops.to_array(result, writable=True),
+                       isCancelled=isCancelled, amount=int(amount), threshold=threshold)
+    return result
+
+
+def _unsharp_kernel(source, out, above, amount, threshold):
+    """Sharpen source into out, which holds the blurred rows on entry"""
+    for top in range(0, source.shape[0], CHUNK * 4):
+        rows = source[top:top + CHUNK * 4].astype(np.int32)
+        difference = rows - out[top:top + CHUNK * 4]
+        if threshold > 0:
+            difference[np.abs(difference) < threshold] = 0
+        difference *= amount
+        difference += 50
+        difference //= 100
+        rows += difference
+        np.clip(rows, 0, 255, out=rows)
+        out[top:top + CHUNK * 4] = rows
+    if source.shape[2] == 4:
+        out[:, :, 3] = source[:, :, 3]
+
+
+def _padded(source, out, above, radius):
+    """Return source extended by radius repeated rows and columns at the image edges"""
+    rows = np.clip(np.arange(above - radius, above + out.shape[0] + radius), 0, source.shape[0] - 1)
+    columns = np.clip(np.arange(-radius, source.shape[1] + radius), 0, source.shape[1] - 1)
+    return source.take(rows, axis=0).take(columns, axis=1)
+
+
+def _sobel_kernel(source, out, above, gain, band=64):
+    padded = _padded(source, out, above, 1)[:, :, 0]
+    for top in range(0, out.shape[0], band):
+        rows = padded[top:top + band + 2].astype(np.int16)
+        smooth = rows[:-2] + 2 * rows[1:-1] + rows[2:]
+        gx = smooth[:, 2:] - smooth[:, :-2]
+        step = rows[2:] - rows[:-2]
+        gy = step[:, :-2] + 2 * step[:, 1:-1] + step[:, 2:]
+        magnitude = np.hypot(gx, gy, dtype=np.float32)
+        magnitude *= gain / 100.0
+        np.clip(magnitude, 0, 255, out=magnitude)
+        out[top:top + band, :, 0] = magnitude
+
+
+def sobel(image, gain=100, isCancelled=None):
+    """Return the Sobel gradient magnitude of image as Grayscale8, scaled by gain percent"""
+    gray = image_ops.grayscale(image)
+    result, out = image_ops.new_image(gray.width(), gray.height(), QImage.Format_Grayscale8)
+    parallel.run_bands(_sobel_kernel, image_ops.to_array(gray), out, halo=1, isCancelled=isCancelled, gain=gain)
+    return result
+
+
+def _median3(a, b, c):
+    return np.maximum(np.minimum(a, b), np.minimum(np.maximum(a, b), c))
+
+
+def _median9(rows):
+    """Return the 3 x 3 medians of rows, which carry one extra line and column on each side"""
+    # Sort every vertical triple, then the median of the 3 x 3 square is the
+    # median of the largest low, the median middle and the smallest high.
+    upper, centre, lower = rows[:-2], rows[1:-1], rows[2:]
+    low, high = np.minimum(upper, centre), np.maximum(upper, centre)
+    middle = np.minimum(high, lower)
+    high = np.maximum(high, lower)
+    low, middle = np.minimum(low, middle), np.maximum(low, middle)
+    low = np.maximum(np.maximum(low[:, :-2], low[:, 1:-1]), low[:, 2:])
+    high = np.minimum(np.minimum(high[:, :-2], high[:, 1:-1]), high[:, 2:])
+    middle = _median3(middle[:, :-2], middle[:, 1:-1], middle[:, 2:])
+    return _median3(low, middle, high)
+
+
+def _median_kernel(source, out, above, radius, band=8):
+    padded = _padded(source, out, above, radius)
+    if radius == 1:
+        for top in range(0, out.shape[0], band * 8):
+            out[top:top + band * 8] = _median9(padded[top:top + band * 8 + 2])
+        return
+    size = 2 * radius + 1
+    middle = size * size // 2
+    for top in range(0, out.shape[0], band):
+        rows = padded[top:top + band + 2 * radius]
+        windows = np.lib.stride_tricks.sliding_window_view(rows, (size, size), axis=(0, 1))
+        windows = windows.reshape(windows.shape[:3] + (size * size,))
+        out[top:top + band] = np.partition(windows, middle, axis=-1)[..., middle]
+
+
+def median(image, radius=1, isCancelled=None):
+    """Return image with each sample replaced by the median of its 2 * radius + 1 square"""
+    image = image_ops.supported(image)
+    radius = max(0, min(MAX_MEDIAN_RADIUS, int(round(radius))))
+    result, out = image_ops.new_image(image.width(), image.height(), image.format())
+    if radius == 0:
+        out[...] = image_ops.to_array(image)
+        return result
+    parallel.run_bands(_median_kernel, image_ops.to_array(image), out, halo=radius,
+                       isCancelled=isCancelled, radius=radius)
+    return result
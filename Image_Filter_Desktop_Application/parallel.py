@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-core execution of image kernels over bands of rows.
+
+A kernel is a module level function kernel(source, out, above, **params):
+source holds the rows of one band plus `above` rows of halo on top and any
+halo rows below it, out is the matching band of the output and must be
+filled completely. Point operations use no halo; neighborhood filters ask
+for as many halo rows as their radius so that bands join without seams.
+
+Bands run on a thread pool by default, which scales because NumPy releases
+the GIL inside its kernels. The process backend copies source and output
+into shared memory and runs the bands in worker processes instead.
+
+This module is imported at startup for RenderCancelled, so NumPy is only
+imported by the process backend, which needs it to share buffers.
+"""
+
+# Built-in/Generic Imports
+import concurrent.futures
+import os
+import threading
+
+
+class RenderCancelled(Exception):
+    """Raised when a render's isCancelled callback returns True"""
+
+
+BACKENDS = ('thread', 'process')
+
+_settings = {
+    'workers': int(os.environ.get('FILTER_APP_WORKERS', 0)) or os.cpu_count() or 1,
+    'backend': os.environ.get('FILTER_APP_BACKEND', 'thread'),
+}
+_pools = {}
+_lock = threading.Lock()
+
+# Bands shorter than this are not worth handing to another worker.
+MIN_BAND_ROWS = 64
+
+
+def configure(workers=None, backend=None):
+    """Set the worker count and backend used by run_bands()"""
+    with _lock:
+        if backend is not None:
+            if backend not in BACKENDS:
+                raise ValueError('Unknown backend: %s' % backend)
+            _settings['backend'] = backend
+        if workers is not None:
+            _settings['workers'] = max(1, int(workers))
+        for pool in _pools.values():
+            pool.shutdown(wait=False)
+        _pools.clear()
+
+
+def workers():
+    return _settings['workers']
+
+
+def _pool(backend):
+    with _lock:
+        if backend not in _pools:
+            if backend == 'process':
+                _pools[backend] = concurrent.futures.ProcessPoolExecutor(_settings['workers'])
+            else:
+                _pools[backend] = concurrent.futures.ThreadPoolExecutor(_settings['workers'], 'filter-band')
+        return _pools[backend]
+
+
+def bands(height, count):
+    """Split height rows into at most count (top, bottom) ranges"""
+    count = max(1, min(count, height // MIN_BAND_ROWS))
+    edges = [index * height // count for index in range(count + 1)]
+    return [(top, bottom) for top, bottom in zip(edges[:-1], edges[1:]) if bottom > top]
+
+
+def _band_source(source, top, bottom, halo):
+    start, stop = max(0, top - halo), min(source.shape[0], bottom + halo)
+    return source[start:stop], top - start
+
+
+def _run_shared(kernel, names, shapes, top, bottom, halo, params):
+    from multiprocessing import shared_memory
+    import numpy as np
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        source, out = (np.ndarray(shape, np.uint8, block.buf) for shape, block in zip(shapes, blocks))
+        band, above = _band_source(source, top, bottom, halo)
+        kernel(band, out[top:bottom], above, **params)
+        del source, out, band
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def run_bands(kernel, source, out, halo=0, isCancelled=None, backend=None, **params):
+    """Run kernel over bands of source in parallel, filling out.
+
+    source and out are arrays with the same number of rows; kernels see
+    what out holds on entry, so they can also update it in place.
+    isCancelled is polled as bands complete; pending bands are dropped and
+    RenderCancelled raised once it returns True.
+    """
+    backend = backend or _settings['backend']
+    ranges = bands(source.shape[0], workers() * 4)
+    if len(ranges) == 1 or workers() == 1:
+        for top, bottom in ranges:
+            if isCancelled is not None and isCancelled():
+                raise RenderCancelled()
+            band, above = _band_source(source, top, bottom, halo)
+            kernel(band, out[top:bottom], above, **params)
+        return out
+    if backend == 'process':
+        return _run_processes(kernel, source, out, halo, isCancelled, ranges, params)
+
+    def task(top, bottom):
+        band, above = _band_source(source, top, bottom, halo)
+        kernel(band, out[top:bottom], above, **params)
+
+    _wait(_pool('thread'), [(task, (top, bottom)) for top, bottom in ranges], isCancelled)
+    return out
+
+
+def _run_processes(kernel, source, out, halo, isCancelled, ranges, params):
+    from multiprocessing import shared_memory
+    import numpy as np
+    blocks = [shared_memory.SharedMemory(create=True, size=max(1, array.nbytes)) for array in (source, out)]
+    try:
+        np.ndarray(source.shape, np.uint8, blocks[0].buf)[...] = source
+        np.ndarray(out.shape, np.uint8, blocks[1].buf)[...] = out
+        names = [block.name for block in blocks]
+        shapes = [source.shape, out.shape]
+        calls = [(_run_shared, (kernel, names, shapes, top, bottom, halo, params)) for top, bottom in ranges]
+        _wait(_pool('process'), calls, isCancelled)
+        out[...] = np.ndarray(out.shape, np.uint8, blocks[1].buf)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return out
+
+
+def _wait(pool, calls, isCancelled):
+    futures = [pool.submit(function, *args) for function, args in calls]
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+            if isCancelled is not None and isCancelled():
+                raise RenderCancelled()
+    finally:
+        for future in futures:
+            future.cancel()
+        concurrent.futures.wait(futures)
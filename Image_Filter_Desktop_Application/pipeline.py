@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Non-destructive edit pipeline.
+
+A document is the decoded source image, which is never modified, plus an
+ordered list of operations. Rendering replays the operations on the source
+and caches the output of every stage, so changing one operation only re-runs
+the stages that come after it.
+
+Renders can also run on a preview proxy, a copy of the source downsampled
+to the size of the view, with its own stage cache. Every operation takes a
+scale argument so that geometry given in source pixels maps onto the proxy,
+and an isCancelled callback that long running filters poll.
+
+Consecutive point operations (contrast, gamma, levels, curves) render as
+one stage: their lookup tables are fused and applied in a single pass, and
+a run that directly follows the gray filter is folded into its pass too.
+
+Quarter turns are not resampled. They accumulate in a single 'orient'
+operation that is always the last one; the view draws the unoriented
+render with a rotated transform and only exports apply it, as an exact
+transpose/flip of the pixels. Geometry recorded after the orientation is
+mapped back so that it applies to the unoriented image.
+"""
+
+# Built-in/Generic Imports
+import collections
+import threading
+
+# Libs
+import numpy as np
+from PyQt5.QtCore import Qt, QPoint, QRect, QRectF, QSize
+from PyQt5.QtGui import QImage, QTransform
+
+# Own modules
+import image_ops
+import neighborhood
+import point_ops
+import profiling
+import resize
+from parallel import RenderCancelled
+
+
+Operation = collections.namedtuple('Operation', 'name params')
+
+
+def operation(name, **params):
+    """Return an immutable Operation; params are stored as sorted items"""
+    if name not in OPERATIONS:
+        raise ValueError('Unknown operation: %s' % name)
+    return Operation(name, tuple(sorted(params.items())))
+
+
+def _gray(image, scale=1.0, isCancelled=None, intensity=0, mode='qt'):
+    return image_ops.grayscale(image, intensity, mode, isCancelled)
+
+
+def _brightness(image, scale=1.0, isCancelled=None, adjustment=0):
+    return image_ops.brightness(image, adjustment, isCancelled)
+
+
+def _box_blur(image, scale=1.0, isCancelled=None, radius=0):
+    return neighborhood.box_blur(image, radius * scale, isCancelled)
+
+
+def _gaussian_blur(image, scale=1.0, isCancelled=None, sigma=0.0):
+    return neighborhood.gaussian_blur(image, sigma * scale, isCancelled)
+
+
+def _unsharp_mask(image, scale=1.0, isCancelled=None, sigma=1.0, amount=100, threshold=0):
+    return neighborhood.unsharp_mask(image, sigma * scale, amount, threshold, isCancelled)
+
+
+def _sobel(image, scale=1.0, isCancelled=None, gain=100):
+    return neighborhood.sobel(image, gain, isCancelled)
+
+
+def _median(image, scale=1.0, isCancelled=None, radius=1):
+    return neighborhood.median(image, max(1, round(radius * scale)) if radius else 0, isCancelled)
+
+
+def _point(name):
+    """Return the operation applying the lookup table of point operation name"""
+    def apply(image, scale=1.0, isCancelled=None, **params):
+        lut = point_ops.compile_lut(((name, tuple(sorted(params.items()))),))
+        return point_ops.apply_lut(image, lut, isCancelled)
+    return apply
+
+
+def _rotate(image, scale=1.0, isCancelled=None, angle=0):
+    if angle % 90 == 0:
+        return _orient(image, scale, isCancelled, turns=angle // 90)
+    return image.transformed(QTransform().rotate(angle), Qt.SmoothTransformation)
+
+
+def _orient(image, scale=1.0, isCancelled=None, turns=0):
+    """Turn image clockwise by quarter turns, moving pixels without resampling"""
+    turns %= 4
+    if not turns:
+        return image
+    image = image_ops.supported(image)
+    return image_ops.from_array(np.rot90(image_ops.to_array(image), -turns), image.format())
+
+
+def _crop(image, scale=1.0, isCancelled=None, x=0, y=0, width=0, height=0):
+    rect = QRect(round(x * scale), round(y * scale), max(1, round(width * scale)), max(1, round(height * scale)))
+    return image_ops.region(image, rect)
+
+
+def _resize(image, scale=1.0, isCancelled=None, width=0, height=0, kernel='bicubic'):
+    size = image.size().scaled(max(1, round(width * scale)), max(1, round(height * scale)), Qt.KeepAspectRatio)
+    return resize.resize(image, size.width(), size.height(), kernel, isCancelled)
+
+
+OPERATIONS = {
+    'gray': _gray,
+    'brightness': _brightness,
+    'contrast': _point('contrast'),
+    'gamma': _point('gamma'),
+    'levels': _point('levels'),
+    'curves': _point('curves'),
+    'box_blur': _box_blur,
+    'gaussian_blur': _gaussian_blur,
+    'unsharp_mask': _unsharp_mask,
+    'sobel': _sobel,
+    'median': _median,
+    'rotate': _rotate,
+    'orient': _orient,
+    'crop': _crop,
+    'resize': _resize,
+}
+
+
+def _rotated_size(size, angle=0, **params):
+    # The bounding rect QImage.transformed() gives, rounded outwards the way it does
+    matrix = QImage.trueMatrix(QTransform().rotate(angle), size.width(), size.height())
+    return matrix.mapRect(QRectF(0, 0, size.width(), size.height())).toAlignedRect().size()
+
+
+def _oriented_size(size, turns=0, **params):
+    return size.transposed() if turns % 2 else QSize(size)
+
+
+def _cropped_size(size, x=0, y=0, width=0, height=0, **params):
+    return QRect(x, y, width, height).intersected(QRect(QPoint(), size)).size()
+
+
+def _resized_size(size, width=0, height=0, **params):
+    return size.scaled(width, height, Qt.KeepAspectRatio)
+
+
+# How each operation changes the image size; the others keep it.
+GEOMETRY = {
+    'rotate': _rotated_size,
+    'orient': _oriented_size,
+    'crop': _cropped_size,
+    'resize': _resized_size,
+}
+
+# Operations driven by a slider: there is at most one of each in a document
+# and changing it edits that stage in place instead of adding a new one.
+ADJUSTMENTS = ('gray', 'brightness', 'contrast', 'gamma', 'levels', 'curves',
+               'box_blur', 'gaussian_blur', 'unsharp_mask', 'sobel', 'median')
+
+
+def _stage_end(operations, start):
+    """Return the index after the operations rendered together from start.
+
+    A run of point operations is one stage, and so is the gray filter with
+    the run after it as long as that run treats all channels alike.
+    """
+    end = start + 1
+    if operations[start].name == 'gray' or point_ops.is_point(operations[start].name):
+        while end < len(operations) and point_ops.is_point(operations[end].name):
+            end += 1
+        if (operations[start].name == 'gray' and end > start + 1
+                and not point_ops.is_uniform(point_ops.compile_lut(operations[start + 1:end]))):
+            end = start + 1
+    return end
+
+
+def _render_stage(image, scale, isCancelled, operations):
+    first = operations[0]
+    if len(operations) == 1:
+        return OPERATIONS[first.name](image, scale, isCancelled, **dict(first.params))
+    if first.name == 'gray':
+        params = dict(first.params)
+        table = point_ops.compile_lut(operations[1:])[0]
+        return image_ops.grayscale(image, params.get('intensity', 0), params.get('mode', 'qt'), isCancelled, table)
+    return point_ops.apply_lut(image, point_ops.compile_lut(operations), isCancelled)
+
+
+def orientation_transform(size, turns):
+    """Return the QTransform turning a rect of size clockwise by quarter turns"""
+    oriented = _oriented_size(size, turns)
+    return (QTransform().translate(oriented.width() / 2, oriented.height() / 2)
+            .rotate(90 * (turns % 4)).translate(-size.width() / 2, -size.height() / 2))
+
+
+def split_orientation(operations):
+    """Return operations without the trailing 'orient' and its quarter turns"""
+    operations = tuple(operations)
+    if operations and operations[-1].name == 'orient':
+        return operations[:-1], dict(operations[-1].params)['turns']
+    return operations, 0
+
+
+class EditPipeline:
+    """Source image plus the ordered operations applied to it.
+
+    source is a QImage or a loader.ImageSource; the latter is only decoded
+    in full once a full resolution render needs it.
+    """
+    def __init__(self, source):
+        self._source = source
+        self.operations = []
+        self._caches = {False: [], True: []}
+        self._lock = threading.Lock()
+        self._previewSize = QSize()
+        self._proxy = None
+
+    def setOperation(self, name, **params):
+        """Add an operation, or update the existing adjustment of that name"""
+        op = operation(name, **params)
+        unoriented, turns = split_orientation(self.operations)
+        if name in ADJUSTMENTS:
+            for index, existing in enumerate(self.operations):
+                if existing.name == name:
+                    self.operations[index] = op
+                    return op
+        elif name == 'orient' or (name == 'rotate' and params.get('angle', 0) % 90 == 0):
+            turns = (turns + (params.get('turns', 0) if name == 'orient' else params.get('angle', 0) // 90)) % 4
+            self.operations = list(unoriented) + ([operation('orient', turns=turns)] if turns else [])
+            return op
+        elif name == 'rotate' and unoriented and unoriented[-1].name == 'rotate':
+            angle = (dict(unoriented[-1].params)['angle'] + params.get('angle', 0)) % 360
+            del self.operations[len(unoriented) - 1]
+            if angle:
+                self.operations.insert(len(unoriented) - 1, operation('rotate', angle=angle))
+            return op
+        elif turns and name == 'crop':
+            size = self.outputSize(unoriented)
+            rect = orientation_transform(size, turns).inverted()[0].mapRect(
+                QRectF(params['x'], params['y'], params['width'], params['height'])).toRect()
+            op = operation('crop', x=rect.x(), y=rect.y(), width=rect.width(), height=rect.height())
+        elif turns % 2 and name == 'resize':
+            op = operation('resize', **dict(params, width=params['height'], height=params['width']))
+        self.operations.insert(len(unoriented), op)
+        return op
+
+    def parameter(self, which, key, default=None):
+        """Return a parameter of an operation given by index or adjustment name"""
+        if isinstance(which, str):
+            ops = [op for op in self.operations if op.name == which]
+            if not ops:
+                return default
+            op = ops[0]
+        else:
+            op = self.operations[which]
+        return dict(op.params).get(key, default)
+
+    @property
+    def source(self):
+        """The full resolution source image"""
+        if isinstance(self._source, QImage):
+            return self._source
+        return self._source.full()
+
+    def sourcePath(self):
+        """Return the file the source was loaded from, or None"""
+        return getattr(self._source, 'path', None)
+
+    def sourceSize(self):
+        return self._source.size()
+
+    def canDecodeRegion(self):
+        """Return True when sourceRegion() can decode less than the whole source"""
+        return not isinstance(self._source, QImage) and not self._source.isLoaded() and self._source.canClip()
+
+    def sourceRegion(self, rect, size):
+        """Decode rect of the unedited source scaled to size, without decoding all of it"""
+        return self._source.region(rect, size)
+
+    def outputSize(self, operations=None):
+        """Return the size a full render of operations has, without rendering"""
+        size = self.sourceSize()
+        for op in self.snapshot() if operations is None else operations:
+            if op.name in GEOMETRY:
+                size = GEOMETRY[op.name](size, **dict(op.params))
+        return size
+
+    def orientation(self):
+        """Return the clockwise quarter turns the view and exports apply"""
+        return split_orientation(self.operations)[1]
+
+    def unoriented(self):
+        """Return the operations before the orientation, the ones a render applies"""
+        return split_orientation(self.operations)[0]
+
+    def snapshot(self):
+        """Return the current operations as an immutable tuple"""
+        return tuple(self.operations)
+
+    def setPreviewSize(self, size):
+        """Set the size the preview proxy must fill, usually the viewport"""
+        with self._lock:
+            if size != self._previewSize:
+                self._previewSize = QSize(size)
+                self._proxy = None
+                self._caches[True] = []
+
+    def proxy(self):
+        """Return the preview proxy and its scale relative to the source"""
+        with self._lock:
+            if self._proxy is None:
+                size, full = self._previewSize, self.sourceSize()
+                if size.isEmpty() or (full.width() <= size.width() and full.height() <= size.height()):
+                    self._proxy = self.source
+                elif isinstance(self._source, QImage):
+                    target = full.scaled(size, Qt.KeepAspectRatio)
+                    with profiling.span('scale.proxy'):
+                        self._proxy = resize.resize(self._source, target.width(), target.height(), 'bilinear')
+                else:
+                    self._proxy = self._source.preview(size)
+            proxy = self._proxy
+        return proxy, proxy.width() / max(1, self.sourceSize().width())
+
+    def sourceImages(self):
+        """Return the decoded images of the source, the full one first when it is loaded"""
+        return [self._source] if isinstance(self._source, QImage) else self._source.images()
+
+    def renderImages(self):
+        """Return the preview proxy and the images of the cached stages"""
+        with self._lock:
+            images = [self._proxy] if self._proxy is not None else []
+            return images + [image for stages in self._caches.values() for key, image in stages]
+
+    def cachedStage(self, operations, preview=True):
+        """Return the cached render of exactly operations, or None"""
+        operations = tuple(operations)
+        if not operations:
+            return self.proxy()[0] if preview else self.source
+        with self._lock:
+            for key, image in self._caches[preview]:
+                if key == operations:
+                    return image
+        return None
+
+    def render(self, operations=None, isCancelled=None, preview=False, oriented=True):
+        """Return the image produced by operations, reusing cached stages.
+
+        Safe to call from worker threads with a snapshot() of the operations.
+        isCancelled is polled between stages; when it returns True the
+        render stops with RenderCancelled. With preview=True the operations
+        run on the preview proxy instead of the full resolution source, and
+        with oriented=False the final orientation is left to the caller.
+        """
+        operations = self.snapshot() if operations is None else tuple(operations)
+        if not oriented:
+            operations = split_orientation(operations)[0]
+        with profiling.span('render.preview' if preview else 'render.full', operations=len(operations)):
+            image, scale = self.proxy() if preview else (self.source, 1.0)
+            with self._lock:
+                stages = self._caches[preview]
+                cache = list(stages)
+            # Each cached stage holds the image after a prefix of the operations
+            done = reused = 0
+            for key, cached in cache:
+                if operations[:len(key)] != key:
+                    break
+                image, done, reused = cached, len(key), reused + 1
+            del cache[reused:]
+            while done < len(operations):
+                if isCancelled is not None and isCancelled():
+                    raise RenderCancelled()
+                end = _stage_end(operations, done)
+                name = 'filter.' + '+'.join(op.name for op in operations[done:end])
+                with profiling.span(name, width=image.width(), height=image.height()):
+                    image = _render_stage(image, scale, isCancelled, operations[done:end])
+                key, done = operations[:end], end
+                cache.append((key, image))
+                index = len(cache) - 1
+                with self._lock:
+                    if stages is not self._caches[preview]:
+                        continue
+                    if index == 0 or (index <= len(stages) and stages[index - 1][0] == cache[index - 1][0]):
+                        stages[index:] = [(key, image)]
+            return image
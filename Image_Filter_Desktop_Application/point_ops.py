@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Point operations fused into lookup tables.
+
+A point operation maps every channel value to a new value on its own, so
+it is fully described by a curve over 0..255. The curves of a run of such
+operations are composed into one 256-entry table per channel, and the whole
+run then costs a single pass over the image however long it is. Composing
+the rounded tables gives exactly the result of applying the operations one
+after another.
+
+POINT_OPERATIONS maps each operation name to the function building its
+curve from the operation parameters. The compiled tables are cached by the
+operations that produced them, so dragging one slider only rebuilds the
+table when its value changes.
+"""
+
+# Built-in/Generic Imports
+import functools
+
+# Libs
+import numpy as np
+from PyQt5.QtGui import QImage
+
+# Own modules
+import image_ops
+import parallel
+
+
+CHANNELS = ('red', 'green', 'blue')
+_RAMP = np.arange(256, dtype=np.float64)
+
+
+def _channels(channel):
+    """Return the indices into (red, green, blue) that channel names"""
+    if channel == 'rgb':
+        return (0, 1, 2)
+    if channel not in CHANNELS:
+        raise ValueError('Unknown channel: %s' % channel)
+    return (CHANNELS.index(channel),)
+
+
+def _contrast(amount=0):
+    """Stretch values away from mid grey; amount runs from -100 to 100"""
+    amount = 255 * max(-100, min(100, amount)) / 100.0
+    factor = 259 * (amount + 255) / (255 * (259 - amount))
+    return factor * (_RAMP - 128) + 128
+
+
+def _gamma(gamma=1.0):
+    return 255 * (_RAMP / 255) ** (1.0 / max(gamma, 0.01))
+
+
+def _levels(black=0, white=255, gamma=1.0, output_black=0, output_white=255, channel='rgb'):
+    """Map black..white onto output_black..output_white through a midtone gamma"""
+    white = max(white, black + 1)
+    position = np.clip((_RAMP - black) / (white - black), 0, 1) ** (1.0 / max(gamma, 0.01))
+    return output_black + position * (output_white - output_black)
+
+
+def _curves(points=((0, 0), (255, 255)), channel='rgb'):
+    """Interpolate (input, output) points with a monotone cubic"""
+    points = sorted(dict(points).items())
+    x = np.array([point[0] for point in points], np.float64)
+    y = np.array([point[1] for point in points], np.float64)
+    if len(x) < 2:
+        return np.full(256, y[0] if len(y) else 0.0)
+    # Fritsch-Carlson tangents keep the curve from overshooting its points
+    delta = np.diff(y) / np.diff(x)
+    tangent = np.empty_like(y)
+    tangent[0], tangent[-1] = delta[0], delta[-1]
+    tangent[1:-1] = np.where(delta[:-1] * delta[1:] > 0,
+                             2 / (1 / np.where(delta[:-1] == 0, 1, delta[:-1]) +
+                                  1 / np.where(delta[1:] == 0, 1, delta[1:])), 0)
+    segment = np.clip(np.searchsorted(x, _RAMP, side='right') - 1, 0, len(x) - 2)
+    width = x[segment + 1] - x[segment]
+    t = np.clip((_RAMP - x[segment]) / width, 0, 1)
+    curve = ((2 * t ** 3 - 3 * t ** 2 + 1) * y[segment] + (t ** 3 - 2 * t ** 2 + t) * width * tangent[segment] +
+             (-2 * t ** 3 + 3 * t ** 2) * y[segment + 1] + (t ** 3 - t ** 2) * width * tangent[segment + 1])
+    # Flat beyond the first and last points
+    return np.where(_RAMP < x[0], y[0], np.where(_RAMP > x[-1], y[-1], curve))
+
+
+POINT_OPERATIONS = {
+    'contrast': _contrast,
+    'gamma': _gamma,
+    'levels': _levels,
+    'curves': _curves,
+}
+
+
+def is_point(name):
+    return name in POINT_OPERATIONS
+
+
+@functools.lru_cache(maxsize=32)
+def compile_lut(operations):
+    """Return the (3, 256) uint8 red, green and blue tables of a run of operations.
+
+    operations is a tuple of (name, params) pairs, params being a tuple of
+    (key, value) items, as pipeline.Operation stores them.
+    """
+    lut = np.tile(np.arange(256, dtype=np.uint8), (3, 1))
+    for name, params in operations:
+        params = dict(params)
+        curve = POINT_OPERATIONS[name](**params)
+        table = np.clip(np.floor(curve + 0.5), 0, 255).astype(np.uint8)
+        for index in _channels(params.get('channel', 'rgb')):
+            lut[index] = table[lut[index]]
+    lut.flags.writeable = False
+    return lut
+
+
+def is_uniform(lut):
+    """Return True when the table is the same for every channel"""
+    return bool((lut[0] == lut[1]).all() and (lut[0] == lut[2]).all())
+
+
+def _lut_kernel(source, out, above, rgb, lut, band=64):
+    for top in range(0, source.shape[0], band):
+        rows = source[top:top + band]
+        target = out[top:top + band]
+        for table, channel in zip(lut, rgb):
+            target[:, :, channel] = table[rows[:, :, channel]]
+        if source.shape[2] == 4:
+            target[:, :, 3] = rows[:, :, 3]
+
+
+def apply_lut(image, lut, isCancelled=None):
+    """Return a copy of image with every channel mapped through its table"""
+    image = image_ops.supported(image)
+    if image.format() == QImage.Format_Grayscale8:
+        if is_uniform(lut):
+            lut = lut[:1]
+        else:
+            image = image.convertToFormat(QImage.Format_RGB32)
+    result, out = image_ops.new_image(image.width(), image.height(), image.format())
+    parallel.run_bands(_lut_kernel, image_ops.to_array(image), out, isCancelled=isCancelled,
+                       rgb=image_ops.channels(image)[:len(lut)], lut=lut)
+    return result
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Background decoding of the images next to the one being viewed.
+
+When an image is opened, the prefetcher lists its folder and decodes the
+neighbours in navigation order (next, previous, second next, ...) on a
+background thread: first a viewport-sized preview of each, which is all
+an image switch needs to show something, then the full resolution images
+for as many of them as the memory budget allows. Opening a prefetched
+image hands over its ImageSource with the decodes already done.
+
+Moving to another image re-plans the work: queued decodes of images that
+are no longer neighbours are dropped, a decode already running for one
+is discarded when it finishes, and prefetched images outside the new
+neighbourhood are released.
+"""
+
+# Built-in/Generic Imports
+import collections
+import os
+import threading
+
+# Libs
+from PyQt5.QtCore import QSize
+
+# Own modules
+from loader import IMAGE_SUFFIXES, ImageSource
+
+
+DEFAULT_RADIUS = 2
+DEFAULT_BUDGET = 512 * 1024 * 1024
+
+
+def folder_images(folder):
+    """Return the images in folder sorted by name, as the browser lists them"""
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return []
+    return [os.path.join(folder, name) for name in sorted(names, key=str.lower)
+            if name.lower().endswith(IMAGE_SUFFIXES) and os.path.isfile(os.path.join(folder, name))]
+
+
+class Prefetcher:
+    """Keeps the neighbours of the current image decoded"""
+    def __init__(self, radius=DEFAULT_RADIUS, budget=DEFAULT_BUDGET):
+        self.radius = radius
+        self.budget = budget
+        self._folder = None
+        self._files = []
+        self._current = None
+        self._previewSize = QSize()
+        self._sources = {}
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+
+    def setCurrent(self, path, previewSize):
+        """Make path the current image and prefetch its neighbours"""
+        path = os.path.abspath(path)
+        folder = os.path.dirname(path)
+        files = folder_images(folder) if folder != self._folder or path not in self._files else self._files
+        with self._lock:
+            self._folder, self._files, self._current = folder, files, path
+            self._previewSize = QSize(previewSize)
+            wanted = self._neighbours()
+            self._sources = {key: source for key, source in self._sources.items() if key in wanted}
+            jobs = [(neighbour, False) for neighbour in wanted]
+            jobs += [(neighbour, True) for neighbour in wanted]
+            self._queue = collections.deque(jobs)
+            self._wake.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='prefetch', daemon=True)
+            self._thread.start()
+
+    def _neighbours(self):
+        if self._current not in self._files:
+            return []
+        index = self._files.index(self._current)
+        order = []
+        for step in range(1, self.radius + 1):
+            for neighbour in (index + step, index - step):
+                if 0 <= neighbour < len(self._files) and self._files[neighbour] not in order:
+                    order.append(self._files[neighbour])
+        return order
+
+    def neighbour(self, path, step):
+        """Return the image step places after path in its folder, or None"""
+        path = os.path.abspath(path)
+        files = self._files if path in self._files else folder_images(os.path.dirname(path))
+        if path not in files:
+            return None
+        index = files.index(path) + step
+        return files[index] if 0 <= index < len(files) else None
+
+    def take(self, path):
+        """Return the prefetched ImageSource for path, or None"""
+        with self._lock:
+            return self._sources.pop(os.path.abspath(path), None)
+
+    def images(self):
+        """Return the decoded images of the prefetched sources"""
+        with self._lock:
+            sources = list(self._sources.values())
+        return [image for source in sources for image in source.images()]
+
+    def memoryUsage(self):
+        return sum(image.sizeInBytes() for image in self.images())
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._wake.wait()
+                path, full = self._queue.popleft()
+                source = self._sources.get(path)
+                previewSize = QSize(self._previewSize)
+            try:
+                if source is None:
+                    source = ImageSource(path)
+                if full:
+                    size = source.size()
+                    if self.memoryUsage() + size.width() * size.height() * 4 > self.budget:
+                        continue
+                    source.full()
+                source.preview(previewSize)
+            except IOError:
+                continue
+            with self._lock:
+                if path in self._neighbours():
+                    self._sources[path] = source
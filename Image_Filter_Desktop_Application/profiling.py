@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Lightweight timing spans for finding where the time goes.
+
+Code marks its stages with span() blocks or the traced() decorator:
+
+    with profiling.span('filter.gray', width=image.width()):
+        ...
+
+While profiling is off a span is a shared no-op object, so the cost is
+one flag test per call. While it is on, every span records its wall time,
+thread and the change in resident memory, and the events can be written
+as a Chrome trace (chrome://tracing, https://ui.perfetto.dev) with
+export_trace(). recent() summarises the latest outermost spans for an
+on-screen readout.
+
+FILTER_APP_PROFILE=1 turns profiling on at startup; when its value ends
+in .json the trace is also written to that file at exit.
+"""
+
+# Built-in/Generic Imports
+import atexit
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+
+MAX_EVENTS = 200000  # Oldest events are dropped beyond this
+
+_settings = {'enabled': False}
+_events = collections.deque(maxlen=MAX_EVENTS)
+_latest = collections.OrderedDict()  # name -> outermost span record, oldest first
+_threads = {}
+_lock = threading.Lock()
+_local = threading.local()
+_epoch = time.perf_counter()
+
+
+def rss():
+    """Return the resident set size of the process in bytes, or None"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def enable(enabled=True):
+    _settings['enabled'] = bool(enabled)
+
+
+def enabled():
+    return _settings['enabled']
+
+
+def clear():
+    """Forget every recorded span"""
+    with _lock:
+        _events.clear()
+        _latest.clear()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'category', 'args', 'start', 'memory')
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        _local.depth = getattr(_local, 'depth', 0) + 1
+        self.memory = rss()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        memory = rss()
+        _local.depth -= 1
+        thread = threading.current_thread()
+        event = {
+            'name': self.name, 'cat': self.category, 'ph': 'X', 'pid': os.getpid(), 'tid': thread.ident,
+            'ts': (self.start - _epoch) * 1e6, 'dur': (end - self.start) * 1e6,
+            'args': dict(self.args),
+        }
+        if memory is not None and self.memory is not None:
+            event['args']['rss_delta_mb'] = round((memory - self.memory) / 2 ** 20, 3)
+        with _lock:
+            _events.append(event)
+            _threads[thread.ident] = thread.name
+            if _local.depth == 0:
+                _latest.pop(self.name, None)
+                _latest[self.name] = (end - self.start, event['args'].get('rss_delta_mb'))
+        return False
+
+
+def span(name, category='app', **args):
+    """Return a context manager timing a block as name while profiling is on"""
+    if not _settings['enabled']:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(name, category='app'):
+    """Decorator timing every call of a function as a span named name"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _settings['enabled']:
+                return function(*args, **kwargs)
+            with _Span(name, category, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def recent(count=3):
+    """Return (name, seconds, rss delta in MB or None) of the latest outermost spans, newest first"""
+    with _lock:
+        latest = list(_latest.items())[-count:]
+    return [(name, seconds, memory) for name, (seconds, memory) in reversed(latest)]
+
+
+def events():
+    """Return a copy of the recorded trace events"""
+    with _lock:
+        return list(_events)
+
+
+def export_trace(path):
+    """Write the recorded spans to path as Chrome trace event JSON"""
+    with _lock:
+        trace = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': ident, 'args': {'name': name}}
+                 for ident, name in _threads.items()]
+        trace += _events
+        data = {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+        text = json.dumps(data)
+    with open(path, 'w') as handle:
+        handle.write(text)
+
+
+def _configure_from_environment():
+    value = os.environ.get('FILTER_APP_PROFILE', '')
+    if value and value != '0':
+        enable()
+        if value.lower().endswith('.json'):
+            atexit.register(export_trace, value)
+
+
+_configure_from_environment()
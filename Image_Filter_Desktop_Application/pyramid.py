@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Mipmap pyramid of an image.
+
+Level 0 is the image itself and every further level halves both sides with
+a 2x2 box filter, down to a few hundred pixels. The levels are built on a
+background thread; until a level exists the next finer one is used. When
+only part of the image changes, update() recomputes just that region on
+every level. A pyramid of an unedited file can be given its path; its
+levels are then read from and written to the on-disk cache.
+"""
+
+# Built-in/Generic Imports
+import math
+import threading
+
+# Libs
+import numpy as np
+from PyQt5.QtCore import QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QImage
+
+# Own modules
+import cache
+import image_ops
+import profiling
+
+
+MIN_LEVEL_SIZE = 256
+
+
+def _halve(parent, child, rect=None, band=64):
+    """Box-filter parent into child, which is half its size, within rect of child"""
+    if rect is None:
+        rect = QRect(0, 0, child.shape[1], child.shape[0])
+    left, right = rect.left(), rect.left() + rect.width()
+    # Bands of rows keep the 16-bit sums small instead of a quarter of the image
+    for top in range(rect.top(), rect.top() + rect.height(), band):
+        bottom = min(top + band, rect.top() + rect.height())
+        block = parent[2 * top:2 * bottom, 2 * left:2 * right]
+        total = block[0::2, 0::2].astype(np.uint16)
+        total += block[1::2, 0::2]
+        total += block[0::2, 1::2]
+        total += block[1::2, 1::2]
+        total += 2
+        total >>= 2
+        child[top:bottom, left:right] = total
+
+
+class ImagePyramid(QObject):
+    """Power-of-two levels of an image, built lazily in the background"""
+    levelAdded = pyqtSignal()
+
+    def __init__(self, image, path=None, parent=None):
+        super().__init__(parent)
+        image = image_ops.supported(image)
+        self.path = path
+        self._levels = [image]
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._thread = None
+
+    def build(self):
+        """Start building the missing levels on a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._build, name='pyramid', daemon=True)
+            self._thread.start()
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _build(self):
+        while not self._cancelled:
+            with self._lock:
+                parent = self._levels[-1]
+            width, height = parent.width() // 2, parent.height() // 2
+            if max(parent.width(), parent.height()) <= MIN_LEVEL_SIZE or min(width, height) < 1:
+                return
+            with profiling.span('scale.pyramid', width=width, height=height):
+                child = self._cached(width, height)
+                if child is None:
+                    child, out = image_ops.new_image(width, height, parent.format())
+                    _halve(image_ops.to_array(parent), out)
+                    if self.path is not None:
+                        cache.store(self.path, self._cacheKind(width, height), child)
+            with self._lock:
+                if self._levels[-1] is not parent:
+                    continue
+                self._levels.append(child)
+            try:
+                self.levelAdded.emit()
+            except RuntimeError:
+                return  # Deleted along with its canvas, e.g. at exit
+
+    def _cacheKind(self, width, height):
+        base = self._levels[0]
+        return 'pyramid-%dx%d-%dx%d-%d' % (base.width(), base.height(), width, height, int(base.format()))
+
+    def _cached(self, width, height):
+        if self.path is None:
+            return None
+        return cache.lookup(self.path, self._cacheKind(width, height))
+
+    def levelCount(self):
+        with self._lock:
+            return len(self._levels)
+
+    def level(self, scale):
+        """Return the coarsest available level with at least scale resolution"""
+        wanted = int(math.floor(math.log2(1.0 / scale))) if 0 < scale < 1 else 0
+        with self._lock:
+            return self._levels[min(wanted, len(self._levels) - 1)]
+
+    def update(self, image, rect):
+        """Replace the image after an edit limited to rect and refresh the levels"""
+        image = image_ops.supported(image)
+        with self._lock:
+            levels = self._levels
+            if image.size() != levels[0].size() or image.format() != levels[0].format():
+                raise ValueError('update() needs an image of the same size and format')
+            levels[0] = image
+            self.path = None  # The levels no longer show the file as it is
+            rect = QRect(rect)
+            for index in range(1, len(levels)):
+                child = levels[index]
+                rect = QRect(rect.left() // 2, rect.top() // 2,
+                             (rect.right() + 2) // 2 - rect.left() // 2,
+                             (rect.bottom() + 2) // 2 - rect.top() // 2).intersected(child.rect())
+                if rect.isEmpty():
+                    break
+                # Levels are shared with tiles being painted, so write a copy.
+                child = QImage(child)
+                _halve(image_ops.to_array(levels[index - 1]), image_ops.to_array(child, writable=True), rect)
+                levels[index] = child
+
+    def images(self):
+        """Return every level, the image itself first"""
+        with self._lock:
+            return list(self._levels)
+
+    def memoryUsage(self):
+        """Return the bytes held by levels other than the image itself"""
+        with self._lock:
+            return sum(level.sizeInBytes() for level in self._levels[1:])
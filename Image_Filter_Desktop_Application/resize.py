@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Image resampling with selectable kernels.
+
+Resizing is separable: the rows are resampled to the new width, then the
+columns to the new height by running the same kernel on the transposed
+buffer. Each output sample is a weighted sum of a few input samples whose
+positions and weights are computed once per axis, and both passes are
+spread over bands by the parallel module.
+
+Large reductions first average whole blocks of pixels (a box filter with
+an integer factor, one cheap pass over the source) until less than a
+factor of two is left, and the chosen kernel only does that last step.
+Images with alpha are resampled premultiplied so that transparent pixels
+do not bleed their colour into their neighbours, and returned as ARGB32.
+"""
+
+# Built-in/Generic Imports
+import math
+
+# Libs
+import numpy as np
+from PyQt5.QtGui import QImage
+
+# Own modules
+import image_ops
+import parallel
+import profiling
+
+
+BLOCK = 64  # Output samples computed by one matrix product
+
+
+def _triangle(x):
+    return np.maximum(0.0, 1.0 - np.abs(x))
+
+
+def _cubic(x, a=-0.5):
+    x = np.abs(x)
+    return np.where(x < 1, ((a + 2) * x - (a + 3)) * x * x + 1,
+                    np.where(x < 2, ((a * x - 5 * a) * x + 8 * a) * x - 4 * a, 0.0))
+
+
+def _lanczos(x, lobes=3):
+    return np.where(np.abs(x) < lobes, np.sinc(x) * np.sinc(x / lobes), 0.0)
+
+
+# name -> (kernel function, support radius in samples); nearest has no kernel
+KERNELS = {
+    'nearest': (None, 0),
+    'bilinear': (_triangle, 1.0),
+    'bicubic': (_cubic, 2.0),
+    'lanczos': (_lanczos, 3.0),
+}
+
+
+def _coefficients(source, target, kernel):
+    """Return (index, weights) arrays of shape (taps, target) for one axis"""
+    function, support = KERNELS[kernel]
+    scale = source / float(target)
+    stretch = max(scale, 1.0)  # Widen the kernel when reducing so that it filters
+    centres = (np.arange(target) + 0.5) * scale - 0.5
+    taps = int(math.ceil(2 * support * stretch)) + 1
+    first = np.floor(centres - support * stretch) + 1
+    positions = first[None, :] + np.arange(taps)[:, None]
+    weights = function((positions - centres[None, :]) / stretch)
+    weights /= weights.sum(axis=0, keepdims=True)
+    index = np.clip(positions, 0, source - 1).astype(np.intp)
+    return index, weights
+
+
+def _weight_blocks(source, target, kernel, block=BLOCK):
+    """Return (start, stop, first, matrix) tuples covering the target samples.
+
+    Output samples start..stop are the product of input samples from first
+    on with matrix, so that each block of the pass is one matrix product.
+    """
+    index, weights = _coefficients(source, target, kernel)
+    blocks = []
+    for start in range(0, target, block):
+        stop = min(target, start + block)
+        taps = index[:, start:stop]
+        first = taps.min()
+        matrix = np.zeros((taps.max() + 1 - first, stop - start), np.float64)
+        # Taps clamped to the edge land on the same input sample and add up
+        np.add.at(matrix, (taps - first, np.broadcast_to(np.arange(stop - start), taps.shape)),
+                  weights[:, start:stop])
+        blocks.append((start, stop, first, matrix.astype(np.float32)))
+    return blocks
+
+
+def _resample_kernel(source, out, above, blocks, band=64):
+    """Resample axis 1 of source into out by the matrix blocks of _weight_blocks"""
+    depth = source.shape[2]
+    for top in range(0, source.shape[0], band):
+        rows = source[top:top + band]
+        count = rows.shape[0]
+        # One line per row and channel, so that every block is a single product
+        lines = np.ascontiguousarray(rows.transpose(0, 2, 1), np.float32).reshape(count * depth, -1)
+        for start, stop, first, matrix in blocks:
+            total = lines[:, first:first + matrix.shape[0]] @ matrix
+            np.clip(total, 0, 255, out=total)
+            np.rint(total, out=total)
+            out[top:top + band, start:stop] = total.reshape(count, depth, -1).transpose(0, 2, 1)
+
+
+def _reduce_kernel(source, out, above, factor):
+    """Average factor[0] x factor[1] blocks; source is viewed as (rows, factor[0], width, channels)"""
+    width, count = out.shape[1], factor[0] * factor[1]
+    # Sixteen bit sums are cheaper and hold blocks of up to 256 samples
+    dtype = np.uint16 if count <= 256 else np.uint32
+    columns = source[:, 0, :width * factor[1]].astype(dtype)
+    for row in range(1, factor[0]):
+        columns += source[:, row, :width * factor[1]]
+    columns = columns.reshape(out.shape[0], width, factor[1], -1)
+    total = columns[:, :, 0].copy()
+    for column in range(1, factor[1]):
+        total += columns[:, :, column]
+    total += count // 2
+    total //= count
+    out[...] = total
+
+
+def reduce(image, factor_x, factor_y, isCancelled=None):
+    """Return image shrunk by whole factors, each output pixel the mean of a block"""
+    return _reduce(image_ops.supported(image), factor_x, factor_y, isCancelled)
+
+
+def _reduce(image, factor_x, factor_y, isCancelled):
+    width, height = image.width() // factor_x, image.height() // factor_y
+    source = image_ops.to_array(image)[:height * factor_y]
+    blocks = source.reshape(height, factor_y, source.shape[1], source.shape[2])
+    result, out = image_ops.new_image(width, height, image.format())
+    parallel.run_bands(_reduce_kernel, blocks, out, isCancelled=isCancelled, factor=(factor_y, factor_x))
+    return result
+
+
+def _nearest(image, width, height):
+    source = image_ops.to_array(image)
+    rows = np.minimum(((np.arange(height) + 0.5) * image.height() / height).astype(np.intp), image.height() - 1)
+    columns = np.minimum(((np.arange(width) + 0.5) * image.width() / width).astype(np.intp), image.width() - 1)
+    return image_ops.from_array(source[rows][:, columns], image.format())
+
+
+@profiling.traced('resize')
+def resize(image, width, height, kernel='bicubic', isCancelled=None):
+    """Return image resampled to width x height with one of KERNELS"""
+    if kernel not in KERNELS:
+        raise ValueError('Unknown resize kernel: %s' % kernel)
+    width, height = max(1, int(width)), max(1, int(height))
+    image = image_ops.supported(image)
+    if (width, height) == (image.width(), image.height()):
+        return image.copy()
+    if kernel == 'nearest':
+        return _nearest(image, width, height)
+    alpha = image.hasAlphaChannel()
+    if alpha:
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    # Whole factors leave the kernel less than a factor of two to reduce
+    factor_x, factor_y = max(1, image.width() // width), max(1, image.height() // height)
+    if factor_x > 1 or factor_y > 1:
+        with profiling.span('resize.reduce', factor_x=factor_x, factor_y=factor_y):
+            image = _reduce(image, factor_x, factor_y, isCancelled)
+    source = image_ops.to_array(image)
+    across = np.empty((image.height(), width, source.shape[2]), np.uint8)
+    if width != image.width():
+        parallel.run_bands(_resample_kernel, source, across, isCancelled=isCancelled,
+                           blocks=_weight_blocks(image.width(), width, kernel))
+    else:
+        across[...] = source
+    result, out = image_ops.new_image(width, height, image.format())
+    if height != image.height():
+        parallel.run_bands(_resample_kernel, across.transpose(1, 0, 2), out.transpose(1, 0, 2),
+                           isCancelled=isCancelled, blocks=_weight_blocks(image.height(), height, kernel))
+    else:
+        out[...] = across
+    if alpha:
+        # The negative lobes of bicubic and Lanczos can overshoot the alpha
+        np.minimum(out[:, :, :3], out[:, :, 3:], out=out[:, :, :3])
+        del out
+        result.convertTo(QImage.Format_ARGB32)  # Hand back straight colours, like the input
+    return result
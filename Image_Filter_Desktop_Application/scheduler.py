@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Background execution of filter renders.
+
+Slider drags produce far more requests than can be rendered, so the
+scheduler keeps at most one render in flight and one waiting. A newer
+request replaces the waiting one and marks the running one as stale; the
+running job notices through its isCancelled callback and stops early. Only
+the result of the newest request is ever delivered.
+"""
+
+# Built-in/Generic Imports
+import traceback
+
+# Libs
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Own modules
+from parallel import RenderCancelled
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(int, object)
+
+
+class _RenderTask(QRunnable):
+    """Run one job on the thread pool and report back with its generation"""
+    def __init__(self, scheduler, generation, job):
+        super().__init__()
+        self.scheduler = scheduler
+        self.generation = generation
+        self.job = job
+
+    def run(self):
+        result = None
+        try:
+            result = self.job(isCancelled=lambda: self.scheduler.isStale(self.generation))
+        except RenderCancelled:
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            self.scheduler._signals.finished.emit(self.generation, result)
+
+
+class FilterScheduler(QObject):
+    """Runs render jobs off the GUI thread, newest request wins"""
+    resultReady = pyqtSignal(object)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        # Not the global pool: Qt splits scaling and format conversion into
+        # jobs on the global pool, and a paint waiting for those must never
+        # queue behind a Python job that needs the GUI thread's lock.
+        self.pool = pool or QThreadPool(self)
+        self._generation = 0
+        self._running = False
+        self._pending = None
+        self._signals = _TaskSignals()
+        self._signals.finished.connect(self._onFinished)
+
+    def submit(self, job):
+        """Queue job(isCancelled=...) and supersede every earlier request"""
+        self._generation += 1
+        self._pending = (self._generation, job)
+        if not self._running:
+            self._startPending()
+
+    def cancel(self):
+        """Drop the waiting request and ask the running one to stop"""
+        self._generation += 1
+        self._pending = None
+
+    def isStale(self, generation):
+        """Return True once a newer request than generation has been made"""
+        return generation != self._generation
+
+    def isBusy(self):
+        return self._running or self._pending is not None
+
+    def _startPending(self):
+        generation, job = self._pending
+        self._pending = None
+        self._running = True
+        self.pool.start(_RenderTask(self, generation, job))
+
+    def _onFinished(self, generation, result):
+        self._running = False
+        if result is not None and not self.isStale(generation):
+            self.resultReady.emit(result)
+        if self._pending is not None:
+            self._startPending()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Cold start benchmark: time from launching the application to its first paint.
+
+Starts the application again and again with FILTER_APP_STARTUP_PROBE set,
+which makes it print a line and exit as soon as its window first paints,
+and reports the wall time of each launch as seen from outside, interpreter
+or bootloader start included:
+
+    python startup_benchmark.py
+    python startup_benchmark.py --repeat 20 --target 300
+    python startup_benchmark.py --command dist/filter_app/filter_app
+
+--command times a frozen build instead of filter_app.py. With --target the
+command exits with status 1 when the median launch takes longer than that
+many milliseconds.
+"""
+
+# Built-in/Generic Imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+
+TIMEOUT = 60  # Seconds a launch may take before it counts as hung
+
+
+def launch(command, env):
+    """Start command once; returns the seconds until it reported its first paint"""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+    watchdog = threading.Timer(TIMEOUT, process.kill)
+    watchdog.start()
+    try:
+        for line in process.stdout:
+            if line.strip() == b'first-paint':
+                return time.perf_counter() - start
+        raise RuntimeError('%s exited without painting its window' % ' '.join(command))
+    finally:
+        watchdog.cancel()
+        process.kill()
+        process.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the application from launch to first paint.')
+    parser.add_argument('--command', nargs='+',
+                        help='command starting the application (default: this Python running filter_app.py)')
+    parser.add_argument('--repeat', type=int, default=10, help='launches to time (default 10)')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed launches that fill the disk cache first')
+    parser.add_argument('--offscreen', action='store_true', help='use the offscreen Qt platform (no display needed)')
+    parser.add_argument('--target', type=float, help='fail when the median launch takes longer, in ms')
+    args = parser.parse_args(argv)
+
+    command = args.command or [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                            'filter_app.py')]
+    env = dict(os.environ, FILTER_APP_STARTUP_PROBE='1')
+    if args.offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    for _ in range(args.warmup):
+        launch(command, env)
+    times = [launch(command, env) * 1000 for _ in range(max(1, args.repeat))]
+    median = statistics.median(times)
+    print('first paint over %d launches: best %.0fms  median %.0fms  mean %.0fms  worst %.0fms' % (
+        len(times), min(times), median, statistics.mean(times), max(times)))
+    if args.target is not None and median > args.target:
+        print('median %.0fms is over the %.0fms target' % (median, args.target))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the on-disk cache of decoded images; run with python -m pytest.
+"""
+
+# Built-in/Generic Imports
+import gc
+
+# Libs
+import pytest
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage
+
+# Own modules
+import cache
+import image_ops
+from loader import ImageSource
+from pipeline import EditPipeline
+
+
+@pytest.fixture
+def cached_file(tmp_path):
+    """Return the path of a PNG whose full decode is in a fresh cache"""
+    settings = dict(cache._settings)
+    cache.configure(str(tmp_path / 'cache'), 64 * 2 ** 20)
+    image = QImage(400, 300, QImage.Format_RGB888)
+    image.fill(QColor(10, 20, 30))
+    image.setPixelColor(62, 53, QColor(200, 100, 50))
+    path = str(tmp_path / 'image.png')
+    image.save(path)
+    cache.store(path, 'full', image)
+    cache._writer.submit(lambda: None).result()  # Wait for the write
+    yield path
+    cache.configure(settings['directory'], settings['limit'])
+
+
+def _overwrite_freed_memory():
+    for image in [QImage(400, 300, QImage.Format_RGB32) for _ in range(20)]:
+        image.fill(QColor(4, 5, 6))
+
+
+def test_region_of_a_cached_image_outlives_it(cached_file):
+    image = cache.lookup(cached_file)
+    assert image is not None
+    view = image_ops.region(image, QRect(50, 40, 300, 200))
+    del image
+    gc.collect()
+    _overwrite_freed_memory()
+    assert view.pixelColor(12, 13).getRgb() == (200, 100, 50, 255)
+
+
+def test_crop_render_outlives_its_pipeline(cached_file):
+    source = ImageSource(cached_file)
+    pipeline = EditPipeline(source)
+    pipeline.setOperation('crop', x=50, y=40, width=300, height=200)
+    render = pipeline.render()
+    assert source.full().pixel_owner is not None  # Came from the cache
+    del source, pipeline
+    gc.collect()
+    _overwrite_freed_memory()
+    assert render.pixelColor(12, 13).getRgb() == (200, 100, 50, 255)
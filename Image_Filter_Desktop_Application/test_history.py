@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the undo history and its rendered snapshots; run with python -m pytest.
+"""
+
+# Built-in/Generic Imports
+import threading
+
+# Libs
+from PyQt5.QtGui import QColor, QImage
+
+# Own modules
+from history import EditHistory
+from pipeline import operation
+
+
+OPERATIONS = (operation('gray', intensity=50),)
+
+
+def _filled(width, height):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(10, 20, 30))
+    return image
+
+
+def _wait(history):
+    history._compressor.submit(lambda: None).result()
+
+
+def test_snapshot_round_trip():
+    history = EditHistory()
+    history.remember(OPERATIONS, _filled(40, 30))
+    _wait(history)
+    snapshot = history.snapshot(OPERATIONS)
+    assert snapshot.size() == _filled(40, 30).size()
+    assert snapshot.pixelColor(3, 4).getRgb() == (10, 20, 30, 255)
+
+
+def test_render_of_a_closed_document_is_not_remembered():
+    history = EditHistory()
+    generation = history.generation()
+    history.clear()  # Another document was opened while the render ran
+    history.remember(OPERATIONS, _filled(40, 30), generation)
+    _wait(history)
+    assert history.snapshot(OPERATIONS) is None
+
+
+def test_clear_drops_snapshots_still_being_compressed():
+    history = EditHistory()
+    release = threading.Event()
+    history._compressor.submit(release.wait)  # Hold the compressor
+    history.remember(OPERATIONS, _filled(40, 30))
+    history.clear()
+    release.set()
+    _wait(history)
+    assert history.snapshot(OPERATIONS) is None
+    assert history.memoryUsage() == 0
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Regression tests for image_ops; run with python -m pytest.
+"""
+
+# Built-in/Generic Imports
+import gc
+
+# Libs
+import numpy as np
+import pytest
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage
+
+# Own modules
+import image_ops
+from pipeline import EditPipeline
+
+
+def _filled(width, height, color):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(color)
+    return image
+
+
+def _overwrite_freed_memory():
+    for image in [_filled(400, 300, QColor(1, 2, 3)) for _ in range(20)]:
+        image.fill(QColor(4, 5, 6))
+
+
+def test_region_of_region_outlives_its_parents():
+    image = _filled(400, 300, QColor(10, 20, 30))
+    image.setPixelColor(62, 53, QColor(200, 100, 50))
+    outer = image_ops.region(image, QRect(50, 40, 300, 200))
+    inner = image_ops.region(outer, QRect(10, 10, 100, 100))
+    del image, outer
+    gc.collect()
+    _overwrite_freed_memory()
+    assert inner.size().width() == 100
+    assert inner.pixelColor(0, 0).getRgb() == (10, 20, 30, 255)
+    assert inner.pixelColor(2, 3).getRgb() == (200, 100, 50, 255)
+
+
+def test_two_crops_survive_a_new_render():
+    pipeline = EditPipeline(_filled(400, 300, QColor(10, 20, 30)))
+    pipeline.setOperation('gray', intensity=10)
+    pipeline.setOperation('crop', x=50, y=40, width=300, height=200)
+    pipeline.setOperation('crop', x=10, y=10, width=100, height=100)
+    first = pipeline.render()
+    expected = first.pixelColor(5, 5).getRgb()
+    pipeline.setOperation('gray', intensity=60)
+    pipeline.render()
+    gc.collect()
+    _overwrite_freed_memory()
+    assert first.pixelColor(5, 5).getRgb() == expected
+
+
+def _random_image(width, height, seed=0):
+    pixels = np.random.default_rng(seed).integers(0, 256, (height, width, 4), dtype=np.uint8)
+    pixels[:, :, 3] = 255
+    return image_ops.from_array(pixels, QImage.Format_RGB32)
+
+
+@pytest.mark.parametrize('adjustment', [-80, -25, -1, 0, 1, 30, 120])
+def test_brightness_matches_qcolor_hsl(adjustment):
+    image = _random_image(48, 40)
+    result = image_ops.brightness(image, adjustment)
+    expected = np.empty((image.height(), image.width(), 3), np.int32)
+    for y in range(image.height()):
+        for x in range(image.width()):
+            color = QColor(image.pixel(x, y))
+            color.setHsl(color.hue(), color.saturation(), max(0, min(255, color.lightness() + adjustment)))
+            expected[y, x] = color.getRgb()[:3]
+    actual = image_ops.to_array(result)[:, :, 2::-1].astype(np.int32)  # BGRA in memory
+    assert np.abs(actual - expected).max() <= 1
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the neighborhood filters; run with python -m pytest.
+"""
+
+# Built-in/Generic Imports
+import time
+
+# Libs
+import numpy as np
+import pytest
+from PyQt5.QtGui import QImage
+
+# Own modules
+import image_ops
+import neighborhood
+
+
+def _random_image(width, height, seed=0):
+    pixels = np.random.default_rng(seed).integers(0, 256, (height, width, 4), dtype=np.uint8)
+    pixels[:, :, 3] = 255
+    return image_ops.from_array(pixels, QImage.Format_RGB32)
+
+
+def _naive_box(pixels, radius):
+    """Mean over 2 * radius + 1 samples with repeated edges, rows first, each pass rounded"""
+    size = 2 * radius + 1
+    for axis in (1, 0):
+        padding = [(0, 0)] * pixels.ndim
+        padding[axis] = (radius, radius)
+        padded = np.pad(pixels.astype(np.int64), padding, mode='edge')
+        total = sum(np.take(padded, range(offset, offset + pixels.shape[axis]), axis=axis) for offset in range(size))
+        pixels = ((total + radius) // size).astype(np.uint8)
+    return pixels
+
+
+@pytest.mark.parametrize('radius', [1, 2, 7, 50])
+def test_box_blur_matches_naive_mean(radius):
+    image = _random_image(131, 97)
+    expected = _naive_box(image_ops.to_array(image), radius)
+    assert np.array_equal(image_ops.to_array(neighborhood.box_blur(image, radius)), expected)
+
+
+def test_box_blur_time_does_not_grow_with_radius():
+    image = _random_image(1600, 1200)
+
+    def best(radius):
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            neighborhood.box_blur(image, radius)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    small, large = best(2), best(50)
+    # Summed-area windows cost the same for any radius; a direct
+    # convolution would take 20 times longer at radius 50.
+    assert large < 2 * small
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for fused point operations; run with python -m pytest.
+"""
+
+# Libs
+import numpy as np
+from PyQt5.QtGui import QImage
+
+# Own modules
+import image_ops
+import point_ops
+from pipeline import OPERATIONS, EditPipeline, operation
+
+
+RUN = (
+    operation('contrast', amount=35),
+    operation('gamma', gamma=1.8),
+    operation('levels', black=20, white=230, gamma=0.8, channel='red'),
+    operation('curves', points=((0, 10), (128, 150), (255, 240)), channel='blue'),
+)
+
+
+def _random_image(image_format, seed=0):
+    pixels = np.random.default_rng(seed).integers(0, 256, (37, 53, 4), dtype=np.uint8)
+    return image_ops.supported(image_ops.from_array(pixels, QImage.Format_ARGB32)).convertToFormat(image_format)
+
+
+def _one_by_one(image, operations):
+    for op in operations:
+        image = OPERATIONS[op.name](image, **dict(op.params))
+    return image
+
+
+def _pixels(image):
+    return image_ops.to_array(image_ops.supported(image))
+
+
+def test_fused_table_equals_each_operation_in_turn():
+    for image_format in (QImage.Format_RGB32, QImage.Format_ARGB32, QImage.Format_RGB888):
+        image = _random_image(image_format)
+        fused = point_ops.apply_lut(image, point_ops.compile_lut(RUN))
+        assert np.array_equal(_pixels(fused), _pixels(_one_by_one(image, RUN)))
+
+
+def test_pipeline_renders_a_run_as_one_fused_stage():
+    image = _random_image(QImage.Format_RGB32)
+    pipeline = EditPipeline(image)
+    for op in RUN:
+        pipeline.setOperation(op.name, **dict(op.params))
+    assert np.array_equal(_pixels(pipeline.render()), _pixels(_one_by_one(image, RUN)))
+
+
+def test_gray_folds_a_uniform_run_into_its_pass():
+    image = _random_image(QImage.Format_RGB32)
+    run = (operation('gray', intensity=20), operation('contrast', amount=-40), operation('gamma', gamma=0.6))
+    pipeline = EditPipeline(image)
+    for op in run:
+        pipeline.setOperation(op.name, **dict(op.params))
+    assert np.array_equal(_pixels(pipeline.render()), _pixels(_one_by_one(image, run)))
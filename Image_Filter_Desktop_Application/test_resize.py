@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the resize engine; run with python -m pytest.
+"""
+
+# Libs
+import numpy as np
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QImage
+
+# Own modules
+import image_ops
+import resize
+
+
+def _gradient(width, height, image_format=QImage.Format_RGB32):
+    """Return a smooth image, on which good resamplers agree closely"""
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.empty((height, width, 4), np.uint8)
+    pixels[:, :, 0] = 255 * x // max(1, width - 1)
+    pixels[:, :, 1] = 255 * y // max(1, height - 1)
+    pixels[:, :, 2] = 128 + 100 * np.sin(x / 61.0) * np.cos(y / 83.0)
+    pixels[:, :, 3] = 255
+    return image_ops.from_array(pixels, QImage.Format_ARGB32).convertToFormat(image_format)
+
+
+def _rgba(image):
+    """Return the samples of image as an int32 (height, width, 4) array of straight RGBA"""
+    return image_ops.to_array(image.convertToFormat(QImage.Format_ARGB32))[:, :, [2, 1, 0, 3]].astype(np.int32)
+
+
+@pytest.mark.parametrize('kernel', sorted(resize.KERNELS))
+@pytest.mark.parametrize('size', [(640, 480), (97, 61), (1, 1), (1000, 20), (3000, 2000)])
+def test_output_size_and_format(kernel, size):
+    for image_format in (QImage.Format_RGB32, QImage.Format_RGB888, QImage.Format_Grayscale8):
+        image = _gradient(800, 600, image_format)
+        result = resize.resize(image, size[0], size[1], kernel)
+        assert (result.width(), result.height()) == size
+        assert result.format() == image.format()
+
+
+@pytest.mark.parametrize('kernel', ['bilinear', 'bicubic', 'lanczos'])
+@pytest.mark.parametrize('size', [(400, 300), (123, 77), (1200, 900)])
+def test_close_to_qt_smooth_scaling(kernel, size):
+    image = _gradient(800, 600)
+    expected = image.scaled(size[0], size[1], Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    difference = np.abs(_rgba(resize.resize(image, size[0], size[1], kernel)) - _rgba(expected))
+    assert difference.mean() < 1.0
+    assert difference.max() <= 8
+
+
+@pytest.mark.parametrize('kernel', sorted(resize.KERNELS))
+def test_alpha_stays_straight_and_does_not_bleed(kernel):
+    image = QImage(120, 80, QImage.Format_ARGB32)
+    image.fill(QColor(255, 0, 0, 0))  # Transparent red on the left
+    for y in range(80):
+        for x in range(60, 120):
+            image.setPixelColor(x, y, QColor(0, 0, 255, 128))  # Half transparent blue on the right
+    result = resize.resize(image, 45, 31, kernel)
+    assert result.format() == QImage.Format_ARGB32
+    expected = _rgba(image.scaled(45, 31, Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+    pixels = _rgba(result)
+    visible = pixels[:, :, 3] > 8
+    # The colour of every visible pixel is the blue, never mixed with the hidden red
+    assert pixels[visible][:, 0].max() <= 2
+    assert np.abs(pixels[visible][:, 2] - 255).max() <= 2
+    assert (pixels[:, :8, 3] == 0).all() and (np.abs(pixels[:, -8:, 3] - 128) <= 1).all()
+    if kernel != 'nearest':  # Which side of the edge nearest picks differs from Qt
+        assert np.abs(pixels[:, :, 3] - expected[:, :, 3]).max() <= 40